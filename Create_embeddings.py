@@ -0,0 +1,26 @@
+import argparse
+
+from dotenv import load_dotenv
+
+import src.logger as Logger
+from src.embeddings import build_embeddings, DEFAULT_PAGE_SIZE, DEFAULT_BATCH_SIZE
+
+def main():
+    parser = argparse.ArgumentParser(description="Create vector indices and populate hotel embeddings")
+    parser.add_argument("--page-size", type=int, default=DEFAULT_PAGE_SIZE,
+                        help=f"Hotels fetched from Neo4j per page (default: {DEFAULT_PAGE_SIZE})")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE,
+                        help=f"Sentences per model.encode() call (default: {DEFAULT_BATCH_SIZE})")
+    parser.add_argument("--verbosity", type=int, default=1,
+                        help="Verbosity level (0=minimal, 1=normal, 2=detailed)")
+    args = parser.parse_args()
+
+    load_dotenv()
+    Logger.verbosity = args.verbosity
+
+    build_embeddings(page_size=args.page_size, batch_size=args.batch_size)
+    Logger.flush()
+    print("Embeddings created successfully!")
+
+if __name__ == "__main__":
+    main()
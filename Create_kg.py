@@ -1,7 +1,16 @@
 from neo4j import GraphDatabase
+import argparse
 import csv
+import hashlib
+import json
 import os
+import queue
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
 from dotenv import load_dotenv
+from src.answer_cache import invalidate_answer_cache
 
 def read_config(config_file='config.txt'):
     config = {}
@@ -33,6 +42,7 @@ def clear_database_loop(session):
         if deleted == 0:
             break
     print(f"Total deleted: {total_deleted}")
+    return total_deleted
 
 def create_constraints(tx):
     # Create uniqueness constraints (or indexes) for faster lookups and data integrity
@@ -41,125 +51,981 @@ def create_constraints(tx):
     tx.run("CREATE CONSTRAINT IF NOT EXISTS FOR (c:City) REQUIRE c.name IS UNIQUE")
     tx.run("CREATE CONSTRAINT IF NOT EXISTS FOR (c:Country) REQUIRE c.name IS UNIQUE")
     tx.run("CREATE CONSTRAINT IF NOT EXISTS FOR (r:Review) REQUIRE r.review_id IS UNIQUE")
+    tx.run("CREATE CONSTRAINT IF NOT EXISTS FOR (s:HotelSegment) REQUIRE s.segment_id IS UNIQUE")
+    tx.run("CREATE INDEX IF NOT EXISTS FOR (s:HotelSegment) ON (s.dimension, s.value)")
+    tx.run("CREATE INDEX IF NOT EXISTS FOR (h:Hotel) ON (h.average_reviews_score)")
+    tx.run("CREATE INDEX IF NOT EXISTS FOR (h:Hotel) ON (h.expectation_delta)")
 
-def load_hotels(tx, file_path):
-    with open(file_path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        batch = []
-        for row in reader:
-            batch.append(row)
-        
-        # Batch insert Hotels
-        query = """
-        UNWIND $batch as row
-        MERGE (c:Country {name: row.country})
-        MERGE (ci:City {name: row.city})
-        MERGE (ci)-[:LOCATED_IN]->(c)
-        MERGE (h:Hotel {hotel_id: toInteger(row.hotel_id)})
-        SET h.name = row.hotel_name,
-            h.star_rating = toFloat(row.star_rating),
-            h.cleanliness_base = toFloat(row.cleanliness_base),
-            h.comfort_base = toFloat(row.comfort_base),
-            h.facilities_base = toFloat(row.facilities_base)
-        MERGE (h)-[:LOCATED_IN]->(ci)
-        """
-        tx.run(query, batch=batch)
-
-def load_users(tx, file_path):
+# Rows per write transaction, and parallel review writers, unless overridden on the command line
+DEFAULT_BATCH_SIZE = int(os.environ.get("KG_BATCH_SIZE", 1000))
+DEFAULT_WORKERS = int(os.environ.get("KG_WORKERS", 4))
+
+def _to_int(value):
+    return int(value) if value not in (None, '') else None
+
+def _to_float(value):
+    return float(value) if value not in (None, '') else None
+
+def parse_hotel(row):
+    return {
+        'hotel_id': _to_int(row['hotel_id']),
+        'hotel_name': row['hotel_name'],
+        'city': row['city'],
+        'country': row['country'],
+        'star_rating': _to_float(row['star_rating']),
+        'cleanliness_base': _to_float(row['cleanliness_base']),
+        'comfort_base': _to_float(row['comfort_base']),
+        'facilities_base': _to_float(row['facilities_base']),
+    }
+
+def parse_user(row):
+    return {
+        'user_id': _to_int(row['user_id']),
+        'country': row['country'],
+        'age_group': row['age_group'],
+        'traveller_type': row['traveller_type'],
+        'user_gender': row['user_gender'],
+    }
+
+REVIEW_SCORES = ('score_overall', 'score_cleanliness', 'score_comfort', 'score_facilities',
+                 'score_location', 'score_staff', 'score_value_for_money')
+
+def parse_review(row):
+    review = {
+        'review_id': _to_int(row['review_id']),
+        'user_id': _to_int(row['user_id']),
+        'hotel_id': _to_int(row['hotel_id']),
+        'review_text': row['review_text'],
+        'review_date': row['review_date'],
+    }
+    for score in REVIEW_SCORES:
+        review[score] = _to_float(row.get(score))
+    return review
+
+def parse_visa(row):
+    return {'from': row['from'], 'to': row['to'], 'visa_type': row['visa_type']}
+
+def row_fingerprint(row):
+    """
+    Short hash of a parsed row, stored on its node so a sync can tell unchanged rows apart.
+    """
+    payload = json.dumps({k: v for k, v in row.items() if k != 'fingerprint'}, sort_keys=True, default=str)
+    return hashlib.blake2b(payload.encode('utf-8'), digest_size=8).hexdigest()
+
+def read_batches(file_path, parse, batch_size=DEFAULT_BATCH_SIZE, skip=0):
+    """
+    Streams a CSV file as lists of at most batch_size parsed and fingerprinted rows, so memory
+    stays flat however large the file is. The first `skip` data rows are not parsed (resume).
+    """
     with open(file_path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
         batch = []
-        count = 0
-        for row in reader:
+        for index, row in enumerate(csv.DictReader(f)):
+            if index < skip:
+                continue
+            row = parse(row)
+            row['fingerprint'] = row_fingerprint(row)
             batch.append(row)
-            if len(batch) >= 500:
-                _run_user_batch(tx, batch)
-                count += len(batch)
-                print(f"Loaded {count} users...", end='\r')
+            if len(batch) >= batch_size:
+                yield batch
                 batch = []
         if batch:
-            _run_user_batch(tx, batch)
+            yield batch
+
+DEFAULT_CHECKPOINT = os.environ.get("KG_CHECKPOINT", ".kg_checkpoint.json")
+
+class Checkpoint:
+    """
+    Progress of a build, saved after every committed batch: the number of leading rows of each
+    input file that are known to be in the graph, and the stages that finished. With resume=True
+    an existing file is picked up, otherwise the build starts from scratch.
+    """
+    def __init__(self, path=DEFAULT_CHECKPOINT, resume=False):
+        self.path = path
+        self.lock = threading.Lock()
+        self.state = {'files': {}, 'stages': []}
+        if resume and path and os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                self.state = json.load(f)
+
+    def offset(self, file_path):
+        return self.state['files'].get(file_path, 0)
+
+    def commit(self, file_path, rows):
+        with self.lock:
+            # Writer threads may report out of order; the offset only moves forward
+            if rows <= self.state['files'].get(file_path, 0):
+                return
+            self.state['files'][file_path] = rows
+            self._save()
+
+    def is_done(self, stage):
+        return stage in self.state['stages']
+
+    def stage_done(self, stage):
+        with self.lock:
+            self.state['stages'].append(stage)
+            self._save()
+
+    def _save(self):
+        if not self.path:
+            return
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.state, f)
+        os.replace(tmp_path, self.path)  # atomic, so a crash never leaves a torn checkpoint
+
+    def remove(self):
+        if self.path and os.path.exists(self.path):
+            os.remove(self.path)
+
+class IngestMetrics:
+    """
+    Wall time and rows written per build stage, reported as a JSON summary.
+    """
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.stages = {}
+
+    @contextmanager
+    def stage(self, name):
+        record = {'rows': 0, 'seconds': 0.0}
+        start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record['seconds'] = round(time.perf_counter() - start, 3)
+            record['rows_per_sec'] = round(record['rows'] / record['seconds'], 1) \
+                if record['rows'] and record['seconds'] else None
+            self.stages[name] = record
+
+    def summary(self):
+        return {
+            'stages': self.stages,
+            'total_rows': sum(record['rows'] for record in self.stages.values()),
+            'total_seconds': round(time.perf_counter() - self.started, 3),
+        }
+
+def _progress(label, count, start):
+    elapsed = time.perf_counter() - start
+    rate = f" ({count / elapsed:,.0f} rows/s)" if elapsed > 0 else ""
+    print(f"Loaded {count} {label}{rate}...", end='\r')
+
+def _load_sequential(driver, file_path, parse, write_batch, label, batch_size, checkpoint=None, progress_key=None):
+    # One session for the whole file, one transaction per batch
+    progress_key = progress_key or file_path  # checkpoint key, for a second pass over the same file
+    offset = checkpoint.offset(progress_key) if checkpoint else 0
+    if offset:
+        print(f"Resuming {label} after row {offset}")
+    count = 0
+    start = time.perf_counter()
+    with driver.session() as session:
+        for batch in read_batches(file_path, parse, batch_size, skip=offset):
+            session.execute_write(write_batch, batch)
             count += len(batch)
-    print(f"Loaded {count} users. Done.")
+            if checkpoint:
+                checkpoint.commit(progress_key, offset + count)
+            _progress(label, count, start)
+    print(f"Loaded {count} {label}. Done.")
+    return count
+
+def load_hotels(driver, file_path, batch_size=DEFAULT_BATCH_SIZE, checkpoint=None):
+    return _load_sequential(driver, file_path, parse_hotel, _run_hotel_batch, "hotels", batch_size, checkpoint)
+
+def _run_hotel_batch(tx, batch):
+    query = """
+    UNWIND $batch as row
+    MERGE (c:Country {name: row.country})
+    MERGE (ci:City {name: row.city})
+    MERGE (ci)-[:LOCATED_IN]->(c)
+    MERGE (h:Hotel {hotel_id: row.hotel_id})
+    SET h.name = row.hotel_name,
+        h.star_rating = row.star_rating,
+        h.cleanliness_base = row.cleanliness_base,
+        h.comfort_base = row.comfort_base,
+        h.facilities_base = row.facilities_base,
+        h.row_fingerprint = row.fingerprint
+    MERGE (h)-[:LOCATED_IN]->(ci)
+    """
+    tx.run(query, batch=batch)
+
+def load_users(driver, file_path, batch_size=DEFAULT_BATCH_SIZE, checkpoint=None):
+    return _load_sequential(driver, file_path, parse_user, _run_user_batch, "users", batch_size, checkpoint)
 
 def _run_user_batch(tx, batch):
     query = """
     UNWIND $batch as row
     MERGE (c:Country {name: row.country})
-    MERGE (t:Traveller {user_id: toInteger(row.user_id)})
+    MERGE (t:Traveller {user_id: row.user_id})
     SET t.age = row.age_group,
         t.type = row.traveller_type,
-        t.gender = row.user_gender
+        t.gender = row.user_gender,
+        t.row_fingerprint = row.fingerprint
     MERGE (t)-[:FROM_COUNTRY]->(c)
     """
     tx.run(query, batch=batch)
 
-def load_reviews(driver, file_path):
-    # Note: We pass 'driver' instead of 'tx' because we manage transactions manually here
-    with open(file_path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        batch = []
-        count = 0
-        for row in reader:
-            batch.append(row)
-            if len(batch) >= 100:  # Reduced batch size to 100
-                with driver.session() as session:
-                    session.execute_write(_run_review_batch, batch)
-                count += len(batch)
-                print(f"Loaded {count} reviews...", end='\r')
-                batch = []
-        if batch:
-            with driver.session() as session:
+# Sets the properties of Review `r` from CSV `row`
+REVIEW_PROPERTIES = """
+SET r.text = row.review_text,
+    r.date = row.review_date,
+    r.score_overall = toFloat(row.score_overall),
+    r.score_cleanliness = toFloat(row.score_cleanliness),
+    r.score_comfort = toFloat(row.score_comfort),
+    r.score_facilities = toFloat(row.score_facilities),
+    r.score_location = toFloat(row.score_location),
+    r.score_staff = toFloat(row.score_staff),
+    r.score_value_for_money = toFloat(row.score_value_for_money),
+    r.row_fingerprint = row.fingerprint
+"""
+
+class _Watermark:
+    """
+    Tracks which read batches of a file are fully committed when their rows are written out
+    of order by several workers. The offset only advances over a contiguous prefix of batches,
+    so every row before it is in the graph.
+    """
+    def __init__(self, offset=0):
+        self.offset = offset
+        self.pending = {}  # read batch -> rows not committed yet
+        self.sizes = {}
+        self.next_batch = 0
+        self.lock = threading.Lock()
+
+    def add(self, batch_number, size, pending=None):
+        # pending < size when some rows of the batch are skipped instead of written
+        with self.lock:
+            self.pending[batch_number] = size if pending is None else pending
+            self.sizes[batch_number] = size
+
+    def done(self, batch_rows):
+        with self.lock:
+            for batch_number, rows in batch_rows.items():
+                self.pending[batch_number] -= rows
+            while self.pending.get(self.next_batch) == 0:
+                del self.pending[self.next_batch]
+                self.offset += self.sizes.pop(self.next_batch)
+                self.next_batch += 1
+            return self.offset
+
+def _review_writer(driver, tasks, errors, on_commit):
+    # Each writer owns one session and one partition of hotels for the whole load
+    with driver.session() as session:
+        while True:
+            task = tasks.get()
+            if task is None:
+                return
+            if errors:
+                continue  # keep draining so the reader never blocks on a failed writer
+            batch, batch_rows = task
+            try:
                 session.execute_write(_run_review_batch, batch)
+                on_commit(batch_rows)
+            except Exception as e:
+                errors.append(e)
+
+def load_reviews(driver, file_path, batch_size=DEFAULT_BATCH_SIZE, workers=DEFAULT_WORKERS, checkpoint=None):
+    """
+    Streams reviews.csv to a pool of writer threads that create the Review nodes and their
+    REVIEWED links. Rows are partitioned by hotel_id and every partition is written by a single
+    worker; these transactions only read Traveller nodes, so writers never lock the same node.
+    The traveller-side links (WROTE, STAYED_AT), which would make writers contend on travellers
+    who reviewed hotels of several partitions, are written afterwards by link_reviews in a
+    single pass. Rows without a hotel_id are skipped and reported. Bounded queues keep the
+    reader at most a couple of batches ahead of the writers.
+    """
+    workers = max(1, workers)
+    offset = checkpoint.offset(file_path) if checkpoint else 0
+    if offset:
+        print(f"Resuming reviews after row {offset}")
+    watermark = _Watermark(offset)
+
+    def on_commit(batch_rows):
+        committed = watermark.done(batch_rows)
+        if checkpoint:
+            checkpoint.commit(file_path, committed)
+
+    queues = [queue.Queue(maxsize=2) for _ in range(workers)]
+    buffers = [([], Counter()) for _ in range(workers)]
+    errors = []
+    threads = [threading.Thread(target=_review_writer, args=(driver, tasks, errors, on_commit),
+                                name=f"review-writer-{i}", daemon=True)
+               for i, tasks in enumerate(queues)]
+    for thread in threads:
+        thread.start()
+
+    count = 0
+    skipped = 0
+    start = time.perf_counter()
+    try:
+        for batch_number, batch in enumerate(read_batches(file_path, parse_review, batch_size, skip=offset)):
+            valid = [row for row in batch if row['hotel_id'] is not None]
+            skipped += len(batch) - len(valid)
+            watermark.add(batch_number, len(batch), len(valid))
+            for row in valid:
+                partition = row['hotel_id'] % workers
+                rows, batch_rows = buffers[partition]
+                rows.append(row)
+                batch_rows[batch_number] += 1
+                if len(rows) >= batch_size:
+                    queues[partition].put(buffers[partition])
+                    buffers[partition] = ([], Counter())
             count += len(batch)
-    print(f"Loaded {count} reviews. Done.")
+            _progress("reviews", count, start)
+            if errors:
+                break
+        for partition, task in enumerate(buffers):
+            if task[0] and not errors:
+                queues[partition].put(task)
+    finally:
+        for tasks in queues:
+            tasks.put(None)
+        for thread in threads:
+            thread.join()
+
+    if errors:
+        raise RuntimeError(f"Loading reviews failed: {errors[0]}") from errors[0]
+    if skipped:
+        print(f"Skipped {skipped} reviews without a hotel_id")
+    print(f"Loaded {count - skipped} reviews with {workers} writers. Done.")
+    return count - skipped
 
 def _run_review_batch(tx, batch):
+    # The traveller is only matched (read, not locked) so reviews of unknown users are skipped
     query = """
     UNWIND $batch as row
-    MATCH (t:Traveller {user_id: toInteger(row.user_id)})
-    MATCH (h:Hotel {hotel_id: toInteger(row.hotel_id)})
-    MERGE (r:Review {review_id: toInteger(row.review_id)})
-    SET r.text = row.review_text,
-        r.date = row.review_date,
-        r.score_overall = toFloat(row.score_overall),
-        r.score_cleanliness = toFloat(row.score_cleanliness),
-        r.score_comfort = toFloat(row.score_comfort),
-        r.score_facilities = toFloat(row.score_facilities),
-        r.score_location = toFloat(row.score_location),
-        r.score_staff = toFloat(row.score_staff),
-        r.score_value_for_money = toFloat(row.score_value_for_money)
-    MERGE (t)-[:WROTE]->(r)
+    MATCH (t:Traveller {user_id: row.user_id})
+    MATCH (h:Hotel {hotel_id: row.hotel_id})
+    MERGE (r:Review {review_id: row.review_id})
+    """ + REVIEW_PROPERTIES + """
     MERGE (r)-[:REVIEWED]->(h)
+    """
+    tx.run(query, batch=batch)
+
+def link_reviews(driver, file_path, batch_size=DEFAULT_BATCH_SIZE, checkpoint=None):
+    """
+    Second pass over reviews.csv after load_reviews: writes WROTE and STAYED_AT sequentially.
+    """
+    return _load_sequential(driver, file_path, parse_review, _run_review_link_batch, "review links",
+                            batch_size, checkpoint, progress_key=file_path + '#links')
+
+def _run_review_link_batch(tx, batch):
+    query = """
+    UNWIND $batch as row
+    MATCH (t:Traveller {user_id: row.user_id})
+    MATCH (r:Review {review_id: row.review_id})-[:REVIEWED]->(h:Hotel)
+    MERGE (t)-[:WROTE]->(r)
     MERGE (t)-[:STAYED_AT]->(h)
     """
     tx.run(query, batch=batch)
 
-def load_visa(tx, file_path):
-    with open(file_path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        batch = []
-        for row in reader:
-            batch.append(row)
-        
-        query = """
-        UNWIND $batch as row
-        MERGE (c1:Country {name: row.from})
-        MERGE (c2:Country {name: row.to})
-        MERGE (c1)-[v:NEEDS_VISA]->(c2)
-        SET v.visa_type = row.visa_type
-        """
-        tx.run(query, batch=batch)
+def load_visa(driver, file_path, batch_size=DEFAULT_BATCH_SIZE, checkpoint=None):
+    return _load_sequential(driver, file_path, parse_visa, _run_visa_batch, "visa rules", batch_size, checkpoint)
 
-def compute_hotel_scores(tx):
+def _run_visa_batch(tx, batch):
     query = """
-    MATCH (h:Hotel)<-[:REVIEWED]-(r:Review)
-    WITH h, avg(r.score_overall) as avg_score
-    SET h.average_reviews_score = avg_score
+    UNWIND $batch as row
+    MERGE (c1:Country {name: row.from})
+    MERGE (c2:Country {name: row.to})
+    MERGE (c1)-[v:NEEDS_VISA]->(c2)
+    SET v.visa_type = row.visa_type,
+        v.row_fingerprint = row.fingerprint
+    """
+    tx.run(query, batch=batch)
+
+# Derives the stored averages and expectation deltas of a Hotel `h` from its running totals
+# (score_count only counts reviews with a score_overall, so averages skip nulls like avg())
+DERIVE_HOTEL_AGGREGATES = """
+SET h.average_reviews_score = CASE WHEN h.score_count > 0 THEN h.score_sum / h.score_count END,
+    h.expected_score = h.cleanliness_base + h.comfort_base + h.facilities_base,
+    h.cleanliness_delta = CASE WHEN h.subscore_count > 0 THEN h.cleanliness_sum / h.subscore_count - h.cleanliness_base END,
+    h.comfort_delta = CASE WHEN h.subscore_count > 0 THEN h.comfort_sum / h.subscore_count - h.comfort_base END,
+    h.facilities_delta = CASE WHEN h.subscore_count > 0 THEN h.facilities_sum / h.subscore_count - h.facilities_base END,
+    h.actual_score = CASE WHEN h.subscore_count > 0
+                          THEN (h.cleanliness_sum + h.comfort_sum + h.facilities_sum) / h.subscore_count END
+SET h.expectation_delta = h.actual_score - h.expected_score
+"""
+
+# Derives the stored average of a HotelSegment `s` from its running totals
+DERIVE_SEGMENT_AGGREGATES = """
+SET s.avg_score = CASE WHEN s.score_count > 0 THEN s.score_sum / s.score_count END
+"""
+
+def _hotel_totals_query(match, increment):
+    """
+    Aggregates the reviews bound by `match` per hotel and either overwrites (full recompute)
+    or adds to (incremental append) the hotel's running totals, then re-derives its averages.
     """
+    def total(prop, value):
+        return f"h.{prop} = coalesce(h.{prop}, 0) + {value}" if increment else f"h.{prop} = {value}"
+    return match + """
+    WITH h, count(r) as review_count, count(r.score_overall) as score_count, sum(r.score_overall) as score_sum,
+         [r IN collect(r) WHERE r.score_cleanliness IS NOT NULL
+                          AND r.score_comfort IS NOT NULL
+                          AND r.score_facilities IS NOT NULL] as scored
+    SET """ + """,
+        """.join([
+        total("review_count", "review_count"),
+        total("score_count", "score_count"),
+        total("score_sum", "toFloat(score_sum)"),
+        total("subscore_count", "size(scored)"),
+        total("cleanliness_sum", "toFloat(reduce(s = 0.0, r IN scored | s + r.score_cleanliness))"),
+        total("comfort_sum", "toFloat(reduce(s = 0.0, r IN scored | s + r.score_comfort))"),
+        total("facilities_sum", "toFloat(reduce(s = 0.0, r IN scored | s + r.score_facilities))"),
+    ]) + """
+    WITH h
+    """ + DERIVE_HOTEL_AGGREGATES
+
+def compute_hotel_scores(tx):
+    # Running totals per hotel; the averages and expectation deltas are derived from them
+    query = _hotel_totals_query("MATCH (h:Hotel)<-[:REVIEWED]-(r:Review)", increment=False)
     tx.run(query)
 
+# Traveller.age holds an age group such as "25-34" or "55+"; its numeric bounds (null for other values)
+AGE_BOUNDS = """
+CASE WHEN value ENDS WITH '+' THEN toInteger(replace(value, '+', ''))
+     ELSE toInteger(split(value, '-')[0]) END as age_min,
+CASE WHEN value ENDS WITH '+' THEN 200
+     ELSE toInteger(split(value, '-')[1]) END as age_max
+"""
+
+SEGMENT_DIMENSIONS = (("traveller_type", "type"), ("age_group", "age"))
+
+def _segment_totals_query(match, dimension, prop, increment):
+    """
+    Aggregates the reviews bound by `match` per (hotel, traveller type or age group) into
+    HotelSegment nodes, overwriting or adding to their running totals.
+    """
+    if increment:
+        totals = """
+        ON CREATE SET s.review_count = 0, s.score_count = 0, s.score_sum = 0.0
+        SET s.review_count = s.review_count + review_count,
+            s.score_count = s.score_count + score_count,
+            s.score_sum = s.score_sum + toFloat(score_sum),"""
+    else:
+        totals = """
+        SET s.review_count = review_count,
+            s.score_count = score_count,
+            s.score_sum = toFloat(score_sum),"""
+    return match + f"""
+    WHERE t.{prop} IS NOT NULL
+    WITH h, t.{prop} as value, count(r) as review_count, count(r.score_overall) as score_count,
+         sum(r.score_overall) as score_sum
+    WITH h, value, review_count, score_count, score_sum, {AGE_BOUNDS}
+    MERGE (s:HotelSegment {{segment_id: toString(h.hotel_id) + '|{dimension}|' + value}})
+    {totals}
+        s.hotel_id = h.hotel_id,
+        s.dimension = '{dimension}',
+        s.value = value,
+        s.age_min = age_min,
+        s.age_max = age_max
+    MERGE (s)-[:SEGMENT_OF]->(h)
+    WITH s
+    """ + DERIVE_SEGMENT_AGGREGATES
+
+def compute_segment_scores(tx):
+    """
+    Materializes per-hotel review aggregates by traveller type and by age group as small
+    HotelSegment nodes, so recommendations read them instead of scanning every review.
+    """
+    match = "MATCH (t:Traveller)-[:WROTE]->(r:Review)-[:REVIEWED]->(h:Hotel)"
+    for dimension, prop in SEGMENT_DIMENSIONS:
+        tx.run(_segment_totals_query(match, dimension, prop, increment=False))
+
+def bump_hotel_version(tx):
+    # Same EmbeddingState counter populate_embeddings bumps: in-memory vector indexes
+    # (src/embeddings.py) reload their hotel names and ratings when it changes
+    tx.run("""
+    MERGE (m:EmbeddingState {name: 'hotels'})
+    SET m.version = coalesce(m.version, 0) + 1,
+        m.updated_at = datetime()
+    """)
+
+def append_reviews(driver, rows, batch_size=500):
+    """
+    Ingests new review rows (dicts with the reviews.csv columns) without a rebuild. Each batch
+    runs in one transaction that creates the reviews that do not exist yet and adds them to the
+    running totals of their hotels and segments, so averages stay correct without a global
+    recompute. Rows whose review_id already exists are skipped. Appended reviews are marked with
+    source = 'append' so --sync does not delete them for being missing from reviews.csv.
+    Returns the number of new reviews.
+    """
+    added = 0
+    batch = {}
+    for row in rows:
+        batch[row['review_id']] = row  # last row wins for duplicate ids in one batch
+        if len(batch) >= batch_size:
+            with driver.session() as session:
+                added += session.execute_write(_append_review_batch, list(batch.values()))
+            print(f"Appended {added} reviews...", end='\r')
+            batch = {}
+    if batch:
+        with driver.session() as session:
+            added += session.execute_write(_append_review_batch, list(batch.values()))
+    print(f"Appended {added} new reviews. Done.")
+    return added
+
+def append_reviews_file(driver, file_path, batch_size=500):
+    rows = (row for batch in read_batches(file_path, parse_review, batch_size) for row in batch)
+    return append_reviews(driver, rows, batch_size)
+
+def _append_review_batch(tx, batch):
+    create_query = """
+    UNWIND $batch as row
+    MATCH (t:Traveller {user_id: toInteger(row.user_id)})
+    MATCH (h:Hotel {hotel_id: toInteger(row.hotel_id)})
+    OPTIONAL MATCH (existing:Review {review_id: toInteger(row.review_id)})
+    WITH row, t, h WHERE existing IS NULL
+    CREATE (r:Review {review_id: toInteger(row.review_id), source: 'append'})
+    """ + REVIEW_PROPERTIES + """
+    CREATE (t)-[:WROTE]->(r)
+    CREATE (r)-[:REVIEWED]->(h)
+    MERGE (t)-[:STAYED_AT]->(h)
+    RETURN r.review_id as review_id
+    """
+    review_ids = [record['review_id'] for record in tx.run(create_query, batch=batch)]
+    if not review_ids:
+        return 0
+
+    # Only the reviews created above are added to the running totals
+    tx.run(_hotel_totals_query("""
+    UNWIND $review_ids as review_id
+    MATCH (r:Review {review_id: review_id})-[:REVIEWED]->(h:Hotel)
+    """, increment=True), review_ids=review_ids)
+
+    match = """
+    UNWIND $review_ids as review_id
+    MATCH (t:Traveller)-[:WROTE]->(r:Review {review_id: review_id})-[:REVIEWED]->(h:Hotel)
+    """
+    for dimension, prop in SEGMENT_DIMENSIONS:
+        tx.run(_segment_totals_query(match, dimension, prop, increment=True), review_ids=review_ids)
+    bump_hotel_version(tx)
+    return len(review_ids)
+
+# Diff-based sync: every loaded node (and visa relationship) carries the row_fingerprint of
+# its source row, so a refresh only writes rows that are new or changed and deletes the ones that
+# disappeared, while the graph stays online and unchanged hotels keep their embeddings.
+def _fetch_fingerprints(session, label, key, page_size=10000, where='true'):
+    fingerprints = {}
+    after = None
+    while True:
+        records = session.run(f"""
+        MATCH (n:`{label}`)
+        WHERE ($after IS NULL OR n.{key} > $after) AND {where}
+        RETURN n.{key} as key, n.row_fingerprint as fingerprint
+        ORDER BY n.{key}
+        LIMIT $page_size
+        """, after=after, page_size=page_size).data()
+        if not records:
+            return fingerprints
+        for record in records:
+            fingerprints[record['key']] = record['fingerprint']
+        after = records[-1]['key']
+
+def _diff_rows(driver, file_path, parse, key, existing, upsert, batch_size):
+    """
+    Upserts rows whose fingerprint differs from `existing` (key -> stored fingerprint) and
+    returns (changed row count, keys that are no longer in the file, hotel ids affected).
+    `existing` is consumed.
+    """
+    changed = 0
+    affected = set()
+    with driver.session() as session:
+        for batch in read_batches(file_path, parse, batch_size):
+            rows = [row for row in batch if existing.pop(row[key], None) != row['fingerprint']]
+            if rows:
+                affected.update(session.execute_write(upsert, rows))
+                changed += len(rows)
+    return changed, list(existing), affected
+
+def _sync_hotel_batch(tx, batch):
+    tx.run("""
+    UNWIND $batch as row
+    MATCH (h:Hotel {hotel_id: row.hotel_id})-[old:LOCATED_IN]->(ci:City)
+    WHERE ci.name <> row.city
+    DELETE old
+    """, batch=batch)
+    _run_hotel_batch(tx, batch)
+    return [row['hotel_id'] for row in batch]
+
+def _sync_user_batch(tx, batch):
+    # Type and age group feed the HotelSegment aggregates of every hotel the traveller reviewed
+    result = tx.run("""
+    UNWIND $batch as row
+    OPTIONAL MATCH (t:Traveller {user_id: row.user_id})-[old:FROM_COUNTRY]->(c:Country)
+    WHERE c.name <> row.country
+    DELETE old
+    WITH DISTINCT row
+    OPTIONAL MATCH (:Traveller {user_id: row.user_id})-[:WROTE]->(:Review)-[:REVIEWED]->(h:Hotel)
+    RETURN collect(DISTINCT h.hotel_id) as hotel_ids
+    """, batch=batch)
+    hotel_ids = result.single()['hotel_ids']
+    _run_user_batch(tx, batch)
+    return hotel_ids
+
+def _sync_review_batch(tx, batch):
+    # A review moved to another hotel or author loses its old links; the old hotel is affected too
+    result = tx.run("""
+    UNWIND $batch as row
+    MATCH (r:Review {review_id: row.review_id})-[old:REVIEWED]->(h:Hotel)
+    WHERE h.hotel_id <> row.hotel_id
+    DELETE old
+    RETURN collect(DISTINCT h.hotel_id) as hotel_ids
+    """, batch=batch)
+    hotel_ids = result.single()['hotel_ids']
+    tx.run("""
+    UNWIND $batch as row
+    MATCH (t:Traveller)-[old:WROTE]->(r:Review {review_id: row.review_id})
+    WHERE t.user_id <> row.user_id
+    DELETE old
+    """, batch=batch)
+    # An appended review that now appears in reviews.csv is managed by the file from here on
+    tx.run("""
+    UNWIND $batch as row
+    MATCH (r:Review {review_id: row.review_id})
+    REMOVE r.source
+    """, batch=batch)
+    _run_review_batch(tx, batch)
+    _run_review_link_batch(tx, batch)
+    return hotel_ids + [row['hotel_id'] for row in batch]
+
+def _sync_visa(driver, file_path, batch_size):
+    with driver.session() as session:
+        existing = {(record['from'], record['to']): record['fingerprint'] for record in session.run("""
+        MATCH (a:Country)-[v:NEEDS_VISA]->(b:Country)
+        RETURN a.name as from, b.name as to, v.row_fingerprint as fingerprint
+        """)}
+        changed = 0
+        for batch in read_batches(file_path, parse_visa, batch_size):
+            rows = [row for row in batch if existing.pop((row['from'], row['to']), None) != row['fingerprint']]
+            if rows:
+                session.execute_write(_run_visa_batch, rows)
+                changed += len(rows)
+        session.run("""
+        UNWIND $pairs as pair
+        MATCH (:Country {name: pair[0]})-[v:NEEDS_VISA]->(:Country {name: pair[1]})
+        DELETE v
+        """, pairs=[list(pair) for pair in existing]).consume()
+    return changed, len(existing)
+
+def _delete_nodes(tx, keys, label, key):
+    # Reviews of a deleted traveller or hotel go with it, as a rebuild would not load them
+    result = tx.run(f"""
+    UNWIND $keys as key
+    MATCH (n:`{label}` {{{key}: key}})
+    OPTIONAL MATCH (n)-[:WROTE|REVIEWED]-(r:Review)
+    OPTIONAL MATCH (r)-[:REVIEWED]->(h:Hotel)
+    WITH n, collect(DISTINCT r) as reviews, collect(DISTINCT h.hotel_id) as hotel_ids
+    OPTIONAL MATCH (s:HotelSegment)-[:SEGMENT_OF]->(n)
+    WITH n, reviews, hotel_ids, collect(s) as segments
+    FOREACH (r IN reviews | DETACH DELETE r)
+    FOREACH (s IN segments | DETACH DELETE s)
+    DETACH DELETE n
+    RETURN hotel_ids
+    """, keys=keys)
+    return {hotel_id for record in result for hotel_id in record['hotel_ids']}
+
+def _delete_review_batch(tx, keys):
+    result = tx.run("""
+    UNWIND $keys as key
+    MATCH (r:Review {review_id: key})
+    OPTIONAL MATCH (r)-[:REVIEWED]->(h:Hotel)
+    DETACH DELETE r
+    RETURN collect(DISTINCT h.hotel_id) as hotel_ids
+    """, keys=keys)
+    return set(result.single()['hotel_ids'])
+
+def _delete_in_batches(driver, delete, keys, batch_size, *args):
+    affected = set()
+    with driver.session() as session:
+        for start in range(0, len(keys), batch_size):
+            affected |= session.execute_write(delete, keys[start:start + batch_size], *args)
+    return affected
+
+def recompute_hotel_aggregates(tx, hotel_ids):
+    """
+    Rebuilds the running totals, derived scores and HotelSegment nodes of the given hotels only,
+    and drops STAYED_AT links that no review supports any more.
+    """
+    tx.run("""
+    UNWIND $hotel_ids as hotel_id
+    MATCH (h:Hotel {hotel_id: hotel_id})
+    OPTIONAL MATCH (s:HotelSegment)-[:SEGMENT_OF]->(h)
+    DETACH DELETE s
+    WITH DISTINCT h
+    OPTIONAL MATCH (t:Traveller)-[stay:STAYED_AT]->(h)
+    WHERE NOT (t)-[:WROTE]->(:Review)-[:REVIEWED]->(h)
+    DELETE stay
+    WITH DISTINCT h
+    SET h.review_count = 0, h.score_count = 0, h.score_sum = 0.0, h.subscore_count = 0,
+        h.cleanliness_sum = 0.0, h.comfort_sum = 0.0, h.facilities_sum = 0.0
+    WITH h
+    """ + DERIVE_HOTEL_AGGREGATES, hotel_ids=hotel_ids)
+    tx.run(_hotel_totals_query("""
+    UNWIND $hotel_ids as hotel_id
+    MATCH (h:Hotel {hotel_id: hotel_id})<-[:REVIEWED]-(r:Review)
+    """, increment=True), hotel_ids=hotel_ids)
+    match = """
+    UNWIND $hotel_ids as hotel_id
+    MATCH (t:Traveller)-[:WROTE]->(r:Review)-[:REVIEWED]->(h:Hotel {hotel_id: hotel_id})
+    """
+    for dimension, prop in SEGMENT_DIMENSIONS:
+        tx.run(_segment_totals_query(match, dimension, prop, increment=False), hotel_ids=hotel_ids)
+
+def sync_graph(driver, batch_size=DEFAULT_BATCH_SIZE, hotels_file='hotels.csv', users_file='users.csv',
+               reviews_file='reviews.csv', visa_file='visa.csv'):
+    """
+    Brings the graph in line with the CSV files without wiping it: upserts new or changed rows,
+    deletes rows that disappeared and recomputes aggregates for the affected hotels only.
+    Returns a summary of what changed.
+    """
+    with driver.session() as session:
+        session.execute_write(create_constraints)
+        existing_hotels = _fetch_fingerprints(session, 'Hotel', 'hotel_id')
+        existing_users = _fetch_fingerprints(session, 'Traveller', 'user_id')
+        # Reviews added with --append-reviews are not in reviews.csv and must not be deleted
+        existing_reviews = _fetch_fingerprints(session, 'Review', 'review_id', where='n.source IS NULL')
+
+    summary = {}
+    stale = {}
+    affected = set()
+    # Upserts go parents first so reviews can MATCH their traveller and hotel
+    for label, file_path, parse, key, existing, upsert in (
+            ('hotels', hotels_file, parse_hotel, 'hotel_id', existing_hotels, _sync_hotel_batch),
+            ('users', users_file, parse_user, 'user_id', existing_users, _sync_user_batch),
+            ('reviews', reviews_file, parse_review, 'review_id', existing_reviews, _sync_review_batch)):
+        changed, stale[label], hotel_ids = _diff_rows(driver, file_path, parse, key, existing, upsert, batch_size)
+        summary[label] = {'changed': changed, 'deleted': len(stale[label])}
+        affected |= hotel_ids
+        print(f"{label}: {changed} new or changed, {len(stale[label])} removed")
+
+    # Deletes go children first
+    affected |= _delete_in_batches(driver, _delete_review_batch, stale['reviews'], batch_size)
+    affected |= _delete_in_batches(driver, _delete_nodes, stale['users'], batch_size, 'Traveller', 'user_id')
+    _delete_in_batches(driver, _delete_nodes, stale['hotels'], batch_size, 'Hotel', 'hotel_id')
+    affected -= set(stale['hotels'])
+
+    changed, deleted = _sync_visa(driver, visa_file, batch_size)
+    summary['visa'] = {'changed': changed, 'deleted': deleted}
+    print(f"visa rules: {changed} new or changed, {deleted} removed")
+
+    with driver.session() as session:
+        session.run("MATCH (ci:City) WHERE NOT (ci)<-[:LOCATED_IN]-(:Hotel) DETACH DELETE ci").consume()
+        session.run("MATCH (c:Country) WHERE NOT (c)--() DELETE c").consume()
+        hotel_ids = sorted(affected)
+        for start in range(0, len(hotel_ids), batch_size):
+            session.execute_write(recompute_hotel_aggregates, hotel_ids[start:start + batch_size])
+        if hotel_ids or summary['hotels']['changed'] or summary['hotels']['deleted']:
+            session.execute_write(bump_hotel_version)
+    summary['hotels_recomputed'] = len(affected)
+    print(f"Recomputed aggregates for {len(affected)} hotels. Done.")
+    return summary
+
+# Offline bulk import: node and relationship CSVs for `neo4j-admin database import full`.
+# Ids live in one ID space per label and are also stored as typed properties, so the imported
+# graph is identical to the one the transactional loader builds.
+IMPORT_MANIFEST = 'import_manifest.json'
+
+IMPORT_NODE_HEADERS = {
+    'Country': [':ID(Country)', 'name'],
+    'City': [':ID(City)', 'name'],
+    'Hotel': [':ID(Hotel)', 'hotel_id:long', 'name', 'star_rating:double',
+              'cleanliness_base:double', 'comfort_base:double', 'facilities_base:double', 'row_fingerprint'],
+    'Traveller': [':ID(Traveller)', 'user_id:long', 'age', 'type', 'gender', 'row_fingerprint'],
+    'Review': [':ID(Review)', 'review_id:long', 'text', 'date']
+              + [f'{score}:double' for score in REVIEW_SCORES] + ['row_fingerprint'],
+}
+
+IMPORT_RELATIONSHIP_HEADERS = {
+    ('City', 'LOCATED_IN', 'Country'): [':START_ID(City)', ':END_ID(Country)'],
+    ('Hotel', 'LOCATED_IN', 'City'): [':START_ID(Hotel)', ':END_ID(City)'],
+    ('Traveller', 'FROM_COUNTRY', 'Country'): [':START_ID(Traveller)', ':END_ID(Country)'],
+    ('Traveller', 'WROTE', 'Review'): [':START_ID(Traveller)', ':END_ID(Review)'],
+    ('Review', 'REVIEWED', 'Hotel'): [':START_ID(Review)', ':END_ID(Hotel)'],
+    ('Traveller', 'STAYED_AT', 'Hotel'): [':START_ID(Traveller)', ':END_ID(Hotel)'],
+    ('Country', 'NEEDS_VISA', 'Country'): [':START_ID(Country)', ':END_ID(Country)', 'visa_type', 'row_fingerprint'],
+}
+
+def _import_file_name(key):
+    return (key if isinstance(key, str) else '_'.join(key)).lower() + '.csv'
+
+def _cell(value):
+    # Empty cells are imported as missing properties, like null values in the MERGE loader
+    return '' if value is None else value
+
+def export_bulk_import(output_dir, hotels_file='hotels.csv', users_file='users.csv',
+                       reviews_file='reviews.csv', visa_file='visa.csv'):
+    """
+    Transforms the source CSVs into neo4j-admin import files in output_dir, with the same
+    de-duplication the MERGE loader applies: one Country / City per name, one STAYED_AT per
+    traveller and hotel, last visa rule per country pair, and reviews whose traveller or hotel
+    is unknown are skipped. Writes a manifest with the expected node and relationship counts
+    and returns it.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    files = {}
+    writers = {}
+    for key, header in list(IMPORT_NODE_HEADERS.items()) + list(IMPORT_RELATIONSHIP_HEADERS.items()):
+        files[key] = open(os.path.join(output_dir, _import_file_name(key)), 'w', encoding='utf-8', newline='')
+        writers[key] = csv.writer(files[key])
+        writers[key].writerow(header)
+    counts = {key: 0 for key in writers}
+
+    def write(key, row):
+        writers[key].writerow([_cell(value) for value in row])
+        counts[key] += 1
+
+    countries = set()
+    cities = set()
+    city_countries = set()
+    hotel_ids = set()
+    user_ids = set()
+    stays = set()
+    skipped_reviews = 0
+
+    def country(name):
+        if name not in countries:
+            countries.add(name)
+            write('Country', [name, name])
+
+    try:
+        for batch in read_batches(hotels_file, parse_hotel):
+            for hotel in batch:
+                country(hotel['country'])
+                if hotel['city'] not in cities:
+                    cities.add(hotel['city'])
+                    write('City', [hotel['city'], hotel['city']])
+                if (hotel['city'], hotel['country']) not in city_countries:
+                    city_countries.add((hotel['city'], hotel['country']))
+                    write(('City', 'LOCATED_IN', 'Country'), [hotel['city'], hotel['country']])
+                if hotel['hotel_id'] in hotel_ids:
+                    continue
+                hotel_ids.add(hotel['hotel_id'])
+                write('Hotel', [hotel['hotel_id'], hotel['hotel_id'], hotel['hotel_name'], hotel['star_rating'],
+                                hotel['cleanliness_base'], hotel['comfort_base'], hotel['facilities_base'],
+                                hotel['fingerprint']])
+                write(('Hotel', 'LOCATED_IN', 'City'), [hotel['hotel_id'], hotel['city']])
+
+        for batch in read_batches(users_file, parse_user):
+            for user in batch:
+                country(user['country'])
+                if user['user_id'] in user_ids:
+                    continue
+                user_ids.add(user['user_id'])
+                write('Traveller', [user['user_id'], user['user_id'], user['age_group'],
+                                    user['traveller_type'], user['user_gender'], user['fingerprint']])
+                write(('Traveller', 'FROM_COUNTRY', 'Country'), [user['user_id'], user['country']])
+
+        review_ids = set()
+        for batch in read_batches(reviews_file, parse_review):
+            for review in batch:
+                user_id, hotel_id = review['user_id'], review['hotel_id']
+                if user_id not in user_ids or hotel_id not in hotel_ids or review['review_id'] in review_ids:
+                    skipped_reviews += 1
+                    continue
+                review_ids.add(review['review_id'])
+                write('Review', [review['review_id'], review['review_id'], review['review_text'],
+                                 review['review_date']] + [review[score] for score in REVIEW_SCORES]
+                                + [review['fingerprint']])
+                write(('Traveller', 'WROTE', 'Review'), [user_id, review['review_id']])
+                write(('Review', 'REVIEWED', 'Hotel'), [review['review_id'], hotel_id])
+                if (user_id, hotel_id) not in stays:
+                    stays.add((user_id, hotel_id))
+                    write(('Traveller', 'STAYED_AT', 'Hotel'), [user_id, hotel_id])
+            print(f"Exported {len(review_ids)} reviews...", end='\r')
+
+        visa_rules = {}
+        for batch in read_batches(visa_file, parse_visa):
+            for rule in batch:
+                visa_rules[(rule['from'], rule['to'])] = rule
+        for (origin, destination), rule in visa_rules.items():
+            country(origin)
+            country(destination)
+            write(('Country', 'NEEDS_VISA', 'Country'), [origin, destination, rule['visa_type'], rule['fingerprint']])
+    finally:
+        for f in files.values():
+            f.close()
+
+    manifest = {
+        'nodes': {label: counts[label] for label in IMPORT_NODE_HEADERS},
+        'relationships': {},
+        'skipped_reviews': skipped_reviews,
+    }
+    for key in IMPORT_RELATIONSHIP_HEADERS:
+        rel_type = key[1]
+        manifest['relationships'][rel_type] = manifest['relationships'].get(rel_type, 0) + counts[key]
+    with open(os.path.join(output_dir, IMPORT_MANIFEST), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+
+    print(f"Exported {sum(manifest['nodes'].values())} nodes and "
+          f"{sum(manifest['relationships'].values())} relationships to {output_dir} "
+          f"({skipped_reviews} reviews skipped). Done.")
+    return manifest
+
+def bulk_import_command(output_dir, database='neo4j'):
+    """
+    The neo4j-admin invocation for an export (run it with the database stopped).
+    """
+    args = ['neo4j-admin database import full', database, '--overwrite-destination',
+            '--multiline-fields=true']
+    args += [f'--nodes={label}={os.path.join(output_dir, _import_file_name(label))}'
+             for label in IMPORT_NODE_HEADERS]
+    args += [f'--relationships={key[1]}={os.path.join(output_dir, _import_file_name(key))}'
+             for key in IMPORT_RELATIONSHIP_HEADERS]
+    return ' \\\n    '.join(args)
+
+def verify_bulk_import(driver, output_dir):
+    """
+    Compares node counts per label and relationship counts per type in the database with the
+    manifest written by export_bulk_import. Returns a list of mismatch descriptions (empty if the
+    import is complete).
+    """
+    with open(os.path.join(output_dir, IMPORT_MANIFEST), 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+
+    problems = []
+    with driver.session() as session:
+        for label, expected in manifest['nodes'].items():
+            actual = session.run(f"MATCH (n:`{label}`) RETURN count(n) as count").single()['count']
+            if actual != expected:
+                problems.append(f"{label} nodes: expected {expected}, found {actual}")
+        for rel_type, expected in manifest['relationships'].items():
+            actual = session.run(f"MATCH ()-[r:`{rel_type}`]->() RETURN count(r) as count").single()['count']
+            if actual != expected:
+                problems.append(f"{rel_type} relationships: expected {expected}, found {actual}")
+    return problems
+
 def main():
+    parser = argparse.ArgumentParser(description="Build the hotel Knowledge Graph in Neo4j")
+    parser.add_argument("--append-reviews", metavar="CSV",
+                        help="Only ingest new reviews from this CSV (same columns as reviews.csv) "
+                             "and update hotel aggregates incrementally, without a rebuild")
+    parser.add_argument("--sync", action="store_true",
+                        help="Update the existing graph in place: only write new or changed rows, delete "
+                             "removed ones and recompute aggregates for affected hotels (no wipe)")
+    parser.add_argument("--resume", action="store_true",
+                        help="Continue an interrupted build from its checkpoint instead of starting over")
+    parser.add_argument("--checkpoint", default=DEFAULT_CHECKPOINT,
+                        help=f"Checkpoint file of the build (default: {DEFAULT_CHECKPOINT})")
+    parser.add_argument("--metrics-file", metavar="JSON",
+                        help="Also write the per-stage timing summary to this file")
+    parser.add_argument("--export-import", metavar="DIR",
+                        help="Write neo4j-admin import files for a cold build to DIR instead of loading "
+                             "through the database (no Neo4j connection needed)")
+    parser.add_argument("--verify-import", metavar="DIR",
+                        help="Check an offline import against the counts exported to DIR, then create "
+                             "constraints and compute the hotel aggregates")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE,
+                        help=f"Rows per write transaction (default: {DEFAULT_BATCH_SIZE})")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS,
+                        help=f"Parallel Review node writers, partitioned by hotel_id (default: {DEFAULT_WORKERS})")
+    args = parser.parse_args()
+
+    if args.export_import:
+        export_bulk_import(args.export_import)
+        print("Stop Neo4j and run:\n    " + bulk_import_command(args.export_import))
+        print(f"Then start Neo4j and run: python Create_kg.py --verify-import {args.export_import}")
+        return
+
     load_dotenv()
     uri = os.getenv("NEO4J_URI")
     username = os.getenv("NEO4J_USERNAME")
@@ -171,30 +1037,83 @@ def main():
 
     driver = GraphDatabase.driver(uri, auth=(username, password))
 
+    if args.verify_import:
+        problems = verify_bulk_import(driver, args.verify_import)
+        if problems:
+            print("Offline import is incomplete:")
+            for problem in problems:
+                print(f"  - {problem}")
+            driver.close()
+            raise SystemExit(1)
+        print("Offline import matches the exported counts.")
+        with driver.session() as session:
+            print("Creating constraints...")
+            session.execute_write(create_constraints)
+            print("Computing Hotel Average Scores...")
+            session.execute_write(compute_hotel_scores)
+            print("Computing Traveller Type / Age Group Aggregates...")
+            session.execute_write(compute_segment_scores)
+        print("Knowledge Graph created successfully!")
+        invalidate_answer_cache()
+        driver.close()
+        return
+
+    if args.append_reviews:
+        print(f"Appending reviews from {args.append_reviews}...")
+        if append_reviews_file(driver, args.append_reviews, args.batch_size):
+            # Hotel ratings changed: cached answers citing the old averages are stale
+            invalidate_answer_cache()
+        driver.close()
+        return
+
+    if args.sync:
+        print("Syncing the Knowledge Graph with the CSV files...")
+        summary = sync_graph(driver, args.batch_size)
+        if any(summary[label]['changed'] or summary[label]['deleted'] for label in ('hotels', 'users', 'reviews', 'visa')):
+            invalidate_answer_cache()
+            print("Run `python Create_embeddings.py` to embed new or changed hotels.")
+        driver.close()
+        return
+
+    checkpoint = Checkpoint(args.checkpoint, resume=args.resume)
+    metrics = IngestMetrics()
+
+    def run_stage(name, message, load):
+        if checkpoint.is_done(name):
+            print(f"Skipping {name} (already done)")
+            return
+        print(message)
+        with metrics.stage(name) as stage:
+            stage['rows'] = load() or 0
+        checkpoint.stage_done(name)
+
     with driver.session() as session:
-        print("Clearing database...")
-        clear_database_loop(session)
-        
-        print("Creating constraints...")
-        session.execute_write(create_constraints)
-        
-        print("Loading Hotels...")
-        session.execute_write(load_hotels, 'hotels.csv')
-        
-        print("Loading Users...")
-        session.execute_write(load_users, 'users.csv')
-        
-        print("Loading Reviews...")
-        # load_reviews manages its own sessions/transactions now
-        load_reviews(driver, 'reviews.csv')
-        
-        print("Loading Visa data...")
-        session.execute_write(load_visa, 'visa.csv')
-        
-        print("Computing Hotel Average Scores...")
-        session.execute_write(compute_hotel_scores)
+        run_stage("clear", "Clearing database...", lambda: clear_database_loop(session))
+        run_stage("constraints", "Creating constraints...", lambda: session.execute_write(create_constraints))
+        run_stage("hotels", "Loading Hotels...", lambda: load_hotels(driver, 'hotels.csv', args.batch_size, checkpoint))
+        run_stage("users", "Loading Users...", lambda: load_users(driver, 'users.csv', args.batch_size, checkpoint))
+        # load_reviews runs its own pool of writer sessions
+        run_stage("reviews", "Loading Reviews...",
+                  lambda: load_reviews(driver, 'reviews.csv', args.batch_size, args.workers, checkpoint))
+        run_stage("review_links", "Linking Reviews to Travellers...",
+                  lambda: link_reviews(driver, 'reviews.csv', args.batch_size, checkpoint))
+        run_stage("visa", "Loading Visa data...", lambda: load_visa(driver, 'visa.csv', args.batch_size, checkpoint))
+        run_stage("hotel_scores", "Computing Hotel Average Scores...",
+                  lambda: session.execute_write(compute_hotel_scores))
+        run_stage("segment_scores", "Computing Traveller Type / Age Group Aggregates...",
+                  lambda: session.execute_write(compute_segment_scores))
         
         print("Knowledge Graph created successfully!")
+    
+    checkpoint.remove()
+    summary = json.dumps(metrics.summary(), indent=2)
+    print(summary)
+    if args.metrics_file:
+        with open(args.metrics_file, 'w', encoding='utf-8') as f:
+            f.write(summary)
+
+    # Cached answers were generated from the old graph
+    invalidate_answer_cache()
 
     driver.close()
 
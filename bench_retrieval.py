@@ -0,0 +1,651 @@
+"""
+Offline retrieval benchmark.
+
+Replays a labelled query set through GraphRetriever.retrieve_baseline and
+EmbeddingManager.search_similar_hotels and reports latency percentiles, throughput
+and recall@k. By default everything runs against a local stand-in built from the repo
+CSVs (no Neo4j, no model downloads); --backend live benchmarks the configured Neo4j
+instance and the real sentence-transformer models with the same query set.
+
+Results are written as JSON (sorted keys) to bench_output.txt so two runs can be
+diffed or compared with --compare.
+"""
+import argparse
+import csv
+import hashlib
+import json
+import os
+import platform
+import random
+import re
+import sys
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from dotenv import load_dotenv
+
+import src.logger as Logger
+from src.models import Intent, Entities
+from src.retriever import GraphRetriever
+from src.embeddings import EmbeddingManager, QueryEmbeddingCache, build_search_text
+
+DEFAULT_OUTPUT = "bench_output.txt"
+# Share of synthetic reviews without an overall score, as in the real data
+UNSCORED_REVIEW_SHARE = 0.1
+# Hand-checked best rated hotel ids for the default synthetic reviews (40 per hotel, seed 7):
+# the highest means over scored reviews, in line with the hotels' subscore bases in hotels.csv
+EXPECTED_TOP_RATED = {(40, 7): [5, 4, 10, 16, 9]}
+
+class HashingEncoder:
+    """
+    Deterministic stand-in for a SentenceTransformer: signed feature hashing of word
+    unigrams and character trigrams into a fixed number of dimensions.
+    """
+    TOKEN = re.compile(r"[a-z0-9]+")
+
+    def __init__(self, dimensions: int):
+        self.dimensions = dimensions
+
+    def _features(self, text):
+        words = self.TOKEN.findall(text.lower())
+        grams = [w[i:i + 3] for w in words for i in range(max(1, len(w) - 2))]
+        return words + grams
+
+    def _encode_one(self, text):
+        vector = np.zeros(self.dimensions, dtype=np.float32)
+        for feature in self._features(text):
+            digest = hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest()
+            bucket = int.from_bytes(digest[:4], "little") % self.dimensions
+            vector[bucket] += 1.0 if digest[4] & 1 else -1.0
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def encode(self, sentences, batch_size: int = 32, show_progress_bar: bool = False):
+        if isinstance(sentences, str):
+            return self._encode_one(sentences)
+        return np.vstack([self._encode_one(s) for s in sentences])
+
+def _age_bounds(age_group):
+    if age_group.endswith("+"):
+        return int(age_group[:-1]), 200
+    low, high = age_group.split("-")
+    return int(low), int(high)
+
+class LocalGraph:
+    """
+    In-memory copy of the knowledge graph built from hotels.csv, users.csv, visa.csv and
+    reviews.csv, with the same aggregates Create_kg.py materializes. reviews.csv is not
+    shipped with the repo; when it is missing, reviews are generated with a fixed seed.
+    """
+    def __init__(self, data_dir: str = ".", reviews_per_hotel: int = 40, seed: int = 7):
+        self.hotels = {}
+        with open(os.path.join(data_dir, "hotels.csv"), encoding="utf-8") as f:
+            for row in csv.DictReader(f):
+                self.hotels[int(row["hotel_id"])] = {
+                    "name": row["hotel_name"], "city": row["city"], "country": row["country"],
+                    "stars": float(row["star_rating"]),
+                    "clean": float(row["cleanliness_base"]),
+                    "comfort": float(row["comfort_base"]),
+                    "facilities": float(row["facilities_base"]),
+                }
+        with open(os.path.join(data_dir, "users.csv"), encoding="utf-8") as f:
+            self.users = {int(row["user_id"]): row for row in csv.DictReader(f)}
+        with open(os.path.join(data_dir, "visa.csv"), encoding="utf-8") as f:
+            self.visa = {(row["from"], row["to"]): row["visa_type"] for row in csv.DictReader(f)}
+
+        reviews_path = os.path.join(data_dir, "reviews.csv")
+        self.synthetic_reviews = not os.path.exists(reviews_path)
+        self.review_setup = (reviews_per_hotel, seed) if self.synthetic_reviews else None
+        if self.synthetic_reviews:
+            self.reviews = self._synthetic_reviews(reviews_per_hotel, seed)
+        else:
+            with open(reviews_path, encoding="utf-8") as f:
+                self.reviews = [self._parse_review(row) for row in csv.DictReader(f)]
+        self._aggregate()
+
+    @staticmethod
+    def _parse_review(row):
+        score = lambda key: float(row[key]) if row.get(key) else None
+        return {
+            "review_id": int(row["review_id"]), "user_id": int(row["user_id"]),
+            "hotel_id": int(row["hotel_id"]), "date": row["review_date"], "text": row["review_text"],
+            "overall": score("score_overall"), "clean": score("score_cleanliness"),
+            "comfort": score("score_comfort"), "facilities": score("score_facilities"),
+        }
+
+    def _synthetic_reviews(self, per_hotel, seed):
+        rng = random.Random(seed)
+        user_ids = sorted(self.users)
+        reviews = []
+        for hotel_id, hotel in sorted(self.hotels.items()):
+            for _ in range(per_hotel):
+                sub = {key: min(10.0, max(0.0, round(hotel[key] + rng.gauss(0, 0.6), 1)))
+                       for key in ("clean", "comfort", "facilities")}
+                overall = round(sum(sub.values()) / 3 + rng.gauss(0, 0.4), 1)
+                reviews.append({
+                    "review_id": len(reviews) + 1, "user_id": rng.choice(user_ids), "hotel_id": hotel_id,
+                    "date": f"2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+                    "text": f"Stayed at {hotel['name']} in {hotel['city']}.",
+                    "overall": overall if rng.random() >= UNSCORED_REVIEW_SHARE else None, **sub,
+                })
+        return reviews
+
+    def _aggregate(self):
+        totals = defaultdict(lambda: {"count": 0, "score_count": 0, "sum": 0.0, "sub_count": 0,
+                                      "clean": 0.0, "comfort": 0.0, "facilities": 0.0})
+        segments = defaultdict(lambda: [0, 0, 0.0])  # review count, score count, score sum
+        self.reviews_by_hotel = defaultdict(list)
+        for review in self.reviews:
+            user = self.users.get(review["user_id"])
+            if user is None or review["hotel_id"] not in self.hotels:
+                continue  # the loader's MATCH skips these too
+            self.reviews_by_hotel[review["hotel_id"]].append(review)
+            total = totals[review["hotel_id"]]
+            total["count"] += 1
+            if review["overall"] is not None:
+                total["score_count"] += 1
+                total["sum"] += review["overall"]
+            if None not in (review["clean"], review["comfort"], review["facilities"]):
+                total["sub_count"] += 1
+                for key in ("clean", "comfort", "facilities"):
+                    total[key] += review[key]
+            for dimension, value in (("traveller_type", user["traveller_type"]), ("age_group", user["age_group"])):
+                segment = segments[(review["hotel_id"], dimension, value)]
+                segment[0] += 1
+                if review["overall"] is not None:
+                    segment[1] += 1
+                    segment[2] += review["overall"]
+
+        for hotel_id, hotel in self.hotels.items():
+            total = totals.get(hotel_id)
+            hotel["rating"] = total["sum"] / total["score_count"] if total and total["score_count"] else None
+            hotel["expected"] = hotel["clean"] + hotel["comfort"] + hotel["facilities"]
+            hotel["actual"] = (total["clean"] + total["comfort"] + total["facilities"]) / total["sub_count"] \
+                if total and total["sub_count"] else None
+            hotel["delta"] = hotel["actual"] - hotel["expected"] if hotel["actual"] is not None else None
+
+        self.segments = []
+        for (hotel_id, dimension, value), (count, score_count, score_sum) in segments.items():
+            age_min, age_max = _age_bounds(value) if dimension == "age_group" else (None, None)
+            self.segments.append({
+                "hotel_id": hotel_id, "dimension": dimension, "value": value, "review_count": count,
+                "score_count": score_count, "score_sum": score_sum,
+                "avg_score": score_sum / score_count if score_count else None, "age_min": age_min, "age_max": age_max,
+            })
+
+    def embed(self, encoders: dict):
+        """
+        Stores a vector per hotel for each embedding property, like Create_embeddings.py.
+        """
+        for prop, encoder in encoders.items():
+            texts = [build_search_text(hotel) for hotel in self.hotels.values()]
+            for hotel, vector in zip(self.hotels.values(), encoder.encode(texts)):
+                hotel[prop] = np.asarray(vector, dtype=np.float32)
+
+    # --- Cypher stand-ins, one per GraphRetriever query (same result keys) ---
+
+    def _by_rating(self, hotels):
+        return sorted(hotels, key=lambda h: (h["rating"] is None, -(h["rating"] or 0)))
+
+    def hotel_details(self, p):
+        return [{"hotel": h["name"], "stars": h["stars"], "rating": h["rating"], "city": h["city"],
+                 "cleanliness": h["clean"], "comfort": h["comfort"], "facilities": h["facilities"]}
+                for h in self.hotels.values() if h["name"] == p["hotel_name"]]
+
+    def hotels_in_city(self, p):
+        hotels = self._by_rating(h for h in self.hotels.values() if h["city"] == p["city"])[:10]
+        return [{"hotel": h["name"], "h.star_rating": h["stars"], "h.average_reviews_score": h["rating"]} for h in hotels]
+
+    def visa_check(self, p):
+        countries = {h["country"] for h in self.hotels.values()} | {u["country"] for u in self.users.values()} \
+            | {c for pair in self.visa for c in pair}
+        if p["from_country"] not in countries or p["to_country"] not in countries:
+            return []
+        visa = self.visa.get((p["from_country"], p["to_country"]))
+        return [{"from": p["from_country"], "to": p["to_country"], "visa_requirement": visa or "No Visa Required"}]
+
+    def age_groups(self, p):
+        per_hotel = defaultdict(lambda: [0.0, 0])
+        for s in self.segments:
+            if s["dimension"] == "age_group" and s["age_min"] <= p["age_max"] and s["age_max"] >= p["age_min"]:
+                per_hotel[s["hotel_id"]][0] += s["score_sum"]
+                per_hotel[s["hotel_id"]][1] += s["score_count"]
+        rows = [{"hotel": self.hotels[i]["name"], "rating": total / count}
+                for i, (total, count) in per_hotel.items() if count > 0]
+        return sorted(rows, key=lambda r: -r["rating"])[:5]
+
+    def traveller_type(self, p):
+        rows = [{"hotel": self.hotels[s["hotel_id"]]["name"], "rating": s["avg_score"]} for s in self.segments
+                if s["dimension"] == "traveller_type" and s["value"] == p["traveller_type"]]
+        # Cypher sorts null first in descending order
+        return sorted(rows, key=lambda r: (r["rating"] is not None, -(r["rating"] or 0)))[:10]
+
+    def exceeds_expectations(self, p):
+        hotels = sorted((h for h in self.hotels.values() if h["delta"] is not None and h["delta"] >= 0),
+                        key=lambda h: -h["delta"])[:10]
+        return [{"hotel": h["name"], "expected_score": h["expected"], "actual_score": h["actual"],
+                 "improvement": h["delta"]} for h in hotels]
+
+    def attributes(self, p):
+        hotels = sorted((h for h in self.hotels.values() if h["clean"] >= p["min_cleanliness"]
+                         and h["comfort"] >= p["min_comfort"] and h["facilities"] >= p["min_facilities"]),
+                        key=lambda h: -h["stars"])[:10]
+        return [{"hotel": h["name"], "h.star_rating": h["stars"], "h.cleanliness_base": h["clean"],
+                 "h.comfort_base": h["comfort"], "h.facilities_base": h["facilities"]} for h in hotels]
+
+    def rating_filter(self, p):
+        hotels = self._by_rating(h for h in self.hotels.values() if h["rating"] is not None
+                                 and h["rating"] >= p["minRating"] and h["stars"] >= p["minStars"])[:10]
+        return [{"hotel": h["name"], "h.average_reviews_score": h["rating"], "h.star_rating": h["stars"],
+                 "city": h["city"]} for h in hotels]
+
+    def top_rated(self, p):
+        hotels = self._by_rating(h for h in self.hotels.values() if h["rating"] is not None)[:5]
+        return [{"hotel": h["name"], "rating": h["rating"]} for h in hotels]
+
+    def hotel_reviews(self, p):
+        rows = []
+        for hotel_id, hotel in self.hotels.items():
+            if hotel["name"] == p["hotel_name"]:
+                for review in self.reviews_by_hotel[hotel_id]:
+                    rows.append({"review": review["text"], "date": review["date"], "score": review["overall"],
+                                 "traveller_type": self.users[review["user_id"]]["traveller_type"]})
+        return sorted(rows, key=lambda r: r["date"], reverse=True)[:5]
+
+    def known_entities(self, p):
+        names = [h["name"] for h in self.hotels.values()] + [h["city"] for h in self.hotels.values()]
+        names += [h["country"] for h in self.hotels.values()]
+        return [{"name": name} for name in dict.fromkeys(names)]
+
+    def vector_search(self, prop, k, embedding):
+        hotels = [h for h in self.hotels.values() if prop in h]
+        if not hotels:
+            return []
+        matrix = np.vstack([h[prop] for h in hotels])
+        query = np.asarray(embedding, dtype=np.float32)
+        query = query / (np.linalg.norm(query) or 1.0)
+        cosine = matrix @ query
+        top = np.argsort(-cosine)[:k]
+        return [{"hotel": hotels[i]["name"], "stars": hotels[i]["stars"], "rating": hotels[i]["rating"],
+                 "score": float((1.0 + cosine[i]) / 2.0)} for i in top]
+
+# (intent, sample entities, LocalGraph handler): the sample entities make
+# GraphRetriever.get_query_for_intent produce the Cypher text the handler stands in for
+QUERY_HANDLERS = [
+    ("search", {"hotel_name": "x"}, "hotel_details"),
+    ("search", {"city": "x"}, "hotels_in_city"),
+    ("search", {"target_country": "x", "current_country": "y"}, "visa_check"),
+    ("recommendation", {"age_min": 18}, "age_groups"),
+    ("recommendation", {"traveller_type": "Solo"}, "traveller_type"),
+    ("recommendation", {"attributes": ["exceeds expectations"]}, "exceeds_expectations"),
+    ("recommendation", {"attributes": ["clean"]}, "attributes"),
+    ("recommendation", {"min_stars": 5}, "rating_filter"),
+    ("recommendation", {}, "top_rated"),
+    ("question", {"hotel_name": "x"}, "hotel_reviews"),
+]
+
+def _normalize_cypher(query):
+    return " ".join(query.split())
+
+class LocalRecord:
+    def __init__(self, values: dict):
+        self.values = values
+
+    def data(self):
+        return dict(self.values)
+
+    def __getitem__(self, key):
+        return self.values[key]
+
+class LocalResult:
+    def __init__(self, rows):
+        self.records = [LocalRecord(row) for row in rows]
+
+    def __iter__(self):
+        return iter(self.records)
+
+    def __aiter__(self):
+        return self._aiter()
+
+    async def _aiter(self):
+        for record in self.records:
+            yield record
+
+    def single(self):
+        return self.records[0] if self.records else None
+
+    def consume(self):
+        return None
+
+class LocalSession:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def run(self, query, parameters=None, **kwargs):
+        return LocalResult(self.driver.execute(query, {**(parameters or {}), **kwargs}))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+class LocalAsyncSession(LocalSession):
+    async def run(self, query, parameters=None, **kwargs):
+        return LocalSession.run(self, query, parameters, **kwargs)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+class LocalDriver:
+    """
+    Minimal sync + async Neo4j driver look-alike that answers the queries the retriever and
+    the embedding manager send by dispatching their exact text to LocalGraph handlers.
+    """
+    def __init__(self, graph: LocalGraph, retriever_cls=GraphRetriever):
+        self.graph = graph
+        self.handlers = {}
+        retriever = retriever_cls(driver=self)
+        for intent, entities, handler in QUERY_HANDLERS:
+            query, _ = retriever.get_query_for_intent(intent, Entities(**entities).model_dump())
+            self.handlers[_normalize_cypher(query)] = getattr(graph, handler)
+
+    def execute(self, query, params):
+        text = _normalize_cypher(query)
+        handler = self.handlers.get(text)
+        if handler:
+            return handler(params)
+        if "db.index.vector.queryNodes" in text:
+            index_name = re.search(r"queryNodes\('([^']+)'", text).group(1)
+            prop = "embedding_v2" if index_name.endswith("_v2") else "embedding"
+            return self.graph.vector_search(prop, params["k"], params["embedding"])
+        if "EmbeddingState" in text:
+            return [{"version": 1, "updated_at": None}]
+        match = re.search(r"h\.(\w+) as embedding", text)
+        if match:
+            return [{"hotel": h["name"], "stars": h["stars"], "rating": h["rating"], "embedding": h[match.group(1)]}
+                    for h in self.graph.hotels.values() if match.group(1) in h]
+        if "n:Hotel OR n:City OR n:Country" in text:
+            return self.graph.known_entities(params)
+        raise ValueError(f"Local stand-in has no handler for query: {text[:120]}")
+
+    def session(self, **kwargs):
+        return LocalSession(self)
+
+    def close(self):
+        pass
+
+class LocalAsyncDriver(LocalDriver):
+    def session(self, **kwargs):
+        return LocalAsyncSession(self)
+
+    async def close(self):
+        pass
+
+def _segment_ranking(graph: LocalGraph, in_segment=lambda user: True) -> list:
+    """
+    Hotel names by the average overall score of reviews whose author satisfies in_segment,
+    computed from the raw review rows rather than the aggregates the handlers use.
+    """
+    per_hotel = defaultdict(lambda: [0.0, 0])
+    for review in graph.reviews:
+        user = graph.users.get(review["user_id"])
+        if user is None or review["hotel_id"] not in graph.hotels or not in_segment(user):
+            continue
+        if review["overall"] is None:
+            continue
+        per_hotel[review["hotel_id"]][0] += review["overall"]
+        per_hotel[review["hotel_id"]][1] += 1
+    ranked = sorted(per_hotel.items(), key=lambda item: -item[1][0] / item[1][1])
+    return [graph.hotels[hotel_id]["name"] for hotel_id, _ in ranked]
+
+def _age_overlaps(age_group, age_min, age_max):
+    low, high = _age_bounds(age_group)
+    return low <= age_max and high >= age_min
+
+def labelled_queries(graph: LocalGraph) -> list:
+    """
+    The replayed query set. `relevant` is the ideal answer (hotel names, best first when
+    `ranked`) computed directly from the source data, or the hand-checked EXPECTED_TOP_RATED
+    for the default reviews; None means latency only.
+    """
+    hotels = list(graph.hotels.values())
+    expected = EXPECTED_TOP_RATED.get(graph.review_setup)
+    if expected:
+        rated = [graph.hotels[hotel_id]["name"] for hotel_id in expected]
+    else:
+        rated = _segment_ranking(graph)
+    stars = {h["name"]: h["stars"] for h in hotels}
+    by_city = defaultdict(list)
+    for h in hotels:
+        by_city[h["city"]].append(h["name"])
+
+    cases = []
+    for city, names in sorted(by_city.items()):
+        cases.append({"name": f"search_city:{city}", "intent": "search", "entities": {"city": city},
+                      "relevant": names, "ranked": False})
+    for h in hotels:
+        cases.append({"name": f"search_hotel:{h['name']}", "intent": "search", "entities": {"hotel_name": h["name"]},
+                      "relevant": [h["name"]], "ranked": False})
+        cases.append({"name": f"reviews:{h['name']}", "intent": "question", "entities": {"hotel_name": h["name"]},
+                      "relevant": None, "ranked": False})
+    for origin, destination in sorted(graph.visa)[:20]:
+        cases.append({"name": f"visa:{origin}->{destination}", "intent": "search",
+                      "entities": {"current_country": origin, "target_country": destination},
+                      "relevant": None, "ranked": False})
+    for traveller_type in ("Solo", "Couple", "Family", "Business"):
+        cases.append({"name": f"traveller_type:{traveller_type}", "intent": "recommendation",
+                      "entities": {"traveller_type": traveller_type},
+                      "relevant": _segment_ranking(graph, lambda u: u["traveller_type"] == traveller_type),
+                      "ranked": True})
+    for age_min, age_max in ((18, 24), (25, 34), (35, 44), (55, 70)):
+        cases.append({"name": f"age:{age_min}-{age_max}", "intent": "recommendation",
+                      "entities": {"age_min": age_min, "age_max": age_max},
+                      "relevant": _segment_ranking(graph, lambda u: _age_overlaps(u["age_group"], age_min, age_max)),
+                      "ranked": True})
+    cases.append({"name": "clean", "intent": "recommendation", "entities": {"attributes": ["clean"]},
+                  "relevant": [h["name"] for h in sorted(hotels, key=lambda h: -h["stars"]) if h["clean"] >= 8.0],
+                  "ranked": False})
+    cases.append({"name": "exceeds_expectations", "intent": "recommendation",
+                  "entities": {"attributes": ["exceeds expectations"]},
+                  "relevant": [h["name"] for h in sorted(hotels, key=lambda h: -(h["delta"] or 0))
+                               if h["delta"] is not None and h["delta"] >= 0], "ranked": True})
+    cases.append({"name": "five_stars", "intent": "recommendation", "entities": {"min_stars": 5},
+                  "relevant": [name for name in rated if stars[name] >= 5], "ranked": True})
+    cases.append({"name": "top_rated", "intent": "recommendation", "entities": {},
+                  "relevant": rated, "ranked": True})
+    return cases
+
+def semantic_queries(graph: LocalGraph) -> list:
+    cases = []
+    for h in graph.hotels.values():
+        cases.append({"name": f"hotel:{h['name']}", "query": f"{h['name']} hotel", "relevant": [h["name"]]})
+        cases.append({"name": f"city:{h['city']}", "query": f"a hotel to stay in {h['city']}, {h['country']}",
+                      "relevant": [o["name"] for o in graph.hotels.values() if o["city"] == h["city"]]})
+    return cases
+
+def recall_at_k(returned: list, relevant: list, k: int, ranked: bool = True):
+    """
+    Share of the ideal top-k (ranked) or of the relevant set (unranked, capped at k)
+    found in the first k results.
+    """
+    if relevant is None:
+        return None
+    if not relevant:
+        return 1.0 if not returned else 0.0
+    ideal = relevant[:k] if ranked else relevant
+    found = len(set(returned[:k]) & set(ideal))
+    return found / min(k, len(ideal))
+
+def _latency_summary(latencies, wall_time, recalls):
+    latencies_ms = np.asarray(latencies) * 1000.0
+    recalls = [r for r in recalls if r is not None]
+    return {
+        "queries": len(latencies),
+        "mean_ms": round(float(latencies_ms.mean()), 4),
+        "p50_ms": round(float(np.percentile(latencies_ms, 50)), 4),
+        "p95_ms": round(float(np.percentile(latencies_ms, 95)), 4),
+        "p99_ms": round(float(np.percentile(latencies_ms, 99)), 4),
+        "throughput_qps": round(len(latencies) / wall_time, 2) if wall_time else None,
+        "recall_at_k": round(float(np.mean(recalls)), 4) if recalls else None,
+    }
+
+def replay(cases, run_case, rounds: int, concurrency: int, warmup: int = 1):
+    """
+    Runs every case `rounds` times (after `warmup` untimed passes) with `concurrency`
+    threads and returns (latencies, wall time, recall per case from the last round).
+    """
+    for _ in range(warmup):
+        for case in cases:
+            run_case(case)
+
+    def timed(case):
+        start = time.perf_counter()
+        returned = run_case(case)
+        return time.perf_counter() - start, returned
+
+    latencies = []
+    returned_by_case = {}
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+        for _ in range(rounds):
+            for case, (latency, returned) in zip(cases, pool.map(timed, cases)):
+                latencies.append(latency)
+                returned_by_case[case["name"]] = returned
+    wall_time = time.perf_counter() - start
+    return latencies, wall_time, returned_by_case
+
+def run_benchmark(args):
+    graph = LocalGraph(args.data_dir, reviews_per_hotel=args.reviews_per_hotel)
+    query_cache = QueryEmbeddingCache() if args.query_cache else QueryEmbeddingCache(capacity=0)
+
+    if args.backend == "local":
+        graph.embed({"embedding": HashingEncoder(384), "embedding_v2": HashingEncoder(768)})
+        retriever = GraphRetriever(driver=LocalAsyncDriver(graph))
+        embedder = EmbeddingManager(
+            verify_indices=False, backend=args.embedding_backend, query_cache=query_cache,
+            driver=LocalDriver(graph), async_driver=LocalAsyncDriver(graph),
+            models=(HashingEncoder(384), HashingEncoder(768)),
+        )
+    else:
+        retriever = GraphRetriever()
+        embedder = EmbeddingManager(backend=args.embedding_backend, query_cache=query_cache)
+
+    k = args.k
+    suites = {}
+    per_case = {}
+    try:
+        cases = labelled_queries(graph)
+
+        def run_baseline(case):
+            rows = retriever.retrieve_baseline(Intent(category=case["intent"], reasoning="benchmark"),
+                                               Entities(**case["entities"]))
+            return [row.get("hotel") for row in rows]
+
+        latencies, wall_time, returned = replay(cases, run_baseline, args.rounds, args.concurrency)
+        recalls = {c["name"]: recall_at_k(returned[c["name"]], c["relevant"], k, c["ranked"]) for c in cases}
+        suites["baseline"] = _latency_summary(latencies, wall_time, recalls.values())
+        per_case["baseline"] = recalls
+
+        semantic_cases = semantic_queries(graph)
+        for model_version in (1, 2):
+            def run_semantic(case):
+                rows = embedder.search_similar_hotels(case["query"], top_k=k, model_version=model_version)
+                return [row.get("hotel") for row in rows]
+
+            latencies, wall_time, returned = replay(semantic_cases, run_semantic, args.rounds, args.concurrency)
+            recalls = {c["name"]: recall_at_k(returned[c["name"]], c["relevant"], k, ranked=False)
+                       for c in semantic_cases}
+            suites[f"semantic_v{model_version}"] = _latency_summary(latencies, wall_time, recalls.values())
+            per_case[f"semantic_v{model_version}"] = recalls
+    finally:
+        retriever.close()
+        embedder.close()
+
+    return {
+        "meta": {
+            "backend": args.backend,
+            "embedding_backend": args.embedding_backend,
+            "k": k,
+            "rounds": args.rounds,
+            "concurrency": args.concurrency,
+            "query_cache": args.query_cache,
+            "synthetic_reviews": graph.synthetic_reviews,
+            "hotels": len(graph.hotels),
+            "reviews": len(graph.reviews),
+            "python": platform.python_version(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        },
+        "suites": suites,
+        "recall_per_case": per_case,
+    }
+
+def compare(current: dict, previous: dict, max_regression: float) -> list:
+    """
+    Latency percentiles that got more than max_regression (fraction) slower, and recall drops.
+    """
+    regressions = []
+    for suite, stats in current["suites"].items():
+        old = previous.get("suites", {}).get(suite)
+        if not old:
+            continue
+        for metric in ("p50_ms", "p95_ms", "p99_ms"):
+            if old.get(metric) and stats[metric] > old[metric] * (1 + max_regression):
+                regressions.append(f"{suite}.{metric}: {old[metric]:.3f} -> {stats[metric]:.3f} ms")
+        if old.get("recall_at_k") is not None and stats["recall_at_k"] is not None \
+                and stats["recall_at_k"] < old["recall_at_k"]:
+            regressions.append(f"{suite}.recall_at_k: {old['recall_at_k']:.4f} -> {stats['recall_at_k']:.4f}")
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Cypher and semantic retrieval latency and recall")
+    parser.add_argument("--backend", choices=["local", "live"], default="local",
+                        help="local: in-memory stand-in built from the CSVs (default); live: NEO4J_* database and real models")
+    parser.add_argument("--embedding-backend", choices=["neo4j", "memory"], default="neo4j",
+                        help="EmbeddingManager search backend (default: neo4j)")
+    parser.add_argument("--rounds", type=int, default=20, help="Timed passes over the query set (default: 20)")
+    parser.add_argument("--concurrency", type=int, default=1, help="Queries in flight at once (default: 1)")
+    parser.add_argument("--k", type=int, default=5, help="Cut-off for recall@k and semantic top_k (default: 5)")
+    parser.add_argument("--query-cache", action="store_true",
+                        help="Keep the query embedding cache on (default: every query is encoded)")
+    parser.add_argument("--reviews-per-hotel", type=int, default=40,
+                        help="Synthetic reviews per hotel when reviews.csv is missing (default: 40)")
+    parser.add_argument("--data-dir", default=".", help="Directory with the source CSVs")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help=f"Result file (default: {DEFAULT_OUTPUT})")
+    parser.add_argument("--compare", metavar="PREVIOUS", help="Earlier result file to check for regressions")
+    parser.add_argument("--max-regression", type=float, default=0.2,
+                        help="Allowed latency increase over --compare before failing (default: 0.2 = 20%%)")
+    args = parser.parse_args()
+
+    load_dotenv()
+    Logger.verbosity = Logger.ERROR
+
+    results = run_benchmark(args)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+    print(f"{'suite':<14}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'qps':>10}{'recall@' + str(args.k):>11}")
+    for suite, stats in results["suites"].items():
+        recall = f"{stats['recall_at_k']:.3f}" if stats["recall_at_k"] is not None else "-"
+        print(f"{suite:<14}{stats['p50_ms']:>10.3f}{stats['p95_ms']:>10.3f}{stats['p99_ms']:>10.3f}"
+              f"{stats['throughput_qps']:>10.1f}{recall:>11}")
+    print(f"Results written to {args.output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            regressions = compare(results, json.load(f), args.max_regression)
+        if regressions:
+            print("Regressions against " + args.compare + ":")
+            for regression in regressions:
+                print(f"  - {regression}")
+            sys.exit(1)
+        print(f"No regressions against {args.compare}.")
+
+if __name__ == "__main__":
+    main()
@@ -4,9 +4,12 @@ from dotenv import load_dotenv
 
 from src.processor import Preprocessor
 from src.retriever import GraphRetriever
-from src.embeddings import EmbeddingManager
+from src.embeddings import EmbeddingManager, build_embeddings
+from src.context_builder import build_context
+from src.intent_classifier import IntentClassifier, INTENT_CLASSIFIER
 import src.logger as Logger
 import src.inference as Inference
+from src import tracing
 
 load_dotenv()
 
@@ -15,7 +18,7 @@ def get_response(model_name, verbosity, query, add_embeddings):
     Logger.verbosity = verbosity
     
     if add_embeddings:
-        EmbeddingManager() # only needs to be instantiated
+        build_embeddings() # offline job: create indices and embed new/changed hotels
         return
 
     # Check keys
@@ -28,42 +31,50 @@ def get_response(model_name, verbosity, query, add_embeddings):
 
     try:
         Logger.log("Initializing Components...")
-        processor = Preprocessor()
         retriever = GraphRetriever()
         embedder = EmbeddingManager()
+        # The local classifier reuses the already-loaded MiniLM model
+        intent_classifier = IntentClassifier.from_embedder(embedder) if INTENT_CLASSIFIER == "local" else None
+        processor = Preprocessor(intent_classifier=intent_classifier)
         
         if query:
             # Single query mode
-            Logger.log(f"Processing query: {query}")
-            Logger.log("...> Analyzing Request...")
-            intent, entities = processor.process(query)
+            # Every stage records a span; TRACE_FILE exports the trace as a JSON line
+            with tracing.trace("query", model=model_name) as trace:
+                Logger.log(f"Processing query: {query}")
+                Logger.log("...> Analyzing Request...")
+                intent, entities = processor.process(query)
             
-            Logger.log(f"    [Intent]: {intent.category}")
-            Logger.log(f"    [Entities]: {', '.join([f'{k}={v}' for k,v in entities.model_dump().items() if v])}")
+                Logger.log(f"    [Intent]: {intent.category}")
+                Logger.log(f"    [Entities]: {', '.join([f'{k}={v}' for k,v in entities.model_dump().items() if v])}")
             
-            Logger.log("...> Retrieving from Knowledge Graph...")
+                Logger.log("...> Retrieving from Knowledge Graph...")
             
-            # 1. Baseline Retrieval
-            baseline_results = retriever.retrieve_baseline(intent, entities)
+                # 1. Baseline Retrieval
+                baseline_results = retriever.retrieve_baseline(intent, entities)
             
-            # 2. Embedding Retrieval (Vector Search)
-            embedding_results = []
-            if intent.category in ["search", "recommendation"]:
-                embedding_results = embedder.search_similar_hotels(query)
+                # 2. Embedding Retrieval (Vector Search)
+                embedding_results = []
+                if intent.category in ["search", "recommendation"]:
+                    embedding_results = embedder.search_similar_hotels(query)
 
-            # Display Results
-            Logger.log("\n--- Baseline Results (Cypher) ---")
-            Logger.log(retriever.format_results(baseline_results))
+                # Display Results
+                Logger.log("\n--- Baseline Results (Cypher) ---")
+                Logger.log(retriever.format_results(baseline_results))
 
-            Logger.log("\n--- Semantic Search Results (Embeddings) ---")
-            Logger.log(embedder.format_results(embedding_results))
+                Logger.log("\n--- Semantic Search Results (Embeddings) ---")
+                Logger.log(embedder.format_results(embedding_results))
+            
+                context = build_context(baseline_results, embedding_results if add_embeddings else [], model_name)
             
-            context = baseline_results + embedding_results if add_embeddings else baseline_results
+                formatted_query = Inference.format_prompt(query, context)
+                client = Inference.setup_inference(model_name)
             
-            formatted_query = Inference.format_prompt(query, context)
-            client = Inference.setup_inference()
+                response = Inference.call_model(client, model_name, formatted_query)
             
-            response = Inference.call_model(client, model_name, formatted_query)
+            if Logger.verbosity >= Logger.DEBUG:
+                Logger.log("\n--- Latency Breakdown ---", Logger.DEBUG)
+                Logger.log(tracing.format_trace(trace), Logger.DEBUG)
             
             retriever.close()
             embedder.close()
@@ -75,6 +86,7 @@ def get_response(model_name, verbosity, query, add_embeddings):
             Logger.log("Type 'exit' to quit.\n")
             
             while True:
+                Logger.flush()
                 user_input = input("\nUser: ")
                 if user_input.lower() in ['exit', 'quit']:
                     break
@@ -112,6 +124,7 @@ def get_response(model_name, verbosity, query, add_embeddings):
 
     except Exception as e:
         Logger.log(f"Application Error: {e}", Logger.ERROR)
+        Logger.flush()
         import traceback
         traceback.print_exc()
 
@@ -122,7 +135,7 @@ if __name__ == "__main__":
     parser.add_argument("--model", default="microsoft/DialoGPT-medium", 
                        help="Model name for inference (default: microsoft/DialoGPT-medium)")
     parser.add_argument("--verbosity", type=int, default=1, 
-                       help="Verbosity level (0=minimal, 1=normal, 2=detailed)")
+                       help="Verbosity level (0=minimal, 1=normal, 2=detailed, 3=debug: latency breakdown)")
     parser.add_argument("--query", type=str, 
                        help="Single query to process (if not provided, starts interactive mode)")
     parser.add_argument("--add-embeddings", action="store_true", 
@@ -133,10 +146,12 @@ if __name__ == "__main__":
     if args.add_embeddings:
         print("Adding embeddings to the database...")
         get_response(args.model, args.verbosity, "", True)
+        Logger.flush()
         print("Embeddings added successfully!")
     elif args.query:
         print(f"Processing query: {args.query}")
         response = get_response(args.model, args.verbosity, args.query, False)
+        Logger.flush()
         if response:
             print(f"Response: {response}")
     else:
@@ -0,0 +1,132 @@
+import os
+import time
+import sqlite3
+import hashlib
+import threading
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Disk-backed cache of final LLM answers, keyed by (model, prompt)
+ANSWER_CACHE_ENABLED = os.environ.get("ANSWER_CACHE_ENABLED", "1") not in ("0", "false", "False")
+ANSWER_CACHE_PATH = os.environ.get("ANSWER_CACHE_PATH", os.path.join(PROJECT_DIR, ".answer_cache.sqlite3"))
+ANSWER_CACHE_TTL = float(os.environ.get("ANSWER_CACHE_TTL", 24 * 3600))
+ANSWER_CACHE_MAX_BYTES = int(os.environ.get("ANSWER_CACHE_MAX_BYTES", 50 * 1024 * 1024))
+
+class AnswerCache:
+    """
+    SQLite cache of LLM answers with a TTL and least-recently-used eviction once the
+    stored answers exceed max_bytes. Safe to share between threads and processes.
+    """
+    def __init__(self, path: str = ANSWER_CACHE_PATH, ttl: float = ANSWER_CACHE_TTL,
+                 max_bytes: int = ANSWER_CACHE_MAX_BYTES):
+        self.path = path
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False, timeout=10)
+        with self.lock, self.conn:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS answers (
+                    key TEXT PRIMARY KEY,
+                    model TEXT NOT NULL,
+                    answer TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+            """)
+            self.conn.execute("CREATE INDEX IF NOT EXISTS answers_accessed_at ON answers (accessed_at)")
+
+    @staticmethod
+    def make_key(model_name: str, prompt: str) -> str:
+        return hashlib.sha256(f"{model_name}\n{prompt}".encode("utf-8")).hexdigest()
+
+    def get(self, model_name: str, prompt: str):
+        key = self.make_key(model_name, prompt)
+        now = time.time()
+        with self.lock, self.conn:
+            row = self.conn.execute("SELECT answer, created_at FROM answers WHERE key = ?", (key,)).fetchone()
+            if row and now - row[1] > self.ttl:
+                self.conn.execute("DELETE FROM answers WHERE key = ?", (key,))
+                row = None
+            if row is None:
+                self.misses += 1
+                return None
+            self.conn.execute("UPDATE answers SET accessed_at = ? WHERE key = ?", (now, key))
+            self.hits += 1
+            return row[0]
+
+    def put(self, model_name: str, prompt: str, answer: str):
+        if not answer:
+            return
+        key = self.make_key(model_name, prompt)
+        now = time.time()
+        size = len(answer.encode("utf-8"))
+        with self.lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO answers (key, model, answer, size, created_at, accessed_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (key, model_name, answer, size, now, now)
+            )
+            self._evict(now)
+
+    def _evict(self, now: float):
+        self.conn.execute("DELETE FROM answers WHERE created_at < ?", (now - self.ttl,))
+        total = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM answers").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        # Drop least recently used answers until we are back under budget
+        freed = 0
+        stale = []
+        for key, size in self.conn.execute("SELECT key, size FROM answers ORDER BY accessed_at"):
+            if total - freed <= self.max_bytes:
+                break
+            stale.append((key,))
+            freed += size
+        self.conn.executemany("DELETE FROM answers WHERE key = ?", stale)
+
+    def clear(self):
+        """
+        Invalidation hook: drops every cached answer (e.g. after the knowledge graph is rebuilt).
+        """
+        with self.lock, self.conn:
+            self.conn.execute("DELETE FROM answers")
+
+    def stats(self):
+        with self.lock:
+            entries, total = self.conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM answers").fetchone()
+            lookups = self.hits + self.misses
+            return {
+                "entries": entries,
+                "bytes": total,
+                "max_bytes": self.max_bytes,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+_cache = None
+_cache_lock = threading.Lock()
+
+def get_answer_cache():
+    """
+    Returns the process-wide answer cache, or None when ANSWER_CACHE_ENABLED is off.
+    """
+    global _cache
+    if not ANSWER_CACHE_ENABLED:
+        return None
+    with _cache_lock:
+        if _cache is None:
+            _cache = AnswerCache()
+        return _cache
+
+def invalidate_answer_cache():
+    """
+    Clears all cached answers. Called whenever the knowledge graph is rebuilt.
+    """
+    cache = get_answer_cache()
+    if cache:
+        cache.clear()
@@ -0,0 +1,55 @@
+import asyncio
+import concurrent.futures
+import contextvars
+import threading
+
+# One long-lived event loop per process. Async drivers and clients are bound to the loop
+# they were first used on, so every coroutine of the pipeline runs here, and blocking
+# callers (Streamlit script threads, the CLI) submit work to it and wait.
+_loop = None
+_thread = None
+_lock = threading.Lock()
+
+def get_loop():
+    """
+    Returns the shared background event loop, starting it on first use.
+    """
+    global _loop, _thread
+    with _lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            _thread = threading.Thread(target=_loop.run_forever, name="async-runner", daemon=True)
+            _thread.start()
+    return _loop
+
+def in_loop_thread():
+    return _thread is not None and threading.current_thread() is _thread
+
+def run(coro, timeout: float = None):
+    """
+    Runs a coroutine on the shared loop and blocks until it finishes.
+    The caller's context variables are visible to the coroutine.
+    """
+    if in_loop_thread():
+        coro.close()
+        raise RuntimeError("run() would deadlock inside the event loop; await the coroutine instead.")
+
+    loop = get_loop()
+    context = contextvars.copy_context()
+    future = concurrent.futures.Future()
+
+    def on_done(task):
+        if task.cancelled():
+            future.cancel()
+        elif task.exception() is not None:
+            future.set_exception(task.exception())
+        else:
+            future.set_result(task.result())
+
+    def submit():
+        # Creating the task inside context.run() makes it inherit the caller's context
+        task = context.run(loop.create_task, coro)
+        task.add_done_callback(on_done)
+
+    loop.call_soon_threadsafe(submit)
+    return future.result(timeout)
@@ -0,0 +1,128 @@
+import os
+import functools
+from . import logger as Logger
+
+# Maximum prompt tokens spent on retrieved context
+CONTEXT_TOKEN_BUDGET = int(os.environ.get("CONTEXT_TOKEN_BUDGET", 800))
+# Long free-text cells (e.g. review text) are cut to this many characters
+MAX_CELL_CHARS = int(os.environ.get("CONTEXT_MAX_CELL_CHARS", 300))
+
+# Verbose Cypher result keys -> compact column names. The semantic-search similarity
+# ("score") becomes "match" in merge_results; Cypher rows keep their own "score" (review score)
+FIELD_ALIASES = {
+    "star_rating": "stars",
+    "average_reviews_score": "rating",
+    "cleanliness_base": "cleanliness",
+    "comfort_base": "comfort",
+    "facilities_base": "facilities",
+    "visa_requirement": "visa",
+}
+
+# Columns in the order the LLM sees them; anything else follows in first-seen order
+FIELD_ORDER = [
+    "hotel", "city", "country", "stars", "rating", "cleanliness", "comfort", "facilities",
+    "match", "traveller_type", "date", "score", "review", "from", "to", "visa",
+]
+
+def normalize_row(row: dict) -> dict:
+    """
+    Strips variable prefixes ("h.star_rating" -> "star_rating") and applies FIELD_ALIASES.
+    """
+    normalized = {}
+    for key, value in row.items():
+        name = key.split(".")[-1]
+        name = FIELD_ALIASES.get(name, name)
+        if value is not None and name not in normalized:
+            normalized[name] = value
+    return normalized
+
+def merge_results(baseline_results: list, semantic_results: list) -> list:
+    """
+    Merges Cypher and semantic rows by hotel identity and ranks them: hotels found by both
+    retrievers first, then the remaining Cypher rows in query order, then the remaining
+    semantic rows by similarity. Rows without a hotel (reviews, visa checks) are de-duplicated as-is.
+    """
+    merged = {}
+    order = []
+    for source, rows in (("baseline", baseline_results or []), ("semantic", semantic_results or [])):
+        for position, row in enumerate(rows):
+            row = normalize_row(row)
+            if source == "semantic" and "score" in row:
+                row["match"] = row.pop("score")
+            hotel = row.get("hotel")
+            key = ("hotel", str(hotel).strip().lower()) if hotel else ("row", tuple(sorted(map(str, row.items()))))
+            if key not in merged:
+                merged[key] = {"row": dict(row), "sources": set(), "position": position}
+                order.append(key)
+            entry = merged[key]
+            for name, value in row.items():
+                entry["row"].setdefault(name, value)
+            entry["sources"].add(source)
+
+    def rank(key):
+        entry = merged[key]
+        both = len(entry["sources"]) > 1
+        from_baseline = "baseline" in entry["sources"]
+        similarity = entry["row"].get("match") or 0
+        return (not both, not from_baseline, entry["position"] if from_baseline else -similarity)
+
+    return [merged[key]["row"] for key in sorted(order, key=rank)]
+
+def _format_value(value) -> str:
+    if isinstance(value, float):
+        text = f"{value:.2f}".rstrip("0").rstrip(".")
+    else:
+        text = " ".join(str(value).split())
+    if len(text) > MAX_CELL_CHARS:
+        text = text[:MAX_CELL_CHARS - 3] + "..."
+    return text.replace("|", "/")
+
+def render_table(rows: list, count_tokens, token_budget: int) -> str:
+    """
+    Renders rows as a pipe-separated table, adding rows in rank order until the token budget is used.
+    """
+    if not rows:
+        return ""
+    columns = [name for name in FIELD_ORDER if any(name in row for row in rows)]
+    for row in rows:
+        columns += [name for name in row if name not in columns]
+
+    lines = [" | ".join(columns)]
+    used = count_tokens(lines[0])
+    for row in rows:
+        line = " | ".join(_format_value(row[name]) if name in row else "-" for name in columns)
+        cost = count_tokens("\n" + line)
+        if used + cost > token_budget:
+            break
+        lines.append(line)
+        used += cost
+    return "\n".join(lines) if len(lines) > 1 else ""
+
+def _approximate_tokens(text: str) -> int:
+    # Roughly four characters per token for English text
+    return max(1, len(text) // 4)
+
+@functools.lru_cache(maxsize=8)
+def get_token_counter(model_name: str = None):
+    """
+    Token counter using the target model's tokenizer, or a character-based estimate when
+    the tokenizer cannot be loaded (unknown/gated model, offline). Cached per model, so the
+    tokenizer is loaded (and a failure reported) once; preload it off the request path.
+    """
+    if not model_name:
+        return _approximate_tokens
+    try:
+        from transformers import AutoTokenizer
+        tokenizer = AutoTokenizer.from_pretrained(model_name, token=os.environ.get("HF_TOKEN"))
+    except Exception as e:
+        Logger.log(f"Tokenizer for {model_name} unavailable ({e}), estimating context tokens.")
+        return _approximate_tokens
+    return lambda text: len(tokenizer.encode(text, add_special_tokens=False))
+
+def build_context(baseline_results: list, semantic_results: list, model_name: str = None,
+                  token_budget: int = None) -> str:
+    """
+    Compact, de-duplicated, token-budgeted context string for format_prompt.
+    """
+    rows = merge_results(baseline_results, semantic_results)
+    return render_table(rows, get_token_counter(model_name), token_budget or CONTEXT_TOKEN_BUDGET)
@@ -1,44 +1,362 @@
 import os
-from neo4j import GraphDatabase
+import time
+import asyncio
+import hashlib
+import threading
+from collections import OrderedDict
+import numpy as np
+from neo4j import GraphDatabase, AsyncGraphDatabase
 from sentence_transformers import SentenceTransformer
 from . import logger as Logger
+from . import async_runner
+from . import tracing
+
+MODEL_1_NAME = 'all-MiniLM-L6-v2'
+MODEL_2_NAME = 'paraphrase-albert-small-v2'
+
+# Hotels fetched from Neo4j per page, and sentences per model.encode() call
+DEFAULT_PAGE_SIZE = int(os.environ.get("EMBEDDING_PAGE_SIZE", 1000))
+DEFAULT_BATCH_SIZE = int(os.environ.get("EMBEDDING_BATCH_SIZE", 64))
+
+# Vector index name -> (Hotel property, expected dimensions)
+VECTOR_INDEXES = {
+    'hotel_embeddings': ('embedding', 384),
+    'hotel_embeddings_v2': ('embedding_v2', 768),
+}
+
+# Embedding model version -> vector index serving it
+MODEL_VERSION_INDEXES = {1: 'hotel_embeddings', 2: 'hotel_embeddings_v2'}
+
+def check_model_version(model_version: int):
+    if model_version not in MODEL_VERSION_INDEXES:
+        raise ValueError(f"Unknown embedding model version {model_version!r}. Use 1 or 2.")
+
+# Share of Hotel nodes that must carry an embedding before a serving instance starts
+MIN_COVERAGE = float(os.environ.get("EMBEDDING_MIN_COVERAGE", 1.0))
+
+# "neo4j" queries the vector indices, "memory" answers from an in-process NumPy matrix
+DEFAULT_BACKEND = os.environ.get("EMBEDDING_BACKEND", "neo4j")
+# How often (seconds) the in-memory backend checks the graph's embedding version
+REFRESH_INTERVAL = float(os.environ.get("EMBEDDING_REFRESH_INTERVAL", 60))
+
+# Bounds of the query embedding LRU cache (entries and total vector bytes)
+QUERY_CACHE_SIZE = int(os.environ.get("QUERY_CACHE_SIZE", 1024))
+QUERY_CACHE_MAX_BYTES = int(os.environ.get("QUERY_CACHE_MAX_BYTES", 16 * 1024 * 1024))
+
+def build_search_text(hotel):
+    """
+    Builds the rich text that gets embedded for a hotel record. Missing fields (e.g. a hotel
+    without a City or Country) are left out, so every hotel can be embedded.
+    """
+    location = ", ".join(str(part) for part in (hotel.get('city'), hotel.get('country')) if part)
+    parts = [f"Hotel {hotel['name']}" + (f" in {location}." if location else ".")]
+    if hotel.get('stars') is not None:
+        parts.append(f"{hotel['stars']} star rating.")
+    for label, key in (("Cleanliness", 'clean'), ("Comfort", 'comfort'), ("Facilities", 'facilities')):
+        if hotel.get(key) is not None:
+            parts.append(f"{label} score: {hotel[key]}.")
+    return " ".join(parts)
+
+def embedding_fingerprint(search_text, model_name):
+    """
+    Content hash of the search text plus the identity of the model that embeds it.
+    A hotel only needs re-embedding when this value changes.
+    """
+    return hashlib.sha256(f"{model_name}\n{search_text}".encode('utf-8')).hexdigest()
+
+def normalize_query(text: str) -> str:
+    """
+    Casing and whitespace do not change what a query means, so they should not miss the cache.
+    """
+    return " ".join(text.lower().split())
+
+class QueryEmbeddingCache:
+    """
+    Thread-safe LRU cache of query vectors keyed by (model_version, normalized query),
+    bounded both by entry count and by the total bytes of the stored float32 vectors.
+    """
+    def __init__(self, capacity: int = QUERY_CACHE_SIZE, max_bytes: int = QUERY_CACHE_MAX_BYTES):
+        self.capacity = capacity
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def get(self, model_version: int, query_text: str):
+        key = (model_version, normalize_query(query_text))
+        with self.lock:
+            vector = self.entries.get(key)
+            if vector is None:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return vector
+
+    def put(self, model_version: int, query_text: str, vector):
+        if self.capacity <= 0:
+            return
+        key = (model_version, normalize_query(query_text))
+        vector = np.array(vector, dtype=np.float32)
+        vector.flags.writeable = False
+        if vector.nbytes > self.max_bytes:
+            return
+        with self.lock:
+            old = self.entries.pop(key, None)
+            if old is not None:
+                self.bytes -= old.nbytes
+            self.entries[key] = vector
+            self.bytes += vector.nbytes
+            while len(self.entries) > self.capacity or self.bytes > self.max_bytes:
+                _, evicted = self.entries.popitem(last=False)
+                self.bytes -= evicted.nbytes
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.bytes = 0
+
+    def stats(self):
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self.entries),
+                "bytes": self.bytes,
+                "capacity": self.capacity,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+class InMemoryVectorIndex:
+    """
+    Holds every hotel vector of one embedding property in a contiguous, L2-normalized
+    float32 matrix plus a local table of display fields, so top-k search is a single
+    matrix-vector product instead of a database round trip.
+    """
+    version_query = """
+    OPTIONAL MATCH (m:EmbeddingState {name: 'hotels'})
+    RETURN m.version as version
+    """
+
+    def __init__(self, driver, embedding_property: str, refresh_interval: float = REFRESH_INTERVAL):
+        self.driver = driver
+        self.embedding_property = embedding_property
+        self.refresh_interval = refresh_interval
+        self.matrix = None
+        self.rows = []
+        self.version = None
+        self.checked_at = 0.0
+        self.lock = threading.Lock()
+
+    def load(self):
+        """
+        (Re)loads all vectors and display fields from the graph.
+        """
+        load_query = f"""
+        MATCH (h:Hotel)
+        WHERE h.{self.embedding_property} IS NOT NULL
+        RETURN h.name as hotel,
+               h.star_rating as stars,
+               h.average_reviews_score as rating,
+               h.{self.embedding_property} as embedding
+        """
+        with self.driver.session() as session:
+            version = session.run(self.version_query).single()['version']
+            records = [record.data() for record in session.run(load_query)]
+        
+        if records:
+            matrix = np.ascontiguousarray([r.pop('embedding') for r in records], dtype=np.float32)
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            matrix /= np.where(norms == 0, 1.0, norms)
+        else:
+            matrix = np.zeros((0, 0), dtype=np.float32)
+        
+        self.matrix = matrix
+        self.rows = records
+        self.version = version
+        self.checked_at = time.time()
+        Logger.log(f"Loaded {len(records)} '{self.embedding_property}' vectors into memory (version {version}).")
+
+    def refresh_if_stale(self):
+        """
+        Loads on first use, then reloads whenever the graph's embedding version changes.
+        The version is only checked every refresh_interval seconds.
+        """
+        with self.lock:
+            if self.matrix is None:
+                self.load()
+                return
+            if time.time() - self.checked_at < self.refresh_interval:
+                return
+            with self.driver.session() as session:
+                version = session.run(self.version_query).single()['version']
+            self.checked_at = time.time()
+            if version != self.version:
+                Logger.log(f"Embedding version changed ({self.version} -> {version}), reloading...")
+                self.load()
+
+    def search(self, query_embedding, top_k: int = 3):
+        self.refresh_if_stale()
+        matrix, rows = self.matrix, self.rows
+        if not rows or top_k <= 0:
+            return []
+        
+        query = np.asarray(query_embedding, dtype=np.float32)
+        norm = np.linalg.norm(query)
+        if norm:
+            query = query / norm
+        
+        cosine = matrix @ query
+        k = min(top_k, len(rows))
+        if k < len(rows):
+            top = np.argpartition(-cosine, k - 1)[:k]
+        else:
+            top = np.arange(len(rows))
+        top = top[np.argsort(-cosine[top])]
+        
+        # Same scale as Neo4j's cosine vector index: (1 + cosine) / 2
+        return [dict(rows[i], score=float((1.0 + cosine[i]) / 2.0)) for i in top]
 
 class EmbeddingManager:
-    def __init__(self):
+    def __init__(self, verify_indices: bool = True, backend: str = None, query_cache: QueryEmbeddingCache = None,
+                 driver=None, async_driver=None, models: tuple = None):
+        """
+        Serving-only setup: opens the driver, loads both models and checks that the
+        vector indices are ready. It never writes to the graph; index creation and
+        population live in build_embeddings() / Create_embeddings.py.
+        Drivers and (model_1, model_2) can be passed in instead, e.g. by bench_retrieval.py.
+        """
         self.uri = os.environ.get("NEO4J_URI", "neo4j://localhost:7687")
         self.username = os.environ.get("NEO4J_USERNAME", "neo4j")
         self.password = os.environ.get("NEO4J_PASSWORD")
         
-        if not self.password:
+        if driver is None and not self.password:
             raise ValueError("NEO4J_PASSWORD not found in environment.")
             
         Logger.log("Initializing Embedding Manager...")
         
         # Initialize database connection
-        self.driver = GraphDatabase.driver(self.uri, auth=(self.username, self.password))
+        self.driver = driver or GraphDatabase.driver(self.uri, auth=(self.username, self.password))
         
         # Initialize Sentence Transformer Models
-        try:
-            Logger.log("Loading Model 1: all-MiniLM-L6-v2 (384 dim)...")
-            self.model_1 = SentenceTransformer('all-MiniLM-L6-v2')
-            
-            Logger.log("Loading Model 2: paraphrase-albert-small-v2 (768 dim)...")
-            self.model_2 = SentenceTransformer('paraphrase-albert-small-v2')
-        except Exception as e:
-            Logger.log(f"Failed to load models: {e}", Logger.ERROR)
-            raise e
+        if models:
+            self.model_1, self.model_2 = models
+        else:
+            try:
+                Logger.log(f"Loading Model 1: {MODEL_1_NAME} (384 dim)...")
+                self.model_1 = SentenceTransformer(MODEL_1_NAME)
+                
+                Logger.log(f"Loading Model 2: {MODEL_2_NAME} (768 dim)...")
+                self.model_2 = SentenceTransformer(MODEL_2_NAME)
+            except Exception as e:
+                Logger.log(f"Failed to load models: {e}", Logger.ERROR)
+                raise e
         
-        Logger.log("Creating Vector Indices...")
-        self.create_vector_indices()
+        self.backend = backend or DEFAULT_BACKEND
+        if self.backend not in ("neo4j", "memory"):
+            raise ValueError(f"Unknown embedding backend '{self.backend}'. Use 'neo4j' or 'memory'.")
+        self.query_cache = query_cache or QueryEmbeddingCache()
+        self.memory_indexes = {
+            1: InMemoryVectorIndex(self.driver, 'embedding'),
+            2: InMemoryVectorIndex(self.driver, 'embedding_v2'),
+        }
+        self.version_stamp = None
+        self.version_checked_at = 0.0
+        self.version_lock = threading.Lock()
+        
+        if verify_indices:
+            try:
+                self.check_readiness()
+            except Exception:
+                self.driver.close()
+                raise
         
-        Logger.log("Populating Embeddings (this may take a while)...")
-        self.populate_embeddings()
+        # Query-time vector index lookups go through the async driver on the shared event loop
+        self.async_driver = async_driver or AsyncGraphDatabase.driver(self.uri, auth=(self.username, self.password))
         
         Logger.log("Setup Complete.")
 
     def close(self):
+        async_runner.run(self.aclose())
+
+    async def aclose(self):
+        await self.async_driver.close()
         self.driver.close()
 
+    def readiness_problems(self):
+        """
+        Returns a list of reasons why semantic search cannot be served yet (empty when ready):
+        missing or non-ONLINE vector indices, wrong dimensions, or too few embedded hotels.
+        """
+        problems = []
+        
+        index_query = """
+        SHOW INDEXES YIELD name, type, state, options
+        WHERE name IN $names
+        RETURN name, type, state, options
+        """
+        coverage_query = """
+        MATCH (h:Hotel)
+        RETURN count(h) as total,
+               count(h.embedding) as embedding,
+               count(h.embedding_v2) as embedding_v2
+        """
+        
+        with self.driver.session() as session:
+            indexes = {record['name']: record.data() for record in session.run(index_query, names=list(VECTOR_INDEXES))}
+            coverage = session.run(coverage_query).single().data()
+        
+        for name, (prop, dimensions) in VECTOR_INDEXES.items():
+            index = indexes.get(name)
+            if not index:
+                problems.append(f"Vector index '{name}' does not exist.")
+                continue
+            if index['type'] != 'VECTOR':
+                problems.append(f"Index '{name}' is a {index['type']} index, expected VECTOR.")
+            if index['state'] != 'ONLINE':
+                problems.append(f"Vector index '{name}' is {index['state']}, expected ONLINE.")
+            
+            index_config = (index.get('options') or {}).get('indexConfig') or {}
+            actual_dimensions = index_config.get('vector.dimensions')
+            if actual_dimensions is not None and int(actual_dimensions) != dimensions:
+                problems.append(f"Vector index '{name}' has {actual_dimensions} dimensions, expected {dimensions}.")
+            
+            total = coverage['total']
+            if total == 0:
+                problems.append("No Hotel nodes found in the graph.")
+            elif coverage[prop] / total < MIN_COVERAGE:
+                problems.append(f"Only {coverage[prop]}/{total} hotels have '{prop}' "
+                                f"(required coverage {MIN_COVERAGE:.0%}).")
+        
+        # The same "no hotels" problem is reported once per index; keep it once
+        return list(dict.fromkeys(problems))
+
+    def check_readiness(self):
+        """
+        Fails fast if the vector indices are not ready to serve queries.
+        """
+        Logger.log("Checking vector indices...")
+        problems = self.readiness_problems()
+        if problems:
+            for problem in problems:
+                Logger.log(f"[!] {problem}", Logger.ERROR)
+            raise RuntimeError(
+                "Embedding indices are not ready: " + " ".join(problems) +
+                " Run 'python Create_embeddings.py' to build them."
+            )
+        Logger.log("Vector indices are ONLINE and populated.")
+
+    def wait_for_indices(self, timeout: int = 300):
+        """
+        Blocks until the vector indices finish populating.
+        """
+        with self.driver.session() as session:
+            session.run("CALL db.awaitIndexes($timeout)", timeout=timeout).consume()
+
     def create_vector_indices(self):
         """
         Creates Vector Indices for both embedding models.
@@ -77,71 +395,193 @@ class EmbeddingManager:
             except Exception as e:
                 Logger.log(f"Error creating index 2: {e}", Logger.ERROR)
 
-    def populate_embeddings(self):
+    def populate_embeddings(self, page_size: int = None, batch_size: int = None):
         """
-        Fetches all hotels, creates rich text, generates both embeddings, and updates the graph.
+        Streams hotels from the graph page by page, builds their rich text, batch-encodes
+        only the hotels whose search text or embedding model changed since the last run,
+        and writes each page back with a single UNWIND statement per model.
         """
+        page_size = page_size or DEFAULT_PAGE_SIZE
+        batch_size = batch_size or DEFAULT_BATCH_SIZE
+        
+        # Keyset pagination on hotel_id keeps every page an index seek instead of a growing SKIP
         fetch_query = """
-        MATCH (h:Hotel)-[:LOCATED_IN]->(c:City)-[:LOCATED_IN]->(co:Country)
+        MATCH (h:Hotel)
+        WHERE h.hotel_id > $last_id
+        WITH h ORDER BY h.hotel_id LIMIT $page_size
+        // Optional, so hotels without a City or Country are embedded too
+        OPTIONAL MATCH (h)-[:LOCATED_IN]->(c:City)
+        OPTIONAL MATCH (c)-[:LOCATED_IN]->(co:Country)
         RETURN h.hotel_id as id, h.name as name, h.star_rating as stars, 
                h.cleanliness_base as clean, h.comfort_base as comfort, 
-               h.facilities_base as facilities, c.name as city, co.name as country
+               h.facilities_base as facilities, c.name as city, co.name as country,
+               h.embedding_fingerprint as fingerprint_1,
+               h.embedding_v2_fingerprint as fingerprint_2
+        ORDER BY h.hotel_id
         """
         
-        update_query = """
-        MATCH (h:Hotel {hotel_id: $id})
-        SET h.embedding = $embedding,
-            h.embedding_v2 = $embedding_v2,
-            h.search_text = $search_text
+        update_query_1 = """
+        UNWIND $rows as row
+        MATCH (h:Hotel {hotel_id: row.id})
+        SET h.embedding = row.embedding,
+            h.embedding_fingerprint = row.fingerprint,
+            h.embedding_model = $model_name,
+            h.search_text = row.search_text
         """
         
+        update_query_2 = """
+        UNWIND $rows as row
+        MATCH (h:Hotel {hotel_id: row.id})
+        SET h.embedding_v2 = row.embedding,
+            h.embedding_v2_fingerprint = row.fingerprint,
+            h.embedding_v2_model = $model_name,
+            h.search_text = row.search_text
+        """
+        
+        jobs = [
+            (self.model_1, MODEL_1_NAME, update_query_1, 'fingerprint_1'),
+            (self.model_2, MODEL_2_NAME, update_query_2, 'fingerprint_2'),
+        ]
+        
+        Logger.log(f"Streaming hotels in pages of {page_size} (encode batch size {batch_size})...")
+        
+        start_time = time.time()
+        scanned = 0
+        written = {MODEL_1_NAME: 0, MODEL_2_NAME: 0}
+        last_id = -1
+        
         with self.driver.session() as session:
-            result = session.run(fetch_query)
-            hotels = [record.data() for record in result]
-            
-            Logger.log(f"Generating dual embeddings for {len(hotels)} hotels...")
-            
-            batch_count = 0
-            for hotel in hotels:
-                search_text = (
-                    f"Hotel {hotel['name']} in {hotel['city']}, {hotel['country']}. "
-                    f"{hotel['stars']} star rating. "
-                    f"Cleanliness score: {hotel['clean']}. "
-                    f"Comfort score: {hotel['comfort']}. "
-                    f"Facilities score: {hotel['facilities']}."
-                )
+            while True:
+                result = session.run(fetch_query, last_id=last_id, page_size=page_size)
+                hotels = [record.data() for record in result]
+                if not hotels:
+                    break
+                last_id = hotels[-1]['id']
+                scanned += len(hotels)
                 
-                # Generate Embeddings
-                emb_1 = self.model_1.encode(search_text).tolist()
-                emb_2 = self.model_2.encode(search_text).tolist()
+                for hotel in hotels:
+                    hotel['search_text'] = build_search_text(hotel)
                 
-                # Update Node
-                session.run(update_query, id=hotel['id'], 
-                            embedding=emb_1, 
-                            embedding_v2=emb_2, 
-                            search_text=search_text)
-                            
-                batch_count += 1
-                if batch_count % 10 == 0:
-                    print(f"Processed {batch_count}/{len(hotels)} hotels...", end='\r')
+                for model, model_name, update_query, fingerprint_key in jobs:
+                    # Only hotels whose content hash or model changed need to be encoded again
+                    stale = []
+                    for hotel in hotels:
+                        fingerprint = embedding_fingerprint(hotel['search_text'], model_name)
+                        if hotel[fingerprint_key] != fingerprint:
+                            stale.append((hotel, fingerprint))
+                    if not stale:
+                        continue
                     
-            print(f"Processed {batch_count}/{len(hotels)} hotels. Done.")
-            Logger.log("Dual embeddings population complete.")
+                    embeddings = model.encode(
+                        [hotel['search_text'] for hotel, _ in stale],
+                        batch_size=batch_size,
+                        show_progress_bar=False
+                    )
+                    rows = [
+                        {
+                            "id": hotel['id'],
+                            "embedding": embedding.tolist(),
+                            "fingerprint": fingerprint,
+                            "search_text": hotel['search_text']
+                        }
+                        for (hotel, fingerprint), embedding in zip(stale, embeddings)
+                    ]
+                    session.execute_write(self._write_embeddings, update_query, rows, model_name)
+                    written[model_name] += len(rows)
+                
+                elapsed = max(time.time() - start_time, 1e-9)
+                Logger.flush()  # the in-place progress line is printed directly, after pending log output
+                print(f"Scanned {scanned} hotels, embedded {written[MODEL_1_NAME]} (v1) / "
+                      f"{written[MODEL_2_NAME]} (v2) ({scanned / elapsed:.1f} rows/sec)...", end='\r')
+        
+        if any(written.values()):
+            # Lets in-memory backends know they have to reload
+            with self.driver.session() as session:
+                session.execute_write(self._bump_embedding_version)
+        
+        elapsed = max(time.time() - start_time, 1e-9)
+        Logger.log(f"Scanned {scanned} hotels, embedded {written[MODEL_1_NAME]} (v1) / "
+                   f"{written[MODEL_2_NAME]} (v2). Done.")
+        Logger.log(f"Dual embeddings population complete in {elapsed:.1f}s "
+                   f"({scanned / elapsed:.1f} rows/sec scanned, "
+                   f"{sum(written.values()) / elapsed:.1f} vectors/sec written).")
+        return written
+
+    @staticmethod
+    def _write_embeddings(tx, update_query, rows, model_name):
+        tx.run(update_query, rows=rows, model_name=model_name)
+
+    @staticmethod
+    def _bump_embedding_version(tx):
+        tx.run("""
+        MERGE (m:EmbeddingState {name: 'hotels'})
+        SET m.version = coalesce(m.version, 0) + 1,
+            m.updated_at = datetime()
+        """)
+
+    def graph_version(self):
+        """
+        (version, updated_at) of the hotel data. Embedding runs, --append-reviews and --sync
+        bump it and a rebuild replaces it. Checked at most every REFRESH_INTERVAL seconds.
+        """
+        with self.version_lock:
+            if self.version_stamp is None or time.time() - self.version_checked_at >= REFRESH_INTERVAL:
+                with self.driver.session() as session:
+                    record = session.run("""
+                    OPTIONAL MATCH (m:EmbeddingState {name: 'hotels'})
+                    RETURN m.version as version, toString(m.updated_at) as updated_at
+                    """).single()
+                self.version_stamp = (record['version'], record['updated_at'])
+                self.version_checked_at = time.time()
+            return self.version_stamp
+
+    def encode_query(self, query_text: str, model_version: int = 1):
+        """
+        Returns the float32 query vector for the given model, served from the LRU cache when possible.
+        """
+        check_model_version(model_version)
+        query_embedding = self.query_cache.get(model_version, query_text)
+        if query_embedding is None:
+            model = self.model_1 if model_version == 1 else self.model_2
+            query_embedding = model.encode(normalize_query(query_text))
+            self.query_cache.put(model_version, query_text, query_embedding)
+        return query_embedding
 
     def search_similar_hotels(self, query_text: str, top_k: int = 3, model_version: int = 1):
         """
         Semantic search using vector similarity with specified model version.
+        Uses the Neo4j vector index or the in-memory matrix depending on the backend.
+        """
+        return async_runner.run(self.asearch_similar_hotels(query_text, top_k, model_version))
+
+    async def asearch_similar_hotels(self, query_text: str, top_k: int = 3, model_version: int = 1):
         """
+        Async version of search_similar_hotels. CPU-bound work runs in a worker thread
+        so the event loop keeps serving other conversations.
+        """
+        check_model_version(model_version)
         if not query_text:
             return []
-            
-        index_name = 'hotel_embeddings' if model_version == 1 else 'hotel_embeddings_v2'
-        model = self.model_1 if model_version == 1 else self.model_2
         
-        # 1. Generate embedding for query
-        query_embedding = model.encode(query_text).tolist()
+        with tracing.span("vector_search", model_version=model_version, backend=self.backend, top_k=top_k) as span:
+            rows = await self._asearch(query_text, top_k, model_version)
+            span.set(rows=len(rows))
+            return rows
+
+    async def _asearch(self, query_text: str, top_k: int, model_version: int):
+        index_name = MODEL_VERSION_INDEXES[model_version]
+        
+        # 1. Generate (or reuse) embedding for query
+        with tracing.span("encode") as span:
+            hits = self.query_cache.hits
+            query_embedding = await asyncio.to_thread(self.encode_query, query_text, model_version)
+            span.set(cache_hit=self.query_cache.hits > hits)
+        
+        # 2a. Answer from the in-process matrix
+        if self.backend == "memory":
+            return await asyncio.to_thread(self.memory_indexes[model_version].search, query_embedding, top_k)
         
-        # 2. Query the Vector Index
+        # 2b. Query the Vector Index
         cypher = f"""
         CALL db.index.vector.queryNodes('{index_name}', $k, $embedding)
         YIELD node, score
@@ -151,9 +591,9 @@ class EmbeddingManager:
                score
         """
         
-        with self.driver.session() as session:
-            result = session.run(cypher, k=top_k, embedding=query_embedding)
-            return [record.data() for record in result]
+        async with self.async_driver.session() as session:
+            result = await session.run(cypher, k=top_k, embedding=query_embedding.tolist())
+            return [record.data() async for record in result]
 
     def format_results(self, results):
         if not results:
@@ -165,3 +605,24 @@ class EmbeddingManager:
             formatted_lines.append(f"{idx+1}. {res.get('hotel')} (Similarity: {score:.4f})")
             
         return "\n".join(formatted_lines)
+
+
+def build_embeddings(page_size: int = None, batch_size: int = None):
+    """
+    Offline job: creates the vector indices, embeds new or changed hotels and waits
+    until the indices are ONLINE. Serving instances only read what this job writes.
+    """
+    manager = EmbeddingManager(verify_indices=False)
+    try:
+        Logger.log("Creating Vector Indices...")
+        manager.create_vector_indices()
+        
+        Logger.log("Populating Embeddings (only new or changed hotels)...")
+        written = manager.populate_embeddings(page_size=page_size, batch_size=batch_size)
+        
+        Logger.log("Waiting for vector indices to come online...")
+        manager.wait_for_indices()
+        manager.check_readiness()
+        return written
+    finally:
+        manager.close()
@@ -1,6 +1,16 @@
 import os
+import time
+import random
+import asyncio
+import threading
 
-from huggingface_hub import InferenceClient
+import httpx
+from huggingface_hub import InferenceClient, AsyncInferenceClient
+from huggingface_hub import get_session, get_async_session, set_client_factory, set_async_client_factory
+from src.answer_cache import get_answer_cache
+from src.context_builder import get_token_counter
+from src import tracing
+import src.logger as Logger
 
 models = [
     "google/gemma-2-2b-it",
@@ -10,7 +20,135 @@ models = [
 
 model = models[0]
 
+# HTTP connection pool limits shared by every inference client in the process
+POOL_MAX_CONNECTIONS = int(os.environ.get("INFERENCE_POOL_MAX_CONNECTIONS", 20))
+POOL_MAX_KEEPALIVE = int(os.environ.get("INFERENCE_POOL_MAX_KEEPALIVE", 10))
+POOL_KEEPALIVE_EXPIRY = float(os.environ.get("INFERENCE_POOL_KEEPALIVE_EXPIRY", 60))
+
+# Retries per model (jittered exponential backoff between them), then failover down `models`
+RETRY_ATTEMPTS = int(os.environ.get("INFERENCE_RETRY_ATTEMPTS", 2))
+RETRY_BASE_DELAY = float(os.environ.get("INFERENCE_RETRY_BASE_DELAY", 0.5))
+RETRY_MAX_DELAY = float(os.environ.get("INFERENCE_RETRY_MAX_DELAY", 8))
+FAILOVER_ENABLED = os.environ.get("INFERENCE_FAILOVER", "1") not in ("0", "false", "False")
+
+# Circuit breaker: consecutive failures/slow calls before opening, what counts as slow, cooldown
+BREAKER_FAILURE_THRESHOLD = int(os.environ.get("BREAKER_FAILURE_THRESHOLD", 3))
+BREAKER_SLOW_CALL_SECONDS = float(os.environ.get("BREAKER_SLOW_CALL_SECONDS", 30))
+BREAKER_RESET_TIMEOUT = float(os.environ.get("BREAKER_RESET_TIMEOUT", 60))
+
+_clients = {}
+_clients_lock = threading.Lock()
+_pool_configured = False
+_pool_stats = {"clients_created": 0, "clients_reused": 0, "requests": 0, "new_connections": 0}
+_stats_lock = threading.Lock()
+
+def _count(key):
+    with _stats_lock:
+        _pool_stats[key] += 1
+
+def _trace(event_name, info):
+    # httpcore reports every freshly opened TCP connection; other requests reused a pooled one
+    if event_name == "connection.connect_tcp.complete":
+        _count("new_connections")
+
+async def _atrace(event_name, info):
+    _trace(event_name, info)
+
+def _on_request(request):
+    _count("requests")
+    request.extensions["trace"] = _trace
+
+async def _aon_request(request):
+    _count("requests")
+    request.extensions["trace"] = _atrace
+
+def _pool_limits():
+    return httpx.Limits(
+        max_connections=POOL_MAX_CONNECTIONS,
+        max_keepalive_connections=POOL_MAX_KEEPALIVE,
+        keepalive_expiry=POOL_KEEPALIVE_EXPIRY,
+    )
+
+def _configure_http_pool():
+    """
+    Installs huggingface_hub HTTP client factories with our pool limits and connection counters,
+    keeping the event hooks of the library's default clients.
+    """
+    global _pool_configured
+    if _pool_configured:
+        return
+    
+    sync_hooks = {name: list(hooks) for name, hooks in get_session().event_hooks.items()}
+    async_hooks = {name: list(hooks) for name, hooks in get_async_session().event_hooks.items()}
+    
+    def client_factory():
+        hooks = {name: list(h) for name, h in sync_hooks.items()}
+        hooks.setdefault("request", []).append(_on_request)
+        return httpx.Client(limits=_pool_limits(), event_hooks=hooks, follow_redirects=True, timeout=None)
+    
+    def async_client_factory():
+        hooks = {name: list(h) for name, h in async_hooks.items()}
+        hooks.setdefault("request", []).append(_aon_request)
+        return httpx.AsyncClient(limits=_pool_limits(), event_hooks=hooks, follow_redirects=True, timeout=None)
+    
+    set_client_factory(client_factory)
+    set_async_client_factory(async_client_factory)
+    _pool_configured = True
+
+def get_client(provider="auto", model_name=None):
+    """
+    Returns the process-wide InferenceClient for (provider, model), creating it on first use.
+    All sync clients share one pooled keep-alive HTTP client.
+    """
+    key = (provider, model_name)
+    with _clients_lock:
+        _configure_http_pool()
+        client = _clients.get(key)
+        if client is None:
+            client = InferenceClient(model=model_name, provider=provider, api_key=os.environ["HF_TOKEN"])
+            _clients[key] = client
+            _count("clients_created")
+        else:
+            _count("clients_reused")
+        return client
+
+def get_async_client(provider="auto", model_name=None):
+    """
+    Returns the AsyncInferenceClient for (provider, model) on the running event loop.
+    Each client keeps its own pooled keep-alive HTTP connections across calls.
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+    key = (provider, model_name, id(loop))
+    with _clients_lock:
+        _configure_http_pool()
+        client = _clients.get(key)
+        if client is None:
+            client = AsyncInferenceClient(model=model_name, provider=provider, api_key=os.environ["HF_TOKEN"])
+            _clients[key] = client
+            _count("clients_created")
+        else:
+            _count("clients_reused")
+        return client
+
+def get_pool_stats():
+    """
+    Client registry and HTTP connection reuse counters, for monitoring.
+    """
+    with _stats_lock:
+        stats = dict(_pool_stats)
+    stats["reused_connections"] = max(stats["requests"] - stats["new_connections"], 0)
+    stats["pool_limits"] = {
+        "max_connections": POOL_MAX_CONNECTIONS,
+        "max_keepalive_connections": POOL_MAX_KEEPALIVE,
+        "keepalive_expiry": POOL_KEEPALIVE_EXPIRY,
+    }
+    return stats
+
 def format_prompt(query, context):
+    # context is usually the compact table from src.context_builder.build_context
     context_str = ""
     if context:
         # Check if context is a list of dicts and format it
@@ -41,33 +179,398 @@ def format_prompt(query, context):
     """
     return template
 
-def setup_inference():
-    return InferenceClient(
-        api_key=os.environ["HF_TOKEN"],
+def setup_inference(model_name=None):
+    return get_client(
+        provider="auto",   # Automatically selects best provider
+        model_name=model_name,
+    )
+
+def setup_async_inference(model_name=None):
+    return get_async_client(
         provider="auto",   # Automatically selects best provider
+        model_name=model_name,
     )
 
+def _count_tokens(model_name, text):
+    # Same cached tokenizer build_context budgets with (preloaded at warm start)
+    return get_token_counter(model_name)(text or "")
+
 def call_model(client, model_name, prompt):
-    max_retries = 3
-    for attempt in range(max_retries):
-        try:
-            # Use the passed model_name
-            print(f"DEBUG: Using model: {model_name}")
-            response = client.chat.completions.create(
-                model=model_name, 
-                messages=[
-                    {"role": "user", "content": prompt}],
-                max_tokens=500
-            )   
-            response_text = response.choices[0].message.content
-            return strip_thinking(response_text)
-        except Exception as e:
-            if attempt == max_retries - 1:
-                # If it's the last attempt, raise the error so the app can handle it
-                raise e
-            # Wait a bit before retrying
-            import time
-            time.sleep(1)
+    with tracing.span("llm", model=model_name, prompt_tokens=_count_tokens(model_name, prompt)) as span:
+        # Identical (model, prompt) pairs are answered from the disk cache
+        cache = get_answer_cache()
+        if cache:
+            cached = cache.get(model_name, prompt)
+            if cached is not None:
+                span.set(cached=True, answer_tokens=_count_tokens(model_name, cached))
+                return cached
+        
+        answer, answered_by = _call_model(client, model_name, prompt)
+        span.set(cached=False, answered_by=answered_by, answer_tokens=_count_tokens(model_name, answer))
+        # Fallback answers are not cached, so the requested model is used again once it recovers
+        if cache and answered_by == model_name:
+            cache.put(model_name, prompt, answer)
+        return answer
+
+def _call_model(client, model_name, prompt):
+    last_error = None
+    for candidate in _failover_chain(model_name):
+        breaker = get_breaker(candidate)
+        for attempt in range(RETRY_ATTEMPTS):
+            if not breaker.allow():
+                break
+            settled = False
+            try:
+                Logger.log(f"DEBUG: Using model: {candidate}")
+                start = time.time()
+                response = client.chat.completions.create(
+                    model=candidate, 
+                    messages=[
+                        {"role": "user", "content": prompt}],
+                    max_tokens=500
+                )   
+                response_text = response.choices[0].message.content
+                settled = True
+                breaker.record_success(time.time() - start)
+                _record_failover(model_name, candidate)
+                return strip_thinking(response_text), candidate
+            except Exception as e:
+                settled = True
+                breaker.record_failure()
+                last_error = e
+            finally:
+                if not settled:
+                    breaker.release()
+            if attempt < RETRY_ATTEMPTS - 1:
+                time.sleep(backoff_delay(attempt))
+    # Every model failed or is short-circuited; raise so the app can handle it
+    raise last_error or RuntimeError(f"No model available: all circuit breakers are open for {model_name} and its fallbacks.")
+
+async def acall_model(client, model_name, prompt):
+    """
+    Async version of call_model, for an AsyncInferenceClient.
+    """
+    # The first count may load the tokenizer; keep that off the event loop
+    prompt_tokens = await asyncio.to_thread(_count_tokens, model_name, prompt)
+    with tracing.span("llm", model=model_name, prompt_tokens=prompt_tokens) as span:
+        # SQLite may wait on a locked database; keep that off the shared event loop
+        cache = get_answer_cache()
+        if cache:
+            cached = await asyncio.to_thread(cache.get, model_name, prompt)
+            if cached is not None:
+                span.set(cached=True, answer_tokens=_count_tokens(model_name, cached))
+                return cached
+        
+        answer, answered_by = await _acall_model(client, model_name, prompt)
+        span.set(cached=False, answered_by=answered_by, answer_tokens=_count_tokens(model_name, answer))
+        if cache and answered_by == model_name:
+            await asyncio.to_thread(cache.put, model_name, prompt, answer)
+        return answer
+
+async def _acall_model(client, model_name, prompt):
+    last_error = None
+    for candidate in _failover_chain(model_name):
+        breaker = get_breaker(candidate)
+        for attempt in range(RETRY_ATTEMPTS):
+            if not breaker.allow():
+                break
+            settled = False
+            try:
+                Logger.log(f"DEBUG: Using model: {candidate}")
+                start = time.time()
+                response = await client.chat.completions.create(
+                    model=candidate, 
+                    messages=[
+                        {"role": "user", "content": prompt}],
+                    max_tokens=500
+                )   
+                response_text = response.choices[0].message.content
+                settled = True
+                breaker.record_success(time.time() - start)
+                _record_failover(model_name, candidate)
+                return strip_thinking(response_text), candidate
+            except Exception as e:
+                settled = True
+                breaker.record_failure()
+                last_error = e
+            finally:
+                if not settled:
+                    breaker.release()
+            if attempt < RETRY_ATTEMPTS - 1:
+                await asyncio.sleep(backoff_delay(attempt))
+    raise last_error or RuntimeError(f"No model available: all circuit breakers are open for {model_name} and its fallbacks.")
+
+def stream_model(client, model_name, prompt):
+    """
+    Streaming version of call_model: yields the response text chunk by chunk as it arrives,
+    with <think> blocks removed even when they span chunk boundaries.
+    Retries and failover only happen before the first chunk has been yielded.
+    """
+    # Created now so it nests under the caller's span; the generator finishes it when the stream ends
+    span = tracing.start_span("llm", model=model_name, stream=True, prompt_tokens=_count_tokens(model_name, prompt))
+    return _stream_answer(client, model_name, prompt, span)
+
+def _stream_answer(client, model_name, prompt, span):
+    start = time.perf_counter()
+    try:
+        cache = get_answer_cache()
+        if cache:
+            cached = cache.get(model_name, prompt)
+            if cached is not None:
+                span.set(cached=True, answer_tokens=_count_tokens(model_name, cached))
+                yield cached
+                return
+        
+        chunks = []
+        answered_by = []
+        for text in _stream_model(client, model_name, prompt, answered_by):
+            if not chunks:
+                span.set(first_token_ms=round((time.perf_counter() - start) * 1000.0, 1))
+            chunks.append(text)
+            yield text
+        answer = "".join(chunks)
+        span.set(cached=False, answered_by=answered_by[0] if answered_by else None,
+                 answer_tokens=_count_tokens(model_name, answer))
+        if cache and answered_by == [model_name]:
+            cache.put(model_name, prompt, answer)
+    except Exception as e:
+        span.set(error=type(e).__name__)
+        raise
+    finally:
+        span.finish()
+
+def _stream_model(client, model_name, prompt, answered_by):
+    last_error = None
+    for candidate in _failover_chain(model_name):
+        breaker = get_breaker(candidate)
+        for attempt in range(RETRY_ATTEMPTS):
+            if not breaker.allow():
+                break
+            emitted = False
+            settled = False
+            try:
+                Logger.log(f"DEBUG: Streaming from model: {candidate}")
+                start = time.time()
+                stream = client.chat.completions.create(
+                    model=candidate, 
+                    messages=[
+                        {"role": "user", "content": prompt}],
+                    max_tokens=500,
+                    stream=True
+                )
+                thinking_filter = ThinkingFilter()
+                for chunk in stream:
+                    if not chunk.choices:
+                        continue
+                    text = thinking_filter.feed(chunk.choices[0].delta.content or "")
+                    if text:
+                        if not emitted:
+                            # Time to first token is what counts as a slow call here
+                            settled = True
+                            breaker.record_success(time.time() - start)
+                            _record_failover(model_name, candidate)
+                            answered_by.append(candidate)
+                            emitted = True
+                        yield text
+                if not emitted:
+                    settled = True
+                    breaker.record_success(time.time() - start)
+                    answered_by.append(candidate)
+                text = thinking_filter.flush()
+                if text:
+                    yield text
+                return
+            except Exception as e:
+                settled = True
+                breaker.record_failure()
+                if emitted:
+                    raise e
+                last_error = e
+            finally:
+                # Closed before the first chunk or interrupted: give back a half-open probe
+                if not settled:
+                    breaker.release()
+            if attempt < RETRY_ATTEMPTS - 1:
+                time.sleep(backoff_delay(attempt))
+    raise last_error or RuntimeError(f"No model available: all circuit breakers are open for {model_name} and its fallbacks.")
+
+def backoff_delay(attempt):
+    """
+    Exponential backoff with full jitter: a random delay in [0, min(cap, base * 2^attempt)].
+    """
+    return random.uniform(0, min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * (2 ** attempt)))
+
+class CircuitBreaker:
+    """
+    Per-model circuit breaker. Opens after failure_threshold consecutive failures or slow
+    calls, short-circuits calls for reset_timeout seconds, then lets a single probe call
+    through (half-open) to decide whether to close again.
+    """
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, model_name, failure_threshold=None, slow_call_seconds=None, reset_timeout=None):
+        self.model_name = model_name
+        self.failure_threshold = failure_threshold or BREAKER_FAILURE_THRESHOLD
+        self.slow_call_seconds = slow_call_seconds or BREAKER_SLOW_CALL_SECONDS
+        self.reset_timeout = reset_timeout or BREAKER_RESET_TIMEOUT
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.probe_in_flight = False
+        self.counts = {"calls": 0, "successes": 0, "failures": 0, "slow_calls": 0, "short_circuited": 0, "opened": 0}
+        self.lock = threading.Lock()
+
+    def allow(self):
+        with self.lock:
+            if self.state == self.OPEN and time.time() - self.opened_at >= self.reset_timeout:
+                self.state = self.HALF_OPEN
+                self.probe_in_flight = False
+            if self.state == self.CLOSED or (self.state == self.HALF_OPEN and not self.probe_in_flight):
+                self.probe_in_flight = self.state == self.HALF_OPEN
+                self.counts["calls"] += 1
+                return True
+            self.counts["short_circuited"] += 1
+            return False
+
+    def record_success(self, latency):
+        with self.lock:
+            if latency > self.slow_call_seconds:
+                self.counts["slow_calls"] += 1
+                self._on_failure()
+                return
+            self.counts["successes"] += 1
+            self.consecutive_failures = 0
+            self.state = self.CLOSED
+            self.probe_in_flight = False
+
+    def record_failure(self):
+        with self.lock:
+            self.counts["failures"] += 1
+            self._on_failure()
+
+    def release(self):
+        """
+        Gives back a half-open probe whose call ended without an outcome (cancelled, closed
+        stream, interrupt), so the next call can probe instead of the breaker staying stuck.
+        """
+        with self.lock:
+            if self.state == self.HALF_OPEN:
+                self.probe_in_flight = False
+
+    def _on_failure(self):
+        self.consecutive_failures += 1
+        if self.state == self.HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+            if self.state != self.OPEN:
+                self.counts["opened"] += 1
+            self.state = self.OPEN
+            self.opened_at = time.time()
+            self.probe_in_flight = False
+
+    def stats(self):
+        with self.lock:
+            return {
+                "state": self.state,
+                "consecutive_failures": self.consecutive_failures,
+                **self.counts,
+            }
+
+_breakers = {}
+_failovers = {}
+_breakers_lock = threading.Lock()
+
+def get_breaker(model_name):
+    with _breakers_lock:
+        breaker = _breakers.get(model_name)
+        if breaker is None:
+            breaker = _breakers[model_name] = CircuitBreaker(model_name)
+        return breaker
+
+def _failover_chain(model_name):
+    # The requested model first, then the rest of the configured models in order
+    if not FAILOVER_ENABLED:
+        return [model_name]
+    return [model_name] + [m for m in models if m != model_name]
+
+def _record_failover(requested, used):
+    if requested == used:
+        return
+    Logger.log(f"DEBUG: Failed over from {requested} to {used}")
+    with _breakers_lock:
+        _failovers[(requested, used)] = _failovers.get((requested, used), 0) + 1
+
+def get_breaker_stats():
+    """
+    Circuit breaker state per model and failover counts, for monitoring.
+    """
+    with _breakers_lock:
+        breakers = list(_breakers.values())
+        failovers = [{"from": a, "to": b, "count": n} for (a, b), n in _failovers.items()]
+    return {
+        "breakers": {breaker.model_name: breaker.stats() for breaker in breakers},
+        "failovers": failovers,
+    }
+
+class ThinkingFilter:
+    """
+    Incremental counterpart of strip_thinking for streamed text. Text that could be the
+    start of a <think> or </think> tag is held back until the next chunk decides it.
+    """
+    OPEN = "<think>"
+    CLOSE = "</think>"
+
+    def __init__(self):
+        self.buffer = ""
+        self.in_think = False
+        self.started = False
+
+    def feed(self, chunk):
+        self.buffer += chunk
+        output = ""
+        while True:
+            if self.in_think:
+                idx = self.buffer.find(self.CLOSE)
+                if idx < 0:
+                    # Drop the hidden text, keep a possible partial closing tag
+                    self.buffer = self.buffer[-(len(self.CLOSE) - 1):]
+                    break
+                self.buffer = self.buffer[idx + len(self.CLOSE):]
+                self.in_think = False
+            else:
+                idx = self.buffer.find(self.OPEN)
+                if idx >= 0:
+                    output += self.buffer[:idx]
+                    self.buffer = self.buffer[idx + len(self.OPEN):]
+                    self.in_think = True
+                    continue
+                keep = self._partial_tag_length(self.buffer, self.OPEN)
+                output += self.buffer[:len(self.buffer) - keep]
+                self.buffer = self.buffer[len(self.buffer) - keep:]
+                break
+        return self._emit(output)
+
+    def flush(self):
+        """
+        Returns whatever is still held back once the stream ends (an unterminated <think> is dropped).
+        """
+        output = "" if self.in_think else self.buffer
+        self.buffer = ""
+        return self._emit(output).rstrip()
+
+    def _emit(self, text):
+        # Match strip_thinking, which strips leading whitespace from the answer
+        if not self.started:
+            text = text.lstrip()
+            self.started = bool(text)
+        return text
+
+    @staticmethod
+    def _partial_tag_length(text, tag):
+        for length in range(min(len(tag) - 1, len(text)), 0, -1):
+            if text.endswith(tag[:length]):
+                return length
+        return 0
 
 def extract_hfmodel_name(model):
     parts = model.split("/")
@@ -0,0 +1,114 @@
+import os
+import numpy as np
+from src.models import Intent
+
+# "local" tries the embedding classifier before the LLM, "llm" always asks the LLM
+INTENT_CLASSIFIER = os.environ.get("INTENT_CLASSIFIER", "local")
+# Minimum cosine similarity to the best centroid, and lead over the runner-up, to trust a local label
+CONFIDENCE_THRESHOLD = float(os.environ.get("INTENT_CONFIDENCE_THRESHOLD", 0.5))
+CONFIDENCE_MARGIN = float(os.environ.get("INTENT_CONFIDENCE_MARGIN", 0.08))
+
+INTENT_EXEMPLARS = {
+    "greeting": [
+        "hello",
+        "hi",
+        "hi there",
+        "hey",
+        "hola",
+        "good morning",
+        "good evening",
+        "how are you?",
+        "thanks, bye",
+        "nice to meet you",
+    ],
+    "question": [
+        "Does the Hilton have a pool?",
+        "What are the reviews for The Royal Compass?",
+        "What do travellers say about The Azure Tower?",
+        "Where is Paris?",
+        "Is the hotel clean?",
+        "What facilities does The Royal Compass offer?",
+        "How many stars does this hotel have?",
+        "What is the rating of the Marriott in Dubai?",
+        "Is breakfast included at Hotel X?",
+    ],
+    "recommendation": [
+        "Suggest a romantic hotel for couples",
+        "Where should I stay in London?",
+        "Best hotels for business travelers",
+        "Recommend a family-friendly hotel",
+        "What are the top rated hotels?",
+        "Clean hotels with good facilities",
+        "Best hotels for people aged 18 to 25",
+        "Which hotel would you recommend for a solo trip?",
+        "Suggest a place for a family trip to Italy",
+        "Hotels with a rating above 8 and 5 stars",
+        "Which hotels exceed expectations?",
+    ],
+    "search": [
+        "Show me hotels in Cairo",
+        "Find hotels in Paris",
+        "Show me the Hilton",
+        "Find the Marriott in Dubai",
+        "List hotels",
+        "List all hotels in New York",
+        "Search for The Azure Tower",
+        "Hotels in Tokyo",
+        "Find user 123",
+        "Look up hotels in Germany",
+    ],
+}
+
+class IntentClassifier:
+    """
+    Nearest-centroid intent classifier on top of an already-loaded sentence embedding model.
+    Returns None when unsure so the caller can fall back to the LLM.
+    """
+    def __init__(self, model, query_encoder=None, exemplars: dict = None,
+                 threshold: float = CONFIDENCE_THRESHOLD, margin: float = CONFIDENCE_MARGIN):
+        self.query_encoder = query_encoder or model.encode
+        self.threshold = threshold
+        self.margin = margin
+        self.labels = []
+
+        exemplars = exemplars or INTENT_EXEMPLARS
+        centroids = []
+        for label, texts in exemplars.items():
+            vectors = self._normalize(np.asarray(model.encode(texts), dtype=np.float32))
+            centroids.append(vectors.mean(axis=0))
+            self.labels.append(label)
+        self.centroids = self._normalize(np.vstack(centroids))
+
+    @classmethod
+    def from_embedder(cls, embedder, **kwargs):
+        """
+        Reuses the EmbeddingManager's MiniLM model and its query embedding cache.
+        """
+        return cls(embedder.model_1, query_encoder=lambda q: embedder.encode_query(q, 1), **kwargs)
+
+    @staticmethod
+    def _normalize(vectors):
+        norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+        return vectors / np.where(norms == 0, 1.0, norms)
+
+    def scores(self, query: str) -> dict:
+        query_vector = self._normalize(np.asarray(self.query_encoder(query), dtype=np.float32))
+        similarities = self.centroids @ query_vector
+        return dict(zip(self.labels, similarities.tolist()))
+
+    def classify(self, query: str):
+        """
+        Returns an Intent if the best label is confident enough, otherwise None.
+        """
+        if not query or not query.strip():
+            return None
+
+        ranked = sorted(self.scores(query).items(), key=lambda item: item[1], reverse=True)
+        (best_label, best), (_, runner_up) = ranked[0], ranked[1]
+        if best < self.threshold or best - runner_up < self.margin:
+            return None
+
+        return Intent(
+            category=best_label,
+            reasoning=f"Local classifier: closest to '{best_label}' examples (similarity {best:.2f}, margin {best - runner_up:.2f})."
+        )
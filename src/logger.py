@@ -1,24 +1,105 @@
+import os
+import sys
+import time
+import queue
+import atexit
+import threading
+from collections import deque, namedtuple
+
 ERROR = 0
 NORMAL = 1
 WARNING = 2
+DEBUG = 3  # diagnostics such as latency breakdowns, only printed when asked for
+
+LEVEL_NAMES = {ERROR: "ERROR", NORMAL: "NORMAL", WARNING: "WARNING", DEBUG: "DEBUG"}
+
+# Number of records kept in memory; older ones are dropped
+LOG_HISTORY_SIZE = int(os.environ.get("LOG_HISTORY_SIZE", 1000))
+# Records waiting to be printed; log() drops (and counts) records instead of blocking when full
+LOG_QUEUE_SIZE = int(os.environ.get("LOG_QUEUE_SIZE", 10000))
+
+LogRecord = namedtuple("LogRecord", ["timestamp", "level", "comment", "thread"])
 
 verbosity = NORMAL
-history = []
-    
-def setup(verbosity):
-    verbosity = verbosity
+history = deque(maxlen=LOG_HISTORY_SIZE)
+dropped = 0
+
+_queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+_writer = None
+_writer_lock = threading.Lock()
+
+def _write_loop():
+    while True:
+        record = _queue.get()
+        try:
+            print(record.comment)
+        except Exception as e:
+            sys.stderr.write(f"Logger could not write record: {e}\n")
+        finally:
+            _queue.task_done()
+
+def _ensure_writer():
+    global _writer
+    if _writer is not None:
+        return
+    with _writer_lock:
+        if _writer is None:
+            _writer = threading.Thread(target=_write_loop, name="logger-writer", daemon=True)
+            _writer.start()
+
+def setup(level):
+    global verbosity
+    verbosity = level
 
 def log(comment, level = NORMAL):
-    history.append((level, comment))
+    '''
+    Records the comment and hands it to the writer thread if it passes the verbosity level.
+    Never blocks: when the writer falls behind, the record is kept in history but not printed.
+    '''
+    global dropped
+    record = LogRecord(time.time(), level, comment, threading.current_thread().name)
+    history.append(record)
 
     if(level <= verbosity):
-        print(comment)
+        _ensure_writer()
+        try:
+            _queue.put_nowait(record)
+        except queue.Full:
+            with _writer_lock:
+                dropped += 1
+
+def flush():
+    '''
+    Waits until every queued record has been printed, e.g. before prompting for input.
+    '''
+    if _writer is not None:
+        _queue.join()
 
 def getLast():
     '''
     Returns the last logged comment, without Level
     '''
-    return history[-1][1]
+    return history[-1].comment
+
+def records(level = None):
+    '''
+    Returns the retained records as dicts, optionally only those at or below a level
+    '''
+    return [
+        {
+            "timestamp": record.timestamp,
+            "level": LEVEL_NAMES.get(record.level, str(record.level)),
+            "comment": str(record.comment),
+            "thread": record.thread,
+        }
+        for record in list(history)
+        if level is None or record.level <= level
+    ]
 
 def clear():
-    history = []
\ No newline at end of file
+    global dropped
+    history.clear()
+    with _writer_lock:
+        dropped = 0
+
+atexit.register(flush)
@@ -24,3 +24,8 @@ class Entities(BaseModel):
     current_country: Optional[str] = Field(None, description="Current country/Origin for visa queries.")
     attributes: Optional[List[str]] = Field(default_factory=list, description="Other attributes like 'pool', 'wifi'.")
     dates: Optional[List[str]] = Field(default_factory=list, description="Dates or duration mentioned.")
+
+
+class QueryAnalysis(BaseModel):
+    intent: Intent = Field(..., description="The classified intent of the user's query.")
+    entities: Entities = Field(default_factory=Entities, description="The entities extracted from the user's query.")
@@ -1,9 +1,13 @@
 import os
 import json
+import asyncio
 from langchain_huggingface import HuggingFaceEndpoint, ChatHuggingFace
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import JsonOutputParser
-from src.models import Intent, Entities
+from src.models import Intent, Entities, QueryAnalysis
+from src import async_runner
+from src import tracing
+import src.logger as Logger
 
 # Initialize LLM
 # Using HuggingFaceEndpoint for direct inference
@@ -20,27 +24,56 @@ try:
     llm = ChatHuggingFace(llm=endpoint)
 except Exception as e:
     # Fallback or error handling if init fails (e.g. missing token)
-    print(f"Failed to initialize HuggingFaceEndpoint: {e}")
+    Logger.log(f"Failed to initialize HuggingFaceEndpoint: {e}", Logger.ERROR)
     llm = None
 
+# "combined" extracts intent and entities with one LLM call, "legacy" uses two separate chains
+PREPROCESSOR_MODE = os.environ.get("PREPROCESSOR_MODE", "combined")
+
+INTENT_CATEGORIES = """- question: The user is asking for a specific fact (e.g., "Does Hotel X have a pool?", "Where is Paris?").
+- recommendation: The user is asking for suggestions (e.g., "Suggest a romantic hotel", "Where should I stay?").
+- search: The user is searching for a specific entity entry (e.g., "Show me the Hilton", "Find user 123", "List hotels").
+- greeting: The user is greeting the assistant (e.g., "hello", "hi", "hola", "good morning")."""
+
+ENTITY_FIELDS = """- city: Target city name (e.g. "Paris").
+- country: Target country name (e.g. "France").
+- hotel_name: Specific hotel name (e.g. "Hilton").
+- traveller_type: ONE of ["Solo", "Couple", "Family", "Business"] if mentioned or implied.
+- min_rating: Minimum review score number (e.g. "rated above 8").
+- min_stars: Minimum star rating (e.g. "5 star hotel").
+- min_cleanliness: Minimum cleanliness score.
+- min_comfort: Minimum comfort score.
+- min_facilities: Minimum facilities score.
+- age_min / age_max: Age range for demographics (e.g. "for people aged 18-24" -> min=18, max=24).
+- target_country: Country to visit (for visa queries).
+- current_country: User's origin country (for visa queries).
+- attributes: general attributes like "pool", "wifi", "exceeds expectations"."""
+
 class Preprocessor:
-    def __init__(self):
+    def __init__(self, mode: str = None, intent_classifier=None):
         if not llm:
             raise ValueError("LLM is not initialized. Check your HF_TOKEN.")
+        
+        self.mode = mode or PREPROCESSOR_MODE
+        if self.mode not in ("combined", "legacy"):
+            raise ValueError(f"Unknown preprocessor mode '{self.mode}'. Use 'combined' or 'legacy'.")
+        
+        # Optional local classifier (src.intent_classifier.IntentClassifier) tried before the LLM
+        self.intent_classifier = intent_classifier
             
         self.intent_parser = JsonOutputParser(pydantic_object=Intent)
         self.intent_chain = self._build_intent_chain()
         
         self.entity_parser = JsonOutputParser(pydantic_object=Entities)
         self.entity_chain = self._build_entity_chain()
+        
+        self.combined_parser = JsonOutputParser(pydantic_object=QueryAnalysis)
+        self.combined_chain = self._build_combined_chain()
 
     def _build_intent_chain(self):
         system_prompt = """You are an expert intent classifier for a Travel Assistant.
 Analyze the user's query and classify it into one of the following categories:
-- question: The user is asking for a specific fact (e.g., "Does Hotel X have a pool?", "Where is Paris?").
-- recommendation: The user is asking for suggestions (e.g., "Suggest a romantic hotel", "Where should I stay?").
-- search: The user is searching for a specific entity entry (e.g., "Show me the Hilton", "Find user 123", "List hotels").
-- greeting: The user is greeting the assistant (e.g., "hello", "hi", "hola", "good morning").
+""" + INTENT_CATEGORIES + """
 
 You must output a valid JSON object matching the following structure:
 {format_instructions}
@@ -62,19 +95,7 @@ IMPORTANT: Output ONLY the JSON object. Do not output any explanation or preambl
         system_prompt = """You are an expert Named Entity Recognizer (NER) for a Hotel Travel Assistant.
 Extract the following entities from the user's query into a JSON object:
 
-- city: Target city name (e.g. "Paris").
-- country: Target country name (e.g. "France").
-- hotel_name: Specific hotel name (e.g. "Hilton").
-- traveller_type: ONE of ["Solo", "Couple", "Family", "Business"] if mentioned or implied.
-- min_rating: Minimum review score number (e.g. "rated above 8").
-- min_stars: Minimum star rating (e.g. "5 star hotel").
-- min_cleanliness: Minimum cleanliness score.
-- min_comfort: Minimum comfort score.
-- min_facilities: Minimum facilities score.
-- age_min / age_max: Age range for demographics (e.g. "for people aged 18-24" -> min=18, max=24).
-- target_country: Country to visit (for visa queries).
-- current_country: User's origin country (for visa queries).
-- attributes: general attributes like "pool", "wifi".
+""" + ENTITY_FIELDS + """
 
 Only extract what is explicitly mentioned.
 You must output a valid JSON object matching the following structure:
@@ -91,10 +112,88 @@ IMPORTANT: Output ONLY the JSON object. Do not output any explanation or preambl
         
         return prompt | llm | self.entity_parser
 
+    def _build_combined_chain(self):
+        system_prompt = """You are an expert query analyzer for a Hotel Travel Assistant.
+For the user's query, do two things at once:
+
+1. Classify the intent into exactly one of the following categories:
+""" + INTENT_CATEGORIES + """
+
+2. Extract the following entities:
+""" + ENTITY_FIELDS + """
+
+Only extract entities that are explicitly mentioned.
+You must output a single valid JSON object with an "intent" object and an "entities" object, matching the following structure:
+{format_instructions}
+
+Category must be exactly one of: "question", "recommendation", "search", "greeting".
+IMPORTANT: Output ONLY the JSON object. Do not output any explanation or preamble.
+"""
+        prompt = ChatPromptTemplate.from_messages([
+            ("system", system_prompt),
+            ("user", "{query}")
+        ])
+        
+        prompt = prompt.partial(format_instructions=self.combined_parser.get_format_instructions())
+        
+        return prompt | llm | self.combined_parser
+
     def process(self, query: str):
-        print(f"Processing query: '{query}'")
-        # Invoke chains
-        intent_data = self.intent_chain.invoke({"query": query})
+        return async_runner.run(self.aprocess(query))
+
+    async def aprocess(self, query: str):
+        """
+        Async version of process: returns (Intent, Entities) for the query.
+        """
+        Logger.log(f"Processing query: '{query}'")
+        
+        with tracing.span("preprocess", mode=self.mode) as span:
+            intent, entities = await self._aprocess(query, span)
+            span.set(intent=intent.category, entities=len([v for v in entities.model_dump().values() if v]))
+            return intent, entities
+
+    async def _aprocess(self, query: str, span):
+        # A confident local intent saves the LLM intent call; greetings need no entities at all
+        intent = None
+        if self.intent_classifier:
+            with tracing.span("intent.local") as local_span:
+                intent = await asyncio.to_thread(self.intent_classifier.classify, query)
+                local_span.set(confident=intent is not None)
+        if intent:
+            if intent.category == "greeting":
+                span.set(path="local")
+                return intent, Entities()
+            span.set(path="local+entities")
+            return intent, await self._aextract_entities(query)
+        
+        if self.mode == "combined":
+            try:
+                span.set(path="combined")
+                return await self._aprocess_combined(query)
+            except Exception as e:
+                # A malformed combined answer should not fail the request; use the two-call path instead
+                Logger.log(f"Combined analysis failed ({e}), falling back to separate chains.")
+        
+        span.set(path="legacy")
+        return await self._aprocess_legacy(query)
+
+    async def _aprocess_combined(self, query: str):
+        # One round trip returns both the intent and the entities
+        with tracing.span("llm.analysis"):
+            data = await self.combined_chain.ainvoke({"query": query})
+        if isinstance(data, dict):
+            data["entities"] = data.get("entities") or {}
+            analysis = QueryAnalysis(**data)
+        else:
+            analysis = data
+        return analysis.intent, analysis.entities
+
+    async def _aprocess_legacy(self, query: str):
+        # The two chains are independent, so both requests are in flight at once
+        intent_data, entities = await asyncio.gather(
+            self._aclassify_intent(query),
+            self._aextract_entities(query)
+        )
         
         # Convert dict back to Pydantic model for consistency if needed, 
         # or rely on the parser output which is usually a dict.
@@ -105,13 +204,21 @@ IMPORTANT: Output ONLY the JSON object. Do not output any explanation or preambl
         else:
             intent = intent_data
 
-        entities_data = self.entity_chain.invoke({"query": query})
+        return intent, entities
+
+    async def _aclassify_intent(self, query: str):
+        with tracing.span("llm.intent"):
+            return await self.intent_chain.ainvoke({"query": query})
+
+    async def _aextract_entities(self, query: str):
+        with tracing.span("llm.entities"):
+            entities_data = await self.entity_chain.ainvoke({"query": query})
         if isinstance(entities_data, dict):
             entities = Entities(**entities_data)
         else:
             entities = entities_data
             
-        return intent, entities
+        return entities
 
 if __name__ == "__main__":
     from dotenv import load_dotenv
@@ -131,6 +238,7 @@ if __name__ == "__main__":
             for q in queries:
                 try:
                     i, e = processor.process(q)
+                    Logger.flush()
                     print(f"\nQuery: {q}")
                     print(f"Intent: {i.category} ({i.reasoning})")
                     print(f"Entities: {e.dict()}")
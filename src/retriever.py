@@ -1,20 +1,30 @@
 import os
-from neo4j import GraphDatabase
+from neo4j import AsyncGraphDatabase
+from src import async_runner
+from src import tracing
 
 class GraphRetriever:
-    def __init__(self):
+    def __init__(self, driver=None):
+        """
+        Connects with the NEO4J_* environment variables unless an async driver is passed in
+        (e.g. the local stand-in used by bench_retrieval.py).
+        """
         self.uri = os.environ.get("NEO4J_URI", "neo4j://localhost:7687")
         self.username = os.environ.get("NEO4J_USERNAME", "neo4j")
         self.password = os.environ.get("NEO4J_PASSWORD")
         
-        if not self.password:
+        if driver is None and not self.password:
             raise ValueError("NEO4J_PASSWORD not found in environment.")
             
-        self.driver = GraphDatabase.driver(self.uri, auth=(self.username, self.password))
+        # Async driver: the blocking API below is a thin wrapper that runs on the shared event loop
+        self.driver = driver or AsyncGraphDatabase.driver(self.uri, auth=(self.username, self.password))
         self.last_queries = []  # Track executed queries for UI display
 
     def close(self):
-        self.driver.close()
+        async_runner.run(self.aclose())
+
+    async def aclose(self):
+        await self.driver.close()
 
     def get_query_for_intent(self, intent_category: str, entities: dict) -> tuple[str, dict]:
         """
@@ -69,11 +79,14 @@ class GraphRetriever:
             # Query 8: Age Demographics
             if age_min is not None:
                 # Default max if not provided
-                age_max = entities.get('age_max', age_min + 10) 
+                age_max = entities.get('age_max') or age_min + 10
+                # Reads the precomputed per-age-group totals of every overlapping group
                 query = """
-                MATCH (t:Traveller)-[:WROTE]->(r:Review)-[:REVIEWED]->(h:Hotel)
-                WHERE t.age >= $age_min AND t.age <= $age_max
-                RETURN h.name AS hotel, avg(r.score_overall) AS rating
+                MATCH (s:HotelSegment {dimension: 'age_group'})-[:SEGMENT_OF]->(h:Hotel)
+                WHERE s.age_min <= $age_max AND s.age_max >= $age_min
+                WITH h, sum(s.score_sum) AS score_sum, sum(s.score_count) AS score_count
+                WHERE score_count > 0
+                RETURN h.name AS hotel, score_sum / score_count AS rating
                 ORDER BY rating DESC LIMIT 5
                 """
                 return query, {"age_min": age_min, "age_max": age_max}
@@ -81,12 +94,24 @@ class GraphRetriever:
             # Query 5: Traveller Type
             if traveller_type:
                 query = """
-                MATCH (t:Traveller {type:$traveller_type})-[:WROTE]->(r:Review)-[:REVIEWED]->(h:Hotel)
-                RETURN h.name AS hotel, avg(r.score_overall) AS rating
+                MATCH (s:HotelSegment {dimension: 'traveller_type', value: $traveller_type})-[:SEGMENT_OF]->(h:Hotel)
+                RETURN h.name AS hotel, s.avg_score AS rating
                 ORDER BY rating DESC LIMIT 10
                 """
                 return query, {"traveller_type": traveller_type}
 
+            # Query 9: Exceeds Expectations ("hotels that exceed expectations", "surprise me")
+            if any("expect" in attr.lower() or "surpris" in attr.lower() for attr in attributes or []):
+                query = """
+                MATCH (h:Hotel)
+                WHERE h.expectation_delta >= 0
+                RETURN h.name AS hotel, h.expected_score AS expected_score, h.actual_score AS actual_score,
+                       h.expectation_delta AS improvement
+                ORDER BY improvement DESC
+                LIMIT 10
+                """
+                return query, {}
+
             # Query 6: Facilities / Attributes (Clean, Comfort, etc)
             # Simple keyword mapping to base scores
             if attributes:
@@ -112,12 +137,6 @@ class GraphRetriever:
                 """
                 return query, {"min_cleanliness": min_clean, "min_comfort": min_comfort, "min_facilities": min_fac}
 
-            # Query 9: Exceeds Expectations
-            # Triggered if user asks for "exceed expectations" or "surprise me" or similar
-            # Since we don't have a specific entity for this, we might need a flag or infer from query text.
-            # For now, let's assume if no other specific criteria, we fallback to general top ranked or this.
-            # But let's check input text or just use Query 7 (Top Rated) as default recommendation.
-            
             # Query 4: Filter by Rating / Stars
             if min_rating or min_stars:
                 query = """
@@ -135,8 +154,9 @@ class GraphRetriever:
 
             # Query 7: Top Rated (Default Recommendation)
             query = """
-            MATCH (h:Hotel)<-[:REVIEWED]-(r:Review)
-            RETURN h.name AS hotel, avg(r.score_overall) AS rating
+            MATCH (h:Hotel)
+            WHERE h.average_reviews_score IS NOT NULL
+            RETURN h.name AS hotel, h.average_reviews_score AS rating
             ORDER BY rating DESC LIMIT 5
             """
             return query, {}
@@ -155,20 +175,10 @@ class GraphRetriever:
 
         return None, None
 
-    def retrieve_baseline(self, intent_obj, entities_obj):
+    def format_query_for_display(self, query: str, params: dict) -> str:
         """
-        Executes a Cypher query based on the processed intent and entities.
+        Inlines the parameters into the Cypher text for UI display.
         """
-        intent_cat = intent_obj.category
-        entities = entities_obj.model_dump()
-
-        query, params = self.get_query_for_intent(intent_cat, entities)
-        
-        if not query:
-            self.last_queries = []
-            return []
-
-        # Store the query for UI display
         formatted_query = query
         if params:
             # Replace parameters in query for display
@@ -179,12 +189,61 @@ class GraphRetriever:
                 else:
                     display_query = display_query.replace(f"${key}", str(value))
             formatted_query = display_query
-        
-        self.last_queries = [formatted_query]
+        return formatted_query
+
+    def get_display_queries(self, intent_obj, entities_obj) -> list:
+        """
+        The queries retrieve_baseline runs for this intent/entities, formatted for display.
+        Unlike last_queries this is safe when several conversations share one retriever.
+        """
+        query, params = self.get_query_for_intent(intent_obj.category, entities_obj.model_dump())
+        return [self.format_query_for_display(query, params)] if query else []
+
+    def retrieve_baseline(self, intent_obj, entities_obj):
+        """
+        Executes a Cypher query based on the processed intent and entities.
+        """
+        return async_runner.run(self.aretrieve_baseline(intent_obj, entities_obj))
 
-        with self.driver.session() as session:
-            result = session.run(query, params)
-            return [record.data() for record in result]
+    async def aretrieve_baseline(self, intent_obj, entities_obj):
+        """
+        Async version of retrieve_baseline.
+        """
+        intent_cat = intent_obj.category
+        entities = entities_obj.model_dump()
+
+        with tracing.span("cypher", intent=intent_cat) as span:
+            query, params = self.get_query_for_intent(intent_cat, entities)
+            
+            if not query:
+                self.last_queries = []
+                span.set(rows=0)
+                return []
+
+            # Store the query for UI display
+            self.last_queries = [self.format_query_for_display(query, params)]
+
+            async with self.driver.session() as session:
+                result = await session.run(query, params)
+                rows = [record.data() async for record in result]
+            span.set(rows=len(rows))
+            return rows
+
+    def get_known_entities(self) -> list:
+        """
+        Names of every hotel, city and country in the graph (used to match entities without the LLM).
+        """
+        return async_runner.run(self.aget_known_entities())
+
+    async def aget_known_entities(self) -> list:
+        query = """
+        MATCH (n)
+        WHERE n:Hotel OR n:City OR n:Country
+        RETURN DISTINCT n.name as name
+        """
+        async with self.driver.session() as session:
+            result = await session.run(query)
+            return [record["name"] async for record in result if record["name"]]
 
     def format_results(self, results):
         if not results:
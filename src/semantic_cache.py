@@ -0,0 +1,138 @@
+import os
+import re
+import copy
+import unicodedata
+import time
+import threading
+from collections import OrderedDict
+import numpy as np
+
+# Response cache in front of the whole query pipeline, matching near-duplicate questions
+SEMANTIC_CACHE_ENABLED = os.environ.get("SEMANTIC_CACHE_ENABLED", "1") not in ("0", "false", "False")
+SEMANTIC_CACHE_THRESHOLD = float(os.environ.get("SEMANTIC_CACHE_THRESHOLD", 0.9))
+SEMANTIC_CACHE_SIZE = int(os.environ.get("SEMANTIC_CACHE_SIZE", 512))
+SEMANTIC_CACHE_TTL = float(os.environ.get("SEMANTIC_CACHE_TTL", 3600))
+
+class EntityGuard:
+    """
+    Cheap stand-in for entity extraction on the cache path: finds known names (hotels,
+    cities, countries, traveller types) and numbers in a query. Two queries may only
+    share a cached response when these match, so "best hotels in London" never
+    answers "best hotels in Paris" however close their embeddings are. Names and queries
+    are compared normalized, so "PARIS" matches "Paris" and "families" matches "Family".
+    """
+    NUMBER = re.compile(r"\d+(?:\.\d+)?")
+    WORD = re.compile(r"[^\W_]+")
+
+    def __init__(self, names=()):
+        names = sorted({self.normalize(n) for n in names if n} - {""}, key=len, reverse=True)
+        self.pattern = re.compile(r"\b(" + "|".join(re.escape(n) for n in names) + r")\b") if names else None
+
+    @classmethod
+    def normalize(cls, text: str) -> str:
+        """
+        Case-folded words without accents, apostrophes, punctuation or a plural ending
+        ("Gaudi's Retreat" -> "gaudis retreat", "L'Étoile" -> "letoile").
+        """
+        text = unicodedata.normalize("NFKD", text.casefold()).replace("'", "").replace("\u2019", "")
+        text = "".join(c for c in text if not unicodedata.combining(c))
+        return " ".join(cls._singular(word) for word in cls.WORD.findall(text))
+
+    @staticmethod
+    def _singular(word: str) -> str:
+        if len(word) > 4 and word.endswith("ies"):
+            return word[:-3] + "y"
+        if len(word) > 3 and word.endswith("s") and not word.endswith(("ss", "us", "is")):
+            return word[:-1]
+        return word
+
+    def terms(self, query: str) -> frozenset:
+        terms = set(self.NUMBER.findall(query))
+        if self.pattern:
+            terms.update(self.pattern.findall(self.normalize(query)))
+        return frozenset(terms)
+
+class SemanticResponseCache:
+    """
+    Bounded LRU of previous pipeline results. A lookup hits when a stored query within the
+    same scope (model, retrieval settings) has cosine similarity >= threshold and the same
+    entity terms.
+    """
+    def __init__(self, encoder, guard: EntityGuard = None, threshold: float = SEMANTIC_CACHE_THRESHOLD,
+                 capacity: int = SEMANTIC_CACHE_SIZE, ttl: float = SEMANTIC_CACHE_TTL):
+        self.encoder = encoder
+        self.guard = guard or EntityGuard()
+        self.threshold = threshold
+        self.capacity = capacity
+        self.ttl = ttl
+        self.entries = OrderedDict()  # (scope, normalized query) -> entry
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def _vector(self, query: str):
+        vector = np.asarray(self.encoder(query), dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def lookup(self, query: str, scope: tuple):
+        """
+        Returns a copy of the cached results for a near-duplicate query, or None.
+        """
+        vector = self._vector(query)
+        terms = self.guard.terms(query)
+        now = time.time()
+        with self.lock:
+            best_key, best_score = None, self.threshold
+            for key, entry in list(self.entries.items()):
+                if now - entry["stored_at"] > self.ttl:
+                    del self.entries[key]
+                    continue
+                if entry["scope"] != scope or entry["terms"] != terms:
+                    continue
+                score = float(entry["vector"] @ vector)
+                if score >= best_score:
+                    best_key, best_score = key, score
+            if best_key is None:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(best_key)
+            self.hits += 1
+            entry = self.entries[best_key]
+            results = copy.deepcopy(entry["results"])
+        results["cache"] = {"matched_query": entry["query"], "similarity": best_score}
+        return results
+
+    def store(self, query: str, scope: tuple, results: dict):
+        if self.capacity <= 0 or results.get("error"):
+            return
+        entry = {
+            "query": query,
+            "scope": scope,
+            "terms": self.guard.terms(query),
+            "vector": self._vector(query),
+            "results": copy.deepcopy({k: v for k, v in results.items() if k not in ("answer_stream", "cache", "trace")}),
+            "stored_at": time.time(),
+        }
+        key = (scope, " ".join(query.lower().split()))
+        with self.lock:
+            self.entries.pop(key, None)
+            self.entries[key] = entry
+            while len(self.entries) > self.capacity:
+                self.entries.popitem(last=False)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+    def stats(self):
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self.entries),
+                "capacity": self.capacity,
+                "threshold": self.threshold,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
@@ -0,0 +1,152 @@
+import os
+import json
+import time
+import uuid
+import threading
+import contextvars
+from contextlib import contextmanager
+from . import logger as Logger
+
+# Append every finished trace as one JSON line to this file (unset: traces are only kept in memory)
+TRACE_FILE = os.environ.get("TRACE_FILE")
+
+_current_span = contextvars.ContextVar("current_span", default=None)
+_export_lock = threading.Lock()
+
+class Span:
+    """
+    A timed step of a request with free-form attributes and nested child spans.
+    The root span of a trace is exported once it and all its descendants have finished.
+    """
+    def __init__(self, name: str, parent: "Span" = None, attributes: dict = None, record: bool = False):
+        self.name = name
+        self.parent = parent
+        self.root = parent.root if parent else self
+        self.attributes = dict(attributes or {})
+        self.children = []
+        self.started_at = time.time()
+        self.start = time.perf_counter()
+        self.end = None
+        if parent is None:
+            self.record = record  # only roots started by trace() are exported
+            self.trace_id = uuid.uuid4().hex
+            self.open_spans = 1
+            self.lock = threading.Lock()
+        else:
+            with self.root.lock:
+                self.root.open_spans += 1
+            parent.children.append(self)
+
+    def set(self, **attributes):
+        self.attributes.update(attributes)
+        return self
+
+    def child(self, name: str, **attributes) -> "Span":
+        return Span(name, self, attributes)
+
+    def finish(self):
+        if self.end is not None:
+            return
+        self.end = time.perf_counter()
+        root = self.root
+        with root.lock:
+            root.open_spans -= 1
+            done = root.open_spans == 0
+        if done and root.record:
+            export(root)
+
+    @property
+    def duration_ms(self):
+        return (self.end - self.start) * 1000.0 if self.end is not None else None
+
+    def to_dict(self, origin: float = None) -> dict:
+        origin = self.start if origin is None else origin
+        data = {
+            "name": self.name,
+            "start_ms": round((self.start - origin) * 1000.0, 3),
+            "duration_ms": round(self.duration_ms, 3) if self.end is not None else None,
+            "attributes": self.attributes,
+            "children": [child.to_dict(origin) for child in list(self.children)],
+        }
+        if self.parent is None:
+            data["trace_id"] = self.trace_id
+            data["started_at"] = self.started_at
+        return data
+
+def current_span():
+    return _current_span.get()
+
+def start_span(name: str, **attributes) -> Span:
+    """
+    Child of the current span that is not made current; the caller must finish() it.
+    Used for work that outlives the enclosing block, e.g. a streamed LLM answer.
+    """
+    parent = _current_span.get()
+    return parent.child(name, **attributes) if parent else Span(name, attributes=attributes)
+
+@contextmanager
+def span(name: str, **attributes):
+    """
+    Times the enclosed block as a child of the current span. Works across await, and
+    asyncio tasks/threads started inside the block inherit it as their parent.
+    Without an active trace the span is still timed but not recorded anywhere.
+    """
+    parent = _current_span.get()
+    current = parent.child(name, **attributes) if parent else Span(name, attributes=attributes)
+    token = _current_span.set(current)
+    try:
+        yield current
+    except BaseException as e:
+        current.set(error=type(e).__name__)
+        raise
+    finally:
+        _current_span.reset(token)
+        current.finish()
+
+@contextmanager
+def trace(name: str, **attributes):
+    """
+    Starts a new trace (root span) for one request, even if another trace is active.
+    """
+    root = Span(name, attributes=attributes, record=True)
+    token = _current_span.set(root)
+    try:
+        yield root
+    except BaseException as e:
+        root.set(error=type(e).__name__)
+        raise
+    finally:
+        _current_span.reset(token)
+        root.finish()
+
+def as_dict(trace_or_dict):
+    return trace_or_dict.to_dict() if isinstance(trace_or_dict, Span) else trace_or_dict
+
+def export(root: Span):
+    """
+    Appends a finished trace to TRACE_FILE as one JSON line.
+    """
+    if not TRACE_FILE:
+        return
+    line = json.dumps(root.to_dict(), default=str)
+    try:
+        with _export_lock, open(TRACE_FILE, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+    except OSError as e:
+        Logger.log(f"Could not write trace to {TRACE_FILE}: {e}", Logger.ERROR)
+
+def format_trace(trace_or_dict) -> str:
+    """
+    Indented text view of a trace: offset, duration, name and attributes per span.
+    """
+    lines = []
+
+    def walk(node, depth):
+        duration = f"{node['duration_ms']:9.1f} ms" if node["duration_ms"] is not None else "  running   "
+        attributes = " ".join(f"{k}={v}" for k, v in node["attributes"].items() if v is not None)
+        lines.append(f"+{node['start_ms']:8.1f} ms {duration}  {'  ' * depth}{node['name']}  {attributes}".rstrip())
+        for child in node["children"]:
+            walk(child, depth + 1)
+
+    walk(as_dict(trace_or_dict), 0)
+    return "\n".join(lines)
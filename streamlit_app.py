@@ -2,26 +2,33 @@ import streamlit as st
 import os
 import sys
 import json
+import asyncio
 from typing import Dict, Any, List
 import time
 import traceback
 import uuid
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 # Add the project root to the path so we can import our modules
 sys.path.append('.')
 
 from src.processor import Preprocessor
 from src.retriever import GraphRetriever
-from src.embeddings import EmbeddingManager
+from src.embeddings import EmbeddingManager, MODEL_1_NAME, MODEL_2_NAME
+from src.intent_classifier import IntentClassifier, INTENT_CLASSIFIER
+from src.context_builder import build_context, get_token_counter
+from src.semantic_cache import SemanticResponseCache, EntityGuard, SEMANTIC_CACHE_ENABLED
 import src.logger as Logger
 import src.inference as Inference
+from src import async_runner
+from src import tracing
+from sentence_transformers import SentenceTransformer
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
-base64_str = "/9j/4AAQSkZJRgABAQEBLAEsAAD/6xdoSlAAAQAAAAEAABdeanVtYgAAAB5qdW1kYzJwYQARABCAAACqADibcQNjMnBhAAAAFzhqdW1iAAAAR2p1bWRjMm1hABEAEIAAAKoAOJtxA3VybjpjMnBhOjc5ZjY5ZTRmLTY4NTAtNDcwYi02NTYwLTQxMDA2MjEzNDdmMwAAABOFanVtYgAAAChqdW1kYzJjcwARABCAAACqADibcQNjMnBhLnNpZ25hdHVyZQAAABNVY2JvctKEWQauogEmGCGCWQPCMIIDvjCCA0SgAwIBAgITf8DFXrYCzoMPnf3QSrAMRZ64JjAKBggqhkjOPQQDAzBRMQswCQYDVQQGEwJVUzETMBEGA1UECgwKR29vZ2xlIExMQzEtMCsGA1UEAwwkR29vZ2xlIEMyUEEgTWVkaWEgU2VydmljZXMgMVAgSUNBIEczMB4XDTI1MTAzMDIyMzQ0N1oXDTI2MTAyNTIyMzQ0NlowazELMAkGA1UEBhMCVVMxEzARBgNVBAoTCkdvb2dsZSBMTEMxHDAaBgNVBAsTE0dvb2dsZSBTeXN0ZW0gNjAwMzIxKTAnBgNVBAMTIEdvb2dsZSBNZWRpYSBQcm9jZXNzaW5nIFNlcnZpY2VzMFkwEwYHKoZIzj0CAQYIKoZIzj0DAQcDQgAEawavchc+90s/hPWHxK3FFJ3MlrNDMsBT9MKpPwTIQKlgKDEGTNCDKZ7pSr9psMwxnQyVriyKysDz6Pfmk73qFaOCAd8wggHbMA4GA1UdDwEB/wQEAwIGwDAfBgNVHSUEGDAWBggrBgEFBQcDBAYKKwYBBAGD6F4CATAMBgNVHRMBAf8EAjAAMB0GA1UdDgQWBBQd6OZCLAQToStyGD7pXnGFgwJTdTAfBgNVHSMEGDAWgBTae+G9tCyKheAQ1muax0rx+t/2NzBsBggrBgEFBQcBAQRgMF4wJgYIKwYBBQUHMAGGGmh0dHA6Ly9jMnBhLW9jc3AucGtpLmdvb2cvMDQGCCsGAQUFBzAChihodHRwOi8vcGtpLmdvb2cvYzJwYS9tZWRpYS0xcC1pY2EtZzMuY3J0MBcGA1UdIAQQMA4wDAYKKwYBBAGD6F4BATCBggYDVR0fBHsweTB3oHWgc4ZxaHR0cDovL3ByaXZhdGVjYS1jb250ZW50LTY4OGFhNjczLTAwMDAtMmE4Ni1hODdhLTA4OGJjODczNTcwYS5zdG9yYWdlLmdvb2dsZWFwaXMuY29tL2I0ZmI2MDQ4MjVlY2M1YzNjZTZiL2NybC5jcmwwGQYJKwYBBAGD6F4DBAwGCisGAQQBg+heAwowMwYJKwYBBAGD6F4EBCYMJDAxOTljY2Q1LWRhZWQtNzlhNy04YjhhLWIwYmVkYzBhZjZmYTAKBggqhkjOPQQDAwNoADBlAjBmFtL3mPAMowbUEhwSn3lJjBLyCyhUYGl2NZQQHJOcHLpWNpHkl98WCG9IyI7KbE8CMQDxWA7ZdmKXNzz4Tf6p7wvW5zVzMnhwiezCm/86GxT8otwlWpSrb8J5T3FBV8wOLqtZAuAwggLcMIICY6ADAgECAhRB+qUhR3YhWNp/myz/jf0WCR7uPjAKBggqhkjOPQQDAzBDMQswCQYDVQQGEwJVUzETMBEGA1UECgwKR29vZ2xlIExMQzEfMB0GA1UEAwwWR29vZ2xlIEMyUEEgUm9vdCBDQSBHMzAeFw0yNTA1MDgyMjM2MjZaFw0zMDA1MDgyMjM2MjZaMFExCzAJBgNVBAYTAlVTMRMwEQYDVQQKDApHb29nbGUgTExDMS0wKwYDVQQDDCRHb29nbGUgQzJQQSBNZWRpYSBTZXJ2aWNlcyAxUCBJQ0EgRzMwdjAQBgcqhkjOPQIBBgUrgQQAIgNiAAS4I+VTFKKW2qcHaXHYRLsUr5NVlaYDFHPMONPMpny6airK8KpIs6RkGs6J5ouqun6ufO3QQANZYfdfrY2rMRdF7Bbqtv+VLtVeRUIzTaALRmAlbv48KxmAuhQFRD6eQ3mjggEIMIIBBDAXBgNVHSAEEDAOMAwGCisGAQQBg+heAQEwDgYDVR0PAQH/BAQDAgEGMB8GA1UdJQQYMBYGCCsGAQUFBwMEBgorBgEEAYPoXgIBMBIGA1UdEwEB/wQIMAYBAf8CAQAwZAYIKwYBBQUHAQEEWDBWMCwGCCsGAQUFBzAChiBodHRwOi8vcGtpLmdvb2cvYzJwYS9yb290LWczLmNydDAmBggrBgEFBQcwAYYaaHR0cDovL2MycGEtb2NzcC5wa2kuZ29vZy8wHwYDVR0jBBgwFoAUnFzYiVND51rVgdsD3hl/BCoqLaowHQYDVR0OBBYEFNp74b20LIqF4BDWa5rHSvH63/Y3MAoGCCqGSM49BAMDA2cAMGQCMALG0QTc1bXdvA3W7/nV6uJw0XquQSFhURIM7ompvlxffsfCDRf1Lasf69dqgVkgewIwLTfAIoqiYMeCpXjtS3LIelmWjkhkAJbvZd1ziCKl1YwSaG8+Tzx2/Fti2f4tV33MpGdzaWdUc3QyoWl0c3RUb2tlbnOBoWN2YWxZB+AwggfcBgkqhkiG9w0BBwKgggfNMIIHyQIBAzENMAsGCWCGSAFlAwQCATCBkQYLKoZIhvcNAQkQAQSggYEEfzB9AgEBBgorBgEEAdZ5AgoBMDEwDQYJYIZIAWUDBAIBBQAEIG3TpikLaGTXD4GBYWQuGwMemJiVEk6tialrJYF7EYhMAhUA3hDkZ345hwq1AZKoY+4F1WDPbO4YDzIwMjUxMjE1MjEzODE0WjAGAgEBgAEKAgkA7paXSGe1F4KgggWfMIICyDCCAk+gAwIBAgIUAKPmzpsOLWwEQ8txkCxtj4kd0XwwCgYIKoZIzj0EAwMwUjELMAkGA1UEBhMCVVMxEzARBgNVBAoMCkdvb2dsZSBMTEMxLjAsBgNVBAMMJUdvb2dsZSBDMlBBIENvcmUgVGltZS1TdGFtcGluZyBJQ0EgRzMwHhcNMjUwOTA4MTM0ODUzWhcNMzEwOTA5MDE0ODUyWjBTMQswCQYDVQQGEwJVUzETMBEGA1UEChMKR29vZ2xlIExMQzEvMC0GA1UEAxMmR29vZ2xlIENvcmUgVGltZSBTdGFtcGluZyBBdXRob3JpdHkgVDgwWTATBgcqhkjOPQIBBggqhkjOPQMBBwNCAASFX4mdJAheJrab1x2l9vhyFSV9g2BgjjK5WkOJaWHuUDQ/lUMmOsFRsimD+AYy6NwQv22ND1nAy6oTvlQybzWho4IBADCB/TAOBgNVHQ8BAf8EBAMCBsAwDAYDVR0TAQH/BAIwADAdBgNVHQ4EFgQUJ6wXXk40NEjmk0QIo79sKLTXm7gwHwYDVR0jBBgwFoAU3lWXjGB0OwPiarREBmWXYcrl+I4wbAYIKwYBBQUHAQEEYDBeMCYGCCsGAQUFBzABhhpodHRwOi8vYzJwYS1vY3NwLnBraS5nb29nLzA0BggrBgEFBQcwAoYoaHR0cDovL3BraS5nb29nL2MycGEvY29yZS10c2EtaWNhLWczLmNydDAXBgNVHSAEEDAOMAwGCisGAQQBg+heAQEwFgYDVR0lAQH/BAwwCgYIKwYBBQUHAwgwCgYIKoZIzj0EAwMDZwAwZAIwPCdVT3pQ0xEeuKnbnYOJ2hjGUcHgq+xNtt2eMq8eDud85cxKhjJDX+YBH/3PwWYBAjBccukG/sFZaZLuzO0uMvlNcswt3OAIlz6w+vsQzWwkzKcgGYBOER1caTrS/bKgkzIwggLPMIICVqADAgECAhRFAINuchMCxWSknmQzdvqPCbdk9DAKBggqhkjOPQQDAzBDMQswCQYDVQQGEwJVUzETMBEGA1UECgwKR29vZ2xlIExMQzEfMB0GA1UEAwwWR29vZ2xlIEMyUEEgUm9vdCBDQSBHMzAeFw0yNTA1MDgyMjM2MjZaFw00MDA1MDgyMjM2MjZaMFIxCzAJBgNVBAYTAlVTMRMwEQYDVQQKDApHb29nbGUgTExDMS4wLAYDVQQDDCVHb29nbGUgQzJQQSBDb3JlIFRpbWUtU3RhbXBpbmcgSUNBIEczMHYwEAYHKoZIzj0CAQYFK4EEACIDYgAEo3338b0IKh9FWSXgUvmpIN/+2y6PRSHYTwrVzQNx3WcqLFluwJwkMnIiebkCkV+5pspHn6fFNHMTfl7FJUTpMSKONNW4Fv4awasz6sYhLCNP/wHk4MF/8DhrxXKtJUsKo4H7MIH4MBcGA1UdIAQQMA4wDAYKKwYBBAGD6F4BATAOBgNVHQ8BAf8EBAMCAQYwEwYDVR0lBAwwCgYIKwYBBQUHAwgwEgYDVR0TAQH/BAgwBgEB/wIBADBkBggrBgEFBQcBAQRYMFYwLAYIKwYBBQUHMAKGIGh0dHA6Ly9wa2kuZ29vZy9jMnBhL3Jvb3QtZzMuY3J0MCYGCCsGAQUFBzABhhpodHRwOi8vYzJwYS1vY3NwLnBraS5nb29nLzAfBgNVHSMEGDAWgBScXNiJU0PnWtWB2wPeGX8EKiotqjAdBgNVHQ4EFgQU3lWXjGB0OwPiarREBmWXYcrl+I4wCgYIKoZIzj0EAwMDZwAwZAIwQcYGjR1KfAGV1uVNgXR8YF3McEJbShGEY/+lh9yUJNiBzKj5R1Hmdi6IdmkoWFBxAjBwC6Yt0x6bxekQmwAR51P07SWj6Sxq5/Bsn3cFWHkcbeHfuvGKPycTTri6GlI+Iy0xggF8MIIBeAIBATBqMFIxCzAJBgNVBAYTAlVTMRMwEQYDVQQKDApHb29nbGUgTExDMS4wLAYDVQQDDCVHb29nbGUgQzJQQSBDb3JlIFRpbWUtU3RhbXBpbmcgSUNBIEczAhQAo+bOmw4tbARDy3GQLG2PiR3RfDALBglghkgBZQMEAgGggaQwGgYJKoZIhvcNAQkDMQ0GCyqGSIb3DQEJEAEEMBwGCSqGSIb3DQEJBTEPFw0yNTEyMTUyMTM4MTRaMC8GCSqGSIb3DQEJBDEiBCB2W5+dqlns6vy+Cp+70FEuYAowUzvprIdv09OoMRdRVjA3BgsqhkiG9w0BCRACLzEoMCYwJDAiBCCE9Z8OlS6TnTcPjfwZORTT13ZiXshY9XXlr+Wm7IfQaTAKBggqhkjOPQQDAgRHMEUCIFuBzFoXgJp1yGAYYlWM4TSYS2jC/tC2cPtoDLdPL3IEAiEAlCPhlyt44GLdT8zClvIBtPJHPJNpg67Lu15WD1+cOZVlclZhbHOhaG9jc3BWYWxzglkD9DCCA/AKAQCgggPpMIID5QYJKwYBBQUHMAEBBIID1jCCA9IwgeuhQjBAMQswCQYDVQQGEwJVUzETMBEGA1UEChMKR29vZ2xlIExMQzEcMBoGA1UEAxMTQzJQQSBPQ1NQIFJlc3BvbmRlchgPMjAyNTEyMTUxNjQyMDBaMIGTMIGQMGgwDQYJYIZIAWUDBAIBBQAEILLMkMmpnzLwV15QgrzTg7jRCdDGWOB7mh3G6KoVFu0qBCCcGv1fPn5cgkeWtXTyUz/jgmlvrg23RvZwELGVObHbPQITf8DFXrYCzoMPnf3QSrAMRZ64JoAAGA8yMDI1MTIxNTE2NDI0MlqgERgPMjAyNjAxMDkwMDAwMDBaMAoGCCqGSM49BAMCA0gAMEUCIQDYe1X3A96HVEMohIeP3fB4qTKXReuardxAdOW1tzSsAQIgfaMaiPm4x66FbRXk0wfukKBsiPQACHDf/95tYDCJEaegggKKMIIChjCCAoIwggIHoAMCAQICFAC1PpdfjiDcu0+QYNy0zbRk+0XSMAoGCCqGSM49BAMDMFExCzAJBgNVBAYTAlVTMRMwEQYDVQQKDApHb29nbGUgTExDMS0wKwYDVQQDDCRHb29nbGUgQzJQQSBNZWRpYSBTZXJ2aWNlcyAxUCBJQ0EgRzMwHhcNMjUxMjE0MTU1NTU3WhcNMjYwMTEzMTU1NTU2WjBAMQswCQYDVQQGEwJVUzETMBEGA1UEChMKR29vZ2xlIExMQzEcMBoGA1UEAxMTQzJQQSBPQ1NQIFJlc3BvbmRlcjBZMBMGByqGSM49AgEGCCqGSM49AwEHA0IABL6a6FBcZIUpDcBOBp95dD+7PuCurQr79gmrN2A3WsEwkUyEERDIhRqBQeVks3chYztQaCoSW1rXQNEnWDZY0lOjgc0wgcowDgYDVR0PAQH/BAQDAgeAMBMGA1UdJQQMMAoGCCsGAQUFBwMJMAwGA1UdEwEB/wQCMAAwHQYDVR0OBBYEFHrmBFdoiVmH4CD3dEpmV9Vl9tt9MB8GA1UdIwQYMBaAFNp74b20LIqF4BDWa5rHSvH63/Y3MEQGCCsGAQUFBwEBBDgwNjA0BggrBgEFBQcwAoYoaHR0cDovL3BraS5nb29nL2MycGEvbWVkaWEtMXAtaWNhLWczLmNydDAPBgkrBgEFBQcwAQUEAgUAMAoGCCqGSM49BAMDA2kAMGYCMQDL8VdgQBT5WCZ21IgfWSGZuL3gMgMKLZK9sn3m3DUz3d08P2h66a93Rj6Nge31CMoCMQCVwJneKt0wYFkOxm8UrulNA88oddprq0zcIgfXTTQnb2o6UwkWx2mqPRzVvcTGbplAY3BhZFhEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABkcGFkMkEA9lhAuX21C4HzmztKJdX3TFDnghERE2pPM7HOf65ZikZMHHVHlhAbLC+wCObSNaOCrV9iajdnsVMO1LiqTN0U7xQBOwAAAbdqdW1iAAAAJ2p1bWRjMmNsABEAEIAAAKoAOJtxA2MycGEuY2xhaW0udjIAAAABiGNib3Klamluc3RhbmNlSUR4JDY2OTY5ODExLWIwMTQtZmJiMC04YmYxLTRhMGIyZDM1MTc5NnRjbGFpbV9nZW5lcmF0b3JfaW5mb6JkbmFtZXgiR29vZ2xlIEMyUEEgQ29yZSBHZW5lcmF0b3IgTGlicmFyeWd2ZXJzaW9uczg0MzI5NTY1MTo4NDMyOTU2NTFyY3JlYXRlZF9hc3NlcnRpb25zgqJjdXJseCpzZWxmI2p1bWJmPWMycGEuYXNzZXJ0aW9ucy9jMnBhLmFjdGlvbnMudjJkaGFzaFgg0iRpWnXaCPtJwlIc8RruokSxpMzbiXQ7NBM1qAtHaWaiY3VybHgpc2VsZiNqdW1iZj1jMnBhLmFzc2VydGlvbnMvYzJwYS5oYXNoLmRhdGFkaGFzaFggiyItEH/cJJ5H5apOf8Q1Qx3yMagVogmCMeTAgBIVjXBpc2lnbmF0dXJleBlzZWxmI2p1bWJmPWMycGEuc2lnbmF0dXJlY2FsZ2ZzaGEyNTYAAAGtanVtYgAAAClqdW1kYzJhcwARABCAAACqADibcQNjMnBhLmFzc2VydGlvbnMAAAAAnGp1bWIAAAAoanVtZGNib3IAEQAQgAAAqgA4m3EDYzJwYS5oYXNoLmRhdGEAAAAAbGNib3KkamV4Y2x1c2lvbnOBomVzdGFydBRmbGVuZ3RoGRdqY2FsZ2ZzaGEyNTZkaGFzaFggLWZ4DEwFE4ApIeP2oEqYenQt6fOw0wS6DoyVwpi7omBjcGFkTgAAAAAAAAAAAAAAAAAAAAAA4Gp1bWIAAAApanVtZGNib3IAEQAQgAAAqgA4m3EDYzJwYS5hY3Rpb25zLnYyAAAAAK9jYm9yoWdhY3Rpb25zgaNmYWN0aW9ubGMycGEuY3JlYXRlZGtkZXNjcmlwdGlvbnggQ3JlYXRlZCBieSBHb29nbGUgR2VuZXJhdGl2ZSBBSS5xZGlnaXRhbFNvdXJjZVR5cGV4Rmh0dHA6Ly9jdi5pcHRjLm9yZy9uZXdzY29kZXMvZGlnaXRhbHNvdXJjZXR5cGUvdHJhaW5lZEFsZ29yaXRobWljTWVkaWH/2wBDAAEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQH/2wBDAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQH/wAARCAQABAADASIAAhEBAxEB/8QAHwAAAQUBAQEBAQEAAAAAAAAAAAECAwQFBgcICQoL/8QAtRAAAgEDAwIEAwUFBAQAAAF9AQIDAAQRBRIhMUEGE1FhByJxFDKBkaEII0KxwRVS0fAkM2JyggkKFhcYGRolJicoKSo0NTY3ODk6Q0RFRkdISUpTVFVWV1hZWmNkZWZnaGlqc3R1dnd4eXqDhIWGh4iJipKTlJWWl5iZmqKjpKWmp6ipqrKztLW2t7i5usLDxMXGx8jJytLT1NXW19jZ2uHi4+Tl5ufo6erx8vP09fb3+Pn6/8QAHwEAAwEBAQEBAQEBAQAAAAAAAAECAwQFBgcICQoL/8QAtREAAgECBAQDBAcFBAQAAQJ3AAECAxEEBSExBhJBUQdhcRMiMoEIFEKRobHBCSMzUvAVYnLRChYkNOEl8RcYGRomJygpKjU2Nzg5OkNERUZHSElKU1RVVldYWVpjZGVmZ2hpanN0dXZ3eHl6goOEhYaHiImKkpOUlZaXmJmaoqOkpaanqKmqsrO0tba3uLm6wsPExcbHyMnK0tPU1dbX2Nna4uPk5ebn6Onq8vP09fb3+Pn6/9oADAMBAAIRAxEAPwD+GtVOTwAQQvXGQAOM+oPtx25xh2DgjIJPBO0Y6YPGe4+vJzinb+gYAZ4HU+pGMn0xyDzwDwAKXvx6479/z/Ln8a9j11PIfe1r7ab20/4e3Uj2gKykjngE9vXoR1O7jpz0zzTfLx0PQfT6euf5/rUmOncjpnHX8P8AD9RRjnOT9O31/wD1D8fVNptbd1bSy019Pnr2e4X0tey3tbqtPxXXuAG1QFP0yep6n8Dk+pxn60AnGO/BPoT7cDt2HANKP8//AF88/nSevP8A9Yf5z/kVnzO+yb01s/J216fdrruIX/P+f6/0o+v5gfyHt/Xr6ICDz1H4/wD1qWqTu2rbu72Vtum3n1f5h/T/AKf9de4UxyRg/wAXQZ6AZGQfp6fXoafjPPpz7f4D279hSE8gH7p/HBz37c8f14qlqut+vTotu+t+6Gt/6/p+nXYjKgcbhn0xz/nnp3oKALwcYGOmc8+mfX3+vOalIGc4APHP1AHOf856cYwHng+n6dv5jnt044ourpare2nRJdL3ur9UuiDTT8/kvlp+N9SONR8ynoQc5GeMjPzZzznoO/Q801kw+Ac5449Pl464znkgDHTGOBU27PGeg9Mewz0/XP8AihwT/wDrzj9PXn8M9qXMur6ee2y6f191x3vr5fdb/IiZMYJPI6E8YyR/U9T04654dsGAQeuD+YB45+uBge/epB3wcfnzz+XBGTR/n/Gnfa1raX8r2tZdPTT8xNt79Nvz/wCBbawwJhdikAdzt5z8vJPoSM4B4PsRUZVgQAM7j19gOO/APf0OPcifg9OxI+vXr75/zxydSM9Mc+vv+nQfQc0Jpvfz/TW1/uD8euu76b7/AI+fmNVQoJzkgDaCD06kDng57YIJ5OelRhcDcc8EcEfQfln/AOvjtMcd+Ppz7D8z6f8A1qTJIBHtjP8A+sfzH1oVtNunW/b/AIH4D6Wt1318vO3qR7SxIAx7E89gBxnHUcjIHbPFAjAPDdR6enH4Zzjjj9al757mg9enTjnsehx/n88cv+tNAvZ+q9fvv3auM2YX+EHu23PXA9cHHzfTGQSQKaFbPYDoO4PTIJ/A5z046VLwfQ+o/wAf0NIO3H0Htxxxz6A//qo1v/Xy6/o/kHS1tf8Ahrf0/l1EZd2NxztOV7cngnnP1HT86ULgYU4x34H6Egfh+PWl6d/T8/8APH/66Q57Y/PqPT6/WhOzVumqaWitt/Wv3C1/rb5rb7/8xhQ8nOc5GSPYcj6Z46elKyZ24IBXvgHnAGeo447e3bOXnt9ff/PPv/PGT+X9f/r81nzrqtNPW91bsgI2XJOeuAenp6DJ/wD1/Xg2E854PbByOgAOT257nAI6c1J/n8P/AK3b885o9j0/zj8qcZXvpa713vslpo0/yXXqPtf52/r+mM2gKeQc4y2AOhHXAIzgHp3/ABojGFHGPYH07e3oO3HHelOeAAMd/Tsad/n/AD+tVtbr5uy6pfLvZrV6LayNUt9H0+fVdNhmzBBHA4wOemBjrj/9XY9CgU7myQQQQOOQeOevb8ulP4OPY8duR298flwaX/P+f8/Sne/W/wDwdf1C3lvte/V9P620EUYGM8DoPT1/Ptx9ai25Zu2T3H5c5HXIx6jPbFTdef8AH+X9fwznij/P+f8AP9KNvn39P+Bf7wvv5+X+VvyZCoO70HTkepXP5DcfUj+EjgyBdvAwBjGMdBwcA9tpXuB1yOc07k9//wBQ7fl+nTnFH4de/wBO36+h/CltbS276WX5fgJbojKDDcA4A5HIOAMjt0bPcjOO4xUY5IAPXp1z1xn8O+ec/jVnpkEdf0//AF/rwabgenH4HrnPbof/AK31XMrrfzVttt116W6bjv32/wCG9d7a+f3ETKFUYA6gA8nj6Z6dM9+M800BsAkZPGR3OdoGAC2OuCMnGRzg5qcKAc9+R/n+XXp2Ao+g4znBHv79++SPwNN+Xlv6r+r9A/rXSz+/8/PQjRdmWIG7HIHUDjb/ADDAbuMEjIzT2G4DoOfc5PHHccH0HHXI607A7D+p/Enk0uewJ9MfqB+vp/OknfVa9Oq/l6u9l/krJ2Fp0IuSQpAG3IyDnOMZ69OScEDk8nOAaTZk43cj25x+Z44A7fyqXP5f1/8Arf49M0AAc47nnvk+/wCNPTTTVpd76Wt92gLrft+P9f1a4zyye/v0H48np6fmO9AjA6nIHXjnrz35PPXk/wAw8H09T/hj6dfY5oAwDyTnHXPqeOuMdyfXpgdHZf18v8kBCyjkg/Lz2Pc9M88Ad93XjrzSpGoBPPzYzjtjGMAY7Y68BTjGKlGOmP6fl/X/AB6Jz/nv/P8Aof5EXn/w/np3D+v6+4QoCu3jAx1B4wQfXHt6cnIxxUbLtGeDzj6D16ccls8+/GTUpP4evQZ/T0/keetL+Hfp/k//AF/xqXqrPZtadd4/rv203D+vvGHaqDgkEDIA6k4Jzg+h56nnkc01F43dN3OGAPBxycH+7xwfrnpUufy5/wAP1HX196B1H+OP8/59aV0mktbtavXotb+j/wCBqNNrZjGQEjoDjj9Mcd+M+h98U8dAM5xx+gH9P0FGOnTnn+nP5Uds49T9QPT9fqeKcdlrdtNt3vtp232/V3ERsMtnjAAJGCCcdeec5/DGDz0FAXJDYwOMjHXAHI5PHOMkDOO+OZAQVPuR144GfXqMH8c/hR27cdAeP1Hp6f4mhO/Sz379v0to/K6eqHfS1uqe+m1tlb79/wAyJgSxGcdPmxx90D+I5JPGOeAuMdcu8sAdcnjBx1HfuP5e3HWn5J656Ae3sP8AI/rQDwR3/wABk4yM/l261XzfT10EMEZJByOGJ799o55z1z1zjrzyKQjaWBG8H6D34x1PXOMgc59pPxpO464PU9Tn8fYfiT65pX20319Fpb56rT7r6Xa0d+3nYidQoyCSMgYI55/GnBO4IyO+3PBx0JP0wQP8Kee3A2j7307evf264pRxyPXP48dv8/zovtfdq/z00+97eodn/Xo/67d9FPJ4yf5n3/H8/WmMNzA56Yz35Bz0zwfwHQY9nAjkckgD/J6Dn+eKTHB7Z69OfX25H/6qSbett7u/lovlfdLXZ67MPw7fhr93YCAwI7EEcE9x3Of/AK/480KMALxxnkZx3I//AFYHpR0Axz647fh/h6/hS/5/z/kVQiHbliuRyQcnrk8nA6jvjHcADnGXKoK7VAGOCSD+OO4xjOcfnwafx+ft/P8A+vQBnPPpjHpx0+p9PXqMcH9dh97+qt0va/4eiI1jCkngkdscDJByBwMjHXrnpnlQqxhSx65YkA9R0xz7c/z61IeO31/x5/8Ar/4FGv8Al/X/AAwiJlAxt5PJP0GMYPp15z/PmU+3XHA75ycDtk9+3p2ppGOVGSeufT9KdxnPf6Z6Zx39T/npR6221/rsPfW+/f5b+Xb02GFDt4PIGMY6g8DjPb2GemO2IuQQxz1745yeoyP157dTVj/P+f8AP6UHt1+nb2P4enb+QJaNCHnPv3H1z29wD+WKAMKRxyCO+OTnpn8OePbNL6d/6+x/nxR9R7/iOnb/ADj6VP8AL0ur6bdNLPp6bfeBH5ZGAW6DGMY/rx39aCnBAODyQSOnTjr/AEPfGDT+n+ccfy4B/Q0v5fp+v/16Skm7u97LWz2tHTW/ovw1eoNVMDbnjGPp789P8+mSoAXgdCSfYH1GeecD359KX9P6/wCf5UjDIAPQ4I4688g45x1/IHoOKT07Xs7Pe+3r1sPe1/T7vL0+8aylgATzzz1644wew549MD3p2e3B+gwM+nc8fiBg+9L0/wDr0DBwcjB/ln6HHf8AXjpRe/591ZP9fw+4L6W6b/Mb97cC3UduCOc5z1z9fQcA5oUYPGMenHU4xk4xgDsRjn+HJAdjBz3656+n1Hbnj69OCmD/AK/D/LfqNA5DZBIxg49MYI569eSTx64UU1lJC8qCvHXA5wccEj36An+IjmpO/wDPP9e9BAI7f/r/AMPw+vSjW/yf6W/Dbt9wl+fle3p5iKu0Y7AYGBj1x+B9PQVGUIJKjPOQv5ZGOBjGf4hjrmpc8dP88/4/TgdaBxzn8P8AP+OfpxR5f8MH9beX9a/PcjMfUj1JAz6/55PfvjNKUJA3HnA7EZHA789B3+nQU/g5z6e/9KUAYGSTjPXsOBke/J/r7pbdfnuO9ui+7df8F/Ps7aKMoSeSB+HToO2OmPT3pPL9/wBP/r1JR06c/XB9Oxz/AJz15phdt9Pw/wCGt+AwLtB5GT/F0IAx054AP59zyacgwMZGO2Bj+pz+GOOPeg9cev4//r9znHTHWl/z/n/PrSWy+Xk/+AHT9Ld7a/P+txm3LBuCPTjpjHXHOR68A8885U5JySCMEDGR3BBJLYGevB4PORxS4/EdOe/T8/elJ7duf6fzA/yTRb9LeVrfqgv3V12+7S+/TTsNAwAvYADnvx0Hr6/TjnnAqhQQMcnPv6DnqeP19+adx3AP17H1+tKMemR09Ouee/6dOPxPxs+vnbXbp06Ly6IYFXAB6Dpjp1+v5daaBjcQD0xz35GTngjjn+vXEowf8/TkcZ688dunrTduD1P0Pvj154//AFe7DyequnZ7Nry/rQaASCCMnOBkfMDkYByegxuxz7ZPFCqV24IGM5wCDz+P6Efnzl/XvnP+ffP1oPJ6Y9Ow5755x1xk9vXrUvRq3o16uPz7P1173d39y+5baf1fqMMfJwQB16d8jPQ4/HP4UMuewzknPrnr3PXAP/6zhw469SfT/DPpnn+lLRpZbLRO/T733u99dWG2z+e1+/qtCILsOTk/QYOccE9s5+nbHThBFyzcfMTlcdOADnrgAjnnPJyKm/X/AD/hQOAB6U09Wuv6aP8Ar0uF/JddXr2t91tOnkIAAAB0A/PnsB/j26mmu20jgHOeD7YGRggn73rj88F/br69h9RyPyH8+TSEkDjk5GP/AK/Si9mvPZ9PT+vxEvz7kSjc2M4x1HU4PXuMdeRz1PTBqUADp+POeeuP8M/U47A6dMHv/L+nr0xSjjOO/Xn/AOv7c0Prf/Pa23+dr+mgf13/AK/r1D2JGO/H079x1/z1YcqN3ylcnpnpuHOcgdOoPIHHTq/j88+4/wA/WmkZ47cdO3Ppxx+P5ckH9fL9f63tq1bvb/L9X923VsaTuTBxhskj8eQOQT3HGM9cDhaUIpAyCBg8fUemTj3B54waUAD5f7vQ9Py74/SnYzjoB/Ud8cnv2/xw7dbK/X/hwfb5+WtrW+Xz77EbKCoUHbjnnnAPsemfft8vyno5VAwe+PwP4c9fTmne34/z/wAKP0+nvn8f889aV9L6Wv8Ahe19v+B521C78/8AgP8AT8P1jVCnQ5yepAU9c/w9z64yMdeBTxkdTntnpnPH6/8A1qCQBn15+vp+eCM+1LkcdifXj8Py6/5yrPR9era3skrW08nbpZB020vv5jWI+7jhuOx7/wD1+f056AQA5HU+ncZ4wBjqcn5sk5GemKUjPYHp+h7n/wCt/Ol7dP8APp/n9ewnd2WuqbS7u2qtvZ2vdf5Bttv17f13Tugx7/r6n9PxwMfhR/PP6f4jnjH4+geOfb6evU/5/wAD688f/qI69O39aSd9bL/gaJ6fLRdtr2F/X9b/AJCOpI4YZ5Gc+mNx9uueRk8cAGpEBGAq44+ZuME8AYPuQOnXJAGSMsHGByV5JAJ65GMgcYOTngY4xnGBI3bJbAbBwBzngLx745x3wSDk1dt/S7dtF0/rV+bQ3pr6a91ppZ+itp2bTJVyWAP545z7DIOR7HJzxxmrCFS2GBC8g9QTn+7j2z29MVXDEMcjIP8AEAMqO/X7uexA9OR0pOP4CTg4JJ6EAcdSOvJOMHsOTS7LTTbr26+X637hbr00V1rbb+rd9tiorMSdwPAAHBz3GeoHOc5GO4OSDT+lJ1HTr6Ht6g9f/r+3NKeBn+XJ/Ic/p3NZyd7atO1trXfuvp167779GH56Wt+X/B7973SY5z/h65+v60E8EjnAPfvjOP8A6/bvS9O/+fT8v0ppBxwcYI/z/LOc+wNJNtq7vqtG3rr8w3f+ey9fLyFLYwMHk+nuAST+OR69uaTpkjn154HIHvjAz27YyABS9Rhhzn6jqpP4HGMZz7nFL/n/AD/9am1ZLd33s+1l59dOq7dg20tfvrvqtNP+D+VkxgY6cfl78/nRj+nr/wDX/wD189eaWj/OaSUnrqr2S9brXvro79bd2L136h/XrRSdO/rkn/P/AOr+Qc449uvp9P6cfnRduy26X27dfktv1Dfr9/3C0gJ7jHOOvWl7ZP4/56fqaOn5d6Fd3t9+umz+9qz6u2wdNt+vp/w/UT+n+fp/Ue2aBnv/AJ46jj9D+fqD6/59v8/rklf8/wCH60JSelnZ+W21307a+W/cen5fpft/XXqJ04wT19P16DnP+Pc0Z6YOD275/wA9+vGeKWkHfI6Ebcen06/X8e1Eb6pJX3vfXdWtfTe2nVAvy/HXz39OyAZ74z+f+f6fWlzjgdT0Hr3x+n8vaj/PWkxznoc5BHb8/b/OeaIva97eT223trbbbtoLTr/TAfTH5f0pe/OePw/z+PSj/P8An/P9aB+J6f56dSP6H6iu7NdHJ+lrN9dv18w7/f8A1v36/mJn/P8AT6jHNAzzk5zyCPfrzjn26evsDHPHT06e38v5D8Fqk3pbX10dkov9X336h92v/Af/AAPvsIePz7/yGOp7D+vdeR0P0Pp7dunT/OaQgn/P8/UHoe/58H4D/P8An0qbPTe938rWt6f8MPpvu9vyf57/ACDn1Hf/APX+HfH1GKBnnP4fl349aWjGT+XHH+f/ANVD5tHr5b9LPZ79PmmIKKKPrUgIPXqDyB6ZB5z17/0pf8/5/wA/1opMgcdPT/P8s1S1dr3ts/uXZPoldJW3DX8O3T+uovH5dP6+4/D6Uh6gYz78cc9/89uM44M56YOPT/Hv35/DjHB+GfXP19xzjt+lWrtL5NJ9dtX1stfPa/m13+XS/ruvv+97i0gx6+/P6f5/PuaWgd+2Og9fy6Y/pULmVt0tb3voutlt+fpcQDPPH/6vX2oBBzwR1xyBj8AP89h0o/ID+X/1qQ/Xgf56n6H8+3FPnei8muvSzu/lppru9EAuMUcdjn/P+f8APRB79f0/z/nsaXn8Op7/AOf19KWra6ffotPesvLt9y0ACcc4yR0HB/nSA/hzgZHXH1x+XrnrigHIz+GO+eeOcent74ozyeOeP168/h24yPWnyyutNm29X5Ju/Zu1n67jt0tqnr+C9N+vmGOSe5/z06fl+HfKZOcEdecjoPY/l+ZxS5/I9/br6H8+OO9AGAB6Y/8Ar+v4enYin7ySS1ul8rWtvpo9NvN+R0/DW/l18unle/S7ic4JP1Ppyef69v6lM449f6e3J79h+XFJjJOTxxx9P58+mPfNHcAd+n+Ht+nXipu29LtXW2uitrt8Xfpt3F/X9b+f3C/Wk4546/8A1ueP1z7/AFpcZ4z7fTrnn+WP1zSdcfnTXNfbtvfy162ezb6fcH9f1+I7A/Hn+XX8/wBP1TpzyPf37fzFJkfjkjH0z9f8+hoPt0yP0PHA/wD1CtQF/wA/5/P8aTr0JGPy9e/8hg/mDQOnf8sH9O/0/CkyccDr9cAE9ePXuOuCaTvddO+/l19L279uwv6/4Nxff/P+T+XANL+tFGM5/wA/zzWV3Lrpbr0S8/ubtu9w/D+txB044/8ArfQ//qpf8iij/PX+n+e3rQlqrd728k92/vXy9EAd89f8nn9e9BweOnXuc/p9ccYo9f8A9X9eTSfh/L/P/wCv61Sv7rfS73tp7vlst7fj0D8P6+QDGSACMfljAHTt6fy70f5PUcj/APV/+ulH+f8APB57/wCTR+H5+1Oz93XZaq/a11pv+QX7abf19+oHPb1H5f5/z3B/PuaP8/5/z/8AXQfU/wAvX2/+t6cVN5O2vZb7app9fv1108h9N/8Ahmu/6dPvFo/x/wAPy/8Ar0f5/wA/56UA5znIx046j/P/ANfFJXb1Xa/orb330t+Yv0Cij1Pb9B/nH04yO9J2OePcHtz/AExz9adn6O9+uvw7+jffRt7Av+H/AK/RC0f/AKv8+n4UhPGfx4x0/wA//WoIyPrj/wDV16euDzz60Ru2nrZdvK36W73sFtu17X/P8wGO3A57EZOPpS/5/wA/pR6H/H09D39en9KQjvk8dux+uOf89KpXutbW013b0dnd9elvR9gFPt/n+ZxSc+2P1+v/ANb8eOlL/kfp/n8KTHIOT7jPH+f/ANf1mV99VdX673S729O23YFr+nm+wc556dvw9/6Yxx1peO/v/n/GkGccjn27/wCfelo95u+70tu+19f/AErW2/kPb1+/t8gIBGDSAADH8/6/y+lL14/+t+v+TSHPGMdefp7Uk5d33vfrotX929rafM1en/AXYPx9/wCn5f1paaeoI57H2H1/Lg/hjmlIzxkjkc+3f/PXjvzQoydraee347/16h2v/XyX9fO4tNwTnODzx/TPT+fNL075J/D2J4Gf8OORS/19Ovpn/wDX6c8U0rfJtvpp7rdr2aa+W+jDZ/drrps7rRP8Nu40fXI7evHGT655/Qil6Z9zk/j9P8/zoPQ/5/z/AJzS1Ou6v8uyt1St/V2H5bW62VvL8bboO3f8+n+fY0YHHHA/T8efT8aKTIz16Z4/Tn+nYn3xRrZLp92jt1+7fbQQEZBHrRgYGR6ZA/P34z9QPpS8/p0/r60nfHJyc/T09h0qo3TWj9LPyu/ku99dk9Wnr92vpe3/AAAOAMfp6+wGPw6GjPOOf6f55+n40HBI46fof/r4z7fiKOB7E5OCRnj8cdP/AK9ON9N1byts15Xffu9tN2W9b2/4b/Pz/EXr/n0GT+X86Bntzx+J59MY9Px7Ufh/n/PXn6ZpDnHy4z/n9frVa+7dX7/NK77XWvyfqJfn+Gu4vX/6/wDn0pAAM47/AOf8/wD16XGOO/ftz39O/tz6DpR6c9f0+v8An8qeuj20aav6f8H7wv5vp/Xy6C8D/wCt/n6/j1o449/f39sY/rnikx0/z7YPr6/lS4GeT2z1PXHA4z+I/HrTX9f11AQ47f8A6/5/TqelFIe3p/L/AD3Pb6ZIP68+n9P580uq9NbbX93v5fhsAv8AX26f5Ppz7UEZBGev1557e3HPT86TPHr19e3vj145xQORjp247foMH2oV7K616/159ugbai/5/l/h+ppBkZyQfp/9f68emetLj+XT/PtQMgnPTPA/Dv8Aj+PvQr6X7a9ddP8Ag/qPo9v13W39bX7C+nvznv1I9h2/+vScDPb/AD3/AA/wo6/5x/Oj8enQe3+ff8D1C101astdnrpv5vp11+TX9eovHbg/p/j6fy7ZKf5/z+f480UE4/X06e+ew/rSbs767PpbazfRbpf8N0A74x7+3t/jRn/P+f8AP50nfIyRgfT3Pp9MfjjNIRk9cH+vHUZ5yCB09ie1JKT5b6aXe97+7o/NfpsrB69vuuv62v5X6rnGMA89OP6H8fb1xS8/0+mc/wCf1pDnnA59/p/n0+tAzxkjgcge/wBfp/Pmi2176q7u305b3+V16WvqAvbn8e2Ovv8Ar/TFISFHI6Y/z26//qpfcjBycDrjv7j0yOffpSdCeCc+vIH59P8AOO1Vba+ll/lfpZf5et00te/kuvlp5X1F59Pr7Uf/AK+/b/PT/E5XA7duvGB159+p9M9aac9RyfQ/Ud8+maSUla+unfRWt0tuv6Yhc8dMZ/l6d+mB/wDXo45zn65GP5f4UUe3+eajmb31t93Ttb017gH4c9/8/wCc8dKaRwR2Pfrz/gOp6AfnhR1PTjHcZ79R/nrR1/H+R/I0K91bTVL8t9u6b2vfzH9/R7em67du+ghIODwfTqMnqOvT6989s4K549vfj88/5596MD06dOOn0/8ArUMMjoD9ffv/AJ59OlXeUmt0tO/bvZrS3zTS7hpdau3TVaa/dt+Oov8Akf5//XQeuAcDv6+3T69ufSgccDp+P5H1/wD1elAHvjjI59O31+vP6VVtN7rv3X3L8RfoR7BwBjIBJzzkdgD1OSMdhnG4jin45yfvAnkHgjtgdAOv0455NA3Y5HTrjn+Xr7daMdffrz/L+vfvUylo0r69mtrpt7rz+64W1/4N/wBbf16i+vB9eue3t/LFHvx/LAz369vTg4pAACT6+v8An/6/frRx698evP8A9bv+frU2u9E7aPbZe7qvPu1v0Q+unl3/AOD/AFsKcZIHPv0+o9R2/mKD/nOOfpz36D359qOR0/D/APXz+HHFIc8gkHnP5/iOcHr1xkEZrVva/wCb8uv3LpdLYFuk7a21flbV+Wuuy1HdAeR0JPJ79AcBScEDA78YHU07OB90DknoOBnnGe4PAyPTvSHAPHTB3BScAdRn+FRlfc+hwKmHdWPy5AzkYPbnGfmBx0Bye4NLez6Wu0+zWifk1e/4Md+VJu++3py20S1dt9NutxQSOmRngjI5HoOoPT3B6cZphOD9wrycYHPJXkAAfL9Mn1+7TxnqSeg6cdDjPfPbgkdMZ6VOvJUkZAP3SAT1HAJ5JODg4B5GRlRRdadb7fg+++z+XXZq22z1+b20/H8zO6/Q+h/rnP8AnmlGffuM/XqPwB/yaYrbjxk8AEY7+x5HrwcdvXh/b+f+ef8APrUSSajoltdNtK1op33f9Ws9xfl/w1/+Ht94g6k+vHX09ux/z3NLR/T8Pw/D/D8EJA569vU56f0xye3rxUpNtdFor6dLW8m9tLb9EPfzei/BW/rfuGMcD6kn3Ofx9+mM96B3GQcfTP0OPy9PYckgPft19+/t3GOMUY54A9/XP+c1STSvfVNvfs4vX7r6eT3epffrfy66dXr/AMERVXqMggnjt6fU9+v6EU7qfrznPfj/ADmkPTrj/PbBBz9OaBnkHjqAR6DHPHQ+lJtya0elnp8tdtXr+N+9x66/L7kvl/XQXOeOCOf1/n+fHHrSZz68ZHbj/PUcY5oAA+g445/TOCevbNA56dO34/56dvywcrvtLlut/lfy7eVl5B3/AAv6/wDD/iGR+uMc9ev/ANfPT3poOTgggEd85x0/zyOc85NLnnj8eOOff2znHfP5B65GCfU54Az+X4e/vTiumi2d76rZu6/yvsr6odlb12d3vpp0WzvfbXcT1C5zkZ9v1xntgemAOM08ZJ6ev/1jnpj1z+lIByffnPpjA59R+WD9aaAdwJPXqB7emevfjgjPHANXrpsu/wA7adV38+gb9tFu93tp8ulv1bH0hz2/z6/pR3/Lqfz/AM9/brS/5P8An8v8mskveVr2WvnZa9NNdl56OxP/AA/cToMnHb+g/n+n0oyCM9seuP8AP6Yo9j/n6/WgDHHT0HXuPr/TAPPPNNLZ2639VdLb53vv+Y1srb30/D9RBz1BGOhPX/EH/OaUMvPGR68/Tgjg9vX+dGQeOecjjt1/wP5Ug4xz2znj1yeBxzkc88Z6E5NWa1SS201e1r76X21v971Tt9+mmq+SvfXr+V27IB9scZxx+vTk9+TjvjupOOxP0/zn39KTIB5PPv8AU4/In8PwoJI4UZ44zz/Pj9cg44qVe6aTSdk99rLr59NbhbVaKz9Utk31vp3/AOGDOMHIxyPbjpzjA/MemTSj26H6+36e1IRkdODg9cehHrjvwPrkHq4AAAen+c1olt0stvu/4a/mJ7LXX5bWX+dv8rWCkz6HjHI65Hbpz/PpSn3HT27/AOOf8PSkA6Z78HH8x+XqD0z7J8z5eyXe1rtNpL7+v6C0/r+tOuuvoH6Ej64P9cGjPP5Y/H/9X6j1xQPz9Dnqec9uPw7dOKPrxnjrz/8Arx9efXHOaT5l01XTbzfl/wAH5O2uum1+/wDX5eugE9eMn07Y/XGen59skH4H8D9OhOP6A4/M7n2/E88n+mB/9ag/h3OT+PHt9eeM5rRJ6dLdre9t6Wta3mg2a6bX38vTby+97h059fT1/TuMc98D0wnG4HuMjuM/T1xz0z1+lGeDg8ntzwcdcYz6enUYGTy7HQ4659Px6UK+l731ur9rK+/b729FrcOjevbf00ffTovusH8+M/8A1v8AAdOtH+f8/wCfXFNOMjnnPvz7foCfT2zTjnt/+r/H8P8A64h81k99L97Wa87dHrq2n21F/X+QUhGTz06nrkn6/jS9P15/z6Uhz26+/T/P+eOKSTv1u/Lbzfl57rf1F/X9fr0EJIOT05+v+cDPbrjk0A9+cYz05x+HT8R2zz1p3/1/0/p/n0pM/wBOMc568Z/D0xzk8UJ6pWs20vlpb56X/wA+ladVbp8tL6d/N+flZDzyMnjIAPr0OP8A6x+hoB4BxjP07nGe3X/9VAIOMZ+uCMfy4OP0xSn9Rz6n8uvtT96/Vu3yVlqraK212vJhstvv6W3W+mvo0vUD9M/r+f4f5JwCZ+g44HT8T6D8P8KMdD+Xpn1+vNLkZxg9vp39uOn/AOvslfZJNqzu97aWXey8t+nnP9fLRL+v6SDP15+n+PTp/PuaXOPqP0/+v/8AWxSZAHoKASc8YHbPX8R6fjQk769Ne3Rab2W67NaWtazN9dv18l997aB1x+v+HsQf5UH8yDnHv/TqM/4Ue/8Ah/njn8zRnPr7eh/I/wA/w70Lfra/6ra3XbYf5r/gW8wzjB6e+enp+P0+pPFGR9Prxz2/Prj6HHNGRxn8OPUY9z1Pt6Gk92xnB49up+vGM/pVRvLzXXqunTa+nTbm6bDS2/4fW+is93bf111Wq9sAD27fgMf/AKxijOOnOP8AJGB3x2x/9ZCDgY6j39B/XPXqfbg0oz7Z79uf1z9f/wBVXq1uvOy81f8AJr5i/G/fvpe9tf8AP1D36Zx25Ht0OMe+ev5OGf69h0/z0pozzn/P+Hv2/Og5/Ht7+3I/l+dQlK66denRK600s7aLff0DfTTfd+dl+AD8vr39/wAvXHpS/p/n/PTt+dHb3/l/n/DnrSc8Dt3Pv7Zz16dOmOc1SjtfXTXbR6X6K703v8+wt/y/r/gNvawZ6cZ/I4/z7ZpM9wM/n3HHbn3xnHXFLwf/AK354z79/wD9VJ6//q7Adsnnt3pK6cbra+l9LaJfn3u++wJd1fy9Wtu71F3ADkHoCemeew7jpzn8O4oz7H/PP4fjj6daTjJ45IPUenH5e2fT1peg9frx+fH5+3vT1dummq1T6bf1pcNP0/Lpf83Z+VgJwM4Pv04/Xv2xmj1OP05OOP8A9XtSY5JznPHTI7+np0PI757Upz2x26/r/j+mKztfS783qrbX89Lb6bLawW899L9Oj9dH1f4BnHTPP17/AMv5djgUEZxzgZBx6kcgfXr/APqpf88YP60gIzg8E/8A1/TnjBP9OcU4qWj7Ss9fS+n5v7tgXkttdr/f0F/z/n/6+aQHIORznryOh7c9+P1oPGT19P8ADp7fn+FJ15B5Hbkcc8Hgn/ORjNON7rdq1nfpovO1trPrqCV/6/Ptd2V3oL1x+R7jvn/PP4djIxnnoeO5x1I6cf4ik9uev5dCB39eo6fhmlHU++PX36jAx+Oc4HtRZ+7ff12Ssvl6rX57FtNfX8tPXX5bq97hnnoe/P0z/gf09aAeox368nP09P6c89aMgA5Oeuf8MZ9x+lNycnGMdTk4I4/Tt0z9fS9dL/en6bp+jtba40r38r69Hqvx1/LrqP8A5/kP5HP9OtJyTntjPvnrn6Yo2nAHcdCcnk/kSD/hS4/r+n+fwpNN2vbpf709Pnprv8kJ2Wzv3/Db1+TWzDHQ+3H4Z/L0HTvnPY/n/nP9KP8AP6/5/wDrUnA6HJ59Oh4P5dPTgc9xKTfLppvd21Vkn/T7q+whf8/5/wA/XtTcg9+nuR/L+fPelyOfy/HOBnGcZpOvOeDjv3yf6nsewAyDinCPddPwut+ie1np1vrYaX6JPVWeltfT8NRcjJG1sYznP16kZz07jnPqKPUkY57fQfiR27nOPTAaQT+HTpzx1/lyMduB1pwz3/z7Djp9easb0V11ST/B6bbp3ejttfUP/wBfT2/Mcf4UvTGe/pzz/QZ9e1J/n6df89+3FHGSfTGf89+PrjjpnnBK9ui32urL5r56vskT3/rt/X/Di/5/z0pDnt/LOfy5/Klopqyabvv+Kt30t89PzNn/AJ6gCfpyf/1/5/D1pCeQPxPOMen1yeKWkPPQ9/TOCPp+v164pxTdtNE79e6+/wD4GuisGn9dPP8Ar8dhcgcnnGPb9TgUnB5wfqAc49iBnv8Az96MgnAPv+H8/fI6H8qTPvgDjn8u/wCYPTnkd60S0V76LbX9N7fPzuVbTTe633eiemnfazvqk90BOMfKScEH6+g4/wD14zzjAUEfQ+n5jr68dOf0oz7/AIf5Gfc+n0pcgdTihJpK3lf9en+Wu/YXRaa7XXV6aW+fzet+6e/T6/kPzz9Tx9KX9aTAPOcjt6Z9e/ToOfyp3Iz/AJPPp+HX1FTFt20suXzXbyVuv/DWuv8AhtRDyTyCR9e/fqPb3xn3whPPPf3xz6dR6DAHuOlAGPf8evXg+3Ofr0AHFL/OrAB3/T6enHH/ANYfmhI59uvX0Gffv2paTHTk8fr9f8/Wj+v6+f5D9V+m39feGfbnH4fn/wDWPHbOKTdyAAT69vf09Mde/fnhCccHJxznjp1xx7D2z9DTvr/h+fJxj64/Slrp10d/XT/g2HZLdXVtPN2X4dVs+j8kY4PTAyM+mOfx/wAgH0pePyHb27cHJx6dPxoPAOOfx9OD1PHf8c980gOe3HOQeCPTjvnn2/Ki23Sy208vyfb8Opd2tpr5vW1u+ia+7ougo9/Xj37+35e1GCSPTI47n0x17+2ffpS9P5e/+fU/nQM9Dxjp75+v1Jyfbk9aXZ6Lun3bTvbS9tde77skXOO/uPTPvzx+VN569Tz09OfU9e5P/wBagfTH+fajrwDjHt25+nHuPTg96m0m0nHS1vndN7bJJWXV6B11/r7unp8gzkDAIz36/mB/n3yQAhOCAOv4dPTpx6/hgUE/n7Y9+Tk46DHY9cEZ4UcdcZx0Hp7D/Oaa+zZdH6dNdVf8n521dKy31+fpq9vPd+TsGfbjGev046D36gADr3wcHPHf8Djp69COc9Rimk/N14wRxjk4z9emO386dnj6cHHr39/z5/SqTs1bTR2X3br8Ou707p9Ntk7/AHduqd7797IMjv29ccZ469vx684zQPXrkf545/z3oOCOen0/Hn/Pt7UuB6Y68A8D/PvyevvWV9tXZW9Elb167/LQX9eXT8X1+Qgz3Ofw/wDr/wBP5crz+Gf6dvx+v6ikOeMDPr/9bkUvHr/n/wDVg84/x0TldaeT6NPS/k/K3foN99Ne1unl0AkjB456Z7/5wRyOf5me3b/H9aQjPX8Pb6H1/lxx6oev5k849vTH4ZHqaNdPxW+um/pbe9+19g/r8ur29bb9+hkenXPHHPU//r9z9aXPt368e49fw9efrSE4PJIH0PXn2IPX8CKCSD04xknPQD29v8M1nZ6K26ut7d9L+W+/5Ds7qy16dO1rXtft1vq/MC3OMZ/lyQBn8+eOPpzSFhzjI69+hwP5kH1PXGc5pxI7+49uoyOuPw9j+J655UjOfoOBjnjkn3zTjLe67/PZdd3a7t97e4K3VXVtNXq9PXXVXS0/MCAep6c+n6Z/n70vI9jSeuBz+Wf0/Xml/wA/57VXvXTV0vWTurK9ujW68/k7z21dvy72/rUMUh9P6enb8aWkJx16fy/rWb1d73f57dPy/wCDYLf138g3DcQB75/yMDt09+e1L3/z3/8A1Uh49OpJ+nc//qHU++aTII79j0Ocfhj8/r1watX3s7aLva1r23v5dL2b2HbydtOl+357q9tPVCj/AD+f4/4enFBxnv756cj6j27Hr65NLn9f84/Psecj60084646n+gI+vX0xzRFyaWmmzv6+vRX/K2lwW+9ut+3Xb8l1FJAI+vAz1/LGf8APSlUk7uCAOSD27AtnGMDJz0BI/vcJ1JGPu85z0yfTjrn3B+vReeeQcBsZ/E46c5bk5xnPXNad/P1/D1/4axS0s2rO6adv8O1t3ytO7+Wo7KrkgfKcjkgggZXqOnJ6ep+oMgAGDjrnBOMjPOPX1GOwA7c0wEck4UrnaOQCQCScdeg7k9s4I4eudp5JOTxwPbAOQOuR2HqetJ9Er3uvuTV+u35vp1Fd2itV67Su1prdaavmflppYcvH3uecA++4ZBB/UZ6DHXFTDdxz2Jzxwcjafw/pUSgE9jgZAOcnGOxGDzgEnOOeO9PbP8ACQuAeueeh4A54H0x75pNu6Wiutb6dtrPf+rsTS6J+mnl2vq7/e7dDOTAJJ9v0z/T39enOZPc+n4flUanJBC9sE4I7DHftn+ZPUgSds98YyBk/wAvxx0okndb+l3dJcu13+f+Qb287L8l5+eltFtfQOCM9RnjqORg47Z/l0oBzjg8859j07+3680AAf09v85PT6dqX/P0pJWa0stle7f2Vrq9Xqlt5g/Lbpd/5df+BuB4GT0/wpMngjGPpnr04/nml6/5A/nScdPbp7dKEnpfor2bbbatt0XzffQVvJ9f6+XUDnIxx1z/AEH+fzFB56dR9SBn8fT3zz78gyfx/l759sAj6nNB46AnHI7/ANc5/wD1ZoSaadls127Xb0tutNL2Gt1p27K7v139Pu9A2k4GVHTOen8h0+gHH5hxnBPPt6/geOPel4P+fzpNoznoev8Anrj8B+Iq762+YXW21tmu+m++mnr+SABj175J+uf8j+tGOx+vf1HT07enTilGD7DPHGR3+vAIx/LtlP8APH+ef896hbrSzd9W7JrS7UejdvL5i28rfmH4H6emP09v/rc0dO2fp+PP+OOTS/5/l/n8KMf5/wA/Si0rrfXfV6fDdfPVL830Ovl2DAPXp9Px6fX8KQcA/icfnjp/Qdc9TSgYHtSHHTsf8n6fn3+mZSd46Wu7rXXZXvbey0Vuye+geXS/3f1+IZB7jnH69un8/wDCk49e3c8+nseePYnkc8kIBHGMjpjoM+oHr/nOaUDj/wDX35+nfqPwx0qraJq6917vbbo/8kvTQbS6X9Gunf5/0+51OMgdM8ZIH5/lxxS4BIJ/A9fp/n8ewppGOgyfc+vfI5zz+AyBg0AcHggdD054Ppxz7Y6egxUt7a25baW105d1fvZra/e4/TySsteib3ur/PdoUD8ffuec+3Hp2/CgjI5H5/8A1qMY6fQ9uPy5x2/Gl/z/AJzSTs7rVLv0vv8A5X/Am/4ajcdh+Htx6846+hOPUYw7qc+gwP8A9XT8ev5CjvkcHp36enX60En64HT8/wDHj0z9MbDvtb9OyT8rPz+YnJJ5GPTnIP8Ahx65/Wlox/n9OMf560nHX0yP8fr0/pSu9HtfRrTq07bdOys+1rhvrbp+Vl8/P1uGBjk8Hjr/APrOcfXPYdaCPwA/X2AHQ9gevXHbJ7ev+Tn26Dv1xjFBGSDk8du2aXvabLv/AOSrppdvr0Q4uzWv/A/4L266a+iAZweOD9fyPftz1/MgOwOeR6fXqf5ZOOp449G4BP0/px2/TPp060uB9Ppx9fz/AM8gU07rZre/fp91tfMV/wCtF29b7fr3FAz19+3bHuef88Un4dPXr1PPP8+49+qgnHzDk9Mcf/r6fz70hIOASeORgdxk8dfx7/1f9f1/Xe4ddfnbt1+7v89RR347cc9/frwP8fxTII9Dx7d/pyf6YyMEUoPQ4z6Zzxzn/Hrwfxox39ev19M9z0pK9lp0/Reluunp5h0f4f8ADdrfjYKTA555578jOcfocf8A6hQc4GMZ4z/XFGAevP8AkH+YFHb879v8xff/AFb7/TTpqGBnORnA9+Ae3+ccZ69QADGMcZ9fx/z7c9BSYByeD+fr659x9fpijb6d8559e/IOenc49qzs0nq9k7WttbZ33X36arYq+jV3rZWt2Vu69PTe72XgdB09B0z16e3NJjoQME9encfTjHsOe/qADGMevUjpgcY6cemOOTTiO/OM46d/15/HuaFdNJa99be6+V6/5a666aMW2z7/AHPo1638/lYTGMf16nHTn2/zjGKMfTGO3r/T/wCv7U7r/P6fl+A7elBJz79eP/rd/wBfWrS11vsnbpdW7O19NN/NKwhp9Rz6c/5/P/69API6Hn8x1HH+c8n2pf8AP+f8nrScZ6Z9fXH68Hn/AA9Els1bXe111T9LaWtvvdvWx/X9f194EDPXr29cd/5dPTnjFGeev4f570gAO7GMfQDpn35HX6nIyeKUAf8A6icenAzxx+XQUatrpZa2t5O1k77aad+xTSvrfRLpqtFutvLe+gAY4yP5/wBBye/Xk9cUhAAzkZ9xnPAHp3Hp6fgUIwRwPcjPoOmOR6Ad/enbR6dfbrj/AApxTSWndPvutW223s9t9O+iWlnd/JLutPwv9z66GemMnP8Anv8Ay/IUevB/x/E8H09vpijr6j+Y98H+tL6e3bt/kY9O/wCb1109Hfy6rt07+Qum3fX7v6+YgGCQAenHPB4wPp0546DrzS0Hr+vXPHbP+e3TjhNwJx3Gf0J/P/D8aS5tNEkrdLX2+62vl5Lob/d+QAcevORz2zkdOp6HP19aQDrk9fXoBjPQ9OM8c8Y47U7GP/1+n8qbgZPHPUZ9ec/0/P6Yr+mVvfXfXpq3bz0139NVoLgdz06/j/8AWz1IHoOmDjjOPx/n+HNGBnp6c4/z6fypAuMn1JIOTjHb0z3pK7s3o0mmrbvRdNFte/Xouy07/f8ALtt1f/BFPXGR7c9cZ7en0645OKMD0z255/z070AA9hyf19c4HfPP40EAfUYA/Hj1+nH9RSSfu+S1/Dyfby9UHW2vlo73sul9HdLZ/hoGMkcE+nP6kd/6HB9aXp274PH+fT/HjoA9D+Ocf0NGTz/+vP1/X1pa+7srLXrpePfrf/gXFv8Al/X5B/n/ADz/AJz+ScdfTP4etL6/h/n8AP5fgfn/AJ/yPT+ZqVzXj022ve2i1X4eduyQB+XX9e//ANek4H4/rRx6A5wfy5H1/HijAP8AT26dPy6UktdbpReny5W3vorvW/Rdno7Ldvvot+nfu3+DsIMHIyMegx34/U/59FwMDnvxz1yQR9fTr0zSfdxjvge59vyPHTHGTilAA6+vbjHt06f/AFyRzirTeie3S+n8qen4rr6D6X2Wll3aSTfb59QHb/P5cng9h9KWkHcZ56/5zx26fpTunXv/AIcfrz+XWqv8rPX5f5r8Hcn/AC66ef8Aw3caR0A4HfnnHoP/AK2CKX/6/wD9f/Paj/P+f89z9KPT/P8Ah/P8aWqa2Str01ur916fPUAz/X/9dJnsOeRn9eenT6YHGO2KX60hz7A+vXHP+e1SuZtPXf0tqrq3b8er6DXZ7X72Xz+QYBGM5x/PGOffnP1peM8tgfpx6/j6fQ0mB1GBnGSO/PH55/Hp34MA9QP8Pp7cVSvfVrRWS1Xa7tsunZvSyasCdu9v6vbp8/JPQOOTnGR1z6ZPFA447enp2Xt+ZOe+COaMDGMev68/l/h6ilI9D3zn1/P/AD26VHvabq3320Xw9Vtst182X0t07adLJa27adPzQnPGMYGOvp/n2/Gl7/57/wD6hQM9wRxke+en/wBfrz7YNB49c9+KFe602evfpfsrv7112Qv66df6+Qh/Xnp6f56++O+BR+Pt/OlPB/TP44H1Gf8APXCcZ/z24+mecf8A6qN901Zau19rK9ntbS7QeunmHHYjOOg7Dt/npQcHqcd+vT3/AD6H/wCvRzg9jjj3Pt/9fHQ0AA8kY45HUH0z6+nPT8AaEndddrNbdFs+y3dtGNW38/mttVt520dvxDHAwccDH6DuOuP5/Sg46ZH88noMZ6cjuOxoOPY/X0P+fxoAA5AHPp+vTt7kDPAqotu2ve213a1079X/AMHpqX22VvL+r/MB7HP6+vT/AD7Uv4f/AF/akwOOnH49OPc8fnS9PUgd+v8A+s/zqt7N6abed019zQg6c4znH09/TkZ5wfzo7Z+n6/XFFGevXJ9Onqc/pjpSTbabS2fqtr6Pby8mH4+vkB/M9ePx+mOnGPXrSduTxjB/z1+uSfrS/wCff8qTnOMDHXP0x9MH069KSk207Lrv6Rb0enp/TGv61S+5vZjQBnGRgdFI55yeD147EHIz7cuGD1PfB69R7Z9fr+PFJtBOf69McDGPp+HtRjtyM49z34J54/8Ar+vI3dJ+Sb0vs1ffXTTZdN9rNtPr2vpp0vtv3vptbtZRjJycZJwcc49h6Z6AZABo47epyTwMjryfbjOfYcCkAHJ7Hnv0xxjv9OmO3Sl469hxx9ccDv0/zmhPSK9E9PTv62v0v5oXa2rtbv8Ad+VradO4YGc9/X1H4dfx/wAKXtgD8R/9fjj6UUCmm3ZpWVuu262/TYQHtx+uPUZ9enHHp260mcZJ7f5/z6ml5yec+nrx1H9fz9qTg9ex/wA/oab1avtZu3o49A/LyFyB7Dtnn/639O1IMHjP1/HPXjp39+vOeTbjGeccjPXnn/P4dxQO+QBz/kn37/8A6qN2t79tfJ7dbfh6j09X56Lpbte6323v0uHHt+Htnj+fH1oP1x/h3P8A9c9D+IJgE49s/l3Ge/4Z6e2TA64zn9eP5VC1a6bv7uWyt/w2iTtqGnS9+3fbT879+2oYz9fb+f1/PBx1wKOOmOMfXgcEd+R6d/zwvr19vf8AWkBznGRg/wCRyP8A6/I57Be9dXWmny1j0+Ssn52SDVr0/Dp/lb0F/T/OaTOc/hkex9+OevQkcfkoyf1/HGfYfXj8OKB7Y9Se5/l1zz9OnoJO/VO3mtFbf5aadtV1F/S/Dfrawg79ux464PH4Ucfh27f4YI/TFLSHp0yecZ/Mf0/Id+aaTvHS1vk7aJtr+n5Av19A75yOwPr3x/McH14pB25AHtwOcj0IPPQZ6nnpyYz6HHXHbHAx3GDx1HU96U4HPA9MY/L2z39uaLN8utmn1Xa129b3166P8G+q76W0t2s9N/1032A89xjucZ4/zzyOnb1O/X+hzyD/ADGPwI7UYGc/j+P+PH/6snJgYx1+uT/OpSvbp57Nba7+aS79kx3X9fLXe/SyWll8wI9ecfXP+J7Y78A9aAMDjPTp9B+X17U7B/z+P+H+cHCf5/z/ADoUZXW6v8trfd06dib/ANf16IP8/Sj8v5f5+nftR+P8vy5/+saMDnnOfxBz/TFXeWjultZN7p22Wul7vvqAnHU/h+Pp+mMZzz+KjB4z7deh98f5HWkOMZP689O/pz7fQjpQQDgdh9Pw7cD/AD04ogtui++97O/bv520drJt9t/6ttr3b/PTUOM9c/1ByR159cfjwKOp+nXp/kdjRwOOOfXqfU+59aOO3J5I9fcc9PQ+ntWevpbXXbprt5rv07XBbrrsv08+n3dNg49vXn2xz+HqaPw/z+OMGkwM+/Q5J6Y/X/8AX3pwH/1/8n9PyFNX0tdbd129bdHf00WiEJk4yRgfmMjP8s4/P6ly43HpgqeTnafTHU9RwOnrzTSew5HAOcn+h7Z6njPPWng9cc8EKO+CRx+pbjjjnA5rb001v/VrFLRJWt2SbSS92zXZPpfTbew48ZOCUBxuLDBOTk8HqG7H0wQe0nTDdD+o6Yz+PTP4daaMDceo6/eDHktkdOgxnng54OOaMnoR1yR+Hr1/MZqXa8btpdHtqkr3T3svO+7dldjd9NNUuvZpO1uttb7qz2SHjaMhsYI5z6ZwemPXkHOcdO4mLBSvHU/z7H15OD26moF3duuOmRzzjIyMA9xncBjJ9RIyFyqhthx1APByvQ46AduvTA9E943a/wCCrPtpqvL9Bb9Or2f+FbJO3k7at6XasZ6ADIzxwfulef4R169B+PTGcye35D/PApiksAAMAYzjnJPGO2CeccZ/Hkvole6fRPXv01d9+l3ra2r7J20++179t9tXbX9A/wA/Sjn2/wA9f/rfjSDPcY/HNO4A988Dr+OPy65z6cURb0t0Vvu5b/rZruKwlJnvjBGRz7jtxnnOOmfbNICTkHg+w4x9eef89jS+2c9efT8hjP5dOnU07WcVpt3fk9Pu6v1vZodrf8P0dtntqn+YZJ4Ix+PTpnp36Y9RzxjFA/xxnrgYH+evajHHU+mep54/D64P6k0fXP449uOO/wD9eoUpetr9d7ct3qtrWWmt9XqD+XTb0Xr+f3CZOcEHGOo7/ocdwOv406gZIweM9uo9OfX8valGOuB0xj6/jnnBz2/pV27Wtotb+fLdpedrXWmm+wv6/r/gfIQYAx7f59/Q5z65zRSkfp9OD0/z68n1poOTxggDJ/w7fXI7fnSu243XV7qztondPa/nrfRdLgv15/z+NLke3A6f14Hrzz16c0mfQAfh6emeR+HB+lL09P5/pn+f5Vp6gJSfh16/y7Zz6H/61Gc8jsOevt2+h6/zJNBz1HX0zx/njjGOT9aP6/4f7v60Hbo9H5/Lfsg7E47Z9D06HHf+X4Uh9z6Z6jqOe4P5j6A0gB5yT6Y544+v6g/qeH+mfX6+v07f4ZrN3bXk7t7LRq++63Xf9R6PTy1XyvZ+q0drjc4zweAOcfp+Gf59OtKMHHOOx7nj+eOfr1pTjjgZHf6/57daKla9Ot1bysndWae197u9rK6YfL9ei/4L+fkHoPqfc/8A6uP8mil4wMDnv7+nf6dv/rp+A7f5/l/nqK7Xbfy2atrqk3pbZvdoQdvp+v8An8T/AEM8jA/Hj+p/XH4+h6ccY/zxgf5H0pM/hg+mc/gR0z/LrTTlfRt6Lr3tve+17XS+W4fl/n/XTXTyAg5Hp39T+A4/z6cFM57HnjB9PX8+o9Oadz6k+/8An1/zjigD/PNUnJW5uq6taba9PTXXVvsP7vK359G/R/kH+f8AP60gwAO3Xr2HB5Ht6n/GjGT1x+A/LoeO/wCfXgU7tk/l+uT7fz/Cn7zto0lu9H21aei1vZ6+SFfS3TcaMZzxyDznt+fb/wDXS+4xgccdef6c/qOaXC54wAPXj16Yz647nnPrhcqQMAZznjAByfXPAxn8TTV+v4df8gv/AF/XYTtnPP8An9fX8Pekz+nrS4wAfUnnAzjt+XPTjkc56J/n/PrUPmVlqmlr6re+vTz63AKTJOOCeg/zn69Bn86Of89f/rfrQT09/wBP1Gfw96lSlpZ/j2d92/6WgCYJzk5B9z7Y6Y9P/wBXOQ4Ud/w9v5DjnHrS/wCcf/r7/l1pQOpz6f1/Acfj9eopOTt+Nt2tPu62enl5u+qfmnZbXVunS/ew1RySO+Mj8PXuc9T9c89FyBk8Dkg9Oo+nX2oxnHOOf8568f59qX+VJ3etnt1dnZWvfpbXRq3dib9bforaf0ugZHr7fj6UgYZ9D6HjPb2689O1L/kHnt6UZHHHPPrz/h+fOPrSSd1ZNtW02e6/z+77g38x3Xr9Rx16gAYPPtxxyDwMUzncD2x0Pf19PTGcn6cnC85PHHUHpk/T6H8M8daTp/n2/X8PyrS73sr6XWul7addFq9btd9Q/r9QIzj65H4UYz+PcccfXP8AKjGTjPbkdenJ+nUfh24Bo9SOT0/Xkcn64Pbt7q8vd0v3v8nfys9Fp99xr/hvV2+718uwY6Y6AEY/LFA/z/nA7/49xS4x/P8APp+n+c0gwc+3B4/z17VKcrp9m9/K179Pm1fv0Evv0/y1/ruLweOvt/KlHbp+OO2euf8A9XTPsgHtnrwPX1/r70ox3Gf0xz/Xpnt79Kacm10769NG3tu79GrXvprcDODnp68e/wDn09PqmemPcdj9f8jngemaP1/z+f8AI0mO/wCGfzHfjucfnRdtrS7Vr21drp37Xfl032uAhGWJAwO/PX0x344ycjP5049vcflz3/znp1HNJ69eP88f17UY9z1z+X58euMDH45pSbtrunfdO9ld7fh1Wt7bN369Fpv5bfn2/AOuc56/l2GD2yB/Ojkj+fseeO3OfcfWlpMjOO56f5/x9fpTTbeqs9d9+l+m2u99RCYyOcYxntnPU+3Pt7460oG3jIOen079eRz1/oDSk/r7D/63Hrj8eBw7IGFwCRknPI9ODnB4xn8KXnr31V7bLZPtf0+9Du7W6f1/l/V2NAIxtIA9Dxye+Se3OMZ/A9DIzngjPOfr0PX9c084PJwDznr+o5x6euTkdOUyOeO44/Mdcewz3P04qv6+5r+v6Ytxvfk5A4A747//AFs46n04OcnPr+X+TSk4HIHAzjGP/rntyefwzlM/yz6n346/h1FGt/LX9LfqH/Dfdb/gf1cQ8A4OOuCenPr2/nR09Sfb8T0/QfhyaODjIOO3GSO546d8/Xg80AdOORwP8/yHOBR/XoPTzur30Xlpvf17dtwH5e3p+GSBxjp/+oxjGcnHQ9/5fn69KMZwNxABJ7Hp/XoM+vXmlGM4PQ8duOMfl65/DFSvs/4X/wC2/wBaC/r8v6Xp96cevf279Mfgfy9c0vH09Sf88fqfT0JQP8/T8cc/yNRd3V7221a1Wj/HS93qtG+oACM49B64znP6ev1xS/0z17Z7fX6Dvntw3+eP5fl6+op3qcDHT6emO/8AiM+9OMrpK1+v/pNul9LbJddbgJ09Oe2OfT09+3TqaDz+Oc0Z/wAOnv8A559PajJ4/H8P89MZ/rVRtZb7dX6ef/DfPU/P+v8Ag/gIMgcnn/Pr/nv60c8evGffg8/n9On0pCMjnPHPHX8M9Og6d6B0zknjrg89MHA59j69+MVDbau3s9FquzXy3211WupS776rTlX/AA3fTRt2fouO35jJ+uAeOBnH6HpigDBAzgDr3Pf3HB/p+Sgfj6+vr/j7CihSenVpat631TfTTbz0Ju+/nv17/wDBFGM9R0z0+v6HHHHtg0nA6n0xz1H688jvx05pfr/nnv39eMjt7UuR/dGBx/kHI6nPfGQProuj202+78gGk+p/Xp9c+w/l6UueOvHbv19PT6/l3pAc5GOQMn27+uOnXr7UvXjv6+w/lj8Pxxwle6fk+/lur9dbLpp2AB7jj/P8qaBjPHBOeP8A9X0+mcdAKWkP+f8AOD/n1p9E/K+r01Sv6bf8OHf8fvQhByP17dMY7H36Y9KXjp+HTI/H0FGP6+3bpnt/POPpRgjqc/y/ADjqP/r+uSb7PT16W37W0TsttHox3utenrd/pouvotegckHGPxz+f+HXp+SEds8Dk+vrnPbkfln2p3Pb9fT/AB9P85UY6kZ64z0zwevX8sducU43bXk2+nlf+t1e4r/g7/l/kNAAGB65z3/ngfl/9dfb1/z+FAIPH48Dt39M9u/FAwM8Dkcdse+P8aer3bemqvtotXa+jb1eujXbQd+v4hntn8O/+T39aP8AP+f8/nRR/Tr/AJ/L8+pqVfR6tLVfK17dl/w24f1/Ww0A555PtjHp354yTxjqevFLjn2+v1/PqPf1JxS/TJHr7Y+p/rSYyQSTwOg6E8f/AF+v/wCutXy6LT1Wiau7O1rfnraw99/6t6bbCe5B9PXA/D1x9c+1KOePbnJPHXoCOeh+vvSj/H8+360fUA5xjP8ATn1HX/69JN6bW1u9bfZ0d72XTf163L76b+fp/l3/ACAY5bj0IOe38vXqM9fqA8dufzH5H3+h/Cj/AD/hSgqAcjk/X8zz/LHA60Jt2Wiskr3TtrHbTV/P0SYhM9vbnHf0yM+vr07dKUHHHbOfxx7f54oA7+x79+g47ckdfejHAPv0/p+v098043dtO+t7aXi+ulrbJb7ANwASxPXp2B9gB6+h9ulHPr9P85/T8fYB78Z4/P2o/Hnr+GfQflV66d7ar5q/3f8ADD137bfK33+nzYduhHsD2/Dp+B/PpRjHA798889+f580i4IyMk++DjA/DJx644HvQOc89Dzx9cYxx2PqSODU3ldXT0Vur00vZX6X899t7Gq+T23Wnl+F/wAReCcH6HPp+vrz39R0yAAYHYf5/n+XUCnDGRnn6jjIyR+uKAOc4GOAc/j9Pcj0qVf3Uk0k9te61tpprt6iDOPx4P49PUdQPQ5NAI547Hn/ACD/AE69fRRjnPQZ45HPqeuCTjPufbFBI4+Uf5Pcent9OccVSvo/J/Pa76/ha+/UAGMd+nXPv0Gc9eM+2ffLaP174z19v89KTJxzjP14/l/+qhS0jt2t3t81bb8UAYyO/Tkj/Hikx79ORnqCP5g//q7YXPoe3bnr3457j04z+BjPf19MHtg+o9s59+BUpy0su3q17qeyfk72v5j1/wCHWnT/AIHyAfl7DpRgHrz9fz/r/Q0vbP8ALn8vWjjIB4PXpnA9aFzXW+lu/lv8rJ/K/mtfPT8Lf5C8c5z7fgPp3P8AM5NGQD1GR0Hrzx+ZwP8A6/VP89zn88/rx6elKB04Bx0PT8M/z79gRVRbdrra+mi6qzt5NNXS09QEznjI4+vf8ePy+vrSjLHH6+vfP0/XrkZ6nHHT8OuM/l2+v4UcAZPr0PHH1z/TjHPoXd6W6q+/mnrp20T1evzATvnqT/n8/wCeBmj6c+1HfGenXHT/ACev+eUI7jjrgdv8evXntU6txvunfS2z6u2ny80w66+X3f8ADBx/ntj+XX8R7UdM475/P8eM5P4/QcAHX8+319/x759OKUkZA9c/hj/Pr6e+Hr7vTW9u97X3+em6006jV+l79Lff8xB78Z/H8OvYc46Z/E0gIPQEY7Yx6fh/Wl5yeOB39T3x37jt60o5+nb34pK7s+t1e3Z2a3Tvbzu07MXr277bfppboHAx6nPB6jv+PY8f4UMTyTyf507ge/ft6kc+/Q4wfQim9vx4/DqP1zn/ACG4u2+miavZW0/G/a/lsC818v8AhhpbgEDHODnt2zz0Pcdv0qTnBZSBnIG4Bsgj9M9MjPfggE004znp/nj9f/rYpeMY9sADr1zk8EYXHqDjGOOKrytpb5eg/wCXT8tfv/XT8W5AcFwygNjuw57dyGHfjBAxgZOQFBbOdvH1Ge3Tp+Rx/Sm5JBxkkc7cjnOR37AdPcdPV+fXqf8APfrjv/LtUyd3trurtLl2/J3d1ft0bB6WTVrPu/LS1+vdb9LWFUqck44HBJ4yfl78Y5IPXjPGDzMWzt9zxkAnr19M89Tn0x6RLkZHABGOueMg85BA/pyPQGYqGIBO0c5OOg474OD+B/LNN9L799lZNPXbWyv8mO/w6aJ3/Lr1fz+SKGcY98479euP88Y9qTAJzjnn9P8AOc/rimRbyimQYbuM8/1wevvjrmpP8/5/z+PpLS5lZ9b28rLTy019FbyU7denTz6f5hx/n9P8/wCNFHT0/wA4/GjOAff37c/h+fTt60Lm773d31+F7LR26brRXswDj8f88fQZz070Zx1PH5fT/P8AKmjjPf8AzjHsRjp06dBwFPOQRwcf0+h60cz0tulrtqnZ31/rq7ajtZ66rRvzWm39X9AHI6cdMEf0paP8/wCTwaKhOzWtvTt1EHp+v+f8M+/sAAfj6k/nyaMD8/8AD8ePUfyNGB6n8hx198HHbP41Svpaya9dfhvdfPXzTAB+f/1qABnOCSRjj/Jz+X8qKTp3/wAT9fX/AD75aUlZ6q13r1V1e6ei6vzsAp6dP8/n3/oPejqOfTofp0opoJ5z6445575647ewz1zmmubS+u2nW1lr30e/zvpYaV7+X+dhRgYx09v8/r7cnNGeSPT/AD/n60emBxznH/18d+49PelIyO4z0/P/ADz2x+IXM3Z7L5aWte+/y1v231PXr1367sKPoefz+vHekGcAnGfQZ/8A1fr1pai708tvK1vLp1F1/p/8BiHHU9ufpS579qQjOeTz1/z/AJ980YwRzwOPY9vbHb/Dk0dt/wDh+33/AK9QF/z9P8/55opAOeD+Gfr69Pw9OKXPpz0yP69eg59zQu6e1tLvXVdNOqXoAmNvQn16/wAs989enPfpSj3/AK/y45+vfjOM0nOcdvrz9f6cHvRznoMcY59+/wDP9B61Su2n3381pdafin0tokhvz333/rX8uwozzxx249uevp6j19qBz9P69OvYZ4/xo49Px/p/L/6/QKADwWK/Qfj79+enNNSbtffVb67pXeu71a+TsL+v+CGF98jP4ZyB68nGc+mQKMgdeh7Z4PYZ59ff6CjAI68+/HHt3P4Z9MeoBkcknGfl+o/LsT0P+Du3bdX7W1XuvbXpfTVvtZtALgHHOPXn68/z9+nrmkHTnp64zz/T3x+VHGOpPYZ+ufy5OO5IyaAB1z68fgcY7cnr/PoKL3d0um/lo9b6L5X3b6AB/P8AyBx+Xt6dqTOMjPt+fHf1/wA8ikJ6gc9vUdcc/wBR6dqM56e+fqOPb/I/KXJvV6dVsk9vn00d+llsNL9deitv/S8hf0opOT7c/wAuf/1/iB60ufw455/+sMf09TSs/La+3TRX1W973+9d2g/l/j1ox+v4UYx/n/P4djQcAZz3HQfT+vHT8elCTbXR+em1unkrdPvD9QA9Tyf5A4AHTPB9PTnHRRjBB79+eO/ufTp9MijaMA7j9P8AHBz9Oee/UmkwPU8Zx39O+M84PJH8+K1vfrbX+8tL31aStrd2vdaAH19OP5/5/wAijjHTntz7+mAfrQeKKlc26utE2+yVrdN13V327sD/AD/n9PzoGfXp+v4d/ft/Kk5z/X+WPpz17nj0Dc7s8Dg9eOmfTryOo9M/SjXo5JKzb7J26fr1vew7fdpd72va9/x/IcSRjA+ucYAHr2//AFUfTGP/AK4Of8+uaMdyT0/+vnA7/wD6qWlts3Z/Laz+9f1uIP8AP+f8/wBaAoA46HPr19PQZ7e3OBQen+Qf0P8Ah3o7dSCenv159sfjz9aqN9XfVa2d+61dtGmvm+1wCjP+fy/z+FJjAx/n/wCt+GMdsUfXpznOP8/55qVvZPe3lvb1tr+QCnP+f8/56Ugzzkgf4e//ANb9aCO+M/lmkJOAQPTI6fXuev6fyqLldJd79r35d9/W70s7Avlr6f18xcg4/T6jOf8APfmjJPQ8dx78c/UDP9aAME479R7+uf6f/Wo7+gA//XntjHqO/BpbNWumrNeT03vb5tPz0WifXT8dfwtrb0e1xfw/Lp/n8Pyo47j6nr9Ovvz1+mKKKOZ6PTr09L3+719FYX9f1/X6CjHv36f59Mk+vt1oAHf8vbHtyBjvz7A4pBj1/E/4DvSgKcHcemCMdxnp78ew7+1Wru3Sy0817t/l1XfroAZGSCemMDrwT7Edvp17GgkA8Dj8Pf1yBgfyz1wKQgA5HUjn8+h5PHAx17Y4pCeQo5J6dfz/AE6dTVhZv+vz7LzegpOM/gffH5Z+hGM+noDjHHp7f4f0PtSH0wemeDj6enX/AD1oyfTnJxnjj17/AOccAHNS21y627r5q/loH5/h5fqKTxj19P8A62On4e3Jo/z/AJ/z3pB7j8fy/LP9OaWs7vR7u2667Np97bP8QEAwSfXGe/PNOXrz056njnPfnH/6sUn4/wAvy6f/AF/ejAznJxjGOPwPJx9efbpk0LVr5K3pZa+oBgd/89v5ZopMdvw6mjH+ev8AP/PJpff93pf8/wAu4C0n+f8AHp3/AP1UDGSMkn35x6f56nrS89v54/oaE+V/Jfo/P9H6AITx0yOeMe/+fr26UZwD7fy/Hrx1Pc570Zxx6Y9uvAH6H07D3pfyHb2x+A9Pb/Gnq7bad3skluui+XrfQe268/vs/wAu1nqIpz2xyevH+ff3zS/5H+f8/rR/n9P/AK1HHrz1HXn8v5Hrg+lFn2aW+mqt19el/PQX9ff/AF/mFAGT1x07nH+fw+vHQ7/04x/n9KUDP079eOv5fUc/U8UJXtpv0tpo11tta93o/vACQf5n9ex9evU/Uc0dccfl6e/HX3/SkwOuT7DH69f8fbvQe3OeOnP5ev5epq9d9b9kuiav321s1ra3ZgJkHv0Gc9uOg/THp69KWmhgBnHckj9evrjnHbvwDgBznjvwfwB5/Dv+eDxVa3Xps/l+nbR99htNbq3zXl/n/VmO/wA/5/z/AEpAQenSkznK9CB+XA5/Xj+lLjjHAPqBjPP4j+lSnffSWmlt49dXf7t9PkFvlt/X/DXfl1S/hz/Qf4cml9M5x7fn/X9aOn+fUcH/ADz6eyY464Pbv35+h9M//rlyb1663T2vpvvfW677dd1/X+Qd8/h3/wAaBjPIz/np+PH+BpD9cY5/D3/X/IoA9ST/AJOOOn1/PGam7VvLa68l38remlgFxxj+pz+P+e/4Uf8A1+v+T+H9KT9fr/8AWFB6H2H+f84PQ+hpq7a30a6PbT8LW1+8BfXn3/w9Pf8Az0bnjJ4/D19geo6Hv16ZoGRx16n09M9PcnjB7dOKB0zycjOCc/gKE7W7K+y0d+W6d9fv06dh2tr93ntdarz6oBjjGcc85479up/L8ad14/X6f19Ow70nqPxPtnp256d6BzyDwenp+vT+XXvRdrq+9nre6V/W+utlpbqD7/nrvrrf/hmLx/X17f5/lSDoM9SM/wCfpS0YHvn359OnPH+T34S/rS/5iCj0o455J/Djt06cY9uvryaP8f8A6/4//WOaNU9PLvrt89bJ9AFBwT16dv07+3+HPIT/AD3/AM9/880E56n659B/nr+NNHI6YB6fz6evcdemapN6PtZO1+6uu13pta+t/Mt17bi59P5H8ucen688YpTyQTyR0/8A1dD170hJ9Prz/LgZ/wAaMnsOfQ8cf/X7Zx70+Z2ja3bp5fdvt219D+t/kL/n/P16/WjAye/Oevp6Z4H5Z4FA/wA5z/8AXpQAec4/HP0wOB7ccnrjvSV7prX0v05U12267fhYDI4yCf8A9fX0x17evJJABgZz1/TjjrjOep+nWk25AO45H8P0yT6cdzwR155wFwCOpGPbP9fX1x2q1rbbby/u9P8Ah+muwAMckAg4HPPHX3PU5H0PqMFP8Py/yP5+tAxjIJPH8s/ie319qOnPr6//AF+fb9O1Jtu1k13W99Y6dvPWzVr6AGQOpopM5GRj3/zxj8unal/D/P4ZrP5a/irW+7rv+lx/597f8N6v9BM88464H15zz247cc5HvSjn159j/h/Sk69gR1Bznn/Pv9PZemSeAOvr6e3fA9eaaeqdrd306b6WXn5v5C/r+v63+4QDAx6fz7/jS0YGc5PT/PGePzpMe59Mevue+en/ANbuvnr/AFrfcBRx9OwHGPx5/lSjk4+v0HGe/wDj+PFJtJB5Pb0H45x/+vPFJjHc8H/Pbp9fXjpw4vrf4d0l091emum/r1AOgwvH157/AIdvz59TRweDn+XI5GPbpn9D6L/n/wCv1puT6AZPvxxx2B7d8dhkmqTlpt3tpqrq/Xbrfe70TQ9fnv53/Njv8/5/z3PPSkzkhRjJBOT04xxx35HoOck0HpwM5+mPbI7j1x/Wj+nT6f5/lVK7vdet7+V3Zp7N79Xv3EL1/D/9Xf1Gen0HBFKMZGfUZ+nekoI6/TpwcA/155B9uOtQm2+9tXoulvLfonv003AD+XrRnHYH6+mP8/5HJgDuT06jH19uO/19AKMDrntgDqPr6fjn8KE5XV3stdNLaXtpa3Z9beiAOPT9T/jjj6Ae1H+f8/hj8qMZPJI9wc47c89M889eOoxR+R6/r/niqS18t1ZNX2adtl28/XUAPqex7Dvz9OuTgfhjFIdw3fkMBRnOO4znA6kjPqeaAQBlRkDkDBweT7c+/wDSl3HH16j/AHQCo6HB5/ocZDGytVa+zaV+20tnt5t+63exIBktyMggnnkEjJGAG6Hn34wDgmngnJB6jGffIqIbfm5GWxkc4XqQSBn6cdM/UF45yPvLk4JIPOcEDHPHIyeemD1ypJ6aWSavfvps9Nm/J9Neo+l/J/eo7Xtf0VrdHYlTBJyBhuDnp6jIwcjAP0785FTKBkBueR19iMde+R3zyeB0FRqCMjIYDsO4LDGR0467iewHQg0rLkoQec88dACOMn1HpznJ7YpXV7fd0T0X9WV1o21cWnV27Xd+1lbS2+9tbaXsjPVwx4PbPPUn8Ac9OoOOx5p/TGefoPx9/wCp/LhkYXOAScAbuckAeme349AOo6KxxwOe/wCH4Zxn8RSau49ba/ld67fL/MLXei6f0/IXA/LjAPt07frR0HfsPfP1z+vr3o4ODx9f8OPz6fpS8dvX8h7+5z+H40o3b9Frve2lnbz012Yeqv5a/P8ALUT2HQY//V/L86X/ABx/n6d//rHCKQckE9hjt+p46/mPzX/P+NKzbS8rvo1snv109X22FsHr1/x/yfX9aADkYznsP6/56UUmcAdwcYx3P8vpk9/plJNvRb72dtrddu173WuqDcXvjjnpkgf5/wA9c8LjI469/p+GCD/+vpSfX/P/AOrj/wCtTCw6HIPJHX6dj359P5VpFbaJaP8ATfz018/PQEr9/krjvz9B/ie5/wA8cZoJ+YDI5ySO/wBfx/xoBHPr19MDPGfw/HnJpvHU/ng8emDyB9Qeeuafa+9v8rspKz17bWvul0ta6ur36+tx2cnGMjseo7/yx9c0A55x69cf/X79vbmgEDjBH+PbkZ/LOcDsOaNwyAePr/nn8M/zxm077O2ja1SS92+lnbW17N27Ca10W3z07vf8NBenT/CkJOMc49uvP/6u5ApQOw/zzk9T+v40mRnHc88D/PWlaXaX3P8Arog66a216/0v61FopBnODg8Dnvn6f/q/Glpfdrb9H8uz+Yg/z/n/AD3pOeMfj/nP+f5pkDHIx9fr+QH/ANbrigEZyc+o9t2MD0Izx9ee3LSd1dab7LVK3pfp/wAHUaTfz8v6+fb8BTwO/wCGSev06/Xr3yMmk4znvj0IyOx6H/6wJz0xSZAJzn15HTrx7dfpjH4mR07dj0wTyPoADxkduM4pqNntK+l+i6P579N9Gt7lJfK9tb9+W6a+d91fppYXOe2eB0I/p+HPTnkjrTqTgHAz+Pftzz2wM/hzzytL0VmreVrJdNl6vvqS7dNLa/gvXZ3e/wCIUZxzkDHr/nH5/TFFH8v6/wD1v84xylv+dr6LR307fn0EIM4wevr/AJ/qMc9+tLSZ/wAP6f5/w5CEjv8AkfTOPyPbOAaaTbW/R9dlZafhttv5glfRCnAHPIPuPb6cc9ex/RMD5Tk5xwfY9M+4z/U8UpIHXjv39/8AOPpimHaTgE++ORgdOh6fT8eelxTt2Ttdd7abarvqt9Cknp03d7X7J6fn32ei0eccnAzjkkdv6/T6e1APpkDqSehHXr/9cDoRkCk456/LwP8A63XPQcEZB/Rcgfr0/HPTvwfelbRaJ3tulpt5XfZap9tdR9td7La/RWsra2Tejtv1auBzjjvn8OD6enSl5wAe3+c0f5Hv/nr3+lJznpxgE+x/r2FJKWltNfJPfr1tr+GuhH3fh/w/9dxaKOf8/p1x19+PemndnA6euemPzz27Yxx70lFt7O2l/wAL2ut/616i16pW7v0/4e29u47vnP8Ann8vrR/npSE4HPp249M4/P1z6c0gYHvjvz+I/Dt146Y5oSlbT8N9bfpbr01sOzeybFOAMnGBx/TH09qTcMZBzzgfXHTp/j/SkLLx1/w6decjoDxzkZHuuQc88jGcfXgf/W/CqV1pZ3+5aWV+t9NLr7tbjt3TX4Kyt5X6/fZJMO2cY7cenqORx6E9OvSlBHbvzx0yffp059cc4pABjr1zjPOc9eo7/iDx60vfAxz6/wCe3Gen1otK60e762009bN77tvXRidrad+/TTdbevn6C0c/5H/1/X/D3o/z/n1oHOcds5PQZ9On+TjGeamzd999evXvs3r37vQX9dfLfy/rsH+f8/l9KAPf8/8AP+J9aBkjkfXnp/nj88cmk4GTk9uPfr26Z9+uQO9CTvtZ3+TtZWv06u+ru9NbAl/X3L+r/wCQfy9fT6/5/KjIHUjn364/IZ9fy9KQkDgk/r/Pr39c/geU+XAGSc57dwMZ/Ae3ofcuMXfqvTTt/wAO/TTytR662fb0v1srfqtLjuDz+HQj+dA4xjOMdO/5k/hj+nRuBwdx/HPOcdDwefy/WlyvHP049PT2OMccHoPctro+ibur9F0ejbvfuunmrX2bfeyem3fcBnHPA7dc/j6n+vPPFOAJ/wA/y/w5NJ9Pw+vfP49/rn3CcficfT6+1Q/6/rXcnfp8kHOfQev+f88EY6UuSTnPPrRz/h9f8470c4z26fzP4/59qaV2ktel+tur26+f6K4IORnpk47dzwc9Of69xmlHHXkdx05xwe/Tnsf8Qn/9Q5wM/XPc03cPXOASfw9f8/zGdkrW9HfffTv6Ds3sn8tv6+YvfPcHjt64x19cf0pMjnj65x16Y9+479CBQSOhPUd8f/qJ57ZHFGVGM9O3XvzkcE85680tXbW3dbbWv06Pp1vvYaurPW7281p69Oltteya56enP19B+fp1z260g5B4P6j6Y6fT/HqT5c5Bxn265x25xn14yOc0v45H19Peou9Gr3vu9LrRa99bLRtvr0Bq3fyf3Psnp37/ADQoxx3A6UZo/wA/5/z/ADoHbIH4/wAu3GRyf1FPl+FW13f4XTX/AA3nqyROeMdTj/6/v/kcdaXj8+v8vz/+t9KNpyT7dM56ZyR+X6deeTjB659h/n8ODnn0oUXpotle/qm7/wCXWzAB/n/9ff60n0/z79OaDgdfwGPQjp7/AMscd6TIPU/z4I688Y69e/TvSUZaafK3a29u/a13bYaV7b6+XTv5gNoPue5z/M/Tp37ZoOOnPc55PXsPwzj09zSfL0z64z759eD35/A0uV7kkYB9vp+Oc456DoAKOt7S/G+nLZ7a+aenZ7FW95Wv0trr0Xz39H0elgBB6en4fT6/hx688qRkYP8An/P+eeaTp09ux6e5xnOOgJ/Cnc57f59eDn17ds96Vru60V7p2vbrsu10uxL36ra33Ltt8ttrIB7Dgfl1xR/n/P070uCfwx7+wH+fp6U3n0/r/h0/D6+is7aru7fde/z9H32EBz698n36/wD1v8aXnv8A5FJ26475HPv6c/lSAgdyc/XOR19/w/IU0nZPXe+z8tbrpZevk1qNLS+9vJ/i+3zv+YuefbGc/wCfw/X0oBz/AJ/zj8cH2pAUz1IHBJ4GT+n1PbpxyaTI5GcdMcc9uh5zk8jvyT71pHpe+l76Wvtru+llfXXtohpXdrNbdHvpf879PlsLk5yOnpgcYPOTnk9ego6euMj8P/rDHJye+aBjOB6Z+n1PvnIzznJ9KX2yfX/6x/zk+p5qnd2b9Guifu+vwq1vLqkDVtN7Wb6aaJL8Xur9RCO4+UnHJHP0/wDre1OH+f8APSgA+meTj/Ptn8sZ9KOfT9e35elZvmvfVa9d3a336JWV9Uron+v6/wCHYnPpx6/0xj/PFLRR/wDXqL+S/r10/rsH9f16hRznr6f5/wA46U0MAPm69PoR3/Lrjj056puXPU+vfH/1/UdcdjVJO9vR6rSVrbffvbXXuUou9rf8FXWzf5ikgcE5PP8A+r06etGQT2z2+mM8evXnGOOvbICpyB+PQe2eo54HQdT2NBIPQnvx0P0x7ds9R1FWls7Naa33vp6b21b1fpoNK1t13u9Nbbrs9Vbfq9Bc84wfr1H8+PT06etGfx//AF46+3ejryOc/wCf8j1pfX3+v+e3ely6JpWdr2a3s1/wfnq9VpPqtf6vfrr6oKO3+R/LpSZ4GRz049ef0P8Ah05pcEg449T6Z6dxWaT7b3/D0vdf1uL+riYwOOT759e/+fxpR79aQ8cc+nf+fb6mjcP/AK2eef58emfQZoV+n/B3X3eT06q/Qdr/ANen9bfeHP6/pj/H6UhxnuTjgeuT+XGM/r24Xr3Pbp6HPP4j3+hzg03Kk5PUZx16DPPp6+tVFNa2el9PS3fvd/oNK/S+i0Vuu177X/DdWQ7Oex9uD257gY5/Ckz3xnrjAzjp17g+vHtz3QsM9TwR275/D0759uhpcgnIJPvggDuc8/rxnIOOOEk9N9ey7crvpa3S7S6dQs0rvbqvu2fd9dtmLnJI56fT9fX09uaOc9eMYIPt0/z9OM9DP/6u/wCuP8il5/D/AD/9ehdO19VvpdXdu23zXoTf8dAAyRzgH9Pr9f09fQIzwexzn3Hv784/HHNHQf5z7+v4fkPYP+f/AK2Px4AqldNdXqu2lorztb5S2YC5Iz7jp/n/AD6U3P6c+3t+HuPT8KQsBj9R3/z/ADpMqe5H59M85we57nHUU9Wk2mtem2lns9ttLfdqk6UW+mn/AAV/n5eugoORnkZ4Gf0P4/X6e6nBHr+OOvHHvg8Z4ORj1CZGfz7dcY79PxPHXkDqmV5+Y898dhx+BPOBzznHurNvRWVk9n0to9nv30f3NOz6JrW60fW2l10Xe9/JMOgweeOfQd/TocEHr7AZwDnqcFevbJ9Ow9B1/XjACDk9sY+ntgnAzgdsdOecU8YP+NFndaX66u+3K2/Jp6XWtltpdp6a2vrZ7WTsm7W2e6v+oD/HPfsf1z+XPel7dM+vXA69fr/T3NN7YH+f6f09qdg8ce3PBx6+p+p/PihKSs1vbrpbZa69l2v87Eienv8A55pP89PU/wBP89RS8/hyf8//AKu1If8AHoeuO3b/AD1OOs22dtFd/JW6W1Wr1um9LgHv146f5/z+tH8+cfTIJHb6fzPNNyOhJHpkcg89/wCp7c5OaCVPGTnn1wPXOfy/E/g1F3XXXfVq1lbXr5fjoUouy0fyTfb089l+aF5yfTHA9fx7emPxpevPscf16jg9sH/Gm5Xrk88ce+cDpn1I/wAMClGO3I+vPXPPA9enHfA4xWj0WnRel7Wv37afpoO1kraO2umq+Hbz1+d3ewoPqME8/wAv/rDn+XNLSDuceo/z/XvxjsKOccY/z19M8/T/ABzTk2raa3XSyvpvdaXsmtX2toTo3pp66f5/mAABOM85/LHJHfnvn8ad9PbjGfXp+Q/l3pDntj/P4fh/jjk57jHt3/H0/wA81Vm3e9r2vb5X/Lpe+nmxN33AdMdffH8vT/PNIQcfLgf5x6fSg9D/AJwO5/D0/WkJHY+vf29Tn1H/ANfBFSubTfdLsraWu/wtr9+7Sbasr6/L5+XcXnHr1Bz3I4/DnrwaM9OvXHp+Pb9ODnjJ4pBg+2MjAwP5Z54ODRkZxknk8+mRkeuc54HPfk4ArRXsr9l/X332Czb22V7dbf56/wDA6CjP+fx/l696cO/pj057fl6Z9O2eKYTgjA4Jxn+nc8c8ce1Lzn25PP8AnrnOB6e/AY0tY9LtWe/Vetn/AItNbaEq8hs9c4yMYP8AFztOflbH09sEl2OeBnPJPGOx+v0x9TzTFAwxHCqMlc5HJ5Bzxg43FTxjkU/OOwA9h1z6AfhyfYUpPbV7W0t0te6/H3dd7A079VZq217Llsuurvr6u2quSqe3U/xDOcgkEjJH8+wyegFKZCvu3YfewcLhTjJzkgYzg8kchqRDxgAEAA5wMAswHqM4wCOuByMHAoVcEbuT3GTyePzGRzzjLLwSeDqtr21+W3na9/LdPcS3W29/yettbd+2vmZ6LtByCM44J9evGTzz9Sfc08njPPoeOvI7H1GcZ6Z656r6YxjHJOM4A45GB69BjsAKXHGc/h6denY+pz369qUnu2np3VusX8nf8n6B1XXbfbpp8tvPsHoOf8/5/H8DSd+n459zx/npnApcenYenTp+n/1qaBjJ65x2546dfz56dzxWavbey+a6pb9N/NeV2mJf8N63Q7+lAJ4PTofxo4/z/nt696THJ68/p9KE27O2y007WWtu2/4dQ7/1fVf8P8gOOhI5Hr2oBwcY6AH+mD/k55pf89v8j9PypO/9Mnp649emf5+pG91daLVPyurvXyvsvPcadvPsntfT9Bf8j6f/AK/5038R3PbOPXPtj09ATxkux3PX07jrwR6/jxz0zTSpPpkjr+mMHOP0P0zmrTbttt1tv7uttO/fr3sm4K73/q6087q/+QY6+/4ZHPH5k9OcY5pcA9PXPQdfcdfc9Dz1pNpA4AwegJyB74wcf/rpu3kjkH19s859cnOPbr6ATbSbklZq6vrpa93d6rZrutehXazdtLaX093p01WvmtPNw6cEE/56jPH+ccACgnnoTjpge3P+e/uei4A6Dt/9fH5/56UenP8AkZ7jGOp68emDSWtt7W03291tOOit00+57k3jr87XXp+G6VtUKATzn6DvgDv6D64x+YB/n/P6/X2pOc+2P14/n+mPc0v+fy71a6X3t/lf9CX8tl5eX3+gnPJOenIHfv8Aif5/lgGPof6nueOc+3fvxS/p/n34/wA96aAc4OORknjnnp0Ge+eO/wCecbt329NNE18rWfrohpXu+q2XzXff/MXGBxjPAzz64+v05pp6YPOfzGeBwffrk+vPalKnOcjv7jnqOCB2P1zyO5NuT2Ixwe59Mnjj8eT+QpJ6NvZrfr8Ls7u+6su9i10u/N3v1tpftqrr0b2szIPcfn6c5/Dr36fUUvfv+XA/ke3fPb1pMDvyOR09+BgDt/n2XA985z7d+/c9sdOB04q1536X8vL+vyJdrK3p5d9312Te3yDp07dQOv8APj/AYFGPboePw6fT/D8qCBkdu/rk/wCGT+GaM4xnH1/DP9P/AK9LVdfJ+esd7dbbdutkJ2/z/r/getxfy/wP6f5PrSA5GcY/HNL0wOvTn/JP/wCoevBTHHT079x0569h6/0pJO6ukmkt03p2/l13vfbpqC7d7a9v6/rcD19cf44P1x6evbOKT1z7H6YOevPGQe/HSlx+vX34x/n/APXSbTySeCehP144I9fccj8RXaeyf49Neq6PtdKyY42vbt176rTr52tuICMEnHXPUEj0/HHbPQcDOaU4wc4/H0479ufcnvz0oKEAkAZ+ufyyc+2Rjj5vSk2kEHr7Z4H069OcZx2p2b1ei0dmvR69vvtt53rRtu7VvPpZevXve+u72XIPAOeMdfw/XPXqfejAHHbHJ6Adsfz9Tk++aOAODjPTHr+R69O+Pbil4PB698j/ACP1PPfkUydr2ulfbW+ltdLK+t9+iv0uDHp9On5jFAGM+5z9On+FIecc45z65/Lrx+nXmndB/Tn3OO/H/wCoCgXz36fNeXzDr0AHt/k9fx/Ck9D06n8PQ+nUH8PagZ7/AOf8fyH0oI9cdCBg5+vp/PnGRisldtaPbVrTR7W0Vuza3S00Bb/5flZ7/wBboD1wemM9f5+oP5cc008Y5Ax046egPU89z7ds0oGeMAfj2wcc8d+R2/EHBgg84IPPHQHOeMnPc9h2PvVKL63Vmuqe1rNaW26p9Ot7FpaWeq10te73Tur3uvNdtROMg5B4Pr9T3IGOOv8AQYdwMn8/fA6c/wBOOOtGOnHTp+PX+v17+xx2AyM4HuOnp7fT1pRcnb8deia1+ate76tWRN10u1a2rXe/9PpfpZASBxx6DPAP8/8AP1FAIPTtwevJ6557+o656+6cMM4zjpzzn+nbr+IpfTj/AD/hV69uq+S0v6/j69BdEuvXVb6W+5X3tq32sL/n9P8AP060hOB0J+g/n/jS49B/np/gKTGQe/POT6np3/AenXvWS5rrTZ7bbWeunp3e3kC38uvoGfYj69+/HrjvSH1xzxjnHQ/4Z7ZxkUvP0Pp/n6HH6ikwc8H9eeBznOc8c9uvrzWuyXkrNX0tpt10s/v3VxrTXovne1r+Wu689OwhAIGTz6deR27k49Ae/qaXrxuA7e5IPpwPTjB9uxpSvAz9eDj+RPTH4YxwKGHXgE9Ov58jnnP0/Wk3pbVWs7abXWvbS3ltroO66afd3js7J7d/nsJx3IIz3HTqP5j279TQDk/L079eMdgOMZ9fr7UY7cAYHYckc88Dj6Y70v4nj6jv2HcduMnGeTzWa3VtfR20VtLWXN26bXsJvTXdO2+ltOn6e7trqL/nuf8APt/gKQZ/H1/Tpx6Zx054J60H/wDV/n/GjoBj2H6d+OPyptSbem+q1XTRr5aK/X8Sf6sL/nj/AD/+qmk84OfwI9Rj068DkevPU0vXp04Of6e/H4fiKDzgYB9f8e/v/nJoino+/TbZrX8+70fdMa9L/fdba/5fkJyOuD6HB4z9T9OMjPbpikOMcYIyMn/gXPbocfT8qdj8ffjjHPT+eO4GB6Jt6jjBPTn0HuO4z349K1T21W1+tnZq6+/o/wAy49+q39Fbotd+tu9xePw/Mfj689+xByetIABjJ9uw5OMDA+pI9AT60bfx/I4x2GeOfXvgdTzSkDjOP6D9O5x/nIqW763v0aSSvqk/+B1d9H3Tt0+Ser6d792rL9NUI44xzx0GPQZ4zx+ODweOgo9c56ckn/PuQOo44pQPX1J+n/1/U8855oJxn+nJ/Ks09lpuvn5Py7/LsJyurdOl3qvK+mnr+iDnk9R2wOfp+h+vt0oByAemf8//AKqQEk89Pbofx/X+fuvT+QGfX8unPTt09KtOXu6LXZX6WXddN++6V1qLy0vpqtttfLzb9Rc8e3+Hfn8z+lIe3Tk457dwcfh6ijGehAween0x7YHHTp1IGTSEdz0H16+oHUYx26Z7d6V3bfVNtPTVW/pX11BLZ73b83/Wq7+fYb6YORkEcdAOOmB34wMeo70uBjscD1yPfj0yM+p5pcH0AHfGM+44HQ8c8HjnnohGOSfXJB569yTnAwMdz6dqLvRKydlp5XV7/lfXy7F3vbz6X1bsraXXaydrddmAGevPP4cYHOevTHfPc9KXIORjgY6jOc/n17H3/NMHHQAj0GePTr3+vOee9O/A9fb8+P8A9f1rNp6Xu35X0220+WmnzTJe+6bWitps9H/Lt02XXW4ZByP1B6dueOvt2pR0x6e5/D19wPr6Ugx1x159+eff8vwpe3XPY9z+g/lz7VUXouyWitrpZP0t5bp7XE3+n4L+rBjqDn/9f5cYpOg9P0HHP5cevtQQOMjr+Pr19vT/AApDnjjp6HPrnrjPb060ra9laz2Su7b62s/7rvt1C3S/+Sul599H6XF6g4/p1B9Dx1/z3pMADBIzjHpxn2I74+vPrRjsQAPb8fw446gjvj0TYfz+nQZGPT3HAPAwMkYS0+1bVbdduvlfVPT1KX+Ky09enXpvr0Tdru7YpwQRn/63+eoz1+lIMH0yOn0HQ+pHOR/PvS7ec59MDt0A/oO4PvnmgDA5+vv75PU+mcDNNXsrWbT008kndror2e3e+lg6K2+1u+kbrTfzvb8NVzn9e35gHp19z3/BOQcDpjn29O+e3GBjt9DAJznPXgngY68f5H6U4geufUYHOOh/w6YprS22q+b+HffVJv5a7bS32e+6tb7vTZvd+d2FL/nHt+n049/xaOffr/n146HOKXPft+mOv5VW1rv8tXpt+P3+gv6/q3/DiZ7nj1yP88/nnt60gzlskEdu3HUcjtyec9jS9Rxz9f6nn/8AXSc4PAHXp39+3Pv+gqLNrW2ia1drJcq016a7er7FLbpvre2mq17rs32DA9R6c884xg9PrjjBzzg0DGT6+pAznnocenOOw7DpQFwPU8+g5/UDPTqRx0x1XZknknHIOegPHf0Pft6kDNKO/Xum09bOK6/1bulpS0TerS8ra+7br5J9LoYD1OOnI9vqCR+HXkkilzwDnHXnHqfT9evYZzzSjdk56Y7cc5/n16e2cGlx1HUenHHt9PTjseauzbi1ora/hp5bbibSa0ta1nq9Glor9bd1ZerDH8gM/wA+Og9j/kqPf8/Uevb349RSY6cYxnp0/wA9D/nlcfrzz/T8vz60O/u9e+/lrt06bWuQJ3PPHbjn8f8A9eMetLnPt7/gPr6e4/CkGB24GSeo9/f8cdOlNwT8xxjsPUA4B7854wAD19wXq7f11i/NX3tq/J9na/lt03227t7+e470579e3vwPTn3GO/OU4PXHoDxn/wDX3H9O5jPTGADn0ByPyxjr7gjNG3OenI7/AI++OOMDr/XNJ6O3ro76NfmtdN9VYa3W61tp122afW+tvluAwe/A6A45yPpnvj1znJOaTIHYDIyQOeDjJIA9Pp+OeF29+D1B7Zzn6n0yef57gj1H4gk9fbv75HTAx1Adnfrft6KLV78vltZ+ZV1tZ20+73bevn1S6C4BPPX+XsD+vqOvpSdccZyeTj/HscDnnpxzilycEYHqOvPt6c5z+fJxSDIx6HrkdCev06++PbrRyy073W+1rLfa1ra3+96Xl+u1rK9nsteydvx0V7DqKMjGfxz7Un07+vAB9+4z71KTTSs196svIn+v8wwMk9CceuPqQP8AP07hPbPT+fbqCOp49x35wuOCB2Hv06cf0J/+tSYP/AsfUHPTgHrx1wD7dhVpbNNNfLS68rW77vbTe7Wu/p+K6vy7a/ITv2xnjqTknv6fN39sfRPXHUjI7D279SeM9fTFLg5JyOnByR055HTnjPTijbjHTnPfkH2Hb1/+sKF0bd9L+VlZ37367Xb303tet/8A0nSzvq1qr3ezvf5h6jAzngDHTpz6+nGB25HcweCe2eentk9Rjv8A0HQoBj3APqexz+Y6k89xxxTsZz74/THf8B/+vmjm21ul2jZtJRf3Weve2+ona2m2uut/srytdPXo394YHP8ALt6fgMf/AKqCPTr/APr/AA6+uRnnGaMYJP8Aifrj68cD0oOcj07/AOefXpx9aI82mjS9dHt0d/0v02J19f62/r5Ds+nsc9+n1/z7dKT0/wA9P8gAH8PSgcev1/8A1U0k5x6/p/8AWHHfPNVd3V9LJtq73utU9vz7OwJX/P8Ar8x1NyDkZ/I8+n1HOPb680uOozjI4xj8c/579BnJQrnA646+vQ9vQ9+nTr0qe3k76JLSye17X2+772rJrXz9Nn8+qt+F9AJAOcgcZ9z/AI8cDjPXBpeAPT3H8+B6c+n4c0zYSQSRj0/yAOfbHOePVxX0wFzyM8n8Pw6gge1Ndk/8XRWVk/ustn5oq6ta/a7W2ltur23Xror2OMdhxgZ657Djnv65GaUDp+f4+pzzx2z0/AYMD1J4Hr/L+frj0JyfifXt6/TpUu8krb2u+jdrb9/JdteqRN+z63vrbo7ddnv3030DpzjGf59x/U4+vvR/Xr9aTODjGO457E479PYfXrxTs/4/5/OkrppLffyadn92mv4ec7f18xBwOB36cE9ff8+tB7jOOeeRxgdOf1HHqfcGcngY4wR3H+f8mmnGcevoSPUfyGOvUdB1q4t6aa6fc+rvp56at/Mfn87peny0vt3066O79fT+v86MZ6Y5Htz3/Ede/f3yDHfAz/ng4J9PfBwcdKTH02gZHfOfbPToT6kZ9cJavezSTs9raPTsvx7ru1q9+19NNlppa+q2t59wJHGCOozjB4Ht7cdOcD2oOM8kemOuenH5kE8enpS9PT19B79+P169+aTkYB6dOfXHAJPXPPQenHWmm29N7630urLV9Lu2mu33p31fez36bPfe6s7b2drdxTjr9QM+v0/Dt17U1STuyDwe5xwccfUf17cmnDOTn9PT64/x60HOTuyOcZ9c8cgk9+f8kGxxXptFavo2tEn66t2WrttrIpxuzwrZwW79M8/wjjnjngg1JwcNyOPfHTqf156c/SmBlAwS3ILYAPyjBB5AIwc8dApKsfULzn72SM8YxnOdvpkAg49ecnuJett1bZJ7pWvt+Cv1Jadno42bs3e3aysraq13d/iyVTj8c+meOe/H/wBltBxkU9ztIC5U9uG9VIIAJOQDwAQB0yeRUakjJxu9vfpwecZ7Y6HBOelK7ksMdRnLHGAOMEYOO3I9jwOofVX3tfR9nG6+f5AldXtZWfXV2123W63VuxQCuBjO4EDHoPTAIK8lc5wMcD7oNPHHHYccn8u3XtjPp1zSIMYGc/LnHpk8cd8/3uOcjHHL6huzV9tHfr0vfXy6q/ToD0uul3bv935f8OhOeT2HQevv17+n8smlooqVdtabO9l/X579SQ/l/n/PX8qPp+o//XSZweemcD3zj+ufT+dJ3Bzx254Ofx5/Lv17AUWrLTvrfZW0fT1vrf5XaX/A63fbT1+QuAB7DP4df/1UhAP8vp6/mD1+h6DNL/nn8f8AA/h0pDweeQcD356jGP0HXGe5oje6Wvf5XV7f1rqC8n+Nm+mn3/1Zi4xnH5Dr7Y7Y68dOT26oVHAHrnHr+GD3OOOx78Uueg559vx7+3+euF9/89u3+I9cUJu6621fp7q1u+tvvW+wX8+t/n3ffrb+rtA//VnOPT245OOfY8ClwPTvwTzg9+Tn6/X60o5o9sf/AFsfp+f4Um35vv57LXX/AIPm9Au+99vP8+wf5/z/AJ/woPP+eneiijy/y/P/ADf5CDPf37//AF+tH+f8/wCf/rpkjOegHX+f+f8AIU98Z4H45x6f0p6pq2mi767J3ta7u0mkt+gf15fh+PUbjj/D/wCueh6Yz0wOOtNxkgc8fxDjHfHp9PTgetOGT+H1PIzn8B0BOD788n5jv6nHHHfqefl9uhNUr6euvS1uX9NLferoq9vVX+T07eVt+t7+aBQcnnnjvnHHqOvH4dqXaOu49ABgnBx06fz9/TkOxng85/X8vXuP6UEZPI47gnB6jH/1+P0zVK71urLSzurL3bK3ddPXTTYTfe3+Wm33dewmACPz6dc9T6Z/pnHFLkAjJGP6+nP68H8e6jHqPpjpknn0PT8efrQQCPUdx7flkY9cY/KjXTW9t0nq9r/09fvJ667dRBg9wOM8/wCc96Q5JGMY4zxyf88Y9ep9wDqOgxkY6984/wA4H8lHH+f8/wCetLXS/Vu6b05dOmi0+T8t7H3f8P8A18n2D+nP1/Xn/PpwhA5yD29Tn+Z4/nz15pOhzk46Y46k549f1J/SlPGDz19yO3Yfl9Tmq97T+r7abb+a6apO6s1p8+1/J/f9/wCQgHv7HHHfI+nX688H1TaMnJOCe+eP59hjPpkU489Ce+MEDPHr/L3oAJ/me3THXkgg9P05zTGrbvrbbdNNa7ad1b0Q3aM559Qfy/Drz/TAp2OcjOce59PXjP4/XOKXHUc9PXvx1PX19waXp6H+vPUYxx2/l7LXTbzv8tv+CK7fX+tP8kJ/Mf8A1vQcfy6U4HpyOh7YxjkZ9eg56k9c9Kac8YxjPUH156YBycHJ+nGMUpIHv09MdBn64549uc9KO+6t877evp/wdl/X9f1+gmck8f4dun8vb8qP89/8/wCfaj1x/wDqznH8utJnrx7jjH6/X6H2p/0w/r+n/VhCOp5z6Zx6ZzjPbHv+mDb7n6Z4xzwBn/E8cYpe54yTgAdyOOn0JP8AjjFJjv8AlnsO+OBjj9evqZfM7O63T0Vne673s1r1333Kvpu9LW67cunlbfz2eohUHocfjn04I/Lv+gFLtHv6dT09Pp9O/sMU7gZ7d+nXPf3/AJ9OtA5APYj8uO/+eeg5pJT92/R667rTfv8A1fu1zPv379f663+8btAzjI6cde/5g47j2+tO6d/y4/Lv+fNABPSlwOoA56gdscdyT09sDOanmltZ3V7u1+sejau9X0ei6XC993/Wn6IaPfnr04yPbr0yP880p9sccD/H/JpSckbQPT6DnLdu31x15IpDyT2578/X0q5X+V/wWur6bNX/AKS/r+rBng+3+fx9ufWmkZ6ge/uD/nPfn86Xjr64/Q/0/T8KOe598dfQdvQ98Y5qYtu2trW011S9fmm09fTdr8fn8rW1v93qNK56jrnpnH1xnvx098npShQBjn/PuPp/nNAyOpJyT9Pb3x06dOcnFAB55/LjGfz9uv8AU1eunpr66eXr/Wz9XstN9eq3tZbdttO4beuDzx1PT6d+cYPIzjrRjoM8jp098Z9eOD9OMU5V7cDPT07/AFPXOPwAHelxzwMn06/qPxzj1474h309VbdaOy6fD2av1fZCb9LadPJd/RX6fIaP8/4n3/w7dKXtz9R+mR/9fjp0pcd+nHH6D8c559OeO1L1AxjpyMjOR39cd8dOD7Gqs73fTS33fk79nor6iGg449v5+3sQD79KCT3P5/5/z+NKe3A6D8ccZ49cdv8A69NIOQc9O3r9e3T268nNFvw3S0XTbTpuut+qAMe/PqB1PQEjvj8v6IRz9ePwPX34xkdOT1PSg9M88Zz1H4/hxzg8ZxSA55yQOoHTjocnH8if0pe87dLb767Nva3y06ruUr7/AKdU1ZL8O2l0hCBycnIA5zyeox9eMdPXPPRADgkgk8Y5xx169Me+Tz6HmngHp2zjnJ4x7np9M9egwaXnPTjnn09OP0/X2qeayt+ttNLdd9NUtr77j5rfhZ9bK2l1tezv5saeMZ6HgAdjkZ5BHTnPp7dC4gggegOfqOO3Yk+/SjHr19vw/wAB/Lml/wA/5/8ArUm762tv0v21u+t7Xe+xN/XW99vLbz033v1Cj+vX/wDVQMc89uP8/nQf88/4ZpJPdJ+qv/XkLp9/6f1/wwf57f5/pSfz/HH5dO/+ccL/AJ/z35/p2orRJ3V+z7Xvpe+ltfvtfW4Ee0ZwOe/X6e3oCcZBwM59HbR05I4/w659gcdu3pSEc55zwTgcHHb6ntyaMHJ7gkYzkc5PHfHbnoeB3qrOy1tbVrRbtX/Lp59Llt3S1fbbr7ul9F0v8tWLtGR149+/cn68cj9MUbQfcEepx9fr7jrk9eadjd3GPx5zx1Hbn+uaUDj6Dqc9h+p5H4+1Sru2vTrrs1fS+7a1fotGS3e3df1f1b3Y3A/z/nr7nn3pfTP+evXAP6+3tTscgcfUZP4e/Tt370hHT35//XwKTv7r6JJu1ulr+VtrefyF/X3CUf56f5/z9TSHODjr2oGcc8H/AD/n+tQm1t29dA6X/wCHAjPHT3HWkxkHHORj654z0HYZH4gcYpMnvkEkD9ePwJ49SB9TSgY4yfXp9OPT1yOvP41SUultGn5bJ3v917dn5Xpab62eltr6devmvxWg3aRnrjrgHGTkfXr2754z0JdtyTnPP06Zzxjkf579FIz3P+H0x/XPp3pAOnOPzAPpke3p+HQUWbatq3bvfVRenZ93Z31YN7a6/wDDb+d1rpr32DGMnJA9M9c+vfOfTnpSgYHX69P5Hpj27dcgUvTqRjjn6/5/OjAH488evv8A56UJvRd29NG9LLrfa2l+3zFf8d/P+t33YD/P1/p/jijnt17fX+dHp+v+f89Pej0/z/n9KV3p2Vtu2m/Xtv122EGT2x7+/wDn8uBx3DTySOcY7Y/XjIPI9iPxpc/gOeTx6dj6/wBPpQffp7A/lxz+PQ89Miq1bWm3e99LXbVxr+vw27vyE28YHGe/cdMe/YDHt1yOTAHPPfpnIz+p9MjnGAc9aMde/sSfb0Hp2Oc9fWlzj9c57d/Tp79uO9TeV9HfbTTtG13ur3Sbfyvdju31b7627bt/drpfZvUaVByc5yR9BkjPT1/w+tLt9CeOnPHXPT24+pHNHPG0f0H64HXnOR9cEmngcZPT29fTnp+v4mnHmbVm3rfforX08t33vcOZ2X4Xs7Wtb0tb53GgYBOc+pJHb39sfnx3peMZz+v+en1/lS8Dg+3f3+hz0yD0780DaAMD/D8hjv05PckdBVW1Vuyv52cd1qlZefXsSITxz6foOnbt/LjijNH+f8KQY4xjjpjHfnt/n9Klc116697K3/A7N9b6AIcYOc45z/nn6/8A1gRSHjGOvtk8dwOQT/P0x1Dj7de3v3xz6/pSYP8APuT64xyPXj04OciqSfuv0vbqtLfKyu7pvo1bak/PS+q3XTdfLW3a2l7gRzn1xkcYweufoPQ9fxo2+/J56njnnnn8eOeO/JX0z17+/r6cf5xRj3PXP/1unT9asV9b9nfr8l6IbtHpjHfP9O3TnGD06ZID1AH0J/z6fzFAHJyf8+nJ4z64x0zSnHHYHHcE/wCPPJ9ORSV9L9u+76vTt0+fkDk3/Xo3+K9PJCden+cDmlJHTv25z+P5DGMDPU9BRjtgDA9ec9+/Xjoen1PKY6cj/Dr+P/6/ejX/AD7dNF17vX7+yF54/Tgc+v196SikyDx/n/P+I9RUe83Hdd+mml/x/wCGDX8O3T+uonfJHXA7/qDjjtz19OaNo6YwPTPXuOv1J7c888GkAGDgnBGMDoPXIHH9O+eRQFPBJJ46c+vv+HGOorTazvr5XRWmuvTaz1stL721vvtbTRobg5wQevUdCO2c56D6+ncmnbBkHJJHv34x+HGOc+1Ow2eOcdc46dCcD8D1z7AZpwHHXHpnPPbqf89Sam7drWXdXXl66Ndu6ByaVtLNdNW9Fe/b7tLWWgzGOme3fp+hyf8ADGccU4DoB9P8/wCc0uD7cepAGefX6H1owcZ4/wA+3b2/+uM52k76O+938k9L2tt2uTf8rfdb/IQEj88/l0o/z/n86KMH/P5fzou7K+2+9tFZeS9Ot/UBD6dznnH0yev5c0gHrnOMdc/l9cA/jRkkkegGPr7/AP1v54ozjgDOMY+nI6+xH1PTHeqipK21nrvrbS/6dH9xVn+Hfpp1dlbVaa2a0sN24JAPBHIIyf8AOfpnn0pSPqQewP0/+uSfXHuaXnk8+34ZPv1z6D88UAHPOMAe/JGAM/gOPQ/nTbkvPd7Le0bt6bLoDfW/a2m7Vr673Xf1tYAvTPJ9s9SevXP+Pp0wFfQ88f0J69cHJz1J70qjjjqSR0wep9c989fxpcA89fXgYOP54/PrnpUJybe7W9ls2mr6dU79r31d76Jt3evff1vt0v2tvuJgbu/3epyfw/E/0Pc0vt2/z+P5/wBaCOOD14z74GfyzQOnpj1z2PX+vP602316XW71Vlffvv1bur9Bf1/X6C568D8vfP8An24pP1/+v/n9O9GOgH+fp/LH5c03cCcD8ePr/n/PCXM0rdP0tbyb/EF5f8N56AvTjA9s5x+I/wA8/hSbBkk8555Pf/6/4fQ5px/w6dx+XOOuAefxwUxnkEjnPYeozyD2/Pvzk1SUursrbXtZabdrLv8APdldW72ve3Xfz8r6vfy3DGe/9eMZweOB0zzz360YBJyD+Zx6/THXHX8OBQM5OAB0+n07Y9eAeTk+lKDnGf8ADP0z/n6jmk2977pa9vhfTrbfa/TsG2i6pWV3dNpO/nr0/IQqO/8AM5/PPPOMA9/rSgDgg9gM+w+lLgexHv3xz+vbv9KDgenHGOv0xj9PftWl21d9F1ejvbW+qSWy9UK77+XotP8AL+nsfy+nP+fb/IUn6ZyPwHGfbkfljGAKB0Pf0/n/APX54xnvQf8AHjj34HPPTr+fGKFfRO1+mtvW/TT/AIOgR3XqvzFyOdvAIOQcE4APAPByTjjGeB68yBcEkcHkj0zn8wf5AkCmDPO04zuJHYkk8eh4Jx+I6cB+T83HAznkggDjpj8QcjqMGlJ9E9d99f6+a+exWr8rW7K2zV+/ZXf3Wd3bQxA9O/8ALnjv+PTjoCg4z2A/w7/5PSjAY4yBgZHbuvpjHGR7EkcNTxGMghmAA6fTn5s5IYknrz3PPNNP4Xqm7q1n/SW/XXrsS37qbbW+ltrKL6X3T2XXXq2UYxgHA9P68/5/wp/4dP6f5/wqJWGDsBOO5HQduBz+uDjgDqZc4AOM8c9PcdODn8B61E1pdJt2769Nlpu79N30Bq7snfbfzSfX8BaAO3+cCkHuR/LH1yaOmcnqe/aoVm1ZtaX7PTfdrpd67PTsIOCPUGgc9Dn07549u+f896X/AD/n+tJ39vT1zj3/AP1/lVxWqve92/krJWutNfR207B/X9eoY59yMdOPy6/rj8SKM84PXrn2z39Mdv6Zpe/49R29+fx9P5mkydwOAQRz2P8An9epPummt0vxtpZX0vp1aaV/W1nfe/a2/p/lsGDuznjHT/HP9P8AGjg//X/wP0paTv1/Dt/nn2zx6VH4f1/Xb9RC4z+HNFFIRkdfWjTT8f8AgAOGOnTuf16ccZ79eeaTJ7jHH5jrn3/xHHQGig/56f06f/XzVRu7WW/nbTTt8umt73dg/r+v6+QH/OaYwO0gckn0/wA9/U9O/endeox7Zz/n+lAHTGfYf0x+PShX6K9nrb5P06dN/MNn6BzjsTjr7/T/AD+HZaKUAnnHf8/ofX2689DRFO+mnn93/AugD/PX+Xv+fX2pMDjjoPrz6/n9SMn1oK/Xgdfb1z3Hp1GfWjH58Y9/y/l9QfQvVWdnpo3rbpZNJX10XW9uyAU4KjHOc5OeOD/Mccj+fQH+Tnn/ABORke+ee1GCBjrjOBwPTGDnkkY/mBTQfzHXtz/h71TTumvXXdr3U0+i9dXtpogHcfj6/nxj34ppbaM9e3/6/wD9VHJJB4GOo6/5/wAPel9P196STvG66rRaaK179O2r1v30sfiN+bOTjGOg6/rxx9fwpRk+mD7Z9cEHt2PT0xzzR/n/APX+f9aX0/z6/wBf84prmsrK1tLeWm6fpvv5dRt37bW89Lf19/SwAHAz9Px7/wA/SlGCMHPrnOP/ANWfXk8AYNHGOvP+f6dPfrjuemeR19hzj36gfX8qPeVm2ul+3TR6euuvyFsHHOM4469T+npn9PpR8vcHnrjII/P/AOsQc+2DH1x2J/zz6dfcnrRgdc557Z9uvT378+1NN37bX73uk9LvRrbyv8z+v67hx79uf58Y/rSDH1H+cfh/TpRjH8x6n/D8TjH4UZ79Pbjv/nA5qLyb21Wtk2u266+m+u+wATj2znGfx/wPNICc8dj+P8/y+o9OTIIHIxzj19wO/wCH+NHrkf1PP69fT2x7UnJtKz7O+na+miVr/c9R/LX9b9Pytr1+TeSQcgdvcjP+H4/TOA/nH8zj9e36HqRTQMDoMZyPX19zkdvXp604c+vsMHP9P89qNb/4dHrq+l369Ot/W6G+n3eaXXv/AJeQHn8sHn/OOKBx0HHPT6H8h7Dj1FGDx15PHp+fp/Xv2oHv7n9On+H657wrtq991b107+Vu/TuJ39fL1t+Vvu0HADuDj16YPJ49eMf5IoO0HjOev8uhHp06+hBNGFwc9ckcHn8MY/P6+2EABOe446fqOnQdcZPHcZxqr2Wr2W+/z0/Xq/IBeMe54wRwOeuT0+vXr9Q04PHvn8Dnrnr7e479gEcdOvX/AD1HGen0pCeeg/lxx0/r69z0yarW+z9FbR3fprqn/kC3X9f5ASR0GcAAfyHXn09/qeiYyQfb09/fGMdj159Oq+3+f/r49fp3zS1PvWtbrrfqtG9FdP11b7XuO9ttH3v6DcYJI5JxnsB7479D3z79acAAOhwT17ZPTt+meaXp/X2POO3X+mR60EAjBJHrjt7eo9Dng/QZp3b1tbRJ+unf173d+4Xe1+34d7dhQAexPfg9P09sgZOeBzmgBeRzx7jHp1AGBz1Hb0oAA7ngnsOueMDseOc44GD60eoOckc5HXHcHI6dznGOSeQKpf1/wBB8o7Hjjr7nrxjP4+nXmj5c8An1Gc846cE8dD196T39OuQMd8fXPv8AyHCHj/PHfr6fiP50AB/+v1H4/wD1gf8A69JnPGc44x9OeP0z6YHTigE5IPb+R6f1z/8AXoPrxgA9vTnH1/wHsQeWu29+qtv3vqHl/WuwDI9M89uO/POf5Hn1pfb/ADxTQwPXgk4/H9enfjrTsds9B16/TsRk9fQ1DUvd1d+vRbq3lpstHf5Daa3TXr+If545/wA/5xQBk/z/AM9v5dz3oHOfQDr79MD3H+SKUquQcseOR279s47Y6EdTzUqD3f3d9t+3/D3W1l89Pw1sJgcZXIH4Dt6dMcfnjuaOMk4/+t1wM0YxnBOD1Xnjkng5/PI69KDjke3H+SMH/wDVmklb5Wdk9WtNbpK3l1S9QF+U8dB+fp1yf5Y9cUmcY79vwPX8Ov8ATmij17en+f8A6/401fR7W3XpbdbaLtd7ddQCjknH6d+/+fzpM9M/T0/LP9M0dT0HA/H9exx+Y4GCK0votO2nbb+vkH6a/wBfOwoB4zyM4469s/oR2HI/CgjIxxz+f+fTPTril56df69en5mjAPT8eOTyeg9h2z69uaPV/wDB2/rTv3DYAF9Dx0GPz5x365x0B60fKegOecHpx7j09f8AdBwKXGec569eP846nGT9M0Af4c98+nT0POR6Cl1X5/8AgOm7Sv8ALy8zuIdmenUEc4z1yR7+nPT3pOMd8+uf/wBefrx1pePXt6eufTt2yevTp0T/ADzz/n/Io1aSeml0rf4b9+1tVp2fUD/IpCcfTpnPT9D34PpRyT7cY9cg/wAuPx7H0CT+HH557fh+vTJGKyW69f8AKzuuv5NbdB22V7+V+9vx6PtYXv7cf1z/AEopAT34OOmc5HY/Tj8PTpRj+ef8/wCevNCupLvdfpbYH/l+X9a9dxf50o28A45yMdD+pxj8OMc+6UYJ6c/T/P8An8apSemnTbXbTW1308kvN7CF2pwBnHJ688Zz+nrnPT3CcDAHYfh7Y/Drzmlx2zjn/H1HbsMZ/lSf5yfbr7Z57dPpTd3yuy66a3bVm7Wvba2urv5AJxxn147f54pTj3OPz/L1/GkIJHAB+v8An/IzS1Hb11tvbT+lcBDyCAevX0/kff6UmCBj8MHJAHf6+gzjjA9cr/QducDtx/n05o656+2e/Tn/AD+PtSk9F239NLd++ml2rWGm7W2tr+X46aW8+lw578/QYx+p6/5HWl455B+nb2P0o54wMg/n/n1HXkUm0du/Uf5/kOOcUtVq+iTW1ulr/L566hvu3tZbfj2/4N2KMDsc+uT6Y5656f48kUoA4GD14569OPbB5Hp09CExkjB9O/Xjpz7n/wCv3pcYwcnv6HpxwSeT05H1zxVJvTXpbTovdu9Vr59FuIdhfQjPQn8QOnJ5xx27cZy0Yx0PXk5+vT06e/4ZpCAehPB/76/DHT8c9OPQ44A6ntx68Y/z+lO7lbq7Prpe6/K9/XZ9WDhjOR0HTnnggc9xnt7kEcc03HoPc+x9fxz+oHI5prFug6evcEkA/hgdvrmlHHufX1+vWqV9L6u227e3btst+muo7baq/r+PZffcTJ3ZHXoOxx6+wzkZ759hlfc9s9P8nP8AnjgUc5P6fh6/n9OPenDn+XHb+nr37Hp1qIu9kuiV+1k1+PTbW+9hP9F+CEx+v0+nfI7d6UYx0P4cDH5fSjt19PX0/Lvj1/CgAEckj8PT3z9Pb1p3k7W00v5PVd1tZ9HpsF7/ANfL9AwMdDnqOSeh75z+fY9MUDGOQcn6cfh65Hr0J9qTBxgk9CPTB79uvPPt70gxjr0OPw6+/bGOec889BO7TV0/zV1d9fNaa7a6Avnp/wAD+tevyHDGCD15weT+H8/z9qBj3z+X6ngdfTt9SExj/wDWD/Kj1P8An/PP1/Lg95crs9dH961a9E1fr5WsAf5/z6UAnA4wCD1AB6jv/Pnj86Tv/wDq9/x7fSjnJ+g7/wCSP5enepu9NNtdE7W00u9F5v5bXYf1/V/6+QZJOMrx1GOcfnyffHv6Uc9sf5z39enbHXr2MYOcc/4/Tr6inYBU4yCO/YZxj3H4A07uTVla1r311TV9Om/r0d9h9V20/S+3/Dv1EGOp+g/x+h4zz6e9B2ZVjx14yRgdh0+vYt+Jo/z/AJ/Tj69KUIM8k5/hzz69Dzge/cd6avdWvqlrbV7b/e1v6a7r529O3+TsHBPp29hzyfy9fzHOQAdD0x29h7f/AFgPpxQF/DHb27+uMcdvbrxRxjPf0/8Ar569+4/XAlJtNp+e+q0Wq2S77XXQBePr69x14yRjH1BOfam8/h/X/OMfjRnk/Tt7/wAs/wCI6UZ5P/1+9Nx2T3Ss16NX/L8Q/r/hxuT1xjHXJGT+PQDP59fYqDkA/wCR0/Hv1/GjJ5z69ePb8eemMHHPPIIUjdgZOfUHBJ9TxjnP5jJqdtkuvWTtqr/O/bVaP1fZemq7abrrb/gdFYo474PqPr/XHPf39KMZ45/DrQB69PX3x+H/ANbNK7k09um2ysk+trLXTta7tYX9f1/XQXjB4xzwfUfoOvBP6UAKQMgjn247/h6/h+QAMZ3c9MHHX1znp+g7UEDI5OMcZHv/AJORnr0zVJaJ6aLTW3beya6b9VZMBMDjrnnP9Pr6n/HofT/9X16fn0pcevQ9/p1/LPsM9+KTP8j0H+fX8amzvZ+V/LRa37vbza66AJyR8vQdSQTnr3788f8A6sFMAZODyQSOe3IwPc//AF8YxSjgEAAZOe/P+H06Z6+y/wCP/wCvnnn8KFra3dduZJcr1t2a03XR3uO9tnppto+j3X/Bttqt05yfT/PTj8+T169qPfPbt0/Pqfr6dqUDPp+PHORzz9Op9sHkZPx4z1/rjrVLm0dvKyaWnez2/P0tqg69cfljP4ZPH+emKQY6YwBjp+fH0PUcfrS+nv8AXj60nX6/j2z+fc+3X0NZ3euvZ9d9LPTS/r+YB+B7859+g7j+VO+U9QRnnrnHAGMH8fTqetICRg4Gew6/n3/HGfTpSfz9P89h/kVSvbe2qWq0W353euz63uA/AAJA6nk9QcbumT1HIHPT0OKVvYDd0xwf4jgHI4GQAflyD6kAABwCcg5JIXAJHoSCCMdv5cgmkJDHnGR/D93qW6qFXP3ssTgDqQeCddPn/wAN93f5LsykpJaJvo+ba6ta99r3WvolbS5nAODhsAEnBHQ4ycHgEZGAAeDyAQHgnceM5HPopGAP7ucjPqeDg9KYMYJzkbRjIXK88/NtPXAx7egqQfLkHgDBySTuyvJ7ngn3OfXOKT9Ht/lZ2fre9tLBJX25uzu9XZR0SaT06abWttccABwSduCTyATyD1I+v9OTUu4j+Enrjvg8YPHoD+o561GD2IwO5znP19evcHGNwGcVMvXk5BbIzkfLkZxkdB06fWhOyWnZeXTrr36726g7tdddLN3f2bNeb7LW3RIy1yDyp57nAI56Y57ZJwe3uKl/zzkj9D39sU0OrdO4B59/8+/f8F/PHHv/AInn1P196mSW97evW3l/wLat+s32/r0un27WFpCARg9M5HoO34cD09aMZ6/16e/T8QaUe/8AXr7VC3WvXW/ZWa/L8LadTazW4mfTn34/x/zg+2VyP8PXj8v/AK/FIMD8h05/HjBJxz746daPx+uev+e/48YGKuN9Oz26Oytq99vXqtlsf1sL/kf/AF+n+eOlH4jP04/L/wCv+dHTGe/9M/l9SKP1/wA96lczcWnZJWt5aXbuuvS2mvkrAY5GDj1yOOnT149aTnuc9eMdvb8x3P60vp69+3TH168/l15zR/j/AJ6H8P5jplWemmz10v23S+V9F1vsAY56j8vf6Z6fp6nijpSfnx/n/PbnnkcJ1Oc8Dt155GeM/h/+ujfe9kv6W3XpfT57i1/rd9h1J+BwRnr39Oen6AdOppAc56jHYDH+SPQf/WBnnHr+GMcd/XjjA4IPenGLvtp1untdeVtR236Ws3f/AIb8N+mrHD/9fp79v6c0LgfgDjof59fbn/CkBB7849/0PHr16kYPpS5B6f57H9QcVST0evdpbaNK+mm2vm/uEKBk4yBz/nvz/wDqoA9xzkdf5jr2449O9Jz0Hfgent+FHP8Anj/PX3NKKbatpbv1WnkunXd3XlYHYIzyD2xnpj6+nr2H40hGP4l4GT6H6E8H6ZznjPByexJGRx+mPw49Ow60w+nQDgj1zjHT6/48ddErf1/S+4aV3/l/XyXmPOTkk85x/wDX6Y/z+bcjkH6ntn8eh6flnrg4D1xz259Oo49+3XuPeg4PGefTp9OevY9O3rU3ba2T66+jelvktet9ncF8/wArbWevTXuvVCMQCBzyR0PGOeTjsO+cfpilHPGOMjHqe+T36/ie4pMA45PXgcAA9R2z047kA0vXPb/P+T9CKmzfKuq3V3Hqt1fS/wA+6vZMHZWtva9+z/D/AIF2L/XrSgDjBGeOCOn16jH9M+lJ/n9P8n/61Ljn6nHB6+369+meavS+2ve3ey37v9LC9fl/XoHPPIx+p6/4++c+gpCT6+34DHUcenr2yaD7j+vv/Mdu/wBKTJ5zgDsfb3/z3rJOT1vra3S7208/+HsHoLj3xz6ex9vXnnn8OiY9z7888nj6Dgikyc8Dgfz9Pywc8/jSgj9T7dOp/DoSe/1FP3lbZO+3yVnbrt2vfzD18v61/rzFPHU/r6/1ppPseDwRj/Hv0/lzik+9nPOO2Bx2P58+o9GyKUnAz0xkAHuAeo55PTr1xxjOaEk2tr6aars1a13otL9N33bt59tOrvtZu9/O+3mBUHtz6/TPXvj6c/0cM8c89+3v7e35etJyRzwe+P8A9Z/Tn6dlA9yewz39M47n9f1Ds3ZaXXS6ulZLz++7fWy0B9r3tf8ApATjGDg5989QPy/Dv6YJMdf89Ov9T/nk5zjH+R2P5n078dycjtwepzz+XOORx69cdaFd2S6d9ei0V9rPfTTpvYQpUkj5hwRg59D04J9fy9MYAVJA5Hr6c/0yQMDPbqOSEIP+SOCPUdef8+tIeO/b2HT+vpzjHpVq6toktrN37fkr26Pr1QfmOwR8uR/TPfk/4nGab0zz07Z7f/Xx1JPfBo98+2OOT6dBz+PWjkdcn6AYHv6/qfpnAp/12/zC3/A8/QCRnjPpnj16ep5wDjIHtSbh0659P89uv06ZpCQO+eOO/wDjyc9eOD7U4H2BJ7dPTr6cEcdR71FpNde1726Jvo1vpda7dNSmvL0eyfnql+n6s4yPxx/n/PenDJIHHQ9f8/Xr04xSUox39DwR1PQDr/8Aq/Wlqmlt3u90rfLvtrbV9yQPPJP+P/1x/Lpikyeuff8AH1/l6f4H+e31/p/TvSemR7n04x/kUrySVtPO26Vtdd/Va+VkAvPUEDPqOnTPBOACOO2OeetJt5zkZA6Dp26HnnJ7dAMc0p6HjPXj+Xb8+KaCMcdT0HsSSPp+AOB16ULmbWrts7fJ+m1+76Pzev36f1+v47ikjoeMnH5/Tp/TI6UZ56Hv6fpk+/X3GTkcIdowT1OfqPx/+ucZwDTVOT+WSc+oAHXqfU59OQK097e7V3rvrZ/hdatedmNLTRPb5XulZfjb7rd3g5A49en/ANfHXH6/WgHI4zj/ADjnrznr+fNHbjj8/wCQ98cemR3oHYj25798e/8An1NCb7Wvfy2tp8m1vbuhd7bdPLt+A4gnBXjBHXuOnpg8/iffmgZx1Ht7g557ZHXPI9CaMHHA659RnGBj6ZOOhPWj6foOmOc59e/sO/YJaJdH2t3avtp19fxEGOuDjg4yOvr7dM9c9RRjgfMBnkg57Z/X0/HHuY56A/mf5fX86b68fh6//rqVLTR3std9ErfLTVaNXAX8R+Xbng+/v9PfB/n/AD+tJ7HGSPwP+f5UZHTJB4x1H0/H2+vHWo1f5X6b6Xemna/ZfIDp+Ge/p36/z9RmjPPTj1Bz1PHHX8f/ANdHfv8AT8ev6/z644Ac54/zkj+n+eMtX06K68t7P56K/XRXsPTqvxt2s11/TrrZiDkY6nnB69+vP8h0JHanj0456nt+vT/9XcUmAc5Hb9M9/brn14z6UoHOMc+gI/nyK1d7q3zXy6vXZ9t/lcX9bJf1/XcUA46jHXGM9PXr2z+vHXCAE4yeueT7dz/j6g9KACOuMY9/qB9SMf054ByT2yc9D69vy9z1x2pauz1T6r5q9/066+oCgYA+YY9CT1I5z/LOfbik5PUjn8uOBnr+dJnjH5e3/wBb/I68swc8nI65wO2ePzAzgZzjpQ+ZLTstLLyur626tW31Q0r38lcUkZ5POOcn1x/nHuT3pc857dc54HX3/wAe3pSHBOPcD3Ixn2I7g98HpyKTPIAJ9egxj07cDHBGeOmaWrto07K7fZNPRrZ36afgh2vbfZNt7WsrdPl1tbeyY7Ptnrnn3ODyR/nocAZX/P8An/P1powCevP5A/5I+vQdDh2c/wA/zrN+XZO/V3S8/Pp+ImrW228+uuvT0sJ/nH8/zpeePr9Pp/nj1ox/Ln8//r/5xRS/4Hb+vX8Rf1/X9aiEZyM8Hjp/9f60oyoADdu34fl0x68fQlM8ke3Xtz+OaXn8v5f06/j7Va5unrvpst1ts12eu+gWfn5fO35q3mA7c/j9P89vw54opPXHUA/j6j6nGP8A9eC0jLDIJz09B7Hseh7n6dDSUW+66q1+nLtdryvrZ2Y0r/1q7K+i9Hf8h2e3P5f16e3rRkH8f6f/AK+o49+lB59e36+4I6c9/wADxSdzk4Gf8Af1PYjn05y1Fv5rXyV4u/4/0wt/X3f5/cG7kAA89eCMZ6dR3NKTgEnHH+fSkUcbsk57n2xwfp6/lTuO4/z6/gcH/CqWjts7WbXXRX1t20tq7PotQdr7dr9O1/nuv+Dq1xken+f6npx6+hpPy9Dx6d/UD88+tAB9PX16dMjH4cZ7855oPT9P8R39f17daWvazt5K9mrtrRW6ea8hCYJPX8ffI6+3XPPQ/jS4PqOMduvTI6/59SOqY6+nHf8ATB/oPXPajP8An8v8f8TUvpp0T2S0dvLvpf8A4Nyz7C4x6en5f09KTgc4z9OuOv8An3pMjPXp6fUdf5HPbPbmlyB/wEdOcY5/Htxz264JyK6to+6S67dfu8r9B2fZ+X5fqvvF/D9eT2J/l+HbPVCT6fr79uD9f8nCDB5BOcevI/Dp+mKX8T+WfU9h/n6mm3Jcu72vd27b/nffVJ6A9H9101b+vXRi/wCf8/5/+uYzweh9emR/Xn8PakHpzz6nn9PT2o54A5+pI4Hv6/z9D0qVe66O66df0+5/jcX4CgAZ+br689s+nt25PTkUAdeR149uPzOcccfXtR1GfQ8Ag/p9O/TrRgjB7HP+fzrS0m07Jve7+W62v011aW2iAUqSOowe3r+nAxn0xnnHIpMe/Tgden0/D9fekyDyOn15zx6djn+h74O/PT/9f888DoCMelNp6NW0a06PbR/c+mw7d/Ved/6/PqKevfPA79P/ANXT8s00kZ6HvjHr3GccfUY6HOMUZGT6Yzu7cHpx+Z59c8UZ6e/+e+Pw6ZJHrmnqvmtr67q99Nlfzb6ahb+v+Gb/AK9Rc+3r6dfTrjJzx60AnPt2OetHHuc89OpHr2B49uRRk9gOvf09e/06ehqVduKXpd6XXu3/AMk+29hf1r0/r56dBVGepA//AF/y/wAOcZp2COhAzjBP5+xx+XOKb2//AFf5JGfU/kKXB7cjPp/P+n6d6ave+nffXVq+m+iWrflt8IAASMZABzkEnHB7/UZ/yOTBwfmGDyevPoMdRj6c9aCCAPT1/Tr+FJ256U9dL9tfX+m/6YDsf7Q/UDGentg47Y79qbj1/D/P+e4pmSOAOB3x0z36nPft1/KnZA7+oP4dfrjGf8eMltVfR2at91/u+e47P/JdbadFfvf5MCQO3+OM9eB6Y7HtnHYBz2Pf/wDX/hjOfzpAc8+h7+g9xkDr9SPwNL7/AP1v8/jT2/HcGrb7/wBf8Hr/AMFf8nPt6fjgj296MnnHy9/XoTj88evpnoDQBn3P6+/8qP8AH/8AX/n/AArLXS2j+aS2b02VuuiTvonoxCc+v6e/+HH4UvPHP5e/T/6/fPp0pBnJPr0B7Y/x64/DrSgH16kj+X0457/jSV7q22mtl3j99nb1AVVJ/iHOeOh79ccdPpxng0oBxknAHT8c9Bnrx1/HjFNORjv9D0HPX/D+VIc5GMY7/r/M+nT3rVdOmmy67Xv2s/63C1+3zt09Q6/gff8A+tn+VGenB59Rj8P69+ATSEgHnPPtx/nv3/lkJ59x17e/4jHbnGR061DvbXZpaLpeyVtdbXTa2W2rHZ6O35/1vpp1Fz7E+/bPT8Onb+ZpRk4GOfwwMdec/wCfzw0EH3/T6cdPxHGR7cOH5/nj+fv+NTeXnpdvvbTTXRNPqHqrf1/l/wAN1Fx+H1+hP+GPXNJ+P6f/AK/8+tA9SAefX/OOv+eRSHnocc9R9enPP5/ryKalqtvx0Wmy2Xy37d0B7fMM89R6kjgccE9MYHOAKQgkHJGPYfjk857Hp+fSkGWODnI5wvoGAA56k8DnA54x1p3/ANfn6/4fr3z0Cvqrb3s193ZO97b7rW2+r2f3b/f/AF5ByDnP5DGD9fwz+PWg46nHf2+v6Uv+f8/5+tJwT6/5xz2PT8MU023a+it0tomte23XXa3YF/Vvu/ruGQPzHc46dMk9McnnP4nkX5W4GPvHPucZPX1PIxzSfU9Oehxn6/j68cdgcrkdOw6ZwOAeuPb1P4HFalRdvPda3trbba7T1slr1d0SYA46A57g/dH4HBYdOBjoM80u3G7PQHI+7/D78nr9emc8kUwPg4OckHHToTg+xzz16DnBIqUALkZyc9OByckE5HUbcZXk7skdTS10W1rdb6XTfS/k/V3HZpJtPVJat7Llaa5lZa2Un1b+Y/HX2/z/AJ+hqRxggg4569RztAJH5emO+DUXPbnPbP5f/W6A8809+ccnGM45xwykZx7Hvz0xS35b31V+neLfa/Tt+JDvb7/yXTfqtt/kZ0ZJBbGOBnj7oGcnvnnnrjp0qT5gOeTnsPw9eM4zntnpUcOQCMkrxjjrnOSceo9R0I9xUuMdP8/4YGQPbHpSkvkl1evbybX62dwv6PZ9NdtL2uvPz+bADknHJA59fX6du/P4Gg9vz/L/AD/L1paKjXR2fTVX7Lr+XrpdWD/Jd/LX+vkFHX/P+f8APFA4689fzOf5dvakBBGOvY8Y+vXHr06ULm6Xtdd1f+rav0EL6e36daT/ACePT09Oec88d8Yo5475zn2/z06fj6r/AJ/KhXVnZv79laz/AOH2002AQnH+f88+nqaCccn2H+JJx+A+v5IfQAgdOB065I6fmCfpmjPbg57kjGD1wMk4wPoep9xLS/Z62fRWf9a39LFJX/B22003fRel32VtQ4/vAcdu5PXnj37DnnnpRx1zjGe/TJ7gn6Yz0PUdADgHtzgD8ODxz2z7djjqTaPxPfr+hzwRke3HWq2SSTaur2tZ7Xb0Ta1t121V7hp3e26tazt5J9Wm9+tuiQEewOB6gYHPTIyOv06HjqvTnqPbn2zxj9AfTHAIMAYzxk+nU9s4GOPypcYP4dvwx/nP4eiSbeifldbrT52W/XS2lrhdW2avp3006teXy/I+v6f55pcn0x/T/PT6+3NGMe3BOPXJ6jjk9/z60f5/+vz6UWkrad9N9rP/AC8yf6/r9f8Agh6e/wDntS56D6Z6c4/+scfXrzTRwBzn3/X1549PypDkrxzjGPXPXjPOPf3591GLuneyvv27ab63630t7vdpXe+n/DLyet+v+YrYODuGM9/pkZ46ng9ec8nmkH+8M9ScDkfn+GfSg56cYwc8Y9TkZ4znrk+h4oKgdQOwz7jA7euRjAAODVc12lffazTulbvrort33/ApJaNteis29n66Xd1vtpsA9dwPUf4Z6A8cnHPv1pD3wRnjd6enU5x9PyHqBRgngjHoen5/TB659TS4Awf/ANXJyAB656AD68kUJ6310a6K3NZXv87dN9QsrtttpWW1r2to1+lrbaiAZIGfmHHrnB6dep/P1xnFPx2/H8uc0gA9u/Tj+Xp0peufbOOfQd8Dr+Byfer1urbdfv1+63ne/Xclvtt06a9fTXW3S4EnPtxjjHr157dfx/MGe4x19OmSPf8A/X0pAcjIPqP8/wD16PXGD/j71lzO7d36dtV6/j97vZrrrp0+79f1FpBnnLDHJ/HPI7/r+mOT19enH4kdR/npTcDnjOevPv15OQeT+XXuXZbbS8976dXqne+176vsikr6X7aWV3ts3te+nfrYO/UcDr755PpjHXHXI55BozyPmGOvXHfoexPA6EfQjigDrhR7e4/HPPCnkevqaMLx0H5duf8AJGRjI7DFcvdPZ9npaK3113t38ilFar8NG/s66bPV26bva91JABwQD9Py7HoO/TI/CggZz3POOMn8MZ/kBjJ6Gggdcfzzg9c9ycevP0PNGM5HGD1OfXGOvfpjtx05GJS1Wjbu+m/wpJ67KydttltqS7WW/X1+z+FunfutRc/X/P8AP8M0oPp+Hpz/AI/r9KAMjkZ4Gc/Udf8A61JwDjPUZ47fpx/Lj1PLV9FrfbrFWVtdvVd9eugrfr6ade/roL3/APrfr/nj9MLnHpjPUgfTH4+nr0po+pyO/ccfz789+fSgHj269uc8/wCc4qo30enX5v3Xqtr/AKP1Etf+CKSPyH5dfyHBppwe69D15/z0OfXHOOoCOvTnqfwx39s+gGehpMA8YHtwRg46Z4z0Jz39uMtXsr79fn0t5bX/AODe1G78uv3Lt5v5Lewpxj74PUducAdRznr/AJIzSD3Yfhgevfr1/Xrmk2gYzyBxz+fY9Ouc5x6YBNO+UcdOvBz9PxyOB6jI9RT8vx18r7vp/wANew7Wsr31vorPp91tH08+gnJzjA5Pf0xg9PpkHtin8YH0/wAkY6fh+GKbgDHHt9M85/D+vFLkDg/hxx9M9PXH4fWplfo/u/z1ffZX1WmhDvt81pq1+PRX3t9yFJJ6cHHB6Yx0zjuP6YNIM4z7npxnB7foevfNLknk9f8AP+T6mk5I56nryf5j/OeM1HvS21s/PS9vuSfb8g/z/rffbr+ooPY/z/z6A9PTpSdPYCgc4J/D9Rnt17cdOe/AfoCD1zjj3PTIHHvx3p2bsu1ulrbXs+traNX6+Qklf7tt3rt+LEB7Eg8c8Yzz+WPUetIcDuOOOfQduCPx4OfwFLgdABntzjAz17eg59jyaCOD09MZ4wOnUHHc8DA4/EV76XT0dn7unu6q199X0va2i1NFFK2rW2j0u9O1/u8tWrBxjqOeck59s/hwP/r0fKeMjkdj/gSPw579cmjAHsPrjsAOev696Pl9PfkDtj8T9eee/Snd6NOVmr7WbvbdWd7X7dra3JXzt0t/2718u2mqWzdhcY47AYGfX3/pyPT0wo/PHX9P8aTj8/8A9X/1vWlqbyunbVJ3W2yWrVuul9dXtbQn+rgSTnjP+HH4Adu3t2oDHGeRnt34zjr+lH40n8WMdic5PqvbGPXvkfiaWu/W+93dfjt0v97D/h+t/wDLz/UAcjJ4+v8Anj/PHNJnOeQP5j688HJH078nhT6dT/n64HX9cZpuP72Pxx6DHOD6YPfvxwAKz9L91pdrZWbfRX7/ADvSV/xemumj07Ppd+m4pPHUenryfyHT14/CkHJ6jgAnHJ6c89/fr26EA0m3BJ2gjgYyc9un+PB+lO6duueOPx/Dp0Ge5BJpu1tL2eju0uifXsvkm9B2Sst7u3S3S6erelt11egDqTnr6HuOvHTpg85xSjOeuc9Bj8Px9/f0pMDP5gADt74zxnr29cZIKjA5HB/yOM9Pb8MUtW4pa7dErbXs3tbTV/qJtW0e+2my0dr+WnfVbq7DPsfr+OPX8enTr6U7IweMH1z9Og9+QfrngUnOP8/5/wAKQZ6ng85/P+dapba2dtb230628ra/etLT/X9fj/wNLrn8+fXn6n8f/wBeDQc469cY9PQfX0/lig9D/n/Gm9hn68d8cge547Y9uKSb0drO2uqu9Fe6Sb7WX320Ta7367dfl/wdPUXPqRk9c9R0JH/1weBjOeaQk5AzjOMk84Pp0HX3/AdKTGecA9Md85wDnBxgdO+OT9VwMHgjIx2ycd+O5zzmnd6PutVr5b+ltE9SuVLe+qtrbTbW99tf0YgwB8zA89h2HqPX6kgZB60p56MBnv345/EeoOMfTik2A8kc/wCeuMenOP8AA0pB7dxjPoPTjt/PucDBWr5b3Wl3f1je1l8n3ta3UF621Td0krXj/V9NttReMnv+vqPT6jH9SaXGOg9z+J60g4/zycdM9c8f/qHSgevr/n3H5Vl/kt/6+7yE3dt37eV3p6dr7dtEL+H/ANf2oz9fX/Pv9M0f5/z/AJ/pSZwcHv0x3/wx37f0Vv8AP+v621JFpowON3Tjkjj9O349PrSnp17+vQ8fz98/Q8CggZOAD68deM8Z46/matO293fy7curbStvon8u40ru36bbavyt/VhPfd6YOBx9frxnpnjHahcDjPqD7nPOR7fy+gpB06HHHTgg85OM5HbHXjGKMZORgDjnAzn2yOO2f8c1d3bf1eiT0jZO193q3fXp0Zdlbyer6LS1ujvo9NXd366oOcjDdO3BIz+vpyecZ5pcevBPbqBjn8TnJPf06ZoA55A7c9T06Z65B788UhBHQA+ufbGB657Dr78mod/mknrZ3Wj32te7u7323buuitbbfTydnola7823pdXY4c/5/wA/596dnOBjGO/r1Pr756f4U0Y7dM/me/5Y/LpQScj05z17AYx/k/pSje/3b6ae69L6Xtb+rEP/AC/L9BQSOvBB7Z4Hcdf6DPtSDAJ4xk8+/XBHPufQflSZPPHHYjnPTtjv69PfvS44IHf15A/D+nT2qvebTfk9NbrR9N91ts1ayezt5rWy39H+HW+i9bB24PXp3/n+PHbHTtSD/aYcY/E9Rz3PQ9v55QL16E59B6euO/fr3HXJpMBvYjHYYBz0HqCfX8PSmk21eTdtdVeyXL31WjXX7nvUY3W9rNXsrvp13Xn/AMOBwGyWwTjgnH4Z+g4HfvTgQB1HGf8A6+Pxx69vamhRznGe3buR0B+h7dcUbODk+4PTp68ce/NFtFrslfqmkldpPSy79+l7DdrWbenXpolsl1ae7vb8R+AQB24Iz+fA47dug+nFLTRg+h4AJ7d+P6/iPanVm9NOu/3pef6J9+yh+d79e2qX49/lothPfB7ZPHHXA6/WlpM8ZwBx27/n/gOaUHrjOD2+n+e/P06U1e6dnpbrts7de6ta/XsL/hgyOM8Z9/8A9ft0/maQntnBxx04/D+f40nU9M9x9Qfyznt+Z7BMY7jnOc9zyc//AFs4wSProldRV+m3R7b9NFpr3uUo362fRWvfZ9/P+rOzup+8uOM/1/DoD19vWm+o3D6ccEegz04yfT9aXbz0AHUEdc/5Jx9BRjBPA+p5wfb2J6cjnPqKoqy/BNqy0Ste/ZtatLf8w9OTj/8AVjkHOev8u9JxgYOFP1PPPByOAe5B7ds5pSBnoPU5/AHj8c9xx0yaBjgYJx9OMZHPT6eh9etJ36X8ttrq/ldL8wvon5puz16JXvddE7u34ig5/Ef5x0PbqR34oBxzj1z37fn9MDPsDR25x7+nv/Wl/kM+v+f6dMdqzipXXda9dly28rpWfy1XeH6W2t/Xmtb21fqBJHQZz1+nHrx9PpnjFGMg/r+P+e1BPJ78fgO+PbHTjPB6YNIecjpkDp/n256fXnjUNPus7221Xn06Pe/4LkZxkDPb88fX9TTSB0Levt64Pr0456+lJgEZ4GO/0z9MDHTngdOgNBUd+3XPGTxnuOvr69TxigpRT6tf0tb/AD23T7isM8ggYx36jtg8ge2e/PUCk+8Bz+f1/P29weeTmjg+nOB16dunIx+GMgH3AQoHToB2Gf5EZPr0J4zSbbasnfr/AOSpq3W19GvXZsbVlrvpy+XwrpZaba9kJ8o78HHT25JOc+3HP6mpBg49ORx/h0/zx1poCnGRkc8dh19s9fXg/kKFAGecjPTPQdcDr69aS13VnZ2TV7ptK+2j5X8n5WYpNNdbrvfX/gq2u2t9+rx9Afr+P8//ANXIpM9f8/iOfw5/+vQB/L/Pp+OPrR/k9vwHXr/kY5pcsvLZfjZvZW6JdexAh9COv4dRn27elHTjoAOp6fT8gfpSg9QTjHTHPXGPz9x7YPdhBbHTA5yMc59Af0PQ9fSpjdvR26beSezSXbz662uUldpPRf8ADd976fgxexGeeevTOPfPTHI59T1yV47kexPYjjPHv+R/DDDgde/XjoM+uTg9emScZ4PNKQueh698c5HYnH4AcjvnGavtq3ffTToutlbzs9G/UrlWi1630Wuy0btZX79L9N1KjOQwPrkZ47Zz0475J9+9ICCQODjpnOfr/wDWxx1HAFKMYOBnOefXn15P5evfmgKBnHXpnj6/4dfT81aTTTst0uja03SutPy063E9nvpa17Lold2XRNLq7O1twGc9gPTkfxY4GcHOcnp1HUjACWOccehOf8MjjoeQM9CehjkfjkDvyOfX3I/DmlAx3P4nP8/6VDd7WSXSy+Vrvrft06tsm/ftpot79dNfxF/z/n/PFFH+f5/z/pTSSD7evpgE/wAsfrj0CSb26K+ny2t128/mCV9v+H9BT+Xv6fmMf5/I68bgOxPU8Yzx9M549KOCccc8cnHU4xg4HY8/XtTSoBAJz19DycdTzk9OvUn6Cmo+dm7/AGbvo9rdL9tr6vq0r91byv69Oj0s9N9WGVAJyB3OSoHoBnPHAz0656Z4U4weR659M9D9cdO5pm3j5gB14U8Hpwd3GSO+Ru657hwXgdv9kY7dAe2fx6cEnrVaJq/RxW29rPs3ffo90m0gaVt3rprp2aT3dkuya2FIx74PbsORnGD2z6Zxj6nPIHX1I4/kcnnPtnIxwKMenv745yT278Ec9vcUAcZJ5znIxjsSOPcc/ie/GhStzJaNX72uvd36dO7177twHXIGDjr045zjGcnge49+k2CNwB+bOSeCG5bB449Rzkj37RA57HHzcDk/KM+nJwMj/e688yrxx1IPXqOeQRnjkH88/WlLazv5JK70fXvbz+8l6RvZ3s7dU2mtr2W3fS3LruPGCcdemRwQeTjrx1A9ehPpTlRnPAyMnPGCCMKO46dxj+6egpg5bjqp9PX8OeDzt5/KpssMFOc/Mepx0xgfXB79vwS6fLmtbvFvXu116q616KzS1uk7tb67PrZWejX/AAEZsa4wWI5CjjnGM8njnPXqevGOlSUxZFYL64HTJB6g+/cDkDnqM8lccjkj29fbjjtz/hjClvHay699fz/rZMOt9l007f8AB9fNsXv245H45/8A1f8A68Azjjt/L3Pc5x1/PpyHkH8v6Z7dP/1UYHGeT+Pbv/j7474qEno10s2urSa2tZfJ67PUX+X9fjqGQecj0yPw/LJ/PjJpemcd/wAP8/rSDgYH15Hqfw/+t6Uc9P16/p+fr05pxTUtNl8tNOnzTt/kP56Lr5X/AKdhf89e3H6/545pDngDj39Me3HXpQc8YPXr3x+Q/Hnv17ik56k4Gewzx156/jjA9+atXVr20TX4pfpv57IEtur10s2+nyfe3lr2DnqB2zjHc57569j160AHrye/PHIGM8duvrx1z2Nrf3j07/iB+HqeuRnr0CPc89R64xjnjGT24yfpUrovT7L20vd2Wj9Nbasptaq62Wtrvppslfzt0V7MMdff68/gcgfr+XFG3r2PQ5z+fXIz35zx37gBxyRxwOvbP0z/AC4zS4PHPt1x1HXHQ9+vAppSvvb06rTpfp6aaW0tZN66Psr23s1bt0W/fpYMD0GBnrz9fXn6dTnPc0o4759u4+v8s89O/JJ29+/pj8vX6duPQxkHjP8Anr+H1HOD2p2+WmlnqttLaq2iu9vLUn8hCTkAEAdfryMjvjHtjP4cKfX26D8P14/U0dB0/L35+nP+e9NJ5x3PT/630x3qvx9P+HHvt03/AM9r/n12QuOuCc/y7/l/+rtgJtBwfTgZ9jwf/wBWOPag5GQDk+/v0APH4enTI7JkkHnnPIx68cdPqOmO/rSafo+q6N3V09/l921xpPpe2ibW6vbyvbt0831MEAZ59gOMYx29jn9BikwTzg+xB6ZGcDn6jp79sUYyPvHB7EdTnPHP8snr1pwB7MeeOTx+OcdD9Pepukvw29L6OyXW6S6pvzu9kr/LS2itft8ls7JasNvXr+mPy6enboAeucKRnr79OOvX35788/lgx+PGOcf5579qX17f5/w+tQm91sl6bct+z7Jr7jNtu3la3lZWDgAjoOvp6+mB/X9aABgc8cD8PX9PTvS+vQ/57Dv78dPSgHHGAeD/AJ//AFccdjg1pfbe+7XrZfcr6emruhCU0HGeCOcfU+3T6D2A9OHU0jOfz5B4PbHYgen5ms0n1T89Htddv6072GrPfy+Wq1/4fQCD1z+vHvnjHrzjqR2HKbTnjI45Ofw6e4x6AcY6cqB0yT09evPQ9en1/PJpMHsSB2AHbp3xg9eO3Gegq4p6NL166aLp6Np6q2raZSa6aNLfpryq/pu9b9xQO2DwPbjPXnrySBwOvTijaQT6E59PfPQ8/ofYcUAEkjJOM+gHQn3ye4HTpnoBShT6k8HuD0z3xz6+/H0q+nn17dPn36g5Pbuumn/B+Tto+ujYPy+voP1/PkEmgY/DH/189Oc9/wCnNOx1xz6D/wCtz2/LHr1MBhjge+fx6ckY4we2OT6TrdPRLqr97fjf79urIbv/AF/WvfuJx26enpx9Px6dKM/5/Xj0/ClyAOnPTqMdvbPP1HsfRo4zkk98cdPYDnHb68/VtNvey+71vr5aW11+8/T1/wCG0+W4HocdccfXHvTQDgdP6YyegH0BB6HOewwowehOMH9T155656//AKz0Ock9O4756YzjnGfwxU3bT6NddU7en3vr5K9il20Tvo3o9LfcktdflfojDkYz+p+vQ9ee/UdOeKXYc5wSM5B9O3OT1HHTPTpSDnJDNnr2B654/kT3OTS4Pcn24Hf6ehP049OaV5JJXtffTXaLt/ieummrvZXRSdlZ/c9dHbok7ddG991romMAZ4wc/wD18DjOcYHPoM0uOdx6/wAuOfT37fhRjAySeOTzj04HT8vf8QoAPPrn16dP1wKSbbunpezt/wBu2trez69XptcTe7110dttOX89fX7wyPXvj8fSgHOeCMevf6U4DngDk/rxk8YpAck5HfoD9fUcZ4I68VS5rLr8+l09emy31f4k/L5/d0+/779A9vw4P+H88/yoJ/n/APrP5fn0oPHtzjn+X1/z7U0k9AeTx1xjIPT/AD6DvSs9HqrL02tv28+rS0t0Fq0v8/6+7UTjcOPfI6DsOPbHHpycUpB6AZGBx+fuMfXtx17NYEfxHk8eg68E59+vtz7GG4+Y8jJOQfTt6dO5/DPLs7J3T00T0dvdu35ff8yktE7ryTv3T007728lrqxcc9G5PqMcEHP/ANb8BQFGMY/Mfj6A/qO9Lg8fMfx9uPcYI6A9OueoKgNjryPp/Xk9MnGOtHvNq9nbq01ta3TR+nbXSwX0ettrW8rfivlfXolZDnGDkcA55J5PTjrn6jr+SkAjnpwfX8v/AK3rxRzn1+v6fl0x/kqcdhjj14J9vTp/hU3dlrqtGklttpa9rtfirdLzfbunfy6a+unp6BSHPbBHp75/x6+mKUdf8j8/b1pD19h1HbPUH9Pftxzmlp6977dLa9Nb217J6XD7tl+nb7n59Rjk8gZYHnB47gA9c8k4A6glj90HAWIHGCDzkcEdB0zyPqcgjHsRskkg9eSRnJA2n0wRkc8jt/tENdWIJz0BC88HGDxxtzgY7/LgfLyauNrrRau7vpe6W77ttXfdX8ikk3Fab6t7Pa33N6r5taskK4JIBz0A6DsPbHp19cDikC+ozwBnOcH8ewx+pHI6HJJGSMYz6dCfyz2yc9MYGQvJHDHk56ducdh+P+B5m7tutlfe+ytrbf52u2NNrqnt3VrrS+lrL17vfZCBjGCTjqPz759PfH48rjjB5/l6cZ6evHvjtS4bjknJ78e2ec9O3Yc9sCgDtnOe/Q9SeT6D8gP0aTel+z89o9fK+mv/AAJb0Wq36b7LXVK1tlt2W1w/yMfn+Pc8UAYOOq9CO4Ht6/j+dL+A4/P6f/q56+lOyO4459D6emMcde568HBFJWt92tuy7drW6vzJGgg8g9vzzx/j2H5jk/z3/wAimkdAMgZ7fj/Xp1x2xSnOP5e/HTtj/D07Du2u/Xy+Fu/fz1Td/UOvz3Dn0x754/LIJHX9PwaV4x2yOPQc9OBzzyev17nJOOc556dM5HP07c55pcH+8c+uMjjtj8eOvTAxjFJJqz1Vklbftfvbbo+2l9HWy3Send7Pfqtb3uvRXuxuw9TwOemTwffvjPPftzkU4fiMeufb0OD055/Dk0EE8bjkY9uOc4475OOvI9c0oBxy316ev58Z9OmcD0Fd9dE9rvbTutbre++lvNt6K+/z2dmr3Tuu61v94gUAHHQj16+/6/ypSB3weOpx25OTx+X8waUD64/PH+cfzpMD0Bo193R7Xe2trd3o0/8ALrdS3d9vz6a9NdF2XoH4/wCc+/5fypeOuRj17UEcZx34+o//AFj9eDk0hHB9/X0HbOOB1+hJPWoS1V00k9dPS76fPa2m4fP+tPnp+PQM8Z6/Tv8AT/P5UHP1+ozjkenp27988UYx0A44xn6dev5//XpozjrznnOO/wCJ6HoOM46erSuk9LaJt6XWlu6ta2t9fzaWzut/8tdnbXS/mKVJ55JHT3POB+noPqezcY4wc5HI9+PyAHfJOcnGadz3bHT046Z7fX2A5+iY7Fjxzx6dPTPX64HX1pptK1m9tr/3fTz9W9dHd0nbvZJOyv2T6ab9PO76AVORk4zz39sd8kZ59uTnPNLj1/8A15GMHn8+mTg8HNG1iRyf5DjB9evfOePSlxkEdc5x/k5/lj0HFCu7ddHsrKys07WV7dUui+9OW1muuy216XXbQAOffHPv6Z6n1A/U+h+PP8+p/wA9/c0ZAxnHtnH9evp+PpS89ccdP8f6Y/H0qknZW6K1tEtLaPfs+nloyH3/AK/ry6BSZHP6j/Ef5z2pfw/z7fypOmcAZPP1P+fz56cmoS0T1vrfa+jXz/Bvy11P6X/BEwdxPXjsMd+mc/TOevQcUpBP0P6c9j+BwcdfbomD0GRznPt3HUnPfOOvPXmk5wOev4cY7E5PfvzgcCrV9NFoktf+3dfVWej0v02RVrrp0u7+iXkvPro+mgYJBxnt7Zx6Z4HsR6dDjk2k4GDxyCe2Oemfz6EY44GAgBOQCVHpz7HHb+fXkCnYI/i4/DqfcYPX0+lTdppK2930tFJW1Wl/w6XSKcraXX6rRW20b/BpWv2OevbtjOT2AxwBz14HPWjsckDOOeBn659hz25xS7c9c9zn/PQHgHHHoOlL17dO/PPf1/w6HNNX92ydtL620939LrS13d7Nk3t8unVWta7tq9LNPqttEhAMdx39vpj0GO3tn6r/AJ/z1pccH/Pr/nHpzg4pKST00tffo7KyfRW7tX16EiE47Z/z/n+vFJ6ZHUHgeh69s59Rx17nFHqOnQgjP0PIHJ79ye5x0QZGASSeue3oeTnOM5544Hfra2TtqrbPyT1SX4a30WhSW217+fZPfbS+uzVtxQO2OPTrn8x/Xt25FAzkEcYz1HfP69u56c880mCDyeOTnuMEe3Occ+vJ57mCcHccY+mO/vjnOeQP0FF3f9Vpr+i3tqvLTekuz306vdavXzV+lkr7WTUrkEY55IPU8ep6/nxj07Jt5U4wBnr+h/P3xnngk0uDjljn/I69fcc9+eQcqATjJz2PbjnBHTB7f/qFTzNuytpa+6vom7XT0319LdROWlk79Hdt9Ft07/pa4mM/pnk9OxyBk/j19eKXA4/H07jkc89OwxR/Lj/P4cc0ZGcfjxn6849ffrST1Wmq0272ve21l6dF0aJ1+63y2V9Pl59NwAHbjH+eP8jPJ78rx/8AX4/L8xz/ACo/D/P+ff8AGmnPbr+HfPr9M/h3wRTXTRX17b6Xb/4e77WegtdO76+bWu+r7/1ZxOc/Qf5H5dMYGeKTGT+h9+4x9D9CD0Pq0g9ckY7c4xnsPQZx0wcdqMHJOT0PTnueP8B2Pfpmm0le66fdddvUaXVPtb1utOt972WvddBdpPUH1HsB3PGD3z1A7dTQVPHHvj19/ce+Pds4xSYORljgdew4z78cdz9c9KNrdQx+me/oevA/HPTPcwm9NVZW2Un206rT7+9m2V1XvJdtOrs7JPps79OurDb1GD2yc9s++emAP8BilwO3rnr19/6++Bz6Lj3PXP8An/62O/biloV3bbz17JavV67W7PUlyfR+btffre/5bWE4OR+n1yf/AK9L+I5/w6fXj34/RR6YHbHY8nP05B6n+nKDjJ9+PQZ7Y6E//XOPS+1+337a28nb0F+mq666f8P8rBkdBgkfTp1Jx19Pw68Unr2H4fn+PXqfw6UEDJIxn155+vPT/wDXjOabgD6AgHoB0wcjHc4654IINJ3VrdFqvuX9Oy66oNOl76aW/L5+S0/EKk4JBPJwB6ZHQ8fQ9fXjsEcjggdOOeOecc8nJ7Hg5ODQ3XCkn0+vA6844J6njjpxQQ3HJHByePQenHr19zUpuytZ79HpbyX56ttqzasy1fTXo9NtPJW123112TsBU8jnHQc8j2x0xkD0PTNKQR36++D0Ixnn3OMd85ox33YH5+g79PxHHPvS49246c/r746DPbtT1SV3ayTtu3a10+m76PXbW4OT8t9fVWvvt00V+uvdAuOMnHp6en0weenfPYGlx0Gc4GD+P+H5+/XJjrz1/wA8f0/Pmgfr0z64rO/dt3/S3Xz/ADSbuRfT/PV9Nbvv5bW+Ydce306//W9qM9eo/rjvjr/+v3o5yemO3r/n/P0DnjHr+nX8M9Pxp63t1dvJq+r29dfIOvTW3y2/p/MBgE88nGfTpgfTP+HtRjvxnrz0B/Lp/hnrmjnH5e/Hcdznv357kUmCepz04xxnvnpkd+v4dqdm3r0te7vdaaqy62to29NxrztbT5rTyVrfls3qJt/vZJH16c4z/Xpz168rtPP971xz/XHGR049OKTByMk9Ox6cfme3rzycdCpzwBnHXnPXj/ODj69MNXur7vW2qsl29bNW2f3Mafn2er6aXS2Su7qz0sltZEQzkADjJGDyeWGR1wDj2weBypJqQgYOMZAI69zjOevOO/X65pnVRhmU/PjGOcMMEgAcjGMjtxtA5p5xtIOQccnnJJGQM9+o6dvoaqXxJ7Xer+cU9t/O++vkPtq7p2tZpNXilfTqnfVv5aJrtI3c49OvrnGPbnjHPTPNKCMHHP04Ax7f4+voKXHBPOR+vXqenqRnj6UhyOgyO+Tz78HqPx5p66/h939f1vD169lvporN67N6a6fhobhjJGMjGceg7E4HXjnnOcd6se5GDjrwAe2euf0ODx3qDnHAxwM4HuPpx/nHJqfhuSRkEjaD745GecAEdT3yMGlJ+eq1fXS6beul1urlPZaW6PV7e5r0Wvnda6dxy9fyz+LAeh9een1wTmYHJGRt784OMEdT07+vTrjOKrqPm9M4x64/H69OwwKfkggBmOD6nnODyQOcdAcZHuaG72s7v3X17rW3zfXa1+lp07X2u9V239NVfre+5TAUAYwAB7emOo4H+RS5/Hr+hx3wPrz+dNQjkAcADkA4yR39D3x1A4p3QDHPtj3PH4ce2ODjrUybTjd6Xt6bSfe2u19PyBbr16/rt+gtFNIOcliAOo6frweff8KdwTx+Hv8AkSef5+1KN7pr0dr7Kyd+m3QHt/w/ZafL+ugUUhOMjvjOM/0/z3FLn2/z7Dr7YPPWkrro1rra62s++yvo/PcQmOc+nrxz79unHTPvRnI4/DPf34/+t+FBxg56d6O3b06cenTI4xx+Pp1au2vi6eSS0v8A1p0fUd72v6eVl001f6fkmWJHOVGePz6Z7dOc8nnGDmnDJz0yfqc56HPGevr1P1wbeOgx7fiOR0Hbr1zRgdu56HGBz6/THbBPcc1eunR21Tv3XbS+vb5b2G10WmiWmv4d9b/8AUf5/P688evXpjvRgHk++Prg9vTt260Yx1P4e/X345+meOBzQACV5P0HfJ6H8OnbPXuaFfTS1k9r9GrX8/z+bELnjGPcfhgE/TjnHv8AUNyee55/H8T60pXGME49Tx7c+v4DqPYgIcDJ64z+g7c/l6/mKfvaa9r9r3Wv3N/8OH4iAk9sY9f6eo6/5NHufT3479/w64PGfoA56D8z/wDr9vz9qOfTPX+Xv69sdjjjFT72npZ6ryu2+m26vp2Y2te3k36fdv19Ltie+T7Y79D2/Lp06dyUGcHjqScEYyD0H1Pqeg5PbLuR+JGc9h7cnnsB054Hel+v+H5ent6UuZu226u/LS+nTzei0BPyWtk/RW6L0179LCYzgn0HIxwfbg9fXPb60uB19/5fr3/ImgDHY9//AK/9adheOSPqO3X9R0xn6VSd7Pbp235dV+S79wu7W9fxt/kN/wA/5/Hj/GlHbsOe+D6+569Mj24xwYzjJIP6d+Dz3PrgDJJ7GkGDk7uOg4684PT+XOe1Qr30TX4dm/lfTo+lxB69O317/wCf88GR3wfXnnJ9Tz+XT2owPU/5Hpn1Hvj8cUmB+fWhXut9EtVfVKz176ffpv1O/wDXVb/1vYM/5Pf/AD/Ok5GM+3bPsM4x6njkDtzjK/h0/wA8YzQMnt6+3T647fX8OlaK9l3sr/he/mNei0/Hbv8A1v0DJ47g/wCQenT+We/Y6/8A1x/n/PGM0uCMY+v8+frn1pQoGckjPPr6e3TH5Yphp6W/HX8Hvr+HdpHboO49enoR2GKXkEZ6Acjofbn/ACf0wbQCTk8j06ntwMn39/TpTsKcHLYPI6e3J5+nbJHHek726X09N1fX/gN/qX7f0+u99brcTHGcdMfj+o4yOPqeeKAc84x17e3cYx+Q+uDnAAO5wDz6n8MduT1zjp2NBAyOc464/L8euR+oFTr7u/notNV06eXW2ohBxkdz7+/cdPXt2HpR+H5fy7f59KT169/X27fh+POKPy5B4I7+h/X6jp607tWv2112t66dbN3u7+Qf1/XoIScjB69vXHXnnH+cc0E4/QHk57/l6g9/ypcd+M8dyfrj8M4+vNBA79/6f56f41n8tFr0W9t7eVvPq+yd1p2/PVXT8u3n9yOcjuPX+vpz7D3z2pf8/wCfy/wo9OfXI7j/AD/npS4HHPXPbP079/w/Kktdten42/PQV9/6tbsJj689s4/n0P8AL65pD0z7H/Pt0+velA9z09c49Dk574z2H1oA7dRzz+HBI6fXn+fFpN6O6S5fXZbdu77ffc/UQ9RjpjucnPHXpnPP04znrSjAzjvyfrx+n04/LFOAGM7s47Hrj26/56nqaYQCcjOPQ++Oo/Q8dyeDRaSTdkrW6K/S+3R6/d0He9umy06/5sXjj/DPr7cf59aaT0ORt79TznjnkdfXGP5BOc8A4H155GPX1HTnnp3OSCMDPPUcHnr+P1z3pbbtJaLfX7N7eeq0+7ZMF37b2te2mq89fk/nZOenQ44btnqeMY7H3796UE5AOCfbP4k9vp0/U4XnuBn9D/8AW6f4dMrgdzgf1/Dnknt+vNJPbRb/AIu2u+nTTRb/ACd1273t91/u6Ky+TsJjJ4PPGeR9ec9O9OAJPH+cdxyP/r/hSADPpnvz6cUoAxkk857e/vjI4PT8T62rt66aW21vpd6r5XJ+/pv6fl2AY564BHPIHXvx0Pb+tHXj/Af5/r9aAB/e9ex4/ToT+PI6dkwByDnPODnj29P8/Sh81r7Na/l02aS0Sbu0gE+vJz+H/wBb8TSnn2+lHfH+fz6fh+NA+n/6h9P8/SotJtaNv/Ky6re6s9+i16n9dxn8JByRz7cg8n8wcDnHUnBpQ2f64BOP8e4yO+D0oweBgYHuc9O36jB6/ToueuAPx4zzyen69/oeW1vo92730e3TX1drLTbtd099+6aXbo3o7dv0djGR0/UqfpkAHA7enpkmk74AOCOSOMdge/oB7HHPNKAep4z9PX144/lk59nY6+3+IH9f89lq1a10vPqldPXtZWto0nbS5F/w21en9f8ADieg5z36dPXnHA+tKMYyc9ce34kf5x9chAecZxj68e49fw704gdm79Pz57fy4yM+tVD9Ho+qaX9Xs7gJj6cg464GBzj6duopDnjkdMdPrjr1456fTGOFwOAGJH04A7n16daDjt/n2P09eM8/ha0Wun5Wsv1v5WsC/q/T8/1G5IHYkk4/nye/A/zyaQnjjGenXPPTqe4z37dacfp6df5/4UnPJx9Oef8A635/rxU66X3T12tq46dfl1vZ+Y1v03v0V9Vp2t8vw2b8w6kf4fjjj8QR/V3UcnHpz+PcfXjHTrSehxgnqcDP64OPw6dgaXHIPpn9athf5W209NOvm/v7hz6/kMf1PH+c9qUf5/8A1n/IpQB1zgjn69fT04P1+lAA6lsc/keMY/z1+tZ3+F3XW+yS+G6/r10Qt/66dBNo7HnjjOB0+uPbr2Ax6Hp+P+f0+v8ARQo7sfzzjOT0PTB9ue2e5jjOefT2Bxzn+QB49KLybTsvy0vH1+/qugCHtx7dvU89uPz7/gen5D+fH+f05o6e49/685/z1poY8gA46HOeT29cgEcn3z2qbN7aaa3urpJadu1u/XdMP0DI6AjOe/Pf69fQfhgdm9CWPUHsRzkduvbHc8Ekc04kdwMkkev0B59D+vXBFAPOOmDyOfrnp35+vB4PFCaXR2tq/mr7W/N9NtSr2Wz13f3Xs106P5Aee46jA98npz1PT8D+Dv8AP+fy/Sgfl9f/AK2f0pRj1I98Zweff2/n6UK7snttv0Vrr8vzJb0t/wAN0/X7353G844+nP49c8/4+uMmnYGB6555wPyHPf1+mcZC7VPcj3OBwTxjBB9sj8aQjBHJx+HI9fX6DH54rRJ6baK35ar5r9QE2rwOhB+Xqc55Hp+QHTHy8UZAB4x6k4x1/qcdf60vHHJ9wRnB9R+Qx9B05pDjnv6duQcj+Xf1qv69Q7X2/rYPp/nPWk7jvj1GfX8unXp6UZwCcZ4/Ln8OcDP4EUcYz2PP1/z7/jU6uzslbpvpddLaaL7+w7bebt+X+YnOTj2/+vnrjjGMevQ9aCT6c8DpgfyHt16Z6nGKXJz04GPT1/UfX9aXHr05/wD1dOevfH60tfd02WquvR73VvnfW2gX1V12vbtZf5eT3QUUAZyORgdevHfOc9Poc/WlAwASecH057f5GOfXqRCT0svl0aVt193r+LX9f1/XUOMdeefp+J9+3+SD+vPXqPT8/r2PABpQBtySc/z647ccj/8AVmkCgDJJ57Ht9B6dcY7459NFuv8ADp/5KH9f1/TF7EtnIxx/IdOB16EfypmcDp7Dg/07f06dqfjaD+QHXI/QdMYBxzg8dC0ZPXj8fr+n+Tina7V0no936X9bdL7uwCHpxjv6dc+v1/Xpz1QHrnGOQfw4OewJ9Ocjp6l3rx/nnjr9P/rUnXqMd/oePw5znI9+Bik5NJaK+t9V0etv+Hvr5FJ2VvPdNXto/wBF8/mIMdAScHOTz15/X/H60oAxx0P5c/0oyM4PfPT0HsO+Pz/KggEYz65xx3/Xnr/k1nfZ3fR3ffZ27tfJrrqrivez1V7PrfTS+vz9Ng57/wCf8n+lAB5yR7cc49P8/wBcUuBjqeB/9bkg++e2fY4NJxjgnnj1HPfPXOe3QUvn0XbbS3z8tHoK/wDVu35fqL+Zxx/hyfpxzQAoOcdev+f14PPtR+f+f8+/vSjHOT2OPc9hTi3e13bqt7rT9F032sAmfT3/AM/5+oprdOuPw4x369eP/r4GaXI/L/63f0/wPoaDnHHXtniqV9LL1t10i9enbXuh7NfLt19dPv8AmIDk5/Dp2Az156nBGTjHvRuPPBJBxj1+n8+h/Lml57fr/n+fB/HIBnJ6e3c/y4HTj1/Cld6N9Py92+y0vfS1n3elmdr/AHX7W7Lrrbz3e4ZyM9R7Dr145/ycfhQvQfy649vw/l1pQoA64+nqc9evTH16Y4NLhR3PPPT/AOvzj8sDg8YprbTTVdd1dWultutUtd+uo2vy38lbXp/XmIB168DoeePf6d+/rnkgB6H/AD9DSgYH3u3Q9epxz+GenPfHUgAPVsYzjr7574/Dk57Ua6Wb0V9WtU7fJLfe7X3CEGO//wBejGfw5/n/AJ/r1o4wMHP5+uOvf8/X8Tqf88n/AB7fz9aavo3bbSy6Xjf8Oi+XQP69P8gzk9eRjP07fy/zmm56HjBPv+BHHU9SPX8TS8ewJ/Pt/L+tHXsOOc+/OccevU9fbmqTvbR2v5X0eun4d/IpO2z0tr31te3n1XpqJkjj8SRxjnnPXg88/n0JpR35B6cj8c+30/XOKX/P+f8A9VLjI79T0H09/f05J/LJXuvJ97LRruvTz2ur7q/9d9v8v6d20A9x9Md+cn/9dFJjHc8H2P6/5+vouAecn6duvP8ALB/EY70at69N+9l93fZW+8QUhIHXg+ueMDAAx9Txjrn6UuOnPv1P6/4dKTbn69B1JwcZHY9hxn37mhK+mqS1aXor+rb6PZgKeMcdeM9cc9+4H5/rSd8EjPOB3xnH0PIYAjsPxKZPQHJAySTyc8fj16ZHGOcZpTnGQBkA8f7XQ9ffPcc+nUUk+m7sr3S091LyV18/UP8AgfiJntke/wCmeOffjB46kUvXkfh06556Z9Bnn8iKQ8c45xzgc9unr+P+NOHTOOOw9cflj6fyod76XstdOqsuuze+/wDw1aJKyvrv0dvLfW+v9JN5+vP4+5HI9QPbnk8ZX9SOvvx+maX3+v6//qpcD1x3HHXue/Bzwe/II61Nm3bazXSzXnb5K+u/qK/p3+enXf7ra7dCPAbC49TyQ2cMcg+5zggDkgZ5GKfgHj6cfiOMd/y6ZxTVGOc8NuPbjBHAHpnjOOn6u45ycDjHBP8AL8Kbbcrb7eVntfffotfR6oG3zaXun5p38tX+Ye3T/PU9eowf6eisAcjGAcH3PT1z/wDXH4UY6Y9MHpnPP04/Pk4zmjPXuORzn19M9iPcZ/CtFp52fXrs9180mtuzsC3Xrr9676ff13FzjcpAzzgnvjJHPVSTjI7++eZNx5JGM8nHOcZyTjpj3HHTvUJIIIYn5sgAE8Engdhj3/ReglXIyp5K9z1OefQADORnPJBzQ1ZeWl/w3fZ6K+u+qsPps/NJ76x11drdXv3SeiUinn2PXIB9eeeB2GfQkDk8vZRlSP73PDZOcYx05/XggAHo1cHqOBj+Yx0/XccYyBzin7lypPAyDnGfl4PHswPTPfkc0bpemuvo153879dhLdXvq9et9V9/3GbGuM4PQAnkZwQvyjIXJA5yTkjOMdpTxwPzH8+f/r81DFg5wBjjrxhs88ckYweevPHHFS8/5/kP8f5ds5Wstr21+5W1209f1F/Wn3/1+ItHpjAHoOnPvSe3PQ8/y9Of/r0o9M/1P1pJ+dv6Ser2v89VtogDjuP85xx1/wDrA80YABx/FnOef/rj9OO55pM9+T24GcfkM8e/8+oO/J6+nHHXr+vXnOMVpG+m9vSzfw2fbo16B+H3+X/DijqcDnHPcHr+o5+nHpQCOn9Pbj8z+f4cIc8Y9eeg/Hn0/wAmlAzUJt2t0XR7rRO6V3/mvuD+vu/4H9aCj/8AX6EcH+n8gKTBJBzjAPHr/wDX/n9TyfPnAxg9OevY9+vXGcjnjnJpw3emM4we5Hbnj8h2GfWrVm0/K9t+33W07dw/r7/6+Qc8Yx1Jz369cenGcgYAGPYhGMe456459+OozwMHtyerfn/iwOex68d8d+ep5IPSg7uBgE+3T3wR2z9ec+pNPrZ77/07ef8AVwAt0z64Hr/nnJPfvkgYDjHY+o9Pr296TAJHsf8AP+R6EeopfXk+v+RzSTvb53V9em1v+BumHb+v8rfeJ0JOM8YHT/I69fb2GVHv+GP8/n+ftRxx7nt1/X2Hf0ox/Uf48/z/AFpXbS0t23V9Vfa9lq9ZLbbXY/r+v6/QTOc+oPPr/n/6/vS0YP59OevJH4c9/wDAUYP64x6/j09z7kc4qEm9r2Vt13te3rpbVaeof1/mFAycAkDn398fT+mTjvS4J6D8zjmkwSCcDHT+XUZ98ccdPemua63Vtet2tE15200Eu+9+un6ego/x6dcY/LHr+tNIPbjv9fy96Ug9+/T8Mf5z+RpM469B0A5HYDp34IwP8Mu0tH2tfdvpuvudlbTca/r+uvoLSduTjHX/ACc8d/bpmkzznnH9c47dc8Y9qO/BJORkHsOvGPbnP9apX9Hpfz2vton2626Lcdv66X00d9Fa+t/QUDH+f8/px7UAYGB+Hf8AyBSg+nQ/15/wx1x2wRQeM9OPf9TxwP5dwO6bdr9d7NW2XZu+lr6fcIPc44/zn/Pv+K5PT155/nk/Tr9fejB6YHPUZHbjv9enfORxSYYnAxz05/8A1fXr1BH0lOTktGtdvJWve+/S97308kAuBj/H1GM+vqeOO3U8UbSO4OTgD0PfPb0H5detBDYxgZ/Lv1wOfYZyPTqBSHOM8egyevufp/LAzV62vo3p6rv+Wlr6202ufqGfUjGeBz/U/wCcUfjnHH+fx+nrxTTnHqMdCQD/AIY9fx6jijI6E8+n58YGfy57e1K7b63v6WStutbX113+QavzfkvT8/6bYpI6Efy556jnr9OeOnPIO/X8fx9f59Pr2Qc+/cccDnt7j3/DvSg55/mMdO34fjzml71o6PSytfV6rSy+5bt9UNr7+vbbReu9/wDhxfp9c/57/wAu/bJS4PpxyOvOf6d+eMUnPccev+R+fPB4qLN9Hda7tf1+vbQQDjGOo4z/AJ70UFXHYcD/ACc8/lz65ow/PAPpzjp1GTxxz+WcejSb9LdtvO35Nav1vY/r+tP6u/IPx/P69P8A9f8AOjnGMccnP5ZHX2BPFKASQMZx/LPPIzx9Bn68CkyCePoe4HTj/P0z62rtLaysumq93ffz7Py1AM9R/j/nt056Ck4znBOBx0Hpxz3x7fU9aDjqSRgZGBnI4zn26fz7UZBHB6ggcf074oSl7rvv0dl206pWV7/O3Vhb87X6AeT/AJOMZwfQZ9/TpmlpMZOQfbrx/h+Puadg85xx/wDX/H8uO5xU2bXTR2eu1klqulra9fIBpHGP8/06f/q5xS+ntQc/y9+v0/z64owxHA55xz6fr3FTaXW9ttfl+Git6eQCZPVev49s/lj8uvrmncjB/L/P40AMMnC8dMt6H26H+tIMngDpnJ/DP0/E/wAul2lvdq9lvtdrS1tNe3TtswXJHf1+v4ce570nOcnpzn1yf8P8Rx1oPt/n9R/OkBGBn6H2P1yf19u5qU5O3raz+5Nrs++/poH9fff+v8tA/L1574x3wef8KQ57fjz7/Uc4Pt9eBlcgcZ5/DP8Ah+ftnrQPx/H8OnJ49s+tOKtrtfzvp7t32S0bTfey0sPazt16/J6+Wodjxzz36+nQDB7d/rThzxkDI7+vpnt39R+hpFySOBknHtjsemM//r68U7BweOn0HbJB7/4citfu/q39fcL+v0G/l/nsP89qXv1wOfoM/r7fzo2secD19eOv58Z9uOD3AGyCACO/68fT1zjjr1FYq91e61Se6/l39NLPz03B/P7/APKwg7Zwe5/zn+vNGc4GRx/jz74B+vejBye/bHp1Hr6/0FFPV269X5/De/z9X5WsFvy/rfr+fnoAAHb19epzjHYAHHH+Qnv6fl9f8+p9aMj/AD7DPHr+AP6UAg9+nP5fTOf85701zaN7Wfra6u3f815X8y2l+39bbh/np69Pfj/9fso59Rz+PqO46+h57Y9SjPcYI/z3H4/4iknJNb6Lr20butdPPd+qsAuTjA78Htxnv+ff6A9QUz/n6/1/wHpS4YdvfOe2fx74/PPpSehwM4OM/l+H+PrVNv3enWXe10tvN+X6gJ9D37f1/rjBpR27np0//X/npjigBjnpx7+46cDnr+OPWjDc8DAx1yMkcdPQ5+vBxUpN21Vt+21r9E/VrS/W4fh/X9f0ri9/X/P8/wA+fUUlFH+f88CneWl1t300XL9yWnp1VkAUmevp0Pucgfl69aM9+3+f09//AK9HXt1H6DqD78nj6ioSbdkrvT8dr9rr/INtRBn3zzyeg7dyTg4B9+v0cPf/AD/n8PoKKUA+3T1A/mev54yPaizfS/Xz/wA+q9QEoG7gA8fh1wec9B1/l7UANnIAIHOT/Xt/Lggilw4PygYOQSSOnU+38/pwaqKejvbVvrqtL/1p8+gKeeAR6+nXj6dPx55yRwrA8Z7+wH0yR7fh+VMw/QYz1OCCCOOOnr2J46+tLyevfv1HbvyePTkitLaaaeltF8/u697WD7u33d/vf9bp3xg8c5/mPXPH0HfrS9uB3xn1/Mfyx6HNISo4JPIJHt6n9PfPXtim5BPft06dT3/DB/8A1mn6W20/T5BZ9mOpMA4JHOP09Mfnn+lGR69ff/Pc0vUf07/5Bqbu6el7O6f/AG7ddbd11WgAPf8Ayf168/40Dn/P+fwpRkZ469D9Ac8fn698c0mMY/z1J/8A1DpwPxqFe60tbV6WutLv/gWXzuAD3OCORx1I/MD3/wA4O/b8uPyx/SlCsffHA7EA5P8Aknrn1pOQe2Qf8Qfx68c5HHehXfK9Lb9uqvdfhprtcP8Ah/n6dPkO4AGSDnOPXnjJ9cH35PfFIf8A9Wfy/Dp+g/FGB4B/Dpx1wf8APPNFaX9Ov3p2+7f8AEOQR6Ht6e/0wfx7d6MnJ46dOeuf5fj+FHTOSfX8v8/zpePf37dD065I/nz+Iumlu608le/kv62u/l+fl/Xz9BpwcA+nA5HcD8+R/LIzS4B47Y6Drx6Y5yPb07dzj+v+fT8MfzoO77uBjaeeBndg85HpjnoMA89Rklrva2uvnZX/AB0fkg9L6a7+m39a76C/p700g4HPpngn8uRj6/yxTvX/AD/+uk+bsMn8vx+n1I+tJdrb7ev9dNuohQPU/n/Lgf0pQe3r/wDX9/Q4Pr7UgB647Hvx/Tnj60YPH6/qPbv6/wD16pKWlrLr11Wm/l5b+QAefb06cfnn/Gj/AD3pD2J/Idz6dPy6c/hSEg/xHB9AOgGT+nbPXI+gk99d9HbXdNS6/ctfxs0vu72/rpqO6H07H9ePzNJnH0+mfU9fT2x6ewpAcZB6DAB/px3/AJ8cc8u7/wD68Dp6f/r69qFe66tbWbV9I338l5vXawWf5fkrfhYOe3of8+v+TntRQQeoAOPU9P5n2zQAx6DrnB9/07c9f8aNfddtenRtK35d+q3F/W/9f8EX0Pvzj+nGB3x/SmkA/mM49sH/AAp2CRkDPOP8/wCeenWjaw5IwPrn2/yfofoe81fpe7eifR36dr6fMP8AgP7hpOP8j1/+v/iR1pf8/wCf8/zpPm7AE+voPXH07Z49+tB6dce/09e2PX/Cpte2127f8Ol+ur/Mt57/AIfcv+D8rC+n+f8AH9aCefrk5/zx6/5NNzxnPTr0wfz9e2DjnnvQSMdfb8fz4/MfWrSemzXXe3TptfXTTXdjXpfy9fxfy9dhSOQRjPcn09Bxx15P6Gg5PT8v5Y469Mdv50gBIz0I9yeCffvzj8fydj9P8/1ppSXLbpo1fbXrurWeltevZB262/TzW6+f4WD/AD/n/GlHPGQPr+OPw9ef5UYOQAPw9uvt+fp7Yo2t6Drgcjn/AD+PHPSpV7p2T30fla/a3ZdloIADg56ckHp0x7ZPoPc/UlMc9Rjnscj8frz0P4U4q2BgDr3OD378/kOO/uUCsegHOD1z7fh/Xnjim07p2WlnZWu9vLRJu2+iSfqf0hKQ+vPT19xnpyeM4x357Up464/MUh6cdfm/DnAB45xg9M+/akr3vb0eu7Xd97p66Ppqwt+OgHAJY9SMehK59sdCeD0BPNNPzcgjOMjaDzjjHAzxk5zkjnkgcoSGBABPy5AxnPQg4+nc9O/WnZGQDn1+nOcfn07HIx1ptSWuq1V7W1+HbS7v07Xa8x7eqb/prtr+adxTnjGPft3Bz1PYkYx6cjFL1I/Lt7c9v/r96O2Ow6D/AD+fb/Ffr06du+cfXn/CknJ2u07O+/TTVv8App3EJ+OP8/59PqKFznqMc9fzHcA49O+MnvSgHjvkH0zwfw9O3+NHJ547DqB2x04/w69hTWmt+qv53tq/S979etmAzbkY+XjcevP3gc4BHpj3yRzjAXA7dhgfTj/CgAjqB3Pfuen0688fQYpe/T6f5/z0qX67Xd1bvFLRXS6W1va70BXtrvbUU8dxjOMHqM+2Dz0HHP4jFNwQTnr+H9OOmPy+lLnJP17du9G4E4BycHPJOe+M9OT0/U961aT3GvO9nvttdbdvV6agDnsB65yOgJwDjJPXAGAx/KpsMBwDg8o2QRu5J3L1BzwQ386gDDk8kMcYGRg5zg/LjGMn8BU+QOM54JwO5LEKepz6Z43Dngc0303376fc9Htrv5bFNNW0belk9re67fJbvS/4pSSOB3xx268kntnH6cZ5qRjll4OM49jyMH39Tk+mM4FNBxn34/z+VSldx+YlcHgjG4Z7nKnn8DxU30Wtn7uvW7s300e9tP8AMTa5Vp1evnaPTW+22t3r1sZkY25UBsdcnnJz2Pr+J4A6dKkPXuf5dRnPv6fjUSM3JOCAADjsByD1I5BP3ckjvUgPTBz06/rz6/XocetZu2js3fo+6Vulr6Pp/mhNdelvysn6d9R3T/8AX7gfXuKbnnGCe/rjPH+Prge2aDnkeo9RnsCcY7fXv9MKQQMDGemT/k5P6d/alb8e/TVavyd/1D9fw21f4h16YyB/jjOO2c9f6UuPy6ccfl3/AJf4JgYxgc+3+R+fp7Gjnnqefb9On6/rVLmurJvby093ffSyf+bu7L+tf66/02LR9Pf8u/6UUe/+f044P5fnUrdeTv8AcADj1/Prn9fb/IpMnjJ9j1xk4xj8sfz6Cgkg9AR3PTHr19Of8jlOvoQCMf157+x9fpVxTVtF11+7y6dO+601bt39d1rqtPLcceePcfh0/LjH6YIoFJ7+3fI5/Lv+n4mjHBJwRyR+WO59Pp35xVO9lvsm+9/dvpp0T+Wj2C3Tr89b20/r73oHf8v69uw7Z7/lR+Hft2yMk/z54PPT1TAB/lzz3z/P1OeOlL0ycc9scZ9P/rf0zisrbfroujtv573W/QH2XZb6PW3n1312121Aen6Y9/wH+TyeaX9Mf5z/AJx0pBx04x6euf6GgZ5z68fTtVJtvS+nd7pWun0vt520d9A06dNXf5L+l076i5JyPQcHOME+gPBHr/8ArpeeM55HOO/XJ98ZOc89jik47/59/wAP84oJIGcZPGB/jjnAx/8AXHe1ey01su3l11t6b76XF/X3/wBegUmT0PTrjv19B+ROfyoySBjue/Awe/t27fXpRz3wMe/Ue5445PXvz9VFbbprp30jf+t330Vmlf8Arbz79RCScc4A7E9u59sZ78Z+mSEjg5xyCe57eh9OO45HtS85P+cf/r6jrzn2oYDpxzn0J79vqSc/l1NX/X9L+rDXTay7L73qne1/w0tpdvBIGfcgDIPQjJ/AfX2Bp2ccn8OB+pJx29vcehg+vpz3IB6f/X9zxQcd/ryOn/6vX8/Wobd07WfXs17v57aXewduq7d9dbaaXasutlqLQM5460ZGcd8Zo/z/AJ/z71F23q/TpZ3X6L9fMkM8+45oJI7enp6cY+gx6Y6jmgc/59u/pjg/T0ox79P1/Qf0P60430tp3WvZPezSt33afQF0uvl+gHPGec/y9z3Oc/TgdjhN3UDtj8Dzj8v0/PAQfXv2weMYPfjnkdfxHFB4yenHP+R/nsMZrTXTXpqv8vn+b7j/AF0Vvk/6XfdATx169OhAPPP+PXp6DNJ0x057e2B0x1x646elGOORjPUDgAcYHoSeBnjr16ZMYI45weeMe3XpjPQA/jipafLu7LurWta1n12aut3ptqNpXaXm9UrdLav8+ult7gcnHbPX145x7Dr3708df5/Tv09utNBOTxwQMcevr6EY/oetA75/Dpz+vGP8+0rmbVnt520dvm+zSTtYTvtpa3Tzt972v29EBHPqB0OcdhnIz7+4PP4uPX6cdMH8fekz9OvTrg/57d+M5pR2Hv7A/gT/AC+laaNJfNrr0evfzv8AqL+v6/H7xOvoOnpz/j/Pqe1IemD93Bzj1OPxHGeR/Pmj+eP5/r2oOfx9v89vXGfbkisle/Tp1tZaO977r4vzQa9O/wDWun/AGszLjng8AcH6Drn17HqOnWlblTnsO2Rz/n6/nSMGP3Tzy3vwRwFwRx9O3cEsApw2QD3HQAkY7DJzn345OMGrS2d1o9UtXpy2V0rLRa9Lq/ZGiSajd7Sbts3dQ2e1+3f53S4B6YPX9TnrzxnPb+VL+WP6U3DZPTGOF7c/hj19z7A04ZPqc5/Dv3AOPSnq7Pb89bbp2WmvnrsS153W9/XXXz/Pa7tZKMknp7ev+c9Mf/Xoxj9f5mj/AOv/AJ4/Tv8AjSZGcf44468//Xpc0m1dXu2n96u7dlsn/wAMT/X3dRRnd0yPz6c8/wD1gfU4pT/j9MZOMdOPwHOaQHPc8fmD39Mev+c0pJJ6+vfpx0H+FV3Vv1vp/S1ATJwAO34dz7cf19emAZGTkgfhx759euPbqOtJ2/x/LPH8uM8dOyHOOgPqP/rn246d+opJSsuiWj0Xl5vpe2ny7C1/4IvqBxzn65P/AOseo/Kg+x657fy+nHXjnHpTcHPXPXHQnrz24wcdjjtTuc549/XnHfnn/wCsPeoSd0+rXVW2S01Xfa3TqtWqt56W9bOy76LWy6Kys2IB6nPA7dR75z1+vqR3wpz2GT79Oo//AF/hQCecjHPr69Mfy/8Arml6e1Um/d1t8rprTtdLt/lfRNu6el0+y6Wtqt/0sLnj9Tx3/P8AHuQenc0hyT/P9c/0pAQfXgkdP/1n8wKUn16k46fX/Dr365pOUtF1tst3ot0tnv2fXQQnAH9T3z/nP59qWkOMZ6j/ACD+Xf05pMnPbHHPv6d/1A/lmbN777277XS03S33d+g99fXd77fjr/XVQAOMYHXP+Tn+n8qPxGegP8/zxyB9O2aDnkHHTqD3H4cex56UmD06rjucn/POBzxjPsRJ97dW3Zq2lteu92tnoHr5PXXe2vm9dU+gdjjHTj2weuPb6Z49eADnHTOBjHGeOmPyOPocDikGccdeMDIPb1yPT88nninDkZIwT16fkfw/wqlfpbfo0/5b3tbTyWnlsxuyWnfyfbfut9tNFuJjrk5GOmP8P8KVQB2/XGcZ9ef5e3XNBOPcj+uQPz6Z7UvHc4//AFZ/pSTlp2vb5Jr5dbX8/QWtvX/gdn2te/5oA2cjHTocHHYE9MdvxzmgknrR/n/P455o7cHr/Lr1z6/57U7t20Vluur0jpbr69Fsthf1/Xr+Af5/T/PWk/A/5P8Ak57DP0oIPHPI/I8e3H+HOKTkjkAZ9CeCMEY6/wBR355FNR0jdLe7XXZWfo9/P5MaS3+/T089e33LS6FJ65wB0H+f8D9cdk6DrwP8e3J+mDkHGPWlwR6Z7HOcf1ye43U3GeuOeg9f65GeRx0wcc0lfqt7aWXTlWzWmny6qy1H27XTa72suvXXXX8LXcOSORyDz16dRnk4yePTFL0/GmrnHI/xHryeccZwc/0p36+35+/X0z/LqRT92+mjemuiaa06PZO123fdCe+v47/P+tQzyRjt1/Lp/n+dCknOAeM/j/iAfwP40BgcYODyc/yx6jjPHTJ49Vz0IGP15/H6++OOarXTTZJfjG+3bX/goXyt943HXrzgden0+nX8T1OMKCeOo/z/APr/AMmg8+30pOeBxx3559/r0/8Ar45hN6arTR6a273tr208vNoDcT6gnpnjGeB6AZx0+g9KOePp09/149fwpPm7Yzj8vTnkk9fY4/AhznHpxnIOTxjoMjsT2+oq7tve+7dvlq7673aturbjtr0+Wttvv3svPr1DnuQeOeMdvx/EYJ5z0wKMDI/H1JznkZz+Y5/i96Tkn+Y9/qOnGMHv+dOA5/pnocY9B2PT8e/EylLRO68tbfZfXfXZrTbXcb0677pbbLskuvp53E6A9+cgc+vHrzn070AZIbpgdP8APpnpx/Qr6n/OB/k/5NGQcHJx07/y9fT1/KpV9/Ozeytpo7dPzuLW2i3bXXqlpb+m/kGcjgH6Hj/P16U4f05+nT+vTv0pKP8AP+fyprVxveyW67Kz11srdeu11cQUmcZ5yf8AH1wO/wDj2pCTkYx79vp9M9uPalxyPy9v59PTHQnvk0ktru17tP5pW+X6+Q7WV3pfbz838v06CZYdWB64ycHjsfYDnoOfalBBxk88HA9T/k9+nXikIz3/AEz3OAfUDPHoR3pCMYGQPoenOOv8RIBx2+uBjVXdkn0d9LK2lrKzbt6ebtd3aV7dH00tpfe637dNeuwv6j1yMDA6kcd+2ffg0EEHIJx1Pf04x78knB9fSlOcY6e/B9j6fXI7Z4BxS/r7d/1/z9KlfZdraO62/lu7Wt92rS+Qr7aLs/Nabp6efruu4Pp7HrkgfX07fnSc5Hp/P9P1z+FAPIz1PQZBxj+fTv8ASl/z/n/PXjiiV0la2i12XZ3+/s7p6biCgHnI4549vzA/WikyPbjr6jH+T/P658trSaem1n0dt+22j6bddAXJHcjsOx79x+fbHX1whPXJHrz/ADPPPNJg7s9QRj6frn1wf5CkP3sHGccE457+/OO/Y547Vqr2Xa1/P7O99Elrt37jSV/K121076eX/B2F646Hrn37ZH9euM4z6nGPmxgf/q6dPp9emRSbD04xngkjIx6H9cED29acAR/9ck8+v5c49eMjqY2tZ6dL201Teu19V0dteqKsrqz3t5W13Tvv0621vqri0m4AZ69vUc8cdAcetAz/APX7n/Dvxz+FBIAyc4/z/X/DNJN377fg1/lYnr39Ov8AX3hjnOOf8/kPpTgT0H+T7e9J/nmj/P8An/PcUJNtb2Vr9NNO3y21ejEJnnGCfU9P59fqOnoey+1JzxjByfoO+O/0z7ZNIQTjAA7nJ446j3Jzzjk/jVpPTS2j+fw3v/V/Qdr7fi1p3+V/8txcnPUD+fXjHPcfqD17GcdT/n/P06gU3DHOQM4wTnnHP4deT7cDJFKAR74PBOMgEdfU8/8A6xU63S3ilrby5e29nbR9PNDsl6p6q+vTa11o7+f3CfMc/MMDGe3ofXv9QPfrhwGM9OTn/wDXx7e/55pMY68jPU49PUkd8ngHv604dMnGPr1x749DnoB+VaLouyStbqknr2t+PqOT0VrW+XaOj6Xv2/IBz/nnPpj+fp6UoOM8f1/z/ntnKA/17fh1/HPv6UoP175//V3x1B//AFkd3a3+d+3TZ9Xrb7yBSflzjnHGOpx6jnIyAOmO3FN7ZOc+56dz7fj9c0ufbP5+/v7/AKe5pD0+meOn6+/r7e1JXdr7b6302vftZ7aNtL5h/X9dPyDJ/wA/X/J/wpAc9evUj6/55/8ArijnPTHOOf59ePx9PfhMHOfYjt798A46dxz34qWpN+9vfe+q2vfW3X1v5WQ0l12te/5pdG9fX8mvB/zx2x/Pj/63DTnBwQARnPOfzBzj1OOBj8Db7cnP8Xr79exPI69sHNGAvfgc+5xn+Wev06YyTa2/TS1m7ct+u+nbvqVbs33V0v7u34dLedrsMlT0DDGDk9eQOAfXHfPJwVweVAYdOgBzx8xH1H4+nUZ7ggGePw6nrn09xzknPPfrSgkEkH1HpgHB7j8QQfpx0Hd76qOj6p7W36r00tfXYlvyvbfo3r113/H1F54x17fX9KASAM89e2M9u/PPPQ4zzxTVyOWPXHHp27Hr09vWnf5H/wCrnt2pcrTVnrez9LL8E9G3dbaA/vXe39dwz+Hb6/5P/wBbjFA/x/z/AE/nRn9ePT8vy/qKD+HT19c49foeP1BpK90ktt++63er+e6EIOQCeDk8fp+Pr+H0o6ensMdOMev8sY+tBB69+3p+XPbjPfnBHYxnr+HPv19B7d8dTzVJN666teVvh1XyW/y2Hb8W137bff3129U4ySTzzjPt1+mOcnHbp1JUcAdOvPX3zj6Yx7enGKaQ2BjHX1+h57kep6k4OODS4z1PocYB75645zz7Zz16VoV0Tuum6/w207JPqrb6u6HD7xwQODnJAAz6DGDuJAz2OexOJwATwNvOOT94dM5GcDqMY4IxyBuMBPO7jkEY+XKgE7VJK45P44bI9pg3XJ6Z5yOAv0wR+I/GplfTs3Z/evn8wa0Wlnre3XSNtPXTTqxxBIwOgzx7HAPbnjp784qyOCPqP89vxA/CqwPfp26gd/U5Ayec/iMcYczk49MenJ7gjgHjGB0465OABrWO36J6W7bva33WF0Wtld/LRf5FFFCgkY55JHI6evt2OBxgjHZ/X6/T06kA/wD1x39aRR8q8cYA5x6DnHbPI7c54PJC5z6nOev/ANf1rOV7q+3a1mlZdNVr5vpboK99ev8Aw3r923y0DGP6Z/oevb/OKB6+nHcDjPbv6fhxigdB+nGPyB9qMc9f8849T647fhQru/R28l2vvt1vb8hC9f8AJFH+en+c/T/GkH49uvp9OOfrznrSnn8R/n/PFGqs3ayttrtb7mtE9vx1BOc+38z6f59vegnHOD+H/wCv/wCvRnHbjjkfyx19OgoP49//ANWOvr0545zQt1ddV106X+ffXytsPS+2mi9dm+uj8ul7ARn/ADz6dfp/h0NNxgYH5554J/8ArccDrkjNL0GMknjsc4/mOM9eSc456HI7E/QZPJyRk9e3p68kGnG9klZNPbba26t0t03XmtXG+qXdW7XTWr6peq19UJgnOfTHfj9Tnv656EjOKXaO/P654HPseOoyT/IGSO/PA6DHOMnGOfYenXNHPPbH4DGB7fh/IjpTV7rytdK9nblT8/8AJLd3bH6eSa7P3V5u1/TrqwAHXk59e35dPX0HtRxwOeRwO3Hb8c85yfpxS+v6e3v9ev4Y9eTgcnr6/kP85PHrihXvvpZWSb62tforaa776WYr30112X3W37bN+XmKDjrg9ePb/OPxoz/Pn/P9KP8APtz7/wCe/pSf/rx+XTjt/P0oal7u6Vruzs7K1+2mzS379iRc/p/9f9aQc5yPwP8AX9fwo/nx+I/wHf8A+vgoTj146nA5HPXp29OhPOai19uun5fr3+9jSu7dwxnrngk+mB9fY8A+5xxghAvH8ucnBH1AGenp65HNIVJ6E4xznOePUHr7dqUA4xyMZGcY49cf19/qRpzaLW23Tb4dvNW1StdO+2+nTR20Xor279rXtu7+eqAZJJyMEjqc889fx4/HOetLgZHB5HBz9SeD6jr9cd80YPc/z6jpjGM5POOvQUE4PuRjGev6dc9MY6ckdKXNd6K/W17LSyvsnp56P0Fd3drtW07fZ1u97df8mxQBn34Ppyc9s5Bx1z1pw4/D8fzz+NNIyRzyOvp+X1A4zjj15p3HfA9T/P69P0qW7Jb97W2skvK+ln3XTfWH0d7/AKWS/r9WBzg4xnt/h1/M+vNJ2HPpk9iO/wDj/wDWpf8AP+f8/wD1z9ev+f8AP40e9Lo3r/SvsrdO12Hb1/y/rUQHPTp/nr/T1/Km7eevrgnrnntjnoOv1BpRjHoOfX3zk8Y/HpzimkHOeePfp7D15OOPQjBPBpJ3stFur7/jtfZu1ui6FxVpPt5r072d3fXp5PQXAA6HPTuOR34GOD3x6nk0FMYH59OOvuD39Scd8jFNJxjknjqOp6/Q5/wGc9ndDgnOexwOenPbGMccnkcZp3ace1tdHr8Kvstldtu77lWaa1vs3frsr69t3re9vITbkgng9+/pxnt39hgfi7j1xjjnpyeuc8nj14IzjNLjnOcew6YGP19/TgdM0hU7gRyemPz9if8AJ9sK7k99bN6b626623tfdbsi/Nu7W211v7v59H83sA+vTHHp0I7/AOI7euXD+fr2/pTQBjI4z346fl+vOeOtOqVvo/TRX6Xt2bto99tSH5f19wf/AF/88/5FJnvnj1PH0/8ArdOMdetJnnH+fXrz2z259RRyemfXuM+3ToADkY6YOetWr32s+qS3XTuu6VtdLd2nba/Wz7b+ewHGMnnBzx7f5/rwOQmM4zk9xjJwBj6Ek+uM8n0pec/UDqOvuemBjtxnnj1bg8ZJB5xjv09evTPPqMcdGu7/AFVlo7dFp17/AHouK0Wu2q6aaNrzV9H/AMCw4jAyckd1z0x1JGT3yevJ6+tJjnk9OnJ4yRxn07Dnnk9+E53e2eBkckDuMD25PTjGc5Dh1xnjv19888nr+Oe5xiptLXXXql58tru91ZJ9HdX6hstbX309Yp6rVN2afR33EwOAe3r7Djn0wc4/lyKcOxH1z17g/r+XTjFIcgAEgZOBjknsffHocnB7mnAdh+H+f8f1NHvO3Tyu1pZXt00v69LaWJb/AB829dNbu/pZPSyvsGeufbk9Rj3zRuOBtI9sjPXr9Pf8Rjmj6/48UgGOgPH+eOf54p6q1nbTa9lbrfTztrrbfW4l1faz6W+eq8thee+M+3Az+X9KacEgkc54z079h3OPp0xnucgjn8cdSPQZzng4PpjrxR1J5PbsTg8eoI9D6jnpQm+jvf1tZPVeWqtdptvsxrRrXrvrrtpov6vrZ6CEdecZ6/TkDPI4OMcc5zg4NJsGOTjjk+5Iwf6HP/16U88HOOmcDGQRjP48EdD1GBS4IAHXn17egz1HsT0/Rpy769U2rtOzd/x000fctO2z0+WystdF36u6VuuwQcE854z744zxkgdyBzj05pAMdueM5xnkg+nPfn+o4cQeAPYYPPTpzz6YH+OKQEdO+Twexzn6den+NNq6XTq1e/VJ7Xv80ntr3m7a6edu2i1Wl1b7ns1awvA9f1P+f6dKX/P+f8/0pM845/n/AC5H44o7/wCe/wDn8fwrHbrZ2790mkR/X37C0hI59ueP8+n6HtQQBk5Izn3A9/6noPXtg689Pw/D688H6AdKNOr/AOH0/wCDr+HQenr5bdvXz/rRp6Bjkn24Pt/nGeKTHGOeoz3H1Gffk49+2KCOgye+OM+n6EA8dPXgYpCDz976DpjJ756keucemOmito77666K6aW2mr+avbXRX0Vrdm9fK6stNlf5PXvZDgMeuD75xj17jGOuTz9AaTYPT68nr+n1zx+VIQcH07g5A6du+0H06jjtyoHTqQevJ56c9v59BxnNJ91a103psrR39Fa9t7dlon326+a0WmjVmkrW66dbtG0DAGeufp/npz0+vBVRjPXk55z/AF7+vvx2pQD+X5nr1+vX/wDXgGBz7/1qG33vt+X9XV7XIcm1bvu+v/Degv8An/P4Y/yaKPwGMe/8v/r9e2KTHIOce3qcH/P4UL8en+XXf5dNRC/596bjIz+GMdQOg5A6g45OOvGcUv1yf0POfYkYHsD0GcmkOcH17epx0IwRz3/Piqjo1q1tt1u1onZ6rS+iadtbXGls9N9b28vP9BOp5zgZJznvjjgdB/TPTqm0enXPHTGM88cdeAOeCDTgOOSe34+3cd8ds+9IM54yRxk4A/LpxgdvXPNXdt+71stnaS0e+3W3XXTexommt+2zeyte3327vYAvbp75/kOevXk5zz2FG0DJBOc+xP0APr0z9OeeTBA5J5Pt1J5xz3HYAnuB2pec/wCfU84x/XOMZ5o966d10v5q0b67enWysvKW27tard9NlG+/nbv+d055OSCcAcE/pjv/AF6A8U4Zx1Ge/f6/l07Y9OODGRgj8M/z/wA9fzoyAQO5/wAn+v1NZ3uu3Lq7Lora/K2vTTyJvfp8vJJdd+jvqL2wMA8445yefxP+H1oy2PfGPbnr/j9e/ekGDyBz68f09eMUhz+OeOeo+meeOo49fSqTd1bSyV76aLl+K+lv0eq3TFrp+Pb1F5x6H9OPqBx/ketNI9ck57ZHQgevTPPXuSMcmlOcYzjjkkfqDnA9fbj0oGRgdu/XPP8ALBPqcjJzxS2vtftte/K73Vrd0uhUetrX3t5XT3/4cQKOeDyMDnkcnJ54x+eQT60mAME5JHHr2+owAcEd+R3IwvXPJPp+Q6DnGcnnsMHODyvbOD1B5/LJHA4xnHYc00pJ2u3fr10S11+Sd9X6lXa7627X6d9e/TftqAA+h5Pvg8/iAe5z0PFKMdB9ec+vPXn/AB/OjBPft1+g546Dv+Q69KAOp9PfOff8OmepHtSs27au2vq1be7St366tNEN+d7d3vt/m7dbb7C9/wAP8/z/AEHTHJ/n/P8AjRSdP8+ntz74HNSk3t/Wy/r8e5IvT/OaT1wP/r8ep/LPNB7/AOf5c/lSc84AGTwfX3OPX16+1NJvbX77a2vfb52/FDSu18t/6/LXqJ16cjoen5nHtx0BwfyNvUYzxx0/2u/YHjuSO/FABBIzhexHrxx654x7/U0nXkHjqfxPORkj1J4x6Ajpau7Ltbpe1rdVorp2899L2NFstdNLWv3Xlbrbys7W1Sdtwc8npgDA6H9f0AHA7YQ4yPqR3HXsMdc8E+/XGcBcHJyTyPyPPsP/AK/ccgUAZOc+p4OB1JOMYz2zkck9+ABaNa30t6q0baa2tpfZ211JulbVvdabrRLqvJ7ffvcwOMYwOg7ZPP8ALp6ZpwOfw47f5/P6+9IDn8zx9D3xTh17e+cdPxz/ACP0oV7rS2+l3aystFa3p0++6m/fX+tdet/J7u6G+454/wA4/wA/Wl6/579+nvSdvTP9evt/P8aP8/5/r6deKFe6ve+i1d76xXnaztZLXTWwvu/q3y+/z8gPbn8PXrgc8DPr36U0gnOMEfgT+HTrwev+FLwWI7gf5I/TH8hzlCD9Sc4Pbvxg8AY/PGT0quXbyWtreSvr2+/12Li9Vd+ultLJq77JK/fpZhjk8c+oxjPr14PIx+f0Co6fTHHp1Hbryc5756DNJgnpkDnOT69eM4z+QGOevCn5ecn9SBkdz6ZHPfpgDvF+zWtmklbXT1s/nbTValNqyV9brTTVq1lu7arppv1YbFznn6dv/rfX8PSl29cnIPr29efpj696ME9z0H4du+cHHfOc5znpTsDr6e/Pbj3/AP1+vKd9rt2/RJ+qt376WTbIb7tvRar5PTz03fzSCkBJznoDwfUf4f4/U0vT/P8An/PTij/P+f8APepSbulrp+q89Cb7+f8Aw4ZwfqMY4yR3A/zxSf5/n/OlP8v07f8A1uPWmDIznpnvz6nJ/TpwPbnGkYtJPZ3V+l10+62t7N6jt+nq72ulurq/r38lPpnt09OnXnnB9euSOaQjqOc9Mk9Djvznv6cZPGKXHze/pxz1wSPbAx/Ic007ie/Hbp0PB59ffPI/JJvTeySvvf7Nkl5tJ9d76Fpbbrrfb+VaLS9/O/zd0jb0OSOO/Tpj0OBnqD2J6YIpcAjODznHPY8cdOCMDB6d+MmjnIyTjP0+nA68kAnOM8Y6GlI6cZxng9On+eTkdec4p+82t+9+8fd8lpe1ttOl9GNvTX/t5Wa6X7W1st15+aADpjpzgnIz744z+HQ9KeO2D+P/ANfj/wCv9aQDocenbJ57ZPOc5PPJ9KcADn17e3qQMZPTn/OFFPRv8dey26bXTW2l9ES3f/g666bdv1/AT69x27n6dh/nFGegH5+nTvwfp19vWij1Hbp/j7EdK01+fX9SRCemAepz07Z6dAM8fh09kPpzkjOMfh745x3wMfjS8jPp+Xr7H2H5mm5yenOMdyOpwTx6jpxjk9c4m7v2VrtdtV1e6326eqLj5rRW1XfTTv8AdrvvcNo557gntz2OePf2yTjBFBQY49TjPQdfxx+fPPQmlOexAycc9eD2/oOMc55PCEnk8jHH06ZJAOD2wOnJOD3eujfbZfLe+1mvVr53belr/wArVt7aLtprqrLXogwMjr7dueOTk9e/QHg5BpNuM7jwcAZ+vXkdscEDsenZcA7c4GT0Pbp14GAPX0HPWkIweuRjoScBhlgQABjjHBPTPJGcp3dk3pvtZNq22z6XTsu7Yuba7fRtPyatb5a36930d93jHA57DHIHGSO/Uc9eetKTgeuP8k/1oAxx2APXjHT8PU5PP60rYUAnv2HbnA9v8OlRZ3atdaa3avZLTe193s7X02uS3rf+n39L/gJnOMY46jv+h6//AK/qEnsRn39uP0o5yPT/AD+f9Pfim8Z9SeQD9c8EevrnoBngYpxWy/BNNaWXonfXTW3e6YL/AINt+qvfay6622WvUVgT+GCAOuc88kdOR2/KkAIB5+me3Ye2eB6+gA7ryTx/kfkCO/fgjGaQ54GSPp1OPfgZ459MjsTVLmul27Po7aW1ultpre92ile1m1bfbZWT18te129NrtAUY7/TjPBIxxgc8fj3pdue/qO2PTngegyOnHSjknr05PGPpx15/E5B79FH15OSAe36Akc9D0qVd7b6XXM29GrNXWu2jtqnfXYG9XZ+f5aLS3RNOy9RMZHP+R75746+/IwaXAHPAzyc54J7+34ev4UY9/w/Dv69zkfj2pV6gdenHf8AHn/AfhWn/A8/Xt/XQnV/d/kv8vu7iHABzx9P/rc/j/kSKeCDwoHPQtkAnHBzznGMcHjtmmdCTnOBkDsT6dOh759PengnHPO1RheMcHPQgZ65Gc9ORjNBS5kt9mtLtPVxtZWbTWnvPTtaxLyTk9OPQH04/L0PXtilK5I2jJG4Ec8EZ7c88dwSOMEEHLQcgEe/58evbjuBnv0qyhywIAHJ6cA4PJ9OQOvfnAxUt/Dbq/Tqr6dXf9d0JaXvp07W1S1Saez+dzLjDAYZs5J4z04+XvjBwTxwM8ZGTT+fx4/TPH/1+/oKYhLYJBGADyeOhB/me2ePan+hx/8AW7cZ/wDrcZ4zxUS6aaNaau/TSVn9yv66Cfl5dfR2+/8A4Iv0pB6nv06ceo4Ht+nPTNL+P+fWjA7/AI9zz/Pt9B7ClG+iS0b19Ov33V/IQcf4/wBP/wBX688FH88/5/8Ar8cetIM98Dk49wPz9fwz2pyi001ZWt28t+it1to9PMA+n+fp/kjtSc88/n2Pb16nnknAwMUpPT0/L3//AF/rxnB+WRyP6H/P/wBapv8A09dreX3Lps9Hq+nrf9P6/wCA9Q7vb2+nbqeo/LoOBzSfMfbPqBkY7/U+nT8uV4HPPP49/wAfXoPfFLz/AC/+v/8AWp+iWr/FJX36X/UNtrb3Ta16addv63s2ncRwQD24OPfrnP6ZxnPalGcc/p/+oen88Uv+fpQOc549Pce/Ofwxn9atbXaTutW93tr5JaXeve2oXdu9nfV9+m+qur/iIRkj07+uOnH+HsOmKO+CCQev6evr/nvS9OT7n8M/0xQOfp1//V/n9KiN9NPK6v3Tv2vaz1XrcQf56/0/DP8A9fNFH+f8/wD1v50UO8l10Xfoku/6apaaWQCdRwfxH+cfX19qTkZ5684xnOBzkDHtjn+dIOMjgAcj09ee/Bx6HpmnZJ6j/wDX+vf6kcHHNHo100dtnbv33stF3KWl76pryvrZ9fLte191uNySThvz+nXp3J6/z6Bw3Yxkc45x6Z//AFcY6mgcHpjJ/Pqf8/l0Ao9f8/5/+tQ326JdFfS3Xr/Wmgc3a1rK9+trf1bt03DB78g+nH9c/r3OeKO3+ef5dT+B/Glo/wA/nSV9O1/RXVu35iu/TbbuuvqFB+mfT/E9f0yfTNNJwRx1OD/LP+R6c9KdTTa13067aW6d9Lvr18xbW/r8v+HE+9jnIOOw6eh6jjj6Yx70c9sdscf5ByPoOMetHA/M+/v+fekJIGQB6n3/AMj1+gzRG99PJpPotLaWT6K7tfuNavp5J7dPx77Xt1vZmWOeg6YyOucY/H1989TSfNkgHjjkg9uMjjHPPqB688qOcZAyBnuOT+HfvnnI6HrSjOTkDk/kPToO+cDoPyFVqk+kl0dtvd7WvdWs99dNkO+mu9u3T3baryQ0luPunkYwB9B19c84+uacc+o754/lzjPb07+1Hr1/Xt6fl+P40v8AWpu3a26WrsttH2srA29F2Xbe6W6e9rb9dGFA6D1xz9aKOO5479vy+vbpz6UknfTy/G1n+KJEAA7e/wCf+H+GOlL1xjvj6/T+lIc9hn1+n59aPXj8f6cc56djx+FXyytZaa66JrZXbWztbv52Qef/AAQJPUfh3z1PYdx+vHTqhLDg4+nYdBx0PXqOT0A60Z56YzjHTnuTx3+vpkZ6UcD6jJ5xnHfH4dPpjPHDtLTbpvo38Pnps73u+xSt89Nr/wB2yvfS7vd9BPnOcnHAHTPbHB49jweOnsT5sAAjIz0/zgcY7Z6duadgkH3H8/UY47f15pQOv/1+nv1/P6Uru6T0jpo/SPXr3d7aJLrYOZray20t6a37vz1XrYaN2ScjHToR/nvzkilIB6/z7f5J7d6XB7+/+fr7Uoxnknj06g/XPUdentj1lOXptd6LTo338urQru91polp5fnfzDaGBycYxz6cgZz+Jx9PblD7c/5+lOAHr07Edycc+nQZ/L0ywjnr0/Lsfbtxz0PoRWqv1tt+PnbZb3te/RC/r+v6uLQM5AyAPXHT8B7Z5+nGBR/k/wCe3b8PrTeCTz0GD+OP59Pr6d8rtvdrd3XRf1a199F2Gle/9W1S8l162QfN2x9Pfjqevrjj60mGGcE5x+H5nHX2GOSD607J746n8vX/APV7Z68B/L+fBHQc9f0zz6UJ27fd6b6Xtpfo76safp06emj0206de43Ljvnk8cAYPHX39PTr1wVG71HpnH8vx598noOq8kc9fX39ef60AY4+vt3P+f6CnzO918+q1S/y3389Avp0u+lvO/pbT59dkGSTjHQDn+g/Cl49B6Z/EH/9X49xwgIIBHT+p+nv/wDX4pQM8c5xzx0zx6c/l+HSi76bpW83a173+e2voT17W/Nf8ETA69z1P+f19aWijP6/5/8Ar0ld2e9rbdLW11028/ysA0lgcjtzx1OPw+nfPXGegPnOOQByMdcHnJ59Tz1+o4pScdx26+3J/Hpjj+dAOMev5/h+I9v/AK9K9l7qe6tdWa016382lo/R3q/kvu6aLfv11Wj8nYaSTyCMAZ+p7DJHHbI4PNKN3qP89fy7c89e4wgz3GOnAHbnH6nJ+nvT8f5+vb/PpU30slt1fvNWS6/m+zXSw78ui8vPdLtvfW/ytsrN+fPUY9OuP5fjz647U4Z7/p2z0H+cZoo7Y9evocfn/npRd36aWflpZbq6vZXdtW99bE3/AK6+gnb/AOv6+/Wj/P8A+r0/ClpOOn1/w/rSXlfz9P1809BCMeCBjOMgdzgjnr6+2Ome+QkgdckZJ6A457HPHbjp2pffj8qPw7/5P1xxx146DoJ2totPLf1fp/wUwXnqu3f59OvzsJkgc/09eh7ent1yab83BzwOoxjJ/wAPUnHXgZGKcecbcd+f5D88flik29PXBGMcEke3b6jnAq1vd21vp2aSve+3Z663XTUtaWd97+bv19L9731QuG9R2Hr+PI5P+eKXn2/X09O/P6e9HUdj+PH5+1IQSDzg9gMenqR1z0/pST22SutNu1nvfbXtp1bFzd+r1el7aaL+v1Hc9/qB6ev1/wDrUmOc/wCHPT8f88d6djHP5e/P9PrSEA888du3J744wOPx7emj6f19/rt+PQkKPrj/APV/WikJA6/5zWH9eYddPlb9BR1PAPGAe4/z/Xpxy35sHB57dPXt+Hrn60pOPw7A8k9Mfr/Kk6/MPT06/U+2O354qoqT22ut/K3zS0W2j0TGk9+nmr3208r3+Ynzeuefbn1HTt6gdifSgFufrxkYHOPXB+nHr14w7kdBxn26f/XPb6cjnK02+tl87Nvv09NNN9u1czXa2+lvLe17PT+rKzRvzyR1PA9Ofx//AF80HPc/TnAI5xyMHjpjnp06GlPA4Ocf06jJ6e+c9+e4XAI56fzPpxn/ACKS3VtFbZaL3bX66dNW+3awr7dtNtGmrX8772bv1sIenr/Wgf5z1/H3peD3/wD1+mcjHqSfcYo6/wCf8n/P1oWyXTW7v0037WtuyRD2I68Z7dyMZP5/oOaX1/z/APWPr+GPqUmcYH0+n+eMD3xVK+l1rve71SS1e/Zf5J2Yf8G/p/X9dk5I4x9f8Aev144IxmkO7HUfz47AcHqc/wBKAW5GQSOefT04/wD14x3PCjPTGOmMZxjr7Y9MEDn1HAV2rO0e607Wu7Pv1sul0upWzWie3fW9u/e/4bJN3Ql/YY47/nz2GfzznilGcHBB9DjGff0+nHoadj/P+f5f0pMcegxgfkP1Hsfxp3fReS6fy9NkvJPW/TdHNtotP+Brfu7O/wCoDPc89/zPPrz7+nrmjGRg59OTz+OP8/ypR0yO+ev05/Q/1oxnOfx/P9etQ76O1td9Vva3lvdK3Zd9Jej6qz/q2r0W3yDgg8Hp1/8ArHoPXPOe2Opx79PX/P8Aj70en0/x/wA/hRVJydrfO9k3e12/J91ra19QE7cd/T88+nPr69fdOR3B9M/kOn+HtznIU57f59P8+9IxGMc8+nXt/OqTejt11a3tp3u9UvV6eV2ley01fq1tr/XmBJHcZ7e5z9fp+f4UhJBxkE5AGcjjn9BjAwf1o+Y8+/A9scfT8xnOCQMU7rjP4Y6cY7j8OvUjOKpO732urfNd9mr20bu3cadrdfNbp6fhpbR2avr0QC3IJB6ZOOvrn0PII9eDj0OfX1/pj8uaUDnJz7/TP5ew9+OppACM88dfp/X8fU846mOztZ6aWtezV27LRX7+T6WE3e/TRfO1v8r22/VSM8UD6e2KM/l+J57/ANKFA9Scn69fr/Wkru1n52Wmvu37pf8AA21SFr/Xy/4AfUf5P+Qf88IfX/H+X+T2yKWk75z+H5j/AB4wOevSiKd13v5/3f0fzvbsNb/8C/4ef59lsg5GOvTPXr9OMdPbNJk5AyNoGOOPXvnPHJyOnfpwuewA79x7dvxz1HH1xSHJHAAyeefTj+mPpj8NNNL79n30+V+1u7sUvlbzaunom+6ejstNutgyx4GPxGPoemfXqMZ454AX5847Z59wOhPX9B+VAyeee4PpweuPU4/AfTlcfX0z/TPtn681Ck7rTolqndbXat/VraC5raJL7mtdL9rary+8Bu7kdf054/l/iaUKOP8AEnHT9OOnp255MZ/l7/40o/PHbvycfnz79R15FEb7tLouz3jr/W97dhX38/khoBySM49OuPX+n60p5GM4JI749fb6/r9QYzgkkAenT15P5ep59sU48nPqfX8Pw6d8dfSq3a3T3s7+Wv3Xt0d/UV/6shpwOf8AP+ff+VNy3Tjp+me2e479s46Z4U9O3tn17UhyMHqc9OeOCPyyewzxz60XuvO6/S9vJp9dRpX9b7a67fd16iZbPbnoO34nPX6Zzg8d6U7/AFH8zye2ce5Gc9857BJB/oPb0yOc9x1HajBzwAc4yTxz0454wP68k9VrdWVnbXz2unu/m9fzdK6191aXS77aa7bb9Xs7apPn9R09OPr0HTGT/wDqpRu9sjoex9++COe2M9qX254x/nPf3pQMn8Pzx0H+HvS5pNpJa/ns12/yd9hcz8unT0flZO3T7uo3B3E5GMYwc+3pgjv0P+IU7RwcgN1579PwPPU/jnHLgMnHfpj0+vH+cHpSFeMDBx1HbrxnHB9ePXHHeld6NtNdl6NXb6911Ffv5LTt19fmGc9O+e+MjJP14GAR6456kIeBnk4/pj19P/r8mjA4IyOOmccjHb6g9wMHnOc0p7/X0zxz9D/jnpxRvtbS2/qmu7Wiad7XC9rW12d/uvqrde3y3Eyc8dO46/5wDxznnPblOenB6npz7YyeO4z1I/E0AkkkgAeoPp+XGeemMcY5penTOOTjgAd++D/h7UknprtbTRff1Wja13t5g1b5WXz3a9V/XRDcnJ+YZwOAOhyO3OOvX0OcYHBljkAjg4+nOenPvjoPqejuOO5we4z06cd/vc5456c0Y4A6YxwPzwT39/Wobd091ZW16pq727q2lk079rvm28rWv5W/DTpbzDJOckdTjjHbtz7dPrjjBpf8/wCef8+vqen/ANf9f8mjH6/X9f8A62fzqot36vTvsnb9N+5P9bf1/XqwyPrzjj9fpikPUdfqMY9ee/b6c+tLjkY6f/q6/T8j17cKcfr6+vQf561a/pdtv+H+YDCPY9OD39R3+nPfjPQ0IODnnggfTB7A56Fh3xxwDil3eozxyOc4xz2z04B49OOlOBYqx+8c/KoPUZzkjoccnPoBkcU1pbyt1/UtNxTVrO63T/u/ddPVt2XrtMDnp1/Lv/nH9OcWN+Gzgk7uq4YHBBUjBH8J46ZbjgtVdSG6DnpnI65X1BB4H+JxkVMX2kAHoQR3AOQcfTAIwPvAfKeCRNlpdbW+W2rtulfV62u/MnbR92n5bb91vZGenKjjaBkhfQ8gnr0P5+vs/wDz60Z9ccf/AF+v+fbtRWcnqvRPXrp/w97WT8txMOvfHX+vr/k/jRSHgf5/p/hx6Udhj8P89qF00d76ee2l+lv16ALkdP0+vH88fX3opPcjpnBz2/HufXn60ZAIHc/rjtkf/W68d6d3ur6K79HZ2srpfLdL5D9L7fj1+SX+YdR3GfwPPWgHoPbr2OOKWjnPTjufft/X649hlK9mtGrX3S7dX62aX+YX0tp/Vl/X3+YgHryf/wBfPoP5460DOQMj3J4H88j64x/RaTnpgY78/l+ff0pLdPtZvyV/830EKOe/v9fx9/w6dTnFGD65B5xjpjv/AF7/AIUnsOB2Hb/P0xTvQ4GD09OPx/n/ACp9tV835Lpe2iXZt9FdMBKKKQ4GAT19f8fXv+WOeit2s9E+m2n9d38wFP8Aj3/yD9aTg59sDPH1x/nv05oPAz/Lr7f/AFqO4PqPT+v4/j/IXXp569LO2nX18ttxrve3362t/X+QHgDrx1PHQf1/PPt1o9/X/wCt9PTvyP0oH+fb24o59sf5z+v+eOTbb5/hpZ9n/Vhf1+X9afkHXH+ehH88dO4+lLSeuBn2/wDrn/Pajng9OnTk+/4e49DR0376fdv6/PYLvv8ALbqr/ptpcBkjng/T3/w9/p60rA44OD+f/wBb64/xFH+f/wBeaP8AP+f8+/ahff127fjbv+QAPfmk6ep/z7ml9/8A9VJzx+p4yP6U4q8l6p/1/XoH9eX4foHy5zg5I65GO3p+n09ByY5/+v8A55/oevaj9f8AP8h/nJpR0/Ljp/gePp9fStV0vvbX8L37dAf9fL+v+GVhB+Xp/wDq7fz9eaXtx+Gf09/880c9jj3o5xzjHGfqPx9/T6npWTu3rv177Lfy2d3puwExz/P/AD/kdeOaCD2OPwz/AJH6+9H+f856+/enYOCw7e+Of/rcf/X5oSu/RK97aJWV/P0t9+or67+mzulb8On9IQLnBJwRnscH+fYfnj8FA6kkZzwOD+fJ6ep4pDkcY+vt7+h/zwaOBkn0p2k+VWs031V7Ky80unnbpfUfbz7ev3iE4I4zz+H+enp149KB7fh9Ov5f5HFLwR1+mPr+X8/QikOQOPUfl/nufer/AJUna2+t1b3ddPL56qyW6La279+n+X9dQGD26E8/jn/P4g0EHnHDfp75+n09enOVU55x+B/Xt2+hxjJ7gKBwcnJJyPXHU8+nPB78dcVS/X/Lv/w34j1T16PZ/wBdRADyc49foe3vjk9D0IAwcUAkd8fgOSePz9OmMnGehcAST+Oc8dcjt+PTikI45UYPPOcfz6emeT2PSo1bWtrX6avbor7uy7dXoxf12ADJJJHQ9e/XGB1yf8jtRjPJPPoBzjp9OPTjilAPIxj159OevPqPpxmmnhsc46g/Qkf0/l6iqS0V1bbTpp8/+HW4IdkjuP5gY6fj74x78mmjvn8B/U/0A/H0oGe3p+eeOPz/AM4pD9cf56/h34o/q33a+dr76elwXZen/DB69f0/x/H8fajjGSMDGenPHPQc5HX/ABoxkcHr3/njp16598jtSDpz2OPxzgcD14I/A+9ZPR6vydtHay+Vv61Q1b8bPvbf06aCjuffjr6D17/59aX+vT6cZ/Wkzz/n6Y6/XtQc9sfj2/8ArZ5P9eKXq+y72X9dvQL/AJW/r5i9ehH+Tz6AY5/zxRwQctgYJ9+PT3HI9eeO9Jj0HbJOT3O0EfKR29cUKGIwQCQDj1GSM8/dBJ9fp1Jy4pX1s9OuzbtZdbNPr5C/QX05/wDr0f5/z/k0f5/zmk5z2xjr379P0/8Ar9l92muttdtPPr122D+v67/102D0PqOnf+WSeg4AOaVsZzkHcc8L3CjjkZJ4yDwTggcdSj+f+fy6GqUrK3bVebut/u18tNB6aaPbv/wNNdbDTgnkHjoM88/Trjjp19ORRwex6fTI/Mfh6Z+uHe3+ff8Az0B+vJ2/z/OlzS9LLTVbWXkr37a/gF7W12fX5fm/PX80IB49sUc9M+n6evv7/wD66Wk5PXj6H6559/09iM0vK+n9d7foK/8AT87fj+ewAY4HTrzye/5dv6jPNLQM/U+1FH4r+tPxs/1ACD6j+f8AXv69v5FNXPIPXP8An6ewP/6nUfp6bdPX9QA4yOP8j+vf8CQOKTj0PU/mO/8AgPU7qToxyevAGD+Pt0xz9elLk5/x/wA8989P8S1ra9mnr5du36dx7fcv687P8vIPwI/Xvn1Pc/p6ClxnI9QaKADzznPTPbj+Q/D+tH4f108/mL8P6/piAYGKWk5//X/+odR+R9RS8/4/5/z6d8gf9a7/AK/15ML333663EwcYyAfXBP9ev1z70vTvn39aTHf2x/nv+fXtjmloXp5+enrf+t7h/W39f10EGe/+f8A9X45/muf8/5+lFJk56ccd/rn+np19KFuuiv6dr6h/X5f1/wwgAHYjse4IJ/H0/I80cEdMDk8fj04PfkdPbuKdR6+2PTv+Of0/pmtXrbZpvW3bXotbb/hsNtvdt/1YQ5I9Dj/AD6D8aBnjJz60tHPf8f85Pf6/wBam9/m7/09WL+vP7+wnPc/kMf40HPY/wCPGPw6cAfqKXn/AD6fr/8Ar9Oxj6dfp3/zz+NFvT71/wAN/WvUBO+PYfr/APq9e9KMHPI6Hjrxj9QT+PfoKKOOuOemfYkdevp7fXFVFXd+2ttdEra7+vpba1g3GYIxkjGcY6nnA68EcHrx0wPQHrwcE5HPPUc9sdR1OeOnWn9f8/5/+v8ASj/P+f8AOO9Nybtbezvd2urJ+XXs9tSuZ283v07NPTrpuIO/H5nPT/8AV0z1J47k/wA/r7f56d85OnAHGCf/AKw/yP50c4JI6ehyT1+n+euKh/1/V2LfX0/yF/z/AJ/z/wDWOfX1/wA9fz9aTnvj8P8AJ/z9eFpf12/yFfXb8u39dL318xu3nJ5549sY6fXHNLzznHXjj/P+efYAGPp/n8hS073td6Lyv+HyBt9X/WiX5eofj2+g/wA/5zScDJ/E/wCf6/8A1qWjjj9Mc+39f60X/Xy7eW3lf7uoITgHAP4DnP5frSDHocE5/MZ5/pwR0PNAHfnntnI/D8uPb06UuedvfGen5/h788nFWrq7V+72vayv3W9tVe/VvQdu2vX5W1v+n/BQY/z6/wCTz7c460gzzn14+n+f5euacQR/n/6/+cEdeh1z7cc/TP8Anpk8CpV09N9tfk128l87boXfz/rQXJwMng9+T65I69Pr3HtScg9Rx047+vv9P5c0DPQ8n/PTGPp/kYCD6f5+o/mPwpttpfi+q2euyV2tNnp94Jznrx6Y/wA/5/Vf8/5/z+nVAMDv35P5n+dKD6H2PqP6/j7+h5ST6bLrZX0t3/K/f5ghz2x15z6d6BgEDGeMd+Px6Dt9eMjFB4yTn1PU/wCNHHHbPr6+nXHb+f4iTvdLzv3StZN7f5a9rB/X9f11An/Dg/l1GM/1wDnqDIPTHHp/n8OPp60c4I74/n3+vXjP4igDH17nHX/PvRrb8rafy6vy2t1uPZefTv019Lbee3UPp+uf/rf55o59f0/+v/h+NHOBkDv+fH14/wAjuKWp/wCB/XX5ivr/AF0t/n/Wgozj2OR+HGenT346foHP94A9Mjn3z7/mSPwowx5A498Z4yOh6jj0HTjI4pOvTA49zkjqcfr2HX0rRXsrXv0TSV0rfLq7O/33uH9f1cPTPp/np/kdKQ8emfbufbHXp/8AXA5pf60nH+fbj8+1Rfu+1/TTrv0X9bgmBnoSevXv27gZ6fkM+5ngY/8ArDj+Q/DPGDg0EZOMnjk9/pz2P/66XHGASPf+nt+GKae2vXRauzutXt5tJf53fa7/AD0Wn9aBjvjnHr+gzx/Klx6fX9f8/j1yOp07cfy44wP/ANX40uOnv37/AIgf4fShNvWz0ty9ui3+++2orv7uv9dv8gwcZJ54OehPv/X8OM4NIMjByPb2/DJ/kPWlyT15A55P6f8A6j/KlwTgeuSOR7fj2/zg5e+qeyW9lroru9+3Ttt3BBnIwQeTjgj3x6dR9PUCjJznPPr/AJ9v/wBVHoOP0HX3/kT0pB1wO3b8M/5/Si8pW118r20ate6372T/AFAM47/nj8f5/hTcgEjn1/E44Hr746E+9O/z/h+f+NMH8WM+2c8A+nf1x9B6URvbdrXW2id2vNdvw013aV93ba/pdXv6fMf07e/1pB24/HP69TkH8f60DkZ59Oevft65z29M0uCen+f8/wD6qGpddWrrS/X00X4X6oE7duu/np/V9Ax39fp2x+P0+p/Ax/k8fzoopPWXfa7Xotdumt9PuE/8v8vyAcHOfTHXr/L/APV70nOTkg+nt7cen+cUd+v4ev8A+r2/Gl+n14/z2o20ve9tr+Wq9Nu/TQL/AJf1v/wAI6jI/wAfYcenr+tN2dicgD246dx17dPxzzTyBnrj7uOPXH+PTn0BzyTcBgZ75HTBH1HQ475P4YrRXS2u9Fe1t7a9357beRUbprReS69PJ7p6drN7aNp7DHBOP0/Pt+HXIpyZHI+92zzgLk56g4wAuRznGflJLMJIYgE4AxjscE9ScA4APJOePYipBxkHapC4GNuRnJ689OTwQBg5707aW8r2el9r6Pvfz3uXdpR0Wtkr66WjfTbd9WltuSgn29/Yfr3GO3p60mwggnOOgzk7unPpjnJGDwecZIpyk+g5znnsPwweADnr6Y6VNHyyFucZBx0PPHAXI4xwOTnqe0pvlW1rpfc139Htrt5kLRXT1u015aar1+/QoDDcjnPB4OR7fQ8dO/vQOBgdvz/z+X4dKiiAIO3gHGPoc9P8e5yehqQEjrx9T+me/wDnPYlPXZdnvpsreei0su6fVCs9nfpo/u2/DRDvp/n/ADxx+tNyCT2ILdD7+mT79eAeMLjFLyB6ntn9PTr3pam7s1o097JdLa2tt62WvqL+vy/r/hhMAHPfGKOnH5f59B/hS0fj/n0pX0/rsl8tOvX5aAnr7+vT0/X0o544P078/jjP+R1paKP1svy8vv8A1AOf8+3T9PyoopOf/r/5/wDrUv6/r/gWAXBHH885/U0mT6fnj+maCc9Dnvxg5/P1Pf8AUUpz9f8A9X/6hTXbT5/5/wBIBP09v89/p79aDjPbI5/D9OOvt60Yz+B/rkdMfr0PY9aQZPJHpjHI579eeR+HB96a6tfNfNfen/w/m0t9dl+dl6vfX+rrweh7+hwfXnp347Z9xgr/AE/n/wDq/nSY7ZP59f8APtiloSfa90nrZbWvbyt16736C0/4P9eX49QOe36/r6f5I+tJ6cf/AFv6D8/pmloqQEzzjB/z0/P+f4ZASeoIweM/z+vH8qdznnqP6duPT2/CkPuSMnnHf2//AFY6dhVWvayV3bfRW93X721pv0sG/wDX9feg/T/PWkJxz27+v+fxFGckjPIx/n8P60H19Py/H6Urbab2001Tt93r69mAdcHI69f04/l+lA4xz68E5/DPUgfn70mBnn1yAM9z1Pv/ACHqOi4xwAMeufTp659fT3qrbNK+2lkrpa2b76v13tZau3n+ltE/19XbzAcHP5Z7e2COO3vnr0pcjsOe5/kB9B39SfSkH68/z/z/AInrS5579vX/AAxxx3/LFS23byvbVr9enReSXYQmSex/TsOOh/z3919OCfp/n9PyHFH0opAHJ9Sc8989h+HI7+3tQCcHt6cn8j6deev19Uz2GP8AOeo9M8fWlo7W0tbbyt+dtQt2/rp/SE555H+c/wD1s+3GO5OD3z/nP5cj8Ouc0Hj/AB5PJ9sdPxHtjigc9+mP6/TPf1ANWk3v010XRJdemlnpfa9r2u/P7n21X9fMOvf/AB/z6dKUf/rxxn+f9aBxj9ff/P8AWkx16+vX+Xf8O3Uc80Rvol3u/wAOz9d/zdhd/wCr/wBb9vwHZx+B44HrnPfnj0PFGfQde348Dpn0oGQeCSenXHt9M9CMcCm7iTwc4zk/TjHvn36gHrVu+ndbvtom27XS9Nem9rB/X9f1qLknOQcnufr9cc/p+WTJ9D+OO/8An/CkPHPX169OOg7k9APX6mjPXnAOOxHv1PXvx279KjVryV72et7Ju/m/O7XbRBbr3HZGMYP1zwOTjj8e36ZNNPOO2Ohxzz69/wAsGl57f5FJ646j1/D+lCcrrV3Vvuunv6Nd33BX7fPovW/66CcjJLcfyHp7E59zj3xhSAxByOOnU/TofbH/AOqkIzwf8/TjkjB/An6UpGR6e/8An6D8hQ5N216pvrbRfrrbb57UnZp9b9NktOi+d0LSHPYZpAcrkjt9cj/PrSjpx35/OlrdXTetrea32/P8xNW/4f8A4cG7enHbryODxk+3600kjJweckfUYz/PpkggdQMZfnH5cj069u5x0OO5xzTec8jgZGM8HkEcgA447gfiTwRd2r67q2l32Wu+u2rS02WoK3Xbr5q66f1+ApLcDoOOuMdR7g5POOCORmgHGSMjqc8/UkH8f50v+fz/AMf1pM8HB9eh79eRg5/Tr3NCb2vb9Fps7q21ktEL8+n9fcGeOpAJzz8voCecN2x0+hHGQ+oP8uSMDnvgcAdPr6ISCT1GDk+nbr7c54wvX0OF47dPTjBz/wDr/nweKLu6dlrZL1Vui9NrdQt935f1p96F9cn1PP8An+fryaQnH6fr/wDrpO2cD1/H6+vv+NLjjB79fy/P8TzS009de/T/ADdvQemn4/hfq/8AL8kDPfHP4Y/z6kijPfBIzj8jj174/wAcUvTgHj8eR+P9c0ZHABA+VhjHUk5HHHTHX8MYzTW3Z6PVLZ2turre7+62rEJ6df0/X/6344oyc4x9D6/X0/z3xQOO5P8A+v8Az+XAozzgemfw6UunR+av5a/O/X8A76f1pr+moc8cfn6c+/fj86OeePp70E4xnv6c0HnHp7nH0Htzz/8Aros+2nffROze+vmP12fX9V3EOMj17fmAf55/D3pTkZPXjp7jP8+nApMHcTnggevXjt6de/Gec80AY7DnJJOO5JPYZA9/Xr1p+Sd9Fp01tpv99uvpcNO6drad72uvK13+PyXA69fTp3wM8DnIxz/IdTAznv0/D/PrQTgZ/L/PpSAkkccd/UH8cdKNfTdau2mmn469/vDX8Gu22r/rrfuL36fjx/8Ar/Sj5vb269M/5/GlxyT9Pw//AF5prMF6nH4Z/HgGheST2fV9vP7/ADBX6K/lr/WvX1FGc4/z9ePXsMDoaXn9frx/nHX3pAwOSpzjqR2oyfr6D2/PHqe1L002a+duvle+vTdiS7f8DovToGTnsB3J+vb/AD3HFL/n/Cjnv/n8fb6U3nnv0HGPxz2zg5wRjpTvta2iv89Pvafna3TdDtfsvX5L9bsNoPfkHOe+c4GeMdeB9CPquPfvn/63X0/xxmge2e+M/wCPp6evXnmj17f1x34P+e9K777enXdW7aenkrhvv8v8temjt56dRRwMf5/z+g9KTA/Lp+v+NB6HvR26dun9KX9f11/D7xf1+X9fqw59DnHsM+nc/hS0U31we/8ALt7f4c4ycl79F666bav+uvoApPtjnB5+nToe/wBeRjOOV/lSEkDjn2/z7Z7HrQcnvz1yeTx6f5PXFPSyvonfVPXdb77b227Bb+vu9X/WgvWkJwMkjp17e2Bk/wD16TnJ4xz684Hbt/PHPQ80uOB7dM8c9uucc9MdM4xQtNb6J/ftey20033000D+v8+/9dA4H+fX+v6/nS9c56H/AD6//q96Tv15x06jvg4/p398ZoOQOPXt1A74z/nmkr3S1s/utdX8t7f1cP10uxfw/wA//WpO4/zjg/nn/wCvwRSjn/OP50f5/wA/5/rQvw87209Lei9fmAUnTjB55/P/AD+vHegNnof5j16UHJOc/wD1+nU/h1p8r00a+T0t6K68gt0enrf/AIcOvGCPc4x+PJ/lQfrj0pCT04yc56/oce/X17dgp54z2x1wc4/qMn+lFreV/wArrXtq++m47bPpftfa2vpr+ggOM5Pp14//AF9OufwFLxg+hPY/T05Gc5980h5755wenPI9h0z09evcUoHTHAHbr9OvPT8vwptaX3ulp0slF+Wz2tfpre6Ds9n/AJJWtbvrr+O7EGVJOfTHIyDk88gckn88YpTwDgc+56ZIyRx3A9DjgcjAo6dsf5wP6DH+FLU3f6fhb+nv020F+G34f59QPUnB5OTk8dO36fXr06GT/L6H+f6ijJyOenIH+f8APrR1z6+n+Tn6darXdWul6Pa+uut0n3ur+iA5GO2D7j/JH+fUHt9f5fn/AIc9KMnsf/19P0x0zx7Zo/z/AEPb+fXnsKm+3472e268ra23ACcYxx6nnoOfw7flmk4/X9T/AJx+lBzjp+XOf5cevI4HPUikIHH1weuMdPbH6dT1JwaSba1ats7dbK3rol/l1Hp1f4f8Ff0h2R60UYHf+X4fyoGef8n8fx9KNXy+WvyXLtvu1bTe99Li7/11W39bXDnPI47joeOufwHpnuaXHqCD159O/H/1/wDGk7njjtz1/wD1frS/Tv7Y5PbilZ6aJ2tot7aa+d9LgISeOpxnjj6/5+v5AJHPP6d88enT1/xoyQO/0/z+WfTrxRk8dMDpn3xx07n/ADzQr3TastO+q013v919kAuTzkEEjkHn0/L1/kBSdAR/IHnk8jHbOfz9sg3Hr7n0I75J7c45/Kkznrxzxz2Hpz6f/XyK1v8A8C3bS7fTR6+mwfl/XqJ1zzweMd+nP4j09BzzRnJ4wR9e+R3H8uM80mOD685/Hrjr1HTjpgEHkUuRnBGO+fz5Pt657nGO9Zb6p2t0stNtd9W777trp0rdaa2T02ta13o9fV9tn0UA9c5B6dOAMeh75PPt7cjYwd2Md8/Xj9aM/wCcHv8A55/MgUv+H1+n+ev8qT381b8NCfzAnkDacEEnpgA4HPXnkchccdR1pCeoxkgHH04yMZGW549AfyAeM7v1xnv9OMe3Un6G4cDPBDHn8MkfTqMkjHO08EVv8rXl8l11a2ett+12Houn5f1e+vorapk5+6ee/wD9bt9CR+dLnAzjJx09/wD61LSAk9cd8Yz2Pr0/ye+aS17aW733Wu+nqttfIPW1lbTvr0/rQTk47c8+vHb8fw49aU/XHXB6dv8A9f8AkZo57/5/n09ex5HsnQ9uSSO+Oh4H5n3I7Z4a3fKunT1V97P5f8Edr7etvu6u39bbignoSMjjj3/Lr+Gc0e/HQ5xx164x+ORRxkc9Dk+vP1zjgnt9OlBzg469qr3mtOyStpq+Wz3S766Ja9kw36Jfhfb5efTf0F/z/nmjJ7A9PbjHP4fhnv2pQD1Hr64/Xj6cfjjOaTn6jHPtjgf/AFv6dKSUtLeV7aJ7O91p5adttWIAxGPlB+uPT6gn05HHtSAnjjHXv0I9/wDDpkUp6Y6Z/wDrjjnt649RSA5459zjv+IHP4fhQ7721X4NJO/nf9PvBBnPI7df6fhz/k5Lhn6emDRSE8gdznH0+pH4kfz4zK6WXS17+l3re1r30StfrZgt1+m/yFzkdv8A636Z4/KkOD349Dx+fcHkfpQCD2+Ydfp+Q+tHXtzwD7Y5/TsR3/MbD2f3PTXf/gfj94Y+XnaRz3AXHOPcHpj6Hk95O/GNyhtrH5hgNz8mcg9QPvdT16FnHIHvx1P3jjPylMDHT0AK1LzyCc5HUHBJxk5GOuRzjg8/xDlN9dFa35xv069en3l2tpZpLVrr9lt9tU3e2jT1HYwfc4z79enOR/ICpNzdu2QDnPpxlQcZ9c9TjAIpnH5dP8+v+c1ImRgnGwdDngkkHn26A98j0IFJNOKtpqlbfqtPX/h9LELfXW/dbLRaWs3ttq1dta7UVVVHAAzg4B6Z6D8D2/DpjCkA8EcHJ9PT09c55pqd85BAUYOO2cdGbHrgnnd7mn1E1Zr7+3btbdW/QXp5f18hOQPX3/z1IH5/jR7j/wCt2z0Ht1OcfnR+Pt+XUgfj39vXlM9evUDPfP4jH5dew5GXHmuraK19X093ZPu9dNde2o0v6+a7a9dbaigk9u/fjj1/zj+tL/j+I/z+dIOef8/X/P40tTy3322e2ysnp+d15vcQUUg+mM/j9c44/wAfrxR7Y49uMf59v/1L816W6W9b/wDB11AWk55/T/PXvz7Dp6nrz6f5x27/AI0hzyBk5z3xjHbPuf06cU1q9dtL307bdtnby27FRSbd7W630tqvl5dPkLzjJH+fTPr/AJ9ygzzn8+3X09s85OT2zikGTzntx1PfnPAHsMY4yB60YOev1wT3Of5DGM8Z+mXa2jto+l3u1rd6WW2t9dGuo+Wz7+S6ara+j6aavW1uoE5HII556dAe/XI78Aj36076fX/PPX3pMHPU+h54HTBHT0wfc9McUo/U/XH4dcf1/kJ7W3v2fVRvv6NfkrbS7WX39OqX3bPz7oXr/wDW9v8A6/Wj/J+lIDzg8kc+xx6fTv055GKMg/h9fcd/x6UO9l8u+1l02te13u32tYGn26J/Lo/66+YtFH+f85oz/n/Oc/h34pJbeq6935ar/h7aiEPPYgg8e/uRnkfljnAyc0mc/gf5Yz0B9Tx3x3BpMehOcjJ59+cE59Ae35GgDpgnB6dO/wCB9Sen1xjNaW0i1bRabrTTs7rTvft0Lsrbp3s09bed2l5d1ZXbsKc5HGMnn6Dp06e3OOSDnJpMEHI5PPJ+o7DjnrzjnJ45o7kAn8T06cg8+p7g89qMEkEE4x39CB07845yRzyOam6T6Ws1t06a2u+i66K/UFpZ3Wz7+Vl3tr80kO5z/n/PTtj8fQJGRwc4/wAM+nHI9enrSAEd/X9ceuSPoPTJNLxn8/8AP/1+QDkZ5xSfTRd1ZvsvxVk99Fuurns/Tv02+/yf3C0mRnGcn2/z/n8aXjOf8/5/TNGBnOOaj+kIKQ8+/wBPUe+aO/8An8fw6U38SM9uO/PBP5Y7HBx3LSvtr338u33f5FJXdr9L/wDAvrbTy30HdCSO/X8On+eKDn6Hjp698+oA9evT0ppHXGT6jPUcHHr39+D1zkFCOxY8jv0yc9T+HTH8zVJW2td6vdvSz1t1tbTTS1txqN7arpum+29vVK21vmw2nHfOeuewxjuevXPOD6Dml2kc+oGR3ycd+uO/XnHJ5JpQDjvnPXIHc8j8/bHOMd1JJPXsc+vbH+T1HamnK6267apJcvm1ra3Tpp1Hd6Wt16aK1n8lotdLX1SaAeh+vOPw4/D29euaOOuDnBH655HPv04PH4meSOckD6ED/wDX+f4Uuf8APH+ee1LVXeicUk7LdWW+6Vte+i6EP89fv/r/AIYXrwcYH/1u/PPHfPoO1ID16Y/X9Qf0/pmjj+n+f8/TrSEZ45HoQe/P+fxp+83Ho29PSy18/Nb+VhLXrp38v1+QN0OOuPfGcjngg+p464A+pjjGMnjHocZ4GCevH+c0hz0/+vx045B9CSTx6+qc54J7+4JGPrgZzwTxjjBoSla3dp9Vso9em3Xrez2KS2ei89Vd6aX++1uz9RcA/wAx7HOQTnBJ5zg9OfxMH+n/ANce59Bt/HrTSCBndx+vU+uOfXp6Y9VOR3z0xzzjPB4GOenIIzzntRrpZ3tpe3T3d7739bvv0Ka6XTu7W+7S9u++q11te6AcjOOv1HOQOPy9cZAPHNOHTB/+v+h/X+VJg8ZP0xweP0PBycAfQinVDl8k9Etemn4cu9tWnqyW/wDgb6baLXpte2tmGcfyoyPUc/Tt6f8A1qKP59/8/nQrdf628vXqvl1kCcnoB/n/AB+mM00kZ57n8sHqckccenb3FKR1+99ByeM4x3578/kOAhzjbgc5PP8AvdxnqA3Y9j+NxTbWi31ei6K1n03vp17ajirtAR9TznIOOCR6c4XOeR19jQeD0PI4OPUnjJ9/wpCTjqegycdM5J4A47euB79UPpk8Yz69e3cnPQ4x06d2orRet91dab3T8r6qz22KcdVa2u1rtWVuqv31bS1EIIOOMEjg89wvTrj5iOD1259Q4YOMA4H1OPmxz+PJ56j2pBuBOW4OBkt7Dtg9McZPQ464wBcAcnuemeSwPHH+euOtDd0r6q615X5eevZq662s9x62T2drNXu3ZXuuva+rfZbDhwD1685/U8Z//WOec04e3fn/AD2/LikAxk45P4/r9Mdf580Yx2GOfwz7Y/rWbfr563vt+TvYl6v5L8F/wNO4fyHX/Pp/n1oLAAd/8M8+/HOe474FLxxgZOTntx+ee3P4emaTGOSeOfbqc/5/+vwvx/UXb1WmuvkrdRaZjkYHQHk5ye3J+n1OOw4NKRnjJ5OD/wDW/wDrZHXI6mkzwckjB6/XB6Y4Ht+HpVxT3T6q6169fPr8tdOlJO10+ye+t7devmGOAAPqDj/Ejk8jsMfgQkYJKnueDk8YHHPHHXBx1z7oy5wFJIx94E8YK4655PIzzyCxHSlxg9effnPp8vTjjkY6YOMcO+qWrerejVr8ru9nu3ZJdNV1VaJpvXrJbNfDra7663era1j2MHPU9+h6c9eenccZ4496djjH+cH9fb8PwCAHsSenXnHr3wcd+31IpfXH4fpn19PQc9u9J7KzVultNVbV9nZ9+wm9FZ7Wt010vf73re2gAYwOwoAHJH4dCM9enfJ9T29KcByACBnGDjOMnn6H1wNwxmrMcKtgbecDPOV4IzkknnnOQORxx1E6JXb3fd3eq0tfW92+j0300UVfd6t6K71SavfTz6X7+Sg2E8kja3XGeTnjGc4xyevBwBzipQoGQQMjkEqOCB/D+GcEeuBVyO2JXcFGOAASxA6dgCe2Ow+8TxzVxLEsSoUkkE7UUls4GSMBjgLznocEAkAGodSKaitW9Va2t2l53emy722NXTlyqUYtpavSNre6nJeX3dbN2Mby1wcjA+8T2yTkYA78ggliRkgniomQ8lASc9+g578nnkdPTnqCd59OkiCZXlkzjOcggA8L7fLkkkZA4zVF4NoJORhgGGOhOMgkdjjIPOCeoIIFQqXbXudkut1a9t2+nW99FdpXfJK13FxVtmlZ7bd2rrsrLbRsywuCSM5I78j3Pr29aMdCO3HtgHofp/MdjjFgxhG2HdlujEjjJAGQDxwTxkjoBjOKr7cEjPpwMduO2Dg49u9X11dmlZXWrTavdNa6atX6X13ctaNpu6tpve9tGnvaLvZ9dNwA69fQ8Y7np+fY+/WnYz1/z/8AW9f603kYwc89z+Y/TJ6kdBx0XnPqDzz2I9P8++aTXZ7rv2tp/l3tp55PvfzWvbyW3kvKyvoGefw/Lnp+J/Ol/wA/5+lJnBGRwR+PHX+mODz1FGRwPX8c/wCeP85wraL5/p+Tv/w1mFn2/wCD6d/kL9aT1IGep/L9c4HpQTjnnt+vt14+n9aQ56AnJz246dvQfnjPPJFOKu/mtutmr7bW0d+/mCX4u3rqt7dNV+FvJSSO3HX6+gx6+/OB9eEGW6jr07+nHse4/wARSAH+8eD6Z7H6/l/PINGSckNnjuMY4/Afnx9cVSVt7KzV373Xl9En/VluXy2S2TVnez0Wj7Wb169N/JcHpzjGMgj+XTj29RgcDBwSDzkDv+XI9T+uPakAPBDHHv3/AMMjv19RS45xk8jsBg88+vr9fUml2ttZXtd/y3T/AMk12v0FbR27b63+zfdX/wCA2LgH69M//qx+Xr70ZxjJGf5n26Uo7/05/Ok4znHQde/fP+f/AK+Ulql00bvp2v8Adf8AVbkC0A8nkEDp7HHOc8Zz7dutAOR09euexI9v1pAevHr+JHH+fw98NJpd+vo7rR9F59dN7D7+XR779P6/UAT3H1wOPw79/wBDRnnGDg9/zPOR+GO3txTTxk5x6dfX/wAe4Pc4B9uhySDu4P49fbkDnI5zjAHNO2iu7p72u3tFpbN3016dexSirXvpbW97622XX11Wu2mocZAxj9OccAdu/GCOcn6mD0xjH4jP4jv3x24J5wEYHj5j2AyTzjPGcfTGff0pxHTk8Z7cd8HHcggcD8ABRokmm7Pf5Na63s+i+Wvd6e7rrLq7uzXXV79P+Bo1AIxkcHHYAA4wTx1zz0HY0evI9fT6Z/Duf/rUdcc+vHPTHQ+nUde/bmjgen+f8gVH+S/r+vUj1XTT5WX6P+kL/n86TIzjvS0nGc98H64/z/P3pf1/X9feLr/l+X6f5hx69D+vp/n+dL/n/PtQSPp/n1/H8gcnimfieR9OeeBySDyc5yB7YxVKLf56p9baaK/9X8xqLe339BxIHbrnjjn19ue2eecetAz07Y7dj3GePr070zBJHJ69xjn9D0HofTNGDnqeRjjrx68DoT1zyOnWnZJWb00bunp6bb6+dl6srlVrX1trdPa6+63n0d3ZC4z2x69Oeme/Hfj8etGM4G3uCc+uRnjGPx4zzjg8rg9d3PTr3AIxjp6cY4x170uPc457/jnPX27/AM6pX082n2VrRv11VtPwVtEy9rddV37Jp739Fs7PaysZ9ev/ANcD+vvj9acPXPr6fhjr6+n0PcJ/n/PrQAQPT057dPU8Yz0yPpnhK3u6arTotrLW/VPb5Ef1/X9flqZ7ZAP64P07frzjnsf5/wA/570YHXHPr/n8aM/5+v8An/HjNK0tNLNa3/8AAbaPa2iut/PqByQM8f56fTvxigDsAeOn9eOp+pxz601uh5Ixz1H+e/A4z+tMGc8MexPGe3oM+wPv9Kai7a6btaPdJPp126O92n1tSjdX09NdNv06a/fez/QbeOvt19AcH3HbtnuhGORn+YGBgZ6nuenA44pMHJwxyD379O3YZ9sdKUAnJOR+Oemc47jkDvz/ACF7ujats1r1tfTro/TuldlLTdq1tVr1tun1a8rbrQU5Pbrwc56d+c9Dg9ueARijgc9O3OMY/Ht3AH0PA4MH1Pv2Oe3PcDJ7nnqSOi4B4PftyPz78f5HSlZtLtre2nRXv06aX669Sb2tZu17+fTfpe60X4u4tG4DuM9hx34P+HT+VHP8/wDP8/0pMA84H1/+vUxV3p/Wvy/rbckcMAYxk+pJ69Afy9f/AK1J/PHP+OM9Px7Uh4HA5A4pAT36/wD1xkDAwfTqecdMkVVna6W3dWfS9rJeet728xpN7fp/XzFPHXknA4yB+XPIHU9/Wky3ORn0wOn4H144znr6YpvzZHJ56DP0Pcdh1OD3HU07B67jjnPb29v5e461Si0ktF5d9LK1lZPvbXdq60VqNrX6rz307LTXS93+I1v4e+SOvbJUdjjnI9jzyBTumQRwQckn6dCOc9ucH06CkwBgZbnsvXORz157Dt1wQc5o53AHoR97kDP0weeOoIPPA6U7S200ur3S7Wd3fbX/AIOgb6L12eqbWttL9dLdbJPcdjgDH+P6Hj8PXHTilpAMDr+f5/Tv/j2pc8gYHOO+P65559uvpwNSb/FbaWs77N9+/wB1yH27f152ff0FB5B4P+fqBgdhx+VGcAj+XJ4+nUfn6jmg4PI4H1z69s59h0z14ppIyBzz0/Dr/n8OaLdW7pbarayu3u7+el/RiFPT8P1yeuM5/nz6dU+g/TH0HOP85FN9CSckdAfp/Cen/AuRnHcUhzkAE8446evXGCByT09QMdo1ej001drppWtfqnq3087FKN3/AFZ/0v02uh/PoTgcn8Ov58Yz+IGKCBycdeo7nOB64/zx7t+Y55Ix2wc56jtnjODjsPeg8DJJ7g49Se30+vbr2oUXdL70m9LWbb/BadbPo7O1rLZ6J7+T/Ps9PRtpcc8cc8/nnj69Dn+QApR3z6n+XHfuAD+PSmgEAgEk/wCe3Pv6Z/UPA6Z646+v+TmtN0reXfa/36r7xfPS72tdr3fuuu/VNb3EC4OeMHIx1HfOcEng9MYwTx1Jp4yBjAwcgbsZ45wMchc8cduOopOACSeQMAZIzySQQQc9OOQAOvQVIvKsASSpxgAAHduA3bsAAHnIPQ4xx8z+V9v6ej/HrZFXenMt9dW7bLla6p2sm9mP47de/wBeg4+g/H6dXh+Bubv93LZ5IPHPUA55wT0zzkR/Tqf6dM05SuRuU8nOevHHfoRwQeM9OBUpqyV72a69ml0v5P7r2JT3srvTd9raL5rSzvbYpqgA9CRg4x9crj5eCAR17fg7GOnbt/n+tMV88ckgA88Zz1wPbPOccnPHFP8ATt7fr/T+dRK/VW6rXvbRLy9F8xO+zel76eaWttOnoJ35+oGeffgHkccDn+lO/D8P15x196Tjr646d/Slx69x+fb/ADmpV3ZenWyVtX5Wur6p3tr1BvbyS/Bf5h/n+f8Ah/KkGeRzwepOc0fr6/j+XT8eKX/P8v8AP+eHG9tNb6rstbJ/0n03VxeX9f8ADiE4x7/5z7/Tqe1BPGQOozj8OuM/nj1o7g4z9ePXrxnnjPf8uTn07A9eM56Z/wDrc98dxX00tZvfbdLX0aVwD/PbnJ49Ofy696bkkHII4HB9OnXrjrnj15HZSSOcc5HBPB/XJPGOxII44oyfTHOAO5/p0564GCPemr77rTd7Wt8ra28uttnSXW29rdHur21t1tpr6agCfQ9+3oePr7jAJ5xjjJ3AHXknjB9uox7Hgnk8daMscYUDnn27exPr6enXhRn0wfzHp+eO/wBPTALOz93e+y66dum9u+9gdlrp5a3s9N/Ja9N976AAec/59fpn0/TjJWk6f54HH+etAGO5/wA+wwPr+dK7urvTRaX8k7frYT1+5fhZBj/P5/4/z9aMc5z9Rj8snGf8j3pfr/n0pvUgg4I4I68eh9PfPf6Zq0m0r6W/FKzXpt9/pYF16K2r/L8f8+gp/n+Y/pge/p3zSEj2yQOOpOc46dfTr3pSeOQPXJ9cdB+vYH0B5wmehAHXAPt26AkflxznFQl19NE7J7de73tvp0Gl1emi2sk3pa99Nd394fN16e3XIHUHtn0APt7hAT657gYx15Az64/LPfFLk8ZUHPY8c9f1/wAfTNALH+ED0zn8/b9M5wCO+qWiWislp/l6f5Fp6apaW67LSz3d/vWiGjJ56Hvg49SfTpnB569weQ7r0P8AI4P+ODzz6YyM5XtyMZz/AJ/LFAzn2x655/LP+PHvWV7ttaeT17aefkrWX5Q3f8/Louu+21vvQAdOucev59Sf6/WlpAOeScc9Pxx+A4449etL9D/nPI/p9Knf+u3r/XYn+v66icH3/wAf89f/ANdAIzgc469ePz/xz+uDhc+nX8fx7nt/+qkHPQDnB5/Pnv1zj6Z56F20e9uj2Xnv1t27dUNX8/L1uv07agT16A54yR9M9R7+/Xr0pOeOeOeRycZ6ehOO+D9O5ASScKPrn6cZ6GgE8fKOnfpg9Sfr6ZyOvpVdldLbXR6q36q+rs/NlKO1rXWvTtHz9fLtuhPmBH3ecYzz349yR0/HPqacck4OMfXnJB7nrxyenXvzky3ZQOvUg+v9f8jrS/NngcH0J4bt9e+M/WiXTRbLZrry/lrbW9r9tW+qXLs3dO3bXy+b1tfycbtjAKgqeDnjjtg5xwSCBjk5GOuFIyQeB8pyBz90Yzknr6+/PsVwO7HjkfmOvqMg5Pr165ClSMqMfdIPTgnB689/btnHQU73V3fs2mrWdk3az7aJLvZ7ivolsrtd9JWbevffZXv5A2MdCc8H2BODznPI9Oc0HaBkkHA6jPTgZByvQYB455PagLg/eYjOTnv0x29AOhx145OF78H6/n7D689+h9QubS2+ltL7aLtvvq9Fv5C0S3ut+qTemnlbvbVPoIzcYwdxHy8gdMDjgnI65/EcYpGIIAc7ePUkgAAAZPJHOB3AHJOMlpPJYdQePlzxwfmyDjJU88e470mWJ+4M7SNze+1sAgHHJx0J4zgDpaW1vdSS6Wey8rW73W69LNJXjvFJrrazvGys/lsnfttEfkjPI6H6g9e+OvOOPcccABPQdzjkc57nA9Ocg47HJzRuPI2jP16/0PT69fTg3Efw4x+Wc+/GOvrngfUba7Npq+yXTz6u+jS9H1cdFsntpdX6avp2svS+uoDI74x1yB9B3GRjv7HPYUAkk56duw688gkZH+T1p3Jxx165/wA/54GOuDBzx05J+v8An+vQ4qHJPeKvpe3bTrr1/DTcTlp0v37W31Xd66aa7hjnoP8AIwP5n1/wWj8f8+vTH+elIeM4/U/y9OfXPp0xiOv9fr+v5Eb/AIf1qL/n6f5/zxSY+tGQR3/Lkf8A1/8A63qKTJzjGeO3Xt64A9wM4yPxdndrRW6N7ffp997ruOz+7vp+YA53egz9Pr/k9Ow4pMc8Z9Sck4PPpnJHpzkZHvQAQMAZySCT+I5HPHX/APWcUp3Z4AxxnHX9SPw4/rWqbs2rNvWy0vblX+e+t7eaKSs91t3tZ6br9H26dEJP93jHOccDB5HJ59BjOccjqDO0EdMY6j9TjjB6+vX6UuSAPlXng4PfHXnj2/LFBzgZAx1Oef5fj6jHXHSp5m+lkrN6Xb2ask36K610WltS/RK2vq1t06p9+qenZt24ODyO3Tpke+Tz+HJ7HaX49sY6f5/zx6dKO+ent259+/PT/wCvRjJySeOgHTvnPP8AnpU8zd/Tou9v8kn87X0RLb72tqum9vz37b9wH+ec/wCeP8mg57HHuecD/P8AkUtJ/n/Pt/8AqPekvK/npfr+Pz6i/rv+e4H6Zx9P88dfqBSDnoeT6jken9cfnzzkJI7fTv39OvTHbqewpCx9PXP07HnHGev05x0pq/b53XdOzvo9159Ndiknb8tUu299Hq159HsrISRjJyefTGemPfGTkc9AeKCTj8+CeR0x1OeBnGOvB6mnHdngDHbnv/npkYzzSc4xtHXjOCB1x/h2H04qr7aR3Tdml5rRtba6d9fWlJWWy1W2nTXT8NdNN7aBk4ByMd+2fz6cjHvntSgkjrnjA7c++Oevpxg9T2T5uu0Z+v8A9fpx69x1IOXAccgAnqP8+uBSb6uz7Wav9ne3pa6/BWBu3bps1dWto7a9HqvuWlgcjn8cjH6fp/j3OMgdzyB39P6gU9QTgdQTnA56ev1BGfy5IqyqKMNhQVYe4wcdgD07kkYGeoNTpbm0620af3dOja22S10BRXV3v9ld7q+3bfpt6XSOIEgEEEAZIHI4GQSec4zkYzn3NbVpY+YwAPBKlME5Y4XAJILYz15wRwRkjEVraF2U7WIbBx1HZuQSOB3A9+uDjtdL09pHRSoLNzkD5RyMnsS2DkYA49zg+fWxLpxk+aN+nkm018+mtvW51UaLqNNppbO9ld+7bRdezuV7TSGY/dzkgY+bbnIXBBB9DlcEjPy4OQfqH4b/AA5ttCWPWdRjgudSmiC26ALLBZ288aHCggq00it87gkRqxReS7HO+FXwm8W/FDxj4X8AeB/DWoeLPGHjHV7PQfDPhzSLdrrUdX1a+kVYLaGJQu1QSZrq6kdILK2jmubmWKGGaRP1J+LX7Jngz4Z+CPHUXw28Zr4z1D9lHw/4S0b9q3x7c61bH4dap8Y/iB4oudL0n4a/BPybFrnVpfB8Nrc6Vq9zf3KRatLpl7qlm0MMbW7Z8OcYcJ5XxDh8Ln+JjTxGJ5fqlSdpYfDTnOFGlPE2/hqvWnChQlLWVWdktHKBnmQZ9jMolUyim3Tpv/aIwahVrRjGMpxpXd2oQjKdRKyUVq1dJ/k18TvhtBpiS+IdJWNNPkmjW8sdyIbSefPltZoSvmW0jh/3SqWgYhsGNv3Xz7daayscqWDEELyG7YJG3kjgnHA64zkn9YPhh8D/AAf+1r4Z8RfD7wJrt7oX7VHh+bVPE/w88G+IdTtIfBHx58I2unQzaj4D8KtJDbyaB8WdDksbvVdCTUbmTTvF1hcy6egsbm3a4T87db0C/wBOu9Q07VNNu9L1TS76707VNN1a0nsdU07UrCZ7W+0/UNPuljurPULO5ilt7u0uYo57aeNo5EWRSF5824kyTMOIczw2TxnQWFqRjVpVVy+0U2msXhqb1eEr3fs5xbXMpRahKLgt8vyvM8LlOEnmMo1J1F7koPm5UuX91UnFyl7amvdlzWS0eqXM/Dbu0ZXySAduOR0HHAI5HUg44Pp1xkyIE6NyeCO5z1OR3bBPUHHryK9C1GwZ2J27WBb5WXIIOOPmOWzzzkjGfw5K8smAJK7eRu2nBBJ7KRnGMH7xyBkiu7DYnnjDmleVru71vpZ2tu+3ZXtrZYTg05JQdk7J9dXFPXql02SV92zDK8BcHg5OB05Gc5PfJxz9eOoOGI56ZBPU9AO/bnnn07VM6bAMjHIwQGOFwP4sHdk8E7sjHIzUffPBI68dcDGMjP5jt+dd17rr3d/O2/z19fx5Z32acW1ora8ztbrtotGvPR7mBjHYc4PPBz/kZz0oJ+g/zx3HP88Gg+2ee/HHuef0pMnpjPHP68cjnP8A9fHTLd9PPa7X57ffrpZ9CLPTfd77X9Xprrp5a3DJx+Xb+fPv6AgZ4BpATnkc8ZOOgIGfTHQn6jHPYLEdR/8Ar/znvz6gg0uT/dH5857eg9v5e71XSKelmnFdFf7/ANeqKSa7Xb0d10321s9tP1EBOSPTnvx3Hp+XU8+wK4zycHn6gdB19gPzPtQCe4x69/06/wCHHB5wvc/h/X+mOP8A9ZXN2su6Xqtuienb5t7Dk76WW3zvZ9NHfv1S+Q0Ek4xwDwccccH+uMH8+adz9evt+Q/zjuaCM45Ix/n/APV6UtLqvyV/JdLa9dGTf8rdeiSv0D/P+f8A61H/AOr/AA/z70f5/n/n8OKQ9OOvbr/MYx+YoW9r2T0+/cS1e9vMDjueh/8Ar4/r+GeuCG8jjI6cc5PTvkdM5Of5AGlBIHI5H5ZP0zyQfT+YymTnoCDz6Ej8+o7+2M4qk5batLzVtOXVXVuie21vUtJ66q3ntpbXXTVPR2YZPXOASD0z1xgD1zzxgHjnrmgbugxxyeOT/nBAAwAMYJ60EkYyo5OBz/n1/LPHenAn+6AO3J9P89hjPTHR3aTdo9G7W6cui3va79N0U3ZdGreWtraefVvezdk2ICeemfrn6g/Q+nt0pf8APoD6kc5/H3zz1o688jr19/x6j9M/kEAc8k88D8O2Pp37fXMu7e3RNa3006vp1v638o39dEk7vtbd7b79+u6Q5z+B6djxjk+/sM9wQOFxyD6Z/X/P+ex69f8APp0/Pr78UtK+33fgl+Wnb8RX/rb1628vPqJ0/wDrD/P9PSlz/n0P+Paj/wDV/P8AxpnI6gY55Jx69SOATx079Pakrrbtdpq/SyTb89UvJbAk3t+f9f00Lz659cDngD045/A88Gk6A5IPY4yeTwc88D6D6DsVBxkYzjuT7d8dPbPB5JPqd+FAyDnoP5Z9s9eorRppSeifTZ3slr0smtL/ADV9WUtO3Te3k9L2tp9+909BATgZwwOOnPX1HbGPbqOOc0pznj0OCRkgnjr6d+5456jIWOfuAZ6AY9zycdff6846GWA6DuBj/PTH0OeAB1pJNtXWu/q0lZ9bK3VfNa2B7rZdd9Laeva2iW3a9gA8Z7HPH0I/Xr65PQUoz9ewxnn1yOnX8/yoBz2/Dv8A59Mf/WAMZALHn/PXjOMcjJJB5zUvmbTstLJq7XZvbS+vXR21vbWXu9Ffy6f8Nt26+YuO+P8A9R/XB/z2o6+9H+f/AK340nPGef6emOp575OMD3o+Ll6aW73tbdX2vf59FdCs3t/VhM8+3THvyfywDyOv4cGcE55z04wcHPBzjvx9Tz1pc9fQHvx068/56H6hpOM8DgcH1xyR36ent+Qk09VfbZ63XK/wdm1onrdvcpLo+qVvnazXfz67+YEkdweOOnPfPUccH/EnijLdflH+A6A/hk5H6UDORlQOfbj/ADjr9MehcSfQcDufb8eevtzx1Ip3acVa992nZWVtbJ66bXt+hV0mvheiu9O60Vuuid366IbnnA9jxnnufz4x2A4yKUcZA46fh0Gep6gcZHXk9aUZ/n7/AJe3X0+lHbn05/r+H+cmpfM7Lls7et3dXb6O9tfW+qJcunSy6emtn5Lbr3F/z1z/ADoAAPQcZ9+vB5B5z9eaQA+uep9OOeD/AJHbj1Mcg5OPT/J/TOP1zOqu+2u3zSWltenQXfXv83/wf+HFo/z/AJxSH6cjnH1/lkd/50cjJPT/APX6+o6+mKuKejVt3fa/TSz06L5dO6/r8v8APqJxy3GenOf888dO3Tryh54JGcfQc9Rz2I7jJHPToQEnnA6E5Jxngc/kef5ije3Hyj3464GeD+fTOcd+9e9pttt3Ts7vfTs99VpYtR26u/Vq2iW+j0ey8rdxuTjg8DoeR+BI74Iz2985pckgnGMgn8sYP19+M8exDsnoEGDnvjHr6/Xv/MUuSeoAz6E8DvkYzkfUeh55qW30StvfS3S2q633/NblOVtkunVbWVtLq+/TT13EznoMnpjOMHuM+368AUvP+T09McDP+evOVx6dv0HTj8cev+CYOQOw7nqeo9/xOe/FCb1tb79r2srt797rf1M/69f61tpf8xOwAI45J68Y4/DpjP5mlAHbk8Ad+O/Tv06f0FBAJBB55BxgE45wDn/e5J45OO4Qk/wjjkHsBzwBkc4+o6euKbu07b7Wvo72e+iel9Nd30D+vNd76bfl+ZuHPGO+ex5CnvkEY5B6emcikLAjPA9cgAjgAgEcg856ZPUjAphbAYYHBPAPAyQ2ehHGOnXBwcHOGlssSVBA3YycYOScjnHPQH8sHqKN3s3r9+iS8ne99Oqtrqi1G9m1ypvdtWsrb9Nb3tppsm7omJHQnk4yOcYyPccHOMepBHzEU3JxjPXjnqQTwQCADkde3TpzSDJYkqBgnlTknpgHJwQTzyOAAO3DuQeFGfX2HYfUcevtiiyWlk3a7Ss7ba6pvVdtfK7uJNLu3ZPW1rtJ7vYUkjnjHfnnPPA6j9fXqaOoHf8AnxkYxwO+ORgjOe1GW44HXnqT/nnBxx3+i9fw/wA5/wA8/TmhbdNErLZaWburbrfm1u3dib0XdaJ3T6L8V3stLavRiBe5/EdumMY7cdD3GfwXBzkntweQMc8Yyf5depJ5CgDGOg7+35d+vAx7UhBGcHP1/wA9/wD63HWqd7+X/B1v8tvME31t72mjV9121XbVbaW00cOMg4yAMEBRkZPpnkE4I7jJOc5qQqDk45IOSemVLddrZPHTOcA460zvkA8ZY9SO+FI+6R68ggdCKeSASc5xnIAGAc556AHucemeMEUPvd3Sv2bSt3s1su1u3Qd3ZtXXnrqvdvpe1lo+3lZKzj0/Dt+uO+T9ad97bkHoMgYxjhcepAz2z0wAMCm557YPT/P8sdqkVySAQDtHAPTqMZOfUbh15/KkndJvyd909nfqvJ+j26Ta7S1e2z72+7V/e/vooVYZUceuOO/A/X/9XFPxj/P4VFGpCgZIOckccdscjv3OMZyBjHEtRK+muyt57Ju79bdewtddfXX+rh/npn/P+R3oHHT1z/nP8v8A69H+f8/h/kUVKdmm9f68/wCvOwd19/8AXUP6/wCfp+dJkA45OfQ9D6HP0I6jGPSl7evrgep6Ht/9Y8mkGOw4+mOfpitEmnG9rbW23tfXZ6623e99A/4P9fIOn8/xP5nkngUZ6eh7/lj/AD2pODnBGfT14GM+ox+BzR1I5zgeg5984/McfTHWF0v0aettrR0S3v26WV+47LT79fRO3R6vrta1nuL/APr69aRs9sDrk+2eO3Xn19fanevt68UYJ6fz/p6e9Eb3Vk35a9bf8Dy2D9NfLp/T76AOgORyD0yP8eCMfrS5OCOSAPqcD9fT9KNrdwMHjrnk/wD6se/fFG0gZP8AMev1Oa0XTyVmrd0tH/w35MX9af1p+gnXt+B/kf8A9dH+fy6//rp2GwMjGPrgZ9fz64H6U3GBnjnsOv1wP/1moSd1o9Ld79L6dk308wEJwOmRwPpz+ffoOtGM/wCf6dP8/SjP+ep+uOf89aTjOcnp056evr275z+VCbvG+iWml9dtP8/10Q0nbZ+uuu1l23/q6Q3A5G3gY6e4556nrxx6Zx1p2fqOe/vzng9M8fpwM0vsP8PY9PT/ADikABHU8HrxnoOc+hGPr3oTbs+2u/8AhTv1S67Pf1He9m3tbzellfyV/JvyYuemOc/Tt+vOQP8A64pR6dM4OM/Xr2/Hp19aMd+OvT+uPb+eKXBH4jP4Z/8Arfl+VVfReiv035Vfytfppv1RN/lsvXXr/Wva+on+f8/5/wDrnf25/pj+tFGD2x0/w/yR39sVkAUhAz0z0/r155GD/wDr7HQZPbjjr2PK8nPIye2eevB1B5Ptjj0z24745P6gh69NFpr9z6ffZar7w1Wv9aWf+Qbc8Z4Pfp7k85xn0JPpgUH09j0/mP8A9XcUe2SP/wBWO+c+/v70mAOpPsTg44x/TnOAT9aaT2T03101Vrt20fS29l8h9tkr3t92vXffr1shMjOMY6EHGB6E9BzzjnPYkAU7CgHOTwSB06Y7+g4wOfyFA4J9/wA/4fbnp17ZIxSH+h9+uP4cc4/QfU1V9bdLJpXb1fLaz3XX9Fpq7q6e2qvrp06b7+t3sKPpwP8AP+f8cgLjPXpnrz25H+e9Ltb07Z/z79OOtGDxx1/Dvg/l/njmokna70ut10SSV+3Xr16EjRnuMfjn1/zk8/lSjjHtSkEdR6/z/wD1fWkx3z+H4Y9P65z+FOzvrZeXVK3b00Xnu7gABz/n/P8AXP4Umcf5/wA+316DkUZx3/z1/lSFgPyyOP09j/Kkk27W3t06d/8Ag/qNXb+5emy6Cn27ZPsT/k59MjqKTjIxz2POeBn+Xv6+9GenXORnjp+nTj9c5xilwB+J/wAjjqB75x+FPbR9vvu1pfp3X4XTDvfS347dtPO/Xz6Hr2+v4fnjgfkM5oA+vqenH1/Qd+1L/n/P+fpQC3ORgE8e44I/p37+/Kd3fXa1/wAFr1dvz9Q/r8v6/wCAFFH+f8/57n60uDgnHHrz0z+HXp3xQk3/AF6b/wCbsvMQ3GDnPX8ug7eoxSjnPt+H8/8AJzxmkx09v88/Sgj3PXt/nkfXNNK97+WvRbdX2WltfwH6+nXTbX7tP6QhI579c9/Y5H69OgJpe+Pbt9eOOenc4/TOGjGc4x3J4I6qSDyc5yTkjgdsUHB6Hsc8Z4+o5J6d89Mg93ZXWjSdnq7q11+Hq+z30bstPLVt6rp231f4q47pxg/5z39eOc+vvTd3UYIJPGec4wD+OPw96cc9B+J9P6Z7/hR09T/n/PXn60lZK+jv+jW67ff0tbcNErvV9PlbfstLLuuwd/8AP0/L+v6rQM//AFvT/P8An1o/D/P+fel9z0/y/FbenkSFHf8AL+tHPb/P+Tijn9fz/T/PrSAaCRjOCcY47dOoyCRnnPqPrSnjnHQfn/8Ar4H5UhwCDkjPy465yQecDnB/4CKXqRg9yDj+v5f0xzV31u72t5K70TXmvL/gj6p9N+1+6X5aCdeR79fr6Y+v0zjjPBnP4E5wR/Cen+PT3pTjpzk46dev9M8+n40gAHA+uM4J/DPsPQfTOKWnR6p6aem/Wy16a39Uj8HfTa/Td9LW30u2/MaDknoAARg9enP4Z9vqOBh/9enXj69/5enXqe+PQdsjPb8OvU5NJg5HPQdOg7445+nf9KG7+VtlfT8t33f6A2nZbdl8lfze2/psKOuP/rfz9/6jsTS4P0HPJH06Y698+/50q9RxzkYwT27nr+PH095BGwOfQg8g8dwMt+WCcduwpNxVtbd9vTqvn92vQEk3ttut77Xv01ve3Xbqh6KVYKFIb7v1IxwMnP17E4B4rUt7RnKk8ueSPmIHQ5wx4zkqehHU8HNR20MjSI+3IZuoHyqBgHIG3GRk4LZOB2IrqLK0aQqNgBbGV2qFySOMgnnPy4PAHAzjjkxGI5Fur2ei100vZq9vR26X307KNNNKUr3VrKXbRW2XZWt3T3LVjaDCrjDHByOhGQTwu4AH8icEcjju9Cs5Z7m1t7W2muri5uILa2tLWGW4ubq8uZooLW0tLaGN5rq7uZ5Uit7eFXnmlljgiWSR1U5dnZrEuWIWNAXcscbV6lixAChOpJIxg4Oen7Hfs/8Agjwr+wR8IPC/7Y/xk8P2WuftHfEzTrm8/Yu+CniK2SWHwtpbIbeX9pz4kaLNGssNnpzSB/hdpd5HFJqF2Y9bhGZLS+074HiTPYZXQiqUJYrMMZN4fL8HTdqmLxTStG9vco017+Iqy9ylSUpyvez+lybLJ42tKVSao4WilVxNaatGlSTint8VSWkaVNe9KUkkru57Hpcdn/wTE+ED6ar2Z/4KC/HTwZ5epywtbz3X7Ifwe8S2mZNKguEaSKw+M3jjTZtt9LEUu/Dmnt5EMkUcRk1rjvjpHF8Df+Cc/wCzH8GwTb+MP2o/Hviz9rH4jCRs30ng/QIx4G+EVtqLNvlkt7+3bUPENsJmKm9kubhQWkLD4F+H2n/ED9pj4/eFvDOq67qnir4jfHj4oaHomp+ItUuZLvVNS1jxhrlrZ6lrV3KRlls7e4nvCiBYLa0shHFFFbW6Iv1B/wAFOPixoPj39rj4i6N4Okj/AOFd/BPT/Df7PHw6tYGJtLfwz8ItLi8M3DWmPlWO78RQ63d7o/8AWCVW+b5TX5dDJ63+sGU4XF1frmY15T4gzvERTUObCqOHwGDpRbbp4SjXrynh4O15YaVSXNUlJv7R4+msuxlWjBYfCUowy/BU3yqb9papWrzf2qk4U0qs7f8AL1QVoqKX57Q67rHh3WdM1/w/quoaJrWianaaxo2s6RdzWWr6RqthPHd2GpadeW5We1v7K5jjmt5onV1dMfd4b9Rte0XQ/wDgpz4B1j4i+EdP0rQ/2/vhv4dXUvih4B0m1ttM079rTwTodoFufiZ4KsIEhgT40eH7KGM+KvDtqA/iq0T7XYQtcJbxr+SN7cxvJhsYZsj5gxHp97uCcEY4z1Gc10ngfx14p+Hni3w5438C+ItT8KeLvCWrWmt+GvEmjXP2XVNI1azkWW3vLWVFbvlJ7eUSW91bSTW1xFLbTzRP+gZllNXE0qONwUlhc4weuExT1jUi+WUsJiba1MNXaSnF6wklUg41IRv8phMxp0as8PX/AH2BxL5K1G6vBpx5K1LmTUa1NP3XpzK8JJpnm+saa8UkiyRSQvHJJDLFJC8M0U0bhHhlhdRJDPFIpjmikVJY5EKuoIIHCX9iQMv1GMqcnPQ5xz0OeCcZ+8DxX7kfFbwH4U/4KJfDPxT+0z8F/D+meHP2uvhzpCa7+1L8BfDFkbe2+LOg2+Ptn7Q/wn0mHDPrCkfaPiL4TsI5pmmMmqwI12fM1v8AGrUbE7Gkj2tHIN6NgEsmFG4AFsgty3Xa2OMEAenw/n8cxpThUh9VzDCTVLHYGetSjV0fNC8Y+0w9RXnRrxXLUg01aSlGPBmuWSwlRTpT9th669ph60V7tSmrPW+kZwfuzg7Si/7rTPG7uBk+VgCBnggnA+XtkYPGT0xx0UA1klcHIGff2x2BA4PH0z713WoWhB3kFixI4J6n3wAARzzjBz7k83c2uMk/L8p4G0FuncZ5GcccdiByD93hMTGrGKk1s7PyVrO27Wtn23btv85OLhL3k0lortva2r0s7X7u1ndGR15z3P4/Xr7jv6+mEJH5fzx36DHTv1I6cU5lCAcsAx2jvg8cAjjtj2zk8kGmgY4HuM/57gnrggYPSu2yt16WWu7Ser9LXtZt9kkYvzbet0vLTr6aO3XUQEgnd3Ixj9cfp17/AFJpxz2GT/n3H8/60hHpjjoMd+D1z/L8c06h62el1v0uklbT9F520Jv6eltNLfnaz+YwtyAQwzxzkY+YcdeDyenU044yAcc56+xGe/8Anv05XH+f8+3X070c9/8APP8An6EY5pX21ei0/rS34g2u1vn3sgopDn68/p/n/DHcL6+2evH+H+fU0a9F5P8AC33tf5CWv9f5CcEkEdupHB74z/nmjjp/If8A1u2P5e1AOf8AOD/nkdPzpM4xjp3J7DHpxjt6ewPOKSbdkvOzb6W019FZeaXaz8rW8vOyu9e/+QHHPH1yODx+GcZ6e3A6UgHcjsD69se+emRyTz0p3H+c9v0GD1/XrScEYBOOnoRjt7Y6cjNCe1m1bVtt2sraWv3vpvsF+19Uk77dPXTR6dregA9znnkdTxwOw79ce/1p1IMtyOh4Huc8/wBP60oBxn0PJ6Z9up+vHPr6UK+mnXXppZXTVtlpe+mvXcH939L7npq+oD3IH+Rx+frij1z+H4fh+X50ENjgDGT1J9v89OnPbhcHAP4cdc+/+fSlZ6der3W1nreytte2+77i/r8v6YlFH/1/y/z1opL0v9/TVr8PPyAT8uv/ANbHufyz7Uh5HIyM++fqO/X9M+tBI7ng4I6568e/0HsfwXgjn6844+uencGmlbuu/S22q89f19GtLb7tX1T6bWe/l59RvIJ9McAZzwAPTnOffH4UoIPT/PTP5ce3TnGSFx/9fjr0z+nFL/n/AD+lO7s2r7avW+nKum/XS/W9r2HdW227Xu7WvdLfy1/EP8/5x/n9aOOeee3+f89+eMUoBOAQM+nr/I9Oev8A9cAOMkDt6nrkcdv/AK/H1qLba17rp9mytppZO6Wl0vW6kSilCtxx16dOn5nt/wDqFHT+mc/5/p+GajVWvpr5dLdOj29fzBO3X8KDn/Ake+B3/Cjjv2pvXGSevp27Dpxxx+Y9g7vTbTXe17WelrpvReW/ZAu/bX+v6Ydc9j9OM+oz1/rjOMCgccc9PbH4DOBzx+OBx0PXk8kDOeR3PHbjjt6npyDHPU9eeRnPUjGcZI6DPqOvJe17trZW6aKKeq18rbpJ6FaaX1Xy6RT3/C362F6/14xxz1z9Mf4UY6egGMevTrjHp0+tGDzjnA9s5GSc/UYpcHgnoR+o6/5wKLt2at5v05b3+fbfsJ7K3zf3eSat/nqH+f8APBpfx9f8/j6fT1oCseccEe2fx/HPfjrzng2sORn049f58c9OOtNXdvn9147ra1tvvt1EIo5PXB7+nY55xjpnpx1zQRgnvg47dv5Z9+P1pcHgjj0/lx/h1544pPz/AM9//rcdardWurtXWlltsttunVaaML/p+GwUnPTtzz0P4cY49+T1Ge68ED/PQ8Ef5/PNBAPv/n/P86yXp66dFZ6X0v8ALbfTZ/P/AIG2q21E4PHUEY47dBjv6/hikG3gDOM9vUc85/z6dBS4BP0x+Y9cd+nb07dADHGCOv0B4yOef09cd6avZ2vpu7q2qTfo9t3snsHR79+y8/V/pr5B+v8An/PTij+Y/wA/5H0pcHoAOnqB+WeOuP1/Ew3XA6Z6n1x6dCfx46UNPpZ26rbS3Xy09Nxf1/XcP1/z/k/54RsqMg9uMf8A1sFcAHtnofcnzAnGAQCOT069sEH+vSmtk8dD3AJ7jjt1yOewGeSKEnpfTXXporK9+9+m99eoJpNX2ur97X8vK/oG7jkZJIGM/KOoIPRiPfvg456MYg8Y+6MAg8exABxgZOMqME9OcBTgFixI4XA4HzZ45AwQOBgjPGScsMsPcE9c8gdck8jHBBzkfNyPwzqun4q1lsrW/K36qxSa0btvqtdV7vbS2j0/4AnOCOAAfc5GeRk5yfbnjGD3JuBOMDkHpyOo7Z46cH8B14DjJPP3j69jx/hx8xPB/iFKAmGwc+mAAD09B1xzjpz97jaX9/y/q/4fcUnHRe9uveb2+HTpdK39aNSk5BIwTggZOB16ZHQc545547U7nPoMfjn9eP6+1RqwzlRyST36E55yCFPB7jGRwCVzJzj3/T/9Q6etZz79Xv8Ah2008+vyZD07aq2rTeyvbV7W062f3GSTjGMdD6/Xj3/zg0o69cf096TkYyOpwMfj9Og/H26U7Bxnt69qlXur7aX6aLrf9b+gn/wNFv8Ar/XRbNOR+eMenQHPf/6/04Ac5xxzxnv7/SlGfb8/17e/XoOfeg5HQdOueMfof6VpFt2tZL7799bLXd3T30auVHdaLfV9ErrV9Lt7301e7sKeOwyxxuByQADzwCeoxyPu57U9iMHOMqrEgc8HoTg565A3AgYIyOajJGC3zEEdAc8Z9xjAwSce/fpKOMlgHAyRz1zgk8Y5zxngZ4K8jLerV/Jta66q99/v87q1i0tVfRptO+7aUbpX020tddGtBSCCMEDnHPfpgfz4B/nUq88en1BHI5HXkkY7D0pmB/n8P8KUcHPp37jDKcjj+ePz4oWqWtr9XZbvS+6/zM7vTo1/X9X06JJFNRtznGWC4GeRkjquc9OOfXPtT6TKnjIOOSBgnB6n9P09aDkAY47focfris2m2tLbJ9lonr2tf7vQO33fdb+mMMgzjoFYA5OD97HByBjOfY8g5JxTmIwe3B6/Q/4Gof4iQMgkkZB44OScg9z1OOc4PAqQkEkZJODnH8IJwOOecEcDggZwCKrlScb66aq++3folf000KkkrWT183d7J37Ws/h1uSe/GPw/z+Pek4z7/wA+o/r274zS/wCR9cH8vrTcgnuMEcnjv29jjHvTlfS3m3rbTTXuuvVX+VnPf09Oq+//AD1HUUf5/wAaKx9df+G0+4X9f1/WofX/AB4/H+VA6/56/wCf8npR/n/Jx+tHHOCRj0Bznj/I9R1HIqo6vt389umis3pbfvfQBcZ+gHOMnHX8P19/WjJ/z6Hr+dAJwPY+/H5gdePcEHoaQ4HHOfp3759MdPetEpe7bS2+u9kv+Db/ADAMn1oHcdM8n3xz789vxwKQg8EHpn8fr7fgfalOe2M+h9O+OPT06YJ7Umnpftsn00crtu3lb07aHb9f83+bEPH+ev0/z9cdQcdf1/z2o/T+f0/zkdfWgDGec85/P9P89Kz6XT1+d+ny79h6Weuv5r+tf8+i0UUZ/wA/5/OkIQj8se/8v/156fU9scf59O3t+lGffg9z754HY+3PT9UJxzye/wBMdR06/X36U9e3bp933/iH9f1+np0HUf55/wAn/PWkDZ5HsOfw9fSl/rRf7u1/TX/h9PLQBPp/nkd+ffjH4il+n4elFNzgZI9M+/4jGfbp1xgdQWvb7vy/z62Xmwtt5juP8/of8+lIOufTI9z0Pbp7cY79KO/8v6/z/wAe1HT15/n155+vr6VSurWd31Wlumj7dbt630AAoHT/AD/X/wDV60cjGOfrj9f/ANRpaPrU6uV73bstPwa27+W2tgd27scD8uB+GCeMdeBx7dePTqS3JPX/AD/j9aATxyRjJGBjqO565/LAoJOenBOSD9efTn3+v0NWlJLp0tfS2lm/PW9t9rXtcA/L8OP07Uf/AKv/ANXpR/n/AD/k0nPrj6//AK/TNLXd20ab17210u9d7+oC8c445/8Arf8A6qQ+nrn09OoyP8gnNGM/0/T+o9+lGPXn6/X/AOsPypdv6/r/AIcA/mP6/qOlL/n+f+fwNFIcfT39+n59vfp0pAGfr+X9OtL/AJ/z/wDr/wDroDn6dj/9bt/9Y5xRn6keg5Gemfwx/ninby3su++unnboH9f1/Wgv+f8AP/1qO+P889P60Dp3+vf+Xb6fWijW23r6aeXp9/3gUnT098/zHp09vr1ytJ19CPz/AM/56Uf8D/g7dLh/X9bBkDqcc9z/ACyf8+lHPUjnn/IPHXFJhiQQucZ9R6g4B6dMc9+nOTSAMCWwR97HTGGIyM8denT/AANcr00vbda6bb9r31vbW/ld376tPW/l0/zv/wAO/wDn6H+tJ/Xn+X+FA6g9cjtkjj8OcHPPHft0U/KSCDk84wRngc9OnQe5Bx60rNX0v0/Lpv1Xnr0a0Wvy1Xr/AF/lsJ6Z/wAf5fzpaTI9+fY/4cY6H0785pNwIIyRyAe3Tn1HGP6jrxRa26smlr5abq+qd1fr22sC1t5/P8h3P+fx/p/Oiiip/r+tgEP4fj/+sc+lHf2+v1/z9cdexg4HY5ye/wBR/nj0oAPOT36/rj+eOT+lP5r0afXR9Onr076Dt59/zXlZ9HpfQDxz/wDrP0/w+tIMgEt7n1wP69P8mncd/X/63/1qCM9aL+V+nn2SX/DfetA9fv62VtF0/rsA/L60nB/H1H+NBI5HoMn2/pUm1T1LDGOTj6dwRwORu9sc4pqLd7Lot/ltpa7/ACfXcEm9kNEZOGA7jcOOOwz1PPtjjJrQgjLbdqk5IA5yNuFxnnqT0ABBLYABY4ZFES+wBtoHLMuQeAcKSSOvHTg9MYFdBY2YYrkYBAB2kAgnGBkj2B6c5Ixxg4V6kKcW23pfRNXbuu267N2Sv5m1ODk1ZXbdnfZLSy66prZ3vdJRTve3p9puVQSCRsx8oAABT/gWfx5OT1rvdM0wyKoAIOVAIUgkgjlWwfTOQMdARkAmhpdiHdFA+YuFGVyWJxgc9Tk8EY/pX6dfsJ/scaX8fNV8W/E74y6/L8Nv2TfgNYxeJ/j18T2IhaW1CRS6V8MPBM7Kft/xA8ayiOws7S2Se70qxuDfm3m1C40ayv8A4niDPMLk2CrY/F1XCnSi1GEU5Vq1SbjGlRo017061WbUKcIq8pSUdtT6HKsrq5hiaeFpxu5S5nKTtTpwjZynUlLSEIK7lJuNorddOu/Y0/Zr+HnhbwHqv7cX7WWlNP8As8/DXV/7P+GHw1uCLXVP2n/jPZFn0nwPo8Eyhrv4e6BewrdePNYCSWUiW82ksZoINYiT5Q/aD+O/xF/aV+Lniv4yfFDUYrrxR4nuoxDYWQeLRPC/h+yAg0Pwh4csiSun+HvD9gI7Oxs48GXZLdXHmXdzcSv7R+2T+1df/tN+PNJPh/w7bfDj4G/C/SF8DfAD4OaSvkaH8O/AdjshtnltonMNz4p8QCGPUfE+rO81xcXTx2a3EsFpCzfG+2S4dVwxJYbQF5zkHkY46lgTtwDkgEqa+NyXB4zFYiXEGcwjDMMTTthMLJqUMqwM3GcMPC2n1ir7tTF1VrKajTT9nTjf6bMcTh8PShleAknhqLUq9aKXNjMRonVfanGzjRg1bkvJrmmz9Kv+CZEdh4C+IHxv/az161jl0X9kD9n/AMb/ABI0l7hFe2l+KXiqwufAnwv01d/7tb241fVtQuLRMllmtYpUBaMAfl1qOu6jqE9zf6pdSXuo6lcXWo6jeTszSXeoX9xJdX1zOxwzzXF1LLMxblmkZsncwr9R/FlncfAT/glX4N0STNp4w/bm/aB1HxrqCYK3EvwS/Z8h/sfRI5OC62GpfES+fUIMgxXEaGRFbLOv5IanPtZmx36qeCoIIAC5O4DO704Iwa34XhHH5pnuctc0amNWV4SV20sJladGpyeU8fUxbvs1GOr0ObOassPgcvwNnGcaDxdf3t6uKUZQunZr/Z40XbdWa30Ib28YPuXce7YOAcFVwMAccHOTjjAAyar21/5cufvMSMJk/J0POCOcYztJ9Qa5+5vQXG9yoAOABnkkYUcqoJJGeDyQM7ulSO9GdwJJJGR6AjOeD1xnHAHBHYZ/Q3hpSp/AlFq909dLLz1XkrJWWysfH83vRbavu7/yvlsvOx9MfBz4z+Pvgj8QfCnxU+GHia98I+PPBmpw6roGt2bAhJFIW40/ULY4h1LRNUtzJYatpV4GtL+xnlt50KENH+iHx8+D/wAP/wBsT4XeKP21v2WfDFp4a8ZeF1i1H9sP9mDQEMs/w61a83G7+N/wt0mFBPffCPxFdJPfa/p9vDJL4QvZbmSeNbGG9a2/HaxvQAoyQuRwSQ2cjkbTgAHnnA64BAFfSn7O/wC0H8Sv2b/ij4X+Lfwo17+xPFXhp5I3W4Q3WieJdFvAkOr+EvFelE+TrPhfXbTdZ6np9wGCh1uIvKu7a3lj+OzrI8R7Wnm+Uzjh82wkbR5najmGHXK5YHFqN7wn8VOpbmoVH7SGjmpfR5dmNJUpYHGJzwVa11vPDVVypV6Db0klZSje046PVKS+d9S09vvKPkIDKVwyMrBSrqyhg6MSRx6gjI4PF3liUIOCAOQTyccDnOc5zwDjGeuQM/s5+09+zz8NvjP8Kbv9uv8AZG0P+y/hjc6nBZ/tI/ASyZbvWf2XviPqcgJv9PsrdFkn+CXjC6L3HhvWkhWz0G5n/s2Y21oYrTTvyi1PS2Us7IOVOBgH5Wxghl4YHJwV4753nFerkGe0czoOpCMqVajN0cZg6rUa+ExEElOlWjve93CesKkGpwbUk3w5nls8HVSdqkJwVSlVhrTrU3ZwnCWu9kmtHGSadmmeOzW5V2IVWAB4xx/Dg9Rt7ng5HzYJPJyGXaTkYyQMY9MduowORnv1I613l5Y7Q2AwA6EHuMgckY2jgAEdvUCuYuIGyxxtAB4/BSPmBzzlmBKkgHDZPJ+1oYjnsnJarl6rVJWVvkvK+x4NWjypyj10tdWSuna22llfdJvWyMn/AD07fTjnrwPajPOemCcfrj1789+BjPpIylSNwHPXHPuB0HAx2PTjPQVHkDPt1OfUdPfr09++MV1rSz1Wid99Haz31u99/wADlnve2vn291aP/hneyaQn+f8APH0/X0pf8+n/ANek4P8APkdP6AjP1x+dLRbbTfrr/WnkT/X9f0vmIBgAfzpNwzj+fr/n/wCtnNKSB+PT/PakIzjsR6dR6jP+f8aW6bW/5q2vn5vq2+w13d7O+vn38/P/ADFx/n/P5/WjAOemcZGe/bkfT/Clx7/nj/63+R+NGAeuOP8APHBwaavdebd235K6tv2tvtfYQUfh/n/63WijdggDg9vyPPNQvTS93Zel/wAEgE/A/wCH68/hmlGScdu3f+Q/p+ecBCcjvzx3B/X0HNAbGOucehz09h15/Pgc0JXa0bXlfa6b29FcBc/l+Xf/ADz9Paj8/wD9Q4/w9qAfT/8AV/hRn/D09v1/Wi70+ab120003Xl0+egJzj3x+v60du38x/TNHP6jHTnv6j3zx+B5oOcDHXjI/n6//qz1OKEtU9NH316fnbrorPYf3a/ht/Wvn1FpDyO+QR04/nx+efzoB7HGeP69Py/Dn60EgAE9Dx/n/wCt6in71k10117K1+112tf8AWjXe+35feLS45AOfceg/wD1c+3fuAnp/nPX+v8AKgEZ6nPcjP8AP1PI+vWhJq11o2vTWz269PTrrYQZI/z6f54pc56/5/P35P400n8T6dP8j3/oDQDn/OM/T+eT29+KE2rPon39Htrp8v0D+vyF7Y7f4/545+lGc/h9P8+3PTtSHJ5Gfp0z9cg/rS8//rP/AOvp+NGr63vvq/ud9LXe+1+oBSY5z/nHvz+WPXp1o6ev8/5/1/HvSYOegxg9+ck59P8AP8j3n1v91unV/K4d/wDP0+/+uwMdvbnOPT65Ppzz/jSkgdeOM4PJ7EdCR/nrwaXFMOOBuOSDg/XkegwSMcHIHY0lur+l+vbRa/Lf77DVtL99fTT/AIIvQgD36545HT06npxn8aU4HOD0yfwx74z/ADAx0pAeSAeuTjn1UHjHGevPpnmk3ZyADjBBODjnBHGCfx7e+aer3V9dd7206+my8/NBbXX8+mm1/Lb8B2fY/p/Uj/PSloopbK1t7Pr8utvw7iCjj6+vfP8AQemBRSYPOcHnP/1vw/n1GerUmra7bLrZW/4CvrYAPI469R/j79v09qBx15Prjr/kUY5z/n/P1/CgcngZxnJ9Oh/r7YpK+y9dP8/612H5ad7/APB/rXvoL/T/AD2pGPGMHPt+eD0P49SDj0pf8/5/yaacDAwCDkdOSTgfdAIP+eOcU4rV3vputtFZ3va/y0emm+qHA8g89R9evPXj+ef5pxj+LGD65/8Aivy7Z9qMjtz/AD9Oc49O/pS0v+HXztd/ha3T1QfqISfX0zk9eRx97PQDnBGcAimtxz6gjBPBGQM5Ddv0OQe+XcgHuefbjAwCR157ZGOSOSaZhjgEdsE8eoJJHA7ZJB5BPpitI6Wb6KzVrPZaWWr2fby0GrO22j16XTt/wdtuoxjgkHsTyccYY4IYHJ5HXoTzluTSbSMnA2nJY4OOpHr0PAJxnucDJCuuSegOTwMAkjBGQ33i2OMHjnPTBUqcEZ6fKcjjrxyBg55AAJyQepAFX/X36Ft7WbTcldX9HdfNJp7duyb2wecjv19+mOmcccfXikBGMAHGOnXvjoDjnI5Oc8nIFKfxyTu4OR2GSOfYH88DqHrGCOOqg54525yuPlAXPfnvxknBAaSjF2avK+qe11fZq3RX6W2QZbAAGQQOjYIy575yO2B6j2NSA5Gefyz/ACH8hTAQhPc85xyeSCO2Acn1X178PB5PXHsOewwfrkdR0zxgc5zvZWvunda6uy7aX7ry+UPZbrW979Lq/SSvbTRK/k1dGf8AJ+uPr9OxJHXilpuefyx1zz7cYxjOfbjqad/n0qLWtfS77dO/46ry1EKeOPTjrkZ/D69O2aQFiDnA7duc46DGewx6YHQUhPOPbJ+nPP8ATApeSPp0P8vr9Pr71sm+v4J26eu213brpomNKz8rJa9tr3fWz3k7bPfdeB8pHb5ge+AcKCM4xxzwM8ZGKdgAnIYL0yMc+3HOM9dwz0+brgU4yd3fO0HqCc46EY28kYx1z7u4Kk7ux+VRjrnrkdRyc9zyVJpO7266dtHbvZX1a1+/dFaxsrS3s7tqzfLay2TTtZ63XbYkGcH0/Qf/AFz68elCnBG4+oGCe5UkDtjHUnpjJ64puenvwBg5/wA/4e4qQIpIzkgFuhwBgjHXPT+JsHkc4xkiWiTv08n9nrpa22ur6ArNWstdO1tFqnfe9r73TulpYorkIRwSQO2SOW547fnt5z1FKenIzgAnH9M/Q+/bnNMUDBJP90/xcD+8Opywzx97nPBUCpFOVHOT0/8Ar575/MdDzUy0aers1r122bXfu+6t1Fay/wA13t2v5ve2zXVCHggEZ5+hB4xxz0z6cjqRwKXr/Mfr/SjGOnHOT756/wCP19qPcc//AK+o/Xtzxip3tZt29dPPol+K312JDI6dCOoz/LGOPf8Al0ox39sfnj/Cg4Bzjk8cdf8AP+e1LStdrX7/ACWv/A/4cPTy+/8A4fYTPqfXrxx1/QUo4/8Ar0Yo/Xr+Gcf5/AZzS/r+rgAI/H09vwOeeh9qXcfQfkB/LH+SaSkJHA7noP8AH0+v+FVG91Z9/ktN76f16AO3HGBx/X6/qfxpCT7AEfQenH1xz059SOGMCcexB/Mn09PqKU//AKxyR/LJ+nA69QMVqtlr022ettVsrLy117jS2633S3tpt5vy9OthRz05z2549vr9OPxBpuOQec8g56kYOD/LPpnBpQMYxxx9B69+h4+vOOpFIR3/ADJ4wPbjg85yAOnPeh7rXo9e92r9rPtbr5bvS/WzVlor7bPZPvpq7rqOwfy5HJ/lkevb1x0FAzgZ69/8/wD6v6UgzgDgEcYwfwxkg9vfPNOA4P8A+ojv9Pz69Bk5NZ8reiS8/RKN9Fqvz12RP9feH06f0/rRRRj0+v8Aj/n8alK4B09O/b/Pb8utBJz04Pp09cHv+J9qP8/5/L8aTOfyJGR6Y69+tHy8vut+Pf16AJu5xj8f+BAH9T654zjFKeQceh9c+wGPX1x75HczjPXjHP079c+vrnHGc8tzj1yfxznp6DgAdT2P1Naqyts9dLqz5dfRaXttvtdqrfp+mr9E9fXRW2Xbzz7YGSMEe3+e9AUYI55659jx/jQPQ8knjuM4/Dp+WemOgd/n/P8An0/FLm6X2W3VLbb7u+67iba6vZP8F+VrfIQAAkjv/n/P+FLRQf5fp/nmlr1v+Wy/NLqL+v8AIKTI59uv+f8AI/WlpOO4ycZ6fQEkH0Hbk9KEt/S/y/4b09e4LnGPb+p7+39KQtz1AHcHqScEknt0H+Tkp34zzjqCBjnpx1+v0pDjoRyc+2fTOPXA6A54wOlWr6b7bq3WyW/pq/X1Gt9db/fr2v1/pdGKRjLDrj/D147e1B46dRgYz+QPt+IzgDmm7gcc8g9cYxkYye2M84+nSnc569snAz3J47Z7c9euD2bv+N2tbWVr69rb6Wbv1sO23N873293TRPS222rtpbVfz7f/q7/AInr79KX6/5/z3pPTp3/AAPt/WlrIn+v6/D7wozz9f8AP+R/QGiij8QAH0x+Q7n/ABBz/wDryhOO4z298n+vTv8AlS4HXHPrTGG7GD+I9MjI4x2PHr6HNUtd1dvbXz69e9/L7xpX8l+b7X2V/PYcScYGP89xz2z3+maDnHHX/P5f56daax5wD2/XsBx1I6c/ywV9ugyBxkcde4wPTOcc88jFC2XZO76rpZtdmnp1evTZpbXtvfu3qlqt2u3fX1Ag7emfQ468duueeuCD6e8qJwpwDnJAU5x0x6YyM9Meo55IE+bGTgZOD0JPXBIHGT2IHGeoq9DGzAEdiM7vc9hxzyD7kjgindLd32abXLba2yvqtNt1tZjSVldOWztbTdaX6PfWOt99iBI2c4G4scZIJO0kgY5GTg9TjnIHXmpxbN83ysDj5twGQD90/d7jIGPbnJAroNKsDd3VvaRqfMurmC2VtobY1xLHGGHIB2knAU5BHf7x+wIfgx4HghWGbTLi6kUBDdXOoXkck5AXe2yGSNIyWBO1V6nac8E/RcP8M5lxHDESwEqEKeGcIznXnKKcqidox5FUd7Jt3UUk09G1bzcwzHD5c6ft1O9ZNxjBJ2UeVNvmkm27677adj4daFwp+XAHJzjJB6DBwewzkZXjPQiotp5JGAD3525Hp7k5BA4528CvoL4o/DzTvDVvYX2jxSxWcs8tjdwSTS3IjnIMttMkkhwiyRo8eGYlmTd8pJFeGSwEMTgYwcDAHv07DjgEnBxyRmvLzTL8Rk2NqYDGqKr0Wm3TlenJSjFqUXZXTd1rHTW7uterCYili6Ea1JN053ab+JNNRd7Np2trq7LW7trkn5QSOvYkfxdcgDHAOD1A9cjFMBOQeh/DGfT/ACKnljYZz8pA45G0fLnsR2JwSeTzyOtbpxg8DJzjqeccemTkdsdM4FcVuaN7q1teis+W1/7uvfzStY6HB2TurOy8ltrey01tu7JJ21d1zyeDx/h9OvQYz39jQenQjoTjrn04/L6d6bu9/fPbA9xn26dTgYGTS8464JA4PJ4HPUjnp6D8Tmptt0eln3vb/gvy27Ctfo1dddumu2i3bfy9T3HA6np9c98/X15GRnK9z3/pnr3/ABP4DsKT0zz0wcdTz27Yx16d6cOBj/P+A6dqXS3rd+Ttb+vO3cT000+7+n9+q2G4GQvGOWA7jBHv0yf6HPNOqMNknIwTuyOeckdcdxz1wOcA8injHb6fl/hQ01v+ltNOnnv/AMEJJp2ej36ffpvf/LV3JQoI7A8e/YHgYPvk5z0IxzVmOGRto3ggkcY2ngkckj1zkDBOc/exUcXIBxuACsc9Oo4+oz34I6Fq3LSDzQrcdTjO7gcZOBwck9QBz78nOpVUOy6+V/duvR766LSz0aetKDnorXvZrVvXle3466JtNaFq0t3dVAXLKSPu8leMnLNgrg9D64bLcHqbG1yNyIAV+VgeCRxkA/N0IGMAdNxJI3VFYWO8pgEEHDNyM528HPJG4YGeABgHjn6F+BnwK+JHx/8AiZ4P+Efwo8N3Xibx3421NNM0jToFZLe3jUCW/wBc1m7KNFpvh3Q7FJtS1rVrjEFhYQSysWkMUcvzOaZnRwdGricVVp0aFKEqtWtUahThGCvKUpSeiS7Xva3c9rBYKeIq06NGM5zqOMUoptybasla7ve13a72udx+yd+zD46/ao+Klh8PPB0lloGlafYXPin4i/EPXm+zeEfhZ8PdIXz/ABD458WahIEgs7LT7aKRNOtJ5o5dW1L7PYxMC80sX1l+2B+1T4H8W+GfB37KH7MS33h39kT4HXlyfDpuAbfXPjl8Q2Pk+IPjn8RAiQyajqmuXIlbwzaXkZj0nSXjaGG18+3tLDZ/aq+Lnw//AGdfhhqH7An7KviGDXfDNrqNvc/tZfHvSVEV7+0L8T9KPlTeDtC1CJmkT4OeBL3z9O0rT4pWs9ZvoZbmY3Ua3N5qv5gwl1HJ2DgEn5RkcYGScAYCr6bccnca/OMHh63E+OpZ9mMJ08uoSvkOX1Y2bUkk81xdOVmq9WDawlKUX9XoycpWq1HyfXVq9LJsNPLsJOM8TVSjj8TCzTacf9kpbP2cX/FlG/tZqy91Jy3HkeaQMcgoAcnnd0JJOQOu7OMDnA6Gu88D+FtV8ZeIvD/hLQbb7X4g8Wa5o/hbQrVE3vNrHiDUbTSdLhQAE75L67hUgA4BIIbBrz60USODxggHoSWIK89PcEHIxznBwT+rP/BKfwPoMv7TR+NnjW3WT4c/slfDfx3+034zmnVTbiT4e6PIvgqxkZhsFzqHjbUNGayiOXlktHZASjAenxFmEcoyfH4615UMNJ0YWv7SvKKhh6cdryqVZQhGK+07K10edl+GljsdhqMvhnUjKctGowjZzk2/sxindq636aPP/wCCuHiXRtN/aH8Pfs6eELqObwL+xx8H/h7+znoSwFPstx4g0DRoNb+IOqqE+UXuoeKNVnttSdW3yXWmEOWdQF/G3WJGWR8YIAPy5yME5xnO3GMYxnGc8nive/ip4z1v4g+L/FnxB8TXDXfiLx34p8QeNNduHbe0mreJ9WvNZv23EljtuLt0AJIRFjUcDA+fdXIJbHXnHAIJxtHzDoQR1453dcEDu4QyxZXlOXYObbqUcLTliJt2U8RVUamIqN62c60pzeuspXvdnJn+JeMxeIxEPglXkoJLWMI2jTS7KMEor7ullxt5cyB8bjkdMYJJwCRknJ9Bxn5e3DVni6kI4YgD6AkY5Kg55PYZA7/xZF26Qsx4OcA5wBySMjGOMD0+ZfXPXOEDqwGT1B7nI5AB4GCSucHhsY4zmv0KhFOEdNL6p62Sa6/N7Xt+fzMnJSWqTstUtLb7a2vbzfzNy1uCmwhmbODg5wMlGO4FcDk88kjGBxgV2Om3R8xQeikHAI4JXPB59enUZ+U5xnzyBm2ADJIPzfK2cBlBGSPqAQOo56gV0FnKylSW2qOAQME7iMZPseMEgqDkdM1hicNHlckreWj/AJfJPfZa+ppSrVOZdZaLqubl5U99G2rPra1kfev7JX7UPjr9lr4m2vxD8HR2GuaVf6Xc+FviJ8OPEUYvPBXxW+H2robbXvA/jDTHSW3vtNvraSU2VzLDNcaTemG8tV3LLFP9GfthfsofD4+AdK/bG/ZGXVNf/ZN+IGpjT9b8OXchv/Fn7MvxFunjN78K/H6RmSZdBa8l8vwX4pnJtdQsnsrO4unuZ9PudT/LvTb/AAY1ZiduCDjG7lDnJzjOARz2OOQK+5f2QP2vvFP7LXjLWL1dFsfiP8JPiLo7+D/jp8E/EISbwr8VPAt4pt7uznt7hJLax8S6ZBPcXPhzX0j+0WN1uglZ7K5uI6/Nc8yvGYLGPPMlgnjoQjDF4JvkpZthYaulPXkWKpJt4Wu7NSbpyTpTaX2mW4zD4vDf2dj5JUJa0ayV5YSta3Mlq3SnoqsFo0+aKUo2fwVqmnFGcFNuCNoxjPRh1XkZweDggDvXC31ns3EjBycZ68AcDn1OMepGQT0/Vb9tD9lLwr8NrLwr+0D+z3q2ofED9kH42NLffDDxdN5l1rPw88Q4Mur/AAX+Jh+d9J8Z+F5VmtLGbUPKbX9PtmuIZLm6ttQK/m1qFlliAgHUHIwVIxnIzgNzgAYHTjBr6HIs6w+aYSjisNUlyO8alOa5a9CtBqNShiIayp1qM7wnGWqavtZvw80wM8DXlRmr7OMk706tN2catOT0lCSa5NXduz8vJ7iNufkOcgkEAgdOg5Jz+KjPU5xWY2VBJHQkbeAQSc9AMcDPHHQZAKjHbX1milQQFHQ4GMnjjuTjn+7gdQa5aeD950I28AcgY4A49D6k5HBY4IB+1wtaNSFrbLRvS2i/WSVlq3qtLHg1qKhaV7pt7PZvrp9lO+mvdXRQGcnJz0xj8f8A9XXt+JUn179/5f5+g70rDDAKCfX8T3x29sFsngYOab1BGSPqOn0xjP5/Wupq1m9uvkrLXrZ67/M5rd/m1t0Tstbd7PvtsmEA8EZ/zx7/AI/y7phs9QBjGBn/AOt+B4pB6ZLfUZwPf6g9e4BA5xSgYzz/APr7kn/P49afw9bvs09b2d/XTdroO1k9fweztqr6Lte36APfPTqevPXnJP8ALFOHHOc+3p+mPw9vUmkBB6fy/wDrUtTdprfS2np0+dtfMTvfX+v+H3fmwDYwRnnp+P8Ann2zRnn/AD0/w7UvHf8Ax/8A15+tJS6bXV9rrrZN/wBeiuxACfofbt/kUu446Dvj1GeuOcZ9O2fzppwAfp654HXg/wCfWkBABxk+gweRwOMgew78AHqa0SfRbb6JX+He+i6WfXyYJX/L5scT+J5P+T70nOPfA/Pv/nA46Umc9CfbGOuP1/Meo9aQ8854yMYHA/x5x2PPHHJEpfpfTrdWWq76ffukk6S9Pn11S6/Pvs000Lg/UYAxwB6e56c9R+PYAwTz3746nHt9Pzxijrj8e/Q4x1B+vTHbvml/z36fU9e/8veh9rp3SV1t00vtpb/N9Bfns9vL17PXruKOOfx9P847fTmjPI6fQ/j+ff8AL0o/zj6Uf5/z9aV35P126b216L7hAT6/maAf89c0hxg56d6M9MdOe3p7deOeMdvzEvJvX7/IBcnsBntnkfj1/wA+nY/z0xSdPqfryRx/T6kDIBpD1HXn3A/QkHjqcfQg9n5ad9dOz6/h0auO39PTonb8dO9/uXtyMfj/AF47c9vzpOpA9QCT3H8+D04PGSfegZ75PfoPbjPA75z3waF745BPH04Hp0AH58e5b0vdLRWsnZdPnfrd3vbyGrb2/HS7tZO/Ra+vdpNgVz279+Rz179/T2PY0uDnrx3+vt6Dv1PoMCgf4f54zx+vX2pTx/WjV6rXbs3dJX3/ABt6MTb20tb133+ffs9hMc/T9OP65H+FLRQf1/z9OlRZ9t9vMQZOTyPy5HH+HbA7ego/p/n8f8jtSHOOMZ9/8/4UmSMZHJ7Z78D6D8+vTJNNK66dvTzfl0Glftvb/gvy8x2f6/59+nSmk4x1xx2P5dOO3X3xzQcZHfk47cdD16+vHXj60mCOBk85HbHB74I/Dvxng1SSsn6fPa+t9Ozbsle3S40la7bV/LfVdb27avS78hTgA4Ht7nJ9eT3/AMOxpARxkHPTk4Jz7E8j1+gHOOF55JHrx144GMZ6nr3HXpmjIBHv0647epwT79f0yultW79PJLRb7d1pot9LPtf3rve76Wut7bX1/KwvQEA+/r+OPzP1zS85znp0/wDr9jjoPQUf5/z/APXpR/n/AOvjnHrj/wCvQvz69Vs/n5K9/JNkX/r+vQTP4/X2/wA4pdxxjjA7YH+FNJA4J+n+e340p/z/APW65pK61Wnne1/8/QA/+v8A5z/T6470Zz755/yaYScAgHOeR17dD379x1/DITwMcZ6ev5D6cDvkfi+V6efVa767eS10+8dnp56d/wAtR2eM459P5Z9P6UhB6jg+/wCeOn8+mAB1pDkgcsMDOO3Qe4A6fmc8Cl3c+3r/AJ7Y5J6Y+op66W1traz0+G2/e3Ts+g7PpZ210v8ALffy3uN2qSV5BA59fY59x25x7Hqu0DIyfmJ6nnnsDjJHJ75HbnkO6HPtj37+vXsOpyfTmlBz0o5m9E23Zdr6Wd9tb2drra27E2+7dtv636fIaNuADjBGOepzwOc9c5992fpTienQY45HBGeO/U5/A880eufT5frkde3XPvjpzS4JA4HHXP1Hr1I9eCPcU1eztq9dbq/2dte2/wDnay8xv3c8g5552jHQY6Z/TPvjFOyQcjr+fbFNIHOCQNp4HbB4O0Z5C9d3GAcDGaTcM4z69enr69Ov/wBYdRxfZXSWqb3svNW0d9tNn1D9Ff8Ar7x5JJBwO36e3+fwwKbnA68f1Gfz/wD14zSHJx1GOoB7c/meOnvRxx2wPXpjqOM4x3Ix2GTTin1trrvq9r7eV9e7v5jsrLrfddVqtl3f9LS4ZHJwQOvOf5duT0I9CM44XnnnHtx37/XP+GD1pvUDqAMZ7cg9B/8Ar4475pRnPt65PPH689/Tuasvl1Tdr396+y+G179XfW/uu+mw4jnHclvmB+XjK9PQg4B+pXHJEvIyQACMnqpyOhxkgZz3w3Ax6AQ5JBGSQWPXAJG7PPHzAf8A1s8HMo7qSfZcgAgZIwB2J4z0xzjdmpaato/NLXtpula2jT27bsNVy3vdbXvqtLJq9ktdU3btvceBjOO/r/nj8B69qmQ8gYznPbOc4BPPUgnPB44ByRURIx75GPz5z19Rzg+nHFSgngg8k8cc9V4Xn1z1HQelLeKu1fSz23221b/yXYi91Z7t9X20vu979v8AJZi99xUcA8kKCBgDrxnJJJ64xzTj/HnOM8tzxkDucckk4AwAM5JzyihcdzkDOTwcEdAOcZHPG0j1FPIJyM4B7e4xg9Pbn68d8DaTs7W006K1tLL57pX06IqLWnM7Wt3va8fJ7Wbtp5asaWBJzyBkAZ56rjnr0wevODjAp2c5GOO4PBPoR+Xtj1puPmBAwDkj5ccYXJI659Mg8gHHQh2ASR16juDg4x905xyB9e4qXay5dNLvy1V30u9Ladd9d23Hlikmtbt+a5U7dOjW35Jt1J14wfrxxx29/p0Oe1GPftj/AOv/AJ/wo/P/AD9f/rVP9eX3/PX/AIJmLSevX9P06/rS0df69/rQrd7fj1XT73+Af1t+nX9RoPqc5Ocjp9PbA6g+5yecHOevHT3z1yeMDHb14z14Xg9Ox/Ig5579R+PWm5I/Ee3PHYjnknrx14wTzWjvZeia72V9NNtdlZ9yrXvZeTv0u7KyXX8F9wuW9uSQPbjj8e5znj0PBQFvx4HOcH3z+pz7YBzRk9xwOuMj8OeD+B7HnnBdz7d8f/X+v07E98U1dae7ot0+nut331atul3TK26aaarp8PXz87N73GncT1Hr9cn0AyOevOMd+pLhye2O3X8c/j2x9aQbvw9P59cEDr3PBHFA44/Dr+PQk464656dsUrvTVO1tEtlo7v5pXSv8kiXtutlstem7+7v1SsrjqKKPb/P6/1pJvS97fPTVX1X5edye3Xt/l+In19ufejP0HPf0B6/l+tGenv+H8+/Xjr64pMkc4znOPYjIHQZ6cZOcdDimrtJbJPZ9dk736XfTrpZjSv+i011WmvqHQ5yOeOme+PXPU49s0mT647AEZPOP1AI459++FBzg46DJ6cZGeOcdh15wRnvSDuPwz7jA5I5znqeOAOxppWWu/otLWWjem39J3LSsrvfTorrZaPVbeevlZjfmPpkHjPsRnpk4HHTIyRkkZpWyOc57HjgZ6/XkdMHH1xS54IA6HkHHQnkHtjByCOPy5Xr1HPXA+pJzkcZAzz1PoRkHM79Leq2stN16+vVpBe1umu2lrWX47NPZXtcMdDn3HU84Pv0x9PwzinAe3X26/44pOxA4x+GD/n9PY0DjAJye3HX8en+fxKu9NdtWrPZWttpbrfXT5EP7999+9/nfz6+oYGCPUY/z/nrk9TQCe45/T/P9ePqv+fxpCeM9Pz/AA44/EfhzU6t929fv1e39egeX6a62/pf8EPYdu34f/XHTvj3pOT25BP9cYyfpyR3z0yCo/rg9e34Y+uOPyppYjtnjp3znHUZGfUe4qktVpro9d7K22trb2uvR32cbXWie17+dk+tt3poGX5wR2wfY98enr+OM9hmYcjacLjOByflB9McnrgkY6+qZboMY65zkkZyO+SOg798Z6UvzHIxktkckZ7Dj06/3hg46kZq+nSy0d0la/LdPe99LW0Su7ltJNO0Wrq/Tte/TbXZW39TBB428nrjn9Mdh270HPQ9CD0HuM8c8Y78nk+oFGST8vQ9SQMdPzP59R6U/wDz/n/P9Kzbd1folto/+A9v03Jd762T00XV6d9vntbXfVOf8/X/AD/9el4GMf5JPP4fX8KKPz/z/T8v55Vr9Nra/hrf9LfcrEf1/XoHp/j7d+/88/hSZz6j3P8ATI6fr9OKD0zz/L+fH50fX8Px5wR7evPc+tNLfb8G1azvZ6Ptv3H/AF+K6df67CEnIAIH8+3b25I55waT5s9QPbuff+Lj+XoKUnDdB9eM8/8A6v5cik3H0H59R7c89CcccDHWqXS0VtbW123a97v7vXsy0ttFa3W2t2vP8dfTVIAWPGRnn14PoePwGDjqecU5VZjhOu7J4AXOO+TjLcnrznHBzkVWYrgAE+pyf0/PBwCfTrVmOM7sAENkjJBGSAD1C5+YEjkjkYzgUPXX3VZJ+u2nml/dbdunRmjbtZJb7W3jf/g2fT73RLKSAVzg4PBy33ecnC8ckEAY5yM4rXt4EG0vuOTzwBsP0XGMfdUD6kY6xW8LM67QCQVAyCeTzk5Pc4HJ4yOMZxswW07SRRRRNI8rrGkUaNJJNNIypHFDEqM0ssjMqRqiu7udkYLELXFicRyQnJuMYxXNKbskkkruTbskk7u702v21p0nUnGyveSSilq7W5VstXezVnd67Kx23w/0y81Xxd4U0vTNOu9V1PUfEGkWWmaXYwSXN9qV9cX1tFa2VpbxxvJcXc8rrHGqBixbYATkD9KPGvwx8bfD/UrnSfHnhbWfCOqQzXNvJb6vZz2iie2MX2uOGQxGK5ey89Ir37OZFtJXWOUqxAHtf7K37PU37L9lp/inxVos2pftOeM9N0VND8KQw213qHwc8P8Aje8/sbwZorWt0fs0Hxs+MWtzxeH9Cspg9x4O8M2/irxNe2psdC1rzH/tLfFlPG3xM/aX8DWOqrr3hv8AZc/ZQ1rwJZ6o93Pcwap8RdR+K/ws0f4l+MIJQI/NvNS8W+KNX0e3u5hLMdN0+2CzO6gj5vgzx1xmRcQYvKctyehmeRVVCeIx8q9SlWdaNSlh4yw01GVOVCVbEUqceeLddc9Sn+7hF1Pbzvw+o43K6GOxeNqYTMIS5aeHjBSiqTjKrNVVdNTjThKUknaGkJ++7R+FvjF8O/Hcvwi1Dx/YeENU1LwFpnijSdI1/wAX2sa3Vj4c1G+tvtGmLrMUJ+16bbasJDFpepX1tHp9/MrWtvcy3IWKvhieEldxO0YABz3yp4IyAOSw2nABAHTFfrH8E/j/AOMfBXw80P4w6BpunfEDTfhXY23wL/ab+EHibfd+HPiv+zt4+1jUdV8AXmv2x3oq+H/EOoeKvASeImjN54Y1O8+HU8MxhvZIj5H+17+y74P8G6J4c/aO/Zt1HUfGv7J/xWvJYvDWpXimfxF8H/GZxNq3wY+J6ozf2d4j0J3ZdE1K6WODxNpSxX9pJLKJTNrmfiFis+4pxP8Aa2EpYGOIrPD5fODbpRdK3LhMRKW2JqU2sRRk1GOIo1UoKMoyi8sLw1TwWVUvqdWVdwpKriIysptVLL21OP2qUZXpz0bpzjdtpq/5uzRMhcBgxGBxkk+nTrgHJKn+90OAc2RXBzwTnBHT/vlm6gnnqDxznt1V5Du6Ig2gg7QBvwAB8xwW4GSWB3ezAA4M0RyuODwBnPP3SOR1bHIA+7gg+/01KpGSfK77aNr3lZa3em90lft0WvlOEoRUZJO/re1o6bJNN6q/ZtO++ad3I6EHBDKQf1zjjHBGaXnjJHXsMfXqT19uRU0iEEnGSMjjgc4wWJzxjPPXAORURB57ZwQfxPP0P/1sA5B1l3SSWjtZX2V+m1/+Do0YSVmm0ltfbRXVrrXe+llqmknJITke/PYdB/8AW9fQdOppcd/w/X/P86YT3Ge+OM8qcYJ685x7evPLlOfrxntg/jU269PT08v6/OWn9ztp5W8v+HF9/wDD/P07daBk5wMjbkd+eMcE/n3yRjHY/T0/X8/yxn9JkjAIGRuIGW4B5wckAA84wARyOOcDDTS1b77JvTSz2e2r73sOCTetrLW1m29Vsl+uj8y3axvuTAyx24AHA6dz1+8AcA5zwM4z11hASVAXBGzc2AAMBdy4J+U5GDgYAODlhWFZxDK8YwUDEZ3NyDwc85Hy9B7gjFdxYR48sFdpGDnGSw+QEA/MR354AHUCvMxlXl5UrJtXe11pGz81fZfEr9b2O/Cw0bUXzOyi7aa8r0Vruz6u76PR6+keAfBniDxr4g0Hwt4W0XUvEXiXxHqlhomg6DpFnLeaprGrahOkFjYWNnEhlmuLmZ1jVRgL96R1CFl/aT4kan4e/wCCbXwe179m74ba7Yan+2f8W9Ag0/8Aan+K3h66huE+B3gu+Rbn/hnr4fa3asXh8TanHJBJ8R9ZspUmt5FFlG/2gWB0zwX9if4g2n7MH7Nf7Q37X+h6fp83xst/F/gz9mv4CeI9XWN7X4fax8Q/DXifxJ8SfH2hW8vnQ3fjHw/4P0ezstDlmjgl0qbWFvAJEn2V4z8MP2Wf2pf2kbq71L4YfB/4n/EZNQu7nUdV8aXWmXNh4dlu72aS4vNX17x/4rl0vw8JLiZ5ru+vr3WA+GM8jHLMfxTO8TSzjNa8M2xmGwPDuUYimqlOvWhTjmePpxpV0qrk4r6phnOH7vVVa6kpaU7T/RcvovL8DTqYOhUxGZY2nJxlTpyk8LRk+R8lk/3tWzfP9inZxu5I+ULuJAwWKIRxR4SKNRhEQYxkA4DEA5PVemTwBiPG6lixwMggsdmBjjjG1cHtuIB3ZPUD9S2/Ys+Bfwfbz/2vP20fhH4H1SBVa8+E37PQf9oz4s+YmC2nX154Xli+H3h29BBRpb/xLfW8D43qy5NZF7+0l+wv8IMQ/s7/ALGt38V/ElsCLb4n/tj+LT4qhaZcCO8tPg34Gl07wdGqkCaOLVNSvHXiOZX+dD6dLieFe0MlyvMs1TUYwrUaKwmBStF8yxmMdClUp3+1hnWsrOK2R5ssqlBueYYzC4JSalKnKft6/Rteyo+1qRntb2nIr7ta2+Mfg/8ABH4x/GzVItP+Efwv8d/Ei7VmEzeEvDeparp1rgjL6jrCQDR9LijIJkm1C+giRAWeRMHP7y+EP2H/ANp34If8E8/2g/h/4W+GbeM/2hf2nvH3w60TxD4Y8AeJvC/ifXtH/Z18AWz+M78W8FlfBtT1LV/FEiaVr/h3QLjVr21jZkvLaN7ZkX8gPiX+3h+1z8bbJfBusfFbV/D3g+6I0vSvhZ8H7LT/AISfD+NLx44LTSbXwr4Bt9Eiv4Xmljgih1Sa/lkVyhldtu73r/gpfr958J/H37OX7LXhjVL3Sf8Ahj/9nbwN4P1S60vU7yzvYvit8QIo/iL8SdRGo2UkV4dQnv8AWNKDStN9oheAQlyERU+az+hxPnGZZHlVSeVYKOIryzKphYQr49xw+WeyrU5Ymt7TBqUJYyeFpunCilefP7SSg4y9jLZZRg8JjsXH63WlSpRw0a0nDD888V7klShavZql7WSk59OWy5k1+fnxV8GeMvh3r83hv4h+D/FXgHxFaEwz6B418Pav4V1aGSMrkNYa3aWdyQG6mOJkwMqWPI8Tu7V5QzFOjcFRwAOQCQCMgkEDrjjn5a/RLwX/AMFJP2qtD0C18EeO/GWg/tCfDe3Co3w5/aY8H6N8afD4tlXb5FnqXiiCTxbpACkIk+j+I7KWABXTlVFdZL8Uf+CcvxhUj4m/s7fFL9lfxTcczeNv2YvGsHxC+HAunJ3Xl78GvipIup2FmCd72PhnxuhVAUtowdoT7Ojmue5a4xzPIp4mnG0XjcmrRxUEkotyqYSusPiIu/8Ay7oRxTW13c+dq4PAYv8A3XMY0ZN39jjYeyk5OzSjVp+0pNW3lN09b3sz8ormzZTkqAcE8gjA45JwBwV5OevHrWLNZPvJABGAxC5VQCMgYGV25HQEL2GSAK/Vqb9gDSfiv5k37In7Vf7Pv7RskpeS1+H2uavdfs//ABrCE5S2bwJ8VJNN0PUbwf6t/wCxvGF3HJIpEKurg18i/Fj9mP46/AW+bS/jX8HfiN8L7gOEjm8ZeFdU0vR7zkBH07xE0Evh7VYXOWjm07VbqGQfNE7AcfQ5dxTlOKqKjTx8KOIdv9jxalhcYk7J82FxSo1o+rhbtfc8+vk+Noxcp4b2tLpWo8tai/haftablB2Wtrq3qfLAt3UjKgHI3ZB6DIOQSSemT145OMCrUKFW5bGMElSBgg4xxkFSccE4AGN3p2M+mkKJgimJlDI6FXDDjDKVyNpDA5z0IIBzWI8AyQAeOwHQA8/xDk46jj1YAZr35Yv2kUk3yu12rWvZNWto3a+7t3umzz3T9m3aCi01ZtWaWl/W/fZv1Jra8dGABJ6Y5yT6YPU+o4HHUg4NdZp1+21MseDnJJyGJ3ZGc4OcDdyRxgda4yK1bcp2uNueg7/KTyR26EHn2OBW3Zb0ILA9cKD07c9Rjj5iOe2M9+HERpzj3vaza1vdX1Vkv73la9lqaUpShKLjfX4t9NVsk1Zuyt31dj9GP2Pv2rLP4I3Hiz4a/FXw2fil+y38ZbaPRvjR8J7uQuCjBY7P4heBS5A0P4i+FCYr/TNSsjBNei2itpJlmgs7mz5H9sn9ke6/Z08SeG/EPg7Xpfib+zp8X9Lbxd8BPjLZQt9h8W+FZpCDoXiNooo7bR/H/hiRX0/xJoEghnDwG+t7aOC5e3t/kvTpiGU7slMfKemcrjg4BHy5GBhWAyeef3T/AGE/ht8Qv2sv+CeX7Z37N1hqWmanceH/AB/8FvGP7OXhnxFf29l9q+Mkw8aa/wCK/Bfgm4neMP4k8c+CPDOqQafpQuEil1C4mkljjjv57k/necRjw1jY5/hpxo4fE4ihhs5wsny0K8a1WnRhj4qK5YYnDqSc6kV+9oKUZ3cKbX1OBks1w39nVoupVpU6k8FWS5qkHGLlLDtu3NTqW92N/cqNONru/wDPTqFlt3O4BAPQfKMcdiFKnjBGNwPODjFcZe2pTcwC4IYBcYZd20KQCMnrjO44yM8HA+hPGHhm60a91Cwv7C80270+8utOvtO1K1lsdT03UbGdoLzTdRsrlEubS/srmOS3uba5ijngmjeOSNZA2PH9RtHOSqjIQ53dDyB1z6k4zwSCAc4x+k5fjYVKdKcZwnCpFShKLU4yjKKaalHSzu7Wbteya0Z8njMLKmpKa2dpRd0001oo6rfdOy017nnM0RUkFwC2c54OeMYAHQDAOMg85AzgVGWRVLHG0cj1x8uB3yefqcngHJO/dRYdSFGWZmwCBluMnAXjGQedvPJOBxkTrtB+YgsMMuTnPHJIGOR3ycdgvGfo6c1Ky917JWtq2lvbolfXo3tdWPL5Vpe611VvJeTW2i123tfWqCT3GM8D1H49x19+OnUr+X8vrx/9frxSEFWGDkcYGQNvQA5J6n8Aeo4NL6H8DkYJ9PTHPt9K0kknZLt8/ktbvu/O3Qia5XbqrK3a1tGtHfTVv0XdICMkAYxjqcdx0BPP3hnv09sr/n06+o/xoI/HtnB7/QcHjg8Y69qDz/n/AD/MfzqfvW13e+/X89PUjd9vS7t38+4c5z26Y/Lk8/Xtz74oPXGefbqMY/IfXrmjJHB/Pp16exPr06im8AkkYOfQ57+g74Jz74PSmt79uXb1S20f3LccV1fTyTu7pbdd/wCtBfm7Y49f03cemOMevI4FJljkZHcgf/XGOOByexGetKfvfhz79SOvH06d+eDhAc9u+RyDnJPTng9T36GrV9Fpe3Wyttp1+a03WzsiklpotUr3tdbX087+uvohQW9Rz25GR/noRkHB4PUIA3c9jx79unp757d+ik84Jx1/HPIwOc46Z9eADmgZJB/MH88fUZ5/D3qHe22lk7tN22sk9tf+A3cNVrFWul0b6KyWlm27/qHIycjHfj8yOf557/i6k4yfYc/j1z26Af5xS0vlrp+Xbz3ff84b77/8BW8/Xp2Dg0hAI6Z9s4z/AJ9+/cUuMUgBHfPp/wDr7/5/A9N9Pn6W8/P8QX49PW/l/wAD1Ezn6dxgk9eQf5Y69+lKSfb+X09evTnuPfhDnoQOeOp98849B6CkB5weMZPb06cdgD19s+uLSvs77Ozf+HfTorrrp53KUbtfe9Vs0n5P/LoGXB4IzkY4+vfHT68nB/EBbI+noe3f8PbH5YNJuPcA56DI4xzz15xg+mOfouMsOo64ORjn6EcepPIGORmndW1SWjd9Gr6Lon3V/wBdytOqW1776K21rW07eqF5z2H9QM547Z49x3NGDzz1/DsO4PoPTrzjtSDnjtg5x2JPTkeh5+nHSnf/AF/649P1/Hmod1dadOmtrK2+q2WncmWmmm/4WVr/AHa7fkGM5z07464PHU/4fn3AB+XHr0P/ANb6+vSloqfL+v6f6Ea7dvw2X+QY+v5n/wDV/j+NIcZGfw+vT/OfXig8c84H4/nnnijPTvkEj/Pbr/k07PfVpW19Ldddvy1sHr/VhDnOBnPXuB149scn6gY68hBu9Qe56Yx+HTPbjt+BQn/ZIwCT0PscE9xxznORg+tBY9QOo4zjP5c/l1NWo6bJ377vbrfTS70va3VmiWiTS1vv3069L9LfexQW45wTk9OR+vuPp3PHId3J3D6dvzPtzz/Klz0wO56jH9fxweuM8HFBBPt05xk8cj8M9fw7ZNJ9E7LTXT893t1vr5NMLrTa3TS+1l1V9dfuSvow+Ycn5j0z6Dj2yfp7cUo6dMD0+vtSe3PH5H6EdMHt9Rj0XHGBx/nH17fX36VL89NFr91r/LsiHbS2luvlpZ6fftfvdi4/Xj/Pbv8A40gIOcdjil/xJ/P/AD9aT14//X34x/8Arp6WdrvT0tqt1qmr2/HyYgyP1wM+v+P09xQc9jg9jnvnp+PYjnr07tOFxwMZHfnv7dBzjHXnJ5NBIPv0xz1+o6D05HXgc4oSs0/Pd28vPz1X/BtSSurK6vbX5dnrv934JlgR9fxx+GfTJxnGR0pxJ4x369+e+SP6DsT0FN3Hjgdxn0wOfX36dcdqXJyMgcdT9R24z+Hrx35p9PdXV6PR6Ly63SXW9um9210S6q/R7dL2Wuy7rpqwJbjJGTzg9h16k9+vT15xSnPHI6DOcjr7DHcdT2zx1ymCecE8dGx/jx0Bx37/AOy7sAQMAY+p+mP8+lK7va2ujdltt59PNOz9dJbXu7aWvb5PTr1fz89kznI+nXHoPUfj069cZxSgAcDvzj9Px/H39KMdxwSP88H09Pr6mjA/H1wM/njFK6v1tpda+W/lu9NfTS039fPXd23+/X8Bp+Xb2IzjJ688YI5zg/LwevFNc8MW5GMhRycZAPAI9T0GR/e54f8ApjPAbrzwcDjnnnPcdCOBj17nBBw2M+vOcZGOvUZGOpqk2t09e23TWy0+a7/c1un2d9N+m2m/4aP5xOSCxBGTkc4/vAZHfoBzjOPpTVJKnLjGCTxzxjA6g5OMDsM5G7pTjncQeDgnjk8Y6j+E53Zx+WSchxhiE4AJOc7hvw2eRgnBOcHqDk54rRPrfVtNu+t3bd6q70u/TU1j9nptJu1vdvFJW87p9X00Wg/cc4GCecemBg4XoSPoBz9DS5Y9CFPoR6j/AOt0+uT2DM5LbR90cDPK4OQAMcEkHuAckYxnL+TjI5+vT1Ixzn8cDIPbiXZWdtVo9FptbS/4JLut7OHa97fgr3dns3rur2s10e4ANyD09ec9un+PY89qd2IBweO2f59PYemPQUEH2x+fb+ecfTH4UE4Ge/Qd+/HHGfce5x61X+fb8/6t0fmraxslqopp/wDburfZvXXTXvcdldxGCAcfN97oM5HTGTxjHOecU9vukcYAJQkYK/ePK5yOuBktjOCCajIznpwMqMtwd3fjkYyRnHGcgEcuJBzkggAHH3STuJ7c8gZz04y3ApNN2ey+/VW9dvLS+tnqO2zSejV09G2uXZO62a3dkmSnGDxken/68D86mQBgCBkke3cgDPbgj889zUXqP8n2z/P8OOlSZVShAHBycc8MQeDxk49cc8EcZMrVRu+z6J2vpp1W3a/roQrNW1vfTXT7vPvdW8zOUg8KMbc56fQqOc579sYGcdKk6e+TnHft6+n6cDgVFGQQdvcAjIGB255xx6jOMA+lS849/wBO3/18j8M96U1qnfa+nfb7+11sr36IGv0vd63aV1a99/11EZfxwe/uRnGOw579geRxTs9PekPP8vz/AF/lQMdB27f5/wAn8qjp6eS283vvYOi8r9O/V/l9wDOOeT+n8v6Udent+R9/8/lS03J5JA46epP649PU+3Smk3f8trq626ffouwb/wBW69BT+P4dup+pP/1hjrSZBHAz1PPIH1J/Udvyp1NGM9eQefYkjOM+p/n1GaSfl22+W9tddOq18w87bW8kv1d/K3cQYXsc5Hp3xnGOw47cmlyDjI54I79f89+p6ZNBI4z0z9c8cdPX9R164oAwc5yTkjP6dcnjpn3qrrV6p2srX10Wl79Hvfo+5V0k27p2SVt9o9fz3t+ag+x/DHB755/zn14o9f8AOf8APP8APuKCMke36/5/L1pf6f1/z+Gffmf6em22un46feydfXr6Nv8AG+n39xOc+w6e/T+XP1/mv60nt2Oc/jn3/wA/yXp/9ajT+v6+/wD4OiCkJwM0tIR14z7Z/wA/gf1oW667bfl09AVrr1189vT77iZ9uOfT1PGAO/HY9eeRRuwR8p59ue/bqe5Pp170uB6D8O+PYdcZ98cUcY9j7ZP1Oc/qOMfSmna343bS6dnuvLpZ2KVu3S2222vm1u7bp3dtUMDKMjYTxx9fQ554I/TNOyOTg9sj1J9vXkZ9elL+n+T/AJ+p70Y46DP9f88fTinzLs7+bv2+Wtn0etvIfMr6J62u27vS33bd97PSyEGOpBHOOfc9vr1/+sBTqQZxz15/yP6Z/GlqX93zv9349dvxl/h+HS9v69W9xBnv1/zj8hS/r9P/ANdHPPp+v0/yR9OM005xx19v19/y5oS1+6/9dBbv1+SHHgc88fpz69Oc98dyetNzjOckcH3x79Pft0Bz6U7/AD/n9P8APRMAZ/M59u/p27dOOnFO/bf3fO9uXTrbr+Gmlhr77a/ituq9VrtsNLDkL17Y+ufx9eM575FG7HUE9M/59jwD3x14pRgnOOSfr0/Qf4jjOAaDz/U8Z4yPQ/0zk+4qr6bbJXu+9l0v0S6r0dhppLRJ979dv+DZfNjCYwT8pBxk+oGR7ZzjHGAODzgUbjyegGeo56465B4GOTnGRyQBTHwW3KBk7cngnAxg4I9c8Hn245ecOCPr6nqQwPQ/XP8Au84xV6ba9G7u9mktNV311s+yXS7r3EnvJdX7rfL92z139NiWik5yfTse/br9f6fSlrG2/ovxto/8vLyMhAe5yB9OnzYBPPfI64wOTjnACec9iRxz0xjofQ84BpSCOOMEZB4zxnoG/TpzyPUNPUg5A7Yz3xntj07ntzzgaW0fZKzaS10TX3q+m3TW1xrX9bdtOn/D9wz1yD+OD+hPrwPXjBxikJA/hI6j2/D0z1OOfrilz3zxz269eOehGOegoP4HBBPsO56/X+WKhbq6693o7rX1016elhrdJq+2mujbSu/1Xy8hvG45Vs56884Hb9cHrkZ+i8McBTkZ4Jwe5zkc8fh1zjrTifTng49Cfw9/z/lLGpzkDcWU8dgRg4ycc9TkjjBHqKpO9nrZLRc1reerVt2vW6epSdnFa2ule/prZr5NX01TtuOjUA7VVjnHB+bBOOmO5GBwcYP3q0I4icLjLDBzg5I3enU+3QHOARmm28QJ3bsFgBtORg5B5HHIwRgjOD+etawq0gHAcHb82BwdnYkgtjI5BXnBIBJGNWqora7Vk3fTWzulpsr32S+4unGUtNXrvfva29uj2308y7aWpLJg4DAM7EnggICS208YyCeDnAHB+X9bP2b/AIJRfs5+EvAP7RHj7wZD41+PnxZv7XSv2L/gFqVr51xreu3tzDp1n8a/GmlsvmWvhfR7y5t28F291HH/AG1qIi1OMwWMMN/D5Z+yZ8Efh74Q8F3v7Y37TunTT/BDwZrDaV8MPhq0gtdY/aT+LNmGlsfCGkJKFZvAGhXMaXXj7xAiNaRWsUmko8kxuoa7fx78cPiFeaX4l/aq+KGq4+Of7QGna54Q+DdjZI1lY/Cv4O2yXPhzxf4t8H6YuRoWlyWQufhT8LTa+RPHD/wnviKGR9QNtdy/jvFeb4jOq9TKMuk1l1Or9WzDExlKH13E2UpZZQkmn7GlBTq5nXg706EJUKbdaUuT7rJMvoZfThjcWk8VKCq4WjJJvD0bxSxdWL0dSbahhacklKo1Ul+7iub6K8FfF5vh9dfHf4+X3iaP4hwfszaZqj2nxEu5TdWnxu/bf+Mdjc+DLTxlYSHy4rnwp8MtGtta0f4bWFugt9I8IaRJ4ngjtLzxbemvzP8Ag/q15/wqr9sfWry6mvL7U/g/4F0nUL24cyTXV94q/aN+Emp3k9zI53vPdto11NM7AM7szMCAQPoH9r6xb4I/Bn9n/wDZGgVbPxBpehwftD/HGyiiWKWD4mfFPS7STwZ4W1FRmRLnwH8MI9ItpIJGKW95rc7pGsrPXzN8O4zbfs4ftRam52Lfa3+zt4YXkrj7X4w8XeJGiRBlQAvhhHCkgbIVBLFaw4fy2hSyirmkIxSzDNMqoYSahGKeX4TMcPTpziork5cTVlicZTjBKMaeIhTjFQpwS2zbFVauNp4SUpP6vg8VVrJNytiK2GlUlDVuTdKCp0Zc17ypuUtWzZ/Z1+J+g/Dbx7ayeMopbz4Y+OdH1P4Z/F7Tovmkuvh14xSCz1e+tUZHR9W8J3q6Z438NyMha31/w3p8iFQnPrvgf4teJP2Kvi98XPgX8S9Eg+KnwP8AFF6fBPxx+F7zsNC+JXgxhHeeFviX4IuHyNH8YW+h3+neMfh94rs2SZrW5tbeWd7SdjB8CXN7hDFk7GBR84IK8oSqnOSA3p+BwQPprxZO3xm/Z78IfFJN1346+AEuifBX4ptu33mpfDLV5r25+B/ju6wvmOmgXEesfCvVr6YlLeCz8BWxIe8iVvq83yvDSxkK1eDlgszp08Hit4ujiYNSwOLhO6dKqql6SqRfP7SWHs17M8bAYudOjKFOdq+Gbr0XZP2lKSjGtRlFu04uPvuLvHkU21eWs37UX7OEfwS1Xw34v8B69J8Sf2dvi3aTeJPgf8WbeErFrujBx9r8J+K4Y0WLw/8AErwjKx0rxb4dnWGZbqA3ttE1ncxFPkK5jUF90ZBUjYowM4IOcFskjA4yME8nPX7o/Zi/aG8L+B9I8TfAH4+6dqXjL9lf4s3dpP4y0WxC3PiD4W+Lo0NvpPxn+F5kRhZeKvD/AJivq2nQGO28VaItxpV9E8ghz5j+05+zd4l/Zx8bWOi3+q6d428A+MtKTxf8IPi14bJl8H/FTwFekNp/iHRLvDLDqMCPHaeJPD87jUvD2riWxvoVAt5Z+jJ8yxOCxSybN5c2KjFvAY2V4xzLDw5dbpWji6UeWNemmueyrU0otqOGOwdLE0Pr+D0pOUVicOneWEqNRtyu7bozk26c7vlfuS1WvyZKC5OByAB7LxxnI5Y8AnGc4PAxVNl4PK9lOFOSCPvZ4yDhQDkdCK37iAhyVIztzgA5wvQHAxnA9wDnrkg5skf3nIGFBwCqkk5GOMYyMYGACeDk9K+2p1Y2hG2jirN7fZj80rbvrfbW/wA61ZuF1eLsm7pu/Lqu6stGttvN55zxgj3HP5dPr0zyKMf/AK+P89OKnZeMcA9wPXPc44wPp1x2NIEIyONwPUAk+g5znqf9nHPQ81qleXTTqtnZK67de2r09IcdUrp7WejWyfzte3yS9GoDgZAyxxwQQOemOcfL156sM8YA0YYlDfcYngE8bei4yCcnJ/hxkZpkcfK8Z7YBPXC9hgYIGex5BHGa3rO03HBBwQvJB3ZUDJ655IA3cYPuKxq1Etklyrd/9u21V7WtqnfVWfU0jHW0Uu7XZtxvdt2Tb13fltrf0+AExgoSwG7ty2Rgkkfd9AO2T3r7I/ZH/Zb8VftU/FCLwTpWoWfg/wAHeHtKvPGfxc+KWubYfCnwp+GejIJ/EPi3Xr6do7dJktoprfQ9PnnhOq6q8MJZLaK7mg8j+CfwY+IHxz+I/g34U/C/w7deJ/HfjnV4NH8P6RbqwQyufOudS1Kfb5em6Ho1ok+o61qUzLbadp1tcXMrfKA36Aftb/GL4f8AwE+Fkn7AX7MPiG11vwrpWqwaj+1Z8bNHIST9oP4taVKqv4W0q/iZ5D8Ifh1fJJZaLp8cpstX1K2N7KLlYpbrUPzniLOMRWxMMiyiV81xcXKdZR5qeW4RtRqYyuv5t44ak2va1rrSEaso/XZXgKdOh/aGO5Y4Si1yQbtLF1rRkqMNrxW9Sf2YJJ2bSPQPiJ/wUS+F/wAK1g+D/wCxr+zn8F2+Efwv10zfCr4q/GnwRN8Q/iHrWtJpMGkeIvivqPh3W7yLwk/ivxlcwJdafqniPw/q2raHoVrpmmWC6XbNJplv8c/Fz9tT9pr4927W3xa+OXxB8XaQgKweEo9dn8O+CLNOAILHwR4ZTRvC1pAgJRIYtLwoAzkDJ+LnvmBbkZ9cjGF28Dou3P3QB9SSSarDVHJwWCKOMYypH97nByPUH/Gpy3gfJMC6NSOChicVTTk8di08Tip1ZNSq1ZVqzlKMq07zn7PkjKUpOyDFcQY7E89P6xOlQdl7Ck1RoxircsVCHLdRSUVe7UVvod/Jq6hQkCQwRnJKQxqhGS2clQCe2MHdwCDxgss7lpn/AHjhueCSSckBSR1PT7uDgHk8ZNcZHeCRgoLA7sEliOfcc4zwOQDjp0BrotPG+VH+fII9PXccH24OcYAyckc19BUw1OlFKMElLltFKySVrJq1rX2S127nkRk6k03Pmvpr8TTt16eet+1tz9Jf+Cafwd034vftl/BTT/EaRjwT4E1m++M/xAluF3Wlt4K+EenTeOdTe9LfKLW4udIsNOmMgKML1IzyQK+Sf2j/AItap8cvjl8XvjRrEkr3vxQ+IvivxoqzkeZBp2ratcSaHZZJB8vT9FWwsI1zhI7dUGAqgfoH+yLfH4LfsPft4ftITSG017xpoXgz9jf4Y3hJjlbVfineJ4j+J8ljL98zWXgPSoGmaLDxJKwfarYr8ltfu4m2hAoAUDCkKFABxjHT5Wz2UAfd9fismpyzDifO8xkuall9OhkuGktUpqMMZjHF2XxyrYenO1lz0Gm7qy+jzCpHDZRgMNBcs8R7TG1LNp2lL2NFSVnZxVOU13VRPZ6YsuqPG5YyNnvlsAqABg4K8DG3bgE9MHgGE6zyoVj1JHI68PgLwM/LzjvkjHOOZvZ/3i4YA8cnByNox1J9QMbgcHisw3jE8so5xkbT16H72Qcc5yOvGa/RqeF9rTUr278y72S28u+9tUrXPkXXUXZttq3vX115bNXlvfppq++p6Bb6lH5iyyIkkiFWjbgvGy8qyOpV0dScqVCMDhuDyPuD4M/8FD/2uPgdpg8O+B/jj4qvvBbxtHdfDf4irp/xZ+Gl9bFSrWlz4J+Iln4j0WO2kTETpYwWbeWMJKpAI/ORb/btywGckhSFOPl6Hk8Y4GTzn1JN6PUpdigSBSMAjJB549c4AJzkE8njB58/H5BgcwpqnjcFhsXT3Ua9GE+XZJpuD5ZLeMlZx7nZhczxGHmpUa1ajLvCbi7Pl00aun1vul6H60X37Xv7H3xrLJ+0v+wp4X8NeIbxv9J+Kn7GPi25+CWveaxJlvrz4Ua7/wAJB8MNTuD/AK144bfR0kcYUIhREyYv2Qv2SvjJIZP2ZP24/Cmg63dSL9j+FP7Y3hW8+CPih5nGV0+x+JuhHxF8MtXuN37mKWefQoZn2sxjBG38wba9BKnIY7VwSRgEkcjsM8YUZAI4992HUF2skmJI9uGSQK6EleRjDDBHBAA+Uk5GBn5yXCtTAJSyfNczyu7bWHnWeYYK9tIfVsc6/sqSX2cLUw9ktGtGvT/tiFdL67g8Pi04/wARQVCs4qz5lUoOKlK/WrCp6d/sH4ufsE/tafArTn13x/8AAvxlJ4S2+ZD8QfA0Np8S/h3d2uD5d5B4y8B3PiLRY7aVR5kb3t1aMqE+ZChBFfJNoqzswjkjco5jZVILxsCd0bpgNuG0nbjcMZzwtet/Cj9pf47/AAHvl1D4L/GL4i/DObfl7Twn4p1Sz0W6AcOUvvDcs8/h6/jY4MkN5pk8ThcFWUmvse2/4KBWfxRmiT9rP9l/9nz9ouR18u78b6V4ek+BHxlKYG6cePvheumWN7eKMyI2r+GruKSbLTBwzAZyxHFOAh/tWBwWdU0r8+XT+p4mVrLTCYupOg5Pdv6/FNaKO5UYZRiX+6rYjAy/kxEfaUdWl/FpRU1q7pKhJed7s+BoopEjwVIRARnByxDKRzzu54J4BAOfWv088U6tq/wJ/YC/Y/0vQNX1Lwt4++NPx6+KX7V0Wr6JfTadr2k6V8ObfSfhF8JdZtbu2MdxaSw6jbeNdV0e4jbCm4mli3cks074af8ABMv46bbTwP8AtEfGL9jvxXqGRD4c/aK8I6f8WPhtDdztHGlvZfEr4fHSdTtLNZWGy88TaRC8cUbSTlwx2+I/t6fFXwV4y+PieEfhfrun+Ifg/wDAH4deAP2ffhfrekSySaL4h0L4b6Fb2mveLdKWQKfsfi/xrd+JvEUEwJee2v7aWQyFgx8apif9YcZgcull+Ow1OjUq4zH0cdhKtGKp06XsadL2ji8PWc6tZSXsatSNqMtbNX9GEP7Mo1MVHE4arKoo0aE6FaE3zTcXKbhH95G0Ite/CDTmtG27fXvxctfDv/BST4Y+I/j38PdM07Rv22fhj4fg1P8AaQ+Feg2cNjaftCeF9LhS3m+P3w80u1SKI+PLO3jjb4leGLCNn1R/+J3YwPctt1D8TL+DzSz7SqEgDjbtAKg8dsjCtk4AGT1NeofD/wCK3jn4TePPDHxI+G3iW88JeOPBer2+r+Hte091MtteQsu6K4hYGG8sbyIvaajY3Iktr20mnt7mNopGr9FvjP8AC3wH+218KvFX7Yf7Nnhmy8M/FvwZbx6t+15+zT4fQu+iyyDF18fPhRpESiW7+Hut3Mc174q0W1imfwrfy3Fw6pZpcMerBurwliKeCxM5VMixVWMcDip+88srVHFxwdebu1hajdsNWm+Wm37Go0uRmdeNPO8O61JRjmNGLeIoRdvrUIpP29JK371aOpCK95JzitWj8Yr2AB8KrADJOfmHAGPl798HsRg5AxXN3cXzg4JycnAHcrxjPbnqfQ5BGB6Fqdm4IkGxo5I8xlGDBkOFVh5YAOR2JIVhnOGFclcQuD93G7HXOAeT90EjnIHr3yeAf0vDYm/Io2SaSuvRWk21ZLZJ7PpazZ8ZWg1Nx5ZJrS/b3Voktkr7a6rV3OYkQrnABzjr823BGTgcggkEDtncOGJqEgHgnj2/z+ODjtWlMirtCgL3wMnIyoGcHI+n4gEdaDJtJwflGSM9AB2yBj6ZPbr1B9aLctXJN9H0vdLovKz03OWTbtvo3ZWs7+7tq/xt5Xvo098H9M+vOO/0PXFJ/L2/zz+FGBzx6Z/Dp/8Ar/wpuPfGDxngdO3I/wA59STS6a266xvrpt118ulif621b7f1+eg44IwQfwz7/n+HbnHekzxjBxjHUe+R168diTSkjp/njr9P068UgI4/IcfQcdeDxznv1pX7LbVJ3fbXS3Zt9PuGk7bPv1e9rNWe6s/yeomR3U9Me/OR+Ptzk5OOc0ZXaQFIx1Hv9evPP4cH3d/nPt7f5FGOOAPxz/n6en4UJ9Nlp1atqvP/AIKvvoO60WqV47NpdLq33u+9w49PT/EfTHvjHT0pfp/nnn0/z60f5/xoqSN9/wDMKKUKxAIC9+rensAe4wc4Pt0yuwn5flyRnq3rj+7+YweeMckU7Pt2/FX/AC1YW/T8emnUZwOfQe+O/wCB70Z4JweM/lx26jv+HXFNZH3YGG6nG4DjuCCuc9MAjjj0NIpDjByee2cjnBGcYHfBGQc44wcXy6JvrbXVtLSyt6dWrdr6F8ve2qT0avZ8u/Z2dtdFbzQ7cMABTx6dOenTPv689sikLKRkK2emTznOegOcfhxgcilPXGfXoDn65PTB6f1BFKfYZ5H4jI9/8/SjZJ2eruk5PrZ3l0b/AAX3Amlay+V7dlq7Wet3poteg0kZ4U9yMjPPfqOOx49emaXvnaeMc5Gcd+np6Dk9OhNHUbh144+nbp9fxP0w6pb+/RO7d9lddOt7iv130tf7n691e+t3awgOQe3oevH/ANf04/DrS/5/z+P/AOqiipJEweeevT1Hr/8AWPrR9ef8jp/PrxS0h54zjPp6/X/Ocdqe9r+nbst/JW9A9dPkB6Yx1449M4/z+nHNJn/ZPfpzzjnp3zkZx+lLkDqfTPr+I6/pSAgjjI5HGP8ADoPr7intrZ6O/l0ellZX/Jq1xpa67aXveyvb7riZGTxz06Z/PGf/AK/4cHB6qegx9ODx2x27dR6kUuc5B65Gev6d+MdePWgE+nGMg9+3X+vr2GM07pX07dX5NNddbarfaz3tV0lbVXtpfTpq2rPVPVK/ysrGcHp3OSOmenbrzxzjnnA7L9eP8+uB/n60c+n+f85/DHvhcE9Bn/P8vftU2vay+6/l5vbr66ktp9LPy26W7+at007WDB9vb0H6/wBfbANJ/k9vy6/570f/AFuPT9P6flS0f5f1t/V9+ov6/r+vUTp7/Qdf69uKTOM5IOM+mRz35+gH64pTkcjHHJ+n+fcUZGexPOemf0546etC2vv/AMBrftvuhra9r309LNf52+YzjrtPOPp7e3TqOmeOeoXIxwpP6Z6/jnr2z3PWl4AwM8egPGe/65xzj8KXuO4x1z/nk8c/Xp3q/roru7eys1p0v0d9LvyK6p7W2u+itZa6ee+ib30Gg8/dP6kjgdu3B5wfqDQCc9wMHGTn0wcZ6AdT+Gc04HqMdMde/wCP/wBf6igZIzjH+fcD3/KldrSyvZeellbR3XRdPuBvTZar1S20SvZd7JbWug7c/iP5+tIMjqR7cDoPbH09aXnI9Oc8/TB6fUdeOOueF/D/AD/9bn9aW3Ra67flfp+eu/SL76LXy216dgOBnBOCRgEnHXHBBHJB67QckDOBSYB/EYz/AE/z+Pal/wD1f5/z9OlB+vcfzH8+lWruz7JdL2vbVWe9tdtO2oL89Ndf8/w1XQaMbjzkAZIz0OT+A6cfj6UjMOe45BwR3Ge3P+T1NOOB17nue/YY6HoMflyTTTn5snBGSSDg98nB4xz1Pccn0NHq+j0320tdrqvm9Sklv/n3WqtvrdJdH3AlVz8pGeSeOckDgjngndjtnqM0ZVgQVJBBzx7dieudx9/pzSckkc8dcEZ6DHGQBnnqD+uFMZGF+jHoTxg9sfoPpzSvazu23b7W2kdfLyb2suyKv1s+71ukny2u+mq/JPQYRgkbcEj5jnrkkZyMeoznHBBYAbSZM5Qggr8p4PXA+hzz0/H60m7BPv0ABJJHYjBI6qSRg9Ae9PA+XHTjHPUZGOn/AOrBqpNtxvbpttsuuq08n5aCb2vHs1a3aL06dLau/R2tqo65zg/pn+mPb8vRDuHPXnBx78cHI44PbpjOOtOxnp+XGee3vj15I9uyfN0HOT0zj+nT/wCt26X12/rT+vl5E31XrrqtraaNW0fd222tq7I5UgA9ckZHBORwBjPOOc+x4wmDgnIBC5A6jCg843E8AkDggDg8cFCQAwUk53HZkgdSAOhGMdAuenvmn/KQWDcYJ+mCSegzjqMnI547ZGmt7q7T1T6cqS27WTT27b2tNq3xLZapvX3VotFd7K712Vuj8DHfHX69D7k/Q5P14qZcEcgkbuencqeud3X646+1RAAZ98/r6Yx07VMMKN3JycnGf6478ZI9Ac4zUuWis7Xasuutnfpp6X7eqTs9Lu9vnrG/Xfe+tjNjVgzbiGzj0Hqf6d8nPIwKe3IPbGew7e2QcHHqM46+sMJKAhsjAPIbOfyzwOp49cHHNT5DA8ccj3GR36cj8uPwpSvpJ997t69bJq1/z67kLo3pte3e2vld2bDH+f8AP+eB6UtGecd+tJn8vX/PbHf+fOM/Pr6X2ta/l/XUAAHQH9c/40f5+v6e+eO9Hb5QPbtn9B/nvR+HJHb27E/njoKLPXR66fNWvpu+/wCPQffvr6+d+omRnrk9Mfjzn+nH6ZIXGec9sdeDn27/AIdutAA6jBPr+h6f070cY9OD3I7jPTpj17dutH/A/wCDt/w/zB62t2X3/p/TYZHQ9ev4gj/4of1oPoRx1/HOfx9x3JHXmlpP5f5/zxzx3zR+Pr/wH0C/9edt/wBRAScfKeevPSnfh/L/AB/zn60dP/r0f5/z+NHbS336/j+Qn/W/y/y+SEySOhBz7ev1HX6/TtQOgz+NLQaNNrJa3Xlfvvdfjf7g8tN9/wCugcD2FIeeAeh5Hqeo57deo59MUAYGDzS469Bz+fQ9Pz59Rn2pq6b5XtrfTpbWz/Dr56MezbWrXX9bP+uvQTH1/T1zg+w9AelGB3Oc/wCTjvg9x0x7UDtnj059unv/AJ9M0fp9B/P0GP6ChNppRSb3erV0+X/Ja6rpZ3C//D9en+WnzDn+vPXB7f8A1/T1NL+B/T/Pv9PfqhOPcnoPX8egpaTTtf8Arp699O+m1xa/16r+vw7h/n6fz469/Sj/ADnj/P6f1pD29zS0tv6/rsAUnPP14/yR+P8AjS/5x/X1/XHtRzzwP8fqMcD880+j9P1X9er+YCAEdTn8O/c/4DsOKD9eePp6dM5x04z+eTlAOByT369emODx+vHXryAZzyOnTHv+HbAH+RTvrdW08lZ6JPS3f87pLUfW+mj8ktLdNP8Ag/Jjv8/5/wA//XaeOgPTH0Hp1HX6+5OBTv8AP8v89/50ZweDz+XH1/z29aSf3dV00t976/no2IjcZPOMsMnJXg8cZGD3zz9MHqEIIBbHGCcnPGSBkkNjjoMjIYZ9ae2ODyc+gPGDkZXt6Z4ycjtkNLMBtz1JAPICgNnjOeW9QxOAQABgDVe9vdbu3dWXW1rLt5u447rpZp3va60+7r566EhIPUd/YegGMDgZxjjg56ZFJz6ED8OvvyfTt6n0pSe/p6//AF+3HfgUg5A9/wCtZJ33V7/ffpra/nbq92xBkdQeB1/z+RoHuwx644/yeMH36dqMdscHr3H0H447Y/GkPHQZzz159jzn2yfx702731ava17PayWrv03+5+VadOve3S299r6/hvqg45xyR2+nQD0/xz6UAcduefT3/oOP1NA56jBHp+gzj09D7HHSnBd+4Zxjg+uc4I59PofcjGaHptv+llaz7dvlfVBd7LTbXRPpbXSy0Vv1FVcjOfyzk8jgDBHb1OATk9KuRq2QAuf4SQAGHyqozzkkgDjOMDvxlsabgAByBgjuc4wcEgcdOp6/dOONS1iblQCcdQxYlvug8qB3GCeck8ckilKajBt7W1v6rW9vut6W73HRJJK7et7XTbir6atPpvpYmiQsFGwgqw5OSOcAZYZGCOhwckZ9CPs/9lb9nPQviTD4q+Mnxo1a98C/swfB02t58T/GFsq/2x4s1e52tonwj+HcMoT+1/H3jOZFs4Uh3Q6Fp0smsX/lxxwCbjf2Z/2cNe/aI8dXGhxarZ+DPAHhDSbjxj8XvinrimPwx8Lvh7prK+seItXuGCpJqE4U6f4b0UMbzXdams7G1ikDTNH6F+078fNE+Kt14L+C3wO8P6t4X/Zs+EEkui/B3wQ6PJ4h8ba/qMn2XVPin46t7fDav8R/Ht7h4oGEsuj6fPbaLYKpW5Fx8DnWZV8diJ5JllZ0qnJ7TNMwg045dhZ29yM3dfXa8bxowd1ShetOKUYQn9Fl2DpYaisxxkOeMpKODwzf+91421cdH7Ck2vaSvepK0Fq5Sj3GvePtY/bM+LjeIfF9rB8LP2cfgX4NmvLLwV4bYx+G/gp8D9AubW1sfCXhmMlIr7x/461CXTfD8GqzK994k8ba3Bd3ZbS9PMdj6D+zbJpn7T/7V8XxO+KtpZaJ8Efgj4cu/jL8QdAtFH9heDfgf8ENPtbvwr8L9JiciJLfVbm28NeBbS32mTVtV12+vpUlvZ7lT8zfHDUV+Dng7Tv2XtGuYjr2l6pZ+Mf2i9RtJ0mTVPixFbTJo/w3W7jYibRPgzp19daVfwCWa3m+IWoeMLvdL9g02aP1rWbv/hnr9hvwx4WdvsnxL/ba8RwfEDxIqjy7zTP2bvhTqs9n4E0y4UEyQW3xD+I66l4l8tWEV7pXhnT3IeNlY/LYrBQlgKNHAQdH+0pxyjJYQUvaUMDU/eY/NG3eUq1ahTq4lVZ3clGhzNTqVL+3QrSWJnUxMvaLCx+vY6Ts4zxEHFYfCpXScIVJQouC2vUauoxa+bvjr8W/Enxz+K/xG+MPjB8+I/iT4t1nxZqEYJaKxXU7lpLDSbbIBWy0XT47PSbKMEhLSxhjVVC7Tt6Mxs/2Qvi5KflbWf2hfgXpY5GWTR/A/wAYtWdcgZOxruInOB8wI5OR8+XV2WKgknJwq4x02jBBIHII6DAznkcH3qdxbfsbxuQS2u/tUkZycMnhf4O7yf8Ab8p/FAzjOwyA8FhX2WMwVDCYHJ8BQhGlQo4zL6NKnHRKGGnTqRSSWyVFK1ltptc8SjiJ1sRjcTUm3OdHETlK7u5VbqTbvpd1HfTW1k+j+ap2LgZwQWJyMHPIbtkkcHDEsOuRya9u/Zy+Imh/D34jxw+OA8/wr+I+haj8LPi7ZRKHZ/APi0QwT65bxMjRtrHgfWI9J8d+HpmUmHWfDlmUIJcHwaSQAdyVwAccnO3jDAgg47A8+hJJjDI+RKGKFHQhCF3llwN6kBSATyuOeQfRfoMZhIYvA18NUi3GpTlGMlpKnNJck4vRqcJJOMvs2TWqTfkUcRKjiKdWKa5Zpt/ZlG6unfeLbas7qT0fZeq/ErwTr3wq+IfjP4aeJPLbWfBWvX+iXV1aktZ6vBCyvpuuaZKxxcaP4h0qSz1zSrqPMV1p1/bXERMciMfq/wDZn+O/gm88F337Kf7T0l/f/s4+MNVfVPCPjG1tzqHir9mf4k3irDa/EjwWrhri68K38jJB8Q/BsMkdrrelGe8gWLVLdWn8y8bxt8XvgB4L+MEbtc+OfglLoPwP+LeAZLzU/BN3Ddz/AAK8fXfBldbTT7HVfhXqt7L8sJ8P+CoWl87UY0f5sgnKtncdhOCOMfd6HgA8EjAG1hnIGRXzf1aOeZb9XxSdLHYOsqMq9N8lbDYzD8vJiaMvig5Jwq007qdKolK8ZST9WOIlgMUqlGUZ0KsFL2TTlTrUKjTdObslLls4vqpxvFpxTPZfj/8AALxz+zv8Q7/4eeObezvJo7e11vwx4r0Kc3vhLx/4M1WMXPh/xx4N1UYh1bw9r1k0VxbyxkyWsxlsb2KK9trmKP5/uLfO4AfMT02lQpBPUBcY43dcgnPIPH6KfBL4veBPjB8O7H9kv9pXxDFoPhe3urif9nb446jE11efAHxnqcg3eHPEtyIpL2++B/jK7MUHiLTUZm8KX7R+ItMjRYb2A/Ivxe+EXj/4IfELxF8L/ib4fuPDni/wxcxx39o7Jc2V/Z3EcdzpeveH9TgL2mu+GddspIdS0LW9PlnsdRsJ4Z7aVlLBenJ82rqbyvNFGGYYeN4VUuSljaEWorE0bvR9K1O7lSqaNuLhKWWYYCjOMcZg5N4epa8G7yw9S13Snby+Ce0o66STS8SaIp8pO44Gc8n8x1HXn1yfqqIFwSQcrgeuRg8Y5HJ78twRW3LaMSGdCu7IHTkHkg5PUHJI49evUjsRg5UjGMY64J+m3jHJwO578fT+11T509E7p+iVvJ9Lq73tueP7J3Xk0r6bK1nrurdb3322K1vCWIG1cjkHA5Xrgtk8AjH4dMEivRPDGgahr+paVpGk6deatq2q39ppek6XptrLeajqmp300dvY6dp9pDHJPd3t5cSRW9rBErSTzSRxojO3HJRQJGMg7Y8HLsAMAYyS235Qo4ycYI468/sB8Ko9H/4JwfCHQP2g/Gul2Wo/tqfGTwzPffsx/DrWrWO6T4A/D3VoZLOT9orxzpFyjeT411u2eaD4T6HfRpJbW7P4hnhaMkQ/K8RZ1PAUKdHBweJzPGTdDL8JF8rq1Wk3UqPVww9KPv4ira0IR2lJxi/dynLY4mbnWn7LC0YqpiK8lpCCcfdi2veqTd4wgrtvyu10HxF1jS/+Ca3wg1n4H+CtTsrz9uP41eFobL9obx1o1zBcn9mf4Ya3bx3a/Arwhq1q8nlfErxVaSRT/EnV7KYPodq0Oj20n2pIJrX8a7q8OCqYEKjC4C/Io7HHIPTI+91yW+9Wx4h8San4i1PVdd1zVb7Wda1nUL3V9Z1rU7l73VNY1XUZ5Lq/1LUby4Lz3N5eXUss880rM0skrNnJG3iJ7ollI4PIwSMkkAHOf6Ajvu54z4byD+zqNWviqv1rNcdUjWzHGSV3UrWVqdNSbUMPQ/h0Ka0hFXk5Tc5SM4zT61UjSoRdLCYePs8NQu7U6aavOWlnUk7yqSau9UmkrJ9zclnATcpBODjqQFGfmyBxjnnnk4xmq4mOCdpDA8EE+pBIALH8T05IAwMVWmaRvmyMZAAA3A5HAPBJ4+owByTzKrKCCQcMcjjntxgDPPpyT69h9dGkoK1ruy2d+sbX036WWzS1PnuaTsnLe+ibfVNq93o7pt3dvwN21dm2rt2jC4Hudo9ARg9O/Q8jBr0HQ1i85Hn4iVGkcjaCVRA45Y42qQOSVwO4IFeeWilXjx8y8DHORyoxgcdCDk5OMd8gfV/7Kfwkvfj9+0D8F/gjYK/nfFD4k+E/CV1IihhZ6Jf6nbyeI79gDuEWm+HYtUv5HAKJHbMSrKCa+eznE08HhsViqiSpYWhVrTb2jCnDmbf+FRul/mexl1KeIq0aMU26s4U4rdtzcVZ6b72bu2kr+X3Z+2kq/BL9ir9gj9mKFTZ+IfEnhrxh+2P8VbQbUmXXfjJd/wBjfDK21GLG9bvS/h/pU6LFMwMMdwhCqSSfx81G73F0ZvvZGBzgex9AuMDvnlSDX6Jf8FLPjRpnxt/bE+Ovi7w5In/CEaN4qHwy+HdpCQbS08AfCqxtvAfhqKwVcIlldQ6JLqiIhC+ZqDOc72B/NHUZMSHHQ4JOOg+UnvwTxgYPpkc48LgnBzp5Lg6tdOOJzCdXNMUpK0lXx1R4qUJXd/3XtFSir25YR0vt6ef14Sx1WFObnSw0I4any7OOHhGndX93Vrm9X5mbcyEjGSSckevHTqRx0J6j8eBjltvQDIPXIIzgDjKtg+vbrkNkirVzJkgA8kdenPA4OfTk57jPGMGmwOQcH5iOuTjnkDpzgHHQZwPev0eCUUlGyTSXlsk5WvZrffR366ny0pNu+7d363a+966O7009HCViAUAzwAOMDHHAAPQZAySRjnJHMvnhSAVcMcHgbQOBzkdzwCRnpkMKr89MZ6c+3OeP1Pt09KXLDjJ45x+R/wAg/pzQ0mrXta17K+l1a+99r3d7vRNmcakl2uraJtW2v387Xv62NVL04XYDldu4jOOMDJBPP1wADV5L8AnnacEbRkr7EkcDjgcHBBGRyV5ze4LFeSQc5PQ5BHJPHoOOPQ5xUyz4I68dOAOfw6ceoC8g9qwqUVO0XFySSs0t1ZLte17a6fca0604Ncqum3vd9Iettd7t9rNK51CXpLbuuQBs3D/Z5GMdAN3yscdOmK2LbUhH0YZBHU8DIU4IBYADjjJz29uG+1OuMHbhSDwDgjj5cccnGc56H14fHdMclzgYJLDIJ6cccjnOcdge5zXPPBQaSu0kk9E97R2231Wt+jSsbqvZNuK+T0touq1eml/vs7HfnWXdiRIQcFcZzkEbcMDnPU98dcHkYiXUyVPzDGfXp0HAyO3PqAOFbJNcSbphjGRycMOCw7EknPQ9ensMGrEVxz8zHdywbJChQRknII7gE9SOQARxg8HFNXlrb3bq9kkkrN7J/n0V0iliH/K9WutrLTV3bs9Hs9NFa1ztEuVK4DElgWbrgH5jz/CR1GOR0C8gY9n+BPx++Jv7OfxQ8L/F74S6+2g+L/Ck7mCSVDdaPrWm3SiHV/DPiXSmKwa34b1y0Mllq2lXgeGaGQOnl3MME8PzktyWxyVYKRkcgnp1BLHsOxOMYArUs7jdgNuHzfe6A8rhSCSeuTn7uflYZAzxY3LqOKwtTDYmhGvQrxdOrTqJOLjKykmnolv28tWrb4bF1qNWFWleFWm4yjKMmmmnGSV9Nf01aa2/VT9pD4H/AA7+PXwv1X9t39kzw+NI8Dpf2qftKfs/ae32rVf2bfH+ryZk1rRLWCJJLr4IeLb3zrnw5qkcRi8N3E50m8MFtFHBY/lpqFl5TMdp2kgED5hghcEEDaQTyCDkDkjHX6s/Zg/aQ+IX7MHxKsPiR8P5dPvUksLnw9408EeIYTf+Cfib4E1VVg8QeBPGmjsjQ6loOtWjPGpkie40y5MN/ZNHPEM/RX7Wf7NHw71/4eWv7ZH7I0Goaj+zZ4r1WPTfHvgK6m/tDxh+yx8SdQKST/D3xmq7p5/A2oXMrt8P/G8sf2HUrF7bT7u5XUDCLv4vAYzEcPY2jk+ZVJVMtrz5MnzCq3Jxlpy5djKjelWC0w1ab/fQjyybqxftPocTh6ObYZ4/C04RxdODeOwkLK691PFUY7OLvepFXcJPms4PT8nLu2ZAflO3BJyDn9MgbeGzkADIyVrEdGAwTjrxzkDjqAMcgdMk549a7e+gkAcMCeMAg5LDAO4EADI6jaTkckk4zzU1s+CQTgjJycgAYI4A9ByARtY5IIOa/TMPVjJXTV1y+623vZ6dLLZ7XtofI1qTju1ZyVrLZ3V1qvO339DFPHGRwcdc+/8A7NjHH06UmR1z0zn/AOuP/rZ/XM7qclSckEgt16YXsABnGeByec+kO3Zjjg/Uk+59Bz/Pgd+tNSV9E1/e22+b2vbp5nO0lo77J7+l9167X/BjTj154x09xnoepOCQKUZ59efXHfHX9cfgeOAAAnGPTjI9c4OPwPP6Yo/Xn8v89P1NF1pu7d9unT7799/In/gf8H8Rfr6dj/X/APV+FJz9fy/zn15A/lS0n17nHGe59h/LnsMnGTy/rp+LsAuD2BP0zj2z1x/nsOJQNvbPrxzzx6dOSGGSCBkZ6U5AcY7Z54xnvngDgfmMjGDwLEcR3Ak/KcAgY+Vv4cnkDPPABJxkbSCaaWuq2vtu2rO2ifXt01v0KjG7Xr3fkne3Sz62V3e+iIlViDkHqAuB1Pr1wQfUYxxkcirMNrLK8cUcTvPKyxRRxoZJZZJCqpHGgBZ2YscKpyfuhc4FatvbZwNo+8gBI+990YBIJ5bABOB34619bfBP4f6M+mHxPNLDqGrs7wxwsrKujgKGCCOQZN1LEYpzPgCNJNkbA+a9evkGU1+IMypZfQnTpt81WpUm1eNKFnJxi5Jzmo6KKvzfE0knJcWYY+ll2FliakXKKaikk7OT5bc07NQjzXV5aX0V20j4zmtLi3llt7iCa2uIGMc1tPGYponwAUkiYb0OSAVcbgWA47UmiZeuQSAMcZyduR2YnnJ5DdcnFfa/xk8E6BcadceI7qZdK1OyRYkukjLx6lIcrb2dzGNpnndzFFDOXDIMhiyKVHyBJA2wFQDwCxK46hQSMfdHI4bBGcbdvXTiDKa2QZj9SrVadZSXtKVSDSm6ba5eaF24S0s03rvFtJseW42OY4aOIjTlTvpOMovlulF+7Jqzh0Wt01bq4mIYiDlTyR8o9DwBjsCenvgY6mmAcc8nv9f89KuyR7WxyxIIbqTkADnBIBGQSAcEnIAHFUyCAOCM/p6DI49fuk+2MV4vSz30d30jpbbda37eWx1y5l2drO61002au9Oi76APpjp/+r/I+lHr2/z1/wD1+lJn6/5/z3x/KlqP6/r16C/r+vl/XUQZPY/5/wAnpnjril7/AOcf5/ye1FFP1/4bbXtr+PlowA+3FJ2BPB/qf/r0AgjI9f8APA+vf69KDxzz17dT7fj05+npRqrJ3vdevT/gelh+Vv8AP+vW/oJgZBBzyTg+xIP5ZyOuD9TRg9iByTkjn9epx36npnOaB0yRjA7dCPUfl9RxS9cHPHYfn1/zxVXfXW3ezW8dG9vV6dA1+7To1+qExjoPqOn5Z6c54zjuD1yuT6fy9f09fp78UtJ/n/PNTfy/Pyv17b+voJvZPd/jtf59X1YE9eDwPwPH1zz9P0oB6cEfl/j+P/1+KX/P+f8AP0oHv/n/AD/kDpR02/Py1+/89tgAZPb8O/6f/XpMAZ9+tLR+X0P+enrwf8UA0gEjnPcemARn/J9aXAyDnnH6Z7g5B985ox7Dnqeh49PTkDH50Yzz9P05GfTB/wDr+1a7X0XkrWbV+uqu/R6fJ38393pfr+Hl56H05zjOP5/56474FJjjoeuSM/y5x/Lp7CnUH/OP88/rQ36PWzVtdOW3Z28rf8Av+D879NHrtt6dAGT2/wAf0/xo5BOR2/x+ntR69fr9f8/55o6evT3zj+ZyPzpWdr2dt9nZba/l/Vie39fj+Xf77J9Ae+eevHGPT+XXp3O3fHHrn9OR7/8A66XJ7nPX8z/nn1o7+o9e3b2/Ln+oUvazXS1+l9tP616vyY0kHgnrjjoRkgAgZB6kcD25Hd3tn/I+tIAF68k9zz15Ht0GOfyzRznP6cj1/wA9PT05rV26tK+vXRL57em2rvq9O9uuvey/Xr29AJ9/Xv25z69D/nsUbGOeRgeueSOchgfTJyAepwOKd16/5+v09s0gzzxgDgf5/l06UJy82lZ28tLa/j8r7hFpNO2zvva+q0E4HJ5/LPJUcdORycnjpyCAaOOc9CGyT+XTPOOnvgDgYFDDIxnH0IyCCDnnp9ff8QpxjgEkhgc8dSO3Xj+gxgkYSfNZN26PS117u3Tte23ySBPb1s9el1bXpazDPb0+n0z17/0pRyemf5/y/Xn9KPw/z/nHTnmjPX8j/n8qFe+17Wvv1tbz9N12QhevOOOn8yQMcc5z7UzDbuoA555PHp36+o/wp5Y55PrjkE59Bx04HPTsOtKTwMdvzz3wfQdfx/Lbv5/1r3KT5el7rrr80trq3W6vuug3IGBg/wA+uB+nXknufWl3A8D5RnuATkA4OOM5z3yODg9SWEH5cE9ee3fGB+HIx2yc55K5xuGd3Y46DJzyTwRjI6np6Ufd8/Vfj6jSta62fS61vHV9bPmvZ6X82WCe+AQep9v1z/nt0lBHyjHY46eq5xz2OM554+tRAgj25H9D9R6c/wBalVuBnJxkZOATkr+WSc9+Tx6VNk1HfRr13s1stl+V7hra2zXqnrZaevXvo97soABG4wQ2CQCMgnOePYHnrjqOhp3PJwMDGc/Uc9ff2OfXNIuCMg5OOST1/DP5evandf8AP+fp/wDXqZva1rp3emmlt332T89+xP8AwN/62GHAO8Hg8YAyfvKOmT9OnH94EZpSeABz8pOc8cYGM5yOTk+wPU9EHPPIAwwXGQMnPIIPp8vvnjK0MONpHJDcc8kkFcjB6fTJGcc001pfR+ulko29Ve736PXce9k9bO21nbTR7ba310116gWHIGT0GTyOx6dCSfTrgZ6EBoOzGTxhyR/tAhcfez17Ac47Eg0pG7JXuMjGPm6Y6nb25B9uOMUFTz3JDY6YGfpz2BOW9FxgGi6sld7+8/u735X1XndOzWlaWSuld2a3193V3Wmje3Vd0OyMcg4PY8HGQD398jJ6ccU7AHA6Cm5IwSTk4GBkjPHTj1z6YHI5JwuRnHrn6ce/+fftWbuvTp2/ydtroh9vNvS9tv07/oA9Cc/h/Pt/LoaMj1H50v4dP1/z7dqBjuAe/Oefr+XHTnrwKLfjtsluv6029BB/Sj6UgIPHp/T/ADx9D6UtOz0fldarZW/H8WH9dwHPb8P/ANVH+P0+v+f/ANdIcYOePekx7kn8D0PPsDg4PPPWjz210WtunXp99+jsNL8+v9bd+woGB1z175+n6Ufn35PTr7/4Yx0o6cZPP5cfhxn3+goz6cn+XQHJ7dPxxjsBS+d9t9O3ftt/wBb/ANWFozjn6/y5+vFFGfbj9P8AH/PWhf1t+oBRRxjoPTofp/8AW+n50pPsP15/WhW/HvZf8D/g+Wp/X9f8ESikbttUcZ/+tjPTjr6/jwE//Xxk9MHH4j6dsDmi22q1+fbdfp6gLSEZ/wA/n9fxyPY0hz2J49c9Bn1x1OO4B5PrlevQ/iPT2/8ArdwM5xija3T5ff67/NeVh7Wezv8A5f5/1cAMdM/jn+vT/OaXgD6fyo/z/n/PfvR/n/P49sdPzovfv9/XuITcOeenX/P+etIcAEngc56nr1/yKd+H+e35UnGeMcHoOnY49cevTOO46m/fXzvr+et/z1B2f9duv3+X3jGcAgBgQf4eByCBww3dCNx69cYJwArHILEgjkjGRxkYb5cc9cjrnjO0g0x2AKgAZPJ28Ec56ELnpk+nXgdXrggAnnDA4443A8DA4Oc9T1wfQbJK17JaK9vPe1rv7t9PIrRKLvbV319F8tLa6Pa22jz0z/nj/PXj+dJn05x3H5/5x+APZADzzxx7447H8uvvkd6Q4BwMgnnIHpnPXn8vbHXnNW3tqtfKytvbbq9vv6pJW8/wstXfr32+Q7J7j/63T8/8j6nf0P8ATJx7c/mM0hGcc4IOR3/z2p6rubnIHrxt4I6luBnvjIx1wc4Wj2fra+l2vv8ARa+bsD/F7rpbRobhjnHAGPqSNvHXpyM7scAnI4NWI0ySCAOnT+8cH346AgkdM4wc0saEsoxngZxnuQPVc8ggE9M8eg0YIvLPTcvBIbBKnIxn0xggNjgdTgsKUpqEbaJ67vd2T0801qvkrblJNbcutlo3/da6X7X1ST0XQIokCoDwTg5wMduecnpyePpgnj2/4IfBzx58d/iN4X+Fvw20ZtZ8W+KL0W9pC7Lb6dpthAiz6n4i1++dRBpXhzQbFZtR1nVLmRILOzgdiZJ2ihk878L+GNe8YeItB8J+FtF1HxF4m8TatZ6J4e0LSbV7vU9W1jUZ47ey06wto1Zpp55ZFjKoMIu6RmWNHx+lPxi8V+Hf2JPhnr/7KHwj1mw1n4/eO9Oi0/8Aa8+Meh3CXC+HrUlZz+zb8OdVgJeHSdMcj/hZ+tWkqya1qkbaGZFggu7e3+Nz/OMRCVLK8rUaubY7mVGLV6eFoLljUxuKs7+wo3XJG6dapy0oyXNKS9zK8BTnzYzGNxweHac2re0rVNOShS0XNOfWW1OKcpa2i+W/aO+LPgPwT4Lh/ZA/Zu1ddR+D/hbWINT+LPxMtEa11D9pP4taWDDceJryQHzV+GPhC6+0ad8NPDrO1p5CS+JLpZ9Qv4JouG+DFnbfBLwFqv7VfiGC3k8URajqHgr9mXRL2KKYap8VLe3gk1/4ry2cyslx4f8Agppt7a3+mTPE1tdfEnUvC9tukTR9XRfEfgn8NL34veP9K8IQ6la+G9GS0v8AxB418X3wDaV4E+H3hy1k1Pxd4w1RQebTQ9GgnktrVSJNT1SWw0izEl7qFpFJufH/AOKmnfFTxraHwtp914f+F/gXRbTwB8H/AApcOrTaB8P9Gmmazm1HYBFL4o8V39xfeL/GOoLlr/xNrWoyg+QltDF4NLLI0XT4fws51faNY3P8bNp1cRGbi3CrUsv3uNlBxaStSwsJwgoL2VvV+suXNmdRRjypUctw6SdOk4pWlGKelPDxkpKV251pRk3NqaML9n/4Q65+0Z8d/APwtivpkn8c+JhL4r8TXszyvpHhi287XfH/AIy1S9mcyEaV4es9Y1e6vJnzNJF85Z7gbt/9rr4yab8cfj54w8X+FLc2Pw30IaX8N/hDooyING+E/wAPLGPwv4KtLaEqqwreabYNrVyoG5r7VLmRyWkYj334QQ/8KF/ZA+Nvx/nlez8f/tAXl1+y38GZMiO5tPCbW9jr3x78Y6a+d2xdGfRPAsN9AVMVzq+oQBlPmV+dU/lxoI4/uoVSPGAMADGMZGMYxwNoHA7V6mVxjmOd4rHRUVg8pj/ZWAtd05Vm6VTH1o20aTjRwqdrwlQrxT9535sY/qeX0KF5KvjmsXiHe7jTi3HDQa3XMnKttaSqRbvZD5ZfmVQx9yMjb90nkHGcAe+egAwtfSPiqQWn7IHwZgGAdY/aE+OusE9S66V4G+DujRtt6qFNxNGCBjhhkcg/LbuSQxJB7gcDqoxwBye3OBnPAzj6U+Jkn2X9nL9ljTh8n2y7+PnixkBb5v7S8c6P4cjlYN6p4W2Ag7T5ZHPIHs5pBvFZJF7PMpSaWifLgcTLsusVdpu+63d/JwrtQzCd78uFjG2ru3iKCd3ayXZO99vN/N00hK8A5wuAxAwflz6kc47g45HynhkcgHORnOAGA65BHtnAA+bseOOaZJJgkAnkAdPTHXnnsVB9OeKiVthBAByMNnPfHvzxjPXHGAMnH0KScUm9bJ9NdmtE/W/To7XsvM5k9LLTVtLRK6Vr+qe17dry1+kP2cfiB4d8IePbnQPHVwYfhb8WfD998J/ikQN66f4Y8TS28mneLYYSSkmo/DzxXa6D460okb/tPh8WylEuJAfO/H/g/X/hl448W/D3xTDHb+IvBXiDUfDWsJGwktprzTLhrcXtjNyJ9O1GBIdR0+6izFd2N1bXETFJVY+dgKwMbKrLICkgbG0I4x0wVGVIBJ9T0yMfUvxMaT4q/BnwJ8cY2+1+Kvh/LovwF+NBRi91OLDTbmf4H+Pr7LGV11/wbpOo+Ar+8dAq6l4AsXmeS61mJX+frwjgM1pYhaYbMlHC19EoxxMEvYVbp2XtEpUZyteUlQjfVI9KivrGEcE26uFbqUrt3lSfL7SC6vlvzpbJObu9W/nLzjMCHAcBSpQYBYEAMGBLAqVUDnJbBGCQWP6Z/BHx14L/AGtPh14e/ZT+P/iHTPDPxS8I2bab+yT+0D4guBDFpc0jvLD8Afirq0gaSf4d+IblxB4K128kZ/A2uXC26OukXk9s/wCYaOQCd3T7nPAztzwBjJOeBkdz0FaUDM4QBcFwA6k4UdNpGQcEEbgSQV46fLjHOcop46jBqo6GJoP22DxcL+0w9ZJJSj/NCT92rSbcKkeaElZs6cvx8qFV88VUoVI8lelLWFWDcfPSaavCSV4tXWh6f48+HPi74Z+MvEfw/wDHvhzUvC/jTwlq1xofiLw9q0RivdL1G2dEkiYfMk8Ew2T2d5BJLaXtrNDdWs01tNDK3P22lu4AC/Me7DIAG3II444ORwRnoOBX6Z/DLVdI/b98DaF8GviBq2n6R+2J4A0OLRfgF8Tdau4LG0+P3hTS4iLX4F/EXVLpooR480u2Vovhf4t1G4V9TUDwvq1w5ksbhU/Zc/ZH0K9k8f8Axq/axt/Efww/Zo/Z61o6R8UoLywudG8bfEb4l2sjtp37O3gCyvorW6uPG+t3VuY/E0yL/wAUn4f+0anqMtq9xYzN8vPi6GX4TE0s0i6WZ4L2dKeFpx53jZ1HGOHngYv3q0MTKPJT6wqXpzcZRbfsPI3ia9GeDmqmExD541G7KhCKjKrGu3pB0+a0m0lJWlG9zI/Zv+DXgL4H/C9f25/2mfDlrrvg3TNVuNL/AGZPgnq2Ipv2i/izpDKV1rVLM4mb4L/Dy6EN94r1TaLTW9Rhi0K2lmzLFcfn98Yfi94/+N3xI8X/ABX+J/iK58TeO/G+qy6t4g1S4Hlxq5Ais9L0q1UiHTNB0a0SDTNF0m1VLbT9Otbe2gRY4/m+hf2t/wBpLxT+058Srnx3r+n6b4T8OaHplt4Q+Ffww8PKsHhD4S/DTRgIvDfgbwtZqI4YYLS1Ec+qX6xrPrOqy3N/cENJDFH8X3jqScp64bAJJBzg5I9OOgyQM5+93cOZdiatSec5sl/aeMilCjpKGXYVuLjhKLu1zaxniait7Wrr8EKUY4ZtjaVOn9RwWmFoXcpK6liq0UlKtP8Au7qnBtqEe8m2600o3bvMAPUgc5zzhSNvPIY4BHPQAcZUjmRlbccqRg8n8OTnHyjOMjnkZAzK7ZJPXqMjnBwMjPJHb1x19zEGGMEDJ4GBk9hzjgEenB46DAI+7pQUbLey3st+t7aX8/K6WzPlpc0nd3du7tsunZ7tPbySViMbt43EnDA5HG7OOc9eD2J+gxitCANvGWCrjkEZI6HoM/l19wKrKvynbGNwKkgAkE4OSCT1yRxu4yOTyavwDEiqVIJCkcDoCMZYkfL1B4ODjpnBU3ypvZR6NdPd0Vrr5JaddHYqjBTnyNJ7dr/ZTu9tey69uvR2tuxVXUZJUYGDwQQN23JIJxnBPJ2kcgbv1O/4JqXD/Cm8/ae/a6vIURP2X/2cPF934OvJgPK/4XH8Yh/wq/4cwQswwb1U1fXL2NUPnxpEsoxtLD8zdBtJb2eK1toZLq4kYLHbwRvLLI2AdscSKzMcBiCASOTx1H6WeMtX0T4V/wDBNzwR8L9F1Owm8eftLfH7Xfip8VrCyuYptS8MeAvg3YxeEPhn4Z8TQwl5NLn13xLqOv8AizT9OvvIllt7SK5SIgow+C4uo4vGYCjgaGErVqWaY7C4DEVYUqjp0sI5KtjnUnFWhzYOlWhFya9+SindpP6LJalDD4qdapVp06mFw9StRpzmoznWcYwoqMW+aTVSUZO2tlLpc/NrVLuRwUluBdOo+e4zuM8jDfJK5ySXlmJZi4ySWYkk4HA6gOpI5J7kjk4HGNvp1IGAPXOegvXWIsCcLycjJPOScgdMHGe5yMZHFYTKJhls5Zcpt4BHQA5B5J7AA4254OK+qwVONNwhGKjCMUklslGyWmtrJaLrre+54+IlUnVlJttzcrtptybcVqldtrr57anPy5+XgHjBwB8uNpwBz1BA64BH1wwqOfmOOCOgPA4GT6c98d6vXMUgYhUBwdpJ6fe59SMjIzjkY6GolVASCmSNvB4wSMccDkZJwOMeuBXruairp9W7J3b+6/ql0s9tThbuteq6aq+m+2vS2tr7d6oUD+8Og4xwCOp/u88E9e3YCmFQOd20e5GcnPUbQeOOmeD376Yhy2fKyrDPKkHPQAnOQT7kjnoRyBogMFU+XIPP8PrgDI6cZ6j+I4wacZq6Wl33+Wiv10fR3ukm72RCm5c7SVopO9r+9deerstt1Zb9MhgoPHPBz16DOeuSMEkcc/MfU04q3BAPAweOvJPTj1J47n6CrwRf4YwvTaNoJ9z+HfnPXHSjyt4+XK7eoPAyOh6bR+HU47cVs52avazW7d39m2i2vfW227Wmt8s0l7rbeqdrtrTWze1lrZ2SRRw+TlWwAOSOMZ49OxH04693LuJ+dWJ4A4C4xnAAGW7DtkdOnBtCBvlPOBnjOeW7kcFeoGG568jIy4oVxw2M5wSylVY5xwCO/Q9/YfLLqJL7N0vnrbS17XS17dOiY3FtJuL2WtrNNtWad7K+7162S2IwzeuSAM9jjPoc/mcn9aeHweSQuBk8DnjoR659SOntTmVT/q++MZI5P4gf3hxyemMcU0rxk4YcAgZwAcZ5CkjGQeOnc5zWMZKUtXF6eTd9Nno0tl123dtFaSV+XTv5aW02v0VlZWvtduRJG6DjryxJ2g4xhiec4GODk/NxgVtwTAAAHkbeB06jBJyDgDJ6HPb5uuOEOdxGPbqFyBnBIycZxyPTn1uITGgzkgAdAeeORznGOxz654GaU1GUbLTy+6+/VaW3876jp1Yxvo5NvS2trWsmtG7X2v1e+519tqDqRuPC7SvBBYDZ6kEDAPOc8dSQAfp/9mT9q7xn+zH49uvE2i6fpvjTwL4r0eXwl8YfhD4nX7R4J+Lvw+1BWi1Xwv4js3WS3S6jhlmn0HW44mvtD1IJdWjeW9zbzfHazkbSRyFxkcHnGCSc+mP4gCPvDvcjuAwG8fLnA7sSQDyWb1LEHB68+jfP5pluCzDC1cLiqMa1KsmmpJ3i3ytTjK94zhL3oTVpKUU4u6TPRweKrYWtCtQlKnOErppXUkuVSjJJW5ZLSUXeNtOXQ/Qn9q79mLwT4d8M+Hv2mv2Z9R1Pxv8AsmfFTUHtdBvdQcXPir4JeOGVbnVPgl8VURmay1zRpTIvhrX7kCz8VaOsF9az3NwLhpPz0vbQozsQMKSu0c424++oIwQcAnHOcA54r7A/ZQ/ag1D9nvxB4m0TxJ4ej+JvwD+LOmQ+Fvjt8FdSm26V448L71MOsaNK6lND+IXhOST+1fB/iW28q8sr+MQSyG0ndE2/2tP2WrP4MT+E/id8KfEs3xS/Zc+MkM2rfBn4rJConURgS6l8NfiFbwgw+Hfij4NJNjrOkXKw/wBoRw/2npscts0yW/zWV4/E5PjKeS5pWdSNS7ynMKjaeLpwUf8AZcRPRRxlKK1eixEIqpFcyqRj7WPwdLMMK8ywMFCcVfGYSOrpy0vVprVujKT2tem1yu9038ATQCM7gqszDjlSNxP8+p6gjJI43YoSRdcrjIBwQB8p29jnkA9MbeueOK625s32bvlC5Gw7QSCADz35Deo5JCknGcW4gJjB/hBb5iMncCMg4OepPIHBOOvX7+hieZqMopaJK1lF7W7drtNLRtvofKypzS1SVnZ+auujvdadVa71b5TH2Atwdq85xgcAd/m6A8gDp064xGD3B/L/ABq40Z64xgZI6DjAznryB1znkjOSKgZARwOeOhGAcdeR29h+fWuy90tlp897a7376dNjFprTR9n/AF+u3zuRdeMgfX9M/U8D8qkRPmGBkjnd94YOBxkduc4AK/eyeDUijn5VXnGeAMjI69Dn0/Mq3ANuKPodpwMf3j02gk5wOT3z9cZBobUVeztqujvqrX7W/wAt1oKCV9dObd7q/uq17J9F57O1kxYoy3QZwQpPX0yF59sY4GM/StW2tywwByflU4Hy8kEggEjnjaQ3XI5plvbyE5XbyFO3jA4DduAAB7EHpleB738AvgZ8Qf2hviLonwx+G2lQ3mu6gst9qeqag62Xhvwj4bsgJNZ8Y+L9Wlxb6L4b0O133F/e3LqZGSOztlnv7m3hfzMdmNDA4eticTUhQo0YudSrOSSjFK7vdbu6jb4ubRK7SO7DYWpXq06VKnKpVqNJJK923Ha3RaNtva992jov2bf2cfF37Rnj+Hwh4els/D2h6Np8/ib4jfELX8W/hT4aeBtNAl1jxb4lvpNkMaW0Cumm2DTRz6rfGO1gZVM08X25q/xY+CHifWP+Fa/BPw+3hX9nH9m3wZqd9P8AEm50K2ufiN8WNV1PxP4b0C+8e+J7mU258zxRrmqWVh4T0K5CxaTo8r3SQ27omnweZftCfGb4feC/AUv7If7L2qy33wg0rUYLz4vfFeKM2OtftK/EHTSok1Sdw3m2vws8O3SS2/grw7vMF5HGusXi3EjQSN883tqvgb9lLVtXyY9Z+NXxd0/Q7VgSu/wR8GNJTxHrO3JbFnf+NvF3hRWZCoM3hsIwDoRXwOFzXPnmGD4iw2JxOVVo4hUMhw0Xy1KdOtFxxGYYqk7xliKmDVeVGhVjOFCn8UfaSaj9PVwWWrDVcrr0qWOpuKq5hUfvRk4OPssPTknzRpqvyKpOLTqTfuvlSb++L8/CnwFpXx58EfELwpd/FDwn4H+JkXwt+PBtYLC08aeG/AniK7tz8Kfjt8JruVHuNH13wv4lt73w54n027EujawdV8KwXcajVbsL+fX7Rf7Ous/AjW9GuIdasfHvwt8f2T+IfhJ8XNAVx4Z+IHhkuq+bGpeX+xvFOls32HxV4TvZTqOh6lFLG/n2zWt7efV3xK8aeHPCn7bvxKh8aSCH4bfGPRvDPhD4kbcmKLwd8Vvhx4Muv+EiCEYe48I6/c6J45sHXJF9oMboQSSfKPBnxbk+BmsfEb9k79pTw5d+OfgS/i/UtL8b+FrCSF/Evw38a6VPJp8Xxh+Dt9OrR2OvRIYtRnskkXRvGmizJb30brcLM+WEzfiLF4xZzi8ViM0xWNwODx+KoVajbxmHq0qca08LFvlp4rC1FK1OmoU6lCrRpNKcYTW2KwmU06P9n0MPSwdLD16uFoVIRSjRnCbcI1lFOcqVWDXvScpRqQlNe62j4HuYV3DgAfwHA5IUc5HYjoOnYAEisuVV57ngE7RgcAH3BDY598dcmvqP4/fs9658EtT0LUbbWbL4hfCnx9aSa58I/i9oEb/8I5478PeaoZJFJZtE8YaOWFn4n8J3zpqWk3ysHjltmguJfm+SIKCpUeY2GAAUgjAOCc5ztAVuOBwTmv0LK8fRx2Hp4ijUVSlLS97OMtFKFSMlzxqQfNGUZKLjK6lZo+NxWFq4Wr7KqrSWjtrzpr4oNcyaad+ZXTTuncw2G3bhwffA4OehwQcnjGSevyggcpnjPHt+PTp7/nxxVmSNQFAHHr33Z64AwDwcntn0NVZF2rtRMkY44wBwRkAHOOoI4UDgc5r1mk3ZJdG9e7V7NeTsrdb+SObld1fS/X7r6fh3vdbhnjPt278due9Hoef8Pr/n+tM8zrn8OOPTnG0A/kPdqUgkgZA4J4z9OmehB/mM0ONtJadb9LWT7dFfol56Bba+i72v/W4vcDAwfbGCOR/I9h70EEj059Mj9evr/wDXpc4BPXHB6+hI/MDr0pec9sd/Xv07Ht3pXf3a3+7XVb7bWvvrrc6369/xu0+69L79w445/wDr/T8Px+lFA9v8/j/Wjgewpdrb/n8v6v8AgIQkevXp/wDWoyPUfnRx3Ayfz/zj8gTQcDnAAz2HT/PSj1Tu9vT7gFpM+3fHOR+PT09sZ4znFL/n8/8A9VJ1/UHn6Zz7inFX9P8AKzfzt/WgB17en+NIAQGyevfJ4z/ID/8AXwKRuhIY49ufp09+uMk9PSjqOTgH6eucdOv8PPbnO6nol6vXpZq2mvV9/LbTSrO3q7NW2d1+L/rXZ3Tpzk8/49P58YGBjihRtzzxngH6/j1z07/Xij8T/h6f/rPXvmlIHGOevPQ8nOOB29cj6nANSnrZ9bb+Vktbad1v80K/6X87ASOORyPb9Of8PxyaTv16dR/L6Uv4dP8AOaT1yBjg5z1+o/Lr6Ud35a212sr27+as2+ugv6/r+vMcCDjBGecnGR04yOe/+T1pdx45HHGCBkcD+X68ZpowAPlGe4z2z6j1B4HQYPrQ230wPf8Al+HIHt75zdtE13S016Rd7Lpps973Drb8tfu7hRn2/p6/54GOmO9IOPXv+X4+35+9IDxg++OxOOvOev4++ecCLf1183byGl/X5/h6eujFPbjIyAef859x/SjHf+g7c+mf88UYznnPTg+306Z559fpil7EfkRxj/P9Pwo2tbyvbotLfc9N1svmdF8/0+71VvzE55zgj0x/9elzmg+3JzyPQd/05/yMlN31v1X/AMjb107a99Bef+XTy/q4jAZBPXkegHTHtnrjA/8ArG7nr0Bz09u3J7n/ADikGC3TlhkntyR9VGfT6kDqQpOOw5PUdSeeMdD0+vpnpRdvW2qW/wD4D1fpfTW7ugfq9l/nbXp/SE3YIXaAWzuyB7A4IIPOVPrkZ4IIpSflOMcg5yPQfnnt7fhimhhjlSCM8YI4yCST/Ec5B5x0B4HCA/KxOcBSMk5JwOchRjPTkfmAM1fVb6Wu9r/C2l8ru1n10Kjo07aXV76322Wl/RfqSdQCeAT36547cd+n/wCqmjJJzyR9eB6/rgcDgYBwaXOAcZPtye+B19PTPHNNzhSw7+vb/Jz14z6nrfp5b7ra/wCv/D6jUe/Xbm0u3yu2m2j37NbN6uIJB4zjp7HjH5kcnj3oAAJbocYwOhyDk/8A1voeDSblxggtn06jn2446dz0p/HTrnIIA7c5PQZ4Ldemevajqu3X+v6/zEmlZprumt1eDs/lrrpb1J/XvnGO4Bz+mOTnr2z0FKBuwcnpgr2IOwZwc44+nAI5yRTQe4Oe+cg/hxn9fXrinAgNu7n19MjoRyeuef8ACpi7rXdPXSz3Tast72a6XZK7WT1vr8n1223102KMfOcfU89QcgY5x2zxzg54qT/Psc/5/wA55ZEDtJOM9xn0z0GemOfUdyRzUlRJvVa7Lrtsnfv2+d+on8/n6K/9drCf5/z14P8AnmgZJB/z/iM8H8we1L68f5x/n8uKOcgY6+/H5/j0+vpUpNva9t7NfnsH9d+n9eg3IJI54HT/ACfp7fUUv/6ienr/AF6dfXmj374oAwOp/Hr+o/n+VPRp2v0su92k+tul7b+th/O3lr8/yT1t+AtH+f5/5/H60nX/APX/AIf570evJ/Tjr/nnI/Kl02+ev/DCDI9RR16cevXP4f4/zo98YJ46jP0/H17/AIUmTxx9Tnj+p/Tj6c0466q1r2u2t01t320t33Gk3t+aX69xT/hj/wCtx2H9c8UnHOfbp2Oe2OTycZ9c+4CZORhfUfjnJ7+nc4z16cU7J9M844P5/kcj8O1aW0WnTv10fZ32tvothpWttq+/mv60118gPf8AqMjoc/4HnHvnIoOe3Hv/AJ/Dnnv3FJk+n6nP8j+Wc0o79j39u/Xp34989az+S0Xe/ZX316WWq6W3DVXTS09NNlfz/Jt63sIAQBz9c9/x9v8AClGBkgYJ56cnHH5njGSO/ek/PgA8dP8AEj9OMeopQQehz6/X2Pek7+dvTRX1V9vy6K2lha/5289Ve39fcLRQR7/l/n86T3z+A6flye/r9aNNfw/D9Lhb+vy+/p/kHGc9+n9f6UpppJHYHnj375/PA9z9RSDIJGFznPfv6deM9Se+AOlUk3Z9LdXulul/wbW+VxqN9fw76pP89/8Ag2Un0PA6/nk8egGfx4HoTJ656Akn/d4BA+nsRkZx6puPTAyMZHqfY9AQfr354pcsTjA6dzg/iR0yQOefXqDh6pdF1Wqu9r2b6PV9e2ys6UfT872ttdPfV6d9drC9cd8Ht26g9SPcfrjsF4P8j/8AX/wpDnjgfXP156enp9OmTQMEfz9+34j3qPX/AD6/1v8AqQ+luiV/169/Jb9tRaKKTHOcn6dv8/59aP8ALr+n4/8ADiAHP+R/QmlpPz47dP8ADP545+lITj0OQc+5A9OffP4DNNXurX8vw6Nrp9/pezSu0u5G6qSMAtgAkg4xyp4+mSeMAHpT84OV4DZ798jvnAI75XqPSgEHsAOnHPPccDGPfODx74QknggDqR0PfjAxgADPOCB6NxV9k1or3vrdWWr17vzS67JqrPRNOy33fbXtbRLTZLXWwpOQCcdTxn8ADj65PT0I5ozz3ySOcYxkY7/Tr/MDFBLcDaMdD156evcn8OfUGl5PpnHA+vTn8umDkZ6EVOis7O3Xb+7pa2ln5K+mtnoaJJ7p726L3d9LeTvv1fRKoBYdewPX6/15/D0FWUQ9VHBK4G4Y7YwDxjIAOO+DnOTTI1DdOeOQefmwCODgfUk8H1bitCKE4CjpyNuMkHjAwOepGQPbNKTUVZta9LK/R9Hfr5jjFt+d9npe7TenVNt9NXqPjiPyLgbu3Bz0GTyOT64GdvynGCa17WzaVkWOKRneREEccbvLNLIyrHFBGiMZZpWZY4okDM7uERGLAF1vbYKlTkgAsX+XYDtG7J4UBcAEuo44GOa/TP4M+E/Dn7HXwv8ADn7XPxZ0HT9e+LvjOG6k/Y++DniGCO5gM9rm3uP2jfiFo0yOx8H+GLll/wCFeaXdRqPFXiKOLUIw2nWSXQ+Vz3N1l1KEaaeJxuJqewwOEg0p4jESS5U7fDTgvfrVWuSnTUpy0ST9fLcvljKjbfJQpL2lavJLlpUk4t3XWb+CENG5OMe7Naz+z/8ABOD4cRapMlu/7ePxe8JP/Ylk6xTTfsj/AAt8TWe061fxEyLZ/Hfx1pUxTTLcqtz4G0Gc3Evl31yRcflhJcl55rm5uJZpJpZrm4nmlkmuJppZGlnuJ55WaWeaaVjJNNKzyySOZJGYkk9B4v8AFniXxz4p8Q+NPGOvaj4n8V+KtXvtb8R+IdYuHvNS1rWdQmM97f3szHDvNKzBEAWKCPy4Io44USNPYPgdoOjeG7PXv2g/HulWuq+Dfhde2ll4Q8NalGklj8SvjNf28l54P8I3Fux/03w34bWB/G/xAVQ0f9gaTa6DM0EvinTy/m4LBPJcLicwxs/redZhKm680uV1K0rQw2Cw0ZO9PD0ZPkpR2V51qt5TqSffia/16vSwuHi8PgcOmoR092C5XUr1ZK3NVmlzTavayjFcqijtfGN2fgV8J7f4PW4Nt8T/AItWHh/xh8b5/lS98K+Cswa98N/gy7AGW1vL4Pp/xF+Ilm0gYajJ4K0G8ghu/DepRv4J4S8N65428T+HfB/hexk1bxL4t1zSfDPhvTbdN89/rmu39vpml2sSZBBuLy6ghG3lCSwAA3Dldc8Q654p1vWPE/iTUbnW/EPiPVr7XNd1m9cSXmp6xqdzLd399cScZkurm4lkdFUIu/bGoUIo+9/2GJLb4T2vxi/bP1+0hltP2cvCg0f4TwXiI0OtftI/E+2vvDnwyht43ytxJ4Nsjr3xBvVUeZaroNjO5jWRGacVzZFkuLxLSr5pjZQd1dPEZjipU6GGoRu3JU4TlSow/kpQTn8LYYWP9oY6jR5nDCUIvmd3anhaPv1JOytdxjKcrL3pyaSszP8A2/vEmh6V8SPCn7OHgi/i1H4d/sk+C7b4Lade2TA2Wv8AxChuZdY+M/jNdoKvP4h+I15q8AuF3s9jpGnpHI0cUYT89JXJJwcEtjHLbc4y3oDjsOhHLEZrodV1G5vJrm5vbyW8vby4nvr28mdpJ7u9upjPdXM8jjdLPNO7zSO5JeWQtliQTzEjliGYYzgcHBIGOuPQgd8EADkDB9/IMsWV5Xg8LzOc4U17abS5q2IqPnxNaXu25qtV1Jyb3cno0zzc2xn1vFVq6XLGUrU4XuoUoqMKdNb+7GEUkukUut2H93O7rjOMn+HGTg9fY5/DOfo745lbX4afsk6X8yi3+BWtauyAj/XeIvjF8Rb4twDgyxQxljkswwxY4xXzaOCcseAWzndyp4B5xgY6/QcAED6G/aKcwQ/s+aZu2Npf7NHwxOwZ+RtZvPEniInsQ0o1VZDnjL5BYcm8whzZpksFtGtiaz6/DhpU00tHb96un5sxof7pjZLTmhSp9dnWpyXm17jezevdHzszKTgcegz1GfTHt6VEWIyAOhB/PluOSM9AcY9/RrcsGHTjjHUkL/dIPHbjA68k0fMTkc43LhivqPQZI9eewB6kj3lBRSS1SX2rb6au/V/g+x58Vaz0T1Su7X1jsr2f8u2l3rqWVkVgAeAABuJJz1PJ9Dn3wOfmBFfQf7OnjXw/oXjLU/BHjy7+y/Cv40+HJfhZ8RbhlMkWhWmq3tre+EviD5OV3Xnw18cWfh/xjE+Vll03T9W09XWLUJvM+dcsOigZPPJPOPz+uM+1SptY4cZRwUlA5zGwCsCDtUgg9OcqDt64rizDBwxuDq0GkuePuyTTqQqRcZQnBr4ZQqKM4vXVJqz0OnDVnQqQqRV+VrmTd1KLsmpR35XG6a2cfufYeNPCfiH4deMfFfgLxXZmx8SeDde1PwzrlqH81ItW0i7ks7toZU3C4s7hoRc2V1GTHdWk8NzCzRyKzZtnc7AgcDccEcghc4OBzk9D1xnByRjn6V+KcJ+LHwc8C/tAQH7X4r8IT6J8CPjf8xkubnUdK0eWb4LfEG9G8uw8XeBNHvfBmqXbqN+vfDx7q4kkutbiD/LyMWw2FBIHGADgAEDIz04yeCD6MM1wZfV+v4Je1SjisPN4bFQT2xFG0ZNLdRmkqkHLeEovdq++KprD1rwf7urGNWnJ63hK0rOyfwtcsrJWkmtz07QdRktbmC4gnntrq3liubW6tppLe6tbu3eKa2urS4hKTW9zBKqywXEMiSRTLHIhWRVNfv8A/GuTV/26fgd+zz8N28eaxeftbeE/gF4d+NXh/wAB6je21j4R/aT0zxNbapbeKbrRtOVYEb9o3TLfwqkhvLyWa78faNGbOGQ3whjj/nQs75YFAYZIGc5PBBHUHg5GOeeu7Oea+z/2hvF2s6Bqv7KmqaFq+paFregfspfAzVtF1jR7yax1XSNUtb7xNqen6jp17bGOezvrO6kjuLa4hdJUZQN2OvwPFmSVMdmWS1cJOOHx2GniK+FxDhCcVUp0otU6sWn7ShUV4VIR5WlLmjKNSEWfS5DmCw+Ex0K0ZToVI0oVKabi+VziueDvpOPxRlZ7crum0fL+u/aIrm6guILm1ntLia2ura7ikt7u2uraTy7i1urabbPb3VvIkkc8Eqq8UqujKrAonF3Q3r82MEgHA6gkDpnd1AUAZzngjrX6veJ/D+kf8FEfAviT4ueCNNsNK/bV+HGgSeIPjd8OdBso7Cy/aZ8FaRBu1L42fD7SbURxD4r6FbJ9s+J/hHTYN/iK0EvizSLY3g1K3l/L+5sPLG4gZ+8MjkDjIK9VYHcpU4IPOBkg/Q5Hm/1tToV6f1bH4RxpY3CTknKE1FNVIXs54eqk5UqispR0ajJOC8rM8BLDv2tGTq4asuehXj9uPuuz0ajON+WcHqn5NSfESoUckHKsDgZx/dA4UcYwOuRxjr0rqqknKkdvvDI7nuR9MckEVuTRRtwV5BHQZwQe4GR0Gehxt9CTVKS0kABQKVPIHPOPTbnrjP3sAYIxjFfWKpzw0gtdG766W6vW2666admeHqmlqpK1rRe2np5aq3lbYji+fjPJxglQe+CRnrnI3YGDxgA9dOGGVmyoJz95tmBxtyVyCMdOR2zjJrovh18PfHPxS8VW3hDwD4a1DxXr88clw9pp8cSW2m6dCA11q+u6rdvBpmgaJp8YebUNZ1m7sNNsoU8y4uogoB+vbC2/Z/8AgHbPDeLoP7THxstAyrb289yf2bPh/fpuQpe3ULWWsfHTW7F9rNa2r6H8NhOnlTXHjXT2mik8TM83pYZrDUaU8XjJ8so4eilJxTcbTrTaUKNO93z1JJNaQ5paP08HltSovrFSccPRi9alS0U7crtTiveqSd9orRO7drs8/wDgf4Z1fTYZfGmq6JrFjpWqIdG8I+ILyxntNG1u/jlU63BompXCRW+qXOnQGGO+FjJObFbhVuhE00Yb6C8QP4Tm0O5t/GFxq1noV1cQw376DBYz688cTJLIulQancW1nPdIj7xHNMoWNgzMsZL16l+xHaeJf2l/2tNJ+Kn7QPiC78afDz9nX4feNv2hfiDZala2UHhHTPAfwl0GTVdF8FaJ4RsoLXwz4Z8M6v4tk8M+H7fw7oukWWkyWE8lqltsPy/FGg/tE6/oHxC8WeOPEPhfw5498PfETU9auviH8NPEtuY/D/iLSPEWqy6rfafpF9bLHqfgvVdOaZf+Ec8T+GprPVNDu7eCSMzWsT2c3s5R4iSpZVmfCX9j0a+Ow+A9rjMRh69qcZ5jOsqdCnUqU054mnRhKfO+SOtO6UZJrzsdwmquPwmefX5UqEq9ONClUhJyksL7OTqOKlZU5yaSVpNPn1vG76PWNP8A2JcKZNY/avWXG4m30D4Q7GK7flAk18ttbaR8x9+hBrCtIv2FIyxl1z9sRAW4EXhv4IsDyMjEviVMKeTu4B69DyfG34UeHtI8OaP8Zfg7req+NPgL4xv30rT9V1aGEeL/AIX+MPK+13fwn+K8NoFtLLxXp8G648PeIoILfQviFoMX9vaB5clvrGlaP8kTyoGIPAyArbQPm4+XceM57BT/AMCIr57LsvoY3Cqvh80zR3lKFSnUrQjVoVE4qdOrFU1KEotWadn1V1JN+zi8XOjV9nUwWDTsnGUYTcZwly2lFuo01JO+mjvpY+yha/8ABP2QOs2u/tpN0YeT4b+Aykk4ySZPEzdcnH3+vIFIlj/wTqyGl1n9ubKngRaB+z2hx3w7663cEAFcA9c8V8XrcoSdzjJ45JyPrgDnnBwM+nQip/PiIUbgSQQeD14x1BGenTntnpXWsnkn/wAjPMnta9eDtt1dPy3+7SzOV4+70weDV97U5dOXVe/r227tqyPtaIf8E3o8h5v29rhgf+Wafs52QJ4x977bt4JBGT65amy3P/BOMDdBpf7ecq55D67+zlACQAASV8PzjnGCQGGRjIzmvioyJk5KjHcYx2zjgcHnJ/U8kRFuWAGEPJyeCScdB078fr1raGS3lrmOZSastMRZNWWqShHS1k9Fa6V0QsctLYXDRWjdqb97Z9ZPbvZW2trp9kPf/wDBPfc3l+E/245lHQyeO/2f7fIA4G1PANxt/wB1c4wMdeWjU/8Agn2AGPgH9tuVuSQ3xR+BEAPbjHwtkCjjOADz8wAPT42WTK/My/NgDBII7AH5snjPHvk8cUvmMDyQQCAMlucZ9T1GOMZH61byODtfMMz6q/1yattfWye3o9NNNS1mDSt9VwvlajH+7dJvXb3e34H2U+uf8E/sZX4aftoFgRtMnxj+CCAgEdVHwdlIz82e2cHGOKjHiH9gQEMPhL+2JcZYYVvjn8GrckAjJ3R/BGbqAckqR2I7V8dbnxlgSpzjHX3xlgR9SPyxwDgjJ2nGTnHXGATjOPyKnOOuK555BQWjzHNZX/lx9ZvpZe7NO1+9r66d3LM5WsqGES6r2EGna109NNtdevfU+x28WfsEA4j+Bf7WchGTmX9o/wCFUG7ptJEf7PcwAGDuHK5OcAY3RDxj+wgCT/wz5+1I+1s4f9p34cRnHy5yY/2dGwSCVGMrkAgA8V8e7lHIJyAcn5Rjk85z0HYn175wHK6YZSwHQ5I75A9P4uwAHzfplHIKF0/rmbtr/qZ42Kb06Kqr3vbtr6XxljJ3uqWGsklZUKe7ceii1tr31t6/YTeNv2FByn7Of7SxOMnzv2pPA4yDjn93+zuD68AkHO4AdBUfx1+xL1i/Zx/aEJyCvm/tSeFB8owT80f7PYPzBTyCeo47V8jGVc5yD0ycjAz78r7c9OuMYNNLAbi6kAZ7g5z06e23jAAOMkHFbxyDCxin9bzVuysnmeOV2+X3UvbK6XlvfS7sOOOmkkqeE7L/AGeg107xf36dOzPrQePv2NgmYv2avjaSrAgzftQaO24buMmD4ExckEnHAOcHBAFPHxD/AGQlB2fsy/FgncCom/aaiZsKFwW8r4NRDJ5BxtGdrAcc/JRnAG0J7k8fhnJbpk4Lc445zmlinbcWAyOnzDgjIA7gdzgfru5qamQYVxT9vmPk/wC0ccrxXIv+fysmra+TtfQ0hmdZP+FhrP8A6hcO7Jcj/wCfbs27tfLsj7Gt/iZ+yMnluv7LXxKcD5m839p27UHhSGzF8J48AEAkBm4xxzmvv/8AY4+PP7N3iSTxv+zhqnwG+IGmfAf4keEfGPjH4oaBrHxqPxFs9IT4ceE9S8WyePvh/ol/4A0SfQPilo1jpV5Loev6VqcD3bKmmata6lZTGJPxRtZd2FZQBnJJ5DcggjA5xgDrxkgdePtf9iuZYfiT46ulAX7H+zf+05OpJIAI+CHjCEEEHIcPcDGAcHBHOSfkOK+GsH/Y+MqKrmDq0aftKFSWZY2p7KvBqVKtBTryjz06ijOErNxa1PeyfOK0MbQjyYZQm+SpGOFw6U6bScoXjCMknG8ZR0Vt76Wt/tU/sr6n+z74h0WfTNdtPiL8H/iTpP8AwlnwR+MWhqT4f+IXgyZx5LyBCy6N4x0csumeL/C1xIL7RtWjeIq9s9tcTfFd7aiPKbWXLbWAHIYEHryAAAAOSTzlic1+lP7M37RPgjTPCGs/sxftJi/1v9l74k6jDfSX1lCL3xL8APiFJGttp3xk+HKGPzI2tzJEvjbw3B5dr4o0VLhJIjfRxed88ftT/s3eNv2ZfiPL4E8XPp2vaXq+nWvif4dfEfw85vPBXxS8BaoiT6H428HapueK9sL+0kjF3Zh/tek3vnadfLHcw4bfh7NMZhascmzluWOhBTwmMaUY5lh0ouNRPSKxNNWjiaS0uvaRXs5pKMzwdCvTeYYD/d5zft6HK+bCVesXfSVKbbcJO91eL95M+P7i3CH2YsMr3HAH3QR0469jzjgZbIScquADjJByOmT83AJBJwAeOOSK6m6hADEOSUGOOc7sd1IB5I444x3JAySgQou0/NgktjJyevXPAIO0jcRgDI5r7+lX9xJ3bXxK7vb8VZRWr17+R8vOm1JprTo++3y376bu3QpxoTt3dB07E9MklsHJyQTjHPBJwRq29u0nlnBBAGCF+Y4wACcHBPryB0yeBUaRZwAAG65HzY6YGSTjnsOcccNg16D8N/h/40+J/jbw18PPh54c1Hxb418W6rb6P4f8P6XAZru/vZmBDNwEtbK2j8y6vr+d4rPT7OOe9u5YoInYc2KxtKhQqV6taNOlSjKVSc2oxjCKTc5SdlFJJ7tW30SNcPhqlWpClThKcpyUYqN3OUm1ZK15Nt6dtTrPg18GvH3xz+IHhv4ZfDTQLjxH4u8TXYt7Gxj3Ja2lvFtlvta1i8KrDpegaPbJJeatqty6W9paozsXkaNH+yfjz8V/A/7P3w41v9kX9mXX7fWLPUpYYv2lfj7pb+Tf/GjxLYv++8CeEL+NjPY/B3w1eiW2igt5dnim8jkuLh57JpJr/rPib8SfCH7HPw78Ufst/AHX9M8TfFzxdatov7Vn7RPh2cSwzyRv/pfwC+DmroFktvA+kXKvbeOfE9pJHN4u1dLiwgkTTrd1f8xL673nYqBVTCqg6IgBAAAOBgHAI7cDgAj4fDUcTxNjKWPxlOVPJcNUVTL8HVTUsZUi4uOOxUdH7OPxYSjNX2q1FdwUPpqkqOT0HhqLjUx9VJYutHWOHVl/s1GS3m017WcUtbwWl266ai1rG2c4QEKFVTuG0qsaDA4HKqBhiTtHoPpb9qi6i0Q/Cn4OoRG3wf8Agv4cstft1chR4/8AiGX+JHjRpEGD9rt5vEelaPM5O8DR0jbeYFVfMvgH4Ns/H/xv+G/hzWHEfhlfEUXiLxfMzfJb+DPB9vP4t8X3E5BOIIfD+jXwdj8g3BW+8BXn/wAQvHWofE3x749+IeqEi88d+KfEHiaSPHEMeq6jLd21oueFis7R4LWJAu1Y4Y0XCoK9nEUYYnNqFNK0cBg6tdpKyVbExdCi7t/ZpQxKad2uZM82FT2eGlNycZYmvTp8214U3Cc09NVd0/npfofRP7ZVz/aHxV8M6xkmHxZ+zr+znruSzMs0lx8HfC2mTOD84JM2lyBySQrrj5gpNVviQs/xd+FHgH47AteeKPCjaP8AA34yndvuZNW0PS5H+E3ji9yWZh4o8EaZL4Xu7qRS0mq+C5JZJXn1JaoftJF9Q0z9lrxBIxddc/ZU+H1sWJJJk8JeJvG/g11LDgtENDRCSSy4C4GFFXP2Xtd0S28aav8ADDxpex2Pw9+PehD4ZeJ764ANt4e1y6vIL74e+OZASEWTwj42t9Jv55QRINFm1iBWVbiVX87D03h8jyzG4eLnWyjmpTikr1MNSm6GLpOyvJ+yj7SCSs6lKne9jqrTVTMMXRnJqGLfOtdI1ZKNSlLW97yk1J6NRk2rtnUfAb466N4I0HXfg38YtFuvH/7Ofj66gufFXhC2nVde8FeIFj8u0+J3wrvp1kTQfG2jK/mTwIq6b4n08S6TrtvPE6PDwv7RP7Our/A7U/D+r6frdr8QvhD8RbaXWvhJ8XtDikTQvGmjIUM2n30BeU+HPG2igpaeJ/Cd9IL7TrpTJF9osZILqXynxb4f13wT4m8Q+EfEVi2neIfCmt6n4d12xmJ32msaNey2N9BzztW4hkMUn3XTbIpKslfQv7Pv7ROl+CdI8Q/Bz4x6Dc/EX9m34iXEMvjLwbFIqa74Q12INFp3xP8Ahhfzoy6F448PmVp1MWyy8QWYn0jV4pre4JHXiMJiMBOOd5KlXw+JjCrj8BSdo4mE4x/2mgrpLFxjqtlXSUZNyUZLGjVo4uLwGOtTq0fdw+Ikv4T921Kokreyd0r7wbula6fxnNEDyPlAyArDBPOSCBhQcnjOSOh46UHVW5O0gjGCv8Jxkfjt6+wGCK+pP2iP2e9T+COq6Jq+l63afEb4O/EW1l1n4Q/F7RYnTRfGmio6iWx1GIlx4d8c6CWFl4q8KXzJf2F4nmxJNZSW1xN8xOCWI2j5VAGCMZz8wz04IyR93gngnn6jLsww+Ow9LEUKvtKU46O6ThO6jKnUi7ShUpzVpxmk4yTTSfunjYrCzw9adOpGUJJr3Le7Lmt70HqpRkmmnF6xbM1l25KDhmB5wQMY4+UHCg8E9ASSMA5DTx1OCR1AZh6kdD6ED69O1WW65A3AdmJG4gDAGfujrk+gwQcAiA542rxkHGCMc98Zx1Hrj3r1OuiTW7tby02+9X1s9bJX5X00S1jd7Ky5dLtqz0s+Z2ve+vuoOTjGPf27+x/l17dQpPpzn3H+elJx0wP1PXOQOPQHp9OKX3Hfn+X+frWd9tFpf5+rT1/re5F9Ftu9NfLz+XyA9Bxg5HHfnqfyznnue1Lge+fr29Mf56n1ppIBPHToTgZ45A5POeOOvvg4U9Rwc4Pp6jP9OQcYB60Wf36euz/VBtp6X/Nfpp/SX/P9Px4ppx+J5Bxnp3/L/wCtSkkYwM+uen6f06d8daTJGOM449zxz345HPUHjBquVaNK9907arTR+V9rrXmW40vK/bVdP+C1o/1uHOTgjGOh6g4Pfv0z64z7UA5HXuOcY44/XHTgZ9O9IdxGeO/ft17jHYc/QggUuSeCB7854OQM9M/r06DIwJbbeafLdJd9N3+HVlKOmtlte9ult7Wvfz8r3dmjkZ789eOnf09+O2R2p1NyeTjpnHOe2fU9fT6deoXnjHAPJ9f/ANf598+6eva/k+yXnb7kuyuS/lr222V72fT03bt2FH5Z68/544/+tmiij/J/+t/nrmp/T+vkSB/zz7e31/yRS8cfr/n/AB/kKac//qI4449v8KQ54GMjGTnGc849gfUj8KuK63S/4HK+rW7f9IaV7efmv8/+HFyM478f4/p19v0pCeMHtweD0J9iT0PUnuPoExjJADZwOfYn1x7cHPPXOOVJ9gfb6nH0wDj355xTTs9NNErLf7N1376eT+TtZrvdaXV/s+fm7bPrewZ/PAPvzntxnHHpx70gY8nt1564yfTp6ep6jOMUZOSOAOg5xn2GPbHI78Y9FBbuB19evJz1Pp0HoD04paLotbaN9Pd8t99dLa72HtZ27dWtLRvZ9um+l3p1QD2+o655547/AJnGe3svf/J57/TH1747UgAPbBP0z7/5/Mc07Hvjv9ev5dPrnGKl6vRP/K1tn1Wllv0tq9JdtbL8b+tv037ryKOOxzjjj/DtRwPx6c+/p/nt2xScDPv1o6a38vXT9P0F/SGEtuKnpj7xO3I5wAc5wobH3SMnIPzDDSRgsuCSCcHjnOOQCpBGccADqASM0pJ34XlcnPdc5GD2z0Ygkk9TkZGX/Mc/Ko5PGRyScjnHHbGRx3z1Fp2s3v5X29270Ts7arSy62WrvZKTstU7Xtde60mv73RK1rq6QMfTLEZOB1HI67Txj1529R0NAJJzxjHTjPIA/IHPoc/gKTJyOMHPPv6555wCCPTmjJx90DuM/h7deOhIx6d6eqW+u++mtk9F0ervbT1Fy6XutUt7aXaX3db9Bec5564x1z9M4Pr6cc5wMUo+uf8APsB/LNN5/ujp7YOcZHt9O9L1UjoeMH0wO3A6gj0+lUvX081pfa3m79PnYH023Wq6JJJdenW2l7aigY6cAdsjnn9eO/buMcABzkY78EdOOo/X9OpwaXIA5JGeM+v8vTOenTp1oA7ABgOMYIIHzHOOcg/MecY9SMksaSXvO9+azT1VtNdWrPXqrPuTDvjlexyDz0xwB06e2MewU8lVwSCQO/GT0H17cjk88clF6enJ6Y9T6cflx6cU9cAg9MHPA9Dn2Ge/J5qI/as72svnbV2dt397uT17WttfZW1XXbX8raIop1P0GefXOP8A9fUYqTpz0xn8c4/r+JNQwngn6An6Z9BjPt7HHSpj6+n/AOrj69vWper0V1o1p00Wn3W2a30Dtpvb+l/TF/z/AJz/APrpOo9/w/I9evH4UHkjkjHP1zn/AAoAI98+/Tnnt/QZPPtSTktvK68tNX07Nu9/ncNO/wAtdddtlbTz9H2X60Uc+3+evb8v6UdOv+f896kX9d/Ty0/4DEJxjvj/AAPP9O3WjII9RQce57cZPfnp+vr0o4GO3+A/z+f1p9rJt37afdrf/LpqO22927eX/Di/r6df6/j6YHGKb8uOfc4JxgH2HvgfX3pTjjrk89MHjqPU9Ofw9qQke59hyCDx09sH/wDX1cU9NX208radEr7LztpoOO+z6bevfpf+na4meAMYPA5xj29PTOMD27Uo7ZGBxycccenY9sfl3o4xwSeOvU8/mc/h25xgClPcY7d+mTng+o9abbet+Xor7rRN9Nfno9NL2QXe60Tt57W++z6dnsrgPyI/x+p5/HOeTQeo/Hj9euP6jp7UAYAHoB/+v8aWoFu/8/uu/wCr+d9Q60p4GDxgE4xj8z3zzye+c4HNN5yMDPr7D/8AVmhjkgHv9McdufrwBWl27bee65k0r33SS73v26A/+Db+tfv3EOQRgZ7Z/P8AEDpnqPx6g75IOcD9AP1PIHTnjrSkgD+o/L6cU3P905PfsTwfYZxx2/nSW3bXV6qy0f4+q792OPfVLTXW263fp6bIXoOmec464OeeeSfwBPX2wgwe3oD046fieRzxzjvgCgFTxlunUAk/5H5DOetINo/iPHHGfw9c9Djt+uW9VtqrJPVX23266rX/AIN3surata97tXV727tdfLe+q5BJGCOBnt+Z9h07HntSgjHr2B47E4/lwf69VyMHBOevIOPfJ9unr9KTJPQdR19MA8epwfb8Klu+lraLytounXTbW9n6WlNPTomra21069nZ2fRdNkOpCcA8Z/rnr/8AXpRz0/z9c9Px6Uf5/wA9KkgQn2znt/j2/wAfekOc9QBnB6+nr26jH8+1KTjP+Hp/Xrjt6+6ZBGRx1I4Hrgj05PXnPuKpJ206uz078vr1676fc1023sn2bt/Xle/YM4z6AZ+uc/5H07DGWkqSeDzgHoDx/Lp9PXHWnZHJz6Z4HtjtnkfX0HsblPc/gCe+e3B/w701psm9tn3UX/w+2n4XFO97N7Xd+6Td73vv8+lraID6DgY4xzznnOeuP8PU0pwcZB49e315/Hn1HXNGV/r39M/y9e3HTIo4zjJz1578/TsegGKd+u2i1Xa6b3et29G+9mt2ht2T20e3bTrvdt3vr2d9ReB7dvbjP5fX/wCtT1AwOoJ4AGfoSRnBHUDByuD1BpqDLDngEcFTxjHrgdxzngkZxgZtRxuVDIvQAZ44xjIIBGOhB57nvzRdRSd+ivd26R69N1ps0nokkEVquZvZPTR3ai00/JO9tklpa6JoYvTgHnpgnI5GOoB546jGOelbFrFIwynKjaCRk43d+hJCgEnPTrjOVqlbxORhRk8YzjJPpgFl6HpwcHBIHNfZH7LPwB0D4kN4p+Kvxi1i88E/s0/B+O21P4seMLVQupeIL6YhtE+EvgHzCq6l4+8azolnbwwLIdE02S41i9ESR2on8XNs1w2WYWri8RJtU5KNKnCLnVrVJOMKdKlTXvVKtaTjCEY6ubStbRehgsDWxdalQpxvKSUpTfuwhBOLc5z+zGKblOTtboru69G/Zo+DPgDwz4LuP2s/2l7CWX4I+FNWl034efDoTGx1z9pD4mWAEtv4O0fcu9fh9ok6RXHxB8RqjWsVqDo8EklxNNHXzh8dfjp43/aB+JXiL4o/EO8guNe14xWtppenx/ZtB8KeHdPRbbQPCHhfTg3l6X4a8P2CxWWm2UIUEJJcXJkuLmeWTc/aO/aG1v8AaF8cWutPpNp4J+H3hDSovCPwh+FminZ4b+GXgHTiE0zQNNhXalxqd0At74j1qRftmuatLcXcz+UtvHH8+ReXJLktgj5mJ4+XAOfm4GcZ5yOOMKuB4OT5TVq1qmfZ0msfXg44fD/FSyvBy5ZKhTezrTspYqsledRRin7OnFHqY/HQp04Zbl/+7U5J1qysp4yvFRvOTe8Eny0qbTUFeTvKUm+p8B+AfEfxN8Z+HvA3hS3jn1vxNqC2dq11ItvZWFvGj3Oo6zq10+2Gx0XQ9NhvNX1fUJnWCx0yzurmRgI67v46ePPDmvaj4e+Hfw2llb4Q/CKxu/Dfgq4kT7PP4v1e8uI7jxt8VNUtiFZdX8fazbrd2qy7ptO8LWHhrQ9wTSlA9LvRH8BfgrFbgPbfGH9ofw7505YFL/4f/s/Xc2IoRnEllr3xmurbzp2VY5ofh1YxRrm38Xy5+P8AZGzDBYBAAq4wMfLgN2ztxjGACSBk4NdeBtmmOeOlf6lg5zpYG93GrWjaFbFL096jReyXtZpyjOJhWlHBYeFDX2+IUalfVc0YaONK6000nNXd5cidmnZr4GGVHcgbREoLSSSlhsjRR993YqqRghmcgLzg19+ftYzH4MfCz4B/sd6e0drqvgjRR8cfjwkZG+8+OHxZ0qxu9P0PUcY3zfDn4djRdDt4XdhbXWqakgUSvIa4r9iHwL4Z8RfGgfEb4i23n/CX9nHwvq3x++JcbqPs2p2HgY283hHwkxYCNrrxz46n8OeG7W2fc1zFd3O0ERuF+a/iZ8QPEfxV8e+N/id4wumu/FXj/wAU6z4u12YsxH9oa3fS3r20Kn5o7aySWOxsolOIrW0giQIsaqOKpFZrxFQw3xYbJofW699Yyx+Ji6WFg0r3eHw/tq0k9YutQqJbHRCSweV1Kz0rY5+wp30lHD03CVSa21q1OWEddVTqRe9jibiZn+UgKRg46ljhdvLc8knA6E/N14GazE5BAI7DBBHIIJ3dSO554JHXGHszEgng9Bkg5BwAM9WzkdBj6YGIick4AJPJJPQ8buufTB6dB719tCEYq0Xrs3dvayei3bbb66aJnzjnzbu92lfRWVlsu179Oru72GSErHKw6rFIynsMKxOeOc8diewAGa+j/wBqhDZ/EXwlpOQP7D+A37Pul7cAbSfhL4W1KRVGcKBLqLk4XJZiT1r5uuB/o1wOebeUAjsdnXgg8E++fTBr6V/bCxF+0H4xseVGi6B8LdCC4CtGdF+FHgfTnTkDaQ8BUjHXqAM58jE3ln2VLaMcDj5fPnwSva/953fn56dlJ3wGJut8RhYuVlvao2tdL3T011asr2PmrDc7VwVAAyQW6DIIHOOPrx15FMT+LAbliw54wQBx0OAc4xwMfeFIpzvOTjK985POc9gB2OCT6kGlVhk9T0AA4XgnoAMAjb0JOOFzivekt7dUntrpbe+nyb01WpwqzWq5r2Tt8SS5ddHd31S1Tvfs0pMKc8Hp15JHqO4z6jqTyRwDUkcgwV4OX4xkk5IDEDng4zgHG4D0JqM7ccsTxx1PcnnHpngHPv6lScfMOoIxkc9eg49OO/T6mo3to7ad9NFs7NNW0aZUZJb3abSu1bl+G+vyd9fRPVv6f/Zi8VeHrXxlrXwv8e36af8ADT4++HH+FPi/ULgn7J4a1O9vrXVPhx8QJEOAJPAPxBs9B1m6mULM+gnXLBJFjvpkfxHxd4Z17wH4p8SeCvFFi+keJvCGvar4a8RadMMvZ6zol5Lp+oQZG4SItxA5jlGVmRklQsjqW5iMq6SRODskRgZMgBTgAN3IOSDkDGMjpwv1P8djP8Wvhh8Of2lYCbjxCsth8EvjrtBaaP4heE9GVvh9431DgNj4mfDnToorq7lDNeeKfBXia4md57sZ+cq2y7OFWS5cLmqjQq6e7TxsI3ozvy2XtqUXSlKTu5U6MVdvX0aa+t4GUG71cGvaQTcW5UJOClFJ63hJqXKrtpzl9nX5eEpVH2Flz83HLDBUnpnHqCDnIyuOcfWH7TczHV/2fIGJP2b9kv4DJtJ4Ak0TULna3YZE+fmwSQCBg8/Ial/KkJBzscYUgcoqsdxbuv3uCARnGDg19dftTRtB4q+DcDZUWv7Kn7OMYUcH9/4BsrwAAsCRi6VhnGdxO3OM8mYxTzfK4Ws3Txclqloo0U3qpSvaWu19LWRvhHy5fiZK9lOhHZrW7b0e6urfdfqcH8MPiF4v+FfjHwt8Q/h74k1Dwj418G6xZ694a8R6TMYNQ0jVLN/MhmhYblkgf5obu0mWS2vLR5ra5imtppYz+j3xg+G3gv8AbT+HHij9q/8AZ88Pab4Z+Lfg6z/tn9rf9nTwzbeVFppkKLeftB/CPR4EVpfh9rd4WufHXhmwSV/A+r3Et4iDQ7jzrb8kLa4bzAGYbQwOevAwMD8V2FiTkEg4zX0N8DPjX49+BXxE8L/FL4W+IZ/DPjTwpdm50+/jRLmyvLadBBqOi67psmbbWfDmtWjS6frOjX0b2l9ZzyxSp914/JzzJ69SdPNstaoZthYtU5P+HjKN1OWDxdleVOb+CesqNRqcftRl2ZbmMEp4LGRc8FXknNXvOjN25a1Jtu0lezV0qkdJWaTXkU2klGGVGHb5QgLs4cLtEW1G8wsCNqpuySAegFe96d8D/D3gzTLHxV+0V4i1D4c6PeWseoaL8NtDtrXUvjV43tJQHt5rLw/dOtj4D0O+Tb5fifxu9puikFzpGh64g2n9Fvitpfw/8ffBjxP+3B+xZ4C8NeG/F2lT2aftOfCp7ca/r/7MWuaiWVviT8G9AnifToPhP4u1AyXFtrtxZahqnw9umNpaSafBBNcab+Lur6lqGu6jfazrGp6hq+rapdSXeo6rql5NqGo6jczkPJdXt/cyy3FzNMfnaWWR2ZurEbRWOV5ri8/pThCUsrWHn7DHUm08dTrxUXOmotezpQb1hW991KbU6fLFxm98ZgKGWThJ2xjqx9ph6lmqEoSacZu2s5N3ThePJJJSvax6j49+Omsaz4fuPhv8NPDtj8G/g9NOkl34G8K3lzdav4weF91vqfxW8bTCLXfiBqsZJdLa9Nr4Y02RnGjeHdOUsW8l0xTG0KMSqs0exdvI5H8KgYGD91VJAA55qWK2XGc8MMjIOTnkcAj0HUk7QM54NWkj8kGVEdhAjy7EGWdlUeXGikjczvtVUDbnJAHJC178KOGwdGcKNNQTvOpNtupVdlzTqVZtyqVHbWU5N30fZeY6tWvOKqS5ryUYxStGKbWkYK0YrT4Ukl2R+u3wkuYPgj/wTD/aQ+KEzPbeL/2svin4R/Zk8GzAqtxJ8Ovh7DD4++J95bOAGay1HU7iw0G+8v5JJrOGKXOwAfkRq2yQOAuHVuD8vOCpJUdD34AJJHtX6U/t/wCry/C/w3+yb+yLC/2c/s+/AfSPEfjywXgD4xfHGYfEPxr9rXktd2FlqGiaeryBZUhUQ45QV+YeoXJfgkrwMjOWJ+UYOcEZ4yDyckEgjJ+Z4Mwzq0cwzmV5TzvMcRjKcpSbbwlPlw2C5e0HhaFKolpHmqtnqZ9WVOrh8FC3JgMNSotbJVpKNWurX1tUnJO715bNN2O7+Evxl174Pa3rLwaZp3jPwL400tPDfxS+GXiJph4V+InhYzi4XT9Q+zkT6Trmk3ONT8I+LdKMWveE9cjg1XSbkZu7e76D4wfBvSfD+iaR8X/hHqmqeMv2fvGmpSaXomvarHAfFHw78WC3N7dfCb4r29mFs9K8a6ZbLLPomrQRQ6H4/wBAh/4STw4ECavpOi+Au4JHy45G4Z4bkAHBLY3nIxyv8JHNewfBz40av8HtY1lTo+neNPh/430uLw58U/hZ4ieceGPiP4WFwlylhfSWxNxoviLRrsJq3grxppfleIPBviGG31bS7hWF3bXv1VfB4jCzlmOAhGNdqKxOGb5YY2lFR3+zGvGP8Oo7X+CTcGnDx4YmlWj9VxK9y1qNWzcqEny3vpd072co7J+9FXvzeHXAKvkKUOMKGGGGegxnBAVgA3IPJxUfmsMZbnqeOBkcDj059DjHOAc/Q/xr+D2k+GNH0L4ufCnVtS8b/ADxxqE+neGPEmorD/wk3gTxPDAL6++EXxatLIJa6N8QNEtS0+m6jBFBoHxA0BYvFXhMm3/tbSNB+d2UDgk7mBO0jkdMAgEgYJ69B2zkk+1gMVRx+HhWp9G4TpzVqlKcWuanUi9Yyhs00tddU7vzq+Glh6qhON18UZXupRly2lHlveLTbvp80mSfaDzuIPXkLnIwQO/88cZJ7gN89sDd6jnZxzkHrt+bORjsepqLhcAjLdsDnn3PHQZzx34wBl24HPrySPp6c9R1x27967naOii7Pl1vvZLbyfyWrS0RPNtHS+l31S91JJba7b/MXzSACFGARjI4HUf3gB6Yz0JGM4y/zy2dqISOMgNknA9SQD8x/H6cRHGOp459D7duPy4x2xQvHQDHrz79PXPvxjoT2E1u7r8H9nq++lm9Hs/OHN7X2fR3T21ffVaaJXu0S+a54zgjoQMD8j9eWz6AdyELuc4bk9zj/DsP/r0xcjqc+/fPfn8sfj0o7/5/Tjms7JbWu93bfZ+trrXVeVjPZ9Hby9PR20AyTZxwff2445Prnrjr35pPMb7rtyT2AwBjjoeOff8ALINGWyOOO/8AnGf6Ec/RCAQRnA/Ln8ufz7cd6pW00Wy0S2V1vvqu3462Ku/du7pWatbS9lrp00017dQ3EE4O3IGTzkgc8ZHAHc457AkU7zGA6HkADp78evHODj+lN3L+R/Lrz9PTHTjpQSMdD19xjg8j8OfxzwaHbRcr0avfW706Xtta3rtqmno7Kz077vWK7q2lvLt3F3Ock7iWHqPfGMY655AHpntUqNuzxyxx65bOAc54z7DrzUJ2gdTzk4OeDnB/2ue/4/io6Kc56Dbk7cdMEfxZJPB6EA9qF7yavZNpJJWf2Vpuly721Vlro7FRlJbXs2kujurJW3fTZuyaWtzWhnYLg5Yr0xk9SPzXIHYckbuSDX2D+yRqX2Txb8VbknH2f9l/9oxs8A5uPhpqNlyc7sFbrB2854yDXxmj4Cnrgr26kYOT6jnr7emc/T37MczLqXxznJCiD9lz41ZGc7Vu9J0mxIwBjlbsLk7fxzivmuJaTnlWKgleMoxi9dXeUFJ+t23b/hj08rajiacrPm1fZbLW1+l23pey36nj41V5ZCqli3AUNt2lTtXAX0IBBGcMCD1GK/Qz9m79oD4dfEL4aL+xh+1tqckHwhv9SuL/AOBfxnMX2rxH+zB8QtSZV+1ieVXub/4QeJ7kxweMvDSyLBpxf+2bJYXglkh/M6OYiQjABGVDY57DB3DJyefcDGQcLUqXDLIDjcuMEN8yupwh3FiB83TPKkcdRmubNMno5jgqNKfNTrQVOrhsTSdq+Fr04x5KtKS1Uk9HHVVItwkpQdjfBYyphcROUVz053jVpSt7OtBtc0JRd731s0rppSTTWnuPx6+BnxB/Z4+Jmv8Aws+JGlpaa/o7xXVlqdlI134f8VeH9QQTaN4v8KamVEGseHNdtGS7sb+2ZlAeS2mEV1DNDH4fJb7cknIzxxjknk8KOoI574HIzkfpt8APiN4K/aj+HWgfsg/tGeJbPw5r2hl4P2T/AI/a4+V+G/iK9Ylfg98SNWkDzXHwi8YXLRWum308jt4H1Zra5iA04ywR/I3j34E/E/wB8TNR+C/ivwJ4g0z4pad4hi8LS+CFsZr3Wr/W7qVIdNt9Ft7VJzrNtrJkhn0S/wBNaez1W0uILixnuIZI5X8zK8+nQnVy7NpU8NmGDp+0nVly06OLw0FpjKDk9INWVaCd6M24y0cW+3HZUqqp4vAqdbDV5RSivenQqOzdCSXZ6wbtzJK1ndHjXhfw14h8a+JNE8IeEdD1HxF4m8Rala6PoWiaTbvd6jqmpXbrFb2trBGrOWZjl5G2RxxpJLMyojsP0k8WeKPDf7CXgjxB8FPhXren69+1T410qXQ/2g/jNoVzFdWvwg0K9jA1H4HfCbWICSuvTo4t/iL4xspFnt5kbQ9MmSeOWWy1vEMel/8ABO7whqXgLw1d6dqv7bXjnRjYfEzxtp1xb6hZ/sw+FNXtv9I+G/g/ULZ5rZ/izrFlOi+LfEFm7HwrDJ/ZthKLxGmH5gXMrbmLO7F5GmaSR2llaSRy0sssrFnllkZi8kkjvJI7NI2Sxzyxc+K60a0+aOQUJxlRptNPNqsJRarVE0v9ii1ejBr/AGhpVJL2SgpdEowyalKEWnmVSH7ySaawkJJc0ItafWGnackm6eq1k5JNubsqEijAEKhdvAym3O8kZx83GQx6/eLAsWyZLgl+H+8SSQPlH3eOpORkkgAnncMgVDeTANtUnATnG7K4yOik8+mOcAHJFZm9yVVCozjbuOAOQeGIwAR357AY7fcUYQpxSSsoxWkkuXljy2sktNNelk9ex87VqSlJLdtq95Pm3i021rdrrdt66RZ9WfCGH/hEvg3+0l8W3XyrhPCOhfA3whcE4Y+JvjBfsfEr25C7hcWfw58O+Jo32/NHFqoRztlBPypEAiBcYXbwMDgAKMAHpxwRn1U45r6d+I92/hP9nX9nz4XqTFfeNb7xr+0L4shKhWYa9e/8IB8OoZxtDEQ+GvCuratbDOwweIlmi4my3zcIlGQQMcg5HBO0cYLEjJO3nhRweleNlUZVpZhjJe8sVi6kad18NDDcuGhyv+WU6c6qukr1W1pZHXjZRhHDUbJOjRpObXWc7VJcyvfmimovr7qVlqz6x+M0Qv8A4DfsWayEBa3+GXxV8JvKrKzH/hHPjV4o1CKNgTlTGniRWRR0VhjBNfNCzAB4pC3zDCMhAeNwEMciMRkOjgOrKQysN3XaT9OeOyLn9kX9ma9BB/sb4m/tF+Fn4G5BO3w28TQIx6hc6lPIoz1ZiFGTj5QkfkjPzcbeAB90Yzg89c85IPPYVPD8FUy7EUJNcizDM4ST960XjqrSs9Phafa2nVXeYy5cTSrJNuWGwc4yV3q6FBt22evVrVpeq+svj7ct8UfBnw8/aMtv3+reI7WH4a/GLZtLQfFPwVpttbafr96AMRv498GQ6brImY7rrWLDXWb94JWb5ME7RsGyrEEDOSCpGOhGOTzk54BOQTjH0j+zrqdl4iu/GXwC8Q30Vrofx30m00bQLy8kRLTQfi/4fmm1P4X62ZXKpaR6jqrXPgrUrkttGleKrt5CqwKR8yajb32mX97pOp2dxp+q6Ze3OnalYXcbRXNjqNjcNa3tndRSfvIri2uopIpkYBldWDBSprsyP/Znicpq2awsvaYS+t8HVa9morTSjNSo2V/cpwbTU1fHGv2qo4uEmvaxUat1qq0OW99EvfVpLRe8/JH1P8DP2h9M8CaRrvwk+K+iXPxD/Z4+Ic8EnjTwQsqJq/hbW40aKy+JPwxvpVdfDvjzQVfessGyx8Q2SyaRrNvNbTDyuX/aB/Z+1L4MajoGuaRrdv8AEP4M/EO2m1f4T/FvR4THpPi3SY9jTaVq0OW/4R7xzoW5bXxN4XvHS8s7qJ5oRPZSQ3B+dVYbgcsTxg++5SDz1yemRxjjHWvq39nr4/6b4B0rxB8Ivi7oVz8Q/wBnD4jTwv418FRsE1rwhrcYeOw+J3wxvpY2XQfHXh4SG4Royljr9n5+j6xFcW1wCnLjMFWyytUzPK6TqqpJyx+XxaSxMVbmrUE9IYuMVd3sq6ShN8yjJdeHxVLHUlg8a1GSSjh8Td81J+7aFV/HKlJuyvrB3aVj5PkTgMFKjngjkYHQj7xJ6nrjAHc4rsoC5APPoDg4wcjHU845PYcYHP0v8f8A4Baj8F9W0XUNM1y3+IHwj8f20mu/Cf4s6RC8ei+M9B3oJLG+hLsdB8b6EStn4p8K3siXum3qs6JNYzW11N86yRZ6jhhweOBgYGM5wDjcCTtB5Jzg+5l+YYfHYelicPNSpTWstpQaa5oVY7wqRknGcZJNO6cU7nkYrDVMNVlRqx1TT2dpJ2fMmk4yTjrGz1T7vXOKhQSAAvcnb3A647cnlsAdjikqw0ZxlunIIBHY9CM4z0ILHBHBO0gVVdGVT8ny5wo5xgnv8uDzgYwD1GADXoWTtZ66X2dtt7279nd3OVRu4rrJpXt0e3ZPfv5adUOeSQC3HQA5A64yQenGOmTk5yaRiBldrHKlsL1PIyPvD36dc4PGKQnsGJIJ5GW4zwCFGM4Hc5643dwuRwOc7iPm9WJ7c99vBxjBz03NRejs1q+9rK1tdHp0899iop3Ttf1bW1tdWk11STu+ytZO3ZU46jHH3sfdOM5zzzg4BGMcdjJ4yCffHHb69CPX354pPk68jGT0wecZHTdjPGOuO2AAD5cnDE49c9c8YPOQeD35HGQKFazutH5PbTr62+7VvQelutnsrPTbTTu9n3vq7juvYjqSMdfbHfP58ehpMgjHIzz78kc9TwSf50vHqeuc59z+Q7EgD8smlI6Hj8R/nn0qW1vZp9PJq2mrd7fL02tN9db9Ot2r2bWqd7Nf5icnOD+BGPTp0znPqOQeRjBUHP8Anv8A1pTR0Hrj8zS/r7vlbX/h/OP6/K/5BSDOfQDOPf8Az9B2wSCaAc89u3+f0/D3pBkE5PfgZyR6Z9OPX9D1dlZ667Wat1XW+n+Vx2eu2i177rbz79tmKeT37/48nqfftnqOlIT6gjn07jnH/wCrII6GgsPU9O3vjnnj060mV7kjrjg+v09R+Genamk/ddm1prq+t9uy9P0KS1V4vTbfpq9H31stN36oyMg4IPIOfp2HrkY49weSKUk+h4+vb068/oeATnik3KPX14HtwvH0Htx1NBK44JGPlAHXnr1+nH8yRy+2j6JNrbbV2t3svPs07uyunrrZenw2v+GjfmmmBbHbOM/h69M8eoPPTjpQTgdCflJI78Y6g4z3Gf0OadnGe/f+I84GBjHHuAOOuOaPoB/Lr1qW1pdffu721avfu1qlr63nm2bV7efa2vW3ytfz1uZwcZPPXg9Dx19t3HPGT+B9eMj/ADzS8/r9enr7H8PY5pM5JA7f5/z/AD9DVqytfRddnypL77u3dPYXn9/Tt+r6fchcf5/z16/rmmk8dM+2e4wcdO/b8M9cUMQMZ9COOvOP8Mf5JpODwCR79ic4Bz0PTjp6CnbZtO11qk7dNmrO67LZ2SQK+j1tffW1v+B6gGB6KeBkevpwPTrz+HpSkjuM+uBn0zzxwMYPr07EUEqTj36d/Tvj8hyfpmkyDnkgDoR6c57euc+uPamkm/RbWbt8K10WrV9l59Fa0t9GndXV79Yu9+nX8ewZGc8+vTHAHc+nb1zjtilyccA/ienbOefT+vfkGOmcnPP+GOuP89M0ueRjJ4z0xwf5HI9cY/SW1ta9u99tFf0aVvxVr2SbStZXtbfpa3a3zbXl5CBuuRgDv6+nf/8AX7cCnLnJyR1ODj+mMjnoefUdKKUY7gc89fz7eg/Lt0q4ybbstWlpsumtkt3b5t7dUtOtunZ7cvV7dXrp09E6gkcHnHH1BPHA/rn8C4k4J6Egjnk5OR6kjJOOc88EkHhuQQBgdwCOuR6gjoOuec9OmArgQu8cNjPGACCQxJIwADz2IwMHuALt/nrppp/n+JUbq11s07PteF7dLfj2u95R9ev5f/q/H8adjOQOAcjcf4eV7Z9D/iTwKZ1xyR64/wAj8jjoeOOJEIAA7DnpnjK9xngAADoRzjPGZi21319Oqu+m+vS3R6kLvez/AMmt3+NrPbuUEYMnyqVXJHToepOAeMMc4985PFPOcYyAcc/Tue354/LsiKUTaTnknjv39PwGfz5p/wDn/OKhuzV0rLZLps77u99lrrv3Dov610vpr/k+y1EGcDJz7/y/T/JpaT/P+fb/APUO1L0H0pLVqztfR/rb138n94v6/qwZ9/b/AAH8qPyH+evoP/1Udv6f54ppIJC5IPt16evb8M+nFJK76fO9vw/H8xpX7+b16W7fj66i49OvHXnj37/r1pDkcjpnkfXvnv19x+VLggccn34H6dB7D/69Bycdh3GM59u/4/5NCst9V5/K/dryff5gvlb567er9NO9gIyO2e34gj3x9Dn6HrRj0wDz6ngnPqPrS4OP5/56YOD0Hr0oyAPU9uvof88njHPBqkm2u1r9Wmvdfz2Wi67aBd2tfr5/8Nb/AIIn5d8/59+9Icjp07468+n86d3znt05wf5e/Q54GeOqEgfj7H/6/wDj9abjJ2tps7Xs07LW3S2m2uvpYXTr5fn+XTy6oWjP+f8AP5fhSEgfifc84/8Arf55oPTjn34//V/PHoelRa/lfRdt/wAl8xW28+r2FpvT69Bnv346Z69BjB9sU7/PX/P+e1Ic8YH/AOrv/n2/Aieq9fTqt3rpp+o0/wCvmt+60A+546Y9fr/h7e+KTjHbHB9B157Hj25OcilIz7nHQgf55x06EgdKaQQBx07duePXJx3znqapdNeqVvRKz2ur9HbRb3KWy13e21vu1u7JXV7a9WLgn0HXOecjOf15OP8AIXGOfQcnHXv/AInH1oBBHGRnPPQ+n+Tz+lL27+5/l+PHb8BxTs+uvK9befLv97u/vZLb0v0081/X4eQh9cdufw/D3P8AL3o9uefQ8/hz647gUvHHqc8ewx/jQMH1/L+ff68cVOt1prp1tdaWSfe3z9Bfn/VvuCiijr0x/nn/AD60rfhrr8v8wEY4B78dP5+vT6UmQQdpAJx6evf17+vX6UoB59cHv+PTPb06470AY7AHvjp/n0z0/QtWW6fRq+zXW++naw1ttr36O1nZrr+d7ABj0yevv19ue+Tx09OAAEZ+oxj0GPxz68n8uKQ8Djj0x056cdOp98+5wKUDPXOff1/l19OOBjoMGtm9O3m9ui0tt2BbX7u3n0d0tBcAntz1z/Pnjpx69qcqlu2Fzyfy6YB9Tn0445FIuD+fTHuOOox+OKsIFyQQcNjIHtgHgdsHPPuQOTT2+PZLS/y6bWtv876oejtr+G9rWWul7enm7MkRCSNowVwScde2c5yccfNzj37XoY2yMKRggkMCCehJDAYxxkHnjI4IxSQRGQlAuMleeTjI3LnJx044Gepzzx7Z8Efgn8QPjx8RPDfwt+HGjnV/FHie8MMQnZINL0fTLYRzap4m8Rag6iLSfDehWayX2r6pOUitraHaC9xLDBL52PzCjgcPVxNeUKNCjGUqlScrRhCKu5OV0tEr76tto6MPQqYitToUqc5VKjjCKgndylypL0ev/pSfR737Ov7P/iL9oHxu3h6w1Kx8I+D/AAzpVx4s+KfxM10GHwv8NPAGmlZdX8S61cMqqbsRobXQNJDfadY1eS1s7dXJlKdt+1B+0H4a+IkfhT4NfBTTb3wh+zN8HRc2nw48P3hEWteNNduR5eu/F/4gqnljUPGvi6VXniE4c6FpDwaZaiEm5Dd7+0x8V/A3gXwcn7IX7N2rDU/hH4a1aLUPi58UbZBb337RnxT0vMdxrc0qkyx/DDwldi4sfh/4f8w2twsT+ILlZ7ie2mHwHKCc5PcfMT8pHHOOTyMDGcZwvU5r5TLMNWzzF087x8Jww1Nt5Rgait7OE1b67Xp2/wB6qxdqcJXeHptqyqVJpe9jK9PLcPLL8LKM680vrlePVxUf9nptaulB252r+1mv5YpkrzfKAGySOGHQA8k4TIB5A46/wjtXvvwD8GeHtb1PXfiF8Rbe4b4RfCSxtPE3jiKNzBN4s1Ce48jwf8MNLuCQF1f4gazCunymPfLp/hyHX9cZdml8+D6BoGueLfEOjeFvDGmXOteIvEuqWOh6FpFmhkutR1XUriK1s7SBMZ3yzSpl8r5S7nfCKzD3345+JdE8O6d4d/Z+8Aapban4O+GV1dXvjHxJpkiyWXxK+Mt5ELPxV4pjnXP23w94ahT/AIQ3wMHJjXSbG+1iJVl8Q3W/181nVrzpZXhpctTFRvWqQb5qGEXKqlS6fuzm26VJuz5pOa92nJHHgY04KeNrWlGlb2Ud/aVnaUINP7MdJT00Stf3k15v8RviN4h+KnjnxN8QPFc8MuueKNTfUbqG1iENjp1uqRW+naLpNuAFtNE0PTILTSdIskVI7LTbO2t40VI8VycKGVhjYik5O7aCF4yxOTjB7njJX+DJXKjChlxklj06hf4iApGByQMk8gcYHT6Q/Zi+C8vx++Nvw8+Fv2r+zdK8RawbvxlrbMIrbw18PfD1rJr3jzxJdzbtsFvo3hXTtVnEkjeV9qW3hYlpFB3xNbB5JllSrFKlh8Fh5TataMadKCcUla7fKrcurd1a/XCnTq4/HU4L36lerCL63lUaTfu3trrr2adrO3uHjmJfgN+xV4B+HgBtPiJ+1z4ht/jX48GfLu9O+BvgC8vtF+D/AIfu1G547fxb4qPiHx41vwk1pp+iz+WwCkfn9PKeQVBHQtnsCME/Meg243E4ByOuT9L/ALWPxmtPjj8c/Hvj3R7X+zvBjX9v4W+GuhBGS38O/C7wZZweG/AWj2sDALbpb+HdNsbq4iAX/Tbu7mdd0rLXy5IwDBQcqFB69+OBgHvyRncCdvvXJwvg6tLL/rWKhy4zMqksfi1tKFSuoezpXsr/AFeiqeHT6qlF2s7vozzEQqYhYeg37DC044enJbSVPlUppvbnqc02k3Zy13I2JLHLAjsM55wCRwccdDyc44ODSAk5yCBkAd+3HQf1PfmhfXB598eoA+gHbpz+NIGJz7cZPP4dB/j/AE+mhFqLv2TbvpfT79L9Pkm7Hhbf59fw79dCe2t2vbuzs1wzXt5a2gBPJa6uIoVH1JkAHPVh1r3/APa8uUuv2n/jwy7WjtPiNrWkRlTuAj0RbPRUVSRkoBp6qBjIAA47eW/DTTjrHxK+HekbQ41Px94MsGUg/vFu/E2lwFcDJJKuykDqMjOeu78dtR/tr43fGXVF5GpfFb4hXStxtKP4s1MKRxj7gwp5GB0215crSz3DLrSy7EXtfT21bDON15qi7+n3ehG6y6rv72KpvTZpQldtu/Sfyum9TyUbMnJ6n06AEc5xjnJHfIPqc1KDu34GB82eOSMknDA8ehzuzn6mkVRngDBwSD0yuBwM/wC0T79sdCqENj7yg7uxGeRyRjI64zwRnOOhr2pap/K+y2ev4a6776nHJxasrt6czb+zaOq21urLfq9bq0mMAe349e2cdPU46U7Pv79vz9f6fpSAgjI5/Ojg/wCcEf4Vk731v5keT9PTW/8ASHBmAxyAc5B6HI4zgn8+vTqMY+mP2bfEminxB4k+Efjq/h074a/tA6Fb/DnxLqd2f9C8IeMI71dS+FPxKlG0iL/hDfG4sDq1yu2b/hEdU8UWQfZeSK3zMvUAk5JGOnJzwPTpnrx68HFXECuBExOyUbJTjgJIcMQASoOehGDkZUHAJ4czwccbgquHk0m0pU6iV3CrTlGdKpC9/fp1VGcW9OZLe3KdWErvD1qdTlvHm5ZK9uaDtGUH2TjdN9VddNNbXvC2u+DvEXiTwf4p06fSPE/hPVtb8N+JNLueJdO1nRbqXTdStJFJO9ra8t5YhKPlkUiQHZIpP1Z+18oh+Jfgq0H/ADDv2bv2YrLbx8rL8FfBtwV/hK7TOSwJJ5P8VZ/xkgb4q/DTwf8AtG2zi78T20Vj8IfjvApLXZ8c+HtH8v4ffEK7jX5/s3xR8BaclreXzxsLnxr4K8T3NxK1xqlsJeg/bVSNfjk0MW0pZfCD9nbT/lPAe0+BXw8WRfQbX38YwrAhhlTXydLFTxubZLOpHlr0cJmdHEwUH7uIoVcDCaTe8ZX5oPTnhKMkrSue5KnGjgcaoNShPEYWdLVO8KkK8481m7PRKSV7Si9mrnyJvKu3Q4OB242jHIycYGfr2q/BfyoUBfkfiQFxnnHPqMnrgnpznSpsLHgFjkHPoeO3t0xzVTzSrAgEk9fvcFvxAJP0z0PTNfY1qUJwg3fVK+ytZx0dr7Oyts9Nb6nhX9nJvq357Xi7vok7K9mtEfT37PX7SnxE/Zv+JmkfEz4d3lo1/a215oviLw3rUK6h4T8e+DtWi+y6/wCB/GejOGtNa8Oa7ZO9tdW11HK0Mhiu7Ypc28Tj6V/aS/Zw8BeIPAlp+2D+ynY3s/7O3izVrfTPH/w9lm+3+I/2YfiZqB82fwD4lC75p/AesXRlk+HXi6ZPsl7YmPSLyZdShi+2fnBaFXddxG0kdCODx2xwM8g9cZwCTmvtL9lH9pzxN+zJ40u9a03TNM8beBPGejzeDvjD8JfEQabwf8Wfh9qQEeqeGNet1BFvdxxO174e12BV1LQdWjgvrKRf3sM/wud5bisNWWcZRCKzGlFRxGHb5aWZYWLTdCs9Eq8Lylhq1n7Od4O9OckfR5fjaNal/Z+Nk3hqjvSqt3nhKzcUpxtdum/+XlPRNWlFcyVvl8QiJirjbjAAYgE5xg+nAYdPlIPXBBr7B/YT+DVn8dv2rfgf8PdYjiPhb/hM7Xxj47knUfZbbwD8Obafx54vmu2JCpazaP4fmspWcCMm8jjb5mwew/a1/Zf8KeCdG8JftH/s5avqPjn9kr4x3dxB4P1y/wA3PiT4TeMokS41n4I/FQQArp3i7w4xkXRtTuFjtvFmkRpqmntK8dzXf/sbk/CH9mX9t79ptne31hfh34e/ZV+GF27BZf8AhM/jzqPmeM7myfk/bNF+HOgao8rRFZYIdQUttWT5vJzbPaWM4arYnATccVjJU8sp0p80a+Hx+KrU8J7KrTetOtQqVG6kXrGMXK9kmdeBy6eGzeFPExUqFCMsU5J3p1qNGPtYzjK1nCcUrNW1dtGz4i/am+LV58ef2hfjN8Z7syFfiH8RPEmvaYHJH2bw79sax8M2aqQDtsvDtrpltGCMIIFAAxgfN08jEkcYwCeF3cAKDw2OMA4J6HPFd1q1uhfZGQFRAnsCoA2jIA5G3IGMkAgkCuHuo8NleNv3yQTnOMjj36c47Ywa+7yjC0MFgMLhaMXGGGw9GhCPSPs4QgrXtsk1130vufOZhXnXr1ar1dSrOpKT7cyeu99HsuvrdZ0k6k7MEFclt2BnpjkknOeRwe/TqKRlbzCGGVzyWAxjHTJGR04C5IJ5GOktwoySu3P8P1AJOM+ox+JB5HFVACeDyOCc9uD0znPPfvjpg8+9GMHBPRJuTt13TaXS3TW92ra2POTdr6LTfqvh03s3b53ur2Pafg18Y9R+FOp67a3uj2fjj4a+PNPg8O/FP4W61PJDoPjrw7FObi3xPCjS6B4u8PXROreCPGmnIus+FtcVLy0kltJtQsL3oPjN8GrDwbpug/En4aa1feOvgN48uri18F+MryCKLXPD2uW0QudS+F3xOs7UG00D4leHoW3SRxBNK8XaSkPijwvJNps9xa6f89KoyCeRkDGeCQc9AAPQ+xw2c8V7h8GfjVffCu91/StV0O28ffCvx9ZW+ifFX4V6rcPDpXjDR7afzrO/068SOSXwz488MTsdT8E+NdOiGpaDqkZP+k6Zealp974mNwlfC1XmWWq9Wy+t4S6jDF01yrmivhjiYL+HUaXOl7Ob5eWUPQoV6daEcNiHaKX7iu0r0puys1d3pNu0orZtyj1UvEdny4YbXXAwfvbjjPBXDYJ5IOMZ5yCQ0ckAjnHsT/PnnHJ9vSvob4z/AAWtvAdn4f8AiN8P9auPH/wI+Ikt2Ph949e3SDULHULRI59U+G3xFsLcNB4Z+KfhRJETVtLytjrtj9n8TeGnvdFvo2g+fACTkrtJGcEAEA+nXB6EEepB9K9PA4yjjsPCvQlzRfxKS5alOcbc1OpGVnCpBpqcZJO6adne3HXpToVXCpG7Sunq4zTSalB9YtO61atfa5XXKMQxJ3MuCfQ+nXoODxz7gcyDvjPHXr/Xp19+3PQBGXLr2xn+9j5Tj1K84wc4OeTnrS9f8jn+fFdUn0a1Vtdeye1tLrRWs7K2i0Od9Pku99OttvyW2+gY4x/9f+ef1pNo754xjBPb2/r1PPTilPUdRj9fb/I+lL9OKm7W3X+rX+7+mxp/Lz/rX+vMaGyAcEZGcY57fh3H9e9BwcdM9s9/TP17E9CfXim7geVI7k9RkZAGcDPHYkAdtx5pQuQcNnOR6454wvJ4HQ98ZANU1Zp3eq0d0mtlr2S7K7+WqbTSXRdbqzWyd32fRW+/ouBjGR6D2OOMZJ59ORxS4OMcfjzgenbPoOnH05b0JLc5OAMEgc/l6H14PcU7IGB3xkAen0H5c8jp7VN3prqm+i3vvfrtv+gNtW8tem9ld+fr17sAPrzjrz0x+vH50YHTAx9Px/SlpOBzj3/+tx/Id+etC369LW3/AK7bk31v/WmxYU7ug4bjnHB6gk9DxheDkceua+lv2cSYYP2irkj/AFX7MPxGiDdABea74KscbgQMsJ8D5j2UcDA+aI9xBI6Z47HPrjrnj64HpX0j8AWZPDf7T9yDgW/7NutqxJIAN78TPhjZc5zwRPtG4hcFTgjAPicQNvL5RsrSq4aHW75q9NW7a317vTzPTy1v61FpP3adRvrtT5ne7vZdl9587yMQ5w+V3PkAnIG4fKdwznHYHGB2NWbWYsdrHBONxOOcdhk88Hg9+RgcmqDBi7LxncSSOc8jaOfTLDgDByT0zU0cZGTwAD16EDnOOw4/+ua9Rwhyxhd2UIrZJaqOvd97KP4XZye0tJyT15k3ok9033s7PS2qXzR2WmXC/dbaUPyDgnIOPvdTx/e+bHTHGB+9/wCxF+1xoHxms9N+E/xT1fwj4U/a08MfDzxB8Of2Rf2tPGVhFf3Givq9g9rp/wAPvG99cME/tiGIvpXw48c6qt/Nosl9NYF47uSzk1H+fK1n2/KTtAIC5JySSDydxyOnTAwPXk9JYX5jK8nAIDKPl7qQ25fmBUngqQylVOTgY+L4r4Vw2fYSVCo3SqwTlhsRFL2lOTS5oSWiqUKtlCvQmnCrC8ZJ3uvoclzmvltbnj79KVlVotpRaVlzLdQnC/NCWjTd0kj274x+CfHvw/8AH/jDwf8AFDSdY0b4haFrt7b+MLHxC8s+r/25LM095fXl7NJM+prqUkov4dWWWeLUIbhb2KaaGeKU+BXibSwCgsSSNuST93jAHUZ3YI55OPuiv1b8G+M9K/b/APAOk/BL4h6xYaf+2D4A0L7B+z98TtbuorNfjn4Z0yB5k+B/xC1a4MUUvjOwt0P/AArjxTqM3nagQ3h/UpzJJbzt+WviHRtY0DWdV8PeINJ1LQtf0TUbvSNb0XV7Wez1PSNV0+Vra903ULO4VLi1vLWeNo5oJkEiFSCMcmOHMfOSnluOowwuYYCMI1aMFanVopKMMVhlpfD1LNLrTknTlacVdZphFFwxmGnOvhMVJuEm05Qm+VzpVd3zw3s7OStLW5x0ww3ONrfQ4AIBx6Hp04IycAVZ0Lw/qPizxB4f8K6NG82seJtb0nw5pcMQ/ePqOuX9rp1ooGctmS4G5V+YKCR04W6gIw4JIBPJBPRgMY445B4/HFfRH7JlrDpvxJ134q6hF5mmfAX4c+Mfi2xlA8o+JNLsR4f+Hdu4YFTJcfEPxF4ZEcTKTJ5RwchsfQZji/q2X4mvDWfsnGkm0uarNKnSgv705uMVd3TejV7Hm4Wg6uLowkrR51KTW6hFpybbdrJJv0Vjmf2mdcsNa+O/jWy0KUS+FPh++i/CTwpt+aE+HfhXoth4Js5IDgfu7650W61NiuS0l7I5ZvMOfFc73y3I5HHHpnpjBAHfJxj2qWVZvMmmuZWnubieS5uZnJdp555POuZpCeskksjyMSAdzHoBiqm7ZwDwe3bkBRyPqW4OeuO1deX4WOGweGoxunSo0oNyd7tRgr3095u7be7d292+fFV3WrVJrVOcnom2nzWSs1ayVtmla9trn1ZqNx9t/Yv8LK24/wDCPftPeLolIJIjHib4X+G7g4Xd8vmSaFngAEox5INfKTScscjO4nouMds8cnpz3r6g0M/bf2MfiRHuJk0D9pL4Y36rgZWLX/h94601m64G+TTIh1AJABJ5x8pyMWLFvlOAe3I2g9+xzzjHXg5rz8ipwi80pJ2dPMq6b00dX2dZtptb+0VrLVO97b9mZO8cFNt3lg6V+rvG1O+t7r3VbTyttew08wdJba4ktrmFlntrqKVoprS5hdZYJ4HXDxSwyoskUiHcrpkHOGX6E/aA2+PrXwN+0VYxRqfi1Z3uk/EeK2URx6d8bfBUVlZeNJJY4vlh/wCE60y40T4i2wdUWe58QazBACLGYL83Asx2jOFxkjpkdMMT35z1UY+7np9Ofs+rH4+sPHX7O99LGv8Awte0s9Y+Gr3EiJDpvxv8E297eeDo43do0gHjrSLnXvh3Od4jmvPEWjTz7m06MptmtP6rPDZlRi74Wco4jlV3PCVlGNa7VnanaNdaf8urJK5ng5e2VXCSd1VipUW+laCTh3s5czg1a15X15Vb5pBKgbeF/iHQg4HVjnryTkZIGPraifDBsgnBySpOBxxj5s5AwBgc8A7elWSGSB5Elikt5Y5HinhmRo5oJ4mEc8E0bDfHLDIGjkjcKyMpUg4ALY5FU7+ScjAOQMc8nOOMc9cLwcENx7EOWpTUotyhNcyaSs1JJq7V1fTr1v1ZwWnFtPRxdnpZt6dVe9vu0+a+tfgL8ddI8GaPrfwk+L2h3Pjz9nrx9cxS+KfCsUgXXPButgGOx+Jfw0vJo5BovjHRwweWOPbY6/ZpJpmqRTRyqV579oD9n3Vvgpqeiapp2u2nxA+Evj+1k1j4UfFbRYimjeMdEUgy2WoQbmOg+MtFDLa+IvDF5IL2yuUaSETWTwXD/PcM43KxxxgL3UEnJGDkEZ6juTnGFBP1Z8Av2gdM8D6Rr3wj+LWhXXxD/Z18f3MM3i7wbE6prnhDW03R2fxL+F99MjjRPG2hCVpgsZWx1+zW40rVYpYpwy/MY/A4nKsRPNMqpyqQq2lmOWRso4paXxGHi24RxUErtJpV4rkl73JJexhsRRxtOOCxrUZ00vquJa1ptuL9lUurulJu+75G+ZacyPkiVCvzEEbjgA8HBAI64GSCpwQQCMAHaRVJ8bWAxhsZCjnAIGMj7wGSc845JK85+mP2hvgFqPwW1TQtY0nXLb4h/CD4iWcmufCT4saPG66H4x0FSvm2OoRFnOg+NtCZlsvFHhm9dL7Tr6NnRZLWW3uJPmt1zyoB2ZCtkY28YIz329uvbGTivfwOPw2Nw1HE4ao6lOpFNN6ShKPKpUq0X70KkJJxlFpOMk01dM8zFUJ4atKlUjKnKLVtbqcWk04taOMrppx3urXd0UDGVJC8qwx064wcgjIJJbcccnOOAc0mFX7uM4GSfm2gZbH3uMDODkdMDOTU+0E5JPzdATxnK4UYPGD8pzwRnoBkwEMuRjjkY6YOcnjA54z8x6Edfmr0YyUle7a0u9k27J6W8kunZ6HOuZu1/dvFPS1rNRXMtU7dHfqr7K6lTkA44x0IIGDuyRgY7ccAZI6saeBznp1yMd+Oh9O//wCs4Fx2z1Ptg5z29Bxnpj6ml+v+fw/lUNv71bbfbXVfJemliW389tnqtGnrprurevVC4A6AD8v8joKKKTIz3/I9+cZ7dv0qSReo468//W6c/wBfpR/n/PSkz+lJnP69QcHr9M+vXvz2NNK+2luv5ej/AK6B302AA85Iwent+n8+tL0HpgenTr+fHUD+opaaTjr365GQB+mf509ZO2jv+G135PTXuNXbX6eW7666C49cHPXj8u/880mMc/QDHbnj0OOmRmkAO4kjjtyOcdM9z6gnpTvU/wCeOP6UN93fytbs7abdu6tYd7b2d0vRbdno1a219PMMdOvHTp+mPp/9bphOg6DPA44/r25P+HJp3Gcf0/yD+dAIOf8APb09/wDGl1u1v+Ntf1v89PJfjs+uvn31v5b+gUnXnkf59P8AGlpAc9O3B4/yPyo1t5a/p/wBCMSMY79enTjjv6jt1+lBPGSCM84Gc8EY9M56Y5zg9uq8cHkYDenTj0yfy7deuKQDoe2D19yD/nk9veqVvuWtvRfPpv0k16jutPXXzWllv0t+QAAY6dsHuSep/Hig4ORn8MjsPQ+nX69emKOeeB7ds/jk8jHp9KCOeRyeQfYdzn+Y6cDPSizd2+iv+Cs9+q3/AM9Bpde1npr2eq3t3fcCcdBnkD6dx0B6daXg+mOnT0yPy/8Ar+tA6kY6fl1OD+PX/wCvmjPIHr/nH+fT3pK90uumvk0tGvIXTbW2j18t16X8vICBnnHB4HQ5zyfzxkeuKMAZPr1puQ2Cdxzk88gFSORnrz0PPoBjOHZ6dcdz1574GB1x7Z/IUn17Lp81p/npe61V7hd2S8tV06Pra+y3Wr11uAPpx1H9D0/GlH5e59+O2ev9frSA5zx9D6+/+fwzSj/P+cGqTbaS0227e7vra66u226XReuu39df+AIR7Ec5HuPXAPf+fY07gg8YG0nP3s4zwF4I5wBuBP8ADg0Kc7hjt3ySM5OeBgKP9nvxx0CnGSCcYz/wLoew+8cAkj0Ixkmtf6/L+vM0s1or6O/S7b5bqK7pb6u66W2lx+fPP19P/wBefelAJ+UHAPB9RnHv146/TJx1aOg/I9c9eff16nPqc5IkAPGSccHv/eX1GR0B47H1NTD9XdvdPTfTXrr5EbPXfba/4PfTZadCoOg5BIHUdeSf8574Bo5z14/X6/5/rw1VAwVzzj7xJz17Hvjv36+uX1Er66rounZXt+tkraedl/X9f8D5B/kUUE/0/wA9hn/J90zxnoRnP1/T2/xxUALTe44/zjrkfXnP4c07/P8An9aTH8sdv8P/AK3tVLR/5uz18/TvZb2Hp9+/l/n6bed9gY7Hjj8OPzHH+NLTQRgYBGemfYf4AfmPWnf/AKqFvq2l/wCA7eWt3p01bQPfr81byD/P+f8APFHPQc+3PPr2PY+/fiil4APr+GPfJ78dD/TFCT6bLVvbs/Nen3tCEySf6emOnB9QMc9cDrRQOf8AOPfqf5/hR/nmi17Xu03632uv63VtACj+vX9KKQ/jx6D/AOsf0pJX1tdXt3+X9MF2XXQD/nPT/P8AnmjAPfp9Ov5d85PbpxR+HPHTnoff/PpzQMD2z7f3uMY4+nPT8Kcfnb5LTTmv+HVD+ev9f19/owDHTp7n/PuT/nCg/n1wcH9OaPx/zn/Jo75wM8Dp6f55oV9Xd7PX0tbV+bW2qt5i/r+v6/ERST2xg9Rz+XTpTgzeoIGMcDHHb14PXpyOOM5Q4zkAcjpz9OTj3yP/ANdKePrx37d//rD/APXWl3ZtJd99Nk/Le77K/wAw/r+vX+raCE5PqfXHTjGe349/zo/z/nrSAg8j/Pp/n3pc9+v+f8+3rxWfnbr11u+2yXy8wAZxg/p0zRSZx/kdzx/9b6evUDAnj6fj/XPJ78D807vX8f6+QfL+v+CIB6dO2QePUY47jj06Y4pe+fr/AJ7enfPsaX/P+fw/w7UUX/rr831/4fuAnBHbH6cf547UDAxyOBxk89s/THBycY9u6sBxyT344/76+h7dxzUyx5J4BLdcjoOBycnjjJz1xkkjmj3bXktHffS+2jvstddE9fue2r+XW7utNHpo/wBPRE5AGRu4A449uMDPbPX0yQBV6EgZ4BIHfOTnGNvbaMZGMDrzmoREufugjHr/AIA9eF7AdTwKsINzJsjklZnSKKKFGlmubiVo0hghiRC000jNsijXLu5UKjsMVhVqwhDnndRjZt6JJWVk2/d0V23t6lQg5ShGN5SlLRK7tflSvZNa6qz1va/Q7rwX4U17xl4h0Pwv4Y0q+17xF4i1Oy0fRNF023e4v9T1S+mjhtbK2gVWLtLIygsdqRqTJIyqjEfpJ8YvF/h79jL4Z69+yx8J9ZsdU+OfjmwhsP2s/i7ol1HONEtziY/s7fD7VoMPHpGluyj4kavZyg6xqqvowlMMV3FF2X7Ouiab+xjpPi3UvE1lbP8AtS63+z78UfiDHZzOjXf7PPgmLwbdR+FDcQbJxY/FHxtr2qaPO+/y7vwz4at5rd/Ll1cmT8kbu8lmZpZ5priaVnluLi4dpri6uJmaSa5uJZSZJp5pWeSWSRi8kju7sSc1+e06v+tucTjUjJ5FlcqNWjC1qeaYlSk4159JYWhKDdKLTVebjVu4Rg5/XulDJMBGcXFZhjIyjKTavhKVoXgr2tVqJ2m96aTju5JQ3Dqquo2KCBtjVQAFBVVXGSVGCeOhwQDhuMaQM+BtJw+AAAN24jGOThcgDnhgCpByKtb8kElmbkYJx6np2XkYyOgz6AewfBn4aWPxD8VXc3im/n0P4b+CNFu/G/xV8SwBTLo3gnSXgjubPTSwRZPE3im+msvCnhCzYhr3xBq9jn9xHcPF9zisVSwGGqVpJKFOCsor3m9IxhBWTlKcrRit23Ztt2fzUIVMVXjThduUknKWy2bk9dOVJycnZW1vudh4MT/hRPwnuPirO/2X4p/F7T9d8IfBqHOy98LeAGNxoXxE+LqBcSW17rGb34e+ALxTHIGk8Ya3ZkSaZYXB+WlTYAihUjUBQAAuAmBjjjjaME85G09MV6H8WfiLqHxU8dat4wurGDQ9PljstH8LeFLHe2m+DfBGg2yaZ4T8IaUrEE2eh6PDbWzzcSXt4bzU7p3u76dm88QlgpYfNyFAH0JzyfTOOOR07jmyvCVIxni8X/veMaqVbWfso2XsqEG0vcpJtNpqMpuc0lzM6cZWpvlw9J/uqKUY66yl7qlN2tfmktNG0tG9C3G4XhckY5bPPOBxtz0Axwct1GATX6EfCyX/AIUH+xr8TPjLNIbP4gftQ6rf/s7/AAqJIjvrD4V6E1hrPxz8X2Zzujg1y5/sT4ew3karxLrESHHmFfhzwP4M8Q/ELxl4R8AeFLN9Q8T+OfEmieEfD9lHuLT6x4g1C202wQBf4EmuEklbcTFFGzkbQTX1P+29428O6h8WNM+EXw/vUuvhR+zF4T074D+A7mFgbXWr3wvJJL8RPGyqu2OS48Y+Pp9d1R7tWL3FnFpwZ5EiUDxc9/4Uswy7JKbvSlUWPx7V+X6thJwlToydrL6xivZpxldTpUq6Sdml25bFYTC4nHu6nGH1fDt7urWjZ1FLW/s6XM0/sylF3tofHV1OSXC4IYlcAEDZgbcqMDA25I9CCQBmsZzufg8YGDnHbqDn+I+mR0OP4RalnDZGc7xlmGST04JBHfJAGfvZXvVddpGSDuH3cnnqcngZzgngnAPbivr6aUEoJJcsYrltZpWXptp8OyXyPn5SblJ3u3e997uze2j11TvpZ9WyJpCjdM5HPOMHGRkngrnGeOvueFV2YncpXvnoOfr1PI4x3HOeKHVSM4yc4JyeBxxwR3AyOcjqOuWIOg5wOhxgnnIBxyMcdenbHbdJW5mk29LW1tpdbJavsnZ9xKzt5tLquqve++2icbdnue1fs6Wwvf2gPghb4BD/ABb+H7P2+WDxLps7nt0WJiTnA454xXm3iy7bUfFPirUCc/2h4p8S3pcr977Zrt7cZBzz/rOue5HbFexfsqwCT9o34NE7ttn45sNTYYLHbpFreaozH0Ci0JPIxgk4IzXgMkhuGlnYkmWWeYkkDeZrh5S2ec53HPJ5wScn5vHo655X1uqeX4ZLrfnq19b768t2tl5andNtZfTStyvEVL6buMKLWn/b1+u9rakIXknHQ5GNuTxkkg9Nu0nBJB6jnmpuck7QCQx6DIPbocHAOOhxnrnNMUjnrjORyMk4xjb27H059jl4Hv8AwngtkcnPI6H2OcmvYk3dPppZXbvoujevy67nC21ZdLJ31s7paPXXfZ3ta2i0FJx3AHT8fz/P8aUf596QDJHA9h7/AF4x+Xv7UrH1B/2gOT97ODt7/wC7yBgjHUQt+ulr20fRaed/8yN1or9l5/jr+oBiNuASO4wc5JxzzwDxzg4I6c1dhJLAHGCR355Kn03duvr1PYV40Bw5baB98ufLVQduCHKnueCCD6jpXv3w8/Z88b+M/D//AAsDVZdA+GnwpS6a2m+K3xO1Cbw34MubiMrvsfC1vHaXniX4g6zGRzo3gLQvEV7Gw3XiWcRNwvLi8fhcHS5sRVjSu1GLbTlKWiUYQTcpzb0UY+83tF3sddDCVq7Xs4qWt3qvds43cpNpRSvq3blV77nr/wAF7a1sfAHiCB4mmtfiPbSeHvFWn3DvJpeq6Ro+q2F/o8L2IZIXutO1CzN/Z3zKbqynXfbyxmRs9z8XNK0n4grrPinxFbBvFC6LpdtFq9vNJDK9t4Y0O10HQrN4JGW1a3tNJ0uw05iVV0htYyH5auY0HUvhtpH2bw14D8W6h4r0fQZJDP4j8QaTH4QfWb29lEt3daX4eudQvryy0eJ5EWxOo3Iv5oHWW9t7S6ae1h2fE+paN/Y2qSaxM7aQbCVr1LO/trS+uLBwhaKxnl8xUuJ8tHaTGOaJ5MAJJjn96yTCcIV+FcBjnleXvE1MqnOvWqUqUMZKbpwdaT54xrQqN04pqWvux6I+AxlTPIZxiqf1rEewji4QhCE6ksPGKa5VaL9nKMeaXK1zXu3dt3fwZPuSRopEZZEZo5EJJ2OvysmR8vpnG729olXGTjAznH3iN3Gcdccfic5I4r6Q074D2PxOia8+BHjyy8d6wUaV/hP4vS08E/GSGONFYxaHYX9/L4W+JbIqMsY8F69N4luyFf8A4RO33eWPCdW0PVdA1G90XXdNvdE1vTJ5bTUtF1uxutJ1rT7mN9j22oaXfRQXlrcK2VeGeCNlIO5QOK/nylmWBxVerRw9ZxlSnKP1aqnRxEY8zUb0qii0pWumk4y1lHmR+g18LiaMKc5xUueMW5xfNBu0btNe6rX2eqb1V0ZyOIl3AgDI7njGCcgY6AHKZOPpW3aagwIZH2uARhjwQQM/KT0wcEFTjkAnGK5otiTbhhjIb73B5BxjAOOp54Pdu96BCoDgnIxjIA4+UkbRxjHXkkg56Ctq9GM0lbVWbXyVter1vZb9LWMYTSaSfZWSvZK2mqW618ltY+/P2P8A9qY/A3U/FXgj4g+HD8UP2bvjLZQeH/jl8HrqUImuafGT/Z3jXwdPKTF4e+J/guUrqfhXxDbmOSSSD+z7yT7LKr2f27+2v8N/CvwJ/Y3/AGVfhr8F/Fd78Ufgl8TfiT8ZPj//AMLcg0lrDTfEWv3sWi+FPAng/wAQeWGi0/x94L8FwX9p4h0C6lS5tNRa9lt4PKErJ+Kem3IhMbgDLc7cjK8jBK4PAwpU/wAPftj9Cv2Uf2sfDfw50XxP8Bvj/od98R/2Tfi3PbN8QPBtnIn/AAkfw/8AEsQaDR/jN8JLqeORdD+IPhYzGaWGHZa+KNKW50TV4rmGdDX5bxLw7Vo4/DZ7l1GdZ4XF08bj8spOMY5h7GjUowrwTi08ZQp1HKC0VbkhGo24wlD7TJ80jVw1bLsXOMPb0VSw+KndvDuVSE3BtWfs6jjZp6xu5KPvST+DtRhODldu4k5BAJwRjqTn9TyD61w97A3z9Ac9AdoOFAByR+Ix3PQ5xX2h+1h+zlrX7OfjPSrW312z+I3wm+IWkjxl8EPjLoMRHhj4oeBLp18jULf5pV0nxRpBdNO8X+FLiUaloOsLJBLG9rNZ3c/yFdQtkEcggnliMEdR0bI5GTnA9OgH3eUZhh8fg6OKw0lUo11dOV04bRcJxl70Jwd4Ti0nFpprRI+dxuGnQrVKVWMo1IO2ivzXs1KHSUJKzi1dNJNvVM4yeIDPGT14z6rx047c8cdOnOftBOCMDOBg9enI/HIH15PJrobqEL8oOTlQwHGQTwcjnBIyxBzyCdxzWNIm0HGDzgHjnGR0Gc9cYyOvGa+goyV2t79raba37r+up5sY8j5Zfd6Wu1dXUu99dddb2rkFSAMZIP0wOvXoOSMYOO/Ap0ZIY7Vzk8huhPAzn0HX3PcnOUO5jkqxbBBI5IAzjkjtwcH3J71LDnI+XAI68HtnqPrjnBBUjHWrlKyvy3bezfdrXzenS+t1ZJmbSvZbKzers9r66L/g69ke8/BH40S/DF/EHhvxLoafED4N/EOG1074o/C6+uvs9tr1pZsx07xN4Y1Fo5z4V+JfhKSaS+8H+MLSI3NpOZtO1CPUND1DUtNuZvjX8FYvhxF4f8beB9dl+IPwO+IjXU/w3+JMdqtpNPNZiKTU/A3jrTY2lj8LfE/wqJVt/EXhyaRo7uLyde0KW/0PULS7bwxFIDMy85+UEjknjgZ9sg8dSSor3H4L/GxvhpJ4g8K+LfDy/EL4KfESO0s/id8L7q5FoNVisi66Z4y8G6k8Uw8JfFDwi0st74T8WWsLOjtcaRrEOoeH9S1HTrjwcZg6+DrTzTLUpTbi8dglKPs8XFJJSgtIwxUIr3Z6RqJezqPl5Z0+/D1qdaEcJiXaOnsa2rdJtr3Hpd03710k3F+9HqpeAEk5yMfwr+pPrjhhxnd6gAioWGAd2cjjgk9eM4J9+2APmHJBx758a/gyPhq+geMPB+un4g/BT4hpdXvwx+JdvbC0/tGO0MTal4Q8Y6ejunhX4oeFWmhsvFXha4lOWNvrOjy3+gajp1/P4JIflJbJGPmz1BIBIGeuCcEcAHI55r18DjKWYUIYijJOnJWad4zhUTipU6kZJShODTjKE0mpKzs1pzV6NSjVcJxs5WkmnpJO0ouDu0000072e+txQeeuPXHUZ9hSHPJ6/hyR+fU9T/XqYtwySB1JPHI45HJwcZHIz/WgsRyDzg8tyASTwByB7nPAI6DGOrl1Tei3t1XdLR9bWs9bKz6mTg42vZXs9dFpa6ur330d7bd7KMjgY4PBOfbOAcHoOPXmng/eHQYLYHuQOzdMnByB2IHOKbjjHt19/X+tKF9OgBH4Z3Y9eCOPStL389bfd/Vl8nsJSta7Wj+5Oy3vq3slZvfyJcAsOCwyQcgZGCSDntnjoMHuOMBTjDAdT+fpnHpxz2x09ajDk4IGMEkgfU4JIHf1B5x+bwQoA5XO7jGMbmPfGM9+vf1IFZaprysraavR6pb9PVWv0HK+jtorWV1vZfc9Fra6XLdtgOX4PBGcZ5HAAPBxyepPqcAgcP8A1/z+NGBnP5nHNIGBIGSATzwc+3BHofQdCQD81O7d3yqy6266PW767d9Xa5CV7JX6K+9tLX7a/iyxGcKMEAEgsOpOcHBHYdfUk+3A+k/gUhHw+/a3ucEGL9n7S7fdycm9+N/wqhwCCAMqmOmeckDmvmxTkKArHJUBQANzZXavIC/M2ACSD1AAB4+xPhn4O1Dwv4A+L+g31xC+r/FrwHofhW3iQmO18Pvpvjrw341aW+n+Z74XCeHksGht0EcEtz55km8jY2GJyPNc+w86GVYSeIqUK+Dq1VF048tOniKVSbbqSim3CnJqKbk9VFPVGsMxwOWVIVcfiKeHhVhVpU+ZNuUpU+RfCnopSV5bRum2rXXyGq4cjGASxBAyeMZ54zngcnkjrnrKV6gYA75PXP8AgR379Kt3VvPaT3EEwIkgnltpgB8omhcRyIMEkgODjnB4ySfmNMEseBx6NnH8hn17nv0pyhUUpRqQ5ZQfLNW1jKCSkmrJ3VrWfu3u9Lu2drx5opSi0pprTmi7PRp63Wzbt+I0gKcdRkZ5bHGMnHzfNxjpWhb3LIAQwJ4HOTxgHnB9M4ycDkdARWcRk5zjq2AVAPpkntyB16YPNM3BcAE8cfKM8DBPAyOMglhkj73Ha1GNRJNXdtlZ+8kvklvs7tbq7besJPo2nZX1dna11031T+86K11C9sbq1v8AT7q5sL6xuYL20v7KeS1vLG9tZYprW8tLmFo5ra7tpVSaCaJ0kSVA6MHCmv1O+yWX/BSDwRPrmkwWFp+3X8MfDaS+J9FtY4LFP2s/APh+0+fxPpFvGkUcvxy8J6bbodVsEIm8a6VD51usl/BFCn5PxSAhASjcANnkk/LgHnhTknGeM8cjNd/4G8VeIPAnibQfF3hLW9R8NeJfDep2us+H9f0e5a01PR9WspY57S/sLhMSRywyIN33kkUtHIjRPIh+Pz7J54uMMXgZrDZpg+aeCxHL7rvyuWGrqP8AEw9eyjUhunyzhacYs9vKswjRlKjiY+1wda0cRTu9H7tqsH9mpDVxa3ScXdNxdW/0ue3MkUkMsUsLyQywzxmKaCWFissM8LgSRTROrJLDKqOjKwZQdyj6I07S/wDhAP2QPEWssoi1r9oL4u6Z4RsiQRLN8PvgxpyeKfETqcgtZ3/jrxF4UidhhGm0A7uY8j7V+JGgeF/2+/hn4n/aC+FuhaZoX7Wnw30KTX/2lPg/4ftY7Wy+MXhmwjQX/wC0D8L9HiCIdftCon+KXhPTYzPHJIfEenwvFJctN8oftatF4duvg18GbRkNv8G/gt4UtdYghO6E+P8A4lRj4l+NJcgjdPDJ4g0nSLhmBkR9KMLkmMKPnKOeTzjEZXlVejLDY6ji3VzXCzV5UVgowmpR0SnQqYieHnRmopTg3ZKUZKPq1ct+oU8VjKdVV8PUpQpYOrFO0vbys1NXajKNPnjKKWjWjs0z4mmJLZ2jkbgvXoBkf7Iz8+V6r0yAQcuQANnkHrgMeRuHYZyBggdB2B61qXKmLePvZzjGTxgDpk9hxzwQRnjFYztzkc5AIwB6AAAZ+9znB685Ir9MpNKEmnzJpWsu3K9L3SSun102tufIVOZSbaS0jo+trau10u2zk9z6W+Hs5u/2Xv2ntLA40/xP8BfFKKOim28S+I/D0kpG7nbHrgTd2MhDdTn5cdR9SxJ4JA6ruBAzgkEDB547HivpX4IL9r+E37X2mFi2PhF4P19UIcndoHxf8Fs0i8hQUhvpQzngK/OOlfNpjIOSo5HK5zkHG4EcZA4zwenQjgeLk75cbnUHJ/8AIyhJrVaTwOD621Tkra2Vlc9DGtSw+Xy1aeGkld7tVqiS2Wysmnfu/JABgHIznkY6AYxxzyTgH1/u8nGvpOpaho+o6frGlX0unanpV/Z6npl/bOYrjT9S065ivLC7t5lIaKe2u4YZkdfmDIpJ6msgH5lwB16Y4Ax7HkevQ+uAMVOrjgcnB5UDPOcE9QSRg+mB1zgV9BUgqtOVKUFKM4uMrq6cWkrNea7X3V+t/OUnTkpR+KLUk9b3Ti99NX1t089T6Q/aO06x13XvDnxt0CzjtfD3x00abxjc2drGkdnovxFsroaX8UfDkaJiO3EPimOfXbG1CqU0bxBpjAFJEJ+a+nUjHYew/XP9fqK+pPhFE3xL+G3xK+B0wE/iG2trj4zfCGDO+aXxV4O0yeTx94Tshy7P4y+HsF7qFvawgtd654O0q3RDcXG1vlrcMBlX5CoYHO7OcMMnnn5gCSc5wCANpbycllKFOtl1Vv2uAn7ODkveqYWVnhp6vVqP7py+1OnN9zqx0LyhiYfDiYqT5XtUslUg9kvetJLs7t2Hq+0HbwfcHjPqpxjv9ODnHFTRz8qQcMrZ6e2MADOe/PG0fLhgeKRYjsMnJPII4PU5J6ew4Hr3iMhyccH8eO5HbjpkA9uvce0rWto073bV90r2ffyasr2t34FdPRtWWu3eOvNps09PM+rvgh8eNL8HaPr3wl+LmjXXjz9nnx/dRz+K/CMEg/tvwVr6qYbT4nfDK5nDLovjHRwwe5t4ilh4lsFk0vVI5FeKSLi/jx8C9W+C2r6Lc2es2vjr4W+PbKXXvhV8U9FjZNC8c+HUkRGzGN7aX4o0aSRLHxT4YuXXUNHvvlkjaB4ZpfDI5TjI+Zm+U5GQpGe2ORnAIOBjJ3Lya+qPgh8TfEr/AA/+IvwK1Q+H9e+Gvi4af4ht9C8U6UdVfwh4102/t5ofFXw21Fngk8M+KNRtFbStcFvKttrmivNDfRStbwyR+HQyXFLOaFTKZ0YRxtaEMdhK0+TD1FLlTxULJqliKaTvpavFKMryUJHo1czw8ctrfX4Sl9VouVGtCPNVjblfsndJypydkusW7r3bo+Utu8b15wTnpxwCeSBknPccjg5xmoiu33yDnrgDPGBnAPQdABnA4OK9o8e+ELLR0t7zSrZLS1aWWCZUMhjeVx5yGMtlPNCjaYVbdEoBxtJNeTyW65JJ+hBHKkgjdxg7h1GAM4IIPT6THYapl+Inhas6U5U3BSdOXNHWMZLdJrlTWjS1s2mm2eRhcXHG4eliaMZxhVXuxqRal7stW3qnZro2uvW5mCNVxnbgk8kjght3XpnPfrggAgAYdu6LxwM5GWB/EDByRnGPpxmp3j2nkE98ZzgZz94kAjnPHzc98ZNVxhVCjqGxjHAJ9OAVx0HOR064OGk79Lryd9FddNL7et1szZ3b6Nu2rat57aWV/nbRj/8AP5ZoH09f5dfw/pRz6D6857/h6frzxSZ5Hoe+en4d6mK1Xre707ff1WnkLr9/9fht1v3FpDntj6f54/lzjkjijv8AX/63+e/14FGc/wCen+Hrg/lS2/4Oz2dgEGed3+OeP8Bnt34FAGODg9cZ5PPbPvznv9cZpeTn04x2PHXOfX6dM+1Hf9evp7Z/pjp7Udelnbb5d3uvXv5jb+7TRbbL8e/z1DjnHfqD+Hb8s9O1L/n/AD/n+dIQe2ByM+pFHr3/AF/T/P50lo9Ndr+e2/d6JfIT/q/ovw7DlIznp+B/TIJH68+3QyOh7c8+nPGQO/6fjRwcDpz19j69uPbHuKT+nP8ALp71au7XVknrta14vbbb8Hte7F/X9f5dfwCgE+3f9f16f5xRSd/r06f/AK+f6Gp79O3n5DDkHPbGMe5/+t0/Skwcnpj9enBHbr6j+lKc+3br9ef/AK3vRz2+mO3T6evHHb3GA7u2/p6rlfXySXqPbtrb9H109fmGPw7+2cjrjqR1wTg+voYH4gYHPb0paMcfT/PX/P40km72W2tv+H/4Ig9+n+HufTn6UA45B/z+vY0Y/Adfp7n0560ox1449cewI5Hc9OvPX1oV9N+97paK3e2tuu2nkAwkkjvgHOcc8jPJGDk+vrzjNLkjPTocfy+vfGB1470AcjnPGOw9B+AGMe3rS077Xs7bNeWy6dfn57A+34rz/wAv6uJlickj149fX+X4j8znI9PTqc/h+HPTj8Qv+f8AP6UoOeCOB0PTk/zHTJ/Lpzok73ej0Tff4ei00V12b33Gt/8Ahv10G98HjO7OSONoOeMZx05znqQCKPunpnCt16/LjAzxgE+xOCRjNLlSOQT1IB7DkYIKnOcZGMHn34XlgwxhRleCCepYAnuPlOcD8AMk3+Gl3r+V/v8Ay7GkV3Wzta/W61Wr12XZ9OxMowMc4yccg9eRgfp68c4NPXk9jnjHUnBX07YPb9KbwOcgj+n4j05zThjPXHA56/xA46c9T2x16Cs1qnq/iSve73XXQzs/S/rrtp+RQTJyWG3G3BBxn6k9R69unpUtICMDH+BHQdOBjOT9c9eKM9v8/wCfpnHes3fz++/Za22fe+u1w1fy/Sy/S3np1Fx3/wA/596QcZOOv4/oB7dfXv0pp6k8YB/X5eueMgA4ORgEE460uCQMEj9eOcdcH2z19c0WWmu+/dbevfR9ewW287eXVeTb08t9r2Heo/8Arf5wO/5d8Jyfx4P8uD+fbn9aZ838XAGSCMntj3+vPPp3w8fXPv8A/q4p7Wf9dH+N7/PvcGrefp+V9vubFH+ccUce/vjHPHHbj6k+n0LThRkkYPTGMj247ccZx9TSjBGR0/z2/D/OaSbX9XWln+iv22Yrden6/wBf8AUYPOCPXp+B6Ej8eaCBnnkA/wD6ucf0opMjOO5/+v8A4fy96d3fyVpNLbp/T7agBwePzByPb+Z49f5HAH6f4frQe+emB+HPX1/HtjOaDg9fbrx1/UH/ABxQtbKz313aa019UnbTpa24+29r62Xpf5/ht3Akjpjnj/D65P0wcdcZpDn24xz78cYz3BPH05zS8j/PQ549OBwPfvgZpM57fh659R2HX1zjjPGWru21o+i7Nre1/u2d9bj2V7L9ej17q3Rd3cX8Rz0x+vf/APVx1zRgZz3HH+fWj6df0pR7j6jP9an7u2npb8f89r6rzT8vP/hul/v3D+n+f8//AFqMjOPbNJgHjrj/AA7568GjA/L9P8KLta3fb7rf1bpoLT+um39dOgYGe/1zzg9uozj8Pal49x7k568DGfoM+ppCD1HPXrjHPft06dzjtzmgZyc8dcD1HHPX+nFPW2/yT/w2/PTa3ysH9fl/n+YvQH+Xr/n+tJ29CR0/zjpRk56cAZ9+/A/Sk3dOnPA6/TOPTP8ATJ54Em9Oz6bq9r39P62Y0tvXe997WXX9Xv2Dkntj+f0wf8OvQ0vIPYDn+n8zk96TPPQDp16+mQe/oOBkY5p1D3XZqPbsr6vS/wDXUH0ulay2Xknvbfv/AJMKX3Oec8/5/Xn+XLBwSOw755z1Of8AJ6/lKqbuCcA4ycgdSMD6c/496Fq7N30Suum1tNbdL679X1Hvq+2vy/P9RVAPXlWyCp74PHUYPGc8fTrxZRRwcEkHbkY56Zxnr17nHsKYke7gE/KCT6gZAGAD356n+EDJIBrQhhMjKAHIJAJA5GRyAS3BPUZBzgnceaic4JNPZavqum/fXqtNPM0pxUpRT1fNfV2buk7rRLm7u1tdrNFeQqEGcgY3MSdvACktkggjgk5ADD5RwMj76+FfhjQf2Tvh74c/aZ+Keiafq/xg8bWk1/8Ast/CPXreO5hsIUY23/DQHxA0idfl8OaROC3w+0i7ijbxNrUS3+0abbGcZf7P3wc8EeE/B15+1Z+0Hpj3/wAIPCOqvpnw3+Hs0jWmo/tBfFKzQXFl4TsMgTHwF4dlSG/+ImvxKbaG0UaRFIb27eEfL3xf+Kvjn44fEPxH8TfiJqY1LxP4iuIjIlrH9n0nR9LtI0t9I8NeH9PTEOk+HPD+nxwabpGm2qrBa2cIG0yvMx+MxVeWfYipl+GlKOWYefLmNeL0xM1a+BpTVrxs08VOO0bUV70p8n0WHw8csw8MXVUfrVaN8LScU3SjaKeJqKyd3b91GSun+8a5eVP1DwL4v8TeI9G/a0+I3irW9S8Q+KNe+FIg13xJqt09zqerav44+JPgnTrq4urhmLO08UdyiIgjjjhSOG3VII1iX5rE8gALMC2BgnnGcE+nGMdSM5ORziva/BrvZ/s8/tA6gSFbU/FHwV8JoRnDJca14m8TzxKctww0CFyGwf3atgkZr5/eZ8gckEkEbsgDOMDge2ABwCq9gK9LKKFOniM19klCEMRRowiuWKhCng8LaEY2tGCu01bZ2stjmx85So4RTlKcp0pyd3fmcq83Ju93d2Xztq1odHaRXF1c29vawS3lzeTQWtra20bzXF3dXEscVta28KKzzT3EzpDFGilpJWVEUlgK+l/jJeRfCzwhp/7OOh3MD6rZ6lZ+Lfj5qtpKkseq/EyK3ddI+H63MRKXGifCawvLixuIkZre48dah4iucymx0+WKr8GRF8JPBF9+0XrEFu3iAX1/4O/Z+0q7RXF54/itov7f+J0ltKrLcaN8LbO7hk0ucqYbrx5f6NEjH+yL+Nfme4uZriSae4uJ7m5uZpLm5uLiR5ri5uZ5DLPczyyMXmmuJneSWWQs8kjuzsxY5IR/tTMLvXA5fO1teXEYuNne+zjh7pX1vVfSVLXNqOCwsUl/tGIjFtPenRVtLq1ud2uk7qNt1KyY4DMW4Y4yGUAE+/GPcd8D5QCKkjj5GQM/wkH7o4ByM45Bx7Y9zTIwFxzncQAOozxnt7jcPyrVhhJUSDDsoXbEoDySO2PKjiUcs8jsAiA5bIVQCcj3a1WNOEpS0jGHNJ3tFJRXXsteysn0PLhS9rUgot+89LStfZrlT6Xe6Vnd7o+1P2SGX4TeGPjR+1rfW6Lc/CDwsPAHwglnAP2n4/8AxbsdQ0Hw3qForZWW48CeEV8T+N5cDzbO4sdIlLRtJGa+F5cnIeSSaRmLSyyEvLLIzB5ZZXyGeSUktLK3zF2Zi3zAV9x/tVB/hH4K+C/7KNsxgvvhtoX/AAtL4xWyABrr44/FjT9O1K5sNQ+8ZZ/AfgOPwz4Uhidn+y3TapGqrPNLn4VZipbOM8nGcZGQdpznkkEDHOOBya+Z4bpvFzxudTu3mFe2Eb0ksDh/cwtnq+Ws3UxUW1p7e13yo93NpPD0cPl0FZ4eF61lviKig6ret04Jxp/9uJt9CI4JwoG0fU46cnjoP0GPrTdwzgeuOf5dME9KQAYIDctyfTnBwOenHHT1+gBgYxxxz6+/58Htjv2r6tQ15m25X+ztstddW9W9N99Nz51Jby1emi3d7X9Vtbq9PUG+ZduRntxk/Kcj8iPx+gxSKFQYz6nuSfTH8gOT6Z5yAHJHHbH5YzjIxn14xjA7mpU4I3YPqccDOe/3hzjoR05zxindRdr97aX2Tum1Z2T262210f32urp2v3Tttql13e+uh9EfsoIf+F8+E7tjldI0T4ka4XB+7/ZPwy8W328E5I2NGrZH8XIbmvm2EL9mtmILFoVI7EMQpOcZGR6YYZ65IyPpf9l8i08feNNY4RPD/wAB/jtqokxgxv8A8K11jS4yeTj59RUDGOvYkqPmiLcIIU5+WGMED/dQemcZHtz1HTPj4OXNnOOkl8ODwNOzdrNTxMpLstZRTW10tdT0Kij9Qwy1XNVry100caC7dLJbW9LioqjAIO7JOSSTklccDjHJDZ6cciphtGOwPp6DPH1OeP60/wCzs438bD95mO1QAOTk8KAThuSeD/CpNeyeCfgH448X6GPGmoT6F8OPhhFMUuvin8S9Qbw14OlMYJlt/DcP2e58RePdUjVXUaN4E0XxDqIf5Z4oEPmr6GJxuGwkVUxFaNNaNJu8nJtWjCKblKT2UUm29Iq7suWFGpWlanGc9m3bSN+VNuW0VbXW1t9nY8bKjbzhR1aRsBFHAyTyowSOvPTjHFe2eBPgD458Z6GPG18uifDn4ZRymK4+KXxO1QeFPBMjx5MkWgPLBPrvjfUE2Pt0nwVo/iHU2kAVrVFIauhXx38Efhcyx/CzwdL8XvF9odo+KPxm0iKDwfZXSkqbvwV8E4Lq6sLlI3KPa6h8TdW8RecipPL4R02YmCPx7xz8QfG/xM1w+I/iB4r1nxdrSxiC2u9ZuWli0y0UDy9P0bTo/K0zRNLhVQttpmkWdlYW8ahIbdEwo4FiMxxythKf1Gg1riMTHmrtO2tPDr4LJ6SryTi7J0nY6VTw2GX76brVb606Tapx2dp1N5br4FZp6SR7YfF3wK+FZCfDrw3L8cvGdsxCfEP4r6M+j/DLTbpWI+1eD/g5HdSXviMxP5clrqPxM1SWxmUI934Ci+ZK8j8cfEzx58TtbbxD8QPFWreLNYihFraTanOn2TSdPjOYdM8P6RbxwaR4c0e2B222kaHY6bp1rHiKO0RABXn5LltxI3EHJCjsSA3BXkZB6EDO3tywM4yxORnnIH3ST74Pp82T+OWO+GynC0JRry58XilZ/WcTJVKmrV1TTShSi2k+WnGEb62M6uKqVIuEGqNJWapwTirvlXvPeTSum5Sbad7WdjUE5YkEjBGd2ACG4K4/vYJB9cjKqR0+ivjpp9vJ8Pv2TPFFtHEi+JfgBdaXqbQxiJbjWvAnxY+IPheee4RBsmuv7Lg0ZZJZcztGIgXyqmvmcMSQfurtAOeMADv9AMcH0xgc19RfEAjVP2Tf2aNW4M3hr4m/tF/D+Vh96OCU/DTx7YQvjGB5niTU5Y1P992AwWzzZrUqUsdkk4SklLG1aFSMW1HlqYOvK0ktLc8I28/Rm2EUZ4fGxahzKjTqRk7txca1KMt07aSaeuzsl2+cPtDIF+bmNg0ZztdWXAR0cHekgYZVkIIO09RX0hpP7TviPU9JsPCHxs8LaH+0J4JsLdLHTYvHdxeab8TPCtjGrIkXgX4y6SF8aaVFaoV+xaH4gn8VeEY2UA+GWABX5eaU7lAXOAOvTbgDucnknk4ycEdqVZWPzHAI4H8XBxk5zgnGOTz7966cXgMHjox9vh4ylHWFaLdOtTdlaVOrTcasGne7jJW6HLTxVahL93OVnpKDs4NK2kot8rje6lpbVNbK/wBdW/wU+FfxWfzv2e/iabTxLc/6v4I/HW80bwl44llbBNl4L+I8T2fw58eSMwIt7a/k8Ea7dgIsOi3E8vljw/xX4I8WfDzX7vwn498L+IPBniexZftfh7xPpV5omrQK+PKlFlfQwPNbSht0F1B5tvOjK8E8iOCfPVfCKrhZBx8jouBnB4OCV7kZPTg5zmvpTwn+09470rw7ZeBPHun+H/jf8MrHMVn4B+LMF5ra6DFJtVx4E8bWtzaePPh9NsCiN/DHiCz08ssZu9MvY1aJvNqYXOMvtLD1P7Uw2n7jESjTxcFpdU66ShV5Y/DCooyf26rvp0xeExSTqR+q1k/4tNXptvlSbg/eh3k43sr8seq8NS4EMm1SQQpypYrg4BHGeuSMd8HPQYN9LpgAVZjubIA3scYBOTnGe5HUg5A2jj6CHw7+A3xabzfg98RJvhJ4xuXyvwl/aA1K1XQb66bn7D4I+O+n2On+HZBJIStlY/EjRPBrIpSOXxDezsZH8n8b/DLx/wDCnV08P/Efwfr3gzWZI1ns7TXLQRWuqWT8xajoGpxPLpXiDS5gN8GqaLeX+nzqQ9vdS53CKeY4bEz9nLmw2JcU3hcRF0qido35Yy92ok/t03Om3blk02b/AFetS5XG1SF7KrSalFpcvLzNN8t9G1JJrW6Ptz9lX9oDwJL4M1n9lH9qR73U/wBmvx/qq6poPie0gW+8T/s5/Eq4UW9n8VvAgZTKdJmZo4PH3haJ1sfEGj+dM8IvoQZfFP2k/wBm/wAffsz/ABGv/h343js9QiltLXxF4M8b6DKb3wf8S/A2rIs/h/x34L1RC0Oo6HrNoySMsbPPpt2Z9Pv1ivLadB82R3Rhfdg7hwQRgA+oXlWHXPbkLzg4/T/9mT45fDb43/DSx/Yo/ay8Qw+H/BT3dzc/s1ftAahG15qf7OPxB1M7Y9C165KPc33wQ8bXrQWnifR9+zw9cyR63YrB5G+3+XzChiMgxdXNsvpyq4CtJTzXAUlrF6J4/DU03erFK9elFXrQXMl7SK5vdwtShmVBYHGOMMXCKjgsVKyvZK1Cq93B705XvB6WS2/LS7tsBicAfKDkg55AIBI7kcHvjGDnJwrm2UhcEKQR8uRyMZ5zx94HPBzkDmvpf46fAr4i/s//ABL8UfCX4oeHpdA8Z+GLlI7qBZBd6VqunXCrNpXiTwzqkRFtrvhfxBZsmoaLrdk7213bTZBWVJo08Ol08glSpPG3bjoSckEHOeRjlugJORwfrsDmdDE4ehiKFSFSjWgqlOpT96MlJRSaavZNW0autrKx8/iMLUoVKlCtTcakJtWe6a5VezXXTrayv68Z5Izg528dhgfQY5LcYOBnHAOM1NDFtYjaMHC4yTnJwDxjPGP4eOgOevRNpwOMjOBgkDnoQAeDxnspORx3FbnhnwRq/i3V00zTIfmRPNuruVSLWwtwy7ri5ZVOGPIihHzzOoVV5JX3MLSnj8RSwuGpyr1qzjGnCnduTfKrWjpbXVrRJXWyPNxChQjOtVmqdKCcpzloopWerv566L0d2cPLb4XcuDglvToMn+EsBzjoxyc/SntwR8pOecnscrjA7g9cgZ5yTxmvtW7+BXhyXQf7NsJ7mLWoVE6a5O7EXFyEKvbT2ysEisZD93YpmhyD5kuGVvmPWfCWoaHe3Gm6lbPaXtszCSKTLBhgFZYHAIlhcZ8uVC0bAjGO3uZ3wzmmQxozxtBKlVjF+0g+enGTSlKlUlZKM49rWevLJxV15uBzLCZi5xwsnzU3ZxleMpRTVqkYp3cU99NOqR23wc+L8Xw+i8QeCfG2hv49+CXxBNpF8RPh79pFrdNc2glj0vx54E1CdJovDHxQ8JrNLP4e16OF7a/ga58PeIrbUvD+o3lmavxn+Cc3wxfQPEfh/X4viD8IviFDdah8Lvihp9q1pZ+I7KzkiTUdA8Q6czzN4W+I/haSaKw8Y+DLyZ7rTboxXtjNqWiahpWr6j5VLaNEWKjd9TxjIHTpnk847nGMV7T8GvjJD8P4PEPgHx/oE/xA+BXxCltP+FgfD+O6jttSstRskli0n4j/AA41O4imh8LfFLwmlxLLo2sCBtP1vT3vfC/ie31Hw9qd1bR/C4ujWwVWWY5audycJY3CJ2jiUoxTnC/LGOKilaMnZVElGbVozh9TQ5MRSWGxLSt/ArtXlSbs1GTWrpyd7reLV0tLP51cEE5VVBOfukgqQCOM5yM4IycZye2V4A9Mfl+Wef517t8aPgxd/Cy80LW9F1uD4gfCf4g211q/wu+Kel2s1rpnizSrWWOO80rU9Plkkk8M/ELwzNJHp/jfwXfznUNF1IrJE9/o99pOr6h4c3zAEqDkDgDGQAMgYBA688HGRu5+U+tg8ZRx1CnXoPnhPRraUJe6pRnFpOE1JOM4vWMk7pHmYihUw83Tqpx5WrapqUZJNNNK1nund30t1I/8/wCf896P8/rk0EPxkjaM4xjnPABA923Z77ck8EUV1LZ2b776X93ze19Oyt6HOIQD69+/GD2I455Jz/LuvH4fnx+maKP6/X/P4d+eOtCu3p5de36K1/L5AJtXntxk5z7989+fp39akQEOg2nHbjqM9T1GOvPIGMMG6VHtJ65AwFzkH2wR3PIAGT/s45r1f4QfCDxb8ZPEk+heHP7NsLHRdPm1/wAaeNfEV0NM8EfDvwjZ7Pt/ivxprkiNHpmmWYOy2gQTajq9+9tpekWN/ql5aWkmWJxFDC0J18RUVOnTV5NtNO6SSjy6tu1kk3JuyWu/RSpVKsowprmnJq0ddLcustNFbVvW2nfXN+Hnw18YfFjxVZeDvBGltqesXUVxeztK6WumaFpOnwm71PxJ4j1Kcx2ui+HNEtYXvdW1S9lhgtrWJ2JZzHHJ9D6j8TPBXh641DTYvE48RDRHfS11jT9OvUtfElxYW/lTanoazIkj6Rc3SObC5u1t5Li3KStFEz7aw/iN8XfCfhvwrqHwQ/Z5fU7L4aXUluPiD8StSthpPjv49atZSCRLvWI1d7rwx8MrO43S+FPh1DMQ6eVrXi2TUdceNNO+VncqRnYoIGFGAOAqjCgAKAAMAAEjIIGRXRwvxDnGBrYrHUacMPhcVSVGjg60Juq1Fx5cRWs4uE7O1On9lP8AeNzvGOOeZLl+Np4bDVnOdahP2k6tNpRTajejBWalFvebWvL7tkrv6k0y/wD2c/idpNnYeLJPFnwL+IEMEkMvxBs0vfiR8L/F1y1xLJFqHizwgoTxt4HvpozHFeal4Uu/FmmkxedH4UtnklasbxX+zP8AFPQNCn8Y+HLLSPix8P7YNLN8QfhBq8Hj/wAO2NsGOJdetdNT/hJvB7MDua38ZaBoE8fIaLcpz86CXaODtPOSMDI4HOeoOOQcDBGVxyOh8L+LvFfgnWrTxJ4L8S6/4P8AEVmwltde8MaxqGg6tCVbIC32mT20pTn5omdo35V42UkV4tfBZpDEVsZg8fJvEVqlerhsWnVpOVSXNNQqXVWndyduaVSMUko00kd9OvhnTp0amHSVOEKcKlJOElGCjGKlG3LJJb2UX3b3OeE0bsQhDFSVbDKSTkKcn7w5yCSCQeCM5qZAuTkZbry3GO5Izt4/iwBjivpJvj9onj1lt/j58KPDHxLuXcmf4jeDja/Cf4wqSSz3d94g8PabN4R8YXmcySy+N/BmtahdHeH1WJ2aZZ4fgl8PfHhEvwT+MWh32pTsvl/Db4yiw+FXjwTOxBs9K8R3l/c/DHxQ4bCQyL4r0DULzbvTQ4iyxDB5tLDPkzHC1cG0l++gvbYZ3tr7SCUqceazbrU6frte3gVVSlhqsZqy9x+7UVrO1pXu3taLkr66O9vm+IKrDg9iQM4ySNvuOCdwPQ9fu1uxyR7Rg5CMoyCARwOBjB2nBz+RHzc73jT4beO/hrqf9jePvB3iPwVqRBMNt4k0q60xr2IgFLnTrm4iFlqto4IaG90+5u7adMSQzSQ4NciN0Yw6kE7WUD7rA7TuBXgjIBJHAPAOa71iKOJoRqYerTqLRJxlGd9I3el7aaK2y7bmFOjOnOTqRnGUdNUk7aarRa9dLK17tHsPww+K/jT4QeOfC/xI+HniO98J+MfBuqQaxoGuWMiia1urckGGaJyYb7Tr2JpbLVNOu0mtNQ0+4nsruGS2nmQ/oJ8f/CHhL9sH4e+Iv2zfgVo8Oj+PtDENz+138CNKEtxP4L1W48u3t/jX8PNOVfPuPhL4jkQJrlnF57+B9ZPk3OzTLiKaP8nBO2dpBwpGRjHcDgk+3GMfiRz7J8E/jn8Rf2fviN4f+J/w21ldI8RaAZrdobq3S90LxFoeoRm11nwr4p0mUm11zwv4gsZJNP1nSrtZIbi3l81Ck8MEkfyGd5JUqV6Ob5byUc3wiahJq1PG0G1KeCxLSbcKlv3ctZUqijOKaUov6PLcxpwpVMvxbdTA4hpz3c6NXRRr0uzjtJKynG97NpryjUHBLBSoXPUY27SMqV+bGCBxlecsScVzssbAjOOn6DI549hjBPr34/Q39or4N+APiR8PR+2H+zFpJ034X6jq9ppXxx+DFvKb3Vv2aviPqrO0NtCir9ovPg74xuBcTeBvEkkZh0+Vj4c1GWK7ito5Pgw2sh+YgKSRjGApyMD5h8pzkYIwDnAIzk+1lGbQzLDqpTi6VWD9nisNUXLWw2IhZ1KdSKtqt07ONSNqkG4yTflZjl88JUtN88JpTpVoLmVWlKzhOMtN+104u6aTul9AfsywpPY/tLaO3zf2z+y/8QpI0OP3k3h/VvCviNSAcMTGNNd1GDzGTjox+Y5ACoP3jjqpOBnJ7c8BRz0xk8jp9U/srwC4+JPiPRgTjxJ8E/jloQQZPmy3Hwz168hQfxE/aLFHXIOCM4+XJ+XGjDQRk5AMant2RDj16nAC9SeADghZdaOd5rG7j7SODr673lCVN2V76exte3TpsTior6lgJp3t7Wne1usZff7z6a3M4bfmwMEEHryM4HoO/fk9s8VJHgcgZyACOTzkHpjpx+v93Ipm0hvnBGQAOQMgAY4HscnkEbTkZBwEgYCnjrkdfYdsj65/KvpXv32+6y+f5fI8tq/d3tbsl7t2n+rtftqdR4Q8Ya34B8WeGPHPhW5ex8SeD9e03xNot22Skeo6RdRXluske795azNEYbq3z5c9tLLDIGjlkB9A+P3hzQtH8fN4h8F2v2T4efFHSbP4n/D+2R90Wl6D4oluH1PwpvDbZJvA3im017wZPhdxfQhOQI7hS3ipJZvmGfYnBbtjIHpz0PHIxjA9l0/VbXxb8In8CXzySeKPAfiO78XfD4pbyzyT+FdeslHxH8M+arYiitLnTdG8ZadG4EcbW/ilU/0nUQs3nYul7DGYbMKabvbDYpK7bpSa5Ju27pVN217sZ1GzsozjUw9XCzld39rSvLaorKUb6L3o7K13JJJHi7MCDggcD/Izzn/PHWo0WSUiOMFy2DhRwBkDLE/Kq+rOygH3qaeFIwHDq8ZwOBtbBCsoxtOeOMj5eBnOAajVyT5ajbGQSI1wAxyeW53MxxnBOOAQAOvpXi9k72VtdN47OztvbW21tLnEoJOzT0s1dbpWerd727u2vXXS7Elpb4a6Ju5IyG+yW8gjgyCDi4uwNzJz86W6BicYnQ8179+zdD/wl3x7+EWg61b2Z8Jz+NNPm1vRYkkg0ybQrKOXUdZhuVhP2ieN9LsZ1nkllkPlsXJLHcPn5EC4BHpgcgcnsBjrx14BHOMcfS37NWNO8VeNPFLIF/4Qf4LfFzxMsmAPJvLjwZeeFtJkBYHa39q+JLIRtgbpSm18kZ8bOp1KOWYyrSqSp1fYzjRnGThKFWpFU4ODjaSkm1yvo/VnfgYQrYqjTqQU4OS9pFxUlKnFqUuaLunG0eq9e53fwi+Nvgyzv/FXhP4teGY/EPwe+JEpsfElnp9rHceJ/By29zcSeHPGvw/1K5jNzYa74YNwHksBK1lrtjH/AGff282QD558fPgDrXwU1nS7iPVLPxt8OfGttJrPwy+KGhBm8O+N9A3IQ6Mc/wBleIdODpbeIPDl4y32mXodWWSJo7ibw4P9m2Kj8xhAMnJQ7V3Hp1K4B3cHJABODX038E/jzpfhXRtY+E3xd0i78ffs/wDja5jn8SeFonU674I1vaYrX4j/AA1vJVP9keLNHWXzbi1jKWHiKyWfTtUhkEiyJ5uZYfMcFiY55hKlfF+0pUFmeAqSlL6zGnCnBYig5fDiacEk1flrxSi2pWkujCSwlWg8vq04UIQlUlhMRCKgqbm+Z05xilzU3J7pc0LtrRNHyTIEYZbgcgcDI4B7nPUAEYyvXpjNJlQAnkjA6/w7QCPfjrgKO4xwc/Qfx5+Beo/BrWdIv7LWrbx58LfHlm+t/Cz4oaNGRonjLQd4VobgFnXR/FmkM32TxH4bumW+069U7Ukglhkk+fm2leuAe27LZ4HJzjuDg8cDHAwfoMBjaONoU8ThqinSqRSta06buuaE47xnGV1KMrSi000jzsRhqmFqyp1FqmtP5lo3KLs1KLvpJevkosAcjOOAoPAPHOGA5xjvnP0yKTPQ9B6dc56dM/p6045HDgDgAHPzEjuOCOMkdB154wAxhjkDORxzwAAcZAyvIzk/3RkEDBPbJaJ76d1ptv31e+m/oc7jLRK2rWvR7X67a2v0b110Ak8468Y9OvP04x+fHTNA75znjPoeO3btz/8AqFNzuAPK9O+eTj064PQ+3ucOGMcZPUZz79jx+np14FLZbJ3t99lpdNXutbK6vbVsb0j07fPTrfW+9tl3ukLzz29/5cHPuD9PyX8Ofr/n+nb8Sj/P+fpUt33/AK/r7l0I/AKQ9OhP0/zz/POCORS/5/l/n37dKKE7Nau3W1/n2AT5cAjk885OOx56++cjrjJzgUvQYAyeM9s/QcAeuPbtSDGOOAc9P88f57UhJHpjjOM5/wDr5PHTPP41SctbX+fVq2jdtL2272vcfX06Pr5W/T5big5/z/nPPeky2RjHPrx2B+v4YOO9Ge+B78nj8hz6enHXrgz0IwexPTHuR3HPQ9OvuBb7LZJX2vp127u636boaW+nkrvrpbVb6O+m/QUZ5yf8+vbPv05zjij/ADnPvznHf+fOcUA5HbP/ANYH2/Dn688UD06f57fT/PUVPfRa+Wy0s/6/UT+X+WzX4evnqLx3/wA96KQjOOP/AK3I/wA+/fFHvS/EX9fl9/8AWouP8efy7/560mBnpyef/r+2cfifpwHP0Hftx659v88ZpANv0/zxj/DknPHJp9rN37K/9dOnYdtN9W7WHDHf/wCuemOuenHP/wBbCc8+h9eoPt7deD/hg65/Qj6f/X4+nXmm5I5IAA+pIz+mMjt0GOBTiru3Xdp7W0e/n5XfS2oWfz7fc19/39B3cD8frjH9T9Rj3pD0wc89wCeRjt7+nT35pQQfxwfwx1P8vy9aCeDwCOwwBk8jqODjpwx9OQAK29So7pq/azT1+H8JNuz2fRprRx5JJK9MA54yWIAyMDPykgd8HoBmnlF2kj5c5HBxxyOoOec8YHPYg0mVOVAxgY6HcCBu9sAZIHPfGc5NSAAcAhscfTrjqNvsc9e9TJ2X47rTVPXVX36PfR7hdxUW1re71teHu2i7Lbs326i8Yx09Mdv6f5/N4yOmGxkBhznpk8EYPbpg9Oq0we/H1/8Ard/0qQN8xwfu7scg55BB4Gc/7P8AFxgcilH4V6q3l7yvqRr/AF/n8/xKWBnPfp2+bj/63t09KaxGG4wdpGOnb6jp9c9x1yRWB684wehzzx069ePr2oIZsg9CDjgZGcbeCD69+gyT2qWrWUraW+7R27PR7b/LR0t9bWVtellbbvp0/UUhScHgk4zz7fl1H4/iCpAUHAPAPJ4P48Ag+v05waYT82MkHOVO088rjPBA5GCenQ55xTiCRjqeM8gdwCRx2yT19eD2O2+qtZ6r7Mr+SWz/AKsW2vbXr5adf7ut9kBx1x3AyT0GRntnHToBnAzjINKPpjPOOPp2/P8AHFHXPGO3P6+38+eo4o/zzjn8v8P1qem2/Xy02/Ld22suqfy6d+33evZ7aB3HPXt1/L04H09s0D07Y4/z/wDroPr6c9v6/wD1qAcjPX/63Ht1/wA46U1tHqr9vPbvt0/Pov8Ahvv/AOGEycEkHPQDjtn8+P8AEDFG4HnB7/XH4Z74Hb17Ggkd+o55HI6njPHbtnpRwQcHGccnP584/A+w54wGknb3fuvsuXo276dtXd6PRlLV6x7bJ+Xr0189e6aMjrgjp3wevPcdD69PfPJu/wBknv0/In6Y6e2AcYNAwc49O2eR1PHQ9eeMjPXJpTjH0yfXp17j1x7UX1X/AAUkvdl31st3pd+iSel13dvVbW29N1rrt0Ggg5yOh4/xHA5z6jPOBycUoJLdMAZB9+44/HPtk0DB6Y5HGOoH49gfbHTil7jH44x6Y5H8v/rClfV+6lp16bbba/j+N1ffRddG9Ft00WtvW9u2of8AP5GgHtn2P/1+v60v+fypOn4n+f8AnvS9fwSvrb9Nv8iQxn2I6f5z0478/Q0E47E+v05/OkPXOfoOOfbn1+oHT0pOhJ7E/T8Rxg/gc465PFNa9b2tor915f8ABvrqNLXvtp31Wl+m+4u7tg546Y4+ufr3/EcikyMj5T/e4HOenT8wc/qDS9z746A5/E/48jPUcUgweR0GfQd/0HXPTPGc81SW2jV+qvZXtb110S2tvrctJaNrtdt6dHrpbyS6632EYjuCe/cev+H5Z9KdgE4I6cdOOxGP8j0Pam8A8kk5/wAMZ5z9CTjv7l5+nP8ALp6de2eeRn0qXpbfyd3ZvS9lo7fde++gmrcttFve7fZ3s7fhv26Bx9Pp7Dp+RyB+OKCA2OvHTsaQ88jBH0z+P1HPTk9OtO747/r27df59+9JO1mt9b3/AKuv613SnW6d7P8AJ7a/r318wKnG4MABjIyMc479NxAHGcgeneUAFfUZ5PHUHgEAY7ckcHGR60gVnwq5z8oIIYjII7cA9uMemDzuE8SquA4CjuAAMjrkA56j6nP97Iq24xhfdq2iSTV0rW1u3fX/AD1tXZLdvpvqotX023dlt8kTIDkDHYAcEgkFeM46lunBAOO4yPrj9mn4FaL8Q18TfE/4qapd+Ef2fvhVHbX/AMRvFFsqjUtevrgo2j/DPwQsuEvvGni6YC0t0jDppNlJLqd0EEcKyeV/Az4Naz8bfGn/AAj1jqNn4b8M6Hp1z4m+Inj7WP3fh74d+BtNUSav4l1mfAQOiD7LpOn5E+r6tLa6fbI0kx2+n/tAfHjw/wCNbfwx8JfhHYX3hb9nr4VGe28BaJeYj1nxjrlwrJrfxU8dqmBeeLvE8iO9sswZdC0h4dNtRG73Rf5PNsXiMfVjk+WzcKk1GWOxcLP6nhpSV4xd9cTWScaKatBJ1ZJWjGXv5dhaOGpf2jjYxcYNvDYeX/MRVilaUorVUoP45Jrmvyxau2sb9oX48a18cPFFpqL6XZ+E/BHhHS4/Cfws+GujMR4d+G/gi0cmx0PS4zgT6ld86h4j11x9u1zWZZ7y6fy1toofmmcl8sByT/eUA8kdM4ABOCBhck9TVuWcsxIc56nBOCTkfdzjp3IIPzDg5qAKJO4wcn3HXA5746nnnP4+vgcuoYDD0cNhqfJTppRi7ttuycpy1bcm7ylOV3Jycm7nmYzGVsXWlVqSfNN66bxSSSSTsoxVrRSSS0vdHstqv2L9k7xJLsw3iL9o7whZ7ycF4vDHw28TXrqMHlUm1+IkjhGIGegHn/wr+HVx8UvGlh4WTUItD0aG2vfEPjPxVdKWsPB3gfQY/t3ijxPeAbTs0/ToXWxtiS+oarPp+nQ75r2JT7L4ms47P9lD4WxD5Drvxz+LGtSJjaHj0Hwb8PNHgk3HCsqPqFwg56krnJzWZ44jl+C/w1t/hJbZt/iH8TrTQ/GXxnuhhLzQvCpMOsfDz4Ssd3mwzTRyWnjzxvaEoW1C68M6RdRpPoN0h8KGIly4mhhnbE43McTCMlr7OFKcaFWs009KUKeiekpuEPt6et7KDVGpU/h0MPSbu2uaVRKagv8AE3bTXl5nqji/i58Rrfx/4mguNAsptD8AeE9Li8GfDLwvKwY+HvAulzTNp6XbKAs+va7cT3XiLxRqGFl1LxBqt/cykRCGOPywcjOOcgg85C7WA7ZGdvHrgHOM5jjO9S3G4Z4OcHpjH0wMHOMDB7sJQW2jjHABHvtPb0x/IelfU4PC0sHQp0KS9yEYrV80pNcqbk3rKUn70pNtuV+bVu/iV606tSU6ktZSe+ijFWSjGC0VrW2tpa1nYtQEllG4ewx1GQTklsZB4GV69wTx9mfsYeCfD+r/ABUk+JXj22Fz8Lf2fPDl/wDHL4hwTFWg1SLwjNbN4P8AB7bwY3uPGnjiTQNDitZAWubWa9KqRCa+NoAAQDlSFLFgRwq9CSflHXGckZJHBINfd/jydPgj+yH8OvhZHm08eftM6rZ/Hn4lgM0d5YfCnw091ovwT8KXSgNIkGual/wkHxBkhZgk8UmhzhTtRq+c4lq1J4ejlWGly4jNq0cK5xsnDDu0sVVg4r3eShGbpy0XtXTTtdJ+nkdOKrVMZWipUsHB1mrK06l4qnC17WlU5U42vZSfS58k/Enx14g+J3jjxf8AEPxbdG88S+OvE2s+K9buWZ3Lanrl7Lfyou4llt7Xzxa2sfSG2t4I1VBGqjzV2JkK4PcEkHBwB685OPU5wQuMsRozzZZiMg8nd94FsgkdunOOAfTJAU5pYEZ7scnI+XOAT8oI754OOSCAcYr6XBYeGFw9GhTpqNOlTjShFaRjCMIpJLsu3lt0POr154irUqzXvTqSk5Nt6uz113ad++mrtsBhngc/hk56fXjk+lLnoMfh2GOcenTP6Zx2QKAc5IzjjgfmOOv0HenAEnaDz1xwOOen0x34wec1s7N3s7ad91a6evyb3vbfrztJuyu313u9Yqz3dv8ALTqhmcHJyAe/OO+OwPAyPwzjvU8Q3sFUjkgYyecsMjgE5x2wSDzxjIYqFmijRWZ5nEUceHaSaR2RUjhiQM8sjsRtRELM5AUHOK+oNB/Za8X6dpFl4v8AjXr/AIZ/Z38D3scdzZXvxOln/wCFgeI7KRsiXwV8INKWfx/rzTRg/ZL2+07QfDcrupn162jZZDwY3MsHgow+sVoQnJ8sKcbzq1HZO1OjC9SpK32YJu/TXTooYWrXf7uDfKk25O0IpcuspytGNu7aX32bvgH4c8Qw2HxN1Sz0kTReMfhN42+Heg3E95DYvJrPiNtKhaeIzKBLZxW1tc288jFIx5jncWhkUcj4N/Z88c+JNLPijxHc+G/hJ8PrW5uNPu/iN8WNTfw34bkutPfyr+y8MaZFa33ivx/qlrIjRNpngbQNfuYpmVLv7EpMo9z0r4r/AAp09Do2m6p4hk0HQgun6PqGveHI9O1LV9PtQ0drf/2TpN5qdtps9+jLLNaS3ly0bPKjXErAyHivEmjfD342X41TSvifqPg3xxcSTLB4W+NN5Gngq5VWH2e28H/EW0M2neGYbkruj0bxjo+haXbTs5m8VsGAT2OJ8uyLLMnyfM8kzSpLHZtCDzaU6M68sKoU4NNYaKjPCyi5SjespRXK3ONk7Y5dVxuJxWKw2NoQ9hhJOOFipckat7XTrXaqxcbS9xrmbaTTMZ/HnwM+FxW2+FXhWf4weL7bIb4qfGPRYLTwhZXCFh9p8DfBVLm9srhY3Kvaan8S9S8QGQKkj+FNOlLRL4r458e+MviLrMniHx14m1jxZrJjEMN7rN21wLG2XiOy0myHl2GjabCo22+m6Xa2Wn28eyOK2jRQtSeO/hp49+GN9HZ+O/Cmr+GjfK0ml395FHPouuW4+VLzw/4jsJbzw/4gsHB3w3uj6leW8g+5Ic1wjsRgMCodSVJBBOMNkHvnqMENgAnqDXg5dg8vahiadb69WaTeKqVI1qjTUVJRsuSmr706UYQT0UV07MRUrp+zlTdCCafsYRcIWXK7tXvNxV0nJybW77yAKGJG7BGCOcZ655PYZyMcjjvgr8v908kDJ75PX3HAPv8AiaTGF6kjHOcEj298cjJ5BAPAyKMcAqSAMnvwM8898Y6cn68V7Nu23dbbK/Reml7JaM4krv7S27+V9d7vb0TYrgfdwecE5JOSCDgZPHTp16D6HynjBwOnXp0HT9CcfhQpJBz1B/l7ds/TP45oyfYEkdAckA5P9T1Oc4Gepht6K6vZXd9Vdd7u6vq9LJW9UtVpe9rPdpapXv3S0T8vKzSjrjnI5DE98d8d+fy59K+obU/2v+xd4ghZFkl8B/tTeEdRVsjMNr8SvhN4p066O1sFUmvfh5p6sRgF1UZLkY+YFJwSR6HI4Ix1OecA574I4z6V9O/CojU/2dP2tNAPzNpel/Ar4mW6k5KyeHPiengy+mQDcQUsfiPKkjcEISM4JB8HPXyUcHVVv3WZYFu3RVcRSoTd7aWhVl00d/I78tTlVrwVrVMJXurvVwiqi22u1ttpotm/mBSDyDycbh2BAI4yOf6c4Pcr+PT1/wD1+nrz0PrlhGyVlXGA2MkZGC388dSRxnpmnn36Hgd+eT0wf17jp6+60k1Z3TtbZ6aLzT30Sv5HnuNmt2nt3tfXdJd9tuttQLEZ5PAyRkg46cHPH61KswHJVh35/h98jOMc8Yx9c8Q8Y+9nBwD79M85/XjHtRlfXI7cY56/jg/TjryRRZSjyu7SbSvzabN2WltFs9fuLjre6bd7LdtXcbK2i0SXTvbSzNNZgURDGph6tEyoUYEAfNkMD95icj5WJAOSa99+HX7RHxE8BaK3gyaTRviB8MrmZpbv4SfFDTm8Y/D5zJuEtxo1lcTQax4I1VlbC+IfAWseGdegOHGoMiMh+ekdQi5JbIGPUDKjqSOc88/XPTFuCUFxgA8YyQ3IO3tnnHHbgn1Nedi8FhcXD2WIoQqJ2s52coSai1OEldwkvsyi009U76row+Iq0GnFyVrvraV7XTV7Nb6Ws7NX7fWx8O/s/wDxZdJfh7r15+z/AOObmRmX4f8AxW1mTxD8KdVnbd/o/hD4wR2kereF1kcpFZaX8TdHlsItyre/EFzukbkPFHwn8e/DLV4NF+I/hLVfDN3fRC40yW/SKbR9esHyE1Hw5rtlLd6D4k0mZQDHqeiahfWcg+7MSGx45ZbMc4YcZR9uzkjsQ3QZUnpzuPBGPpf4YfHvx58OtIk8KW1xpXi34c3cxudT+FfxC0yLxb8Pb6aQbZbi10a+cXPhvVHU/u9e8JXmh6/bPtlg1ON1Br5jG4PMcCm8FWeLoJJPC4ubVVR00pYmzlL3VpGtdtvWpBanrUK2GrOPtouhU0/e0klFu8WnOmnaz7wtFJOyb1Pvf4R+NfCH7Xvww8N/sn/tBeINN8PfFHwVYHSv2Sv2gPEMoj/smSZzNb/AP4p63MvmXXw88QTyLB4M168llbwdq0sNpvOlzvFX5w/E74Z+MfhR438S/Dj4g+HL/wAJ+NvCWr3OieI/DuqQ+Tdabf2xAaMfeW6s7iMx3Wn3sDy2t7ZSw3FtNLBNHI/0KIP2dfiuqr4P1u4/Z28aXYYv4S+Imo6h4s+Dt/cswKR+GfiTbWc/irwYjsuLe08b6ZrdlbttF14wihxIn3mnw/8AEn7Y3hLwt8Af2iNPj8D/ALYnhDwwun/sq/HfWNQ0+bwT+1B4P0q38yz+CHiXx9YXN34X8TeJbK1Vovhv4yg1q7uGC/2Drbo7Rq3wlHMo8O4udVQrYfLcTN1cZl2Ig4VMvqylFzxmEinyVcG5NyxMaM5xpXdZWXOl9JPBrNcNBXjUxVCKjSxFNpxxMUoqFKq7XjWS0pOok5JqNublb/E6Kwy4G3PHJwQRg+4IHGSQwJHJXuK+s/2dfhf4/wDE2mfE7xL4T8F69r/hDwD4c0vxH8SPE+madcT6N4K0+81m30XRbvxDfqqW1jHq2qailjYwySefczGVoI3jt53j0vgN+yD8ZPjn8cLn4GaX4en8HeIvCtxqUnxW1bxrBLo2h/Brw94dkkXxV4m+Id1drCuj2egxW91tguHW41S8ji0+wSW4uEB/Yf4RfE34C3WvXnwR+EdjeTf8E9/2KvCviP8AaD/aG8T6pnTdb/bD+JWhQxaJ4Qm+IDQPG0uifEH4iajoXgL4a+C5S9tpPg+41rUooYr2ea6X6T/iJ9ThLNMBj8qw0M1rYSdHE4qFOV6MMDVlGHs3UTUVicapOjgaV+adSany8kZM8atwk84wOJw+KqPB06sHSozl8TrR5Zcyi9fZUeVzqzdlGEXFNySv+WLWywgyvhUA3MxyEVOTu4yAMMD14JGTgV4X+074Y8TeEPFGi+HfGfgzX/CGuJ4U0jxHDaeI9HutG1LUdD8UwR6noGrW0F5HDJc6Jf2Drd6feRxtBMkrGKV1wR9qfslz+GvjV+0H/wAKz8UaLpVjN8YvCvxa8OfDNNLur7TbTwL8ZfEfgrxDqXwmm08JO5vtNsfF9np3h+z0u/W4hnh1CIzl7iFS/R/CPx94Y/bu+FXhf9jv9pfxNZeFP2g/AlrcaP8Asg/tFeL5/KNxdG4uJJP2afjPrdyWmuPDOrX7Na/D/wASanI83hrVZBpcz/Z5lin/AFLxD8a6WbUMPluU5XiaeBp08JjM8qYiMVisPRxCmqc8LGnKpGrToVaUlindy5bzinFNS+S4X8P54KdXE4vG0p4hynRwMaUpOlVnBK8akpqFpTjKKprVN3Td7H4k3MDOxJRiA3QDIxx3OfU8jHHUd6yZLcq5cIyuCeoz1A6DJBIOcjkZ+YdAR9DfEz4S+NPhF428U/Df4j+FtV8G+O/BWq3Wi+JvC+t27W9/pep2rhHidSStxbTIY7jT7+3aW1vrSaC7tJpbaaKVvGr63CMwwucjAxgoSevXKjnue3IzkV81hMwpYihRrUK0alGrGM4ThJSjOMlGz5k2ndW62unfQ9mrQnRqVIVIunOGkuZO8ZRcb3vqrNK+l9baLV+m/CH4u6f4M0/Xfhv8SNHvfGnwO8ez283jDwjazRx6x4e123ie3034m/Da7uQ1voPxF8OxSMscnGm+KdHFz4a8RQ3Ol3YNlzPxk+Dmo/CjVdFurXWbTxr8PPG1lNrfwy+J2jRSRaF458PxyrDKWt5Xkk0PxVokrJp3i/wjfyf2n4d1ZXt7gTWs+n6hfeYXOVY45bPAPBPIIGAQckHK/NxwQCcCve/gx8XNE8O6bq3wm+L2n6h4q+Afjm+gvPEWkab5b+Jvh34nij+zaf8AFf4YPckQ2Xi7RYpTHqukPJFpfjbQlufDutACSyvdP5K0K2ArzzDArnp1HfGYSLsqySSlWpQassTGKWi0qpcsmpKDVU5xxEFhcRpKLtRrO7cG3H3Hqm4S2js1e60un81MpYnk8gbQBk9B6jHJJ44xnk5zQVIGcjHIOOvHtjOMj6V7l8bvgjr3wY8RafaXOpaf4u8IeLNMXxN8NfiV4e8x/CfxJ8GXMpjtfEuiPNuls76GRWsvE3hm+MeseF9agu9J1W2inhWSbxEDIJXv3HPbAOe/AzX0WCxVLG4anXoTjOnJKzTTadknGS+KMotWcHqmmmk1r5mIoToVZU5Qd1Z3v0sttXdNbPfXuVzkd/Y54/Pj1xSr8xwMjnnAJ/DHB9ugxmp/szFeMtwOOSzEt0GM/ln06A/L7V8Ifgnd/ElNe8V69r9t8Ovg/wCABazfEr4p61bNdaZoi3u86f4W8L6chim8YfE/xMsE0fhPwRp8y3F48dxqur3GkeG9O1PV7YxeMw2BoutiJOMYvRWvKTbUYwjFJynOcrQhCKblJqMU3u8Php4iooUtZXT1eiSa5pSdrJRWsnJ2Su2VPg/8Gte+L2qaolrfaZ4R8GeELBNd+JHxM8TNJB4Q+HnhzzBGdR1a4jiaa91nUJA1p4b8Mack+t+JNUaLT9MtZW82SPpvi78YfD954ag+CnwR07VfCfwQ0bUYdTvJdUMcXjP4zeKLLekHxC+KctqzxSyR+ZMPB/gqF5ND8GWExit1vNZn1DWLyj8VvjdZ+L9L074ZfDTQLj4ffAjwnfNe+GvBct3Hd654n1xoxBP8RvitrMEUA8WeP9VhU4laNNG8L2Mi6F4WsNO0+FzP4GxaRg3O5QRnP5E5PPIwAORwSRnFeVhMLXzKrHMMyg6dKnJSwmAk/wCGtLVa6TalXaXuxu4UtopyvM7q9Slg6cqGHfNN6VsR1mna8IX1VNOO+jkmm7bNgmcFj8y5UIct1APQ84OMjbjjAUjqcGSccdB3/PHr3xnjGO/SoyCSeTz0/PAGO3Xr759cSDPA49znP+HJ/Hv+P0PM4xSjypWasktPh21flby3R5UpN/E+ZtpO7eyS9GtfLfe7WoBgn3/z/n0xThvGSrfL75yQRk468kjB9T3yaaDnp07dec+gx9Pr+HIdw24656g9Md+CPw7H8qSlJN6+t/lu+j0S16+YlJpq/dLrq9N7X7JS2sm2+pajLqeNpPIywBG3nPX8enyjJKjkgzb8JtcLIGPCyDzFIPXh84ypYHGPvEjHAWruC9CSMAlf94gjPPbPPPQ+uaXcSRzxjoAT2GOvPvx0JxWUmpVLcsXey1SfNe27a202+XU0UpxdlJxV9ErpWVlv06baNr0PbvA/7QHxS8BaePDmleIotb8GzNuuPh54902x8ffDyfOVJHhXxPDqFhp0zA7RfaJ/ZepRkB4b6JlDDsJPEH7OHxHJ/t/wr4j/AGePE8hB/t3wDPe/Er4SXc7bgZ7zwP4gvR478LQO6l5X0TxR4qt7cbhaaFFHsQfMikHGScnOOefmPTpwD3HsevFPLMpBG7IAGVJ3YJGR97A7ZIxjAORnNeXVybC1Ksq1BzwVeTuqmGlyc8laLdWCXsqnTSpCf3799LHSgowqJV4dqqUvdSWkZX5kr9VKLtqfQGufs+fEC00m68T+CG8P/GXwVaq0134p+EepnxR/Ztso3mXxD4UeC08b+F/LBAlfXvDljbREOq3EuA7eIxTCQlSMmJ2jZMkPGyHBVkADKw5DggMhHI5xTtE1fV/DmqWmveG9Y1bw/rtm6y2es6FqV3pGqW0gIKtDeafLDOhHP3JMNjBODtP0RY/HVPGDxW/xy+Hvhf4rDARvGNhs+H/xYiHy5uG8Z+HbMaf4iuox8yN428O+JjIcq8qnLDjqf2tg0+alDMaMX8VHlp4lR92zdKpJUp7NSaqUr7KLskbReDrNcsnhqjUfdm24Nvl2afOldu3MpeqdzX/Zk+OPir9nrx+vjHRtOsPE2ga7pd34P+JPw48QLJP4S+KHw91ZRFrngzxRaAMr293EfP0vUFU3ei6rDaalYyJcQfP7X+1J+zZ4T8M+H9C/aJ/Z2vNT8V/sufEq9NtpM+oEXXib4MeNXRbjU/g38TPKybXVtKlMi+G9dmRLTxVo0cF7bSvcmdT55Z/DH4V+NVWb4R/FSzsdUmxs+HvxpjtPBHiYPJgGy0fxvbTT/D/XyrblhlvtQ8K3N04DjTkbCJ658Ifif8S/2RfFGt6B8TvhlqWt/B74p6Uvhn4vfCPxhayweFviX4TldfL1DQNYVJNMg8W6GXOo+DvGWiXM0tjfwoFuPs0sgPxeYYl0scs2yhulmVOKhjsqxPNhpZjhYuOihUUb4mlFt0K8VKnJ/upS5JXj9JhqCrYV4HHJzw83fDYynKNRYWrJR5buN37ObV6lNtOKtJK6s/CP2RIGm/aV+GNiwHlaxe+IvD7rgcprvg7xBpBjOMAhjdAbc/NuAGcjHy1dW32VpIHBEkMskB3Y+UwyGJhz1AKYPfIwcEV+rPhz4F+Ffgz+0/8As5/Fv4deLU8cfsyePPif4e1LwR8SNQdLS48P2bXtuniHwF8TNq+X4e8feB7a8aLWLW5WCLV9Lih13TPMsrmSO3/NL4i2E2leJfEFvJbyxQrr+uJZzSQukF5bRapcRwy2szII7iCSMK0csJMbghg7AjP0+SVqmZZhVzShh6/1DE5bhEq0qU4RhXp18RCrRqOUbRrUZNwnCT5otJPa54WZ04YTDU8FVrU/rVHEVP3akrunKFCcakbO7hUivdfW730R5zcqpAZeWHB698DsB3GOCOvU4BqhuCkjB55XHOc4yeeO/HTPbpWlIrSZKL94fMOdqjCjPAU5GQMn0xhgCaqFFiwgwxOM424AYDp3HGOh56jrz9fSd4ty1Sb16p3ju76W73117HhR+9ea1SaW9rdtG00knqQbthTapLAZ68DoeQPoMZ6nBHXA0dL1q50fUtP1W0W0a602+ttQt4r62F1Zzz2cyTRQXdqSEns5mjEN3bvmO4tnkgceXI1ZTYzw2Oo9OSMAdgAecgADBJBz0WPKvuzlsf3SRjdgHBA6rxu6Zye/NVIxqU3FxTU4tWfMtHa9+nVty0d+reqq/s5RkldxaenlZtO2jX6WW92ey/GHw3pMcug/EHwXaNB8PviTDe6rodrGWZfCWvWc0S+MfhzcEsyifwpqs6No5lYzaj4Vv9C1Msz3Myp42ibDjBHcHsPx9e3HuD3r3/4MavpOrwa78G/GOoxWHhP4kXFlNoet3zBLbwN8T9NSSLwp4okkwRb6Xqv2iTwr4qYDy30bVP7QkV7jSLIr5P4m8Oaz4V1vV/DXiDTrjSdd0DUrvSdY026UpcWGpWMzW93bSDJUhJELIyFlkQrIjNGyM3lZbWlRnVy3ENutQtKhKTd62GbShJXes6f8Oo73UkpNe8jsxUVPlxdJLlq+7US2p1ko3itUlzbxvom3Z3MOOTlWAJ246YJwPxznryeeOT2r6N+F040r4RftKeImBV7rwh8P/h7aSZKr9o8YfEbR9Yuou4YvpPhC9BQHHlhsggE184oGBBXCgj5upzjOcDuRnpjk8jAJFe9M50j9lu5HC3Hj7492cEfGGl0z4beBriebB/55JqXjmA/KTiRcsFYLWOfc0qGEoRaXt8dhE00tqdaFaaeiTvClJO3fyaDLtKteq7ctLDVnbZpzp8kX2dpNWXdpNaNHhlxcMZHYOAGYYO4ex3Agkenyk9Mjp8ogE7A5U/MMnOMgDPJUEkH+LBOPXniqkzMAcDgkhFbdnqAcdME4J5AGcY6ABgZiMkkKnY8/Ug5zweATjk17iipU1GUbpRUWvd7RSt121fTfomcEW1FSutZd2pX923bVbv53Z9PfBL45aT4R0fWvhL8WtHuvHXwB8b3cdx4j8MW5Qa74L10KYrX4lfDO7nV00bxbpIYPdWgK6Z4lskk0zV4pY3jkj5r44fArWPgxqmi39rrFt46+Fvjm3bWPhd8VNFQrofjLQ8jMVxES50TxXpQYWviHwzeN9u028SXCy25iuJfCVcADBG4EYXuD8vJB3DowLbj34G0mvqD4DfHfTPB2la18JPizotz48/Z+8dXMc3iXwrHhtZ8G62qslr8RfhzcyZOleK9J8zzJ7aJ47XXrNZLG9Vi0cifM4zBYrK68szyyLqUpvmxuCWirr3b1qMdo4qMVorctZLllaXK16+GxFHF01hMXLllBcuHxGt6buvcmt3Tk3ZL7EtVdNo+YX2uQSrAEnrgj+EkYHHQfOMDGVLcdWSD5eV2lu+RkkgEgY5wOB74zzkV9EfHb4C6j8GNW0bUdP1m38dfCrx1ZtrPwv+J2kRs2i+LdGbBa0uyp2aR4s0kt9m1zQLkw3VpcIxMPlMGHz86rk/LjauR6EAjJOACvOcjocjAB4Ps4LHUMdh6eLw0+ejKGt9J05J2nCalZxnF6SjJXTTWlrrzcRQrYarKnUi04tNb2lFvRxadnGStaya13ZQBK8HkDnHVRx1zgZ7fMMenHQOVlK5BYgcEgZ5HJxjBIJzkZ55BJUDErKCDtBOfUcYyM8854HP4A5wMwNlMgZyT0znJY9TuHYg5J9cE16G9nZXdmt1pZXvp52+7QxtFpW8tbrlvZXfbeVk1st9NpSeeucn3+v9eD3KtS0mev+fTP/wCvtyPWj1PP/wCr0H+FZef6aPb+v+HItsrb2t53t+H/AAzDt6/U9/8A9f8A+qk4X1+nHHv69vWjPPseQR9MnnIx/XnnFBI689uB3PHv14HHUYOeoqkn52b27q6t131+Vmu4156p727aPurWejfTVX7JkDoDgev4gYB55OR296NwP8P0/Hp19cEnkAYzntQWHv3xkfgex9+x7g+lL06kjnnPOR+mB0PoCcU7et3Zat72Vm/Ru19k7Ky1Kst9b+d73stXa78t7J6W6iEgEDBKtjoBgdMdDk+h4Yc4I4NKCoYDHVhkDp6ZwO/bpnr+LcAEAkjoeBw2MAZOOOegGMDGQOBS8A8cEDce2BnPbv1AxyaNb9Va7b1tJK2unlv3766K2vW2qa1WifzT3V3FfjqNyF2/L3IyAMAZAzn+7yevIAGM8EPPQ8n6jtz7c/X2B79WdMEYxliM/wAQGMYIz6cHqMnHU5f36/3vbGSDgfn+fI9KUls99NXtp7u3z02013u7pu9ndysldu/l7vXba/X7rnTA5OT3PT7o/XPSjhsjORx0P/6/b8c0oIPIpOBwe5z6dfxHTjpznBxmktOnlf8Als1rr/n6qzEt+qat96a3v/wOiF/kP8/5/HjvTcgckc+xB64/X06cDuBS5Azk8YzjHbgD8M9fr+YSCM5yPoP5YPQe3Tr60100Wum7W6TSbW9/P8ilbzV9LrvZafPW91bttcMjn5T79PTk9enH9BmkyDngjjPpntnjHH6AdTS8ZPUYOf6Z4/EE9evpwKMf4DOMe/v7nnj60OyV9b6WtfqldX16ba9dtEFkkmr30/8Abb9/Pda37WAAdQMEj6/jz3xyevPPNAJyVGQDkk464PXJ7ZOeMn8OjXPzAjg9e2B/nHOe35U8YPGQcZ/Hscj8+OmPwrVtpLXs7X6aa+iWzBbK7vf5cu2t7dNLN7q1tCTIGFY8c8sRk4JJ6EYyevYkZ20NkZIPGTliegG7A4J/2R3wvbJJpvGDxwTypGeckDqCOgB57Zz3p/3Qy4LZ4I6ElmPzYAwQQM9AMjIHepte1m7Nbad1v0dnd6ttvvqhpXtdtXdmmtN4666ffo7Jbe6pMZ/A9P8APPb/ADxThlvlHGSD7cleOTnPb+pOKZgDj8fxGB6/l9Kcpz0HPH/oQwDz68Z56YyMGkrOKt5dNVqv8ru613stiVzbK9t7Wuui1vp2u/QpIyspcDHYjaACQCePxBHI7DGccPOSOOCfXjHf8/8AJqKHOCD0BGMdMHJwM5785/DGeRLn/P8A+rNJrZpXbtd99I7/AD06bCVlur7/AJafjuIcDnqOmD3JIxx0yeuB1P50ue5GF5yeD069+3ceh4OQRSE4IzkDnnpkEqOjdgPTuG+lNJIAIwQTkHHQHaR2GB1JJyc4xzS0dk2+i30Sur/le3S+2g1rZXe7snt076fnstBxJOCMnk5z3zjHcDueueR27qc8+/4c/h0H0HFJxz6cHuTwQc4x8vb8Owxil+hz1xz6/N/9f9eaTW2mi6t6JNp6vtrd7NXW/RPTa/n87W2879vPyTOSQQenXnGD9P8APBpce/8Ahj0I7j8jjv1ynXrjOSPxwcZ68EZPPTPegjOD6evQ85/D09fw4outNbW11V7PTXfZu/6rawt1rZff+Hn1DPOCRkjgj/OO3PODRkKDkg89APrn8z645Pp0MfNnPTtkcccfTgnI9aCF6YHOeQOmO/tTurrTon2s9G+m1lfTz76UrN/JN2STT012vbrp8gAAxz6cZz75984POM+mMUoHUZz1H5+vv78GkAwBnkjv/T8P8D9FOcZAzjH6nH+ew4pXv3bvvta3Lr+eunRuzsK/z28tra331tqum+6DHJ469cn68Y/yOaO+cc9Pwo/Qcf8A1x6en60dDjnPJ/X/AD/Wk/0W2vT9OvYm/wDl9wtIeh78dPX0/HI46fpS0mPw9Mfh2/8A1en1Fute39LzQEb4OFPPzAHpkc85wcj6nHA7kGlLKSwz0yWIx1yR788YPbk5weKaSxBOB3BAY8HK4Iyo9OhHryMGlPcKMZydx4GDyT0IGc5yecZ7jFapNWVu+l99Uk7fjZXte9jWzXKrPfVc2qd4L5O+tnffTa4/5QNpI6dCcfh1z+HPHtQMccgnvwPXrxz3Ofw685Tb0woJ9SMYH8/bufUHJpQoGRwQTkcc/wCR/nrUOyaXN7173tfst+luz3+4i6ukns/JPonby6u7S1113UDH16nPPP6cce3Sj6/nx7/yzil9PalAB4Jxnof/ANftn8anW/a9vL/LS607W8hNtvTy2+Xp12XTpoJw3yn8h19u/fH1/IATRp90kZPP3sjH4cHnAyRzyMnmljj24Y5wCQTkDvgEEAcH1HoeoOBbjjJwTwAMDJU9CTg7ODgA45Jx2yKqVTlflpZW6WT3T6elvXQaWrs+qtpftd6bet3dLfuyOM5IGc8EkjOAcYAwepz6nr06Z7r4cfDXxf8AFnxpoHw+8CaW2reJvEV15FlAWEVpaW8SCW+1fV7twsOnaLpNoJb/AFXUZ2WC2tIpZHO8xo2Poeh6n4i1fStD0LTLzWNa1zULPSdG0iwgae+1LU76eO2s7K0gRWaSa4meJAAMLncSoBI+3/ilfaN+yf4A1n9nzwHqVlqXxw8Z2Edr+0p8SNJnSf8A4RewkCTj4D+CNShbMNpbEo/xD1S1lEup3qro+8W8U0UfgZrmU6UqeBwa58fif4cbNqhTXKp4isk01TpN6aL2s2oLVtx9nLsHCUZYrEvkw9HlcrpXqSk4uFGmrW5pJWdvhjdtX0fnPxv+I3g/wP4MH7MXwO1WLVPAul6lBqnxc+Jlsphu/jr8RtNGxZ4nBMqfDHwfcedZ+DNEL+VqE4m8Q3glnuLVk+QBKQcuST3IOCVBPyj0AU8YyQQMHHFNkjWNtg25H3FQhQpHyqpAIAxx7cHaMYxVkkIG447dB69QCMHjr7dhzXVluXU8BSjFSlUqybqV602nOtWnyuVWclu7qyVrRgowjZJRWWNxbxVTrCEUo06cdIU6a0UEr6JWba3lK8tb3en5gI4J/HHHHJH1HUjjr+HReGtBu/EepR6dZyRRSCMzPJPkRrGrIpB2KXJZmVRkEfMM46jlLJZbueG1gjkuLi6ljt7W2hiknubmeZ0SKC3t4UeaeeV2WOKKFGlkchUV34r6u8JfDTUPhrrWky+PtV0bwt4n1WCUW/gDULyI+LLHT3gF1Hqnim2iL2vhEyNEI7PRdfurLxHckm4OkRWhimm+hyf+zsRnOX5fjq6hDFV4UpQU7S5ZSWt9oQbS5pPSL0vrr5OO+tUcFisTQpuUqNJyTcbpWs+u7stEnr2019w0LR/D+m+Cvg//AG3ZR+JV+Cmk/FTxtd+Dpo4TZ+LviDr+t22peFtHuF2yeb4YW00HSLnxJ500U1zZWd3p1sB9tUr8CeKdf1fxbrWr+KPEF9capr/iLU77W9Z1K5YPc6hqmo3D3V7dTOQCrS3EjsqAKsaFI41SNVRfuq68ReG7WwvXufEmjWtqbK5hnnS/tbuWCJ7Z4fOjs4p0luXh84MbaI+dIiuke53Va+PvGPws8U+DtIsvE4l0/wAX+ANRaOHSfiP4NuH1bwhc3bqrf2VqVzsS88L6/EQ6XHh7xRZ6RqytFI8NtcW3l3L9XF3DvDvDGY4SWXV3KpjvrDl7WtGrCEnXVVwptJKMqkqsm7+8+VbqGmGS5pmmcYSssVTjD6q6UY8lOUJSiqUKfNJP3mlGEFpZJyctL3PL49wO7bjI64wc9NuR6HcOxAAHarUaqz4I2nI9+cjgDgfXrwSR2NPaJ0VSVwXAIwRgqfukYzwc7ux7dCM1mLRkEDr65BBwD3JxgcnORyD2rwryUXJNWaS3Uk07Ju+34d9tztcZOSjbR28nut33005unXRW+gP2cfhCfjf8ZfBPw9vLkaX4dvr6fWvHOtO2yHw98OfC1pN4i8e6/cS5AjXTPDGmai0DMQj3stpbktJMpMf7R3xg/wCF1/Gbxz8RLS3GmaBq2pQ6Z4M0Jflt/Dfw+8NWlv4f8C6BbxYCW8OmeGdN06NoUAUXLXEhUNJz7N4CuB8Ff2RPHXxGlItPH37T2s3XwV8Bucpd2Pwg8JT2erfF3xBbOuStv4m13+wvA63Me3zYLTWYlzGZQ3xBIxkYsMnGQg+YgcgAspI9B2xjJ6g18vly/tHO8ZmM7/V8DfL8G3dpyUoTxlWD21qRhQWiSdCeqUme9irYTLsPhY/xcSliK9lZ2atQpyVt1FyqLe/Ouo2RwVYj+9zknPUfLnJHTaOOuQeBSIoKjAzuAIxyQcdTgDj1wOeOpGa6Lwf4J8V+PtZi8PeDPDes+K9buFMx07QrKa+lihUAvdXskcYt9OsoVDPdX9/Pb2tvEGlmmRAxr3H/AIVn8J/hsob4u/EA+K/EkAJb4WfBDUNJ1y7tZk5+y+L/AIsXEd54J0Ig7Vlg8KW3jm+UbonFlMCy+9is2weHapJ1MRXk0o0KEPaVGrK3NGOkIN/bk4QT0bi2eZTwtWpFS5VCmn71Sq1GPTa+raWto3bSbtorfPumaVqetaha6Lo2n3+r6xfzJbWGk6RZ3Op6rfXDkbILPT7SGa5uJiWG2KJHck/dPSveP+FE6Z4D2Xv7QPjuy+GMqIJV+G3hq1tPH3xqvgQDHBc+GbLULXw74DaQALI/j/xFot/ahvNXQb7b5LRah+0B4isNOvfD3wo0TQfgb4ZvoGsr628ANeyeNNcs5AVeHxV8UdWmufGurRTo7C606x1LRvD8zZ8vRIUwg8KVDJvbaS0r+ZK5LPJI7Hc8kzv+8kd+S7uzMxJLE555P+FPGJuo45bhnb3YctTFTTtfmk06VJ2W0Y1dEmpR1apfVcPdQTxNWOl5KUKSfup2WkpJ768rWzXR/QsX7QWneAi1p+z18PdN+Fc4Uwv8SvEt3b/EL43XsbKyPNbeK9Q0618O+A3mSQkL8PvDOh6hbrtQ63duhmbwXVta1fX9VvNb17VdT1zXdRme5vtZ1zUbrV9Wv53Jd5rrU7+a5vLiVyx8wyyvuY5HTNOj08ABsZ3cA4J2nOGbI57d87gTjkDPsXwm0O2uZtauLu2gumjWxiiNzAkmwt5ruY/MBA3iNRnAJGBnvXscOZFhcwzWjgcOorE4hSTxVbmrVbQi5uUpzbk0kmlG9ltGyslxZlj61HCzrTk/Z07Wpwapwu2oLlivdik7N3infR3dzxFLiWEADLAnKr8oIBC9ccnacFcEgYG0sCRT2vpNjKRlWG1gV3A593+UBlyOAMZHHr9o3vhfSLi2mhk0uwImikjDLZwLIheNgpjIG5WU7WVs8EAg8Cvj2705YWeMqVClkUnklkcplxtz0VRn+IkgYxX0vE3DNfhyWEWIqUsRTxnO4SjFwadJUnJSi02m+dNe89Tysux7xvtJQi4Oly8zve/M1sopWtyt7Wd3udd4N+L/AI/+H9rcaT4e12OfwxfP5uqeBfE+nWHi74f6uWGT/aHg7xBb3+hGbnC6hbWtrqcJIltr2CVRIOte9/Z++Ief7U0rVP2e/FUoOdT8NHVfH/wevrnaoD3fhi+uJ/H/AIJgldd0s2j6z41sYSxFr4ftoFEa+HPBnBGRkck5+vTAOeRwQBnnOCMUmQoSQpJJ27iR2P8AdKnjjnB4zx8pzXxVTLcPVk61CVTB4j3b1sP7nM21f2kXelVSv/y8hJ2u0up71PF1FFRqL2sE17lRPTWN7S+KO+qUk3o3bc9a8W/BDx/4V0aTxVBZ6d438BbuPiH8OtSj8YeEIkZwEOq3ViP7S8Lzv3svFmm6Hfocq1qCDjyMMrR5R0dQAFdSGByMggru474yDz3GK6Xwn4t8VeA9Xi17wV4l1vwprUfynUtB1G40+eaJjloLqO3dYby2kU7ZbW9jntZkLedHIhr1w/E/4feN5dvxh+Gdr/akhIf4i/BsaZ4C8VO7f8veueCTZt8OfFDAjzJjaaX4T1S8feZ9cMrllj6xmWEsq9GOPpLT2uHShWUU0k50ZNRm1u3CXM38NPcHDDVv4cpYeV7qE7uHNaN2pKzWuyaaSur31fz8GBz+uM9PUnGB+Jz6U4fTngeufoPqT1r6Lj/Z9ufGSS3/AMDPG2g/GSFI2uG8HQRN4N+MFhAgG5br4c67cuPEEsahtzeANa8XbwhkKR5IHgeo6Zf6RqF3pOrWN3pOq2LvFf6VqdpcadqVhMjBWgvbC8ihu7a4Vsq0UsSuCMEDBUdGHzHB4puFGry1UkpUaicK0XppKlUUZR1Ta5l71tFYxq4arSSco+41pNXcXts4pp30vfZ7IzWJPAHPBJPAAyM9COeOOvfFfTX7NZ/tKD9ozwgSC3iv9lX4qmBO0l54EufDnxNtlXOAzKvgyaRQPmypxgivmQk84+6ceo47ZGR0B7YHOT1r6Y/Y/dZf2ifAWiXDYt/HFh47+G0yk8Sj4h/DzxV4SgjdWzuMl5q9qAvILYGD0rkz9L+yMZPlTdCksSrveVBwrRfZWlBPS7a3123y98uLoRSd5z9nJrW8akVF7dPetvby3Pmd+ZHkXADEkgfMNoCspBXHJGD1+8cdRTgSc5PXvyDnp6DqeR/UUkcZjjijYlZI0WObceRLGBHIpBP3ldSDnjOQRjdUvlcHnHHbqfqO3XPyivYpz5qVKSu704O9tm4w1va7sntrd2T0tbkqtqcoyunFuK7JXXbo1dve99urj4Hy5GOc/wAyOw+o9O3NKMDccj16Z5zjnGf5djn1qfYM5wOf9nk9O/4dOB61Ike7kAYHJYkBe3VjxnkdSD6kZ4tNK0m/dWrb+V7t6f8Abr3st7ji1orOTbTt16LXdq+jX/DEaABADgZLD35JbOQTx3B4PYDAFWogp2AnawI4wTn6d88MQfqW9+v8GfD/AMY/EfU4tB8AeDvFnjvWp2Cx6X4K8O6t4mvSx5y0WkWd00SLtbc0pjRQOXUHJ+g5P2QfHPhWJbr4zeNfhH8AbcLvax+JXjyw1Xx0E2hjGnww+G6eNvHkdyw/1cGqaJpSlj5cs8GGx4uNzfLsNP2dTE0/a6uNKElOtNJKyjTg5VJ2s17qfp37KWCxFaCnCMlFfFOXuRj5uUrL5tLVPbr84WTpkDBYgKuBkgYIAxgZ+bHQnr2711Foir8zsqrnBV22kEcgn04Ddf4sAAg8+qrF+yj4ImCi/wDjV8f9TiYArY2uh/AbwDJMuM4ub1/Hvj3VLFnIxix8KXkqYI+yuxRfQtD/AGltZ0ABPhH8MvhD8GEQhYdT8O+ER458cKMnbL/wsD4qXHjPXrS8GdxuNAOhqHO+GCIkbfFxWZYyvCLwOX1qkWtKuJl9UpJXVrxkp4iPfWht9pXZ6FLC0KdniMTTirxThSTq1Erx0VrU2tr+/wBGrJXvzfg74AfGfxvYJrHhv4a+KJfDeVM3izWLOHwt4Jt0GMy3PjDxXJo/huCNeS7PqK8DPBIB+9/2PPhT46vPiT4f+B2j/GXwR45uPGd47N8AfANlqPx70zU9StEFw+ralPY3Wg/DfwBNocKvqs/xM0H4hWOu+ETapqtjdi+t7OG5+KPtHxZ/aC8Y6BoOpav8QfjD488U6tYaF4Z0fU9X1zxdrWr6zqc8VvYaTo2m3NzdKk1xPIsaQWkcUFum5iEhjdo/0O+L/ijwz/wT1+Ffif8AZX+DGraVq/7VHxF0xdJ/a7+N/hq6iu4/h3pcwEs37Mvwp1y1d1T+zyRD8U/FOmzK+patHLotrOYLV3h/POJq2ZY6McnU8JWzHHRcaGGoUVVjhabsp4zFYis52oUG7rkoUqtSfLTptSblH6vKI4XDOWP5ayw9CznVqT5fbO0VGlTpw5U6k1a6dSUYxV5JpWfrn/BR39uHQWi8Vfsx/ATXrDWbO/i0TSP2nPj1o0dkmu/HnX/BlmmlaV4Ql8V2kcN54l8IeEIIBp2p+I9QnnufGl/aST3NzeWaSXWqfKPxc1V/2bf2LvhB8B1IsviN+1Rqtl+1D8ZIgVivNO+F2jC70H9njwTfxqHaK31BX8S/EySyl4EmqaPO8bNDG6/OH7IfwXtfj3+0B4I8B69dJpXw60xr/wAe/F7XGbZbeHfhB8PrSXxP491K4fISES6Jp0ul2kjFVk1LUbCGMsz7T5z+1L8e7v8AaQ+PvxM+MEluNN0rxX4gMHg7QVPlweGPh7oUEGheAvDVpDwttbaN4X07S7MQoNglE7kBpWrPJeFsBgMRl3D+GUqtLLYUs1zfEzS58VjL+zwcKslpZVIzr06SdqUKFBLRpE5hm9bE0sRmNZqnLFOWGwdGGkadFcrrOCvq+WUYObV5c8222Wfhp8T9U+G3xC8B/EvQrho9b+HPjXwp470pkYK6X/hPXtP1+2RW54eSxMbqcho5HXDoWDfRX7c/gPw/4A/a1+OGn+GI4ofBPizxRbfFz4eeQoSFvAXxm0vTvin4QaxaPaQtjpniuGwieIjypbF40bdEQvwHY3iKrgsSjAh+cgrgHJzwQGLfwnoQOTz+gv7TGop8Qf2Z/wBib49Rt52pW3gXxp+yv47nUmSRfEvwD8QJqngeS+kBJFxe/Cvx54ctYGdg8lvoDlSyxtt+kzLD/VM+yrELWjjaeJyusnG8eaUI4mg5X3SVCtBJ31quK3Z5WGq+2y/GQjJqph5U8VTV1dR5lTny7vTng3tblfbT6e8OeLvDH/BSz4daL8EfidrGm6B+3d8NfDkWkfs+/F/W7qGwtv2mfBujW7NZ/BL4napKsSN8SdKtY2t/h54s1CYz6zGo0jU5pbhj5341eLvCHiTwp4h17wr4s0HVPDnibw5ql7ouv6BrVrLY6ppGq2E32a60+/s7lVnhureVXRkZRu2hlZlILVjf3kOo2l/Z3d3Y31hcW95YXljcSW19Y3trKk9rfWl1bsk1td2kyJNBcQvHJHKiyIwKKy/up8NNP+Gv/BWjwppXh34gak/g7/goP8NPDaJZ69odvo1tJ+2T8P8Aw5Zh30xrXVLrSdFP7QGhaXbMdPu72/s7fxTFEft08MbzXehebXqvgpyxUY1q/D2Ik5VqUIudTKa0ppudOKu3gpyb5ox0oTfNFezb5eqio58o0W408zorljNyUY42CskpSat7aKvZv49naaXN/P1d2DRsWaNyoOMY5AG0nqDkHIIz3yOetYkgSAqwBJOCCBwMBS3UEDAGckcjheeT91eLfCP7JnhvU9W0bVvGP7VFtq2j317pmp6VqHwb+GmiappmpadOba+07VLK8+K9xcWGoWd1DLb3drcRrJDOjoy7gceU3ll+xzH0139qe73AF9vhf4RaevYYG/xXf4DkHnDZ4BDEc/X4DiCjiqMJrB46dOpFOMlhqnLOL5OVxlJRTTVrNb7XbbT8LEZbXoVHCdXDxnB2knVi5KSsmmlLo01Z9el27Q/B74xeGIfDN78CvjfHqWq/AvxPqravaavpNsL/AMV/A7xtdRLbJ8Tvh/byMhvLWdFhg8e+BhLBYeNdDgQxtaeItN0bU7fy/wCLfwc8T/BrxgPDWuyafrOmanYW3iLwT428OzNf+EfiJ4M1MA6L418JX4Qm60bVIxIrw3C299pOoW99o+r2mn6vp1/Y2/qlqn7GsbszWP7V94igci/+DWnkHJDFS+namq5HTGeAFPAwPXfDHifwPreh6R4G+H+pfEK88KaLrWoxeD/CnxR1Lwvq2u6dq/jB7WXWLTwzB4dsrW0S013UILaaWxt4FN3qIe4WBLyV3m+i4RyuOb8RKhSr1MnwValWrY2eNpxhhuanC6qU71FGFWTtGonyxnFObtKPv+Xn2PeXZS60qccwxFOdKGHp4ZuVaXO4xcJOzbhFXa3ab5Utbrw34M/BXTvGWmap8R/iZ4huPhv8B/B12ln4q8fiwS81bxHrjQC7t/hp8LtGuGtv+Es+Ius2+Gjg82LSPDVhIde8T3ljpkUaXmH8c/jLL8UY/D/hPwx4dt/hx8Gvh+t5b/DT4V6ZdSXlroqX5jF/4o8Vam0cE3jH4l+J/s8Nx4r8aX8YuLt44NN02HS9A0/TdNtvQfGHxY+Dc8mmeEPip4R+NnxMtPh4dS0zwbo/hn4weHvhz4H8J2upalLfa5Y6Z4cv/hj41ni1G61RrqbV9Rju7a7vbhYPtO4QRisKD4q/soWy/wCj/sn+Nb9lO7PiL9prWbgOwAyXXw98M/DzEdQdjLncSBgk152OwuJwme4x4rDYvN6eExFWlgZYN4dYKFOEnCFaHtsRB1K1WFpOq17nM6dOy5pS78HiaFbK8LKjOngamJo06mJjiFV9vzyUJSpPkpyUYwd1yJq9lKT1Sj8pBWQ4+UEnncOckHPHY+/UAE8dnjOADgk9u5wSOAcE/gOeQO4r6rk+N/wCtzt039i74buwI2v4h+Lvxt1pjkD/AFn2LxRoatjjIVUXkgAY4rH9onwHCc6Z+x9+zBZYBAa/t/jRrzAHABdtT+LsiMQByfJC852k9O1Zjj/sZLjIJNfxKuEtZctnaGIb2/4CWhzSw2HlaU8wovaWkK7suaLf/LtKyTbS2t0adn8vllwfnTB7FlBBGOcD3JXkDG4k45qMvGMjzI/lGT8/tnvntnOOBwepxX0zJ+0qiiQaf+z1+yppZJABh+EN7qbR45wh17xXqgI553hwckE4+Wo2/am8eoA2m+Bv2eNGweBpv7OHwkZlJwB8+reHNTbtn5y2STuJBJDWJzaWqy2MFpdVMRGLbut+SnLyVttCHhsHFJvG8ys3aNJ3eqte8l08+1tWz5p863XIa5hB9C4HueegPbGD15x1qWJftDMIFknxjaIYJpSeM5GyKQkg/dAUlsZGMjH0gv7W/wAeIznT/EfhHRCCdp8P/B/4O6EU9fLfTvAsEi4A4w42nODjNMk/bA/aifIj+Ofj+wXPEejX9loCAccoui2FgI84+UJgdDnBIrVTzmS/3TBxWl08VPV2WqSwyXe+tr27NE+zwCv++rz91XtRjHV8t2l7TRf8Na23h1h4V8T6gVXT/DHia/aQgp9g8N63el8kjj7Np8m85H8JJzlSMrlu50z4GfG7WCP7K+C/xf1MPja9h8MvGM6sDtBKtHoz5+8MYIOAeMdN27/af/aUvlK3X7QXxplVshk/4Wd4xjTBzuAWDVolwQTwAV7YwcVx178XPivqzsNT+KfxL1ANk7r74g+MLosSc5bztafdnG04ABB4yOazazt3fLgabTbvzzmltrfkpvtZX1Whcf7O2bxMno/hjG6ur6uUr327badF6Lbfsn/tQXOfK/Z4+NIBO3fc/DrxLZL/AA87r/T7VAOc8kberEVsJ+x5+02uz7X8GPFumK2Du1mXQNGAwM8nV9YssHI/iIx7dvn241/X74sb3X9evix+b7drus3W5u7E3N/IT0z8xLZ4JyBto43HMv70kbiZJJZM8buTI7EkkcZyOh6HNc6hn7/5jMBG72WDqyVtLr/eo7b6L8y+fL/+fWIfZe1im37t/wDl35/P1Tt9Mx/sl/HBNhv9C8H6QAWVjrfxb+Eml7No6ul14zWRVA5yV5OQR97FmL9mXxtahjqPjf4CaT82H/tD4+/C12QDIyyadr9+3OOAFLdeOa+ZoktwdwhiBDDHyofY8EYyBwVzjp1q0rDaVCKOQcBFUEk55xjg84AwO44xSeHzuSf/AApYWN+VLkwk76ON7KVeVrvve3nrZqrlylFPD12otLWqkteV/wAl+XbZXvre59QL8CYoodl78d/2aLbJw8R+J7aoQSCGAOjeHdTR2+XLFXYnJ5PNeyfD2fxb8NrY6TpH7W3wFufCku9r7wR4juvGXxA8CXqMPnW58Ja78MNX0ZmdQ37yxht70NgwzxOqOPg/R9O1LVNTsNI0jTtQ1fWNXu4rDSdH0izuNR1bUr+5cRW9npunWkM93eXU7sEiht4pJJHO1Vavr2LwP8K/2fok1D9ovPjv4mRR+ZpX7Nfg3xAlvFot1t3W83x4+IGjT3C+GYo2Ie7+Hvg65ufGFyge11bV/CkgkR/mc5ws9KGMxqxtabTpYSjg8PUr1HaNpWqRkqai3/FqSjCDtecXynu5fiIRftcNhnh6cUufEVcRUhThG0Xyvl5XJySdoxTk9knbTv8Axp4u8HareWVj4KTwRb6Y0EGpeIrf4Wv42sPh1qfimSYxXGoaL4b8ZxQXWlXEVn5NtdQQRG3jZWW08q0Fvbx8LqHh/UvG4bwtoeiTeKNav28rQdDt/InnvL1I5JYIbWOeSMmX53dIYpUNwUMQXeyhZ5Pi1qvxV+HfxU+KfxLsNE0nwz8NdJ8OfDj4HeAvh7o2meBvBPh/x74815tXi0fStJ03TzLe6ZofhDQfFniLWrjWNQvta1HUG0mfVdUuJb7zZOa+DnjD4UfEGbVfhb8bmTwbpnjW8RvCfxk0syvqXwx8Uzwy2kK+J7UTR22v/D3VZJIF1aKVIrzR7iEahZ31vELhof1PJ+OMvyjgSplH9nV3jcDCphcQoRhiIc1SKq/WJTXspV3CFVVKsKcU1NShBy5UfHY7h3EY/iNY54qlGhiakK9K7lSlZOMVSimqns1Lkcabbs1aUrX0+XPGng/xj4C1STSfG/hPxF4L1Mudmm+JdD1DQbgK2CFhi1K2gaeMFlCSReYrqAyyFSC3EeZuIO7vtyOVYHB+YcjHY5I578V9g/EW5/aS/Zc8X6p8HvGviG8ubTS0gvLLw74k+y/EL4W+LPD98Gk0rxN4Z0jxbb6toWpeHtYtwJbW8srOC7tJRNZXa2mo2l3bQ+YyeNvhX4nmH/Ca/BW20C8cEvr3wX8TX/g9nfj/AEifwd4pj8XeFZwpG77Lo6+GoTny0aJSu35LCZriqtCliFh6eMw1aPtIYjA1IPmUlHWVKo4uLaduWNSo1qmm1Y9mrgaFOc6PtZUKsHyzp14uylomuaKfMnf4mop3e6sl4KwcSHkkNyoXIC5U9uQcdycDHUerxnIxzxg9uATgkc845HPQnjGCfouP4UfDDxOjSeBPjZodneS7TD4b+L2iXnw71Z5JMB7eDxLYz+JfAk5BGBPqXiDQI5cbmji3eWOX8X/Ar4o+BbIavr/gfWYvDzZ8nxZoyW/inwdcqV4a38WeGZ9Y8PyAqclRqKuBw0YIr0aObYGtL2bq+wrOLiqeIpzw8m9LKKqKPO0203HS+zerXNUwOIgudQjUjradJqat7qV+Tmtt1s/I8stto4YgpIpVjjjBIzt3dPY8nPIPJFfUPi5f+F1fCxPiRATP8SvhTYaT4c+KcWS954q8CbotJ8EfEwqv7y5vtDcWfgvxjc5dzGfDGqzHdc3ko+XFQSKHjZHXIAMbBwQDyQASQR1x2AySeldn8P8A4laj8MfF+l+KbG2h1S1tobvS/EXh+8LDTvFfhPWbd9O8S+GNSVGBay1nSZ57cSffs7nyL+3KXNpCy5Zphp1qVLGYOUPreFbq00n7tSm+V1KEnFtOFWOiTfuyUZWvEWEqKnUnQrL9zWXJOLTXs5XioVEt7q26Sbi2tL2XByyhdpxxk4GPvdCpOegAKkEEDkH2r3X4myHTPhF+zh4Z+4974d+IXxJu48gEzeMvGk2i2Mrr3aTSPBlmyMP+WTKASME+f/GPwRa+BfEEE3hu9n1fwB4x0iHxf8NNcn5m1PwrqTyrb2V6E+VNf8O38N34c8R2q5aHWNMutqmCaB5O4/aUP9m/Efw/4OjKiP4c/CX4T+CWgXGIr6z8G6Zq+sptyAsia3rWoecpAIm8wMN4weOeJpZhjMmcJNxtisY4Nap0acaE1KLfNGUKuIScZWtJNO1jb2EsNh8xU906NC6TtacvaJp7OMo0m462ael1qeEbmOAQp2sPfHYA88FeOeAOc8g1JjB4PGCck8E5BOOSenAPOOeRnNQbjnIPGS2D0HI28Lz/ABZHGCeSOeZQ3TJBOCB1wdxyeDgD3+YjjjgCvpHF8t0op216PVK2itfX7utlc8xw0TW9lffS3Lvftq5LVJa7LQIJJORzgDOSQODwoOc/jg4z0NTQnEkbKQCpIBJHJGMjBBAOSQM8nO1eeSzGeoHIHPXjB4GfTnp7HGCQHADjOOO+PQcH8cAe30FTKzi4NX20aT1srdNe3W3RWCL0Si7PezW217bLXv138z6t+B3xx0rwnomt/Cf4saVceN/gR42uUm8Q+GInX+2vBuubWjt/iL8ObqZHXSPFOlBxJdwJix1+1jksdRhkV0dOS+OfwM1T4PappN5aavbeOPhp43t5NZ+GnxM0iN00bxfoilQ9vcRMZDo/ivSgyW3iHw3dsLywu1LRrNbSQXEvhcLlPmb74x8xxkdTnJ5A5+Y57kdea+oPgj8c9F8MaPq/wk+L2l3fjX4A+OLiGXxHoNuQdf8AA+tqjxWXxI+Hty6yNpvifRzJ5lzawlbXXrJbixvopllAPy2NwNfK8VPMcrhKpTqO+PwEbpVkuW9eil7scRBXeyVVK0tUpHrYbE0sXCODxclCcVbD4l35oNcqUKjd/clr1vF6rRNHyo4G4nBVD0XHI6HBYZAGMAjHA796hIB3blJBweB0IAA+YlerAnIPzdc9a+gfj38CtZ+Cmt6RcQ6taeOfhn44tDrXwu+KOiIx0DxpoDlWEcmGK6V4n00EW+veH7mRbywugSqyW7wyv8/suSCpBAB3E7cg+jMq4GMgEDuM9Tx72Bx+Gx1GnXw8uelUgnFu7cWrc0Zp6wqRknGSfK4tWa3S87EUKlCq6VVOEk2lu01Ze9FrmTjJJWlfW6u7LWDlSAQFJblR0AAA69+xyMD37U7IJzkY/HA7859MZyPoeRTtvmAfLycnc2DgZJ4JBOF6bhkjOO3DBgAjGAMcgkjLHjLZyOmPTkdycduml1rs9XZrmiu99bb7swa6W95b6rukrb36LR+euooxnrn+XbGff0/QYpMAkDcp6cdeOevcn3HA5wOtABPLAA9wORx365z7/hil2rnO0fX069jx6cfpxU3S0vr3ST6Lba3XazfV6CVt9ddL2Vk7LXps+3l8wAZwCe/AJ9f0I4HXpSkY7r+XTHOOo6cke2DnuUAHT6/zwcfy65xjNLgdh/gRk8fhzn9aTd99d7aJdrX3X4dlfs5S/Tdb7O++iflv16DHGNpAHBzjpnkY/LHbPrg9KXqOQQOcjnP5YB/3cfzxTuD+B/l/hk9e9LRfReWz7bfl/lsTfbfTq36bdrW/rpGeDgjgjA98kc8YJA+YAY7ZxhTld20ZDYOM9OTyueMkkjGOT2OQckF+O/J9s8evGMc8dc8eopOc+3c/0HTp1561fM3a9lbdX5W/h+66379uzv3vsr6uzaSvf1sr76/Jo68g9se3/wBfH+NJjnk9wR7dcfnnH6e9GOQARwcnPJ/rycnr+HekwSTnB5HPQ9eg/D6ck8nrU+t9fRNpuOt9npq9d9e4K3V2Xa2tm15dtdG/zFyDwSOmcEY449QeepwccfnQfTKgY7Y747dMYPc9/UUmMckA8c+2OuOMfTv26dHYB49Sc4459+nXoT6UNq+7d+rStfRXt5K+m+3Qd0rdr79L6Xevbpdab+QgxyAeADyO2e+entnr198rnkDHXkEdO5/z60YHoPypf8ipdvn1v8tfvuTe/wDWt9L/AH+em4cY6ZJ4+g7f1/l1Ipo+9nnOM57DsPTk4GfTtmnZx/n9PXnpxyelHTnH6de3+fT2q4t6bu2nW1tHf1te3Xb5ibX5a/1r6O6DGckcYPTII6ng5xg4xgYJPXsKewAJPQqO5XBI47HPUDoMDuDg4aWzu4OMHOMZyDhRu5A3AdzyeQcZNPYHPzdBgc4yRwcnAHII9AD2AOKq9rJXXfrq+XrfXdrvs9rFv3Wt1rrZXdny6efaz2Wq7j+xAPI459e38x605MnuASQOM/3gOg59R+HGelMAAxkfNgAnnt+HODj3A5p6sAQcYwQBnp95Tz0wOMc9+R1xSTslrtJbqz3T0Svte+id1pYjT7tfXbTdaX+aV2Z2wDBOOdoI4Bx74HTjnPTPAwRlcDLYJGMbR0HUZ74ON2M9B2x1piZAYnJOFGD0HbOOxOQd3Iyeg4p53YIwOeORxwQc+oP+OKu/X0810tbuug10elr/AOV7J631S032VxzHkjgEnp2wSGAwCD1B4ye+3JwKlHt7/p/n+lRbQSTuOQScDtnbgcHPBJ4x1OegIp49Oejeo6nrnnkZ49cZ6HJzbWmiel2u13F9e+3zHK3LFLdK7dratR+/7+vQQr9MsQG9T93kdfT14ANO+nGOMf4//WxS/Wk46Z68jH4dx/nmod27vXV7eVr27aW6ErorbO+l7/n5dLBkDjrx68jp+OfwOfyo5yPQg9u/Hf8APHSgAdR3/wAPWj15PJ/L+fXGfxotrZ3Xr20tprsul/y1XzX9fL+tfmY7/X8vr16/h7d6Bj64/T8Pp/XGKP06Z/8Ar/56fhS0vy/XS/8AXoAUcf5/Sg+wHXt7/X8/xPsKP8/WgBOvQ/5x/wDqNGTx0xjjPbvjHBJPPfj8OTgcfl+v+FLTXT19fw/q4CAYH555OB+Z/wA89M0cA+5/QYHUfhjp6Ck6k9eCBg/4eh/Xp06t6YxknsOcBT9cenqOT7Cnvfe9lu1Z7bv/AD8loylrfe7u9LW6NX8u/bQf16/h0/Pv74/zl3kFgvAyVGOOcNyeMEHqenH904wacoBCtjOMgg8YJI5xjng9SO5Aq5HEHBKHJUKCSckcAH5enGQDk+vAA4qCcnom2raJPS7V9Ol76rTVWs07Amk18vie/wALat1V3qle6fzKqREnhQBgqWAHtzk/MMg84BJz06kO8ocgnB54JAxgDjGD+HRcDHUgVrJbpkbXTlcMvmKDkjqRgkcHpg49ORUnlRAMrPCACPm3xryc8cnqPy6cDgHGdaEbrmhddG1u0k013T3vu/uVtX+y76bppa8tuiut+r+4xVjiJIYnOeASBtOOccD1I5OcfjmwkCgA9SfUg88EngjPG4deOcZ6m8y2+c+ZbdT1lhyepBJDZ5PP4568hUS3OFE1qCckHzowMt0b73HOMnJ5PJHNQ8RBbSguj9+K6R879One+z0ShN8toT1a2i3Z/JNdL9316N10hYEKoJbHy8buBggEHvgdAWGV654rSgtHfB2tgqcpgsS3AAVQCWZjhVTqxOByc1Ir2SFPMvLRDgkk3MYAGB3LHgA8nAGRzzmvu34SeG/C/wCzz4A0v9pj4s6LZa34p1vzj+zT8KtaiD2viTV7YKD8W/GFixDyeAvC8zJc6JbOixeJNYit1R3s0EsnjZnm0MHh4um/rGJqzdLC4aEk5160lHlhppFLWVSVuWnBNu6Sv6WBy+WJqNTThSpxU61Sd+WnTXLdu9lJvRQju5OyVzU0C1tf2JfAtt4z1mKCT9rL4k+HXfwB4euESST9n7wDrtsUb4g+IYHRltfid4msZXj8IaVLtuPD+nSPrF0qSyQwT/nxe3U9xNNPNNNczXEss9xcTyNPcT3E7tLPcTzyM8ktxNK7yyyyO0ksjs7uXck9P4z8Z+IvHvibXfGPizV73xB4o8RaldavrutahKZbvUb+8kEk08rZ2omWEdtbxKkNvBHFbwKkMaRpR8JeDfFXjvWhofhDQ7/X9RMT3Mtva+XHbadYxbTcanrGoXT2+m6JpNmpL3mqatd2mn2kYLz3MSAGufKMNHA0q2Y5jVjUx2Jlz4mtKS5KaTTjQo31hRpJtRi7czcpz95yb2xteeJqU8NhYOOFpK1GCu5SbSUqlS286jV3fRJpKySRyDxFyQoIBwevA+6TyPlHJDdcHtkZNeieEfg1r3ijSG8aa7qmlfD34aW1y9refEPxeLiLS7y4hCvLpfhPSLaOTWvHOugBlXS/D9ncx28hRtWvdMt2a4Hp0Nr8I/hKpfUhpPx0+I8QwulWdzcp8EvCV2jlf+Jnqtq9nq3xU1G2YBjaaPLpXgoSrtk1LxPaF4D5L468eeKfiJrCa34u1eXV7y3gWz0+38qCy0jQ9NRiYdJ8OaFYRQaP4f0i2+7Bp2kWdrbIo3MhfJbt+tYzMrQwcfq+G2eLqxSlLRX9hSlZu9tKlSy2cYzTOf2dDDLmryVWra6oQd4pq1vaTT0V3Zxjd7ptNHdj4reGfhvDNpPwF0a/0K+eFrXUPjH4tis7n4p6tFIrxT/8Ivb28lzpXwu0u5jYhYtBe98VNEWS58VMGeGvEhfvPNcT3U0lzcXEz3FzcXEklxcXU8rbpJ7m4mYzTzSsxaSWWRpHZsuSSxNOVAeQuB26dRk49/cHj3NV1fadxGT0xjrn5Qc9MckEe3Q9a78LgqOEfPFSnWlZzxE5c1WTSVryd7JdIxsleySRyV8VUxCUZLlprSNOHuwSdtORaa6Xcru6u3vfUuCswGMDPy5ChSOBnGOf5HkdT06rwF8QvGfwx1m41bwdrJ077fbmz1rSLyzs9Y8L+KdNz+80jxX4W1aG80LxLpMhyGtdVsbhYXKzW7wTxxyx8Ys0QHzFF+U8khRgA9TkYxnv0ySc449O8DfCb4jfEYNN4M8EeIdesYSv2vW4rIWHhnT0O0F9T8U6s9j4d02BCPnkvdTgRQCxOAcTjp4T2LWOqUvYte8qsoWadnqm3aSurST32T6GHhXUo+wjJSX8is7Jre1tOnlbW1rr06Gw+DHxlRE0JtP/AGfvifcsSuhaxf3l38C/F92wGE0HxDfPda58LL+6lDeVp3iW41rwossgjTX9BtCkKedWfwG+LGofFzwr8C5vCGqaV8RvG3iDRvDuhaVdxq8d1Jr13Ha2OsWF3bNNZanoBgM18ms6ZdXumTWNvPcwXUsUZNeox/A7wPoOF+J/x1+HOgSIAJ/Dnw6ivvjH4qBYYaFpfDRsfAUUwBKkT+OwEkbbJHkEj9Cf2XviJ8KPgj8F/jN8btC074h+NLT4L6Y/gf4O6t8YJPC8Fpb/ABj+LlnPpMOlfD/wvoker3Ph+2sfDdrrGv8Ai6JPF9yl1pbR+XBY3rC8l+BzTOquV4eospliMdCsoYfDYevSqqMMRiJQo0fY4qokqtNVJxc4XqS5NYzjGNl9Vl2XwxlaKxvssO6adWdSE4c0oQipzU6cG3CTipWlaMW2k1dpnxV+0tp2q/Ff4r3vgP4KaRcav8F/2a/Dum/BHwz4vurmz0HwLBaeD3lXxZ4v1vxfq9zYeGdNn8c+NZfEHiIm51KG71G2uLQwQ3DLAh8CtrD4O+B23+IdVvPjT4ihB36D4Our7wn8MbS4UYWPUvGd3bweKvFUCOym4t/Del+H7acc2niWRSrnF+IvxC8cfEKa2HizXJLzS9JZ00Dwvptrb6F4L8MWxYMLTw34P0iGy8P6JAmdrGzsY7iZi0txNPPI8z+ZeWqbs4KnBXoAM4PyjvjBHTdwcYOMfRZXlWIjg8Ph6taVGjCEFOnQk/aVW7SqTrYhqM51Kk25zdKNK83J3kjzMdjYPE1J04KcpN2nUV1CK5YxjCnrFRS5YxTcrJLVNnrfif4y+NPEGjN4UsJtL8EeBGkDf8IF8O7E+FvDE6g7kbWzbzSaz4uuogxUX/i3V9cvuwuF5A8rRiqtGgQIynCKigKGwMYUgDaOMZIHDYqFPmzuOcgABiSehxhc5OAABx7AVdtQOAy85/2m7jnGeDuz65+v3ffw+Ew+Eg1RpRhreTSTlJtq8pSd3Jtu8nJtt6tvQ8mpWnUknUlKWsWlJtwsrWSV9IpNW5VttdXutvCznoc8EnI46cHk/Q8EEEEcgV01raHaDsO35QcLnI+XGeMc+p+p5BBLOz37VQKS2B3xksCMnoo9xkkjAHp93fsufsNfGz9pK9gvtB0SLwd8M7CQt4l+M3jtJdH+H+h2cUfnztaXs6xT+JtU8mOQWuk6Ct00k+1b65022L3UfjZ1nuAyfDzxOOxFKhSgryc5K8norQgvfqTbXuxjzSekUr6HZgcvxWOrKlQozq1JNaLVRWl3KTvGMdbyk2rWv2Z8/fCL4I/EH43+MtI+H/w08M3vijxRq5Z47K2CQ2djYwhXutb17U5/LsPD/h/TIla41TWdUntrGyt1aSSUuUjk/Sdv2WP2fPht8Evid4vg+LOqeJ7z4PRWml+Ovix4Ysku/hv47+NPiWRbTwV8Cvg3pNzBBfa7a6VaQax4j8X/ABI1C6iB0+zaex0K3sHRp9Lxd4a+K1tYT/srfsX/AAY+L1j8NvEWuaX4b8afFm/8H6poHjT9ofXZrqC0hvfEviF7e3h8J/CwTXBbQPCMN5a2R0+X7br3m3dzIjeI/tr6nafDu58IfsheEY9VsvAP7Ocuq2usajqOm32l/wDCzfjbri2x+JnxMdLy1tGvdItrqKHwZ4FlKPDaeFdFhezPl6nLv/OMJxnxDV4hyjFZRmEMpSrvEQoxnSniFgYKKq1scpXjCeJ9pGhRwmkoe0lVquU6PJD66eSZVRy3F08ZhZ42p7NQnUalGl7dtOFPDtazjTa9pOrq5cijG0ZJy8JsvGPgB2tzqfia7s4DPai9aDwrqF1ewWhmhF/NZwieGC4uLa386WCGWWH7RIojVlyAcz9pL9me/wDgyPDnxB8GeJ7X4ufs7/FB7q5+E3xr0C0kt9K1uSEmTUfCHi3TS0p8DfEnw9MJYdZ8I6nIJ3iQX+ntc2rO8PgU9wjFl3Z5wCJI8YwDxgtn3AxkccYr6h/Zp/aRl+Cc3iLwX4z8N6d8Wv2ePietvY/GL4I+ILvyNL8QW8JRLPxb4OvmG7wZ8UvDYb7T4Y8X6Z5M6Txx2d+Z7JiIP0vi/jDiTOpYLMJ4jDV1ltOcauXQVOlDGUqnsnOpTqc0pQxcVTXsrzVKavCai5KpH5nKMqyzCe2wvsakJYlxlHEycp+xnDRRkkmnSbb5rLmTtJSaTi/iiWyBViQTluACd3bjj5fflgepwDkVlz2W0gr05yNuSB74I6nnO4ggdBzX6IfHX9kO28PeGpvj3+zd4kvfjt+y1qUxmi8X6faLP4++D9xN+8/4Qn48eE9PEl94T1vS232ieJ/sa+Ftfhij1CyvYGuls6+FZI4J1b7PLDOCMkxvETj5RyMk5zwo6jDYAziubKeIMDmdJV8NW2tCrSm1Cth6y5XKjWpSSnSqwejhJJ31V00RjsvxGEm6dWjKKSvCaSlCpBpOMoyWkoyVvevtp0d+Ka3VckHGDgLzxkHBwN3IGO559BlajEYJOSMkEjBK8EDrjgEgZySSM8kAV0FxbYwQv3gQuMklhyfu/IMDB5ORkHnBzmPAQ2CAc4wPUY3diOcehxzwMHB+ihJzStJNu1la+mj6a3tv13u+p5Em46bPT1t7u2zS76atdOlRJJIniuEdoZ4HWW2nRmhniljJZJIJ0ZZYpVJBR42VweVbKjHvdn+0b4t1aws/D/xc0Lw38evDNrCttaQfESG6Xxvo9ogKpH4Z+K2jTWHj3TUgTAtrO91bWNEiIUPossamNvBZEZhgr0z179sZIJOeoxhTzkg8gHlwIJJjHEq9DIdmc7eBuOSSGwAdx5wCSOePF4DD4mEXiKMHy3caqbp1abdk3CvBwnCVr+9Caaf2tWbUK9ek7UpSabTULKcHs3GUJXTWyd09r20Ppq0+FfwR+Km3/hT/AMTJPht4snZRF8K/2gb2xsbO8ncfLa+FfjTpttZeE71nclLa38c6V4GO3Yj6tdSklsTw14O+JXwC+Nvwn1rxt4J8Q+Frrw78R/BfiC2ubuxlfStSstK8R6XcXF3o+t6eL3SNX0/7LmUXWl6hdWxgZZY55I3BK+Ef2bvi74w0OPxXP4YsvAnw+lUM3xF+LWraX8NfA0sJHzS6ZqfiyfTrvxESORD4Ysdau5CcRW8jtz29p408DfCbQ9Q8J23xsk+KkhMN1aWngfw14rXwd4fu7UmaWHTNd8bXGiPfw30j/Z7j7J4a/s14oxJbtkpMvDlGHwGNzNZPjuJo0MrxFGvDEVq+X4nM5YV+yvGnLEYFW5ZStBLEwlNttuq7WPRr1KlHB/XKeWuWMpzpTpQp4ijho1rzgpT9nXsnyJyk3TaStbkbZ8w+PdOj0v4ieN9C03N7HaeNvE9jpgskkuBeWMeuXzadPaxxq0k0N1ZNDNasgZZY3VkLqQ1et+F/2Z/jZr9lBrOoeCm8DeHJQHj8VfFnWtD+FHhyWJsHzra/8d6hob6lGRyP7JhvZGXPlxvkCvsTV/2gNH+G2heFPCX/AAj/AMQ/D2l+M/BXh74ieFvjP8IPiBpPhz4iaho/iO3/ALP1DTtRXW/Cus2OrW/hzxHomraF9l06+8MXds+nG1bVdiF2+a9a8B/DD4j6jda5p37U8l94juz5ph/aU0DxZ4Z16eZuRAPGejXnxQ8KysWOBc6lq2hQNgNIlsvC8dbNMRQq1cNg6q/s+hVnhsLmssHiMSsZRotQ+texpStg1U5W1TxE3ODvGpG6u9o4OlJQnUTniZQjUrYRV6dJ0JyUZey9pK6r2uk5U1yyT912ZFJ8MvgL4NVj4/8Aj9H4x1KNSZPC37P3gzUPFAEqYBtZ/iB47/4Q7wxbjeCDeaRY+JrdfvqJVABzD8V/hJ4XZf8AhWv7PHhu8uoCPI8S/HPxLq3xU1ZWVQqzp4U0tfB3w7TLZZbbUPDWuxKSUklmQkHI1b9nL426ZZS6xaeCrnxt4bhXzJPEvwv1bQ/ih4bW32gCWa+8CahrrWKEbmP9oQWUqKCJUUq1eRvZSQStbzxPb3cTbJLW4he3uIiBhllgmjSSNxk5V1UgA46HbtQoYLGrmrZzVzGTa5qUcTGlCLaj7jpUHSutvdq87slzX2OWrUrYe3s8FHDKyal7Jzk7297nq89nqvhSte3a3uPiP9qf4/eK9Kl8Pan8Ttf0fwo6mMeCvAS6b8MvBEcJOBAPCPw/svDejTRquFH2m0nkIPLN28aim86VnwqmVmds4eaSTcu53lcu7PgDcWZumNxIwc+S1kjbkY4OSMnkEjsByPQ+wHXNWrMDKkjJyR9MEc4Hqc9enfIru+o4HCxawuGo0VdXVOEI31Tu7R+JXXn6dOb2+IxEr1alSbat78m3py6LpZR93ut01fTShti7n5evJPdguM9c5GTnHAJ4zycdPpVtcT3VlZ2NtdXV5dzwWlpaWsEtzeXV5cypDa2lnbRJJLc3VzNLHBa28SvLNM6wxI7uitJpdpHKqF8K2FJOBjGRgbiDlgeAM8/dAG7NfrH4Q8I6D/wTn+HHhv8AaA+JGjWGt/tmfEjQl1z9mr4Ra/aQ3lp8BfCepRvDa/tDfFHQ7pGT/hNL2Nnk+Efg/Uole0Yr4o1G3xFarF8tn2d/UFRw+HhLEZhjJexwWDhK061V2vOpo+ShTvzVqrjanHe8mov2stwMsS5ValqeGoxU69eV7RirNJX3qzV4wjvJ67arurXXdM/4JffDX+zrGWwvf+CifxZ8KNFrGpQvDdp+xf8ADDxPYYfRtNmR5Eh/aF8b6TclNTvoSs/w90O5a2tpU1K6aV/yXvdSkv5ZJJppJpbiSWeeeeVppppppDJPcXEsjvNNcTSs0s0srl3kLPIxd2Ncnr/inX/FGu6x4p8Ta1qXiDxF4h1W91rX9d1i8lv9V1nV9Qne51DU9RvZ2aW5vLu5eSWSSRurbR8gRR6d8BPhh4g+Pvxi+HHwc8LsV1v4i+KtM8Opeuf9H0fTbmbztc8Q3zZ2xad4c0SDUNb1C5ciKC0sJpXYKDXBgMppZBhMbm2Y1liMyrU54rMsdNe6vZxco0cPF39lhqCTjSgmna8pXnJt91fGTzCvQwWGh7PC05RpYeinq+aSTqTaS56k3bmno0/d0SSPr+3H/DNn7BHiPxYWNl8Wf25tauPh94WUnytR0f8AZn+G+pwXXj7Wo8Ya3tviP47gsPC8bgol7pWhXph3Irmvy7eZA5VvkIbIbgbggxjIA+RgpIwBncAw6gfaf7cXxm8P/Fv45avH4AkaP4N/CvSNK+CvwR04H/R7b4YfDmFtF0nU1UYH2vxbqMep+L9RnAElxfa7I0rllUD4duZXDl0J4/vZxxntyMHsR90cE5PHpcI4Gv8A2fUzHFxdPHZxVlj68ZJ81OnUUIYbD3vp9Xw8YQaWnOpzjZzOLOcTSeJjhqcr0MJCNCnJNJSlFXqVLW156nNKzSduVX0TNT7aUwQw4GAFJyc8Nnjnr1+ZQTnHAr7m+CWqS/En9i79rX4QyMLjVvhR4h+Fn7WPgy3ChpYrHStQl+D/AMWIrVQMiOTw7418K6zqAU8xeH/Nl+WMsn5/eexAG5eG56H0OCeTweOvGM56ivs//gn14m0jS/2p/APhLxJLHB4M+OVh4s/Z08ayTOEtxofxw8N6j4Dt7ufcQm3SfEeraFrSM4/dzafHKCDGCvTxLhHHKq2Jppyq4CdLMKaS96TwdSFeVNXt/FpqdLRPSbT10ObK60Fi40uZOOIjOhNX0tWj7NSeu1Odp77pPRnzVJP5MiBG3AqrHBzjIHC4PABPy479Tzz1fhjxlrfhLWNG8T+F9e1Pw14m8OapZ614f1/RryfT9X0PWLC4ju7DUtMv7Zlntbu1nRZY5YmBUrjDIXU834r0LU/CHiDXfCWtW0lnrnhTWdX8Na1bzKVlttU0DUbjStQgkRsMrx3drKhD8joMjBHNR3eTtUkEHcMcZOASSc89Rzn+E9hXU6OHxuFg5UlWw+IoJyjNKVOcKiV1azvGzacWmuXfTfNOvh60nBuE6VSyknKMk4tK6drp7bW7vTVftR48Tw9/wVM+H2sfFzwdpmmaB/wUI+Gnh8an8bvhxo9pb6Zp37WXgnRLRVl+MHgPS7dIYU+L+iWECSeOPDdhDv8AEtsp1PT7d7kRwyfjdcaY6hwYnjCSMpWSPy5FkjbZIksTKJIpEcbJomUOjgKwXoOp+HPjnxj8NPG/hX4h/DzxHqXhLxx4P1mz1zw54k0qUwX2kanYuHgmjYAiS3bc8N3ayh4bm1lnhmikhllRv1x+Lnw88Dft8/CrxT+1p8BvDum+Gf2hvAtimrftffs9+G7ZYk1mNVVLv9or4U6JAA9xoWpTrLefEHw7YRzHRr2a51WOFbdbqS6+LhUnwdiaWEqupU4dxNSMMJVk5S/smvNxUcNWd3bBzemHm3ai0qT9yVNr6Dkp59QdaHLHM6MVKvTsovFwgl++gutaKu5xSbmvfWqZ+JtxB5X3VBznIHXjJOByAR9SBjjHSptC8U3Xg3xB4Y8W2u1bzwn4l8O+JbXcFO2bQdastUjLAcHBtRlWPzErnADVt6xp7W8ud6mMlmjKANuU4wTtyuCOPukA7TyMiuIubD7WZIX3FZEdWzyrZUY+U4Ay2CABgehavv4Vo1cNUgnKUalKaclLRwlFbWV/fXW9uh8tVpezr07x96NSLel1o1fS2ll0W70urHrH7U/hm38M/tI/GnTNOiSLRX8fa3rvh9EwsZ8PeLrhfF/h9ogF2+VJo+u2bR7OCmMZ+9XgRwDwMBT07nGQDkc9h6nnHU19a/tNwnU9Q+DPjwgSN4//AGcvhJqV1KBzLrHg/Sbj4XavI7ZJeY3ngYmcsWbdJljxlvkuTdubIHBI9M4xg9McjnjOTnnHTbI688Rl2EnOopVIUvZVN3J1KNqdRt9+eD1Xq1e5OYU/Z4itGEXGPO5xey5Zcs4q2y0d01rva6RGSMfeG4Y44+ncj8s8D15w3zOnH4k9Px/XpkfWmN1BOOQ34kfn6j1HTBx0UAd/ywDnvx1z1HXOR7dPejdrV3s126Wtrr5dtW+p5zbeltuunZLvfp23v0FDgjBO3g4JOMD6k9iee3rUgK4yWyPUd/yOOc+p+hFQHHXAzjGRn2z+PABznt9aQMdpXBIBAzjAA6jOe+eCMDIII9C3FK3lZ9nolbpta9tV8r6VFJp3dnbRbW23e33N66LVk+WJwOhPPPX8MHuf07ZoOe3qPT169+vf0HOPWNSMbdxHJ4xnJOMc9sY9+RSndz1A9cZPQDPb68c/kaPfsmnZK1rvXeOj21v1W+oW2vp12vfVfJ99L/5KQ3G04znOf8/gPw6gU9CQwyPbPAAznLc7umecYPXr0pD0wDzx9T69e+M09VLsAOv8sfj/AC5I456Vk9VZ2s97b6WfXtsum62DVpabaX1T6PVpPps7PS+jJgRuDEZPODwdxIzk9j0GenTjnBqwmzDDvnoc5HTABPAAxjqe/NV0T5tgAU+uPlPGOSRk5IOCo68Dg1rafZXWo3dnp1hY3eoanqNzBZadpmnW015faleXEscNvaWNjbRyXV5eXLusdvBbxySyyuqojuyisKtSjRhz1XypK7k2layjq23a29+lm9WzaEZVJxik23ZK2jd+Xe19XeSSf39St8w6A4YnIO7oTjI6gAAnPBBHQ9RXtfwt+DXiT4jWN94ou7/R/Afwu8O3KW/ir4s+NZZbHwdotwymQaTp3kxS6l4v8WTxKz2PhPwxaalrN0cSTx2ll5t5F6Ofhj8OPgTHFqP7Q4k8W/EhIhcaV+zd4V1lLW40qcgG3l+OnjLTZZD4PhVtjz/D3w5NL42nQvb6te+E3wZfGfib8XvGnxZvdNm8T3VjZ6D4dhax8G+A/DNhHoHgHwLpTEE6b4S8L2jCxsEdhuvNRnF1rOrzl7vWNRvrp3mbwKmOxWZ3p5VH2OHvaeY1I+61s/qsH/Gas7VHaknr+8acT0o4bD4NKWMSqVbRccLGSbTfLyus1rBXT9y7qNPlaje57jrPx18JfC/S77wn+y5pureHJNRsp9L8UfH7xTBBb/GXxhZzI8N9ZeEo7aW6tfg94Q1CN3jl0rw1czeKNQtSYde8U3UUkllH8b3Eoh86SRnl8wyTSuz+ZNK5w7vIzMzzSyksz7nMjs24uDmrhmC5JHJOMfeGck4xjbxgnbjnnGe3t/7Nvg7RPF3xZ0nVfF8Il+Hnwx0vVfi98SFf/U3HhP4fwprMuiyNkKr+LNZj0nwlbKRiS51yJFyxUUSwmDybB4jENVK1dxlKpiKklUr16iSUYubs25SaUIK0E3aCjoi41quOxFKmpRjT5ko06a5adKndXdl0S+Ju7e7s7t7/AMc1fwJ4c+E3wEjLQXvgjw83xE+JUJZleX4ufFWx0zVrqzvkbduufBvgK38G+FFhbd9j1CLW0QrJPOW8Dhfywdw3ZDAphCu0gKwK4O4NnkBc45POKn8YeLtb8e+MPFfjvxLM03iDxn4k1rxXrM6/Krahrd/PfzRRgqdkVuZ/ItowFWKCKOJFRUAXHglJyGOMsuMgcdBxg89DwOOnHc9GXYB0MDSjVV604utXfxKVWu1OrZvaLlJqKd0o8seitni8VGWInKnpGDUKeiVowUVT1Wqdopuy1b2d9f0b+CnjvwR+0h4C0b9lL9oXxBbeHtW0oyxfsy/HXVn3SfDrxDebfL+GXjrUZFe4u/hb4pnS3srSeaRm8K35tp4QlrGFg+Nvih8JvHPwb8ceIvhv8Q/D134a8ZeE76XTtZ0u8XmNk2tBd2dwuYb/AEy/heK807ULVpLS9tp4Z4ZHikRjw0Fx5Y5UsGGCHAYAcZPAz05AHAweowT+pvwx8VeF/wBurwF4d/Zy+LGu6bof7TvgrSxpH7Mvxm1+6js7T4kadAjPZ/s//FHVbgxxm7uADbfDXxbqM7Gyv3XQb+YWt1Gz/N4n6zwxiJYzDwqVMlxFTmx2Hgm3gKspJzxtCCu1Rk25YinHSDbqqy50/Vo1KGcUFQqTjDMaKj9WqylpiYRso0Kze9S11Tk7XXuvaLX5OySOpcYzndlcLty2f4SDgknODkZxkHBz0PhXx94z8CXIv/BPi3xF4R1BseZceHNa1HSvOXccpcwWcyW9zFhiXjuY5Y3Xh1K8G94y8J6/4L8S674O8WaBqPhrxR4W1O90XxHoGtWslnq2k6xYTfZ73Tr61mVJobi3lRgVYNuBBXcjI54SRSgZsDB46evGDznp2A64+tfX03hMfh4TdKnXpVIwqRm+ScZqSi42fvKSad72d07LqfP1XXwtSUG5QmpSXLdpxatdNWvp2+R7jc/HgeIUdPib8Mvhp8R5JARLrqaM3w88auzHLTnxN8PZNBiv7vGP3/iDSNcyw3SJI4Jrm7vTP2fvFcudH8WeOvhBfSniz+IOlxfEbwjGykZx4u8EWGl+KrOAkEJ5vw+1eWMbfOuJSSw8hb5jyBzgZ9O3GOmcDHTJI46iq7xrhgVDHGFzk4yfT0KjgfdBb88/7Jowu8JWxWDk3oqNTmprVO3sKsalHW1r+zTtdXTZccXUaXtoQr2au5x966tZ88HGVlom27aWWyR+gHws+C914z+F+veBvGOp+GPG3w+8Aa9Y/FXwT8Q/hlrVh41FjZLqNlb/ABP8DtoqrB4u0FPFXh6GLxDYQ6/4W0+K01bw3NLPbwf2hdTD50/anezv/wBob4na5YPdtYeJtVsPFFpFfTWVxf2Vrr2jaZqEVhdtp01xa+bpwm+wSpFK/ltAFbblc+OaDrGueFdTi1vwzq2oaDrFukyRX+k3c1jdbJABLCZbZkZoZ1GyaMkpJGzRSI8TOjfW3xy+InhO+8dadfeLPh3pPjXwJ468C+CvG3g7V9Luk8EfEHRNO1nRNOg1bRbLxPo1hJo+qw+FvE2m654etbHxF4b1m0gjszFA0QXel06eWZVhUnhsRis7xGLrVKeIhKFPDwwc4UXXo06cnZV61aEK1T3oqcqcpQim2nrKWKxtSKUqVHA0qUI1IPmnWlWTapVZtRv7OlBypw0bUZxTb0kfHKIWU5GCykDB4zzjIxz1ycZAOMnJAL2TCHbnnGefqcegzzzwR1ByBXuEXwv8JeM28/4Q/EC11S9ly6fDr4ifY/BfjtHfBFrpOrTXZ8D+LWTbtjNlq+kardnBTw9G7CKvLvEHhnXvCmozaN4n0PV/Dms2/E+la9p9zpeoJkDDi2u4YpJI2BDrNHvilGDG7KQT1YfMcNiJRpqcqVZct6NaLp1F8O8ZpNpWeqTXVOxzVcNVoyWnPTesZRbnDeN9Y7W87bPQxeOn8/bv68UYAwMjtj0/lzx2/rkU8Lg4YAEYyO3OMgfLjAyO2eeCoApTxkkDk8fT9MfXrn866no0rp9dHqttbfr6W8uO62t1vur2dvLy/PzTTcOmcjOc/jkk59PTHPWhZNnzZ4JIPOccjgjI4J4zycnPUVGT64x3zj2x+HX8egpuc/LgAnkDHJxg5x0/A9+CfRrzX5bKz9PW7667ApWVtdNVquZWau46vTqrapNaX0Pp74I/HHSfDWg6x8Hvi9pd540+APjW6WfWdAt2V9f+H2vHMdv8RvhtcThk03xDppZZL/TQUsPENkj2l/GzMklcf8bvgfrXwX1nS5I9VtPGvw58aWba58MviboaP/YXjfw87grIgbd/ZniHTty2ev8Ahy7kXUNLv1kieN4jBNL4nFJsJbG5hggsAeRn5cEc856g9e+MD6d+CXxr0nw5omq/CL4v6Ve+NPgJ4wvEvNa0K0YN4h8AeINpitviN8ObuQE6d4i04SCTUNNjZNP8SWKzWN9CzyI4+ZxeExGWYieZZbT9pSm1PG4GG1W1r4iilZRxC6rVVklGXv8AKz18PXpYulHB4qTUlph8RL7D0tCpK93Tb0T3jfqro+YiuMgqy8AdMY6ccc4x8xB4XqQAKhkGB8wIPBBx1JIHHG7Pt1Jzjmvevjn8D9Z+Dmt6XLFq1r42+HvjS1Gu/DL4l6OpOg+NfDrFcHgsNN8R6cGS31/QLh0vrC8ViyNC8c0nhskZIBzkDDZGDt6AqAR2J9COOOcCvdwOMo47C08Rh5KdOSg73ampqylCcXrGSeji1zRlpa6Zw4ihUwtZ0qsbTVmk7OMotJxlB21UlpHe+l+hS4AODj5gNxwN3QfQ5x6DOSPUU4A9Sc/jkZB68/h06HPFSFSxBGMD5hgc5HTGTkggg5JOD0GQMs7ccnp1/A5rqb8rXSXa2kdLvXo7pvZpnO7vXv8AK1uWy8knZJ36dOpxn09vX1/nn/8AWcr/AJ/z9aKM4I474578Z7f/AFv8Zt8vX+v+H6E3vqGe9J16H/P+ev8ASlz7Z/z+H88/pSDgdAM+3t6+v/1vQGj8N1bd/wBef3LQP6+8ack4IA5AxkFgCBnPuD1x6Z7YISchRjABzxxwRjk8ZHqScZyRgEUmVznJ9eD97HvyDgEdT6dAtIAdxwRzuHzcYDMv+yx5JP3uOpx/DVpeVrbXTSvaOt/0t62ZaSa1irJJ6rRN8uq0te+qejd99kPwepxjoOvIJA/DBH0PPHIJCoIxzj/D0z0/Dj091ORjr1GeBj+eR655oAxnnIyT7DPPf/PsKl6Ws+ifXR2Xdf5/dYnz2ttp2t+PV3/UM9TnjjHH05z6evX60vHXv09//wBX+TSAAcCjufb/AD/n/wCvzL/r5bCfkn+HS34v/h31Zkc9sev+e/8AnmjIJwMH8f8APt6daBg8fXI/nnPr2/vds0vA6DjsO39Kfe6/TX/gdvPpYAzxwfof8n8e/Ix70o9/5entwP6Hv6gGBz+YwPfoOAO3TI9eOCh6HsOuO/I9cZ+n4da21079e3S9/wBOvyuC6evl/wAN9+n4jyQpDY4OQQSDyvU8Dd1z+Rxk5Ko5wcEA5GRjBI6kHqSCGG3+6TuxzQckYBbaAQMHkcg88EduSAP+Ak0vQMSzMF+gPJBGfl7DvnO0E4xzTst766K3z0t5tv8ABGmyjdP4uV3b1ty8rW+2m+ltV2UvQNx1GOcd/Y9+PzxmlAyQM8kgf5+v+T3poOQGAyD6Y/8ArdM+39KfEDuy3ZgeOAMsADxwBzntz194jovnt1vZX/J2T/4JGvLfon+LS/SP/D9KAUDOBuztBIGBgjJHbC4xnGcHjnkBzBWLMRnPJwSDxjBGCB2PPGe2epbGDjJAXIUcDOQv3fvHsCedoJPTGKew+XAyOMdyfQ9B+Qxx+FDV2nqlordr21lbX5JX0WuzHpeOtl7t7b7K76q99em2qWwhxxnGc4OMdSfQ9xkD8iQaU8EDjOM88/lg8cZ5/Q4IprZzuU5X6DHb5ipHOCOeSfTjmnZAYdCTkgkdB6cDp6ZxnHOe6cb2Se19G9Vt+T3V15au7Nkl6u2u+nTZWtrfdX8hcnnPHp3/ACHBOOPxP0o69/1/HBxx7H68UZ//AFE/T6/px+OaBnnpnvz9P1x/nHSLO7017a2+/XTfXUnz7ef9fgAz3x+HSl6+3X/P+FH09O//AOvmkPTk+nI9eP5+nPpijf1fZadO3z2QeQtJnGfofTt6Z+v0P8WcCk3AcZAxnvkk8dR19Tke+T6JuXuwHUdsYzgDJGfTJJ5wTyBkiTurJ9Nlr02+/T5Ds9rN/LX8PVX7D6Kj3EnAPC5zwegIAPAwAcdRkds+r849B255wT0BHTrjv3/N2tyvvrbr07Xte6s/Puh8r09L+mtvza+bFoOfx9+aCCFyBn8ev+cHtTlAIOcgjPXg9TjI69gDjPJ96Em9vLS/XTddt9hJa6/Pv06au+ttt/RjMnnAP4A8ng4754xn06/SRV2tubkHgrgZ6jGc45GSPxH1p4UcAZODwRu78kYwpPbPAHXqM5sCHPYbSuCDkcgLnocEdO3p6micoR1k90tFta8dtbLTW1+u70u9muVS10a3utH+Ol/VdCJTtyQRgLkAD2yd2MnHTGADnj1x9aeEfDKvpmiWgtYDcXlnYwr/AKJHNM818seD/qiWkLv+7ZhkMVyGxx8t6fpN/q+oWGkabZ3eo6nql5b6dpum2ML3F5e6heSpBa2lpCgLzT3E0ixRxgZZ2VeeSPtO409/B/xV+AnwQsdan1rxzY+N/CWm/FnU7K9gu9Li8Ta54n0WG28BaUqxmGWLwbpRFhrN8ryG71m6vLdC1vZLHXp5FxflPDtfHfXcLVxdfFYDEKhCnCnNUoxg5Tq1nVkuSHNyx5o8z5pqMU9jHF5Pi8yp4d0akKVOliKTqOUpJylJwioQ5U7ySu9bWs9dr/bviv47/BX4deKNR+BOu/Br4VeGLj4fWmgeHrL4sX/wi8MfFFb/AFL+wtNvdWu/HfhC6h0LU3Jvp/Kn1PwzrEt5E0NxL/YmoNL5Q898feOvjZ4T0K78ceG/gn+xx8UPhZE/HxT+FXwP0LxL4X0/cw8qLxNZJcQeIfA97JuQNY+MNC0WcNvWAzIpavin9pLxPF4h/aK+OGqwOvkS/FHxjDashyjW1hq9xp0ITA2keRZxqFAxtwegGON8AfE7xv8ADPxDF4n+HvizXfBniCJdh1LQL6Sza4gJBktNStl3WWq6fOuVudO1O2u7C5UlJ7eVGIr8SwnCSnhsPmFJxq4jFUqWJxOHxcqlSFSpUjGVRwqp+1oTlKTTSlOmk7Kknt9/iM7tXq4aUXTpUpOnRqUVGMqcIe7Hmgko1VGK0XuSuk3Pt7vJ+2Z8QYkTyvhN+y4i54Kfs9+C5MjOQd8qTEkgYAZgQpAZQrDMT/twfE1GZIvhh+zCm4f9G4fDlgCmAFDPpzsMhscNx1AJ5pL7xx8FvjQjp8V/DMfwl8dzn5fi58JNAiPhHU7t8f6R8QPg5bPa2NuZW+e61v4b3GjyIWlmfwrqUrAHxr4lfAT4g/DjSYvFyxaR46+Gd9KItM+K/wAO75vE/gK6Z9uy31G+gjj1DwpqzZ/e6D4u07QtZiIKmyIUufVwuAyGdSGGxuXfUMRJ2hGu37Kq/df7is2qdRStdRvGpZawitvPrYnMOWVTD4t4ik7O9NRVSKVn78OW8bWV2rq90pNHsJ/bj+KwRivw7/ZoQPkFo/2d/AEUqnn5g8dgGXAxgZwp5CnaGHcv8VvgF+1bbaVpv7QN9qXwK+Mem6PD4d8P/GTw+NU174Q6lpltLJJpWjeMfh2z3V34LsLN5DBHqHg+4g0qBGaa6sIoohG358xT7ucblYDbtO9RwOcqSBxyAclfYZapVQOQVwCRgjt6HHPI4ywI4zxwcH0MRwtl69nVwcXgcTTlejisLK1SDkktVLmhUhJaSpzjKL0urpNc9HOMWuaniGq9J6VKFZXjJLl0VrOMk9bxakt7tH0p8Qf2dr/4Eajbz/Gu5up9B1VobjwDe/DYQa9oHxb0qaATjWPCfxDmjfwzYaKY2iF1Lcx3uv2RdoG8O+ZFLs8z174laxqmhnwro9hZ+CvAjSpP/wAIb4Za6is9QmjwYdQ8Xarcyvq/jLVVUlku9duriC0LvHpdjptsRbp9a/s7w+IfHX7MH7XvgPX7rUdf8DfD74b+DPiZ4J8NTebfQ+FfiZcfE3w7oFlq/heExTzade69o9/rWi6na6eYV1W2una4SZ4lK+GR/s7+PrOyg1Tx2vh34Q6NcossV98WNbh8M6jcxMqss9h4Lhhv/iBqqsuDC9h4UuIn4HmjAA4stzHDrEYzD51Xp1sVl2Jhh4WbjDESdChXhKlh0r+2cKq51+8anzOE1FqJtj8PNUsNUwVOdOjiqftZJvWmvaShJTqS+KCcLxfuK1udXWvzhKzkGM4CrnaAp+XOMDgnoRnB+UdTUflK7IrupeTARBkyOxAIRY1y7McnAVWJ6AHNe9z2f7Pfg5D9s1Dx/wDGTVI1JMGjQ2/wr8DiYEjB1PUote8aavaBgQSmleFZ5EJ+eBmIGMf2hfFOhBrf4YeHfA3wftduwXfgjQEu/FxRscy/EHxbN4g8YRyN1dtO1bToskmOGMHA+ojmOIxCSwOBny6KNbE/7PSs+X7Di6tknt7JJ3fvdTxXh6VO6xGJhfS8aa9pP7LvdNRd9VpNvS+uiE0P9n74n65psOt3PhtfB/huRfNXxT8R9U0z4feHniC5aa2vPFNzp0+pj5gVj0i11GaTJEMTkqC+bwV8AfCZDeMPixr/AMRdSjYGTQPgv4aa10gOrJm3m+IXj5NNhCltym50zwlqsJBDRySkgr49rXiDW/E19Nq3iPWtX8R6pM5afUdf1S91i+ld8Nua61C4uJSTg5UNg8Dj5azDzuDE/NjGD93HU4IB54AA9yc850jgsfXblisc6UHvSwsFBW93R1KinJ97w9m29uqHCthqV/ZYdTa2lWldv4VeMNI9b2kmux7aPi/4V8OMF+FvwW8DeFpYeLfxP48a4+L/AIy4QKJ8+KI4/BFlcgncr6d4MgeGQB4pl78V4r+J3xB+IEqHxr408R+Jkg/487LVNUuX0ixUtkR6docMkOj6dEgOIoLGxt4kVQoUDaa4NgADwDx+AA5xz26denPfBp8IKndgbSM8nBPTHHsOQctgHHvWsMtwdH957L2lRae1rSlWqtu137So5yW92r8qu0uqRPFVpxScuSKafLC0VdtbJJRS0S6t7a7vptMkdmWIRvIXKpFDCgZpZXZEigjRW/ePM5EcaJlzIV2k9B9x/tT33/Cr/CPwk/ZVspFguPhZpB8ffF6O3fKah8dviXZ2Wo6xZ3u07Z5Ph/4T/sDwfAjs/wBku4NYjQhndl8v/Y+0bRT8SNT+LvjOxW++Hv7N3hS++NXimzuADaazrGgzW1p8N/CEu/5Hl8W/EK78P6ebVwxubCPUXAMUMrL85eKfHOv+OvE/iHxp4pvZNT8S+Lte1TxLrt9KxL3Wsa5eS6jfzMTkhDcXDLFGSAkSxooVVC187VoLNM9pU1BfVMoSrTivhljq8UqSbTS5qVBzm00rOtTkloj1qdR4TLZVHL99jXye8rtYem481762nUSgmne9OS62Mm7nMjsuOPQgfNuxuIAP09wAATis1kIJ+XJ6Z6noeBhiBjrg8H0P8U7OJH3bsdOR6YIHBKjsOQOQDnJNTJbo+N0rLknjbuzjtnIxuOD6/QjA+uio04xjdpffrpez/TfXc8Gc3Obbvd9k9LNaO2nW71e71SSRnxQ5Zcg8c7sZU5zgHvz77sgEDBzjThBBAjUlhgMoUE5O3gABsHJOeCMnjvi4tsGGBuyFAx342hQBg4zn+EA4PODivoL9nz4EN8WNf1bWPFeqXPg34M/Diyi8TfGX4jNCRbeG/CayKItC0hmEa3/xA8ZzodB8E+Ho2a5vtUnN7PFHpdhfXEfl5jmFDA4arisRU5KUIv3VeU5ydlGnTirSlOb92MYpylJ8sU9L74PC1sXXhSpx5ryTe9oRjy80pS2iormbelkrt7nu/wAHvBvw2+DfwCvv2ivi/wCG9M8aeMPiRd6v4F/Zp+GXiFJm0W8n0t4rbxj8dPE1hEwGseGvBtw40LwtpF4P7M13xX9pF5b3ljYMpq6v+1x8YfGvhOw8I+OPGuo+L/DGhWCwaNol9PJZ2WmG3gjt4PsOl6NLpWkYigight4pbNjFGNtuwPNeC/Hv4w3fxr8fSeJLfS4/DHhHw/pWneCvhd4Dtn8zTvAPw08OxNbeGPDFseBNdrBv1HXb7/W6vr17qWpXJLXG0d9+xl4Bsfir+0j8MvD/AIhVYfBGg6pcfEb4m3kpxbWPw3+GVnJ408XSXbMwSOG807Rm0hTIdjXGpQRAl3UH4yGEhhsLjOI85w9LFY9Qq4ylSxNONaOApqm/Y4bDxmpKnUjG3tJwV6tVyezjFfQTn7erQyvAValDDOpTpVKtGcqTxM+aDqVaso8rnG93BS92MLbbv1f4+y+MfgH8S4/h0vi/W11XRfCnw98S+IBDqGo6ddeHvF3i3wto3i7WdBtHtr8PFcaDdajaWUdzKyTCezWUeTOSw0V/4KK/tNS6RbeG/Evi7wj8VfDmn4h07TfjT8MfAXxTaC1VI40iOpeK/D95re1RHHgvqsr7k3CXcSzfKvxv+LeofGz4tfEr4r6qSL34ieN/EXi9425aztNW1GWTS7BF4Kw6dpf2SwhQbfLitVRdoAWvIXuWyMrk9uPlI7g5ODzwMDnPQkHPRguHcHmeWZfLPcBhMVjo0KVSrVnQpc8K84xlPkainGPNdLl5dEvRZ4jMsRhcdiv7PxNajh5TcI01Uk4yhG3K5JycZOVt33d7bn25c/tl+IZGd5PgD+x3O7He8rfs5eGoG+8RnZa3tvCpDYB2RL6kYFTQ/t0+M7Aq1l8Cf2OrRlX5Wi/Zo8FysBgqSwumnWQAEffBGdpIJGa+FXuyCeTxwTk4B6Y4P5YI9u1QG43FWUcZAwevXgc4J46jHIGMjNdi4QyKSSlgITj2kqjVlZNaydtrenpc51nWY393Fz5mn8KinqlrdK7v1fezvc/Rnw3/AMFMv2kfA11fXfgLSPgJ4CudVtvsepyeCPgX4R8LNqlkUljOn6mdBWwbUrB45ZFNlqBntCrcQ56bHh/9ttvil448H6V+0z8F/wBnLxZ8LdY8V6DZ/Ei88PfBzRfAfjuz8IX+qWVv4g1Xw5408K3WnaxpOr2NgWvre5DzqzQPG8EizOp/NmBlLeuThe/PUjGcdSMbs9R1OK37S4RUZJR5iSK0Tg4YbZQEYkE4x03HKheueBjir8HZBShWqYTAUcNiZU3GOJoR9nXjLljCM41YtSU46crvePKrPTTennWZzlTjWxdSvRjPWnVtOEoppu8WtU+v4vY+kf2vv2f3/Zp/aG+K/wAF/tD6lpfg7xFN/wAInrczrIfEHgPWLe113wPr/moqQynUfC+paXPcTW6CA3n2lEK7So+dvBnw28ffEzVZdE+HfgvxL431JAZLmLw3pN1qEWnQqMmfVb1I00/SrKMAtPeald2drCoMjzRjp+sX7QfxE8CeMP2Z/wBjv9qfxR8I9G+L3xCvPA+rfszeJr/xd4k8R2Pg3R/FfwH1GaPQb3xV4b8NXOmXXi7Vtd8Eavpl7Zxahr9jZm2smiubS+iKBPzt8ffHL4r/ABC0f/hH9c8VNpHgmDD2Xw48B6dp/wAP/htYKclfJ8G+EoNL0i8kAIBvtVh1DU5vvXF7M5djhw3m+cY3L6VGOHjTr4WdTBYvGYyonCWJwlV4erUo0acpVKinODklVlhlJSVm1Zl5pl+BoYic3Um4VlDEUaFKErxp14RqwhKclGKSU1flVRKzTSZK3wW+Hnw/k8343fGLQLHVYgwm+G/wYWx+KnjsSqMGz1bxJZX9t8M/DUhI2ySP4l128tG/1mkysPLELftAeF/Aw2fAf4ReE/Al5bswh+IXxA+z/F34pngqLu2vfEVivgfwtcqTvifwx4Ms760kVGg1R2Te3z5dRxxII40WOPqI0AQDJ4XAIOFwMDp68VgzcFmAyuT0buSvXHBJ7EAjjAyDx9bSyqOKtLMsXWxkn/y5cvYYXaPuqhBpzV9Eq8qltLNnjzxbpe7haUKCsrT+OtK9ve9pLm5W1/Io72s27LZ8aeNvGPxE1qbxJ4/8W+JfG+vzsTJrHirW7/W7za2MRwvfzyrawJkhLa2WC3jVVjSJFUYwIYVZg2QxPUEBscEc5yBxxjoeCOcVCIy3J+UdRgnr8u0nJPAJ6Ac9+lW4lKAntx0LZPYZ/DnJzk5PHFezTwuHpwjClThCEbKMYRUElp7qWkVbXZ9nqtDilUlNqUpzlNu0nJt66N3vu09XZp2s7o+rJfK8c/so6VdgGXxF+zr8R5/DtywAaeT4V/Gn7Xrmis7n5/sXhv4l6FrsKMxKxS+OYo/lMiBvly6k8wlQQR3APPQdTnGMZ6dyRwBz9IfszzprXjzWvhLezpBpfx/8Da/8JQZnRbeLxfeJB4i+GN9KWOxXtviPoPhmNJCAyRXNyiYWRg/zNDDdxzS215DJBe280lveW8q7ZLe6tpGguoJozlklgmjeKRWGVdSrjIxXh5bFYbF5ll8rKMa6xlBXuvZYttz7pv6xCtJ2asuW6V0duKj7ajhMVF3cqfsKjat79HkVr6q3s+VLZOSe2rNjw/qOr+G76LVvDmr6r4e1OFleLUdB1S+0a/iZSTujutNuLaZSCV24fquScLtr6S0/9q/4vzRRWHjW78K/GDTFQRHT/jJ4G8N+PrnyAMbIPFN7Yw+OLD5QAkun+JbOZDyjhgDXzKE6Nk5yc44HuOq5OeRk+nXtrW0CsA7nkgN/tcDBGQex/Jh3PA6MdluXYhKVfD0ak7JKooWnHb4ZpKcfNpprR6W0zw2LxME1TqzSd7pSbi37q5ZRfxK99H00tsfUEfi79nLxwoHij4K+KPhxqEmA+r/Bnx3NqGipIxBeY+BviZFrs7L3+zWfjjTYwF2xFAABeT4HfC7xATJ8PPj/AODzLKVEGhfGDQdd+FOtGRsfuDrMMfi3wAxXBH2i48XafEc73WFeF+e9LijV1AHLHjcASM499vIBYZ9ctnv+m/7LfwH+G+h/D7UP2v8A9qqxuv8AhnfwVqsujeBPh/DN/Z/ib9qL4sWaLcWnw08LFx5kXgLRpljvfir4vSNrPTtKB0WCSTU9QdYPiM6rQyGh7ahj8dGUpxpYXBKf12eLxFRpUqFOGJVSrKU5WTUKlOMYpzk4xTkvo8tpLMqkadTD0JKK5quIs6MaNJaznJwaSSV2m4ybvazbV+1+CPwe8CfsU/DbTf2xP2oNG8L+M/GeqXF8v7H37PzanZ69pfxQ8TaZI0CfHLx0bGaSC4+DXgu+VLrRbfCw+ONWt7c2pn0zy5Z/zf8Aix8Y/Hfxs8deKfib8T/E174t8eeNNXn1rxH4h1GTdNeXtwQqxwxKRFZafYwLHZaXptqkdnYWFvBZ20UcUaINz9pL49eP/wBo74oa98UviDeWZ1PUUt9M0XQdHh+w+FvAvhLTYxb6B4J8GaOhEGj+GvD1gsVnYWcCoGw15ceZdTzSN83XF4wABwArABSw3HkZ6bgQcnqTk57ZJ34fyTEqbznN7V87xlOPPbWlgcO+WUcHhb25Yx0lVmmpVqqcm+VQUcczzCg4/UsDeGAoPS9lUxFTROrPo7/YTdox8229W7uMZCfxHcSeSVIXoM/xAHk5A5OBnB+8PgBe3H7O37LHxo/ahkkax8f/ABhfVf2WP2eHIMd7aW2uafb3nx9+IumNuEiHQ/BU9r4F0/UIPmi1HxXfQo6PbnHwr4N8MeIviL4y8KeAPCVg+qeKPG/iHRfCfh3TolZ5bvWfEOoW2mafCAMnaZ7lGlZCfLiWSQjauB9aft3eM/Db/E/wx+z98O9QS9+FP7JXhCH4IeE723YGz8T+MbC8bUvi/wDEFlACSXHi74hT6q4uFLF9M0zTIw5SJMdGbw+v43AZIlz068ljMxsrpYLDTpyVKXS2KxHs6bhJ+/QjiP5TPAOOHw+Ix85WnSSo4ZNX5q9WK5p33tTp80k07xk4XVnr8bXd7GwVEGwRwxoiAfLhMKDxjjspx91s9VBrFkm8wHOM+2388Z79efmxgDpinytlsNJztA35znoMAZ5wDng888jtSLnBUN/FnkZJ9+nJ5HA9+SOa+1o0lGEUm1bRJJJRStt0SsujbdnI+elU5pttb3u0ru999Hq979LtLQeAMjnj7xOeR0IBAz3OOOwbOeMbGlale6Lf2er6TcNbappV3aappt1Gzh7O/wBMuIb6zuY3BDJNBdW8ckTgZjcKy4xuGPgttGTkn0HPOO+Sc8jnHsafkKGJZgOQcZyQQCejAdB1znGRipxOHpzo1KctVOLi01dNOyd7qzW91frbzSo1HCrTnzO8WpK1lZrlafqtbPv0S1Pt/wDb/ax1P9ou9+KujRJF4e/aR8AfD/8AaL0oRKFtzqPxP8OWV/45hiCgJusfiLb+LrORFP7uSAq2DgD4xj3nbkdRkEZHH1wPT0J+vIr7M+IVo3xL/YT+APxCi3XOt/s5/FXx7+zn4rcAyTxeCviEJ/jD8JJ7krl1tItVk+JulWruRGhgigUcKo+L42KqMKN4CsW4yRtxgemM8+/PAzXz/Djtlqwk5Lny6tWwEovWXJhqjp0ZNOz/AHtCNOqujUk9tvZzFP6060W3HExhiE9l+9jFzVrr4ZuUPJx3R0NncmNtuG+bnKsMAbfrkbjnAIGCCM54Pv8A8DPjp8Rf2fviN4Y+LPws8Sz+GvGvhK7+1aXeJiW1vbeUpHqGia5YkeRq/h/V7VpLPVtKu1ktrq1mkBAKxyJ83JN+8UgADavQgDPUnIyeePc54wBitizlBdN7ZGMjk9cDq272GDjnAHIwK2x+Cw+Mp1sLiKMa2Hr0/Z1Kc7OE1JJNOPLa+1rNNNpp3MsPXq4arTrUJSpVKcouM4XupLlflprZpvX8D9WP2ifgx4B/aR+F2q/trfsueHo9E0ixvbRP2o/2ftJLT3nwB8baxJgeM/CmnwJ50/wN8aXwnudNuxGyeENQmfSroxWPlR2f5fXunG0Jd1+UFWXAHOSpBBGQ6njkEjaemTX09+y7+0l47/Zf+J2l/E3wBLY3jx2d3oXizwXrkK3/AIP+JPgjVovsviLwH4z0plaDU/D+tWUktvJFLG81lOUvbV0ngQj6U/a8/Zw+Het+A9O/bF/ZKh1G+/Zm8bavHpfjDwTczG/8S/su/E3UCkt58MPGwTM58IXly8h+H3jC4Q2Wqad5GnzXB1HyRd/DYLGYnhzHUsnzCpKeWYibhlGPqtvkdk4ZfiKjdvaRS5cPUnd1YpQbdSPvfQ18PSzbCyx2HssVTgnjaEYWbd1fEUknrFt/vIqzhLVaPT4t+KRk1z9m/wDZt8REZfwx4g+NPwouW3Mxjisdf0L4i6TC/QIoh8d6mYgVO5QSowGFfJ7W6DcQuSepPIGcc/dzwQoyp4A7g8fW1lbPq/7MXxI0Nyz3PgD41fDjxvbREZMWmeN/C/iXwbq7oV+URnUNE8NpM4JDySQnBLFa+an06RdzspGMEYABI4zktkEqQSQc9Me9fX5DWhSpV6HNrQx+Jv2tiKkcVDTulWVrrbd9vCx8U5UpNNc+HopNq1/ZJUm97Wbhq33d9dDkXhxx7cDkkcYBOOD26k5ABxnioChA4GevTJI6YB459u/XjAroLmAfwg5AxkjHIwp6gHHQdM4PIz1y3jJGRkEAHkEZySc5A9+oHPXGDkfZU6nMk01K6V7X0bXp37rV+rZ4soKN4tWs07q97Str2d3f0u+qsUiCRwrYHJwCfrnj2HAFKvBPBBJ56Djr0Ppx+H63AvyFSoyf4hjqR16diehJx355qIqRngjJO3BIzjGBwOCOvAAHQYyTTjUvfWzTty9Xblu1fTvt/wANlZK9+i/Va/dfTTz2Ie4A5xyTgZ6nsMHAPOO2eRTgCT82OOR1x0/P0+h7ipAjEjC5BI5wOmQfXgjaB14zznipvKAIGSzHJ5IBwAMH5SeR0/Dr0NUprSOqk1dfKzvdrta6d3Z99rSjba9tNOvwvr89b31sl1K/GARkkHBGCep7j+XXjp6G1HHuOAPm5HI59OSeoxkYJ6DHSrumabf6je2enaZY3uqahqV1DZafplhazXmpaje3LpHb2djYW0U1zd3E7usUMFvFJK8hCojsVDfVn/Cr/hl8BYI9T/aFafxj8STF5+k/s3+EtXW1fR5mXdbzfHXxtpkrnwrCT5bzfD7wvNceMbiPfBrF/wCFHBWbyMwzahgnGkozrYqp/Cw1BKdWq1yrWKaUIpvWc3CEb6ve/bhsDOvFzclSowtz1Z+7TXw6NtXlJ7xik5Ss0keafC74H+KviXY6l4oNzo/gr4aeGp0h8X/FnxtcNpngfw9K6+YmnW9xHDLe+KfE9xGjHTfCfhm01PXb5vmFpDb+Zcp3F98aPCHwptLrw9+zRZ6vpmpXNvLYa78f/FdpbWvxU16GWNobyDwDp0c1za/CTw3eRuYx/ZV1deNr2BmW/wDEkaSyWC+ZfE/4yeO/i9d6YfFF5Y6f4d8ORSWXgrwB4X0+Hw78PPAmmyEH+z/Cfhay22ViZOGvdVuRea5q8u661fVL25ZpT5TsyVDcEjkg/eBxj054xnkglR61wwy/E49qvm048itOnl1Nv2NNe619Yk1fESejcbKlFvRStzmssTQw96eD5nKyU8S7Kba5f4aXwR6J6ydr3SbtK07yyO8kzzvM7yyzSl5J5ZZWMkktzNI8kk00jlpJJneR5JCzM5bNIxyCMnIOMjnI6/8A6jz1x6VAEVSCSfvd8Z46E/1OenbJNSscAk9B+R4Jx37A+1exCKiowioxirKEUrKKsrJ26pKz27evDq25Sk5Nu7b3ve6aa/W7slroRSbQuBx1JxyRtG7PJyOvUY+oIr6hh/4tj+yw5JEPi39pvxciAk7J7f4L/Cq/jlmBKkMlp4x+JMlvwMRXEHgnlSp3DwbwV4O1n4i+MPCngTw7bm417xt4i0bwvo8S9rzWr6Gyjmkx0htzM9zcvuHk28EsjDapJ9V/aX8W6L4h+K+o6L4RlE/gD4XaVpXwh+H7ht0N14a8BwHS5NaQLtTf4n13+2PEs8owZpdW8x+Q1eLmH+15hg8ui/chJY7E2aaUKU4exjLtzVnGa0tJUp7309XBRWHwuIxctJzToUm3ZtzS55JS912imuludeR4M5UtgrgcHOTgE4IB+owepwCPfD0bbtJI+vU/pnoe5HOOuM1XLMRjlv0yfl4ySCfvdR6E5GOF+6NwYDA5Xbu65wcksRkZI/u9CTjNfROmlCMVJaJKyvfRJfPbZtWfa9n5UrOV02ouV7aPqtlfq7XfM/nc0RcMp+XGfVQARyBjdn9M5PPuDYt7ye3dJbeRoZkkjlhuI5JIri2likSWOe3midXhuIZUWSKaMq6soZWEioRi5UnPmHnpzzz/AA4x04OACCOalUAgcluNwPPOcAdSDjHYAdfmGeaxnSjOM6dRJwlFqUWm1LRXTTWq1d9Nk7PqRGcoNSjzRcVpJN3TutL6NyVr+Vnppr+pVtqNj/wUR8E2+manLa2n7c3w38MRwaNqszRWUf7WvgDw3Y4XSdTmYIJfjt4T0y2EenX0jLP490i3+z3DzavaxGvzF1C0uLa4urK8trqxvrK4mtby0u4ZLW7s7m2l8m6tbq1mVZ7a4t5VeKaCaNJY5EdXUEYqzo2r6roep6Xreh6re6JrOi39pquka1plxJZ6hpmp2M0dzZXtldQsLiC6trhElhmRsqygODwR+lHjDRNG/b78Daz8YPBWm2Wk/tf/AA90Aar8cfh3o9pHZw/HnwppMKJd/GjwLpdukaSeOtLtY1f4ieGrCMzagpbXrK3dpZUm+MvU4XxCUpSeRYmouR2k1llacklF6+7g6ja5XfloSdm/Zyi4/SRUM6oqTS/tKhBc6tH/AGunBR1Tad66Wsv+fkVf4t/y0eNVYjhu5xjIz0469gOc54PTkIUUKxznAI6YwPmwAw4APXswxgANkHcu7PaiOqjyzjaSMNuAB2uDnBIxkk5+ZsDGTWNcIyA5X7xyBzxx+XHp0HAA5FfaU6ynGDi03K0k4yTUo2jK6d9E1rpa+urVz5+pHklaMZRUZJNSWqate972Wmz3vr51iATuyuMjPZTgjOSAeCAOOO5HPFev60h8S/AbwjrBCtf/AAq8ca34HvieXTwn49gk8Y+Fg5O5hBbeItP8Y28bZ2xvfKg2llz5CAGbBIDDAIGRhT0OT1zgrwegx1r2n4QQt4hHxJ+HDkH/AIT/AOHepyaNEfmLeMPAMqeOPD7xKOtzc2uk6zpEYUFnGqSIuN+1vPzXSlSxEXrhK8KzdnZ03JU6u19FSlN9dYq91v2YLedL3Uq1NwtfXm92UFpsrrp3s3seK2xU8MgZeMKQMLnAIxx3IyRjaCSw3c17v4Y+NXi3SNMg8Na/Ho/xG8FQFkTwT8RLF/EWkWcbff8A7B1GSWHxD4TuSoUJc+GNY0qRGU5LqCteJxwqsSyDI3KrEMCCCwXII5Oc9eflPGB0p4bBzlsDj0yDn3x6cYHsOK7quFwmMowVWjGXNFNTikqidotOM1qpbap6apM41Vq0ZtU5OLg7OLd4tx5bpqSaab3urde59DXOhfs/+OgP+EX1/WPgh4mmYn/hH/HtxceMPhtczP8AN5Wm+N9LtF8TeHYC6+XCniLRdbgQ4+06wAHkrzPx38K/Hvw6itL3xR4elg0DU3J0fxdpFzZeIPBmtL8u06T4r0ae/wBFun2MrPaterfQ8pcWsMisg4CRgwGHbvgEAjHPGeeO2Mc5yxxknrfB3xJ8b/DyS6/4RDxJeaZZ6inlaxoc8drq3hfXIc5Nvr3hbVoL7w/rNue8d/p85BO9CrYavPp4TMME74XFyxVLrQxj5pJJxuqdde+kklb2iqO7SukzZVKGI0r0VSm7Xq0dE3eK96F+V2s9IuK1d1ojiSwwDknBx95SDgDHIJBPIGAfTjOaDnIyoIAPJJwOncjB/XHtXuP9ufB7x0GHirw1dfCPxNKML4q+HUE2seBru4JZjPrPw61K6OoaMrkjzbjwjrZtIF3LbeG9u2MY+v8AwY8ZaNpcviPRv7M+IPguIB38aeALl/EGj2kZGQdcsUii17wtMB96DxFpen7WBVXcqSeinmlHnjTxcJ4Oq5K0ayapzbST5amtOV03ZX5nzarQmWCny+0pShWhu/Z3cknZ3lFq90ra6rzPKQADwOM5xn6dT7+v9eTNCwEilW2gEkbgSRyMgAnbyAcgj8+tNWMFSyOrgDI2EMegwPYnOTnJBxnrUoTA5G0YDZ6YY8gd8kY6DkYOeMZ9OLjbRxnF2WlpfypO9veVnur63v1ZzcrV01yyTUWnutYvbv8A8DzPpr4M/GnRdD0LVPhD8YNOvPFXwK8XXaXWpabZhW8Q/DvxEwaK3+Ivw6mlV0s9asi4bVdIyun+IrIS2d5EZWSWuH+NnwU1r4N67pkUup2fjDwN4tszrnw1+JOh5bw3488NyuFjvbUsW+wa1Y5W117w7dMuo6PqO+3uo2RoJ5/H1fqTklQCMjIOTgEE54PTsMDnocfSPwZ+Meh6PompfCD4yWF94p+BPiu9W9vLSxCSeJvhl4lZTDb/ABG+Hk0qsLXVbRZMazowK2HibThLaXcbTmJx8xjMHWyyvUzLLqbnSqy58dgabsp2SbxFCPwxrJaNKyqpWdppN+tQq08XCOExUuWpTTjh8Q3KTj8N6c2m24Nv3XryvVaHzI6j5jtZQpO3p+GezLjAxuIJ5PHDV2Qk/L8uSQD2z2zxnnsOuQc8ivc/jd8GNe+DPiCxt59Ts/F/grxVYprnw5+JGhqX8NeOPDMuzyr2yk3OLLWLUFYNa0Od1vtKvd8M6tC0E8/iOON244H4fL6knAPT5iMDoOvA9vBYunjaMMRR5ZUZRi4yTfNzWjzRmnbllF3TjJXTupa3T82vh54apKnNPmi7PRcr21UrtOLvo9U77aXIMFeMccc4xk45Jyc+mc4PsBRnPXHTd6kdcnPp9OvNTlFcbg544K5HsAM9uCPTk5Y5zmuYyCQmSSMZI6bQMjoc9e/UnHOK7NurT00eqvZaN382nq9PlfBq7a2VlqrpdE9VtZu9/u7gSGOOmDnHGeD2/TJxyD1Bp3SkC+gxjHTPfocbdvPTg5oIbnIxweSCcHovQ56fz6jmko7JN7K/a2l7eit3822tWk9NHZPtotr/AD2vZPS19BCByQATn0yCRtJyBwTgDG72xjimsAobtnPIOAFyMZzj27cHJG3s7ecsAoBAGTghdpII7duPbvnrUbHg/N0JwAMY4HcqMfKTgZAbnI4NWlJJX7q+utm0kuvl6q+y3pKSs3pG6bve1rxteyut12t6byZIPqCe3UdOTk8jPp07juXc/wCR/wDXqLcBuwwzjPfq3Q4KjqeAM5HPPenD5s4YgDdnHJHHyj7oPXocceuDxPK31Xn3eie3lfyv1s95tt/k+y3tfultv5sfRx/jTSRzljkgng57c5xnHTPTrz0zTgFIOJM7eCRyRwPz578EetKN3e357NPf8LNrb8BNNbpq+11a4zvyBnPTPHJOMfNnpyR1wduRmnZ/Tr7d6jx1IJ6kj72QCVGcbecEchiSc9PVchflOSCGJYryc9uAOh+pA6LzVW8tba6el2r6eSVrpv0Hyq3ay18tE312Sfr6kn9eP68f/W545pM4/XHv7c9O/wCWewpAc8joOOnP4eg6deOO3dfXvz6++Mfn+XQA0+Z3Wq2V7+SX4u7d3v11Wqs9fK2/yS39fuEB6HBz6Z4x1zjH9OcgY9XbQN3A9OnXPXngggg8de+MGgk8YA68+36f5PPrSHocf4f0/p9Kalqrbvs9tr3+X46W6FKWqdt21200Xfpa+u+nlac8c4A4GQe/Qc8nnk+o/SlV1Uqp6lhyMd2U5I7HcehOR7UMT2wfTP4/56jr+aJEvTcwBO7JPoy5zkDGeeSevGOOE9FHyaTtvpa9uvVarv6hf3V5Sbv8o2u9tNlv10T3lFnaOCE1e1jPO1bmC4jyPdkEiDPOckgDgk4FTx6LJLtEWqaHPklUQ6rFbnIxwVu0twDz8oJ4yTngE4hI7nPr75JHI5zk565/SmlEZc7Rg9yFJBz2yDgjjA685HBFYKFWzUKkk7pWkrp7L1v3u+mwRaT1hdX1t7rTutrLza7676nUR+FNflUG3skul2s2LO/026Yg5ztWK5aQ9egXcRjIyeYZfC3iWFTI/h3W1AXkjTZ5EIHTLxRumAB1BOBxuBOBznlx4HAyOQVwGPfJK4J/DvjPob9vfXts4e2vL62K8AwXlxAAP+2cigjH90DB28DpQ44qKsnSkrrV3TdrX029G100saL2D6VIv1TWjXo35Jf5MSW1uISTPa3cBB58+1miPXk4aIeg5OM++Krqy54cAYJwWRccHtgA5PuW5HGflro4PGHiu3wkPiHWMLtKo9/POmAc/MkzSIR1IyGU/d7k1uxfEfxWoH2saFqqbQpXWPDGg6gTkcEyyWQlOM8kv68ms3VxUdqMajSXuqVrppeXLotNdOiW5S9g3yupJPZc0btX5btWe1vVa9nrwgI7/gQQc4HOOh6+3HvRyOxOSOgJHI4IyMc8HBz755FejR+PbaX/AJCHw9+HmoAckpol9pjtuzlt+k6nabepwQpVeMKeMTL4q+H0qj7d8JNPXcTvbRvGHifTimSCBGl1LqUa456g/MzAhsHOX1yvHWWArbbwdN9Y95K+t7dVoNUKWyxNLZXTUl2aWl1re+/3PReZllxnhQDjPTHOBjcMjn8M49KaWDY+bDYx1wcHOfQkcnnqTyD3r1JdU+DlzkT+DfiJpbEZ36b400bVETHPywal4ahkYDBxm4+YDbu3EmpRpfwRvUyniz4m6LI3RNR8IaDrUKcqCXksdfs5Sq8E7LdWODhcms3mcY/xMJiqa6tUZ1Oquv3ad/LbpZ9SlhJN+5VozvZfxEnf3dLScd2+uyV9zygbGwGb7x6KWBIJJGCAC3XJ4IPK9SaeEB6bs5A6sQo91C4xgjknnqwxivZYPh78NL/zJNP+Onhy2YlTFF4l8F+LdFkJA6vNYWesQRgHHLSYABbkVqp8EJb3jRPil8GdbztKCLx0ukzPuHCGHxFZaW4bqpWUfIcgtgNWazrBRfvzqUkt3Vw9SCWses4RV/S+2vZ6rL8TZKKjK7u4wqwm27R6RldJWvp1V9zwoR7cEkkjng+v4Z6HnsBnjbUqxu/GCeQSceuDn6c9T3zk17oP2dvim7gaboWl+IVbLK/hvxX4V14sAAxKx6dq0srZBULmIkbsDngVbj4H/F3T2Rbv4ZeO4uQ2V8L6tcRsOCCslvayxsDkY2kgjHHOa1hnGWy+DG4TW7s6tNO1orRN36u9tbrsTLCYyDs8NWdraqEtLpa3XVdXp5t9PJEty207evy4C9TwRuyDjOcjcM9+Nwra0Xw/q2vatpuj6JpWo6xrGqXEVrp2k6ZazXt/fXEmPLit7aFHkZm5524RQzsVUkr9K/Br4A3niPxPqlz8TtN8U+C/hv4C8MX3j34h6tPo93p2qjw3pzJDDpWiHUrJLc654j1OS30rSPPR4hNPLO6stq8bfWlt8SP2PPC/hq40n4L+MfiR8FNZ1VXXV/GFz8NIvGfj+5srhCp0iDxXc+KSNHsETiX/AIR7SdNknmMj7yvlbPns24po0Kjw2X0K+YV1yqdbD0auIw1D2iTj7WVCFSV7LnUIxctVdq6a9HBZPOpCNbE1KeGpv4adWapVKqTV+RVLLld3FtyS+KyeqPnG7tdK/ZGsnK3em65+05q+nmGCOylgv9I+A+l38IjmuXuomkgu/iTc28zRwGLcnh6FzIrNPIjz+Vfst+QP2jvhTrurTyS2Xh7xgfH+vX1y7TP9j8G2uo+MNU1C7lfzHkkYaWZpJZDlpH3M28hj7J4I/Zo+Dnxd8bxeFfBv7Q/iTU9b1aDWdXurzXPhRq9pFDYaJp82ua7ruu6rdeIPIgt7Szt7i4vdQu5SoJAIkeRFKaf8JP2dvCUOuSaZ+2h4Ul1LXfD174ba8j+EvxHuTp1lqzJBrJspLGINJcXdhDLpbTeYsDWV/dosZJQp4azTL/Y4zDznj6+aYyhy4it/ZmP5qUKycIRjBYdunRgufkhfmbUm3KXNb0/qOK5sPWUcLDB0KqdKCxVC05R5JSbftE5VGlFSaVldK6SSXxpqOrPrmt65rUsrSS61rer6xJIxwztqd/cXrPJ3yzT8gjcW64O6iOYHOM8HaDhsY7fMBzgd+p7gnk/QEvwk/Zstdqyftg2chBPy6f8AAb4jXLccHabq7s0+bkkGTngdOCReAf2V7Vj9o/aj8W3gAGBp/wCzprhy2N3y/b/HFngjP8SgEYP1+koZxg6dGlThh8e4wpQjHly3G7RSjqnQTe1raLo9meVUweInOcpTwycpSld4nD2d2ne/tbaN+avZrRnhiTypgBWBx3B5z0yO/fAAzjtxmuz8EfFH4ifC3WJtc+HnijUvC99eQG31S3txFeaH4gsWUiXTvFHhnUYbvw/4n0yZCUm0/W9OvbWQHAj3hWHr9r4V/Y+KZl+P3xlunBG5bP8AZ/0q2TuTtN78TxgE5JBAB6HAzWkvh79i+IBpPid+0ZqJAHy2vwo8BacrEYIAa7+IV18p7EoRlQMHvliM2y+vB0q2V5hWi9HGeX4h3bSWnPTVtddU9dVqyqWAxVKcasMbhKctFeOJpra38tTa+q79tTn59d/Z++MjEeLtFh/Zt+JVwSR4y8C6Zf6z8DfEl4xP73xN8Pka58R/DmWeUq1xqHgmbWvD8O9zH4SsosFfMfiD8FfiN8NLe01rW9Ms9U8GapKq6J8R/CGo2vij4fa4rsBH9g8T6UbiztrtwdzaRqp07WYD+7uNOhdTGPZZdI/Y1uLmKysbj9qHXdRu5o4bCys9G+HFvfXt1IVjSC2tLe91O5lmlZtiQQRys5bYobOD9MeFPBfwS/Z306XxH4q8X/G/4KJrQhFx8NPG2r/D/X/FXi7S5YnYjWPghpGheI4rq0lEoEa/Eu38LWRH76KRz5Yf5ytnM8ucVgqeYTg2o08uxdJ1Kkm7O2HlzyxMUuzhWpwSilCmtvVhgY4lOVerhYtJOWJpTjFL4UnVVlTldrR3hJvXV6HL/BLUb/wd/wAE/wD9qXx/oeo3+i634v8Ajj+z98MrDVtPvG06+t9K8PWuu+ObtIbuCSK7gWa5awmea3ZSrW6YYEAj4D1e+ubmee9upri5vLiSSaa9vZZru7uHfkyzXc7SyzOzEsXeVy2QxYbjn9AY/wBt/wCDHg60vvh/4B/Z9h1n4K6/4nuvGXjPwZ44PgiC38UeKDpUOj6X4g0rSovDGtWPg6bTLdJJLWzs57yGFpQtm1nHGVbndT+K3/BOvx1bg69+zv8AHD4Xam65kvvhh8R9P16xjlbHzjSfF+oXdoqrjcY7exsoxgiKJRgLx5Xi8ywOKx2LxfDOPlDMMX9bhWoxwtWrSgqGGoRp1qbrRqxlH2baUYzdmnbmbS3xlDBYqlhqNHNcOp4aj7FxqOcYSk5uTcHy2d+dXdl91mfnZeTMzncTkZyMkksT37ng9STjuNtZjxMCz8kEH5cYPTBwfUEk9fXB7n9J/Av7OX7Ffx58X6B8PvhJ+0f8YvCHxB8Z3/8AY3g7QPir8I9HutI1bxFdQyHSdHufFPhnxFbwWH268WOzS7fT5AHmG2KZgkL/AJ9atot/oN9qWkarA9rqek6lf6TqNs64kttQ0y8msL63dSAweG5t5YmztywPABr7zK87w+YVqmHpU69DEUqcJ1MPisNWoVPZyvGM1GpCKlFyhKPNDa1rrRHzeMyuthYQquVKpSqTlCFSlVjUTlFwcoXTbT1Ts7S7HMpwcEEqW55xg8enbnHY5weeamz/AFH8+uP6+2fSkcFd3XGTxzwcjqeSB0HA79cdG5UsPmJGTgY6fy7Dp/8AXr6JK8U9uqbu+zXlFd35djzGmpXaatpdJtaJJq1u2my6aaE6hDxznnrj09MEcdcEjJwM9jZCKYyxKqFGWLMqjaACcE8DCk4B4JKjBPRkPzDaeeMt1z1LcAnB69vf71fS37MHwgtPjP8AGPwn4Q1iY6f4LszfeMfibrMg22+g/DDwXat4i8banczfKIVbR7KawtfMKrLf31nCMyTqtebmWPp5dg8Ri6r5YUKcpyet2opOMYpbNu6jFLVtWV2r9eDw08ViKNCEW3UqKN91y6avVWSu22201e9tb9j8SR/wpb9lT4bfB+JDa+Ov2hdUs/2gvimPu3Nj8PNHW90b4IeE7vIaRYr8vrvj+e1kIG++0mZ0IjjYfFPT5SAxLnIwOMjqQWPGADg+/UkV7z+0R8TLn41/GHx18Tntxp9n4l1uQ+HNHQFYNA8GaTDDo/g7w5bxDakVvo/hyx02yWNAsZljndVzIQfDDGQeVIyMjPXIzk45745OPYbenDw/hqlLAxrYlWxWNlPF4m6V/aVrS5E7axoxUaMLq6hCF+h1ZpVhPEunSbdLDpUKd7tctNKPMt9ZyvKWyvJtaXJ4SpYK3BPIOQccHBIIyBxjjJwODg8dVpelz38iRWcE9xKR8scEMk0pClASkcUTuwy6ISqlV3f3jg8gOAW+6qAs5JwFwBk7iMDGASQ3BwMjNfplpPjnxR+xj8Efh3pHgXVrzwb+0Z8cI9O+L3i7xfpoii8UfDT4QeXLbfDfwPp81xBcS6Ve/EDNz458RiDyJZtFHhqykDQzTB888zStgvq1DCUoYnGYur7OhRlNwhaK56lSpOMZyjTpxTcpKEm5ckYpuaTWXYGniXVqV5ulhqMOadRLmkrtKMYJyXNKd7RSkrJSl0ufO3wf+Cuu/Evxqnhc7fDFjpOk6h4u8Z+I9ftp7aw8FeBPD1uuoeJvFmpQSxxz3C6ZYoUsNMg33Wr6pPY6baI895GB2/xv+NmleI/COlfB74SaXeeFPgL4R1e51jQ9Kuwo8UeP/EFxHHDcfEf4o3drth1bxReqsiaVYJ5un+E9Lmh0nS0VInuH9nj/AOCmf7XFzClr4v8AH3hn4k2Ct+9tPiV8MPAXiwXkRfe0F9dXOgW99dxO+1pPPudzMqk8LVO6/bC+Efi4Mfin+xB+zj4qvJdxm1fwLL46+D2pyySHDzBPCuuXGjibliANNCA4wgAAr4erLiSeY08bmeRQxtGhyvDUMvx1OcadXaVaVPFwwkZVUny05OT9mk3FNyuvooLKoYSVDB4+WHqVf41XEYealKLslTU6MqkowWjairt77JH56yEYCqDv7yMrrgll+bJGMZ+VucDHBwRn63+EvivQ/hX+y5+0N4qttQgT4n/GW/8ADv7P/hmwSQDVtH+GjiPxn8WvEpiCGSCx1r7H4a8IxXTmNZftF/AhIR8+m6xo/wCzL8XPhb8TvG/wo/Z/8ZfBrV/hCvgvxT4x1DUPixrHxE8JT+HfFfii08Hpo1rYX2i2moJq8l/e297Z/a9QjhuLO21FhJIbYKfCNM8T/AK9nl074mXXxQTwxFYRnSk+FOh+E49dmnZo7f7Hf3vjC7t7W0trbT4wqSJBey3DrEXKtNO6/b4Whluf8O5pj8fXxOBxGWYzC0/7ESo1cfia8Pq+KhCcKVapTeHcJwlNxqSvG8ZJXs/DlPEZbmWDoYeNLEU8XRqzeOlKcMNSpz5qMpKUoRl7XmUlBSSSdmm2z5hWTD8EYGF7nkBQQMAgKAOnUDG3kGnSNIeSGUckYDA4wOhwc59M7Tk5zkZ+wLbW/wDgnlZL+88Aftla64AYNcfEH4N6JGTnLZW18MX7KpyAo3kABsdcVpr8RP8Agn3a7BD+zZ+0tq2M5bVP2h/CVgXHHOdL+Hb7B97JDHGSOgrjWc1Ycqp5HmtRJ8ukMLFaWV0p4mLVk7JPW/ZLXWWX0pXc8zwULvT3q8mruL15aMt720/yv8ShX+8CR1GCrEjrjopHOP0OSeRUu1j2IzkEAOB64ztyD2K98nB4GftkfGT9hK1INn+xP8QdSK5IOuftS66N2McsukeCLTGMnOxsEk4wcgzp+0N+x3aktZf8E+vDlyAwIGuftH/Fq+5PB3izhsS3XnHGMA8da/tzMW/d4ZzWS92zdbLVdPld7PHX0u918tDFZfg9ObN8H7rTXu4ptP3dF/s71b113urvv8TpGYwGLYHG5s52nsSADn/aPOT1HrftiSvlswGT04zyy+gzjjJwQcA+uR9twftR/szRECz/AOCd3wJ2hSP+Jr8UvjfqYDHH3s+JbdTg89Fz0C9SNOL9r74LW5R7D/gnp+yTAASc3dx8X9VbJI+ZmuPHqEg9DkDABJXNcdfNM5qRtHhzHKTaacsTly3s73WLlbXyVlu9zqo4TAwavmuHe0mlRxDevLd60ld6u7XZ30vf3X9inRfh/wDH39mr9oz9lP4neP8ATfhfBo2t+Fv2n/hh8Qdcsp9W0jwzrfhS2l8HfEiG902zZdUn0zVPC+paVcamdGhubuzs7K41eS3njsXhbzHx9/wTp/aR0LQbjxZ8PtA8PftFfDxJmWLx/wDs6eJLD4p6SfLgS4IudA0tk8b6XIsLh5YL7w3GYcPubClzJp37e3hjRZVvPDf7FX7HPh6+RXjivLLwh4+lnijdR5kKyzePAzpKCUmEhInjyj5jyp2Yv+CnXxK0jYfCHwJ/ZW8HSRPNMk/h74W63bT/AGi5j8ua5ac+NC8ty0WQtwzPKgP7t0IwvwH1fj3CZpi8TlGXQo4PF16eIq4LMK2GnRjV9nTp1JUpUJ+1hKbpqo3zThzSk3Sb1f1HPw1iMJQoY3EVp4ihTdOFfD06sW4qSlTU4zjyyUHJxWkWkl7zSsfmd4l0jVfDusXuha9pWp6HrVhJ5F/o2tWF1pGq2M5CnyrvTdRht7y2lCkZjuIY5MFRsIIY8tLEGBPQBlwdpBGOBnA46jI655z6ftnon7Sl/wDt+/Dr48+FPjv8Nvhf42+Lvwj+GEvxo+Cs3h7QtQ8H+JNe0XwNewy/FzwU3iqy1m/8SzXMvgm4/wCEi8PwtLe2lpeaFcmXTLqJlSP81LXwL8IviEUk+Hvj+b4e61dGNrfwV8a5rePSbiV0Tba6F8XNCtItBcyMSsCeM9A8HQrlBPqrklj93lXEmKk62HzbATweLwUqUcT7GTxWGTqQhUhVjKMY1fYuN4+0nSjTjOFSHO3B2+azDKcPFU6mExMa1GupOmpp0qj5Wk4SveHMpJWgpOVmpWXNY+dfsy7squ0EDA5OSce4yQe69c+1PFq4GSPlGOBkZ544IPt9P5etePPhD8RPhhLAvjjwhrHh22vfn0rWLqJLzw3rcRA23GgeKdMe98O65bSBcxXGlapdxMGGDlSK83dJExlSQykhsEqFwT1XhQQcDPccEjJP1+GzChiacJ0K9OtCSTi4TUlZ2tqtOmi3T7vf56ph69GTjOnKHK03zJpWXLt+j9bttaN0u81HRdT0zXdIuHtNX0LUrHXNJuoyVltdT0i6g1CxuIyCGVorm2jcEddnXrj6C/ao0HTYPi9e+PPDtstt4W+Nvh7w/wDG7w7DCAltbJ8Qbb7f4o0iHZtQf8I945h8UaK0aqPLGnqGwWFeAW4AZRkcHPYDHGRjGMZPOR7AnAx9W3tknxF/ZX0jUUZpvEX7PHxEm8N3gJLTt8LPjC0+saFM7csLHQfiJpWr2YJzFDL4tji48xFPi5pOWCzHLswu1TnKWBxDvoo4lwdGUls7V4U6cdfddWVmrnoYKKrYXF4VpucVHEUrXlbkfvxTV/sScpaJtxV1pr8mwQF+QPTjaMdQcEEZ/DA9NwzW7awfcXGGKjAHcZGABzwMnOVA55xgFrMemSRkPsIxgqqkglgQOSuCfbnPAz2r6x/ZW/Zkufj94i17WfFevx/Df4EfCfTE8VfHT4wahEF0zwd4WUgw6Lo7Ooj1X4geKpIzpnhLw9D513eXkhu3t3tLZw5mubUMBhauLxFRQo00knbmnOb5YwpUoxbdWpOTUIQjeUptRScnrWBwM8XXp0KMG6kvibaUYxVnKc29IxhHWUnaKV29k10P7LX7N+g+P7LxJ8bvjlrd/wCAP2W/hLcW5+Ini60CR69438QzJ5+kfB34XwTgDWPHfitlEE80XmW3hnSHn1nUGjVIUflP2of2qfEH7RXi7TL1tIsPAXw28B6PH4M+DHwi0F2Hhb4WfD2ycGy0TTYsql3rOoso1LxT4ilRr7XtZlnu7qQxRWsUVz9qr9p+0+NF/wCG/Anw40F/hv8As3fCG3u9C+CXwuglOLGwlbbqXjrxk6Mw1z4k+NnT+0vEut3TTXEPmxaVZyi2t98vxddXIdc55B4OcnB9SSxBwAc85PTbgV4OSZViMxxUM7zinyYmz/s3BS9+GW4eoo6ztzRlja0be2nZqmmqNP3eaVT1cwxlHCUHl+Ad6UbfWsStHiq0VG6Tvf2MGmoQu1J2lJbRjevL/ezEYYN157ZIJxx1we456nIrBeTe+QM5zsXHB5GRxwCOoGSRgtk9KhL5ZsljuG7ng4Py4HfGDwGxyRyBxWjYwz3E0ccMBneV0iggRDLcXEsrqkMEManfJJPMyxxxL80rOQmWNfcP2dCnUqVJKMacHKUpaWjG19dFtzN3XV6nzMeerONON25ycdXb3nJabXd362cbPy+4v2OcfBzwx8bf2ydRtkE3wX8Nf8IH8GGugjJfftE/FiyvtB8KXdkj5E8/gHwv/wAJH44nZSWs5bDSpiYzJE1fBjSu2XnnkuJ5XeW5uZmLzT3EzmSeedyd7yyys7yO25ncs5OGyf0A/bLQ/B3wv8G/2NdKkjST4MaQ3xA+NQgK7dT/AGi/ijp9hqniKzvJEyJ5Ph34TOgeBrZWYi0ubbWI9qyyyA/ns4O5hgFTjcOQMk9CMAAc98epORXzfDUfr0sXn1WLf9pVYrC3Wscuw75MLy22Vb95i0nq/rNm24o9XNZKh7DARemFinXSeksTUUHVv3cLRpXT19no7tkoOcZJwASSxB6Y+uegHRv5io1BPbOc5AOOmO3HAzn+WMHMEZBYqvLDkgnAGMZ/UH+Q7VNtI7jJ+6Bk9uc8fUdhjnsRX10lq1FX0TsmttN0tdL6vT8LniOLT6p3S0WllbdO9nq1rqrd0iZecZG4jPQDj16EdAPfv0zVuGJnkOF3KI2O0gc7VztGSAOmQVU4I7ciq9smRGituYk5AB5OQeR/dAIGD+Jr3f4I/Af4pfHrxS3hT4V+Eb7xRqNrZyX2v3vnWeleGPBuiRAtd+JfHPi7V5rPw34Q8P2EYea61TXtSs7cJE6wmWcpE/JjMZhsJSlPFTp0aUWlKpVnyRik1rdtbp9evfZ70KNWtOMKNGpUk22uWN+qsmklyva911u9fdXvPwp/tDw18Dfix8NJxZ6n4c+PunfDu91y0u4JPtHhnXPhv4lutf8ADHiPQZEkSBdZW0vdT0W6kuredG0fVr62VVkZZK+XvH3w/l8GiK9gvheaVPcLbr54SO+gmkBkCOqkxzphDmaPZyVBjBYk/Zd1b6P4YuLnwrb+NvB/jX/hGmXRbnxN4M1KW/8ACeoXOnxpBcNoGp3ltYTanp0cu6O31AWscV6ifaYMxSRyNy/iLxTrHw/03wv8S9O8BfD/AMf+Gda1jxT4U0+b4meDNK+IHgj/AISTRbDSL3VLCPT725WGHxHpun6tp17bJcIGe1uZXhWVVk2foWdZNwrl/DLzXLaGFWJzChhsVRl9Y9nUxuLqUKKV1UclzSpQjGUeTRQcrJ3Z8flubZ5ic7WBxbrOhhqs6FS1NSp0KEKrenIrWjKTtK7u9LtWR8R2qK65BUkY/jBx0JGFPXjBzjnnJGa0gywrkumcA/KQMD5cc55H3SO/TjoK+vLT9s/xNp8WI/gT+x+gAIZR+zL4CcFR/d3JnIzgnttxk8Cop/24fFtxtJ+Af7HUi/KFD/sx+BVBXpyFdDzn8xnGQa/F547PZzsskw/K9r5g03H3b/8AMO47auN3fXzv+krD5bFX+vzvyxv/ALNfaUdP4id+t9Lv7j5ftbxcrskXGRt2sOSvOMenoM9eoOMV9qfskftT69+zX441LUJ9HsfiD8KPiDosvgj46fBvXJN/hf4qfD7UQI7/AEu7jYNHYeIdPike/wDCviGFF1HRdXiint5khe4jfmLL9tjxKzLj9nz9jYmMlgP+Ga/CSFjghhhLpVIzyQBwclQMrj0jSP23PEE2zzf2av2KJs8N5n7NHhoghxtYsI9Uj3DDDOVK+xB58HOKWaZjg62ExOQUKtGpG3/IwjzQas4zpt0IyjUhKKlCad4yScXdXO/AywmErwr08xnCUGrp4aTjKLspRaU3zJ3akmrNLzZ9D/EL9lvw74L0b41+M/gZrl58Sf2Xvjz+z94j8Z/CHxdJEP7Y8M6x8KvHXgLx9q/wv+JEMakaV8RPAOiw6/Z3KTMg1vSwNX09XVrlU/JzUtP2ksyAAkFcNkMducqeR7HrkHceTkf0Yfsi/tmeHtD/AGav2lvGnxy+BXwatP2ftS1/4efB3W/BnwS+H1v8N9T8WeIvidBrNl4vvtOeLU77TG8QeD/htFf6tavFZWGo3bXMFi2peTLDDX5hfto/smH9nbxToOreDvEUfxK/Z++LOlP4z+Afxe0xWk0rxj4PmZd2j6pMmIdM8eeFJXXSfFmgSiK9tbqJboW0VvdQhPk+Ds+xdHN8fkmcRnTrQrQw+Exk5KUMZVo4ahKVKpVilB4ujhp0IVEklUdOc4e9GcY+1n2V06uCw+PwLjUpOlz1aUVadKE6kuWoou7VKc4zavqrrm05W/zbvrYDOQG3AZUZLY4ODnnocHGMAgdRiuca2fdkrjAYgZ24UDkkkkHJHOBgr19T6Jf27qxymG+6Dgfw49MAHJ57qexrnZbYqGIQk9AMnrwDnB6EE9+/GK/ZaOInR0T0aS630a2V9F3totNLHwkqUZX3Vl007W1vu9E30un015Z4QMna3GACWz36Hg9889zyODmmrHk5UlWHPOAoxnpkYwRxwoyG+XJroWtCOcEddwxuAz0zzlcAZ+XjsMk5qfTNF1DV9QsNH0fTr7V9W1S7hsNM0rS7K4v9U1O9uHEdtZafp9pFPcXd3PIVjiggikkkdgscbGuueLp0qcpycFGKTlKcrJKyTvdu2nVu6XZNoyp4eU5qKjKabstHJ62ts9ZPpol0W9znhAcqigjJxyC2B/vYO0k4yOpGfqPZfhj8C/FXxIstR8Uy3ui+BPhj4euVg8V/FrxzcS6b4I0OQr5o060ljhl1HxX4omjBaw8JeF7PVNbvDtZrWC2D3MftA+E3w8+BCpe/H8/8Jj8SIlE1j+zp4U1pIxo05UPC/wAcfG+kzSR+GVjOw3Pw+8MXNx4xlUSW+s6j4TkBR/Gvil8VvHHxXu7A+J7yztPD/h2BrLwf4F8N2Meg+AvA+nM+Tp/hTwvZ7dPsFb715qEqz6vqc+661W/vrmRpT4Ms0xWZy9lliVLD7TzGrF8vKlG/1WDt7aWtozly0le6c2pRPSWDoYWKnimnU05cNTl762inWkvgv1irz0d1Fanol/8AGbwZ8KLK88M/syWWr6ZqF3aS6b4h/aB8W2sFr8VvElvMjQXlp4D06Ga5tPhF4XvY3eLytJuLzxlqFqRHqniREeSwj+VZC0sjSSO8kssjTSzSv5k08rsWkknlctLLNK5LSSOzM5OWLMSTbeADGSAcnBzjI7jHQ9udqnpkZqAxPvVgwJOQcgkcfgRg5P8AeAxz/CB6WDwWDwScouVXETd62JrfvK1R2TvKo07JPaMUoJfAo7LkxNWvXUY8rVOCfLSguWnD4bWj523bd3u27MrFGBHrnPHH3eBk+46AgcjHI5ppDNzgE9+enGOw69R69O5qz5EgOd4PPqQMEjpgAE5ODnBHr2DRC3OXIPOcb8Z+vA9sn1HHp6DqwespJ3aWvlbeyvZK223yONUqnM3yvZWduj1+elrPstyDYST8pwRnB4z6dSOeB2B45xkGomG1Cdp6gdc8jPOeR+R6c+xuhO2/PXI2k9enqTnB4yO/XmlMKhSzuVVUaRuQFKqGLKM5AY4AXIXPQckZTrKN588OWCUmrvaKT+0l2003tpYqNKbaiotczSVl6L/gdOi9fqj9msf8K+8K/GT9om5URXHw98Kj4efDaVsZf4vfFm11DQ9NvrXgZuPCXguPxb4m8yMrLaXdrpMu5PMjz8mSR7AoDblQBcnO5uFyS2cFicliQSTz3zX1b8dBP8Nvh/8ABX9n2Hdb3ugeHx8ZPihb4KyP8S/izp+n6jpGnagpBYT+EvhrF4V0w27tmzvtS1eEBZHk3fLskYOc8bjnkZJG0E7iDj15wMdBwTXhZI4162LzSo7vHVbUEldRwtH93Raetoz9+snvaq7vW56uZJ0qWHwcE7YeK9q0781aaU53vs43jTsv5dNWygcgnnp6f09D64+me1R7GBHK5Ax3wM5HUDqMEnPAx3q2YDk/McAcAADpx3J7nHODkHpgik8tlHKl+e2zrkDLZYNjnv0JIwCDX0arU29JLa/5WPHcZdm0ld6X7b2/H7vIqFCGz/wLAYjBIOc4HbJyDjHOcmpFd2B+QcHHf8Ou3g4I64OOpzUvluSSBtBPBBwDjtx746/qKd5DfwEnHHHUnjPAwM07wbXvJ7df8O6W11e+l79U9p5Xo0rt8qirPZfinfXfXRa6ApbOQCQCPlDEdACP7oHIwDu+vAFemfDfx94t+GfjPwz4/wDAuv6h4W8Y+EtSttX8O6/pkgjutMvrc5RgCGS5tJ0aS2vbC4WS0vrKeezuYJLad4j56kCDqWBOOOnoCRnODnruIzn0xV+CLJOGbg5zuweuSQQSTnBywwRnGBg1w42jQxVJ0ayp1KVSDhOEtY8skk4tO99Ha2t3e+524aVSjKNWEpQlTnCUWrqSd4u6dr78v3ff+h3xl8C+EP2mvh54i/al+B2g2Ph/xn4d+z3f7TvwQ0GJhF4X1S/fY3xf+H2mR7nb4b+JbzzZtY06FZR4S1aaW3kxYPFLX5uzKJGJPIUHHO7IIyGVgMENyRnaME9ziva/hD8ZfHXwJ+IWg/Ej4d38VprmiGe2ubHUIhd6D4m0K/i8jWvCnifTnPk6t4d12zaS01GxnR12uk0JjuIYZU+kP2iPgd4D8eeBR+1v+zBp86fCbVL9LP4t/CyOT7brn7Ovj7UCskukXUKATT/DfWrjz5/CfiF4/skduyWc8ySr5MXyWExFTh/FQy/FVJTy2vPky7F1G37Cb0WCrzk9Iu1sPUlpNWpNuSjze7WowzWjLFUYqGNprmxdCHuupCKT+sU4q19bOrGOt1zqybPz8MI2ghTgdDgZzxjJBPA6n6546V3Hw81qbwj438IeKoRmTQfEWkao6KSPMtoLuJb+A4xlJ7F7qGRSNjJI+4EBgciLT3MBkK4Q4C8qVOQrA8cNuBDKeQMg5AxnQ0829pc20lzZx6hbxMfOsZbiW1hulCtthlntyk8Ubvt3tAyS44jkQncv1VWtCrhcRTlS5+ak48qs3Lmilpe1m5ebWu54cYNVqU0+XlnFuWqS5bXult823bffTX+KPhiPwr488XeH7YZtNO12+FgykbX0q5l+26bImw7djWVxEAQCBgjO5Wz5pKDGXJVgRkjKk8Yz6YB565GM9+a+3viP8WPgrrei/D2/1L4KaT4h1zU/BtpaeMNZ0Xx34x8Oa9puteG7y40CDToLiWbW9JuIjomn6Rfwz32lXFw4vdsssgVTXhd0P2c9edhFdfGz4dyyDGy5svBvxR02J+CSJ7Wf4faksSk8BrO5lKgqTIx58vKs6rvB0YYvLsZTlSXsXVUadVTdJ+zclCnOdVJuN1+7V010aOjF4On7eU6OKpVFNqXK3KPLzqMrXlFQfRNJ6NvVHgzsCSCO24E8Y6Z/DoOQoPXFAUn1B4YseOOx6ZOeenGefp7WPhd4D1EH/hH/ANoT4dyH5WgsvG3h3x94FvXyQNryNoOv6HEe2TrKxIQcMBwb0X7PPxKvxv8ADg8F+OYifkfwL8RvAmvzSBQPlXTo9ch1dmYEHym06ORSSHw2RXqRznAtxU6roptJ+3hUo2tbT96or0Sur+WpyPA4hXap+0W/7ucakrq1rqN9etl53SPDo2OdxByD15GDjrzxjpkenArqfDXibxH4P1WHXvCuu6t4b1qBh5OqaJe3Wm3gQE7o3e1ZBcQuW/eW9yssEgJDxuuVPTa78Ifif4UjE3iP4c+OdEjGT9o1HwtrMNoyqBkreLZm1ZSv8azlSpJDNwT598qO0ZlVZAcNE7JHIpJGQyPtdCOhBUEHOST06p1sDioxUpYbEQkkr88Z6WWi0a7b/Fq1sZKOJou/sqkHeN/dla94p7q1kr+em27XvB+KPgjxxuT4wfDqzvNUlPzfEP4Y/YPBPjIyMebrWfD8dt/whHiWQffmdtK0fUblg3m6oXcvVeX4KN4pSa6+DHjDSPipCqNcSeFUT/hF/ifYxIMlJvBOqXDnXDHgkyeEtR1wS4LCCMfKPDzyWYA5AIzwR0Hq3bucbRycZbNVzvjkiuIzJFNC6zQzxSPDcQyp92WCeIrPHKjYKyJIrg87sgY4ll86PvZfi5UvtfV6kvaYfRR92MW+aHVWpyir68ttDV4iNSyxFHmbWtRJxqK6jq9Pe7XabevRFm8tbywvLnTtTsrvTNRspXgu9O1C1ms7+1mXAaK5tLmKKeCVSMOjxqysNpAIqAAq4dfvA9ckjI77WG0AZ5BGN2cjtXstp8btd1iztdG+K+haX8YNEt4BbWlx4kkmsfHek26psjXRfiFYIuugQKB5Nprr61pi7RusmAGNWD4a+A/HQ3/Cjxyllq8m1v8AhXnxTmsfDniFpWxi00DxgjR+EPEJzlYUvp/Dt/P8qx2DM2Kl5hUoLkx9F04uKUqsE6lGS91357OUVrrzpRWybBYaMrPC1VN3vGDdqsWuVtJNvm1tazba3V9DW+D/AMYdC0zw/qXwe+MdleeI/gh4pvjevHZoJfEXwv8AEko8uH4gfD95Q4hu7YsP7b0EMmn+IbESwzxfadkh4X4y/BnxF8HNfsLK+vbPxN4U8UWS678P/iDoRMvhvxz4amYC31TTpiXW3voVKw6xo0zDUNIvQ9rdR8Ryy8h4o8I+J/Bmpy6R4s0DV/DurQcnTtZsZbCZlYcSwecgiubeQHdDc20ktvKhDRSsrA17z8FPi74es9Cvfgn8brW+1/4GeKb1ryK5sUWfxJ8JfFMw8uD4geCJGUyKIi6/8JH4fDrZ6/pwkDIl6scjefUTwNT+08q/fYWqubGYOm01KyjevQV0lXirNrRVYppvmSZ6NK2MpxweL/d4ineNCtJctrtPkm3vHflurxdtLXPlkorMMLgAcncPmXHAOBkZyD1yTzkk03y9oyQRyRt4DADvgHGAOTkZAwOF6fQHxj+Avib4NeIrXS72e18S+HvEFtFrXgbxxoitc+H/ABt4euQr2eq6RKhkbzmjdRe6cxN1Zylo5U27ZX4zTPhb8QtbwdG8BeMtVMp3A2PhvVriNlY4JEi2m3b0JLMAOScnk+1hs1wlfD068cTSdOai1JzUZLZNSjJ3Uo6qUWk1JNNK1jz54CvTnOjOjJSg0tnLdxalFxfwtPXR/jdeWkHkEkbvu4xydwG3gdMdTk89CehCQOOpIPXjoOozj65AwDz0HHvJ/Z2+LiKsuqeE4fDkBXIuPGHiHwz4VjRePmdda1ezmUgkbgYi3cLxgUX+EWlaeGPiX4zfBrQHTG6Cy1/VfGF6D8vyeV4N0TWLdm52krdKMgjK5Bp/2tgU1aupu6bVJOrvytWVOLd3ppbdX21J+o17XcHGO958sLp8qervpfVO/do8RJJU5bB5z83HBJ9Dxg46dB37xkb2Pylgfm65GPcEY4yO/QY9q9nHh74G6eGOo/FzxPrrgAmDwX8LpkSTBUmOO+8V6/ohAPaQ2QGBkq2cU3+2vgDp+37H4G+Kni51GN/iLxxoHhe0k+7ndY6DoOp3SIx48v8AtQnBOGP3if2pB/w8Liqmq/5cumrPlV06vIul1rsmT9UaXv1aUUm2nz89neK+zfVJJ66XWx4yCoycBRkKN2AM5HUEZyMHII9zg0gEYIQyRF26KCNxxltu1QSScZHr75r2cfE7wnY4/wCEf+Bvw4sSo2rceIbnxZ4zuQeMO6anrUGnSMc5wbAxEtgIFAAkb42eP/L8rSZvC/hmAjYkPhTwP4Q8PuqYAYLe2ukC/wABeQxuvMyM5LDNCxuMqJ+zwLh51qkVfWLVuT2mvfXWyV7C9hRj8Ve91f3I3vZrR83K1+bdutzmfDngeLUrNr7VJbu1WV2S3tY08mXajACeV5UGFO1mVVQZUljnOBUvPht4vt7q5i0/w/rOr2cZzDf2Gl3VxFcROE2OqxpLJuUnZKoDKH+VWK7Wb07SNd1a+8Ma5401+eXU49M1jTNKuLu4lD6hqN9rUE9wIASArOkNrI7lQAqMDJgHBw7H4weJLVZrLUrXRfEWhPdSXUGi63YZOn+ZGsW3S9b0t9P17TJViVVWSz1CNEYGQIzlmb3s2xOWwyTAPKadOvm0ZxWPi5SXI7e/GXMlCUuZpwSsuXSTjex5mX0cdPMsZ9fnOGA5b4R+61J3jyNJe9yqKfO7PVpW2t5DeaLq2nsRe6TqVkwyp+12F3bkYbkN50KngsBz0x06Vnsdpwcbjg8jb09AQD0PAAXjGOtfRsHjfSdVQrpHxA+IXw2vWLKtjrOp3njnwgXJyUW+wuu6dBgYU3OnauUXaHlkwGrP1f8A4XRZWcuqLc2HjDQkG5/EHh7S/DXirT0j4/eXZh0uS/scDAb+0rW0kAXEiKwIHzdPNKzahVp06VTRKNWU6V5XirJuDjN2Vnyzk2j2ZYWKScajnC6T5Y82nu6NaSS2dmvn38DLg8hlOFPG4AL/ABDsxzyOueOcc4Kk5ywA29MZz6Y9jwcHGcHJ5ya6qTxpqd2zC6sfC13IRlvP8KaJARtwfmNpbWkgY5xtAUkkYxkCoP8AhI7WTAm8LeGJApIby7XVLMk/W21YAH73RQBuO0cc98a2IspfV1K6j8M7p6K+tk/O+zTWrtpyOnHW0k2pa3Uk2vdupbXavdWvbrdbc5uXAbK5xlckdSMd8Y6n+fHZ5YnC5O4Z6DPBz325OSO33sjkZBrdbVdCYKsnhS0Qlixaz1fVYTgjHyLNJcqvty3pxwakW88KscSaHq8JJyDb65GQMYAGJtPIPAOcsMZGCR1v29SPxYapstF7N72vb3lpvdWuJQ84u2tmn1avd6+nfztqYhzzwQQPQ/XoQuTxjp34p6HnaecnBxnAGV/DPGOgPIJGeRuGXws6kC18RRDHXz9OlAXIGc+VDk+pUIDkDjBAcIfC0jRhbzXoNxUnzNOsZccqpyy3q5xnupyDjvihYlJK9Kotnflu1yqL2j+vZdNBKm1dKUWm9m3u+W7u7WSve19Fol25JSNqjcCy9QCOpxgEkHJ54xwRjkmkJHOXA5zyTgY69RyOoGOF9c1urfaVEMR6CJyD8r3OqXRHBXcCsSREgcocEfgc7ZhrdtFjyPDPhxMKQTNa3162emW+03zRng5PyEHng4NU6072jRm22mm2lZaPXfTe6a1uxxjTkleqlfbljd2drWVra/0ndnNb0670AHqyjAyeNuAOOp5A55A5NSoTIdqbpSCQBGjSHnjkIjEnt8uWznaM10a+LdUix9mttBssfd+zeGtGDDdgMVkmtJn65AyxbPU1OvjrxfHkweIdRtRwp+wvDp4HI6CyigwOmMHjjAI6LnxTty0oR0XxSsls3sm/JK3XyZTp0Fb95J3tb3P8PVW31/O25mW3h3xDesps9B1u7BOF+z6TfzAliQMMluQQASCSeCa6KH4a+PZ1OzwnrECMR+8vYoNOiwMH7+ozWygZYfeK+oxWDceJfEt4p+2eIfEF0p3ZWbWtSkUD/da5I+oAxhQMLjIw5Hkm3GbzJQwyWlkkkJ4GWYu7N7nI7ZYkZrKUsbJrllQitHfllJ6W2u43s9bdu4lKgn8NSWjvLmirv3fW/wAtt+p6Wvwv8UjBu7zwdpXBDHVfHXhO1ZQuMnyF1SWXABGAsZbPLJndmT/hXtrHubUPid8LbBRxhPEGpaq3QkgJo+j3obgfws2TwpYHnysRLnASMEDAOFGMA+2AeM9QO2KkRXyQAOO/ygZHpntgA4HAJznFZOljXqsYo7aQpLbTbmbX/B20dzSNXDpe7h3J95T2u1Z6JWTXZpX06pnqo8HeAoxm7+Mnh+RlOWTRPB/jDU2IXk4e503TIz1PLSKCf7uTm1HoHwXgO67+IPxA1PIyy6P8O9Ls0Zu+2bWPF0bYAYFWa2BAAwGrylBMBtOMcZIb5mzyT94jgdcY54PyirIA25AznqTnJIPOQGJ45J5POSCSTWTweJ1UsdWabSvGNNRfw3elPdadmt0mVGvTTaWFgou123KX8vRvTs9rvW1j0w3vwPs9qppHxg14qSpa58Q+DvDkUgGTzHbaJr0iZAwR5r/XGNrF8W/Ci1O6y+Ddzf7Gz/xU3xJ168jOQMCSLQNN8OKR94sVkX73AGc15o0RPVQSQCBjIA4IwOxBH8Izx1OaRQoBBXGD1zg57jPU9cAYJz26VEsuoyv7WviKl0m/301d6fyOKvpfS1tLo2WJqrl5KVKN7O6hCVtray2tZNXa/I9x0z4xabpLxzaH8GfhDpc8RLxT3Nh4w126jI6M0mseMLmN2UE8tBnI3AAGu7j/AGs/jVbIyaTqHhPw/CRlRpHgzRIEiWPkbJbqC9k+Q5Id3LkkDcSPl+XolyN0QA9SWBAIHXGRgjkkHjOAMDivpD9nbwV4Y1rUPE3xK+I0LT/Cb4P6dbeJPF1tEwWXxVrN1ctbeDvh5YSjCG98WaxGsd6oIaDQ7XVbglSsZbycxy/JMJhqmJxGEjXnCKjCFRurOpVk4whTipuXNOcmoxvrd7nbhcRmFatClSrulBv3uSyioJRlKTcUk4pau76Psr/Vfxk+L3ivQf2WfAvw08Y65faz8TPjTfR/E7xvcahKhvNI+G1ldF/AHh54EjjSxg1u9iXxEligxFb25DIUuUc/ncsjNKV3HBI9B8pZRhQeGGMkjByAScCuo+I3xB174leNPEXjzxFMr6n4jv3u5LeD5bPTLNIY4NP0bTYjgQadpNjHbWFlAoCxwQqAoBOavw58K6v8SPG/hLwJoMfnaz4s1uw0OyOMpb/bbhY57+Y87LbT4DNeXUpwsdvBK5+VCayyPB0sky6viKlKnSnWdXGYm0EqcJTSlyR0SUKcVGlG6taN97F5hWlmGLpUITnJQjTw9KV7ylyuCcrO+spe89b6tX6P6p8M3C/Bv9mHxP433fZfHn7RGoXnw28IHKx3mnfCbw7PBd/EPXbdgoaMeKNa/s7wulyhTz7W2v8Ay22l8fFNzOrgqAoAyoCgfw4A2hf4QAADhc8EZGK+iv2lvHmkeL/iC2ieDpN/w7+Gmk2Pwx+HsaHEM3h/wxvt7rWiqnYZ/E+tNqOvXEww8rXsIZsxjb85R2ssm4YH3hgjOAO43MMKB0xxz781vkWF5qFXM8XF08VmNV4mfOk/ZUbRWHpW15VTpRgn/f55KzkyMzxEYzpYSg5Sp4SnGldS5lKpdOrUeqvzTva97rlTsrGXOrH5sEDHGACDnuQQDhc4yeec9AKqEopHy565OG5Ix+A7AdcA9eOfZ/APwc8ffEuS5PhHw7canYaegk1nxDdT2mkeENBgALPPrvi3WJ7DQdIiRASBeX8czAN5UUrbUrq9R8KfAv4bkr4l8RXXxw8Uw/K3hj4eXdz4e+GljcjIMOtfEG8tl1nxHGjBBPb+EdJs7Sdc/ZvEYBMh76ubYOjP2FGLxWIsl7HDx52tmnOWkKd2rXm4pp2TaVjkhhK1ROpU5aNNK/PVsv5fhVryutoxTa1ut2/B/CvhzxT4z1iHw/4M8P6z4q1icbodI0DTrnVLwIAS800dtE62sEahmmurhoYIVUySSBcsPoDTvht4F8ESiT43/EuxsNRt2y3w1+FLaZ4+8dtIoJ+xaz4ghuh4B8IyFhsma41fW9RtXbEmiu6NEfOPFPxq8e69o83hTR30r4c+BJjtbwJ8NbM+GNDuoVYsi6/ewzzeIfF0y5x9q8U61q8xOShQYUeRwIIQBHGEXHCgAc/QcdSTjGc9Sc8L6vmOO1rVVgaE2lyUeWpiGk1pKrNOnC63UISd72qWBVcNQuoQ9vJdZ+7Tu+XVRVm2rbtpX3jZs+yZv2j5vB9rPpXwG8H6R8FNPuImtbvxRY3LeKPjBrFs4KP/AGj8S9Ut47vRROjETWXgbTvClkCdrJKBuPzHq1/dahcz3dzdXV3dXsr3N5dXtw95eXk7sS891c3EktxczOQC0k0ryEgFmbGKxVmZsByMrgr2wwyM5ydxOSBx05BNOBIwPvduRx0POM9M9PfHHat8NleAwcnKnSvVduavUvUrTaSvzVJ81SVumtktnZI56uLr1vdlNxSVlCNlBX5VpCNla6XRNp+rIzIq5CqOcjJzg8YHBJycZwTnjoe9IHB42n7xySMY4PJyQRjGOnqMbejmw+TyAeAPfgHIIGR1J57fXAV2gnnB5x1/LoQcYOc+/oa7uSGiTuuq30Vu9vwu/mc8ZTWrfvOylJNv3tL6dlu0m1o+p2XgjxVfeBPFfhfxxpErQ6v4M8RaJ4r0uRDsaO+8P6lbapbEMMDBe3C4JUFXYEFWYV9P/t/aBoui/tP+OfEXhhFHg74w2Ph347eDHiVBA+jfFjSLXxPdxwBAIzHY+ILnWdPKqMI1qeA2TXxY0nG3+EgggnAIICkEdMAHAycEDoeRX2v8U45fil+xv+z18UwBP4h+BvirxL+zX4zmXLTDw3ftN47+Flzdn+GKKzl8QaPbSOdhaHyl7rXy+ZU1gc7yrMFeEK8auW1tuVe2jGth5S1s0qlF01dauv0eh72BnKvl2Mw0neVKVPF07vX3GqdRJ305o1OZ6L3YN9NPiV03EkfxcHnoCSQfcH68524PNMMLKAeOemcD3PfrnPOc8eh42FsyVDJjhSCDz/tYznDZJPIHbIyVApyW+5lJA4IwD8ucEcA5A9uD15HODX0/t/c0mnFKzXLqkmrfPb8nc8t0ot2d0272v7rT5eZpteb36LXTUzol8sLk4Xkk9BkFSRkAkAH7zDgDOcivu3w9dJ8Ef2O9c10kW3xF/a61uTwbobgGO90r4AfDq+tr7xjfRAfPBB4+8bLp2i71wl5pWhXKqWjkYV8q/D34b698U/iD4J+GfhiNn1vx74n0jwtYMAQto+qXUMNzqEm3GLbTrR59QupWJWGC3kkfgGvTP2rfH+i+OfjFqWleB5i/ww+FGj6T8GvhfEhIhbwh4Bi/sptZjCkKZvFGspqniO4mHzTtqaGUuUFfLZo3mePwOWJ81GElmGNtZx9nQnH6vTlu26uItNJ35o0aiejZ6mBaweFxOMd/aTi8Nh9uZSqJe1lFdeWnzLTZzTWup4Ncy+bIW2ADkZAGCRgJ68bcAd8YA+Y5qhJb71JBG7IwQO+ScgdcjnC5IOMHOTVu1R5CBtLZ45BPJ9Btx/C3fg8AYrqtJ0DUdVuFs9M0++1e88qW5+waXZ3F/fGCCMSzSraWkM1x5cK7mllKbI1y7FR8x+hrV6WFpOVSdOnTpxTcpzUOVLlt8TVtFZbL10v41KjOtNRhTqTqTaUVFXTd47aJu7b0ute9j1T9ln4V6F49+I02v/EeOWL4N/B3w/ffFn4v3SLs+1eEvDL28ll4ThlZlVtU+IHiFtM8H6XATvlOpTzR7xay7fPfip8VvEnxk+J/jX4qeKvLj1vxprk+rS2Fv8tno2nBY7XQ/DunRgKtvpfh3Rbax0bTbZFRIbOziQKoFfY/x+sLX9nn4G+EP2X9NKJ8R/HL6B8aP2lbiLBuNPvrqwa5+EnwhnYASRx+EdBv38W+IbGRiq+JNdt0kTzdPXZ+ehhCs2Th925sZGDncxGM8HPA4BBxwc5+ZySos3xWJzyo70GpYbLXv/ssZJzxFrbYuolKMk9aMKMt2z28wX1KhRy6F/arlq4qUdP30oLkptX19lHRp6RqSm9di+t3MPmLZLcc5BXOVJ4I44J5OMjkgjjStJHkkRc9CFGSQB82GYcncAFJAVWx1IAINYiJjOG3ehznOOeAc56+xyfbj0H4WeDNa+J3xE8EfDbw3E02u+O/FGi+E9MCRs5im1y/is3vCABiKwt5Jr2dgf3dtbySuCoOfocVWo4fD4jE1Eo06FOpVnL3UlGCUm5J7RSj10f328yjSnVrUqNPn5qs4ws7y1bjZJpJPTW9tNlvr97+JbaD4J/8E8vCGiTxRQ+Nv2w/io3jy/ikCm7g+C/wUW40nwokispMdtrnjrVNQ1uzcbYrm2SKRFbaCn5rXjhmcsEyWLbsDLEYADHIJ4bpjB/iPQj7S/bq+KWhePvjxq3hrwVcRyfDH4I6JoXwJ+GccDh7QeGvhvaf2ReahbYJRjrPiAatqJnTmeCS1aRnMa5+I5DvfAJOWHJwcsQOeo56HnHTGQMY+f4Tws/7PnjsVGSxOaYmrmFWMk7wVfldCnvo6WGhRot+9bk2W56ee1qaxcMNh3elg6UMNCSXuuVK3tJJtX9+q5yunrffQzZWcEHaFHOeAc84PHHIHfOOgz1ywSbcbcHIXpg+hPOeMeucc8cZxamTA5bOQSBjryMDvnnpjgZ4PrTwFycAD3J5Bx2wa+vppKCXLdK+u61fbZ7WsltqeA3e/NfonfXa3fft+S2JNw2jaWH94EAA+gwByADjknpnJyRSh2VhjnGcAkcA9eW4HTggHnntgxhSvUEdcjBwD1I4zyTzj36Cp1GADzyM8gZ9sY59c5J7YHq27K0d9HpdppqO6a1WiSUlrv1V1ro1bzs99t36d7u22r0ekzoclwQ3BGOmMHHXbyScED3J9LSzs3LcdMHOONoAPQEHIzkDtwQeRQeMkggHGRnHJOTg8cZGO2cE/TiTyg23luAOV9RjjkZbkEcc4PJLciXGLSvFq6V3o3ryW2t6JXbf4lJ2a+/y0sX47gqSuST3y3AzjP0wOeDgHtzUhucgDBzk5PB6kdNxJI687SRk5PGTAIu5xngklgf8SD+vudpJsRRqTvYYG4YBXIOQMnk4BAHI4PrWM1FptLXzWt1y6q99H10TXZHXSqO6Tdklun/hXRp7vR6J99NPff2Yfi3cfAb4/wDwq+LoiFzp/g/xbYS+JtNYFotZ8D6wj+H/AB1odxER++ttX8JanrFlNEwKN5y5B2jHZ/tc/A+D9nv9of4sfCzTiLrwzofiWXVfAmogq8OsfDXxZbQeK/h9qkLnKzxXnhLWNMJkTKrOs8eSyuo+bbNE81QUDCXcjq3eNhhi2QRhQGODnpkMARX6T/tIWr/Gv9jr9lv9pOLN14n+Gg1L9j/4yXCsWuWuPBEc/if4K67qLDEhfU/AV9daF9qmGJn0K3hRmKlV+EzWby3iPKsZ7qw2ZwllWLdtHWSeIwUqnRJNYilFu/NOvCKtoe7hYxxmWYugnethHDGUU1d8j5KddKyve3s521soOR8OeB/jd8TPhjFcaf4S8V3Nv4fvCTqngzWray8U+A9ZX+KPVvBPiO21Pw5eK+QGlbT0uk4eG4jkCldy78bfs/fESTHjXwDrPwS8RXGPM8YfBppPEfgW4mYkm51f4T+KNQXUdOjduZj4S8aQW0KjFn4f2qsNeIToEkYMGZwDlcnbuPQjswGMAg44IJPFZn2RG/eMrLuJwuUHJJ56/dOOpznnPXFe7Uy3AVG61J1MJiG1++w03SlKSUeWUo/BVt2qxlHTY8qGIrRThNKrStZQqWmtNFa6vHteLTtqrHs978APGt3aXOvfDDVfDvxx8M2qvcXGofC66utQ1/TbZVLtJ4i+HWp2+n+PtCEQB+1zzeH59MQqwi1KdQrv6L+yTf2epfErUvhNr0wsdI+OvhnVvg1qiX26CPTvEetyQ6h8OdUu0dQ0TaJ8SdK8MTO8ipJBBJcglPNKn5h09b/RL631bSr280vU7KRJ7LVNLu59P1K1mUhkltr2yeG4t5UPKvFIjZHX1+6vgL46+J37RPxK8DfB3xD8N/D/AMefGPijVbfTfCfim+aXwf8AFTwxdJic+KLj4reGYLfWLnSPCVtbvr+pT+OLfxNZWVhpcrBoZAleNn9bH0coxqrSo4zDQoyqPEOcMLisO6SjOFa02sPVdOoo1FJzw6TjdRdrL0crhhquNoKCnQq1ZRp+zSc6VT2nLGUVZc8YyUpRtapdPVrczv2fv2ZfGXx6+JV14As3tPB1h4Sh1LVPi5458Tk2nhv4UeFfDs80PijxD4puZVRLZ9Pe2u7LT9Ld1u9X1ZYrC1RnaVoux/a3/aE8HeIfDXh/9m39nO0vfCv7Lvwy1Ce+0uK7AtvEXxp8cDEOofGL4mPEsT3+raiyt/wjWkT5t/DuktBbwRxSkLb++/t1ftO+DbvxD8S/gf8As6/YLL4Y678QtS8a/Gfx7op23Px7+K3mqupam97EI3Hw08O363aeEtDTZZahqE2p+JZomk1G2WL8nNTuGlJ6fKSNybQOWABx+mMYI9TnHi8P4fH8Q1sFnmcUp4ahTpU55bldR3dKo4R5sdio2cXiJXcaELfuKbTsqkpcnpZjVwuWQrZbgJRqVKk5RxmNg7c0VJJYeg73VNW/ePTnl3hFN8hezkJIhbAY5c4A2nIbpngcHg46c5AyMB5WGcOTwAwB9vmA744PfntxwNbU1PI/vbehJyQAR1wCOCMYzz3zWN5eADnC+mSQeSpzjJ9Rnrg8EYr9OoUowi+Vu+i1vrZR+7y/Gx8hWk20lpHdbX1s9X5aeV9VazJoWDOMctkA9SG5B68nJ4xznIwDwa+8/wBhfwjoVn468U/tD+PdPj1D4Yfsp+GIvi5rljd4+w+KPiEl2unfBzwASzFJpfEvjt9Ou7m1KMz6NourM6CIEj4GLrGrSc7UXcxLEfdAOM8cjtyD1AAzX6N/HW4PwC/Zk+CX7LESvZ+OPiMNP/ai/aEQqUvLbUfFOmfY/gj8P9SUHzEHhjwJK3iy70+cn7NqvixZGjSaPcPm+KatSth8Pk+Hk4182rewnKLtOlg4WnjKqaacWqN6VOeiVatR11R6eSwhTq1sfXSdPB0/aU1Je7Ou2o0IvulUvJq+sYz2Pizx54u8Q+P/ABR4o8b+Lb+TU/Fni/xDrHizxJqc7bpb/Wtev5tS1G5YnDANdXMoRT/qlVYlAVQB5+6biCAQcAZwOcAdeefyBODnaea2rgGSQFRk4G4ckY4GOx78gc9+c02Oxd1MjFEjVgCzuBjJVRtX5snnkDJYkDacg19DhlRweEpU4+zpUKFOFOF2lGMIKMUrXsnp1S8jyqvPWqyn786lSbk3vzSk07aK71b79TCMZUqArA/xY44PAIwpx9dx49MgjQ0vR9Y1/VNM0LQNL1TXdc1i7hsNI0TR7G71TWdVvbh1jtrPT9MsYJ729uppGCRW8EUkzscBCTivtzwP+xhq9n4R0z4uftKeLrH9mX4M6lD9s0HVPF+lzal8V/iZboN/k/CH4QQTWnibxKLvAih8TayNA8F2rSJNc6+8StGyeI/2t9E+F2l6h4I/Yo8BXfwG0S/sptK8QfGnXtRtvEf7T/xBs5U8u7+2ePIYorD4V6NqKM4bwv8ACy20WQW7/ZtU8Ra24aQ+PU4geNqvCZJh/wC0K0JOM8W5OngKErxUnUxCUlUnF3/dYdVJRlpU9mnzHfHLY0YqrmFRYaMrSjQWuJqqyaap/YTTdpT5VfWKk9B1v+zV8N/2eUtdb/bR8Y3mkeLBDDf6f+yl8LNQ0nUvjhqYkQS28XxR8Sj+0PCvwL0uYGIXdrq/9tfEBYZGSLwlYy4uY+K+LH7Xnjv4jeFU+FfgzRvDvwK+AtpdLcWHwS+FaXmmeHdRnjCiHVviN4guppvE/wAVfE2xQZdb8a6lqKxyu40zTtMibyE+QpXknmmubiSSe5upnuLm7uJJbi6u7mZy0txd3M7PNczyyMWkllZneRi7uzE7pFJHJ6AEA5Pf2zk9uemSRnjiqGRRq1oYzN6zzHFwtKEZxUcHhpK1vq+FvKKkrWVSpKpWSbXtFG6FVzHlg6GCj9VoyspOL/e1LpfxKlk221ZxSjCyu4vd6scp8zeWODjPzcHGMgjkFcjpjKjGOhB+uv2a/Hng+8tvFP7Pnxg1mHQ/hB8aLnTJLPxdcQ+bD8GvjJo0c9r4A+LaKkbSx6Ipvbjwj8SLe22PqPgTWr+6G6+0PSjF8bK2BuGePfnjPP5euQDgnoKn8wYbepcPGY9hAKlWHzAo3ylcHrgYOCP7y+lmmCjmOCnheaVOS5ZUakJWlQrQalTq076RlTmk4tJ3taV02pcmFrLD4mFdxU9bVE/twlpKMr73i2rt6PVO+p23xR8FeLPhX498V/DbxvpMuj+L/BmtXWga/YNKk8KXtq6lLmwu0Jh1DStStmh1HSNTt3a01PTrq2vrWSS2nikbgvmbaATgdQMqfUc8YPHcd89QK+4pLb/hrP4BTagry3v7Sv7LHhC2TU4gDLqnxj/Zj0dhDb6sij9/qfjX4B+bDZ38n7271D4X3Fpcys6eDZjXxXbWzGMSbV2t8yk4bcrBSpXrksCMckZPGc88mV46pXpSw+KXLjsFL2GKjblUmkuSvTT3pV4pThq+XWEnzxklrjMPClUVWjzewxCVShLVqKurwnL+enLRpW1V1o0y9bvt2uQVwATg4JGQuScDjjb6A4JJyyntNLvI1EbMwRFjaVif7igEnk4BBAOSAMkAY4rkoYPuqGOcjIO44yeV64IOeh5PO3AxX05+yz8Jbf41fHj4U/Da/Y2+g674rtb3xtqDEJDpXw78MxS+KPiBq07ggw29j4R0bVpHlciNZGjQks6iozTEUsHgcVjajShh6NSq3d6qMOZW6NtpW0s7u2rae+FoyxNajQ5Zc1ScIJ9nKUVfstL6X3Wt7s+w/wBo/Wh8Jf2bf2Tv2Zol+ya3d6Bq37VfxdgIKzt4x+Mkdva/DvSdSVhvafw/8KNI0SYQXHz2z+IZSqhmJqT9lP8Aal8AaP4W179lf9qKDUPEX7KPxR1ZNRlvbKL7d4o/Z7+Ikitbad8ZvhmJFkeB7ZpRH418NWxWy8T6GJ1kge9j2XPxL+0j8brz49/Hv4q/FkJ9m0/xj4v1K68O6eMpHpHg+wMekeDdFgjOFhg0nwrpukWEMShVTyDwBivILe8diM8k43Z25IOM4JJABPPTLD5Rg42/EYTheni8jp0cdGUcdipzzGrXpvkxGHx2In9YdWjO14zoTlyQd9acIxacbxPoKmbToZjKeHbdChCOFVKXvU6lCmo03GcdU1O15Xtabckk0fVf7TX7MXjX9nH4m3fgfxFc2HiHR9VsLXxT8O/iJ4fkFx4O+KPw+1dRNoHjfwjfZeG507UrYr9qtkkafTNQW6027VJ7dwfmu50aSMtkfMoxuIJABAAOcbNo6g/MPlyOMGv1D/Y1+Pfwl+JngvSP2K/2zdQvLb4K3+uTX3wS+NFtPFH4n/Zp8eau6pLF/as9vdSSfCHxfcmGPxZoVxHJYaTdbNdgig8q4ntvvq5/YG/4J9fs9/G1fh98dvj7fX/iTw4unale+DPiXZ6r4A8MeJNP1ywS90DWbHVNF0i5s/FXh2cLLdx6hpvjO20jU4I0tp7+3EssMXkYrjirw0/7KzzCY/F5jQpzlQq4HB1MRTzHD0+WKxEfZqUYTs4rEQlZ06jvG8GmenT4dpZtH69l9XD0qEpR9pTr1o05YecmrwfNaUkt4NaSVrq6dvwN+GvwA8X/ABMs9S8TfadJ8DfDDw/OkHir4t+OJZdN8DaFNs806dZzxwzX/irxTOqsdP8ACXhe11TXbt9rtaQWha6j9Euvif4W+F+n3/hf9mKx13Q3vbObTfE/x98VWsFn8X/GVvOjRX1l4Nt7SS6t/hB4Nvkd4Tp2g31x4t1K1kMPiDxVPDO2mRfu58UP2Jf2Rvj5q9nf2v7aT65p2kiTTvBPw38NeNv2ZfCHgvwJpsriRNK8GeCItf8AD3h3RbCQMVkuLRTqd1ckXWsTX1w0txXmOuf8EqfgXo9jLfxWf7bfjeCOBJP7S+F/hD4EfETT5vly3kTeEfHeuSyRoRtQ/ZeVYbY+jV4lPxKyPGVovNZ49JOHs8thgcRTpqWlnWlUp05YirG6bTUaSa0pyaU30y4WxtCHLgo4dyvaeKdenUqPVXcVCUlSS7pubSs5K7iv52HsgnmsfMZpJDI7uXeWWSTDSvLIzO0kjNl5Hcs0jFnZiSc5z2JJb5WwQSRtY8YGFxt5A6nJ3Z5wQMH9jPGf7Kf7GnguZ08TaZ/wUn0IREmRtR/Z28N2SpjIIaW7WCNcKMg+aVPGNuRjxC98G/8ABMvTpGh1X4j/ALc2lzISJFv/AIT/AApgdWGR80dz4qtJdwIbKlBjcfl6AfZ4XjjL61OP1fA5s6bipRdPAVHdNRVo8vS1r8rv82eFW4dxlKX73EYVSk/eviI36Xb5tUt7rTW3RpP805dOJ4O4BSMN5bd8fwkDHGMcnoR1xVYacMHglgRtAiPHUjBAJH0/XNfpxb+D/wDglpdED/heX7aEH3T8/wAGvhdOoHQ/ND465wNwOO3AAHXdX4Y/8Et5EJX9oz9sWNgu5Uk+BXgF2JIwVHl+Mm3Y5bG5M4PI3YPV/rphYpXy7Pb6WSyfFS0t/cptaX116W9clkWIvrisFo1Jt4qjHblf2pLVq2z/ADd/ytXTZGJG3PodrA456HaDjOckAf3eTgUh01uf3eC3+ywJIyCB8mSc5yF5+nIr9TH+Gn/BL6MsR+0L+2M4Vc/L8A/AKfKOwL+PCeMHOQOvPPStJ4A/4Jc+WP8AjID9svcy5GfgR8PPvEcjafHLAgNnB3Ajb91sqar/AFzw8muXLM+d9X/wjY7y3boW7/LVJ6D/ALBlG3+2YCN7WtjcMr35Xr76113d7afP8tWsxFk7RnkBdvJ/ELnHYZ47EE17l+zP8PdD+IPxj8NWnixSnw+8IQ6n8TPihcOu2OH4efD20bxF4itpHwAj66LK38NWAcbZdS1qzhyWkjWvsK4+Gn/BLp2Lr+0V+2TGApPzfs+/D2QjaDkYHj9ABwMfMoOMlfTsPCkv/BMvwX4G+JXg7Sfjx+1uLj4qReF9K17xO3wA8CjWbHwl4d1RtfufCunRr8R1tv7P8S67b6Nfa3M+2WRfD1jaQqYJ7sS8+YcVe3wNahhstzyNatGNJT/sjGr2cKs4Rq1F+51lTpOU4x3k4pat3NcJk8KNanVrYvAyjB8/J9doyUpQs4Rfv/DKSSvbbXVJH5ufE7xVrfxO8feNviTr0YbWPHXifWPE98iqRDatql5JPbadBuwUtdLtDb6daxKNsNtaQIgVVArzl7RyDiJsj5ThRuA7HPbIxjBzzwOSa/TOXwZ/wTAkUBf2i/2xi4BGX/Z++H2AQNpyD8RjkY5PCg4I2Ec1iz+A/wDgmWDuT9ov9sBg3LKf2efh+QBgDBH/AAslQ2NxIBwrcna2cVvheJ8LQpUsPSyrPIQowjCCeT49RUYqMVoqNkla3kvPVc1fKatac6ksZgnKUnL/AHqjrJ2cr3nqns7Pa5+cjWRIB8lwMcMByCR3BXHGT+XORjLfsD/3GOeQdoOc8cdcDoARkHtkk1+if/CC/wDBNBdw/wCGhf2wOxAH7O/w+5PO4lf+FnEAckYC4yG64wJP+EB/4JqOimP9oT9rncOgf9nbwCQCwUgjHxLwduMYBxzxgZz0Pi7CqyeW52k2ld5Rjmk7pb+ydnfr6a6mCyOV1/tWD+WLpWduR/zK1n+PTZH50fYGBztOT0GAcc8n27EjjnjNKtiRnCNkNk/ITknHTjp07D8T0/Rg/Dz/AIJtfMD+0P8AtaDAXBf9nfwEME4yTn4nMenOBjGOBzxGfhv/AME3Dyn7Rv7VYwAVMn7OXghjk8EYHxQGV4OckAkEY4yGuL8K/wDmXZ101/snGpa26+y89Fa/5Ashklf61g0001fF0t7RaT9/R7366b9D87/spGMo2O4KHcR9NjEduucA896ctrIGOEZMAEBgcH8dncAjOehB+v6CyfDv/gnMpYJ+0j+1MCoDc/s5eE1zwMkmP4qEHGOCccY4GMiNfhz/AME58gr+07+08mVUjzf2b9API254i+JTgqMEctg89c4qnxXhJW/2HOkmld/2TjXa/Lq7UnotVr6d0NZPJb4rApbWWKo9ovrNK9lbW2yWtj4DNvnAdWy3r1bjPOFBK9z0P1xivf8A9nT40eM/2fvH6+L/AAzaWWvaLrOnz+GviF4A15GuPCXxM8E6iAmreEPE9jtaKW2uoy0mm6gqG90bUFi1CzdWikSX6ItPhl/wTklmAb9q/wDaQjGOkn7NOmjBIz1T4hS5HGSCGHTgA8dpb/C//gm9GgZf2tf2gd+3dsk/Zstkwfl4H/FXyAlsdSyEAtjOM1wZhxDl+Jw9TDYjK84q0asHFw/snGvorW/dXUo6STjZxko22R1YbLcTQrU61HHYCE6Uoyi3i6S6pWlFys4y+FrVNKzR53+0t+zr4J0fw3of7Q37PNzf69+zn8Qr1rVdOvZRceJvgt44kRbi/wDhT48CBmWazfe/hrXJUW38Q6SsNxFLLOs7SfCs1kYtxKsqZwMqcjAx1AIbPXPOc8ZBIH7MfBP4lfsC/AzUPE9jL+0B8bviN8NviBoU3hn4l/DDX/gVb6d4f8a6ScHTZ5Li08US3mkeINAvCdT0LxJYiPU9OmEkKu1vPKK+W/Efhz/gm/eXd3Jo/wAfv2jdKtXvbtrWzm+DGj6sLSy81jaQG5OvWElyYox5RknjDylGlYBpST5uQ8R4zDKrgMXl+dYmhRcfqeOll2M9pOjJrkpYiLpxl7alblnUiuWpFqTalzJdeZZVQq+zxWHxmApVKi/2jDxxVKyqLlbqUrSa5J6tJuLjK6V0rn52XW5d8J3FN4kVWBOJMlSVHAJdCqnGTgDGdoxkeUAxIUggjk57Y5/h478kAgZzg8/fEfhD/gn1Gbkz/tB/H2/M8MtvEk3wA0dfssjhNl9b58cwH7RCUUpHIPs4LEvHIMAZcPw8/YGZuP2iv2kHY53Y/Z98MHJ4C8H4iRYHGTk4b5u+a+uo8SUYKXNl+aJaNP8As3FWbajdOPsm1a19k+rumeHUyqo1G2KwUmuqxVG8UuXe8lq00497rTVM+H9rZU7OwG0rwenXJPI+6RyMcZxwQRxB9zQx7wylT5e2RW55DqxYEAggg8A542190SfDv9gxQ/l/tDftFBiAyl/2ffDCA/d4Ii+IshGBjABB7gDGBSb4ffsK5DR/tEfH8naeD8AdDXkgYGU8dsTxgkl8HGQDxnb/AFjwM7KeW5i0o3beW4q7e2rdK931vd69zNZTXj/zF4dXaemKo6L3XqlUd9Hd69ktT5h8O/Ez4h+EGQ+FfHni/wAOvHzt0fxRrllCMEnH2eK7SDGCMLJFtxgfX0Bv2mfixfKYvE1z4S+IEJUq8XxD+H/gzxZK6ruHOp32iDWFByB5kWoxyZYDzA2CPTbjwL+w+d4T9oH49s2Rt3/AfRk5wMglPHEmAoO47cMOOFNZ7eB/2IiwJ+Pvx3O5eD/wpHS48H8PFLc5x1b5hkFSARXPUzHJ6tnLKcepPaUcuxEZW916NU001e/R9jRYLHQemOwrV9YvE0Wvs/Z5/wDga3u+nmL/ABN+Hmrqi+Jv2efADtIS0l74E13xt4EvOepjthq+u6HGwPKqukiIcjAQjEEsX7O+snCWXxp8BSPyClx4U+IemwYIy22SHwXqRjXBwfOmcr3YnJ9QHgf9iUA/8X6+PHH/AFRLRAccdz4qySQSD8vBOABnFSjwZ+xMmMfHb4/MF+b5fgtoCsMYLbQ3i1eMknBKjJ4zwTi8dgY/waWfUNvhw+NnGLvF2UakJxWrttrZu219VhsQ9J1MrqRVk/31CDV3G/wuLejs7PZ7N7eRN8L/AIfajl/DPx78GOxB8ux8deHPGHgm/bAGBJPHp3iPQ42zkEnVFh6HfgnL/wDhQ/j+5BXQofCXjeIksg8F+OPCHiKdxuz+70+21UaqXJzhG09ZVIxsB3Kvqsnhn9igKQvxx/aCfjnzPgt4fxwQQSP+ExYqAM9wMHtWXN4K/YykbfB8bvjijKPlaX4LaKGUHGCNnjOM9eSA64wTjGTVLN66XJCpmM4pK6xWU16nSL1dKnQe+979u6I/s2k2nNYWnKKvF0MdTVkuVp+/Oelne3RPbvzsPiP41fDjTY/Dfjbwhr2seDEbP/CG/FXwpq+p+HIkJUudE1C+gg1Dw7OVIxeeGtW02ZcZLuqhGfa6N8GvHf7zw1rE3wo8SzZY+HvGt1ca94FnmPK2+keN7O1Op6IsrfJFb+KtMe2i3hbnxEw/eL6L4e1b4IeEwE8M/tUftKaRbhebWw8ByafaupJ+SS0h+IbWsiHJJjkgdOxDZIrvI/iV+zpfKsPi/wCIvi/x1CrZkfxR+zp8N7q9lU5Zy2uWOqaT4mjJU7mkj1tJCQMNnBrz8Rjq1N81DC14TaTlPDYbF0lN6XcsPOhOlJ2/mqczf2l07aGFoyaVTFUeVNJQq1aEklpb97GqpJar7DV1eUdx/wANfH2ufCSwtvhN8e9G1SL4V6nqDaj4J8Z2Ig1dPhv4jnZVg8X+AvElqL7Tb/QpZXB1vS7C7kjZQb+BFvEnjuPFvjtY/Fvwj4nn0/xb498VeJ9J1SM6h4c8TR+JNSl0HxTpMnl+VqulNBdi3KyRNCbix5a1d+N8Zjevp7w78Yv2QvCMMltouqfFrSrK42Ne6DpHh1rjwhfNv8xhd+DPHHiTx7oLxyttaQxRW8+ARHPCTlt3xV8fP2LfGHw5ufhrep8QdK0hbh7/AEWWy8C2aT+GdU84ynUPDcK61LBpaXW90vtLhYaPcRmRbays5GVx4mHxeYYTMqWJhw/ja1CtJLFuOEmqdnyt16dO01SqJ2dSMZzjWXWM7X9mvQweIwUqM8yw0K1JL6u/bwb0Ub05SXLzxa1i5xi4NJK8Vp+VV6pnLvPGbiRjnzJi88pzjkvM7sxBAzknoDz82cWSModoU7Sp5AK4BI7fe4AGAPmBUEE/er6zuPCX7Kt6JP7P+OHxOssFmQaj8IYrpckjaWey8QdOeu3d6dcjEuPhZ8BpiWsf2kpotw/d/wBqfCDxTDjOCQ5tb6cDBxwA+RnaCRg/oVLOsNFJfUsTSUWkovL8Uml7uraot2802kfITy+u2/8AaKNTm0b+s0Um7x7zukl2/G1n8uiLJI29emCecdf4eOoOM54wCRnKiE8jGNuGOT0PA7jv9MenNfRj/B/4XvlbP9pbwC42l4xqHgvx/p5JOBnbHo92AenzEAgj5cc5oz/B3w2q4svj38GbzdghZrzxhpjgswU72vfCixoM5LFpPlGQScGu2Oe4SSTlKVNvpPC4lXStZXlSilpv218kc8stxKtaEJptK8a1KWnu2b5akr3b2vok736+BFWByRjOMMc4HB44GMZxnOAcYzjgrvYOgz04YAHaQ2M9zjaPmyAQMBSASM+92nwA8S6vIY9A8c/CPxDIeFj034gWLyv8qsCsN7b2s/AwxLoAO+GyK1V/ZP8AjKJkeTS/Dj27Eh7mLxXo0kMaSbFE2/7QDtUOrEjLbBkK2NrU8+y6Kbni6ClGL9xOz5rRteLV+q0stV1tcxeWY32kV7Co4y5VdK6aSSd3tZXWq7dN1xniK5k0v4a/D3w8qhZtcudd8fakBwzpc3Q8OaCjdMiOz0i/uYskhVvCykg8+Ut5zliy/MMHjOBuHQZxxxnjgZyetfTvxN+GDnxKWn+IPww0TQ9J0bQ/D+kC/wDF9vfXgstG0y2t3aXTdFtL+5iea8+1XHllFcmUllV2ZK84/wCEX+GFgM6n8W1v5BgNb+EfA+s6l8xxlRd61Podu3b5ipGOuc1z5dmdCFHmXPOdWbrS5KM5255OUVzKNk435Wu0VsdNfCzTUfdhypRtKUdOVwTbi2m723Ss3ozyj51II59lyQPvDB5HTPf+ZrS0rXtb8PXi6loeqahol9FtKXel3k9lOPZ2gKCRTzuRlZWxhgwNdzPc/B2yA+z6f8RvEbjPz3d94e8L2rngDMNrBr1yik5yBMDtPGKyZfF3hO2BGl/DTQkKkES6/rGva9Kc4GSkd1p9sepBxBtJz8vQV6DrzxKSlgZzjJK7nGnFWfL0nJSW1mrb902jkVKVK3+0Qi1L4YuUmruNl7t9b6eenyuzfEXS9fLL4/8AC2keIJGz5niHRFTwx4pZi2WlmubC2OkalMMfM2paVNJLgmSfOWDV8CaF4kRp/AniG4uJCyAaH4p0+TRtUV2AGyHVLb7ToV2uQyiV7qwLgD9yu8JWFJ461hS32Gy8N6OjYKjSfDWkwSKMDaFuLi3uLoEHB3ebvJBO/cCTmXninxJqKlb3XdYnQAgwG/uYoSCV+UwQSLEoO1do2YHYAE5inhMVH3sP/sy09x1nUg1dO3JKLhFWVvclHrrYHVpOyk3Uu0ua3LLRR1Urb362s10Ld14E8U2VzJa32g39rLExWWW4WKCzB4yVvp5I7OQDdndHMwIG4HGCtRvDz25YXmp6FAchiqanDeSgEMMBNOW6yQRhgGHIbHJ5i0/XtW09GSK9lkgYky2N632+wkbDg+dZ3aTQSNtbqY9w6qQTldJdS8PagoXUtKbSLgkZvNCf/R8kEFpdIupPKwfvMttcwgE4VAOD0t42NnUcZxTScqME5L4dXGcm3tokpN7W6vJqjJXjJ3a2m3bTl+1HTXS3TRbaJUBbabGBnVDMU6i2sZCpOQDh7pofc5KYPHC5OGrJpaMojS9lbcCC7W9uin5cZWEPJjq3BzjpwDV6Xw/JP+90a8s9bjOW8q1LwamiAbd0ul3OyUnjn7N9pX0c4BGGyPbSmOaOSCeOTDJJG0brhwWDIyqwORhgOhwB1ydIKnUX8acnzJNNqLT005UoyXlfvtZaTKTi17kVqul9Uo9W5N/ne11sVVVhwST12jnIPfHJGMZ/hBxjpyCv4YPv3J5zgH0x+HfrQCOFBBbHADAMT7DjOD02j8c81o22katfsEstJ1C7LfdMFnO6n0w2wL90jbjCnGODxWspxjZynCNnprG1/dX369eqSVtDJRk72je9ttbXa3V27et90ZpAIPBB5zgkZHHqcd8+vJwBggJnAHPLLnJZsZwPyyD6A57ZzXXReBfEpAee0tdOR8kyavqmmaaqDgqWW5uFkCg7eiMctkrkGrQ8IaXGAdV8d+D7DAIZLKTUdduRjbgBNMspIGfJAA+0qCRg461k8XRWntJSat8Ccm0+XROz23SSe2mqLVKq7JrR6uTaT+wu701016artwuVJByM88Y6kcgE4z0Ixx2OOaUsDkEHBHoeDxwfl7Z4PIx79e9XT/hnbcXfiLxbrbZGU0jw9p2lQHoPlu9W1K4lUYOQxsuOpU81bTXPhnY7BY/DnV9WZFwZPE/ja58qT7u4vaaBp2l7VO0kqt30Iw27kZSxTk1yYatUXeyiraWd5Wvq0r9uz1NFRg7KdWlB3Wl23bTflT37tK6bs0ebouCcsMcE5YDGehJIGBtGM8EEYB7DRtbGe8cQ2cE17I+CIrO3nupCTzhUt45C5PI+UbuwBr0CL4lnT3J0HwF8NtDPISU+Fz4huUBBwRN4qvtZBYNuIbyh8x6DtYk+NfxSeLybfxrq2kQbdpt/DS2XhiAKSPlWPw/a6aoUgEYIJGB97AaodXHySVPDU6adrupVV9VG91FWv03bd7aGvJho2Uq7lqk1CHT3Vu7ap6aJPRa63aaX8G/ilrES3Fh8PfGElsSp+1XOjXGmWYHHzG91VbK1C853NKBgZxkVtr8EPFFrxr2u/Dbwp2ZNe+I3hb7TGGOCH0/SrzVL/OcAx/ZzICfuZG2vMNT1zV9YkafWNZ1fV5XJLtqerX2ouzHHLG7uJT3+bBIycgNWOTGhzHHHGH6OFCYYjkblwCTnIHVvp8tYyjmLjNzxlCjFLXkpN2soq95Stfvol5blQnhudKFCrNpaOU7XelnbluraN6/Nbn0DY/C34eW5B1z46+DwAwDweFfDfivxNKVOMmOWbTdIs22lsA+eVJIGSMMPVPh/+z38LviFdX8XhbxF8RPFdjoMaXniTX7jRtA+H3g3w7p6R+bcXuu+KNZvdYj0q3gRHyDBLeOuWgs5JMI2f8O/gnovh7w3pnxP/aG1bUfBPga/iN14Y8G2Ecf/AAs/4oRpyieHNHnMR0Hw5Oyqlz4p1lIbWNGJsVuXKSVjfFL4+6z490618EeHNI074a/CPSp1fRfhl4XkddOkdGUJqvi/UyY77xh4hlGJJtR1VpIo5mP2K1gX5j8zV/tLH15UMvx2KqQp+7XxdqMMPSSa5o03CCnVmrbRmox05p6cp6tN4bDU4zxWHpQnKKdOknOVWbdlzS5puMU+t1zO90rM9yudE/Y98GfDg63p+l3uq67L40vfB2j/ABI1/SPEHjzwLPq+i6TYazqMtp4WXxJ4L1O/0KJLq1iXVrjSo5by4maaPRjbZSoPEvgfxN4+/Z10/Q/hFq/g34pXI+KWu+P/AB/p3wm0xfDyJpsPh2y0zwYP+EK1Aab4hQ+H0fWklsZNGlSA3VvLa3d6wndfEfHtjDB+zb8DoFQJJqXxE+MusOMYLpaQeA9IgbO07lDQzRg7m2gFV2ZwfmS1v9S0O8TUdHvr/SNSgkDW2oaXdz6dewuCTmK6s5IpkYEsQVfBJweMtXNgMnxOLpe2p46rUqYbMK0lHGfv6c54erKkrt8tSEZJOSUJ8ilaXI2lbpxGPo0ZKk8PTpxq4anG+HTpzhGoqc31aa1SbkrtXV+pevor3TZ5tP1G0vNPv7ZjFc2N/b3FneQup+aOWzuI47hHB4KFN6ZwQAAK+lfhKzfCf4TePfjfcMbTxV4pW8+EPwjDZjuo7rWbYj4g+LrIkblGheHZG0e1ukGI9S1QRqyuqlrvw++IXjX4oabq83xmfw14r+Ffg2zRvFHjzxtokd34p0trlJP7M8N+FfEtg1jrWreMdbdDBo2kXc15EiLLqF89vp9rNcD2OH9sP4GWNj4OstJ/Z98VWQ8B6JJoPha9fxv4aur3R7Kadp55rBNY8Ha1aWWp6hct9t1HVEtn1S4vI4ib4xRKlbZvmGZ1owwFHLHiuStTeM+q1qfspUopTVJyqum1KrNQVWHLJxpyle7cbZ4HC4SlKWJqYuNNShJUPaQm5qTsue0eZPlTbi7r30rdUfMGgfBrxbe6PbeI9dbSfh34LIGzxb8RNQTw9p11ENpB0bTnhl8Q+JXI3bIdA0nUCzjDFfvDooPE/wADPAcZPh7wpqXxt8SxfMuvePUvfCvw0tpwdom07wLo9/F4j8RxKRujfxJr2mWtwu0XGhFS0Z6PxR8Vv2cvG+uXnibxZ8IPjT4k126LO+oa38fkvLgLkExpLP4FuDFCuSIYIBDDEuBDGgGyskeOP2WIwh/4Z0+IkzLknz/jzKFY7sgkW/gSJgMlsZY/ickHt8diVGOMy/NPZpRSw+HeGo0lFcvuymsUqtRL4W1KEZWs4dplSw1Nv2GJw3PJq9er7Wct4pyUVRcVfdLlk09b6o848f8Axh+InxMS3s/FHiCaTQtOONI8IaLZ23hrwLoce4sqaL4N0KCw0KxKDG64FjJezHLXV3PIST5bscbiQxU5wuGJBz0OQQARwcHvnJNfUkHxK/ZchUf8Yu+IrkhiR9r+PviEKT8vLfZfDEJIxnIJAAB24zxMfi/+zPHjyP2QrKVQeft/x08fzcg9/s1lbE98jGDkV30MdUw0VTwvD2Lpwi1dKWDg5W5dXJYhu+l293d9b35qmHp1HermlGb6vlr22tpejppZbb9NNPk9oFy5KkZGBkHK44xyBtPY/dAHY4NVygXIxg4BAPbq2R8p+8WwMcnHGMgH60k+Nf7P682/7HHgQEcr9t+LfxYu156bhFqlrnHLAKyjORnnim3xy+DSrmD9jj4ML3Vrnxr8ZLknjn/mcoAd38WP7vGa6VmeZSt/wi4u1+tbC9eVbe3fpprps7HO8HhLWeYUnte0Kr1Tg3a8O2j08+l38rAAZO4cjbtzg5yTjHVSQSTux1yR0NPA5wWUjGfvLn1wecnrnHvX1Gvx8+FkYTZ+xx8AGIPCya18YpsYzgnPj/PXqBwefl29LSftE/DONiw/Y1/Z0JBOA198XZOD/e3fEDrnGRyOCQO40WaZnFK2SV9lvWwu+ltPau3k+luhCwmFuv8AhQprVX9yrrtd/CtFf9O1vlfZuIYlT2HzAAHAwTxggYwBgf3geKa3Ct93I/2wchuQfcAdMKeMeor67g/aX+G8Z+X9jP8AZoPH3ZF+KsoBOSxPmfEDORxwTjjoc1ej/ae8AcmP9jX9lvqvEmj/ABHmwORnM3j9gMkk88MAdvPFS83zRWtkVa10rOvh1ZO19FUd73aabffq7aRweDvy/wBo0rO3K/Z1NtP7luv/AAH0+K9w25+UHnbg57rk/cJxg84HAOOvA+5/2LWsviHY/Hj9mDVLyKJfjj8NpdX8CfanxDH8Y/hO83jPwQsJK/uZtdsINd8PvLGPNlivkhXJcIa6ftSeEEbMf7Hf7JqqBhRJ4O8aSgE8Y/e+N2J64OTgBhjbtxWlpH7ZP/CK6tYa/wCFP2YP2XPDfiDSrlbzSta0bwV4mtdU0u9jGY7zTrxfF7T2tzEMiKaORZEJYq2DmvGzqtnWZYKph4ZLUpVF7Oph6rxOGtSxNGcKlCbTlrFVYRcknflUoq6Z6eAhgMJiI1p4+NSDjKFSKpVW5QqJRmrtWbtJpSstbO6umeTn4I+ObnS21HQrTRfGNpbW7T3Y8C+KfDvi29sVXaHN/pGj6hc65aFSSJBdabFtMbtJwjsvkKW/mPsVSH3bFXoy5IBDDaWUgnLKRkY+6xFfXeh/traloGvWHibSP2aP2VLHxBYX66la6vB8NdZGoRXm8zNcx3S+K1miuHeSSUXMDxXImYSo6uua6/4paLd/tQ+G/Df7R/w68I2cHxC1jxnpPwl+N3w98HWMht7f4i+IGeP4ceNND0eIyvZ6F8SLC1n0e4JM32XxnpU4mnuG1VWrlp5vm2Xyis4wlPD4WouVYlVKf7utZyjCry1JpQnZqNRuC9o1BR95M1q4HBYpf8J1WU6ys/YyUm5U04puDcYuUouV5R973bybaiRfs66RH8Lfg58eP2oLvdbato3h9/gT8FJ9pR7j4p/E/T7i08S+INNfHM3gj4dHWbw3CLm3vdZ07DJK0Rr4V0LwV4j8Rana6H4X0XUtf1OVVSLT9Jsp7y52fxPII0YRwxgF5riVhEgyzuFGa/U79qHRPCPwo8PfBj4Caz4t0rX/AAt8ItB1C/13wl8PLiG71DxH8V/Fl2ZvHninxH4ovLRdI0G3hvbFfB+kWawazr9lpWgQTXdhYLqkZr4s8QfETVtT0x/D3hiGx8C+FHAV/D/heS5tW1DAUGTxHrsxk1fXpy4V5RfXZsopGb7LZWkf7quLh/M8VjVi8xw8ISnmNduniK7caNDB0lyYaCT9+cpK9bljyx5qs17TTXbNcHTw31XCVZTjDC0k5U4K85158sqjle8YpaQV23yxj7q3XpHwW/Zk8Gan458JeDvit8S7Gw8Q+KdZg0mx8AfDu40vxR4qgxaHU7/UPEniOO4n8J+DtJ0nTYLnUtUvLu41C4trKzvd1iJIS49gf9uay+AniO88LfsVeCvBXgHwNo9+1je/ETxJocnir4m/GCOxmCXN9r3iHV5xqegeEdXniW4sPC+iSWRitFgnvJxdzSQ2/wA5/D62Pw1+DXxb+NG2S11TxDEP2fvhdOq+Uf7T8XWP9ofFTX7KbcSz6H4Cjfw99oUs8Vx4wO6RJI1CfKFrIsSBQAoG1VwCAUQBUCqOAAq4HIJAyeDzpRyeln+Oxss1xFXMsBhlDCxw83yYKeKSU60o0YNQmqcZU6UHUdWUKsarupRjyxUxry3DUFhaUcLiK372VRJOtGl7qp3nP3oylyycuVQjKLi9Fe/6K618bv2TvjZqWq+IPjl8BPHvw+8eeJb6fUde+JXwA+Icmp2mpareOJbnVtT+G3xV/tq2keVwZJINJ8VaYpDPHEUHlheHvf2YvgN41LXHwX/bG+G8k8oLW3hL4++GfFHwN8TGQ4Itf7dEHiz4e3NySdizy+JNOt2dt7GJeF+L/t+wABmbJPAzgHrnrkHqPQnkelSpcyPwWDIeithlBIxwPQAgDBAHHFerQ4ZqYKMI5Tm2OwFKKtDDVKixuFjFcqUVDFKpVjCKSioUa1NJW5bW04aucQrN/XcFQxMm7yrQ5qNa7tdp0uWEpPe84S136291+IH7IX7Rnw60qXxFrHwz1LX/AAdGCw8d/DvUdF+J3gjyjtImfxP4Bv8AxBpVpGeuL+azkHOUUgKO8/ZcTUvhX4R+Lv7UAsbtb3wJ4eufhl8KboWk8xk+MfxLsrrSYr6zRIn3TeDPBx17XZ5FCvZ3TaeH2yyxq3Z/sE2eqWHxouviCfEPiXw58P8A4K+A/Fvxl+Ji+G9d1LQoNb0Dwjpz/wBleFdRXT7iCGe38XeKr3Q9BltZ0lFzDdTIgRgrLheIP+Chn7ZeotJHa/GS48K2T3N1eR6d4L8I+BvC0NvJdTSTuRJpvhqC6nmAkWJ7y4uJbqUQoJpXyWrysdV4gx9bF8P0o5djPYfU5Y7FSnWwVOdOpUcp4SVJQxjc6tKn+8lzJRp1U+V3SXo4WGWYSlQzSo8TQlV9qqFLlp15KcVGKrczdHSMpXirO8obtR1+O7Tw94qvXCWnh/xNfqxEjtDoWr3UkszffkaSCzfzHYgs8j7n8xmLD5+ews/hH8VNQCfYPhl8SL0Pwv2XwH4rnL5yMr5WkPvzgfKPmwOlerzftwftjTj5v2m/jHGG5K2ni65sQTwMbbFbcr1ONpIIyBjrWLd/te/tVX4K3v7SXxynKA9fil4uhBHGdot9Vh2nucAA8DB4B9+D4njGMaeHyilFJLlWJxFSySilq8LTurK+19tjxqrymcnOVXGyk31o0orRp3T9q9Gr30bXTVGVYfs0ftE6pkad8BPjVfk8D7N8LvGcn3goABGiEZORjJHJJHQiuxsv2Hf2xtT2rY/stfHq4LKHUn4ZeJoAV+Q9bixi4/vDKkHjHTPm99+0F8eNRDDUfjd8YL4SZMguvif45mBOcZYPrYU4bGAxzwOhGa5W8+I/jy/ZjqPjrxxflhhmvfGPii7LHOSW8/VXLHjnPQDjGRWijxW2nGrlFPZW9hiKrVrO6ftqd2tHstNb3s3EXk17uGOndK3v043+F3TUJq1359bdz6Oi/wCCe37bsyqx/Zf+LFqGxhtS0S00oYyASx1PULQL75xtHJwcitaD/gnH+2jMqtN8D7/TVJ5Or+NPhvpIXOMhjf8Ai2ArjPVtoALAnC8fHFzq+o3ZzcanqlwWK5NxquoTM3OTkyXTHqMckEnJ6isaVRI2+UNIANoEjySAkgDkNI2COOpyuaaocUyVv7Qyem9Nf7NxE2tY3t/woRV39+mo5VMmVuXDY6V1s8VTi+nT6s/Pvbq+/wB4xf8ABN79q9hi98NfDTSVJIYax8e/glYMo6ncJfHO5Plzw2OeBkDiwf8AgnX8fbYj+0/Ff7M+jYyG/tf9qT4J25UYxlhH4ruOARhgu4rycMDk/A6wWw62ts2MEM0Snjtjdu3YPvx+olEVsvItbcEjqtvEM9gDgDp6A8Zx7VEsHxQ1aWcZckraQyqpGyfLZe9mErebWrd79yliMoSTWCxLu/eUsXB9FulQT+F3Teu2vb7zX9g7xjalRq/7Q37FejjcAwuP2nvAl8UIJBBXSX1A5yDkLwR0HrdT9ifRrc51f9tH9iHTUUjcsXxi1jWHUDGfk0XwbfeZ3ACsSPmA9vgNWUHYsKZ74jUD2I4Hvgj16ntehuJYwNpAHTjCkkDgDbtJCjGQPlwOTgCs3lnEM0+fPlDRXVLA0IvZN2dR1Uu/3O5rHGZZH4ctbu4pSniKkorWKTfKo2fTS3nZXb/Qyw/ZD+DVuw/tT/goL+yNZKp+f+z4/jRr7Y/iCppfwtbzMlSo2lS24KG2g4+r/hfpP7IHw3+BX7RPwM8b/t2fDrxdoHxusvAepaO3hH4TfG2ceCfiJ8OvER1PRvGaw6r4R09NRSbRbzV9BvLS3lsbmSC7tnW4ZIWiP4v2+p3ARV3lW9cgZ5GOCSD2yMHJ79TVlb6d2+d2YNhW6YIzgnKnIJIwSMY6dN2fBzLhPMMzpwpYziLMHTp1qFeHscPl0Zqrhq1OvSqQk8FKUZRqU4vf3kuVpptPuwmc0MJJ1MPlmG5pU50nz1MTK8KkeScZR9vGLUouWrVtmrNH6Q6t8BP+CcOovpVppX7dfirSL+VIrbUL67/Z58aatoUt9NJbx/bWnk/sW+0jTgWaa8e4k1ExRBpmmZUxXy1+0d+zZ4w/Zl+NPiz4N+Kb6x8Q3Ph7+zNQ0XxbpFvcQaF438La9plrq/h7xj4eW7DTyaNrNhdpNHJvkWG4jubYySS28jnx+1jLlPNGY3G1wVDYLYBUqdxCkhQ6HOQSCeMj9w/Cni/4K/Gf9hPQPi78ZPgdL8ePij+yDf8Ahb4G+Lns/id4l+HfiOH4FeJb/Ubj4YeJ5r/R7fVoNVh8PanM/gwjVdMkS2hje6S7jebY3k5ji8z4SqYCvUxWZZ/gMVWjgq1CqsAq9LEV5QWFq06sYYOnGEqi9hKNWq05VabVnGz78HRweeU69JUMLluIowWIhVp+39nOnTS9tCUOatJyUbVE4x05ZXvdNfhgNFvp7q3tLS0uL28vbiGzs7K0glnuru8uHWK3tbW3SJnuLieaRY4IYw8juVChmIz+jHiK6tv2H/hRq3wj8M3UZ/au+MXhpLT48eKrGVTdfBD4a6tHFeQ/A7w3fwN5lr448XWjW198TL+1eOfTdNe08N27+Y07J7H8Jv2qf2Evg340sPiL4S/Y6+LOkeLtNsdVsdK1K6+OmheObHQ59TsTZNr2g6Z4n8CxW0HiHTYZJTomqu01xps8i3UBWdQ6/POvW/8AwT3+Ier6rqk3xV/ay+E3iHWtQvdW1PVPiL4N8I/GXT7vV9Vnlur6/wBS1XwpqWh67cy3FxI8k87WEkrl2ZVwQi4YvN8Zm2Mo0cxyDOMHkuG9nXqU/YUsXPG4iEuaEK9LAV8TNYWg1Gbhyz9tVa5rQg1ProZfhcBhp1MNmWCrY+reEZOpOlHD0mopum6tOmva1LygpXShFys7tOPwa10AojCbYygRFVQqxopULtC4Awpwdo5CjGFUVj3K+YcAHjncO5AABAyTjAPUbe3BJr7z/wCGOPh/4wQP8Hf22v2XvHEkrg22i+NNZ8R/BbxLITykJ0/x3o6aeJv4dn9rKgfguFIYZWpf8E6/2xdOgkvdM+Dl38QtKALpq3wo8T+DfiZYvH/z0iXwh4g1S9ZW3Zw1mGx0XOBX1VDijIlKMXjIYSaslSxtOrgJ293anioUpWV1oo773a08KtlOYRvONB103/EoThXi9tVKlKavrrr3vd3a+C2td5YlOHI6+o4yW6HBXJY8DHTFVpNN3j7uDjjbnnr2A6nPHPzcjua+gPFPwT+KfgmaSDxn8MvH/hGaI4dfE3gzxFowjZQC4aW/0yCHA/veYQCuQcCuJs9GWVnIe2cRL5koWSMyKqgOdqg5DDjqMbiBy3B9mGc0KkFPDVaFZKz56dWM1bq7p7pPfZa21PLq4WvCcY1aNWm29FOnJu65b3TS7Lq0763TPXv2Lfgz4c+Jvxss9W+JMDL8GPgp4f1b46fGm6KgQSeAPh4kOpN4eZztBuvG/iA6P4Qs4jukmfWW2AmNhXivxk+KXif45fFj4h/GHxawGv8AxF8V6r4lvIEOINOtbuYjTNFtQRshstC0pLHSLC3VUSKzsoERVVQK/S/TvhB8TPDf7Lng34B/CjwL4h8U/Hb9tC70/wCMHxD0zRrFxdeFP2bvAuoXll8K9P8AEmoXIg0/w14e8beJ7fXfH2rarrl/pmjR6DpOhXV9cLBNbF/Ab7wb+zL+zczD4g6jpP7V/wAabMlk+GfgPXru0/Zw8CanGzgw/EP4maRNb638WtQs5Qv2rwv8N5tK8KyyK0F3491GIz2knx2Cz6hjM1xuYclTGV/9xyvB0IqdRYejL/acTJtqnh6eIxUZRVatOFOpDD0nBttJ/QV8sq0cFhaEoqhTk1iMXXqaQdScYqlSilrUdKk0+SEJOMpyulrbxL4G/s0/E7422eqeKtMh0TwT8J/DMqJ4z+NnxL1aHwj8KvCnCs0Fx4ivUZ9e1x1VvsXhbwvaaz4gvpNqW+mMGD19GL8bP2df2ZkjtP2ZfDdp8bPi5YE+f+0z8Z/Cls/hjw/fKcG5+B3wQ1lb7TrOSCTEmn+NfiVFq2tBo47mx8PaSxGPlT4w/Hf4p/HS802T4g+JEl0Lw3H9k8F/D/w3p9l4V+GPgPTsnbpvgrwDoUVn4d0G2RQiyXENk+pXrgzalf3lw7yN4y6yKU2tnP3tu7AOAuepwRnGMepHy8j3/wCzcTm06cs6xPJhlqsqwk5Rw7Xu6Yuv7tTFNK6cEqdB3tKlUS5jzZYijhIuGAp3qpWeMrxi6uqV3Sh7ypLqn71RfZlG7R3nxG+J3jz4q+LNS8c/Enxf4j8feL9ZlMmqeJfFurXmtatef3IxdXskjW1rCMJbWdoILK0jAgtreGNVQeaSEBTwwLMSuQASB7cZK8D5eOy5JFXlhdioBck9UAYYzwQCcjA/EYHGQcmU2chxlcdAeOOPX069eQckj3+moU8Lg6cKOHVKjSppKMKdNQjFJK3uxsl6Jct3prt4041q03Oq5Tm3zOU5Nyb0V29W3dpu+7v1MVotwPG7H0GOvOST6D+HoeozQIsbeuO4IyMkn3PHXJGPve1bosDtwACRkkeWcYJI7DHbnB4weoOS02BHbJGP4CAMkggHO3HQc5PFdH1qkrv2is97a9rav0WrvZGfs57cvXy337/PX16MxCgRtw7kBV569ePfjI68ZPQcSiMg5XHA+YEbhwBgNgcHpnGcdB2xr/YiCflBAGchc4PTnJweT7Y6ZzU6WYK8Jn5uMg47g/dxg+xz9QOKHiabVufqn81y6P1ta3W+ui1SpTk9E9LPV6W010vtum/vtY7L4OfEbxf8GfiX4O+KngS9isvFXgvV4tV043UKXGm6lCUe21TQdasnJi1HQPEGmXF5ouuabchoNQ0q/u7WRWSQ4+of2pvhD4O0qbwd8e/gtpstt+z98foNS13wbpnmNct8L/G+nSQj4jfA7WZ1BVL/AMB6vdLL4be42y634F1Hw7rMYaSa78r5AgsfKw3OV6KABycEjAxg45IOAc5B4Ir7T/Zc+JHhVrPxZ+zd8a9WOmfAr46z6XDdeJJ42uh8F/izpizW/wAPPjfpsQVnittGnvJtA8f21sUfWvAGraxC26707TTF8fnPtMLXp51grzqYeLhjqCi74nA3Tm0lrKrQbdSla7nzVKat7S69/L4xrUp4GuoxjUalQnJu1GvaKSbd0o1F7s9ot8r3WvxolptbGQOvHcZwcZXPGOvZuR6EfcvwJR/hN+zF+1D8f2322u+J9M0X9lb4X3LMwlGtfFFf7b+KeqWEg+dZtJ+Gei3ekvLECYx4oaNyu/J+cvid8KvGvwW+IPjD4X/EbSl0Xxd4G1a50nXLYTLNaTlFjuLLV9IvFzHqvh/XdPmtdX0HWLNja6ppF9ZX9o7211G5+p/2u7KX4Y/C39lX9mOOM22oeEfhs3x8+KFoRiU/E74/Cy13SbLUo87heeGvhpZ+E9PRJGLwDULlcZYseLOMbDMVlGBw9ZVqWZ4iniKkqbjKLwOE5MVUlZb06ko0aErrWNZK/bqwOGqYV4zEVY8ksLSlSho1bE1rU4JdnBc1SOn2dbLb88Ei2lsLhRxgdsYUHbk4HA7f+hENpWsTZHykYKnGBjHGM4yeBgevGRjjOumnOQCAx3DDHHGQCT2IyRyOc5OCT3vwafIhU4wBwTtPGckDgDJGcYzwCcELkD6R1Foo6WX/AG7oo21e/bpq73SPMVK9m/LXe92rtq9+t/zuaOkgRSK20MMMrow3CRSACpDZBB4yMfw8HIBr9jf2d/ip4F/a8+GPhv8AY5/aQ8Qad4e+IHhi3fTf2OP2i9emAm8JavdyL5XwD+Kes3Aea9+Fvi66Ftp/hjVLuR5PBWsNaRQsNNkWGvyBs7OTKgLhuuTndx0AOTztyDg5OfUEnrtPjlV441jeRmcKykum4BgAwJTIKlQVK4wVBBGM18txBlVHN6EXGSo4zDSVXBYuFlVw9eKXLbVOVOd+WrF3jOLcWrar2MsxtXAyd48+HqL2eIpSfNGcXa7V7Wl9qMt4uPNboeq/FP4f+Mvg/wCNPE/w2+Inhe88LeN/B+r3WieJPDurQCO40+/tjtOx/njurK5QrdafqFtJLa3trNDc2009tPDIfJ11jU7CQnS77UdMmRiVl06+u9NkDZOSGtJomUrnhlHLbSACQR+qOrfGL4Wftc/s7t4d/aP1S/8ADv7TvwR8NRaZ8H/jVZaXd6vdfGbwfp0lvBp/wt+J6W6LPPqegRy+VpHjG6cXMVtEqz3Uuy9tL3879V+HGpWVs0tqYrxFUNNHGDHcLwNygOWMhG1iWLuQo+Ylga6eHMmzfOMBXxGJySoq2Cm6GJqKinh67jFSWIwkmr1aUk7y5VKUJN052lGxjmuPwmDxNOlTx8FHEKNSEPaNTp3aTjVimuSSkmkmve3SabINE/aT/aS8GhP+EU+P3xq0FExsj0n4peNbeBF3Z2Lbf2yYMDjIKFSABjBGPV9P/wCCiv7b2nqsFx+0H4n8U2u0L9k+IWheCfiPaugJwksPjjwzr+9MMSwdiWz1PWvmWfSZygMcRwBtONjElPvZ565zuwAAeg29MyTRrmMM3lvzyDgk465JXIGccLnH8IxwKzq5RktX3cRlWWzk21LmwtF1E1a7m+Vu9nrtZ3taw44rHRV6eKxSXTkqTt9nbVaNfhey2Psk/t/fFPVFA8d/CL9kP4j7uZX8UfsrfCexvJ/vBy2peCtG8JX4dixZ5IrlHzyp3YpT+1t8DtXG3xn+wF+zZelsvLc/D/xV8dvhhdkk/O8EenfEjV9Kt2/uhdLMakgBdo218MXcUkXBjm6FvmRuRkHghTnJ5yOcHoax5HbIBSQE7srsbnHTkgZ6nknjGAc5Ax/1XyaTj7HDVMKtH/smNxGEWvI9Fhq1NLZrfd3Wuho81x0Uo1MQqltWq9CnWfTS9SMr302em6Pum9+L3/BPzXI8a1+yj+0D4JlfcZLj4b/tPadrVrFuxzBp/wAQfhnqkpVcHakmpZIODJnJGQNL/wCCbniST/R/iX+2f8MpmwUTxF8N/hL8T7GDcf8AlpceHfFHg3UJo1O4sY7EORkhGYjHw0/mS5/dSnrj5evXPcZJx1I55PXgwtDMuCsLj1+RehBBGSTgEYG3Bzgk9dtbQ4ep0o2w2aZxhpfZ/wCFGpinvFL/AHxYhcr72steyMnmUpe7Vw2DqqTvb6vGjfVafuvZy1t0eq3b6/fyfs/fsa60kn/CLf8ABQbwxpsj8Q2/xV/Z5+KvhGUkkcXN54fbxhYxEEENIGdFPzY4FYt7+xVYanu/4QL9sP8AYs8bh2Jhhf4vXvgS/lx0UWfj7wroCRyMONkk42t8uRjNfCpMisfkYAj25x68ZIPXvkYJOSSWsWdNrwhhnksiHqeR3GSeO2PQ5FOGVZzQd6HEmMmm9IYzC4GrBWcdX7ChhptLa3Mrp2bJeNwktKmVUUm9ZUKteDTTT+3Oaey6Nan2yf8AgnZ+1ndAyeF/B3gb4jw8tFJ8MfjN8IPG7TJg/NFbaP4we8fIA2L9lLngbdx2jz/xX+xl+1x4IieXxX+zP8btKt0BL3v/AArjxDqFkFHzF/t2l2V9aMm3/los5U4yGwefl5FSNxJFbLER8yyx7IZQcdRJEEdSvykfODnHHFeieF/jN8YPBMkcngz4r/FDwiYiNn/CM/ELxfoojYEbSiadq8MYIIA5QqPTnB3VLium0/7QybERVrxnga9Cbdo6e0jjaqV02rqDd23Z3sR7TK5ayw2No31bjXhNJK12oujGTSeyU9Py4/V9C8QaBI0Gv+Hdf0ORGKvBrGi6ppkisuVIdb6ygZSCeQygjHJyARmxTxn7ssbZAXasgDDptHK57g7QAcYxgAV9i6T/AMFAf2z9Khjtn/aP+JmvWihUNl4y1LTfHtm6RjKxyweNdO1xJUA6o4bcOOQMDXuP29vi/rG4eOfAH7MvxLR1Ikfxt+zN8Jnu5NwYZfU/C/h/w1qO8gnMiXiupy6sCFIPrnElNr2mVZZXjdNyoZhVUmna7UKuDSbvteq227voL2WWO3Li8VTbasquGi4LrrKFZvXW65bdd9F8UNNtGcqQTwBKeCcANxg4B545GORwtRmfkDJDeuXJx2JHcnHHUc5DE9PrW4/ae+EesuB4v/Ya/ZuvixzLdeCNY+Mvw1umJzueFNK+IGq6ZC4H9zTtiZOI9qiq5+I/7EOs5/tj9lr4yeDpXzvuPh9+0dBqsERIzuh0/wAc/Dy9dgCSUSTUTnADP1I1WaY2KtW4ex6WnM6VbA1YtuzVo/W41Gt96d3p1uifqlBpezzDDq/88cTDfl1/gyjezezs2rXPlEypu+9gY/2wc9gAOAQTznPT73HMayMWwoz1wWBxnJzjleSOTheQB0ya+tYtF/YQ17P2Hxr+1Z4DkYApFrngv4a+O7SEnAO+60TxL4bu5I1yWZ1stz84TJGNuL4Dfsw6ou/w7+2Xo+muQGig+JHwS+Ifhsgso4mvdBPim3TDcGQB0G0lRggFf6wYGm+Wtgc0oOyVp5fi5pbXTnQpVad1s7Ste7Wl2THLK01aniMJUWt/9qoxbWi+GpKL33927006v428zYVbby2ePm5wQuDzjjPqTzjdTHvJE4JByMbcdOQ2SSTkdzyBjg8ZDfZsv7JVlqakeEf2nv2S/FQIDRwv8UrzwZdyEAYQ2/jrw34eWOTI5VrhVU8byAxHM6l+xJ+0ThpPD3hnwT46i+YrL8PfjB8J/F5kAIIMVrpfjN71iwJKqbXeRldpbIO1PPslquKni6NCT1UMS3h5apNPlrcjVkmtr7bN8pnLLMdH4aM5pXb9k1VVnZ2vSbTV+19NbnyNc38px9wl9q9Acc5yOewzgcHrncPlOTJMXO3YBgFgwHzds4JYk9fwx2IU17h4h/Zj/aU8PF31r4DfFyygjyWuI/A2t6jbADA3C70u1vbVlwwIdZSMEn2Pk2oeGvEejP5eu+HfEegyxkGRda0HVdKKdB841Czt9hBOG3Z547E169LF5bV5XRxmFqK13yVoSWvLbms77NenNurK3JOjiYzalRqwva3NB2srJ77Wvt5ddjGUD72GbP8ACTkZ68YOB1IHIGGzyc5njKJkBcFR2K46fMDgj8uAc4B71NFbo4O2eBxjARJ42Y9Dnhs85GcjjIAwckzGxmiw5QlQfvHkHduAGBvz1wPYd/mNd0JYeUG4ulNuWiclJtXjrZNp6Wfz1Wqtz1FNOKfNFKOj5ZWfw6XS3v56dynK7EKAB0wT1U8derDgHgH+8AcEDFCWZ9xCkALnjk57465zkZBJyoOAQcNXYaV4M17XYZpbSBILeON2S5v2eCG5lQoPJtWCb3Z/m/e7BDnId0IIHJ32m6hptzJaajaTWtzHgskqgBlcLiRJFykiMSMPG5TryetelPL8TQw9PFVsNUhh6qXJWlTag/h2dkumjd9t+3CsVGdR0YVoSnF2lBP3k0o62vzbdHa2pVE+Tu+bocgN0PAxgA7e3ckAdGAxT9+75t7EAkgMTk85GBk5OABnIHHHBxVEyxrMsRdC7dEVg7kkBcBFyxK9NuM4AwMV3/h74d+OvFJjTw14I8Y+IGlIEaaP4W1q/LBtv3XtrKWIg8cllH3Scd/PniMHTtOtWoQimneUoXW12731tda9VbayfTCliJ/DCrJOzVuZ7uOltLrbXb168hubGQxwOuCTgHjufbG49KheRueTjPOCQT74JHTge2Mg19H237KXx3eBbrU/Ab+EbJvmF3488Q+F/BFtGg2/PJ/wkmsafMoGQSPKLKpLBSMgUrj4D6RpTEeMv2g/gH4YZeZbPTvFGs+PdTUjGVFt4H0LW7ZpRkcfbVU85ZQCa5VnOV83JCrSrO3/ADDwlXkrcqelJTbvstPV6HR9Sxlrypypq8daso00rtbubSs1frvsfOzTOXxuye3JAx34IGe3IJHJ+brhRJuX5gSec5BOSOAeRxwfXr9QB7sfCf7NOjqW1X41fETxdMqh/J8AfCWLTbZypGUTU/GviXSpFQkf6w6a2MZMeQRUy+KP2aNJ2f2X8JPil4wlVRi48b/FLTdCtJGOAGfS/CHhg3KIVU7kGtE4JxJu+Zl/aNNtKhluNrKWt1R9it1reu6Sbt1XM0lt2pYOaX73FUIO6iv3vN2dk6fPrZu6VreR4KoIUFtvH8RYqATnjnAOePvcg4Ixip4pHzsjbzmbHyRfvHPTACIjsxIx0BJBBUZJz7m3xu8OaaxHhb4A/BbRTGP3dzrGn+KvHt6MEtvdvFniW706UlsEsdMEZ+6EAODHL+0/8ZURYtC8RaJ4MiAKrF4E8C+CPCDRg9o7vSNAtr1cAZDm7LgkYb5QQnXzCo/3eVQprRXxFeKttry04Vb63ur267ah7LCwtz4+crtXjRhJr7P2nKDSfdK17eZx2ifC34p+KVUeHPht481uOTG2fTvC+szWxXONxujZrbqAScs0oUAZJWumf9nP4qWwM3iKPwP4GjTG8+PPib4A8M3EasRkvp91rr6pnlcqLJ5BuZSoK4rznxL8SfiP4xdj4q+IfjjxGTncmseK9cvocHjAtpr02yqwHRYgMcYwa4EW0JLuY4/MySWKoWyOdzMck8d+xHzEmtoRzicVzV8Lh09LU6Mqj6apyqQVrWV1TtforGbqYGEpPlxFbazlNRX2buyT1frbVLTc98j+F/gnTSD4l/aE+FVlKu8SWfhW28Z+OLlSAcrG+k6Ba6VI5UsFZb8xsQCWKmrK2H7OOlgi78bfF7xlOvSHw/4R0DwlYt04jvvEGuardIhyVV/7MBBwTHnp4CGCAKoBB4O3gDb0zgH3yPfPplC2cAE4H8ZPXpkdRz2AJx0zyBiVl2In/GzLFz8qUKFOnaytqqTlb/t756XK+t0YpKnhqKfRuVRyu+Vapyt1vs00npY+gP8AhP8A4IaQy/2L8Etc1l42JW48e/FDVLqOQ4UKZNP8J6V4dTjB3It/jjbuIyKry/Ha4tV2+G/hb8GvDQUlkmg8EDxLeJlshjdeMdQ8QZccgsIgWU5II5rwdm3YAHPPr7dP/rimlsLtxnJwT2U88HGCW4HHPH0ONY5LgrxdRVqz0/jYitOL2v7k5uNn2S2fqZ/X6yu4unSad/3cIxcdk3zJX0vfR697rT1vUPjr8VdRRoz4xvtKgdSptfC9lo/hK2Ab7oWPw3p+mEAEDAySdo9zXnWo69rerM0mq61rOps2cnUtY1K+JUkE/NdXMozuAJBUr8oHPWsrocAnPQjHBPTqfXnjnB9sGmE88/h+PAxj8Rj8uBXXDL8DSf7rCUU1onGnHst2o69tX2IljcTNtyrVJ2s0uZ+V7X1tfbTVXWw4sijCIiA56KCxzno2A55OQM/LgY5OaYQvuQeQSSTnscE446kDjvtJNBGc/wAz/D7j8cZ6CoyTjdnJXpjGPz6D3z29eh6YwgknyK8Xokr2W91FWVn+u764e1k/tbfE+uyWrd5b7pdHpoSE459CMc464zjkA4B/nnvmIkNyBjjA/D1/ljtSMSTk8AD14x6np2yeeme/Y4YE+nHYZHBP1zxnOOOeQc1qnole9mr2tvpbrstvv8282+Z63bdru7b22S/TptsTkZIz26Y/zz2/+vSnrzjP+f59eOD24pc+mPw68e/X9fy4o+vqfT/Pp+uKlyu1bS1uyS2/4OqX3q4rN/8ADdNr/wCb/ETAJ/D9Of8AP4duaQgHGex/z/n2pT6459gB/hSZGAT3P1+nTNNO/X8tHZdL3dmu1tX8yKttZLa1tOm1l59LequiRdysHUlXUjaVJV1IJClWB3KRk/xZDfNnnnbj13UmEcN40WowIygR6pCt3tUMMhZ323UYCgYVZwoAKjHWsJeSB0K4IILHAPDALjDHJ9u+eoJnBwQeuGHU4zhsZz2z1HFZzpwlFc0IyetpLSS+FrVarp2bNY88fhb6OSutLKG1/l3te2gqanexYaKSK2bIINtaW0TqeCMsIdwIOG+U8EZz1p0usazOjJLq2pzRnja99OECnHVFkjXGABjbgED5cjAqAe4OBz0x6dD1HGMY9sUZPTt1/Hp0/r27U5U6V0/Zxb2taPVx1S+Wjdnu7WbtMakou6dvJOy3u1Zb36duvVkLhmbc6h+pDyEyMrAjkyOxJJPPU9Bn3kUkZIC8nPGMgcjHJA57Y45J6CgnHAAJ29z2GMk9fXkjH9KcQTx0Iz0ORkDk88H+vanyU0l7sU3bVJJN+7e+ml1bXor9XZpznJWlK68+mzv8/wAdeomQQOOhI7c4Oev1GOCR096dnpjA47+vPrnr+A9emaTnv/n9B/KkJAGScD39/b1/z60lJpWWi2f4abO211ZfeRa3zu+++762enqIx6+y9PwA57cnJ9fTPOYkcZOclgOM5xyecH/63PcjvetbC81K5t7Oxtbi9u7hwkFpaQyXFzNIxXascMas7E5BBA/I16MvgHRPDSxXPxG10WN26rLH4J8NNa6l4rnyAVj1S+MjaT4bVwRva8e6v4xkHS89eevi6VFWlJyk9eSC5pvbZLW3rZdPN7U6UptPlVrPWWiSvF79V3t6N9uM8LeHfEXjbxDpfhXwro9/r+u6vOLew0nTonmuriRim5yoQiC3hTMlxczNHDbwo8sskaruH1dZW3w5/Z3uZrSWz8O/Fv45aPO0Nz9qUal8LfhrqSD5YktH2L488V6bIMzMYx4d066jKCTVvLdj5BpHxb8R+D7qCf4W7Phcto+6K88NzNceKbzlPl1jxPdK9/exuVUy2Vv9k0wneUsAGYV7TbftCeG/iBHBp37QPw40fxu3liGLx94Kt7LwT8RrJcswubi40+1i0jxA0ed7W+p2sYlbIed3+Vfl8zlmVadOTwtSeWK3tqNCoo4mbvF+/GSjCUeXVwjUUpO17r3T28F9ShSnFVeXFyvyTqQcqUE0r+8ndS5tnKMkk27rRnhPjPxr4q8d6/qHi3xlr2peJfEeqybr/V9Tn82eREBEcFtGAtvY2VuoWO00+0itrK0iVYre3jjCpXGRuHmXGfvDGc4OXUk4AA6BiQQB6HoT9TX/AOz9o3jmCbUfgB8QtL+I4WNp5vAWvLD4T+J+noqEtEmlX0sem+ITHyon0e6L3DjENq+QF+dr7wxrfh/VJtK8R6VqWhatZuyXWmatY3OnahC6nBVrW7ijk69SAygAk5DAD08DjcBKj7LCzjQdODTwsoOjVgkla9KSi9uyad9G0zhr4bFxmp1l7VOomq0Hzxkm1dXT672umnbse/fFeMW/wS/ZgsSuBceGvin4iZScc6p8Rb2xSUgkZ3LowXIBLBAoLNxXlXgH4W3HxAv7+W61GDw14P8ADNmNY8deNr+PzNO8M6Ir+XlApB1DXtSlAsfD+hwSG51TUJI4kxEs80f0V8RvCep+K9P/AGZ/Cemyw6dY6N+zrb+I/EmvakWh0PwnoepePPG+r6j4g1y5Cs0FtBDJC0MAVrzUbuS3sNPhub65ht38B+IvxL0rUNMs/h34Diu9M+GXh28a8thdqsWseOPEG1obnxz4vSE4N7cJmLQ9HZ5LXw5pJSztzLeTahe3XjZVisRVwbwWEvGpWxeLq169rqhRniqjTXSVWUdIRd7K0mmlr6eLoQjXjXrXcYUaEYUldc840aaaa/kTSUtr777YfxN+Ilr4oGkeEvB2lSeF/hV4Okmj8I+GJHSS/vbqYKt74z8XXCFU1fxn4gZFkvr1sx6da/Z9K0xYbK1jRvLw0pJcsMAnkAd8dc8ZGO3QMcNnmrDosv3f72W4+8PlIzleMjPf2PrQts+CduARkZAXjkHgqehHfnGevSvpsNh8PhacaVKTbuuaTi5SnJtJyk2neUnq5P8AFaHkVqlWq3JuKvbS6SS0tBdrLS1lZLYFeQ8lzwfQHGR1J7jHXHqvI4qTezdSDkg7u/Q9we4645Jz9KFjBIOOMADJGMBe568tzjr069KcQoXG9RzkHcv9DkdufX64rocopq7bdvJW+G6T8tdNLaWs9VgoydnKSvorST/u7NXu0mrdF0e6TSVXgHnnOT19ue+fTP0x1CYyuCCRngjp1BGcDPOO2SR1prmJcM80KEhjgyIvcZOCepGc89TjPIBiaS1AK/a4FBweZkGM5OOG4PUcD69cVnOrRuk5pXSbb5bW0v1W2mjsvRB7KVlZydmr25r3unfa9l0t1utXdE5ZBwOpGcjsOmeoxjv39QaAUOSc7iTwRweCS3JOQcHqeTk5GKhD2Y6XcDNjcoEitnGM4x14OQRyfbJxfhtJrnb5EFxcZAKmC1nmyAD93yopM8Z45z2HPEuvh42Uq0E9fe542Wq0etlvr1Tvp0CFKq17tObV9+Vp2tHZWenRa67JFXIU5HT05Hc9M54A5GTyOmTTGbJJAODnnHC/rzzgc9f97iuusvBvijUNken+FvE96zngWfhvWrtnJA2hVgsHYsOpKjdu+nHd6Z+zt8d/EAUaF8F/i1qnmAbWs/hz4smVumCrf2SEOcjuPTGazlmWCgk543DQtq3OrBbcqSld9unlruzenhMXN+5hqs7u/wAEm7Ll35ddb2Wre3y8ULYKgA4JPIHXHAAx15wB2GM9quQTByF3DIbBxwVPByQBwfmGTwAcdDX03bfsM/tf38SvB+zt8Uo43wFfUPDw0ZWLjKZ/tWezKAsVJ3BSDkFTgkS6X4Hh8OKmia/oFpb69o5fTNXtb61t5Lm21SylMV/bXLjejyxXCtGzo7LhAFZlCsfc4awuH4nxNfDZdjsJOWGpKrVnCoqjinNQUWoNWV29XbY8/Nq9TJqNOrjMNWiqsuSDnFw1spN6pX0vok977nzaRIA3Ujpt+Y5HXIzyD7A59vVxjyMctyThQSR1z364xx784xX2P4P/AGYvFPx01u9sfhe3gXS7nR9PjvdZTxj488LeAtOWCe5S1gksJfE2pafFeTtI2JrexM8seRK6Ku5j7lp3/BLb48XDp9r8ffs5aejHbgfGrQtXlXO3JEHh211eaQgdVSMtwcbiBXzfFGd5LwrmdfKc1zHD0cVQUXKmm23GpGE4S5VFv3otab67aI9LJ8Bj86wtHGYHDVJ0ajd2nGLTi+WSV2lH4bp9LdLWPzPijUIoI6kYz1GCQM444ByepHJBGePvb/gnZ8Y/+FSftI+HtN1HUv7M8LfFe3Pw41i6lSGe20fWtTdLj4eeLzb3Km1e98JeOotI1KzmkXMSvcoCizOH9vt/+CTvxEdAb/46/BO1OCdul/8ACwtebAAyyfYfB0ccoXK/cI5yCMgVnp/wTZ/sy5ia4/aL06G7guFkjk0T4JfGPUpbOeLY0N1FdLp1giTW8hSeCZZh+8jjOAFxX55nXFvCWcYDGYCePdSGJozhaODxc+WTinGS5aEl7k1GS10a08vrcuyPPcDisPifq3s1SqR1eIpJyheKkn+8u+ZPVfNM4P4iftW/FPwV8QPF3gT4m/B39mbxB4s8G+ItV8O69c618CfDC3d5f6ZdyW8t5LdafJZXFxHqikX8V2xZryC6W6dy0xY85B+154UmlYa7+yB+ybrAlYPKLXwR4o8PSMqkFwj6L4xgRPM+bLLAwBOVAYKa9v8A2/8A4DeK/HPi/wCG/wASPhhpniz4reMPEHgu08PfFi68NfDvxdo0114k8HwWOlaT4xvdF1axjnsZfFmjvEj2olvPsw0iJZZ2lm5+DLX9mr9pNnQH4C/F4h/myngLxE6gHqV22DEjJXkZwclg2MDLIMDwnmGT4XE1VSwNWdLkrUqeKrYJxqU2qdRqnCpSnGnKacoNxXNGUWkroeaVs7w+Or006mIgpr2cpUaddShJxlFOVpXaTSdm9b7n1f4x+Mn7Ln7R3gLwZ8NfHPhfV/2VLn4ez+IpPAuufDOCfxz8Iba98XX9te69P4v8GXu3xmk2ozWlmkuuadquq6hbwW4jkiuLdEhX5b+IX7Jfxg8C6DP458PW+ifGf4WIhkX4p/BnUf8AhN/DNrbgg7/EWn2cSeJ/Bs6q2Z7fxRoumrA4ZRNJgs1z/hl39pF1J/4UD8YypXOR8OPFJzyF3OV0xs5zkrjdgjJweem8DfCj9sn4Sa/b+K/hv8Nv2iPAeuxFSdT8N+BvHFg86A58i9to9JNnqFsxIEtnqENzaS5YPE2Nterh6eEyWMlkme4SeHdSVV5fj8RGtTdSpPnqOniOd4qEqkpylKUnXjzNv2bvrxVKmIx7X9o5bWVZRUI4nD05QkoxioxUqXL7KSSSirezaS3WiPjCGcMrNGySBWYHawYgg+ncg5U+rEgYyK2LWZCUO4ZABckbcgkZ45A5yBjkYyQD0/SLVJL34oyx237U37E/xLtNamaT7X8cPgP8M/EPw3+ITzMoP9oeJ/Bcnh4/DrxnMG/e3btZ6Bq10PMC6grkE8Un/BPrxj4y8W6BpnwY8b6f498JeINd0/S7y88SaRf/AAr+IngnTr64hS61Xxf8PfG66feXFrplubiee+8JX3iSxuXt9kUiyyxR13LjDA0oP+0ksDKKcvaupTr4Oo4RXNyYmk3GN7S5Y1VRqSdkqZz/AOr+LlOP1VOvGTguXklTrRUmvipzSdu7jzRsnqtDoNPeD4NfsL30zKbbxr+1745hs4QWK3UHwT+EF4l1dSNtHy2niTx/NDGoJWO7tdKRwGRM18DXSlslVJXuwDY2g8cDkdMgADIyec1+nX7VP7OH7TXj/wCJv2D4efAv4i3HwZ+E3hvRvhD8KbxdOtltdS8LeC7XyLjxHbRS3cc7jxfrEmp+ImnmtY55rS6tzOolj2D43034NyyW9wPEGoXmjapbXU9pNpZs4pWtZreTZJHdt5oHnjbKMRkgMArsuCR63hrlWK4pnjJZRVw+PzHG1J5njKVPE0L4ejUcIYaFVufuyp0I0qUlJ351KyvdHHxZiqeUqjDGwq4fCYaNPCUJypT5ak4pTqTjaOvPUcpNpbJa2PnKVMDoR7DjACnIHUY9MntkHg1TcDcpG7J49fl5ycDPAHqOOPWvsfwH+xd+0V8XV1G6+Fnwu8Q+OfD+najLpcviWz/s7TtIW+WOOdrO4vNW1Gwgiu1hYSSRGVim5OWV0Ld8P+CYX7YbRLc3fgjwXokRO1/+Ek+MXwq0RoMEKfOS58WsykAgbSqkH7yggCurM87yrJsxxWU5nmGEwmPwdSVHEYWpiKftadSHLzRklLo2u17qz6nLhMsxuOw1HGYXDV6+FrwVSlVhTlyTjK1mna19byV7rW61af59Ebh1PBHzAEY55A3ADJ4/So2V15LZHAx83PP0zg9s47Angk/oJL/wTf8Ajlp23+3vH37LXhoMCXOt/tN/C+Ix+8kdnqt3KOTyAhIIwM4qm37CU1oSde/a1/Ye0Hb99X+PKay8ZOM5TQvDmpb3AI3BCzEE4Bxk8j4syBW5MfGo7L+FTqVZN2i2koQk312Xld316P7DzJb4flvZ3qShB2Vt+dpRe1+q03Z8EAscA5GcDGMdSegVcEjcAD24Ge1SojEEt93GMbW4PTpjH6nI9OK+80/Y6+EtqQNZ/wCCgX7IViccjSrv4p+I2Tpwo03wEN5HGNrEYOVAANXo/wBln9lW1wdV/wCCj/wbQ5+ZdA+C3xx1w9Qf3ZHhyxWQ/wCyH5ODg4NZvi3KLWX9oTfRwyrMZ3vb+XDO/ZK6e6V0XHJMZdNywid02p4zCrRJa61l0dradr3bPgAI2484259xk9flGOxAB+nsaeEY8E8tnHBABGenHH4AY4APSvv4/s+fsJWef7Q/4KA6xqjJyU8NfspfEe43cj/VvrGtaYh4yRvWPGRu46SH4Vf8E4bDLXP7Wv7SWtMqEsND/Zd0uxDNwMK2tfEeEgE9N+Oo+U5NZPi/Au3Jgs6qJWty5NmUU22m/iw0O91r06dEslxKb58RgYrS/wDtuGbtp2qytZ3tda676I+BBCCBhCSMHODwQRk5yRkYO0gHAPODihYedwUkEYHfd0J6Dp6YxxxnAr76Xw3/AMEz7RWVvi3+2zrZHP8AoXwj+Emiq54OA1747vWQAdzn5QBgA5Eof/gmFaHLWn7d2usigj/S/gjoUbt1IxHJfugJOCQTgDoSah8URkv3WT51UT1/3KcNHZP+M6fdtrV9dGWsp3csdgorlSb9upK2jd+RS5nfXSLXuqyteL+CETlQchsn5sHIAI7YGM89evfFaMDMuNqllHJ4Y/hyCSeSMg/MOFO3Ffcq+L/+CaFgw+zfAf8Aa814KD/yGfjb4C0jzWAGN66T4fkKA9SE3ZI4HUm4PjD/AME67FQLP9i/4xamyMAP7c/ad1GPJ+Xll0zw5GBu54XpjJyc5yln+Ilbk4dzmadtWsFCzXLr+8xkX5q+ul1axtHLaKd5ZpgYtpWSeJldXWmlBpN302bto3c+OLCZlKcMecYIJwevAxnIB9cZyOcmv0I/YJ+JmheG/i7qPwz8c3MUXwv/AGkPBurfAnx/9qk2Wdk3iyPb4J8Ryh18pLjw140XRrmG5ba0MNxessibi1eeD9o/9iaycHSP2BZJfLBKNrX7R/j28DsOfnW20uDceo2qRzwBXpfwq+OPwb+K3jvw18Pfhd/wTo+E+o+Ktd1BI9Nh1H4s/Fe6itFgHn3uuatfQX+mRaboWg2kcmra1q12ywafY2Utx5glCBvnOIcVjcdleLo1+HMyw9GVJT+sTxOVU1h50+WpTxEW8feMqU1GcW/tRTPVyzDYbD42hUp5phalRy5XShSxb9opJRlTv7C0lOLcZJaNXsfF/wAQtA1TwN4u8U+CNYiaDVfC+t6t4e1CEMygXek3sljebVLZC/aIZGXJy0ZXOMgHyi4nZjhskEggnAAwAOVADAgnPJJzknnFfVP7Z3i34e+Lf2ifiZ4g+GuqLreh6jqdj9q1S2kuJ9E1DxRaaXYWXim88KXF839pXXhWfW7a9k0K91MnUL7T2iu7smaYmvkfe38OGJwTgEk9ARxxnt6+gznH32Cwyr5VlWNXPTrY7AYbEV6FSDhOhVqUqcqkJR6SjK+kn0s200fMVqyhisXQveOHxNWlCcXzRqQhP3ZxfVNLR+S6q4yeQSECaKOUAk7WUEBSeF5DFvlOckqPwORf0bX9a8NXSXvhzWda8P3qEPDdeH9Y1TRLmFwCysk+l3VtKrg8qVlBDYYNjGc2W2kIGMDeypGijdI8rkBY0jUb5HdiFVAGaRiFT5iQ31DpH7LLeDdD03x5+1F44j/Z58GapapqWgeE7rSx4j/aA+IOnupeCTwV8IkurK90XTr4YWHxb8R7vwl4dVWF1aSaqsf2eXzsxqZfhIRjip06k6nu0sNGl7bEVpaPlp0YRnOp392Lsvek1HVdOGp4mvJewc4xhZyqyk6dKGqs5VHJRVtLXbbemrO7+E/7dH7bWhX2leFPBP7QXxn8RXmqXEWn6P4Pv9Vuvig+rXU8gSDTrLwx4ssfE51CSVmRFt4YHZ8BQCpGf0Sk/aTtvB1tfL/wUX+F/wCzP8XNeuNLmj034J+D/hd4O8PftAWWqPtayuviF45+Fz+GfDXw2tyqhrzSfEE+veLiwVJvC9i26Y/lVqf7VEHgew1Dwj+yn4Hf4B+GNQtZNN1n4gXWrr4o/aL8dWM4MdzF4k+KQtLMeEdMvlLCfwr8L9N8JaQYXFtqEussjXD/ADImr3L+Y8jNJLK7SyySyGWWaSQ7pZZ5ZCZZZZJCWeWRmkZtzszE5r47E8F4fO6rr1Msw2TUJpL2mGp06WbVk3FuUsTQ0wvNZpqnOrVcXpUpSVj3aWd1cvioU8TUx1Sy1rOUsLCWitGnOzquOjTlGME18ElZn7w/EH/gqb8EvjB4Nl+HvxE/Y11nSPB97p+g6JrGmfCj9o/XfAUviHQPCmnxaR4U0LxNe2XgpNU8SaJ4X0qCC10LQdb1W70HTGVpoNMaeQzV8o33iX/glhriMJvgF+2N8PpDGBF/wi3xq+GXjW2tm7mOHxP4S0maVVB4X7RGzDAY5yT+aJ1CQEbWJOBvBHQ9eDyOOOuTzxjBFIb9xuyS3cDAGQOpPUjn65JHAxx0Zd4eZZlUOTLK2aYCLm6jhRzTHuDnJRTk4VMROLbUUneLbSa1RniOJswxk1PF08LXaXKnUwtC6SaSjeNOLWuv/DtL77uPBf8AwTH1ppRY/G/9sj4fyO5MR8V/BX4ceNLOInn9/P4U8Z2lxIqsCpaO2LMFBCqcCoI/2af2LNcJHhP/AIKLeE9JYj91bfFD9nf4teE2yc4jnvNHt/ENlGSeGkUugDEgfLx8DyTKcHcACcKFUKf0IG7BY5BBAJHrSxyksRgjaM7mJHygjI5JUZGRjGT1BzyPW/sHH0k3S4gzaDttN4Guto2T9tg5u6ejvJ7etuV5nh5W9plWCldL3kq9OV7q9lTrwjomtLW16WPv6D9hDw7qzqfBH7cv7Dni0yHEUN78Vda8EXkgyNu+38X+E9MWBm5ULJLlW6kACuni/wCCX/7Td/CjeE9Q/Z9+I8bjcj/D/wDaN+EWtNIP4RHDeeItOnLOTgRmMN22hq/OVNhBDxoSSMh41II/iJLLgnGeSp78AgmrEJt4nylrbq69WSFEYnruVl2t34xjPXmsKmD4ij/AzynNKyi8ZltKps1/0D1cMraLWKVvkNYrKpaVMtlFb/usXOCVuXb2kKuu+ild262R+gN7/wAEwP28rGPzR+zB8Q9Xixg3HhdvDni2EgH70cnhzW9TWUHnaYw5YYKxnJNeeX/7B/7Y2mStb3/7K/x/tpgSSrfCrxhIOpYlGh0uRD3wUYnaCApzivnjRPGXiHRHRtG8Q+ItHmQhkm0jX9Z0yRTwV2tZXsJQA8gIc7gMAYr1/T/2kP2gLOBLax+O/wAaba1UbVt7f4rePYYduV4VE11VABAwB0wcHmuZrjCk9cXk9ZfzPCYmj23tiqiV/wBOyKSyKp/y5x1O7drVqdTflSt+6j3u7p7u19jdT9hz9rqYkp+y98emIIALfC3xZFgHAzmfS0HYnLZwMHgZroLT9gH9su5CGL9lz43DI/5aeBdUhOOCSPPSMjBA6DOAcDAFcDe/Hv42XWWv/jZ8XZzISWku/ip46YhiBw4fXCTzgnGCcnDACtLwtqP7SnxJv4dN8D3n7QPxDvLkhI7TwvqXxO8VyyO33VK6dPcIcj7oaaNVzncVyp5qmO4jpRcsRjsgw6tdznSrtJLlbbviYXilvfzd++1PDZVJxVLC5pUvb7cFfSPR0pN+Vr3Xc9Mj/wCCdf7azqoH7MXxbiyASbrQYrRQvByxubmMKOTnI4A28Cui0/8A4Jt/toTACT9n/wAVW6ylozHqGo+E7EshGCCl7r0QAzwRt3AnPTJruNP/AGIP25r+xj1Hx3pU/wAHdImUPJrPx/8Ajf4b+FsEMLhCJJrDxZ47i8QdwHRNIlmHIMWRxi3X7OPwd8ItI/xh/wCCiXwTsZUQxz6H8GLD4r/tBa7GcNvhhutE0vQvCbznH7t28S+VuJ3y7fmPiVOI8wqqVKlnWU4maunHL8ox2YO7aVmsLi6lnd6uVrXbfc9WllmEpuM54PF0kkmpYnG4fDXXNF+661GN79lrZH6JeA/2Afix+0j4Y+C2l/tL6Fa/Db4gfALxH4F8J6l4z17xb4Lv4vi1+zJb6t5t14V1y80rXtTnt/GXwpsIJNL8P6lrEYstQ8J6taaNd3CSaTZAfPfx6/YK/aT+Nfxz+KPxi8e+Nf2Z/h7F4/8AGOt63YW3iv8AaL+G8b6R4Ztrkad4V0oQaXqGp3EVtpHhqw0vTreEW6SLDaKgRWBQfNdp4v8A+CdXw2hmFm/7Zv7Q2py2stncTz33w8/Z88LXUEsokdFKv8T/ABSlrIwBdGWGV0A80FgMRx/tufCrwu8Ufwh/Yh/Z88M/Z2ZbfW/ivrHxH+PHiMB9yia5j13xD4f8IPMwZvMjfwo9mW+cwAEKPnMHl/GlHF1cTl0KlSLhVpYV18to4TD4SnXqQq14UIYjMpYmnCrVip2nQnypKMYxhBRPYrYzh+VCNPFzjGa5HVVPESrVKkqUVCEpyo4f2TlGLavzQTu225N39i0v/gnJ4YFyLDX/ANtn9k+yvlkCPpvhbVviF8Q9RWTqI4bfwv4FnjuGwGVVikIclVVxmvrLwh/wRV07xBpcetyfH/xReaR5fnTaxpn7NfxB0jQDCoG+WPxB8Rta8C6SsQJwZJZYlUMrMCCWH5z6v/wUs/a3ubeSz8M/E7T/AIVabLGYDpvwQ+H3w/8Ag/bxwYIEKXXgfw5pesssasVWSbVJJeATIxbdXyl40+OXxK+IVw914++IfjzxzcyF3ebxj4x8ReJnLsSWJGsaheKOwIxtHG0DAr1I5L4k4yd63EeHy6m5K6oUKOJlZ8tvcqYShyNJJ29pNbNto8upmnC1CypZXWxUtLupOdGN9OqrVVK+n2Yt66J3P2j8U/sB/wDBPP4SAr8Vv2+orC8iB83S9EtPh1qutK8Yw8DaR4I8VfE7WLeVz8qpNYRBGYq8gKlW8J1K8/4JCeC5GjstW/bN+NVwhKsdFs/BngXSJipxmHUfEthoV+InChtzaUxHIMfyjP5AXOtgDCIqjliEQJjk4ICLwF5xluOMtg5Oa+ss3O5myACGI55G4DBOOPfgdSQQK+gwvBmPbTzLifPMZOyU1RqUcDSd+W/IqFJVFdpu/tbp3eySPOq8QYfX6rlOCopXS54zrz2Vubnly76v3Gu2mp+n/jz4ufsfa+fDemfs+/B/4n/B+8s7u/k8Q6r8Uvijo/jeDxFpkiW402GC3stKsV0i9srhHZ3S4kt50O3ykkiVnf4a0S08R+PvDHga/wBZ8PeGL3xBr2laMZ/GWsDw3pNnLqU0K2y6rqNxE39mW92JVjS6ZCsaTxzOfKJkr85vAOmXHjv4geAfAtqGa68beOPCPhK3Eagv5niLxBpuk7EUHfIcXrkgkjC5AOAD9C/tbfEi3+IP7Vv7RnieG6F5p2ofF3xnp2kndGkL6F4b1N/DGjQwrEixxQx6XpFoIlUKm1EBTqT+mZNxPi+H8rlwll8KtSUsDi69HMsZiKmKxFGdWpThT53OXNUtOc5wbqaKmoxaXw/K4rKqOZYz+2sVOMUq9CEsLSpwpU5qCTk0krQfuxTtFq8uZq90fo745/aO/Z/+D3jbxH8M/i3/AME0vCnh7xR4S1GbStW0+8+IF9FrCPEq/Z75Zb7w1dWWp2OpW3lXun6vZSXOn6laXMN3a3E8EscslaP9sv8A4J03aLHqf7DmraDLgq8mmXvhLxNDGemUhlufBdw6gZO1roZXhSjbXr5Q8EftIeBfjB4I0L4E/td3GpXGgaBajSPhB+0hpdk+s/E/4HJI2LbQfE0ClL74n/BkSMPtfhm7mk8QeF4Gmu/CV0uxtMl+Yf2hPg14/wD2efE1loHjKHTdR0fxHpsfiL4ffELwpeLrvw9+J/hK4P8AoXivwH4mhH2fV9MuEZVurJ/I1fRrsvp2tafp+oQS2i/jWC4Uy3E4yeFzZ5vgszk5zjOlnOZvC4x3i5VsL7XEzjre9SjNe0pt2tONpy+6r5zi4UFWwKweIwseWLU8HhFVo/CuSpy0otpJ2jUWjtfSWi/SbWv2jv8AgmZq+9Lb4N634UmAUo2rfBC+1y0RiMt57eF/2mLO4kRTuAMFmjlcYXJUDjbrx9+wnqqsdE139m7SZHz5UXj39nn9rDS2jGMBZZfDnxN8WwqSD87ozKGYEFiAy/jxLqMzsQfnPQHA56HG5Tt2nqwJBz1IIOaYuXJZiWA4GCVC5J4wTuPHXnC9ucV9NR4Bw9NJ0c4zyFrO0sb7VaNPapTm91vfZ2TV7nky4jrSf7zB5e07K6o8ru7a+40ltpY/X1j8Drxv+Kbv/wDgmZr6uWCRazdftUeB52PJBc+J5tPt4SejGS9AXqT1NI/ge51QN/wjn7OX/BODxzuyY08L/tL3cFxMGzjy7LWf2jvDd8HYcBDbIysQDGDgj8iDe7BwwJBwQSnTI7EDtz6Dr0wRVluYXGSiNktyQnvgg7eORg9AM9cEY6FwbikrUc0qys074h4mbb912aw+Lwy1T3W2176HP/btJtOrhKSTtb2fsorSzvarRq9E+r2Wh+uk3wl+LqxiW1/4JbfB7xLCvzC48FeMPij4xgZQPvxt4P8A2gNeDqwAxsUlsggZxXn2vab4r8Mh38S/8Ep9L0iKMZeW60H9rSCBQMlj9oXx6Yceh8wIV+fPNfmMl81uwe1kktpCQfMgleBlGQQQ0JQjr1BwDk5JBrtdD+M/xW8LOp8MfFX4leHfLwIxoPj7xXpQXb0KLY6nAoAI6ADvzgAVpDhPNovmeMo1ulvbZth29tFN5nWaWjt7uztZsazrBvT2E4Nv3m44Wqk/d05VhqeyVmm7PW/VH01q/wAZfhvpTGLVv2C/hPo0isQ0ep67+0lpjxkH+NLz4lQsp3DJBXIJOAMZHLP8fPguSMfsc/ApSMlk/wCE6+PoYemc/FJuQB0xxkkjkCsex/be/a10yIRQftH/ABkuIFxm21nxtqniG1wv8L2viGTU4JF9FkiZTkgg9a1z+3b+0ZcgjW/EHgHxeowHXxt8Dvgp4qklUcfvbjVPAU11Jkg/M024gY7ZraOQ5nTiovA05rSzhn+Zxvblk3aVOS031ldXvdGf9o4WaT9vOGrspYDCyjpyq1+dNrV9FZLrZjx8e/gvtAP7HHwUOSCWh+Ifx8iIXPBH/FyJQOCc/Kdvo201Tn+OXwSlJz+xx8LBj/n1+KPx0Qcem/xtcDsORnBzlRzTD+1zqGpDHin9n79k/wAUlmYyST/AvRfDdxIDjJ+0eB77ws8ZYknKKCpwVI5Acvx/+A+pHPiP9ij4ROTgST+CfiB8ZvBcrMxXcyRS+L/EVnFySQBahF/ugFQT+zq9Ft1spzafT/Zc5qzSaS29tjMO5aq6ulqvVtrE052cMZh01ZJVsFFb2s7Qo1VqrPRuySvvYpH4zfBI/wDNnvw/UE5Bj+LPxryGGNx+bxM+CMdByOw4GLUfxh+BeMy/sg+BxwMCP4t/GYYPfg6+/PUEgjBKlxirf/Cw/wBivUl26j+zP8ZvDT/eebwj+0PaajFGCwUmG18V/De8k+Q/cD3ZPPzHmkb/AIYV1Q/Je/tZ+CmYDasumfCfx1FGzAZJMV/4PuJVXJPIjZhjgEgBcmHSftsr4iorrL69iK2itb3cNj60m9vdS63tdaDqVWrU8Vl8m7JL6tThorafvcPBLRWTutr6D4vjH+z/AB8yfsh+Gc5JU2/xr+LsPJxkjfqUwBBBAJPJYddoqynxs/Z4A3P+yTYqFIwsHx6+KEaqMDIzKk2ARkE9ADzg4WsiX4ffsiaiG/sf9p74g6IWG5Y/Gf7Pd+FUnGfOuPCnjfW1G3IDukLZByqHgVTb4FfCW+Qnw/8Ati/A24c8xQeLNA+K/guU5wpDveeBdStITySS10wUZ5AANEaWRTsqr4gpNuz55Z8o3fLo5NuKtfW75bX76Q55hHWEsvlqlpHAO+sdLct03ZX012ejRtT/ABn/AGZ5Yysn7IZfIY7o/wBoX4hLgnGT+80qVVwMg/Ljk5GenMt8TP2X2mM0f7JviC2fOQ9l+0h4viYcYypbwrKw/i53Z7Z71M37LPiW8x/wjvxj/Zj8VBziNNL+O/g7TZ5AdvS28VN4emViADtkjR13YJXnGlB+xX+0TNF52meCdF8SwnAWbwn8SvhZ4midmO392NI8ZXMjMxIIATdhiBzwNY4fhSLUXmWIpSdtK2b4+lP7NtKmJUl81prfziWJzlaxwsJWV7wweGnHXle8KT+5N3Wuuz2tB/aV+D/haWN/D3wV+M+gtGdyDRP2vfHGmgEE42mLwa4UDBHGT0PG1c/RXhP/AIKR/wBgkJZeBvjjPAu1PsniT9qzVvFFi4BJAktNd+FWoROhJYFWOCNu5mxXybpvwHXQxdW3juwvbXxFbzTw3ehNdpANKeGQr5NzJYyzrNc/u9xMVwYo95jILqWrLPwX0ufVL2+uvG+ieBPA2k2EV7rmt6/HqOu6tbyyzNDHp3hvwzoVtcaz4l1K48t2tbdUtbODy5H1PVbGBFlf6nOfC/L6GRwz3MYVauDnTo1Yt5jjq1ZU6zgqU/ZqtNP2jlCKVNyleUVyp6Hm4HjHG1sweWYaUIVoTlTu8Jh4Qc6VuePM4JpRs23Kytdq/T7o1b/goX8NvEMT/wDCWfskeBPE8bLhrrxFqPw81G5dmGXabUB8ErS6kY84YTxlVyQwJBqnpXxD/Z3+Jliuv6h/wT/8J+CPBkdyFvvibqvxav8A4feDo3Dr5oiurDQ9DXVpVB3jTvD1jqN8+V8q1IANfDEvxs+C/wAPWFt8Hfh3L408RWm5V+Jfxyis9VmSdCR9r8O/CrT5n8L6WhbdJbr4km8UXMRCl8S7s+N+MfiL44+KWqJrHj3xVrPii/iXZZ/2jcZsNOtgcpb6Po8fkabpFlH92Kz0+ztbeNSdka8EfBYbhHCVJJ5fRxmWUU1y1quaY9VnZpx9nhqWMSV07r204ST3pW0f01XPK0I2xNSji6lrOlHB4fkjt8dadG7s9GoRd0/i2Z9n+IZPA1zq19N8OZdNuPBBuHXQl0a51nUNNsrdNok062vddtLLV7oWsokjW5vrW3uZxsmZFEoA7z4Qa5+yTpup6xY/tDWem3XiWa400+GbvxDoHibVdB0zSmguTdpcz6HNd28N3PdeS6LqXh3VbbyY8yII3YN+dmm6lqOlIy6fqV5ZpMSZUt7p4o5GIAyYkxHuBVRnBfIBz0FMlvZpZHnu3lnnYjdcTOJJpOeDJLJkzDsM4xgFea/bM8zKGecH0eGvaYujiI4fCUKuOoVlTrSWFVO9SM0nJyrOnF1Lr3k5Rd7s/O8BhvqGdVM0tSqQlVq1I4eVNOnH28tYyUmrqEZWjq2ny2W6P26/sP4daqY5f2fNek1a1lWQx2PwPh/ZNfX7fAXYtromu+HPDXjhpOir9ptY7vCnc5fIHzR8Y/Ek3hYy6Z8W/ix+3/4C3qA1p4r+H2g6VphibjELaX448MafcxYAZDbsYXBzE2AtfmhcXSbQ22PzVA2SjYsi9wyuioUfuCJBnk5HWvSvCP7Svx5+H9uuneEPix4207RT8knh681ibxD4XlQhlMNz4X8Qrq3h+4hZcq8UmnMpTjAHB/H8PwbjsGn7PFQxcVLmjKtThTxL2tzV506/M+79jG73SWh9vUz6hXtGVGVF8qv7OUp0k2o/DBOHlpzO2lr9OmvtP/Ze1meW4l+Onxivp2Yss+ufCGz1KeTJVvMkmX4o3zu+C28bn3FVzywapYvAH7Nt0F+yftF+JbMY/wCYl8DtaiUNtGQTYeKr7GMgkqCw64JAzBcfHjw/4vk3fFT4A/BzxhPIWNzr3hLRdR+D/iiRsDdMLv4e3em+HJLhiC5lvfC90jv80qsCc24rX9lnxKF+xa/8Y/g7esuFi1/TdD+LXheOQEAhtS0KTwd4kgtAxYjOjapOidfOI59SFDFYa31ieb0Ypayo0svxMEla+lPCe1abvq6Ue7TsczqUqvM6UcHWbslCrKtTkr8t23KqoJ26Kb123THt8JvgbKpNr+1J4ZU5yBqvwr+JVmc5H3jBY6mq/UccNhScGqEnwc+G7Mv2L9pz4OyDJC/b9H+KWlg8A5Yy+BZgoye7HaCDjgk6Uv7O2q64Gk+F3xQ+EPxYV/mj07RPGEXhLxQwyP3TeFviJb+FL55idwMFk2oEtja7DGfIPGPwy+JvgF9njnwB4y8KKx/dz6z4d1K1sJAAMPb6j9nfTbqEgkrJBdSxuPmWQgbj24epGbUKPEFeMla1OtDCwnHSKs6UqFOSut/dSVrabnJU5oazy2i4tr36U6zi9tpKpJbXvyt63PQZPghpEwI079oT9ne8DEgLJ4y8SaUzcAjP9seELBUJPOSwHJyFIJFc/s8+JJsmw+JHwB1XIyotfjV4NtWOfugJq13prZJ4AIBweQeleBg+Z0dH4yArKSDx/Dwe4OMAnIJKgU7y88vggZ4ZQeuevODxnrjjHJ5r0oYfMmr0s1p1FdO8qMJXvyu/uyhfz8n1W3G62Fi/ewk4a6Lnkt3Facyevfpr56+/f8MyfFuXm0h+H+sIx4/sX4u/C3U27ldiW/iouxweNqKTxxkAVXb9mH49BiYvhtqd6BxnTdW8NamrYPVWsdZn3Z5xjcOpwRXghjhKqGhgJbjJhXPJ5wQFycdyQMAncpwKaUjUgxoq9QSpdDuyMYZWAGOPvepz7UqOcxuvrmCaWt5YafaLvpXV767ddX5r2uBlb9xXjs9Kq01Tt8L0v13u+l7r2y4/Zx+PVuCZfhB48Iz8xh0Z7sHgY+a2eYEbhjg5yDjoM4V18EvjFZn/AEn4T/EWFQOWbwhrbhQF7vHauDwcjkg9hxmvNY7i8hO6K8vYgOD5N/eRgE4/uXAPGOAPwPFbFt4k8S2rI1r4m8S2xTG37P4g1mE4GMAeVeoeO3Q579KtRzhXftsHJaf8uqkE/hT09pLa9rvR9ROWETS9niUml9uLey6NJp2ta17LumjUuPh94/tAWufAvjO2wCZTP4W1uIDGMA7rEHgeoBbHGDWDPo+uWuRcaNrFtjLZuNJv4R1yWYSWy4wOvOcEdq6e1+JvxKsiGs/iJ47tiNv+p8X+IY8DjsNRIxkZAOR1wOa3Ivjl8aYsKPix8QSgUqFk8UarcLgY423NxMpHIBDA9BxVqWawesMHPz9pOGnu6fDL5b217BL6m17sq6fVuMWm7JaLmW17rt0PLmBXh/kPy58yJ4zgcMSGA5zxkgE9PlyBUfmx85liyBxyoJzzwCe+AcKpB55bIFev/wDC+vi+yhZ/HeqX+QR/xM7TR9SBXnIP2/TLgkZJByWDZ9qY3xv+IcrH7TdeFb7cME33w88BXJIYcjLeHsnGc5LZ3c5IIpe0zPrhcPvdWxDW3L3oro30WjdjPlw17+0q6Jf8u43bVu0rd9VbXTbV+QlkIyGVt/Aw4Ixx2xgEEjB5wTwetNO3oGBIGDhgBu7ZHPTnuOMHPJFepv8AFrXpxi78O/Da7AJ3LL8PPDUJY5O7Js7O1bALD7ny5wDwAKhPxHimfdc/Dn4Y3O45Ozw5e2Xtx9g1a3UHrghFAzwM4NaRxGMSvLBq75fgqwbSaXSUU20kl5epXLQ0tWSuknzQav8ADa71bevXTzdm15eU5BPJJG0Arx7HkZPYZHPXHSnDp91uDjgHkkjpwQB1ySfXJyMV6R/wm3huQbbj4W+CnO7P+jXfiqzYZ4Yrt1qUAAdMggA4xt4qM+JPA8hUv8MLOPJy32Pxb4giIPykHEwnA6E4JIHXa2M1axeJum8HWV0rWdPd2v8Abu/019SHSpvatFu+i5ZK693WyS/G3k9W3wRAUcggEnnBVfUfMRhT1OMZGM8knDgM5+U5AB6EDk46kY5z14wOSO1dudY8AyMVbwLrEADA7rXxrK2FBHT7To02FyT1z3KgZIEbXPw9faY9C8Y2zFznb4g0q6XAAHy+Zo0LdRlSWIOPmBG41TxUrXlh6ib6e7qtN3GXfbffTYFSS2qU5p2XVW2fbSzbV3o1bRatcUTjHB5OOn+enf0HJxxlMnOByQeB69P8QPzIz0rringZ9wSLxlCMArul0K4K7SMswVbc+uDgDIXGRyGG18HuqtFqniOBgACLjSLCTGepPk6juPTAABycEleASOKh1pVPh19xvdLW0b97ebXnq1SlFauN9rc99XZ+Sv8AO1ut2cyu7IXcPXBPzEHIyBgdwPukY4POThVIOQMAluWGD3xk5PTGMZ2n2Jzjpjpvhs8x+I7ofLnZcaHMu04GDuhuZcjoTgAAjgEdY00XTXdVi8R6fy43LNaalAeSDztt5EPGMgN2yDk4rRYilf4ZJJpWdOV9Gtfhd1rbV6r1F7GbenI3pb3k10u3rd3Ttf0dnc5mjn/I/wDr0wHPfnAyOnXoegP5cemad1649D07jtkHGTwPXvkcVraaSUmm2raJK+3nrr91mc9nr6/Pp+N7i0bgG4yWHUYJ/QD37eo7inQwS3cqwQRSz3DlRHBDGZJHLdAoRc9xnOCM/NjrXQjR7DTAsuv3pjnxldF0t45tRbkELd3fzWtiG5BB86VQQrQgZKxOrTpqzk3NpLljq9eV2a1tvzdL/M3hRuuaTSXW+61Wq0s0uu11dX3Zg29rc3s62tpDNc3EpxHbQRtPO54yojRGPQ9TxjknrXWQ+HdH0gpN4x1YW8w2OPDuhGDUNblB27Y7u8DtpulGTnBmknuYmUiS04NZdx4iuRBJZ6PDFoenyKY5bewZvtdwrBAReanJm8uA5GXh8xIASSIgOnOCPsNuBnK8YJzzuOSSSRyT/Fn5qycK9e/vKhTSV7JOb2s1LbXo1rrutRN0obXnJbtpqNrK3KtW7rpe129d791N48urSCXTPC1jD4R02VDDLJp0sk+v30TcOuo+IJQt2UkVj5lvZCytA2CIMgE8UW3klzkuTIWJLOXJyd7khnck5diTu9eMVEUHGGHBHyheAAQfU5PHPX06mnsMAEZ4IOMEg5IUkgfh06dh0FaUsPQpNOMW5S3nK7k2rdX362bsOdVycVey00ty22slbp6b6aotqzLhg3oMZI+6VO4jjn0PI5xnrViOZwSqngEg4IJ7ABSPun1xkncMcDIoswC4BwenXIDHGOMns2P0IznDlcjpz97PXOO3fAyev4dic7KOjjZNXvZ20Wmi7vXTXRLTaxMYuLW90+t1va7u+lrrV220OgtL64hminjnkhngdZYZ4pWt7iFwco8VxE6yxPn5g6Nu4xnOa+ktG/ac8Ttp1r4d+J+j6H8ZvCdtFHBDY+NoZG8TaZbLhGGheOLPyvEFjIq8RLdXGoWkZwBBuGK+UFk+fhh7fd68+vp02gH0PPSZ5BIoGTgEjBxyRnP3mJ+7xwcZ4rzsbluDxijGtSvpaNSKcKtNu1uWpFqUX25XF3s7vpvRxVfDyjKlUaTabg1zQ0s0nFrldtXqrWv1ufqDqfxQ/Zo+PXhDRfA8Nz4x+F0mmaLomg/8IX/bnh7SbnxbaeGhdTeG9Lu/iD4it7rStUs9Kur+8ex0/V59BtXv5lv3E10sQj+aPFeg/An4c6odK8ZfBf8AaR0+8do2tH1vxV4Q07TL+FhlZtP1HT9Lmsb63lTLJPZXFxE6NmNmAyPk0gtwcDHDL8u3B5OQygdSehUjGR2B9k8D/GLxt4Nsl0NNQt/EPhWU5n8GeLbWPxF4YnUqVIjsb/e2nOVOEm0yW0lTG4OGUZ+ap8MVcu53gcRiatCTlP6vLFVqVRSbTbhVpy95yutKqk1ouZJHtVM3WJUfrFKhTqxjGKqxpxkuVWtzU5NJJLdw5Unq91f0a28Yfsw2aKY/gF46vR3bUvjBLFvbH3ith4fVQnqqEgdiO9g/E/4AQEmz/ZjspivI/tb4teMbrOMcOttBaBh/DkMAyk8rhSKD2vwL+IoDadd3XwT8UyNk2eqtd+JPhreynPy2+oxo2veG43cHAuodSs4BtU7VAYeZePPhf438AQxX+uaK0ug3pDab4q0e4g1zwpqUbDCPaa9ppuLIM4Kn7NcyQXUfzJLbxspVdqGHy6pP2eJq5lhq90nSxGMxME3ZaU5RrezmrXvyye6vbrjOtjIqLp08LVptRanTw9Fuy5bp/u7xetry/E9Yb44/Ci2B+xfso/CViGyrap4n+JGpOSDyXH9v2wfOSxyMEk8jBNRN+0Z4WhGNP/Zd/ZytsZ5utC8a6ng4zlvtfjBs4BOTtyTk4wM18tGZC4IZX4JymSpXBxhgSOfpn3A5Iz45wBnng5Jzk5+Ug59Tn8QCa7Y5Jls7f71NNrfEYiSesVfWo76rTf7kckswxUWrRpRdldRpUlba60Su9Ovluj6oT9qHUbdmbSvgZ+zJppkKklPhDb6gVKgDIOq6pegk98gg+mMg2v8Ahr34nxBhYeEPgBpJJGG034BfDcOnHRXvdDvWUjJzg56ZGa+TN7LkDOAcgnJPOD0yS3btzk9KcJGOOABjJ9z+eOnTHXj3zt/q9lV1KWEjNaW9pzSurKzak353T66WVkT/AGljXde2lFPblSW6jqmkmrbK+ib62Prb/htP9oSMkWfiLwdpIZhg6R8Jfhbpvlgk8o0PhJCmMfLtIIAHGAcwy/tqftQPzF8YvEdiR0/snT/DejhRnPyHTdDtygyMgKQBgYPp8qKwOAeOMEAH3HIJ9DyOuARjOcDkgMQQe2Mc57c54Pfp6Hkg4ayPJk0o4DDN6JJ00/e0W9nvbfZX20Qv7RxiaX1qtdJK3NLR3Wq7LRW2tfrufSl1+15+09fDF18fvitgghlt/G2sWakE9MWM1sozgHIA9Aea5a5+Pvxq1IMdR+L3xQvlkHzfafiD4tlDYPOQ2rEHJ4IGegHsfESwVcgjrnkknPcNncw54x1z7g1MrjPAGNpDYJBPH1x+I7jIGenVHJ8rhGywOESVtqMN01p8Kabva+jTeq6Eyx2Lne+Ir62vacujTez3TWtrejtp319458Z6mSb3xl4tuycZNz4p1+4ByO5kv3LZxjr3xkZOfV/gjdz+MvE+m/Dy81GKxutSs/Et9Za9qD3d0pfQvDmreJjZ3UcYluJJr8aTLZwXLsSs1zF5qmMO4+b/ADgM9TwccDqev4k9u56cV79+yxLv/aE+GduQf9M1LXNO27QSx1Lwj4hsdnII/eC427Tn73YEgdNPMMTw3hsbj8n9jhK8cHWXuUqbhJKKmouMlyu0kmrq6drq5y1cLSzWWHwuOc68PawaUpzbWqTaldSW+q031a3fleteJ73XrgzyyobZSwt7dRuihUgO0ZLKrMwLZJOGBAVxleKcF+UIKiLJz8235gCSOSMdATgZAPPI61zKDy0Cg8qWBBI6iRkOScknjpz07mpRcOo5B6HksQe56ZxzwM44+XHtGIlLMpLF46EMRXxEYVKlSrCE5Sk4xdtU0lHRKKVkrJK1kKH+xwWHw8nSp02404QbVtVZqyWu177vZ3bR1f8AalyGGy5lQnhgkkidecEqy+pxjntk5yKdzf6i25xqF8jZyGS/uE255zlZQR1HoOCSeKwvtBIHUD13HAPTjgEg9NoGDkqeKcJjyrE98csOMcdD/tdMenQgYxWBwnxLC0Lrf91Tu17u1op376aLrvfRV8RGzeJrPRJp1JaWcU9PLtva25pJrWupkRa/raDbtONc1ReAf4sXA5H8PZcZwTzV6Hxb4pgcPF4r8TxEDbiLxJracc/MNl8MYJzwBx1AwK5ppM4yQPYE+vfJ7+xpjykIMcn646E8YBB4J5ywJHXjNaf2dhHp9Uw9lKKd6cevLd9tftbPa2xr9ZxDt+/qO2ydSWiur3u2n/w+256Xa/Ezx/B8tv4/8a2+3keV4w8Spg4B5CamueRnp/CCCQARuW3xq+LNtgW/xT+JMJGB+68d+K48fN1H/E3J+XJDegGQDgCvFftGBlQQCT8uc4HXlV5/M5HIwe88Nxub72Bg7hnC84OWByB6HknsOawllOXSu3gsK1/eo09eXkvpa3R+ttLX1PrWLXw4isvScu8Xok73dtNd++h7tJ8e/jg8ZSP4yfFYDBBVfiJ4vK428AD+1WAHAwCeucdiMiX4+fHe2fzW+NHxQVYyGSWbx74lcRspDB90uoOV24UqUIK9QTgCtr4XfBXxn8SbC+8SWi6T4X+H2iybfEfxR8cXqaB4B0NuC1sdXnjeTW9ZKD/RvD3h221bWrp8LDYkMWr0G5+Ifwc+D/lw/Bvw5b/E7x7Z4B+M3xT0KGTQNKvEBAufht8J71p9PgMDsHsfEXj3+1tTDIlxbaHpc5AT5/Fxyd1JYTBZVhsfiNpQp0KPsaeyvWrOLpw9FzVGlpCSuelQnj4xjXxGPq4elvFzq1FOeifuQUk2tN3onbmkmz1LwP4s/alHhrSviF8Vfjrr3ws+FN1LDcad4h+KF8+saz4xjUuSvw/8B39reeLPGLSKHS21e3trLw9by4afX7Zl3p53efF34fT6hqt3pN3rR0/7bdPYW2q6VBBq17EXAF5dRafmwge9+eUWqSsYTIF83egz8qeL/Fvi7x94gvfFfjnxLrfjDxLqDBrvXPEWoTanqEoUKIoYmuC62dtCAEt7O1jgtbePbFBFHCqqMSCTy9xBJUYJGFGDjO443c5+buOQfevp+CcRmPBmPxOZ4CGX0q2Lw31ephKOFjDDQpucJxlzQ5K1SrBpJTnNR1dqUb2PJz6GGzyhSweJniZ0qFVVo1XVbqzkoqGl+aEYNPaKbva0nY++LD4kfATxp4as/DXji++NPw81a0N2kPjTwNqFn4i8M3kM86ywSaz8PL3UNHl86ML5MtxpusNcGGNAA7YA5a+/Z0bxYZJPhH8YPhj8ZxIHdNE/4SKfwP49Zd2Vibwb8RpNDnvLo/KrQaDqWtAsp8lpOh+QVu2KqBuOMYwQOAM4HIPPGTgkHvxmke7zjzUVlHCq4Q4PHIO0kHuGGcYxjPXxMfk2Jx2bY3OKeNccZj8RVxNelWpU8RhnUrT9pO0ZRVaEeZu0FiIxilZRStfvw2ZUqOEw+AlQvQwtGNClKnOVKpyU4qMebll7NtcqblKm5N6t2ujqfHfgHxb8Nr9tO8e+BfEPgy9B/dweIvD93oxm5yr2s19DHb3cTggrLaSSRuMujFcVwiXa4VgAOSF2KhG0AY+ZRIoIIG1cj5eSTgke3eEf2hvi/wCBtPbRfD/jzV5/DMmBceDfFCWfjfwTcoODHc+EfFtvrOgmNhwdlkkgXlXU8jel+J3wO8acfE74A23h/UZSfM8Z/s++I7nwJeh2Hz3F78PvE0XifwNehciQ22jReFEY5VJYlZcClmOEaji8to4qCsnVwLp8+6TlKhWdNJJtvlp1as9rJ2TL5cPiY81HE1qMtpRr8zV9Ekpw5veXeUYpeZ89m/c7QJXwxGQSeOnAAB9sgDOORxgU9Ll3yfMYYIJLOckHA6t1YjAPy5O32zXv8HwQ+FfjZS3wl/aN8InUZiPs3gz466Ne/CDxLJI3As7fxKs/iT4bXsob5RPdeKdGjkK7ikWQo5fx7+zp8dPhXaLq3jn4YeKtL8OzDfb+L9NsovFHga8TG5ZbLxt4Xm1vwxcpIjB1KarkAkFVIJHRSzLKqk40nOGGrSdvY4qlLDVJNNX5KdWNNzX96KlHTd7mFTCYunByV6sFvKlUVWNnbSUoN6u8dG+ZaXVjzETuMMXJJwcbh6kdc55JByCQAOp4FNaUgNhsAMWByOR1B9FI6HaTyDgZJzlJdBl3xMssXKq8ZDpkAEn5SDuPHDKMZ5A4w/e8gOCp65GSBnGeDz6/jn5utetCnTk1JKHLdXce2l1dafJ6r0scTlUi9XJO6TUr3UfdUd/eUl1s/na97guJDlfNIyRn5jjBGR0I3Y/l64JqwJXJA37to5OT26Zw3I4AbLDOOnUVnYHXHTPXrnt1PHfGfr2NSKWIK5PUE9cfgeM44zgg+g5xVypwstEk0tLX968VrutE273V77t3J5ptK8nva15LR8q1u3drZXVnfVvlZeLLldzEkdFLYOcY6DrgDjJyDz04LN6kk7sYJAGSSBgZyMnPUZ5657hsNVGYgckrgHkngAZ4B244/wCA/QCpfsxEZdWLsGRREgLSzOzKqxxIqkvK7vtSNQXZztRS2MTNU4U3OTgoRXNKT91xVk273Svb7tX5mkOebUItycmtdLvRWt9ystH0XQ1dB0PXvE+taP4a8LaRqOveIvEGo2uj6Hoel28l3qOr6tfTJBZ2FlaxK8ktxczyLEqqCVJzkAMw+w/H3jjSP2YvA2v/ALPvwu1ew1b4ueLrQaV+0z8XtDu4ryDTbdJFkm/Z/wDhlrFsf+Rd024VV+JviewnI8Wa7byaBp88ug6W8+pWWZ/2PfCNxo0AFr+1n8QvD7wa/dK4F7+zP8OfENkQ3h23Ksf7P+OPjzSrktr0in7d8NfCd0mjq1v4q1vU49F+bPhb8APij8ab3U4vhz4Z+1aH4ZgF34w8ca9qNh4W+GvgPTTknVPHXxA8QT6f4a0CDAZo472+/tPUHBh0uyvrlo4X+LqYjD5tVeLxtSnRyLC1FLDxqSUY5jWg7xr1Iu3NhYSS9hGzVeaVVqUFTcvdjCrhKcaOHjKePrRSqSSv9WpzSTgn0qyV/aPeEW4t83OlwFrdeYAhKLGBweI1jVVAA6HhRnHAzwo4GK+pfhZ+zJ428f8AhsfErxLqvhz4PfBS3uDb3vxl+KlzcaL4UuZYRmfT/BOlW9vc+J/iXr6hWEWheCNJ1WVZiov7jTrcm4WW2139mn9n07fC9jp37Wfxgs9q/wDCX+J9O1TRv2aPBuox53N4V8FXn9m+K/jJeWcvNvq/jJPDvg6Z4xIPCut2rCV/HviR8ZPiT8ZtcHin4neLtU8Xa1BbJY6b9tMNvpPh/TEyIdH8K+HtPittD8LaHbBdlpo2gWGn2EKABYCRvrsrYvN81tTy2DwGDsoyx2Lp2ryp8qX+y4WaTjzK6VTERjytXjRnG1uRYbBYVueLmsRXbt9XpTvT5nytKtVV4vvy00209Zpo+nLr49fCT4DRtpv7KPhK51jxtDG8N1+098ZtG0q98cJK6hZLj4QfDGSTVvCnwpt8Mxste1aXxV48jUJcwarok4NvH8S+I9a13xdrWpeJfFOuav4k8R6zdzXur69r+pXmsa1qd5Od013qGq38s99dTOxLF5pSRyoAGAtYiRshixY5K8EjJJzk49CGz7k8jioDBOcuw2KActJkKVHBLbsBSD2JBI5OOg6sBk2Ey9uvOTrYmppVxmJmqmIqNNXTk17sLt+5TjCnC9oQS1IrYyriYxgrU6UfgoUtKcE7WSjHd2suaTcmrNtvQzTHtY/vMD7wBPc89Mcgkf3effGKYJGRvvnI4zk4JznjOSR1xkdBkcmta00+41m4S00i3uNYvpCEistItbjVbyRjwqJbWMVxNISeQixkk5wM4FfQXhf9if8Aa18a2qajon7PnxNttGlG4a/4r0E+AfDiIQpE0viDx3N4c0qOHDczPeKgB3btua6K+ZZfhoxliMZhcOr2bqVIQu7RaaUmr3s7JX7eqpYPE1mlSw9abVlpTm9+XrZt3ur/APD2+cbe43KP4mGd3rgenQnjs3U889avKdxyoLZ67VI6HnIGAMcn7pPAJ4wR9WL+xreeGip+LP7Sv7KXwn2DNzp1x8WYPij4mhAVXMf/AAj3wY07x9IboLgGGe7t8sQjOpVjW5YeB/2EvB4DeK/2h/jv8Xr5AM6X8G/gppPgbRZ3GQY08V/FXxQl8sJK/JP/AMIgzbQGEBJIrzanEOAaf1eGLx1/heEwmJq05aWSVeNP2CTu1d1Ela+iVzqWXYlWdWeHoJJJqtiKUJJWje9Jy9p125W3bTofIEcDMNxBOBuO8YCcYGehHUKckDkj63I1tVKo8sImblUR/MkxkYVUQNISBgqNu4+meB9pR/HL9jTwiwHgX9i7UvG13GAsesftB/HnxL4hWWRQQs03hb4Z6T4D0ognBa3bULiNQCpYglqnb/goD8XfD6ND8IvAf7OfwEtVV1ik+FXwJ8Err8CHOCnjDxvY+MfFAmQfduI9UikDDfkMd1efPMc5xNlg8jq0leylmGLoUINNRvb6q8XLd3tKKfpbXb6tl9OKdfMVN2TUcLRqVGtVdXq+xhpe6cZPTXXW/hvgL9m79oH4qun/AArX4JfFnxpE+Cl9oHgXxBcaWinrJJrEunw6ZDEBuJkmu40UDczAA49mP7Bvxn0NEuviv40/Z6+A1sCDKvxd+PHw+sNcgU55k8H+FNT8WeL3dcEG2j0Rpyx2mLcNteG/EX9p/wDaF+LDuPiV8cvix43gYjNjrnjvxHJpKKQP3cWiW19baNBEB92KCyjiUDaE2/LXhJngUswhi8wncXCgylu7F3DSMxzgkk5BySSa0WF4jrpe2xWAwcHyrkoYWriKsVeNuWvVq049d5Yb5MyniMqpv93QxGIa0UqtWFKMtt6cIylZ31SqrrdxR90J8GP2QfCGX8eftryeNLpFZZNH/Z5+BXjPxOryKMmGLxV8S7z4baRgkFVnSzuIvmB2MpqWD4kfsOeDmRfDnwF+OnxeuoOl98XvjPo/gLRbplwFkk8LfCzw5LqiQsQxNv8A8JhvIOwzhhuHwe1/I3BxgkkkNwcYOCQMYPOR04HT5qhNw2AeevBxj5ecAEHnr0xnGM881a4cddP69mmaYrROyrLBwu7N2eChhpW10vKXmSs0dN/7PgsHRWi5lB1n0v8A7xOrG99G4rfboj9GoP275vCmP+FQfs0fsnfCiWMBbbVl+FEvxX8Tw4GEl/t/4za545/0heCJ4NOt/mBKhRkHjvGX7ff7Xfji0k0vWv2hviXY6LKCraB4N1iP4b+HliY7fJTRvh7beF9PWEDCrGYCu0BeB8o+FTdMcENjaOCe3sMntyc4689cU77S53Ev3yRx3HXqCSOSeR1Jq6fCeR05xnHAUatRJWq4lPE1U7qz9rXdSpd9G5PW2pUs3zCUeR4qrGGicKf7uFtEvchyRS1d7R1v1PQNT8RXer3kuoave3es30rM0t9q97eaveyOTy0l3qNxc3DOTg5aViSAST1Fb+15iAvnARYGAp4QAcZHOSANvQqO5OOeFN0dw+Y/KvA3Ennnnd36DHGOuKZ9sYn5QMfxHpyOcYBHY8Y4498V7EMtjSglTp0qaWyhCMUkuXoktNNLtt7K19eF4pz1nKrLe7bbXR2SvbWzaTe19EjsG1IMWBkDcZK/KCWIA6Z45A4BHzAgEYquuqsp+8B8uTkk+4Iz94dASAQee9coLjGdz/Mx7AbQMYwcHg44z97jGc1A84yBuZeuS3GANuR64OcH0PXoK2jg22k5Lla30urJafO2lvwdjnnXVtF711ppsrXb11bS+G2r+TXXPrD/APPTKsMHI4B7cA4PGcZ+vOKryanISQsqFTwASpPPHPPTPQYOcnBrlHlynLE9sKcDnJxk8nqck46DAGeI3YgjnkHOAegJyCCCfUYGAGOeBjNdMMDSS3TWujXZRd9bO7vrpq7PbUwVSUmpXdlfRtW5fdvbstXbVpWutzpJLx2Bw5JyOOdvvuPTnk846eg4ga6kYgFs7hkZOCBu/MkAgZxgk9CCMYvnbjhgRtAXPfj0Gc8cnGOPQ5NWI9pcMjM+GHJzzyOmADtHcY4BPTIwSoU7fDZx5Xonq3a+7dnp301eh1KvCNk3dPukuXbpa/3rbrZM+z/2FrKG9/ap+EGs3u1tN8AaprnxV1TzTlY7L4X+FNa8cNJIMYCpc6LasM/KJGjIKnFfM13q81/eXWqXDu13ql9farcySNl5LnUrqS9mLkfMWeSeRmLFixOCBjNfQn7L0r+HdB/aj+IoJik8H/s1eKdBsLgnmDWfixr/AId+HlsImVSFmbTdT1lVAKsVWQJkAivk6S4BESgn5I1UksAeAvPJPdvRQOuBnNfPYPD+3zzNKy1hQoYLBx6JVEp4idr6Xca8G9NbaqyPSr1I08vwlNXUqlSrXbW3LJ06cdEujhNq72aW7OnOrSr952JGCuedp2jBO445HXuTwfm6/SvwX/akHhDwve/BD40+FJfjR+zL4l1JtR1b4ezXqWPir4ea9OvlSfEb4F+LJ4biXwL44tIyZrqxWOXwp4xt420vxZo97BMs9v8AH4nDHs2cY4GCfXr9RyTlsjnqULMz9SOPmAGAOh4JPXjjA46jPb0sblOGx1H2NeK0alTqJuNWjUi041KVSDU4Tg9Yzi16u9jgo46eHqOcJSTaUZK14Sg3G6lFvlafVPT00Pq344/s5T/DnQ9N+LPwu8WJ8ZP2bvF961l4U+LOmWD2V7oerOgmPw/+LfhtZJpvh78SdPj3JcaZfSSaVrsUb6p4X1LVdPZ3g+XJHdQy5wRgEgEseV64PIwRyDjheSDXtnwI+P8A44+Aev6ne+G49H8QeD/FlkuifE34XeMbRtX+HfxQ8MeYrS6F4u0TMau8bEzaRrti1rr/AIdvxDqOiajY3MeW9w+KH7PngP4h+Cta/aD/AGRX1jWvh7osX9o/Fr4Gazc/2v8AFr9naWVsTXs6xxR3Pj/4OvOXXR/iNp9q1zo8A+x+NrTTbuM3155WGx2JymvTwObv2mGm1DCZryqMZPTlpYyyUaVdt2jUtGlUdklCbUJddWhTxtJ18HyxmrOrhb6xSUeaVK7vOGrvBNuMd21eT+Gy7AKS2MjnJyQc8cd+2Rz17ioGlY5zICMcc9MZB47cgjoCcdwBSzAgo3ysroJI9rBwyNwCpThumSMfKx9SCaMhOc5I3Zzj8OR7/jX1lNwnZxblFq99GrO1npv2+e19vH5WptSupJ69L33vd36rXZpva+tosQSDLnIIOTuGDwBnp6e3QYB6MMpIwFBbnJyOuTw3IOPfk9MZBzVUvnnGc9BluvOcknPOcYOcnr04QybQTgjtjnr2xknP68D89FGTtZrTl1fW3L+tu3w2V9xaaXTlqtJXet43100v5q72a6ztIWIB4zkgggYIJx3JB+nGenPRd7NknjaABuCndknDDscjGeh65OTxVNyRj5OM4PzDn36fpjqDzjrIkwbkrwMng54H4Dvtzjpg+oq3CokrNaNO6ta7a013a2Xle9ulN6Xvts/mn023suvVXJ9xwuMKATwBj9Acc59+h454dufLHf15GCR6EZAPUH34wPrVYvzhWySOOOvPGeMjr9O/HOELPnOMnA47sOecAAcdRjHtyDSjCf2nFxbS2Tvqn5W01u+9rO5nzyf2rK+yauldaX8tOt1bXQtF2JDFznnHJ4yeAOeCCeOfoOgIJGI+ZyeOCzHj1IGemMfMc89eeapl25BQK397JIwQM9ivQdfpnnApdz4GNp6HOTwdpwOFXjsenfHbNKmt2lp0aT0WnTyv+HqJO6d5O6fTorrey6J+u17vV2zI4bIYBiOSWY5JHOMEnvjGSOnQgUxpnxjzunGAeV79znOBjHHBz0HFbzHy3AJwPlDED8DgH6nOOfwppL8sOS2AR655O457HHOAcDOOcB+zg04zjF7OzilbbXbVNddNu+g1e3xu/urR2e6vrfvrdK3S1iwNsoxIscgJztdEbGTyMsM57ZOBjgjPS9avDCdyWtupXo6woGVs5Uhk2kYYK3bJUDkcVlhnznOARjk5I9OMY6k569Rj3d57AgFiASAX29CxCjhQc4PB288HjnFQ8PRa1p0pJNKzhF2a5b7xd29Utb91qaxlUTdqk76LSUk9Uuz36adt3ufZ3ww8Sy+IPBniMR2Elvb/AAs8GnxR4q1V7hRax6DHrOkaBa3KtI8szajqGs61Y6da2UQmknd/NhUCOdk8qvv2hfHnhvWl1H4R+NfF3gZzZm1v9X0DVLvRLzWIpHWYWtzFauDNp9vIm6KC6EiyyMZJIg7Zbs7eT/hBv2NtYv32x61+0f8AGKz8O2ZZF86X4afAqwXV9YlQ8D7FqfxC8U6LCWQKskvhpo2y8Z2/JIwDgDGc847Y56EnjJ5PboAea6VxPmGeYDGZXiqeFeWUqscHTj7JOVajhoUlJVG24yUa0ZxsoJ+51bbMnk+Fy7E0sXQnUWKnTdapabapzqN/DpzPmg1Ld/FK3c+nx+178cL8AeLrv4bfEdG2mU/Ez4L/AAo8Z3c+CciXV9S8ILrZYj70g1ISnGd5wKtxftBeBdSOfFn7KP7OmrtJzNceGbX4m/Da8bKnLQp4P+IFrpED4wRs0cxBiT5QAKn5XLFSCo3dyoBxgA5A5HsR0GSeM5JUueMKS4U8EYHqc88YA5I6jnGK+cnkGWSVqdCWHu07YSc8M7+7q/YSg93o779NFbujmWLur1FVvZfvoRqv7Ld+dO63Sb8z6yXx9+yhrEeNV/Z++KPhSVjzceAfj3Fe2sOdozFpvjzwFrkjbcDakuq54AMn8Rgk079jrVmP2Tx/+0f4FkZcquvfDv4e+PrWNjgYkutA8ZeE7t14O+RdM3uMERbiuPlIu2eV6AnIUDnpyC54O3GPm79urST83GcAAEY5zgnuMD8cg+2cZwyKNO/1fMMxo3fXEyrpbLT6z7X8FZebTY3mE5/xMPhZr/r2qe/K9fZuF+nl91z6bf4P/BXViT4a/a7+HKFnHl2nxC+HfxS8DXJI4AmnstD8X6VC2V6/2i8akli5XkxL+y7411HcfCPjz4C+P0IPljwr8bPA9veSgY2hNL8VX3hrUw7DkRtah/mwUzkL81K/VSPqDgqBggcHtjjOPoQDimMkUmN0ML7QfvIh5wMcgZHUgEEEHd2210RwGZ09KWbTqJWt9Zw9Gpb4d/Yqi3tffzloR9Ywslapg4xad17KrJJrR6Kbml10je923fU+hNS/Zh/aF0SFrm5+C/j27tIwS19oGjjxVYlQBmRb3wzNq0Ei7eVZZCpG7aCDXjmsaH4h8PzNba74d13QZlJDw61o2paTIpz8wZb20h2nJ+YH5id2RgcZ2n6rqujzJPo+q6ppEyNuE2lanf6dIp6hlks7iB1C9sEA5we4r1/Sf2k/2gdCgW2sPjN8RmskRYxp+p+Jb/xBpxjA27H07xBJqdk6EdUkgK57ckGuXOobzwOJfS/tKDeq6r23ntZamill0kkliKV2usaiv7qu/wCHZPqzxIypMVAaFgDkMskbNnJ5BTJBXIOQdxOc4wMeseDfjT8Xfh+gh8GfErxpoNnn59MttdvbvRp0+YmOfRNQa80i5jYAAxT2UiFRgqQeOtP7S3j/AFNFTxN4d+EHjMA5kfxR8G/AMl3MB97fqWjaNo+oFmzy/wBqD5BIYEZpq/Fn4cX5A8R/s1fC+6MhZpLnwh4h+IHgi7BKgExR2/iTVNLibnK404oHyGTHy1z1frFRcmMySliEtb0KlGbWi/5+qjv6aalOVKny+wx0qbvpGpCcb25W/gUlZau1tlvujYl/aEHiZcfE74SfCL4hvONs+qweFR8OPFT5J3Odc+HMvhy2muOpEt/pV8C3zNvIJqhLH+zN4myI0+LXwiu2DNlm0b4p+Go5DtBJ2J4S8RQ26HLZ26jOVCr87MWOZLrn7N+pbhJ8OPjB4SkcrtfRPiN4Z8UWsQJGSLXX/CGm3EiDJCq+pAkDBYMdxq/8I98Bb/8A5BvxX8e+HJSVKw+MPhfb38EXIHz6j4T8U30xAJYb49MJ28iM42jz1QwtOzpUM1y96q1OMqtNWcd4U3XpJLVawd/vNHOrK/NUweK1S97lg9XG2slTm730tp3vqaJ+AU2usD8N/it8J/iJ5vzRaYviJvAviZvm4VtA8eQaArTH7pjtL+9BZQFZhgngPFXwl+J/gYA+MPAPizw/A2XivL7RbpdLmUAMZbfVoI5dNuIyCCJILuVCCCGwRjr3+FXhLUtp0f48/BvUnbGyDXJ/GPg66yMHDHxH4TtrOJy3GBqDKPvGYgA16J4U8C/tH+Foz/wrPx1Z6laFgBZ+AfjN4P1qwmzjbG2gT+Jdt2rblXyp9MYN0ZSdwHRHMK1FxisfhqiW0cZRnhZv4bJzaguZ+VJbbJaEfVaVTT2FSEpJJuhNVY/Z0StK+r/mtZ6bM+ThGOCHBUEj5WQjLdMbWPcgYxkDGfUyYKjlSDnIB5OAQSB1GM8fkTzk19l603xujUSfFf8AZe0zxrbAMZdYk+G2p+GdakBJ3yjxT8NTYQXEpByJ7uC9Usd7h8gHy2+sfgPqcrxajp/xd+D2psTuivbWw+IPh+BuchY71PB3iSCFO4ZdUnC/L+8fJrqp52237ahz07fxcNUhXg1peyUo1Fa+vuWettLkzy+T0p1Pe6QqwlCTWi3a5bK9rXSfkfPx5APIwc+vHr6H1+nrxkILYz07jjqBjjpznPU46HnmvfU+B8etRK/gH4o/DXxruBaPTZtauPBXiGTAAER0vxrbaRbvMcE+Va6nchW4Rio54bxP8KfiF4MUSeJ/BniPRbU526jcaZPPpcoUKd0Or2a3GmTxkDiSG6dGHRmXBrtoZpgK0lGGIjGSdvZ1V7Od+3JO0r3be1k7/PnngsVSXNKnLk15ZJc0Xqtbx5lbZ+v4eeAAjoQBnHXI4/P1554J55xStlfTaOO554H6cZ7+vOKNyNgxSI4AzlGUg4OOcnJ3ckcccemKidwhJfsMgEjnkAfqfu98cn071acYyjqm1a2zuorTdPWxyyTT5Xo1q466bJ3v6rr+QEHO7cM98E9OmcDH8jx060gDdc8k575HoR0J7nIzgE/WrE9rcW/lm7t5oBOqvCZo2iEkbbQGQuFDKeilWIyy4ckjDDFg/uzkYOckZ44G0DOOPdfTPHNSg4NRnFxm1omktGk1dSXzuu9lshQcWrwmpJO109L6aXu7+enTW2wwKcgAg9Md/wAuDwD1/lyAQkjIAycckt34yeD2IO0DBIIBFICQOenP4njg56D6UHjPJUnrj7uMng+3TkDGR16VUVotNbJL8N9PL5dy4ytJdUmtbNaOyu+60svO/W49Sck7cA5/DI5HUemc59Bhs04Ac46n6DH6A/XJyeKT1JJ74BAOOM9/cEZ6jPykcGlyDnHY4/Ef05rOylyp6pJNWto1a90/P5dkyLWvbTva71917vptZrTomKDj5gBuA4yOMjOBjjjPqckD72cGnhs84w+Cem4DBzj0AGcYyMjOAT0jHX6eucfr1744xxjsKRTwxOep654IxnHP1ODnBJGOhqtW46LpdJa7LdLtv2016F80pRSlqlbXW+trJ230Ssune9i0BwcFgASTgk4PfjOF6fNyOeRyOHqMlQGKkkEnIx1xyCfUg9exOASMxg84zk+vt07KPl9D/Fz1NPRtpAIBIIP+6OvUke5HTJx1HQUYO7aV7283sr7aPbp59rwlZ81nfzva3u+eq0SsrW3T1ZRhjlmlSKJHlmc4WKNS8jHH90KSSMHOBgevHG0lhY2TiTWbphIDn+zdNMct0yHGBLdBja2uSQzA+dKvRosfdpNfSCIwW6JZ27AB47ckO69f390xM0oLDlS+zdyqDpVLaTjJAx0wMjqOuCDzgHsB9esPnnvL2abs0tG1ppdWa3bVtFpcuK5VeVnJJau9ntdpb6r1WuhuS67OsLW2lQx6PaOCri0Ja9mTjIutRY/aH3DG9EMceQCsanisEBRuDM2SSSVZckk5yWJy7Z5OD8xAYjJbDwOCBwBwM55z7Etnr06k8U04Iz6e3Xgc4PA564/rTjSpq7SWr1a953VrO+luztr1C8paNvl6bPR2aei00879Wrajz6kk7ckDAHYE4xk4PGAPbIzThzj+X9KaFx3z+n4fT0HbtTvXn/P8/wCdJtLRJJKzsr63tffo7X1VtPk4t+HVfLyX42/zTBwehJHJIB7g4wMDtjuenPAo/h44ODx6H0/P2FH+Pp/n8+/5UH9PUdf5frRdvs7+i1081bZL021BN7f8P0+fRW1GSHbzj0JzkDPGMAE5Hvj09aEcnJyCFGcfl6kHpjpz1yc0jqSCSAT8vTgZOQe3TPzEKB26HimLuj44+ZQx9wN2Dgc4GDk45wD351i736aadb7XXqr+XlqaxtK2u+j1tf4PO19Wtld2S6smBAZiDtPB69eoOAR05GTnOfenhm5wQPlwMH0J7dR1HTqQTnNRZQlixXOcYGAWI6gnsehHbnnsC8Bc/KcnJyQc9egJ4z0/AEHGaLJt6N3jF62a+z67aJK6SduqaGoL3feevfZfDa+q26vVK63trMCxDEtkjIz9ACAMnG0HP07/ADZzKJXUnDjryFyRx6hs44PQZGDhgByK4J28sSeVzgkHJC8nHqDwOh4zmlZhtIDDB3MRgcr2Jx1zzn0yc55p7bJXa9N7Py8r3266kWabTct2lZN31Vnr0fSyu77lkXUiq6gjDrtZiFOd2OByfoVPy4+gx23gv4neO/AFxM3hXXpbWxugwvtAvoYtW8L6qhBDRat4e1FLjTLuOQMoZjCJQOUlQgMPP9xyV6rkjg5wTg84yR3HJOSMdgCbjnALZGeSM5wec/Nnv3545HFctfC0MQnGtThNNWvKKdvhTs7X5ru99tV021p4irTcXFyWqV1KXWKVn0Wm3RPRdn9CjXvgZ8R8J4n8O3vwX8VTA+b4p8Fwza34Bvbl2y02p+DblhqejxMQd39iX1xFH0jscbBWH4n+BPjfw/pb+J9FXTfiF4KCtJ/wmngG7XX9KtoCxCHWrOFRq3h2YjO+HWbK18pg6+YxFeNAn0Ixg5yuckYJHJx/dzkkgHtXTeFPGHijwNq8Gu+Edf1fw3qsGCt7o99PZyyEHIjnSIiG7gc43291FNBICVkiYEg+V/Z+Kwrc8Dirxeqw1d+0pu9vdjP+JTaW2s4r+V2sul4ujW0xFJJ6WqU1GMt1ulaL0u+mu/W/MAttZgwZVOMqy45yBlQMj0AIxz6AmkLMQCpXoeBz3PXpn8Dzng9MfRp+J3w++IOIPjD4EisdZnlYv8TfhbbWGgeIGkfcTceIvBbLF4U8SkZ8yeWwj8P6pOQ4N67kE0NR+AOu6nYXXiD4Ta3pHxj8NwK1xcL4SSaHxno1soLFvEPgG/K+ILQxYbz7jTItX01SrNHfMozV083hTm6WY0J4OomlGc1z0Jt2Vo1l7qbbvafK93YJYOUk54aoqsN7Jcs1srODd3Za6aaO+u3z/wCYQwztBGMZHIzwDycjB5yMYHTpipS7HAJByBggc9yO/TtkjgcfLjiSSFopZYWVlkgZ1mikiaGeJ1YB4poXRZIpEOVZJI1ZTwdp4MRIx6gAZC8kcc4AHQ+vfaB1yK9eM6VSMalO001o00/5VpZ3vr91k209eOUJQspKSlF2d91e1mr7WdrXVnt3bceuCeRgnknIP+yTkd+OOuTyDgUlcjgg56jJH03bvbpjpTC3pg+vbgdOvpwMepGOAacCD0Oc/wCf04/Spt3stPyt803+PzM7u+uiuk+u1r+fTb8yTc2M+vfvn37D8v8AGvbf2aLo2n7QvwZnyFLfEPQLYkDAIvppLFucjgrOV+8AcjJ5yfD+AP5dOOcfhx16H8K9U+BU32T41fB+7L8QfFHwKz5xjafENgrZA52kMc4BxzjpiuPMYc+X4yLaSeHqqz0+w7rbrs/vfQ68I39Zove1WFt7xjeOt778t7p38m2lbzO/Dw319EMJ5Wo38OzqB5V3Om3HPAI5xySR93HNUsxxtPIzjkdATk5J9McYOc8HsOg8a2RsvF/iyywFNn4v8T2pxgFfs2uX0SgA4AwFIxwQQQc8CucAAGNzfKTzljyGHpjpgE4KgdzXRhFH6rhmra0oST6X5I3bt02vp+ts60Uq1Rc2sZST+T3fvaLZWfRb9SUu+cls9BkDr1OME5Ht7HkEDiMu2V5UYPPAHJ98jkZ6E5HAwDgVIAcjGDnoT05HGM8E9e/XpkcVGygsTgAlsAAsM5ByflDdCBjj174zvG17NJbq1rfy28+raW33Izi0utmr97dLN7a6PRJWXa1idX3Ko74AAOOhPTHoAc8kHJAPpThg/Ko3EkgDBbnp0PAHP3unpmtXwx4V8S+M9csPDHhDw/q/ijxDqT+XY6LoVjNqWoz8Lvf7PbQu0UEYybm5n8u3gjy8ssSKzV9Et8N/hN8HgX+NHiL/AIT/AMdwHK/Bj4W65aS2GmXSk4t/iX8U7U3mlaYyPhbvw/4LTXNXbEkM+q6RKpI87F5nhsNL2Scq+Jk7woUPenLVJcyUkoRT05pyUV/MrnVTwtWtFyXu0003Um1GMdrdbyabask27XXl4x4C+F/jz4o6pcaT4F8O3WuTWULXWrXwktrDQPD9koLSah4k8RalLaaLoOnwKGeW51C+t02Kwi3vtQ+qtp3wI+DzI2s3Nn+0Z8RLdwDomgXmoaP8C/Dt4h2hdY8QQ/Y/EnxKltnQGWz0CPRPDlztMZ1jUoS4fj/iD8cvGfjnSYfCUC6V4J+HFnN52m/DHwJbTaF4NtWQnZc6lAJptR8U6qoLI+t+Kr/V9ScgkTxqwQeLYICjBK9MA/dHAwFB+XgDjghf+BY4oYbMMwtPG1Vg8O27YTDyftJxev7+smnqrrkpcq7zlc09rh8NpSh7appetU1SlaL/AHcLuKato53drpKLuepfEX4zfEL4q3mnyeMNaSXTdFia18MeE9FsrXw/4H8I6ecbbDwp4R0pLfR9It1TKtPHbvqFzgPe3tzJhz535zMcvndz8xPBJ2jJAPPcjJ46nkCqeGBBwc/n+dPGTnI57jHAz/j689SeBnPrYfC4bC0406FGnTgvsxjGO3Km35t6tt3et73ucVSrUrT5pzc20rOTbata3ktrK+lmlu0TvJuwcnPTqf4e2B+fHoRTdxBAV9vXPAOff1/DGM9c0w4zjrnHpwevb8Oueo6HopweOOoIPTB7YJP885roslbRdHbd3dtFfT722r3SEloneWyfdLbZflvbfoh3mvxl8njgDjrwOMHPvyePqQ7zf7xzk/NwBn0xhunI9wMEknpCVzgjgj/P5g8+561CSx644OMgewJ7nPPoQCMHA4oST2ikt9Irpy77Wd9nd3T9Coxvbdat2el2raW9UrJO6T3ZdVkyBkkqo2t85PbaBxg9x17n6B25WbPLHOF6hjk9cH0A75Pp2zXQ5A4HJIx6c8EdRnoRnpnNTIGVgdudoIxhjgkHjIBJ5z68cnB6JxU780Lu10+l9O/Rrtr0tuSpON2+ZX6LZ2S1a6Xta7XVW8nMAyhSkbgZIDIpzkknJxkjk7QTwScHBwPS/h18Zfi38JLprr4Y/Ejxr4FkkU/aLfw9r+o2mlXiknMd/oxll0bUYWHDwX9jcQupKyKwOD5xsbBAQnrtOTkHjj7vPAyCN2e3fDgG2gFcKTgszBccjIyxU7cD06Zx2zyYjD4avT9niKNCrTk/ejVjCStZXupX6d7Pr5GtKpVhKLpynB3VpQk1y83La/K029r7PTTqfTN3+0lonjx2Px3+Afwu+I1zPgT+NfAtivwO+JinPzXL6t4AtLbwfq12SfMeTxD4I1I3DD/SJGJZqZB8O/2bPHzM3w6+N2tfCrWZMtH4Q/aI8PO+keY3ItrH4rfDy01LT35BjSbXvBmg2+GVprmMbivzIHt2by/Ph3t92OOQSyE4BGEj3sTz/CDzxjIr0Dwv8Kfib41lhg8G/DT4g+LJZyqonhzwN4m1jeWGAFay0ydCCC3OSSCRgnNeHUwGXYP38HmdXLGrNRhXjLDJRto8PX9pShF21dOMJN681z0oV8RWtGrhY4lWVr0rVX8OvtIKM5PV3cuZJ662PS/E37Lnxy8K6S/iR/BEvi/wisbSjxp8MNW0j4neEfIIAE82r+C73WE05D1ZNWjsZo+BJHE4YHwIqoeSEkpKr7JInAjljYNlo3jKgqVIO5duVPUAtkfb/wAPf2O/25PCt9beIvDHwz+JHwkul2yL4h1/xTovwbjijO1lklu/FPijww3lgHcwkjZSCQ6bRX1RdeG/E1xoGp2X7WPxI/YU8WSxaLqQ0641H4neHdU+N8eoxQE2kMHiz4G6NrWqanqEr+WtrD4qvb3T5Lh1/tG4SEMa8mpxPUw1WnQeKy7N1KpCC+pTcMUoylCLccMvbxqWervWpJpNqPQ7Y5RRrQc3TxGCcY8ydeKlSuop2dW8HG9mleEklbV6H5UaL4V8Q63byXumaHqWoWdspM9xa2jywhU2liZNiqemMKSScgKeM/dnwL+FHjHwPqXhu+8HeANW+Jv7Vniixj1j4O/DDTdFTXIfhDpFxD51p8bviXaTx/2Xp3iGO0xqXw58P+I5bHT9CRYfiL4wlsdNt/D1nql7RZlsLW1tdNQ2mmwJFbRqxCzW9qI1EbK6PGzqpZZBLIhkkbLE4OF+ydH+K2r6x8OpPhB461b4M+APCGsLa61p3hf4k+O/iP8As3J8eIrn7c8+q+MviB4K8O3X/Cy7HSxHY6bb2niXxVpWl2sdpbRxtL9nthb/AKD4r8J1Mg4QynNssxU8c8ZXp0c0wdZ06DUatBVacqK9onVpRknHEUVVpc8GuetTp89/nuEM0p5jnWLweKpxw0aVKc8JWhzTV6c4xtOVpKE5Rd4TUJ2d+WEp8rPz48R+CvgR8DNWv9b+Pnjdv2lfjLe3l1qusfCv4YeL5ZfAVj4ju5Xub6T4u/H21aaXxVqTXkjSazoXwpS/NzM0sT/EG0lLoOO8VeNv2lP2qoNI8G+G/APirU/AGhzO3g34KfA74d67Y/Crwm8mds2n+F/Dtnc22q6ywIF14q8UXeteLNRYNNqetXDnI/QW9+F/7bWnWDy/s1fsu/siNo8e5rbxB+zrbfBj9oHxU0AjCpJb67438Y/ELxg0m1RIstvpVlOznAgVzsX4i+L/AMTP2+NFaXQvjp4y/aj8GWcYaKTQPEkHjf4deHo49uBFHpOk2Gh6F9nCqgUQwGAqpEYCjcfxfKcVPEzpz9rlFfF0klCWMzGFSphLJJRpZbhabw9DkXuJxxHtJL3ZVpvV/aY2lSoKUP8Aa4Unbn9hh3CNVaXc8RVmqk7v3nemop6xgtTGT9gH9qO1tVvvGngvwt8HdNK+Y1/8bviZ8OfhYkUSjdvbTPE/iO01shRuykGlSTDkeUzLipLf9nP4H+FSrfFL9tz4KWdxFkT6H8G/CfxG+N2tblzmKLUNO0Lw34PkmO0BWPifyGJXMgXLV8s3txb6hK93cXCaldSZL3V7dy3947E8vLcXjyXDM3O4Fi3IBJwCOeuJQhKptAJOChyAcdQQe3qMDvkHFfY08LnWIjavncKSdmo5dhaVFqyV1z4meNulbdWaaaWr08OpXwNOV4ZfKb2/2mtOSv7uvLSjQ1fm7WdtGkfckV9/wT+8KAmHT/2svjjdRDrc3Xwz+Avh+eQfxFbdfin4jW2J5PNrOYwBlGxiOb9pX4Q+Gwo+Gf7FnwC0aaFgYNa+LGrfEn47a6pUEJPPa+I/FGkeCJXGQWVvB727sP8AU7P3dfB32yWNuJH57E+uGwcEAnOTgHOARjrUq3jNyWJODkZOORwdueoPrxnP43DhvB1JqeKxWZYyfX2uOxCpydo/FQo1KdCz+0vYuL2toKObVoLlo0cLh4uy92hSckly7VJwlUVr3upXs3qfbGoft+ftWR20mneE/idZ/CnSZEaJNI+CHgD4f/BmyWFwFMKTeAvDWh6myKqhQZtRll2jiRjkj5b8YfEPxx4+u5r/AMeeOPGfjW9mffJd+MPFuv8AiKZnJ4JbV9QvPmY8txgDg9ABxEk2VViwzkkHJHXOTndnB/rjqeIml6A8sDjcM5znkDJwfoO34GvWwuQ5ZhNcPgcNRbUHzU6FNTlazfNJR5m7b3er30aOevmOKrxtPE157K0pt8uqasrtWXklbyVkW1mSEeXA0USNy6RJHGuOSuRjg57DOAOtMa6cEgldzHO7KvxkNktk5zlsj6epAqgp1JGTkDvz0x35PAJHByNvbbG20dAo6gcZHsQMn/dHrznvXpewgvdilBN/y2bva92kuqd319bI4Jy1vJybWu8pO8ba72/pWelnofamIXL4wwPHAJHQkg9ucnOevJ4NAuMkAjrgHGRk8/3TuPHTBzyR0JJyWaQEbSenPBx1JxuyDk5wScD14pVaT7pGdxHTJxyO2AMk85BP6DNU6Ch8Mrap9HZtR7vbpda6bpvSJ1JSSba0SV1ZNJct7q7Tut1tortNGkbks7ADaCcKcDJwBwSWOM9wB1GB3pvngkjlSpOMbQMAHJ455zuHTb374oFu2TwCCQDx35HPHcduKMtndu545AXpk5x69fc9xnpVqnqm+VaK11e/w979Oj3/ACE49U7aX178r3em9t7vyaRdM46b2AB5yRhc5xk4J52njgEjI9KaZeAA+4Hk4IyM9eeM45zg4PpiqhkbaQo5AJyAAM45G4Y7DHbOcZ5pCzdemMnt824k4ByOvJOR3471ooRbXupNNXdk9bLf1b6LrbV6tqyskv8AhlZ7XT66ve9vIttKSpAYBRx8pGevXjPAOOm4dQc5ApnnAEHzOQME7jnucNgc/dyd3THtgVwFGcEn8c9+OBj8eMn6Uh25x26Z9Tn25PoRknPbjNCpw001abvomntt/XzVrtybSaUnbe3VWjo7re3W+rs3dak4mj7k56Dj0J98Y69h1zkjkKJxwC21VPOFHGc5PJ5555z0H4wDBwORgA9+47E8454/DHAobb3A5x2z+Pbp9R7HNTyw/kurrXRvpbppstPN23M73aXvdOuuq7W/4Lv5jvNYsRksDk5wp6DHU4HfOCMkEjAFR5Y5GCMngtgcYBHAJwc8cAc9OuacSAMg4HY9Mc+nr/8AX55pu9eDu475BH48gY/zgc04tbqOzSsk7rRb6JK3ayte+nUSl0110STeqtutk/Va63voxBIwyoPOcgnay9wM9QM5PB4A4HfAZXwTkYHGBgcfMccHPQg+xyowMUhKEDcQSMk53HA6nOOpHHX04xS5jBx/eGTye2cdffOACOxPHFWlF622vfS60t9rorbNr82i42t8LXn0vo+/XR/h6OXb82GBPX8OPz45znvnvzZikZSoDA5IGcE4JY/jx2B6ZBHTJpqoLZwO4+uMHHfOODkduM9QZoyoY4ViVIOAOuBnjucYPX65wOZkkk3urJ3a6K3Va69LWTWu4Ri5NJS918rTtfe3R3e77vbax9k+DAug/sX/AB114gLc/EP4z/B34bWrkhTNYeE9L8S+PdWiXAG9VuX0Z5h0V0hLp84NfHzEKSM85wcHpgZOcAcHrj36YIr6n8c3f9g/sl/s8+FwSkvjT4ifGX4p30WWHnQWdzofw60WZkIwy/8AEi1dYyWdQd5QK2QPlOTk89DyQR3KgHB9/oOMV89kEeaOY4lpXxWZYhp2XM1Q5cKkmulqKa6X8rnpZnPkeFptpeyw1JW11VSKqPXa/v2e2nS4plPCAlSMEggHA7YyCOODj2I9xYWR0wwJB5wenBAIHHpxnuAfeqR4HHPt6/57fyPAp4YjBBzjsckD6j3z7HP4Z950+ZJ6Lz73StrbvfvvZaJHkuV22rrbXft10urq9tNNNi4srFl39M56jjpgnPHI7MCMdea7r4dfFT4gfCHxnonxB+GvizVPBvjDw5OZdJ1nSZBHKBIrR3Fjf20iyWeqaRqEDPa6po2p293pepWUktpf2dxbO0Z83JIB+nXnj9RnHoc00HI65wc8468emeuOvOO1RWwtHE0Z4fEUqdWjUi4ThNKUZKSSaaen/B2te5dKpVpTjVpzlGUZJqSbvo07/Lv5O3S/6Gal4J+Gf7Z1jeeKPgXoOjfCr9qK2t59S8Zfs4ac0en+AfjI0KGfU/Ff7OhuZFj0HxVIIpb7U/glcStDclppfh7PLFGnhsfn3c291aXd1Z3ttcWd9Z3M1pe2N3byWlzZ3UDmK4tLq1nVZ7W6gmR45redUmhkDq6KVIKWt3dafdWt/p91dWd/Y3MF3p17ZXEtpeafd20qz215ZXds0dxa3NvKqywzRSK8UipJGyMAV+7dO8V+A/2yIrfw/wDF/XNB+Gn7UCww2HhL476qYdH8BfG6aCNILDwt8dWghS18OeOZ1SO00f4wbFs9SlaKz8eoweDxBb/ORp4nh6Uleri8obXK2nVxGAi+W61vKrho93zVKfVyhdw9h+xzKF48tHGJe8laEK7XKtbfDVflpLXaTs/gsgFsE7to/hJXkZAJzjnPJHBxwM8YaQRuUtk4OPbIIwOScnPA5x74rt/H/wAO/G/wr8Ya54B+IvhfVvBvjDw5d/ZNc0HWYBDeWsjBXgmiYM8F7p99A6Xem6pYzXOm6lYzw3lhdXNrPDPJxjKfQkEZXdgZGOBjgAHHIyB07EgfSUK9LE0oV8PUjVpTUZRlB3TTUbWkrx0628+x5U6dSlJ06kXGSaTT3Xw38vW/dvTW9dicnn5d4x+K+objrtwR05IwKkVgoO45OWU5JJC4GMZPGevQHuT6tIwdwyM564z8owuMAY/pkdx8rgoPJbBIIbjkBgCOcAH0zlSMDHt0X010Xu/o7PT0117vUya+G703dru3wprXsla9uiVhVLDAwxKkZAA5DEdwOmAvXOehzzgZ8j7rbsE45xgEc8AgDPPI5PYE8uHHfPXr7/5/wxQRx1PGORnP9Tzz7/XmpvHRW3a6/wCG1+n9a7k7vTy6folt8iMMNqqdwwWGBggde3bv05HIPuwPg/KSQMA5x3xnJC46Kf4h7DjFSHggBsZPPOSc4JwB0PB49Tz1NJ3K4zgNnJOc5BHQAc8YPORwecVVkmtNk+u2y/r08yklvZu6e7VtLb3W1+t9Oul0Ru7jGGVSSM4GRhTnjnJzk9ycZ6CnK+duWHOTgDbzndzkgZLHrjnBGT2YY/mY4BGSQOmMHn06dgM9qeIxnpyOR3Jx+J9O/HX0OTSPVarbRdvy276aWTsyyVl0vvb4r2t121d+nzJgB6g+vHPAxz9eRTGMnAgXzJiQkMaKWeWV8pDEgH3neRlRApDFjhRuxhSOm0Ajv0wcdv59vT0r6G/ZU8JaT4o+PPgKTxIiN4P8FXWp/FXxuZOYV8IfCzSrnxxrEU+eBFfLo0OlAOpSWW+jh+/KFbhx+JjhMHiMTJ3VKjOaXVyjHSK1fvNuySs7vfZm+Hpe2r0qd9ZTS2SS95OTdttm7u/r1fQftayL4c8V/Dj4H2jr9k/Z7+E/hfwHqUMRBhb4ieIBL8QPijdMFG03P/CW+KLrSp5CS7Lo0MTNiJcfKZHo3tt5G3pjJ3Lnt7Ads4rovF/inVPHfjDxZ441uRn1jxp4l17xZqkjEgtea/qdzqU64IB2RtdGKPaWChAgAVRXOAcnnp35+b69B3ODjJx7GssowssLl+GpSs6nIqlWTS96tV9+tOys7yqOUvNv0tWMqutias43jDm5YLR2jC0Yx0vtZLurprqx4JB4zyCOP09+vpTCw5GRkZ4yO3Tv/nPahi2RtGR0z/jjnHXJ7dxgGkABycYbkE9Bke4/A85IOfQV6KgrK+/z62f3rb810OSy7+bt2009fw8xxOeQcDt37+/b398/WJ2ZSCjJgjGCOMt3PpyRgfezngno8AqMZ5zn26YHvyce/HA6mkCg8FVGPp1OT26fhx1/BqKSte2q1t0XLre710+e9mWo21T076ap2umvLrdvyV7ke6UdSpByBj1wT1zn0HXODnIwczduTnBBz+WM9c/X6H3puwE57EfTHuP8DnHp6KV9OQOx9voOuOOmfXPQuzaVnayXNp00T227Jrq77sHZWu7XSvdb9lZbWtrbTRbht9DyTknocd89+4P16jB4eDgEDGPTHQ9z+X+NJgEdOvX17/y5Ht0ozjjv6Y5xnHrgdv14HabPR317arte+97WWr+/Wzlu9tb3d306Ja9P613HBiOoJxjHPTqM/r+XHTFJ9f8AI/z+XSjIPr+X1/Lpg/r2BMjBP654/wA+nTv1FQrKTeib+J6pt6dr6r5dVpoJu9r9FZelkv0FB45zkA7fYnpzx/DwfQ+o5KFj3YjsDnt6Z/l9B06BM/8A188Y/wA8/wD6jmkbngnGen4c8/5HXv1q42irQVlfb5xu2lot7vpcEtUttvXf8+uvqPLtwN4PGBkAjDDHRgeo6Z+meaZ5UBJLQwB85ZvKjDZJJGSADnjsTknoPlpAD3H0zg4H5fUD09MHgHbA7nJHGD9Dz+eOgwOgocISfvQi9bN8sX2f/Atr2ehd3H4ZvTrdpX01TW+n2devz6TSvFnibQnWTRPE/iLRyp+U6Xr2q2G0BsjH2S6iA24yBjpnj19LsP2iPjZYKIh8TvE+oQBQotdfntvE1qypnarW/iC21ONkxgYK4PJ9MeI4AA9uR+f4fke9LnBUYHPQkgAYyMc5HXPB7nGea5quBwM9auGoPRttxhfo73S3Vu99F5W3hiK0ZaVallbli5Oz+F21a0S3W9vme/P+0B4gvhnxH4O+EvitWIMj6n8NPD+nXTklhl77wxF4fu1Yqf8AWLMGUHIY81vaR+0XbaKSun+Bbrw2jEGSLwD8SvG+g2T4yQG0XxBc+MdFkQ/MfIls2ifG1k2jA+cdI0rWPEGpQaXoGlajrupXLCODTNHsrjUr2RjgELbWkTyZ65YqAoG5toyR6+PhDF4aEc/xW8aaB8PCVLHw5btH4y8fyAAERDwxoVy8OkzMCR/xUOqaOY3I8xD84XxMZgshptRlB+0esaVGdVyb93/l3Tetn5W6vY76OJxzV4yVm7OVWMEk3y6OU1ZX01uuutrW7q9+LHwR8XqV8a/D/WIrly27WE0XwndaiGdgxL6r4Vf4fXE753Ye4srlj99wzHnOPhD4N3y2uv8AgW78U3PkXYDadrNjdxaVtZQEZLnUIMzSQyK2+2W8uwm1GaeQHe/N/wDCa/C7wsAvgX4aHxFqMXMfir4tX/8AbbI4JPnWXgjRms/DtqOSyxatPr4jGRJv5aub1b4vePddvLW71rWX1KCxWaKx0YWtppug2UEzIzwado+mQ2djYIMKsf2eBcLszkDB6+H6VLCZtgsRVhiqOW0qkZ1YVqvMpJJOPLRXtJS97lcruLST93a3Hmk5VsFXp05UamKnDljOFNLlbcU17TRq6VrpNK6s9br2ufTrO/iFvqdjDc28ilTHKqjbFzkxsSzQGIlZEaMBlMYOCwUjxW4+FurtNPHZeIPAl2iTyqkf/CZaJaXKoCdiTQXk9syT7NqSIcEMCQccllz8TtWuLd4bSxgsZ3Ty/tqyNNNHwql4UKABuuAxIUEhvVWHUPDHjKOG28XLbeHtfhgSCx8ZabZH7FeLEoEcfi3RrVF81nAVW1nToxdoCDd295yy/XcZZnQxdbCTyqfOqUZ/WKqpOT5WockVFuE5Ri+Zu17X2a28fIMJUw9PEQxrTnJwdKDndacvNzWvrJ8qS00WuiRVf4VeOIxuTSbS9QnCtp3iDw5qGVzjcog1Fyc7gQBznpyKpzfDbx9BnzPCGvEEZJgsRcqBjPDWplznI6c8cDHXJ8R+FNX8LTQpqdrF9muUaXTtUsJ47zSNVgXGLjTtRgYw3KbSC0ZIuISxjnihZSlYKXl1Dgw3V1FnP+pubiPDA8AbJB0I4IGPUEE181Rni6tNThXoVFdJPkcXbS9/fdmnunr0d+vqzUITUXGUbpbWV7We3W3fr2WptXHhnxHaDNz4d1y2UEgmbSL6MDaRnJa3GBg4IJ5wRz1GO9vcRMTJbXERGCRJbzREYwDw8R64684BzzzWjB4m8SW2BD4h1yHb0Eer365x0OBcAeuM9P1GunjzxopOPEutSKUKYnu3uVKgjAIuvMVvUDJX8q05samk40pp6L3pK6XLZu8Wtbq35Inlg23eUW0tWul42juuj8uu1mckZAMcBTzycYz9Mb8jnsuQOcA5p4YHcAdvXJOQeOAPuk568/3friuvHjjxM6Ms15aXY4OLzRtHuSw6AlnsixJyOpwSc8d438VXb7TcaP4Znb7x36Bawlmzwd1uIWwSSTzgZBwSBilPEJxToa6JuNS+zV1bljda7+VldLRctJ/DUTt0cWr7Xuvu1762ehzKnOSOhAwcH3xyFBz83QHpzjjAkGQQCGBUjPHBK4xj5eT34LZ7gHIPQNrdpIB53hjQCGI+a2TUbVhjuVjvCoIB67cLnJBwKie80iT5f7FeAnOGt9UuQoPHKLPDKfvHqHPIycrjNe2qp2dKVr26XW3aX3rp3IkrdYu91q37ukU3rbs9rvvrY5eJzs5yxz1wegz+ABHTHBOAOgJlHtkD0P8A+vjtx04465qFB2PyklBxgdCCODxjjryRxjsBMc4BHU9vpyenAPv+fGK6JLRLTbR9tl91tHu9e1zO1rK3Rbve9ur29d979hM5BIwRjgY78/5/zyufXj+n1P589P6nTtx/XjHp9PypM9sZHOe5z/d/XrnHBzjis97LTd9Uui9O2/X1DTonbvv29Fo/zQuR1zx69v8AP+RSdN3HqT6Hv/8Ar7ducUoAAwP88/r6evA59T2/LPt+PPNF+1/n2vf+ugd7f0ugjdRxk5GO+OnJ9OG+vHI6UpOB6du/9Of89RRkjdnPtjknA9OenA5GOnrgIQTgAE9+OuQQcAfQHk9OMHnNPTRt27t69m3fZLXrs3rvoW2bdld3d7LSzeuysnfXbv0ScYOAT14yPbjk8c+vQ59soyE/Mp5UOCORxx2BOehAHUcDrTse5756c5557evbuPSmlSQRk/z78cEYx75Ge5JGacX0ukm+vTVL3nba2mnfWxUbcybeml7q+ia3XVPyd+rZHtOcNnJ6D0xnaeDz2+8CM4LeoUEjIG4Ak/xDkDnPPIJOc8c4HfIDyhyWDNyO/TIwR6rwf/ZTjik+8zgnA5PcjqNo5HGD3z8vBB9dFJO1uv3qzTV/Pta23zLcoy77LXX+4tl13t92l7gC2MM5IyQONxUgDPUcjk84GOQQAOV3gDJYAkEEkkfUnP8AFjjoDg+uDQNo5JwPmPfPDZyOCdx5B4z3+gcFeMHK54AIwx9RwSBwOfXjAxSulsnst733V29LPTdJK3q2yL3abvrZN/c3o07u+u6v+aF3MhKthSSAcd8E9QOCTxgnrn2qUN8pDDdk8kdTge+c5wB2B+XjoaaAM5IB49c84A69ew9OnvwoJyTnGegxjGMZ6dOTzxz9Knm5ndp6JJW+Ts3HrH0/Eaab97RKK62enKt73/TZWJw24bgOpzzwfqeOv5/U0YJ+XB9OvUYwOmfTkY9/UGsQ2eu3HT1JHOM+intjvxjinbmC53nABBJAJ7c8E9+hIB9elLTS1r/fba1u2ras9PPayiubZ2803ovdtZ7aX2bt0utGWVVzgAYI5xweOcjn9e38hpaZqmq6Rf22raTqN/pOp2Lxy2eo6XeXGnX9pIhyklveWkkVxGyuS2Y3DFjx1NZMbllIyfQnpngZwTzwSeDnqPYU/LEHLHB9eo6/5/wIpzpU60XCrTp1ISumpxTutNHdbaap31Xa6LhUqQd4ycWrNWbTS7qzu9L37d+h9Ff8L40/xnCmm/HjwJp3xNVYxDD430aS38F/FmwXI2zSeJ7Czk0/xS0YUFYfFmk6q7hdv2qMsHSCb4IaJ45WW++Avjy08eyKrSt8OvFUVt4O+LFoFUtJHZaVcXcmgeMFi2sqzeGdUmvbjaXGiw7ig+eDkYb73UYPpgkcHGMde+T9c0JxLFLhlaF1eMo7JJE8ZOx4pImWWKRWIKPG6sDkqQTXjzymWHbqZZiJ4WT1dG3Php6pteybThdvenKK6u+h1RxqmlHEUo107JVUlGqrJbSXxX0b5k30smi7qekanomoXWka3puoaNqljM0F1pmqWU+nahbTDgpcWV0kU8bqVwd0WFYcj+9TztbDHHoOeBjgEDgcYx7nkDII+gdH+O+t39haeHvinomk/GHw3aR+RaReLZbiHxjo8AUIo8P+P7Lb4gtTEm0QW2pzappi7VU2JUEDb/4VR8N/iOpuPgx48Sy16Q73+FvxTuLLw/4iklb5vsvhvxgrQeF/EhyGS3iupNFvpsKfsxZsHJZnXwr5MzwzpxSSWKpJzoXbSvJr3qau73nFRW3PbdPCwre9haimv+fU/dnG9tFtzWb0S3a2PmTJUexOABgHr2GOe3Yc9h1r0j4VnyPiP8PrkhwbXx54PnBGVIEfiDTnyMY5BB5z9cZwcHxL4U8S+C9Wn0Pxf4f1bw1rNqx8zTdasJ7K5CDnzIRLEFuYZBzFcW7vbzLtKSOCGr0PwJ4M1w3fhfxWk1nBaW2s6ZqvkTPItybfTtTgnZlXyyu6ZLZzCWYDaVOArBh7mGwWJzzD1qWV0vrcnQlJ+yalo7RVmrLdxT2ve/rxV8TTy2VGeLm6MVVjFufut25XZJLdNN3W2vbXnfjLZiz+KvxOto0YLB8RfGqqp+9tPiO/YDgk87h1I4wOnTyxmcEkjH8WDyeTnHTqQeMZ4GeOlfQnxM8MeIPEXjbxr4ptLUS2Gu+KNf12AJOGuY7XUtRubyLejks0qpLhlQOxKkkEstXvC37Ouu6joMPj34k6zp/wf+GMkjLF4t8W28zav4k2KJZLT4f+C4jH4g8X3zqvlRXNpb22hRSkLfa5bgMKjGUK3D+Cwkc3oVMLUdKMKcZ03z1qkYRTjQjq6ju9VBSab2a22w9Sjmdaq8FKNePM5Takn7PnkmpTb0iv8W1r9Gz5zso7m9vLaws7W6vby9nS2tLGzgluby7uJWCxW9pawxvcXE8rELHHEjSOwGxDwK+qbX4AaN8Pbe31r9o/xPL8PPNgjvdP+E3hyOw1z416/DInmQi90tpm0n4cWVyMA6l4ymi1CFG8238PXm0K1G7+OGgfC63utE/Zr8NXHgeW4ie11L4x+L3s9V+MuuQyBo7j+x7qFX0n4aafdISBaeGYv7YWMiOfXrpy+fmV9VmvLq6ur3Unvb67ne4u7u6u5b2/vbiTLSXF1czGW4ubiZiWkeWRnkJLEkHnxZVcfmFn7VZZhOsnyvGVIWTbs24UE/Pmls7Qe3oqnQw1rw+tVkklZP2MH7ujSXvtNb6R069fobxZ8etTTRb/AMDfCHw/Z/Bf4eXyeRqeleGL25u/GvjC3UkK/wAQfiJcCHXdfLhi0mj2J0fwxExKwaLxuPzxwqADAwynAGB16YA6jPUDjoc812+heB/GPihkTw54R8WeIHk4RdF8Na1qe5j0CtaWUqtkf7TE7hxivXNP/ZK/aK1GFLofCPxRpFpJyL3xW+j+DbIL8o3SXPinUtIRFwwJY/d6kAYqqdbJMuTticPGb1nUqVoyqzlaN+apJucpO17XbV1bRGE443EyX7upON1blioxS926iklFK70tdd13+cxjG4jBIwDnPQdDyeSegwvQY7ZOcADPP6n2HU9u/wCHSvpofsw67pRz40+LX7O/gUD78Ws/F3QvEGoQjhmRtM8CJ4qvGYAgFAgbJZQcqcL/AMKn+AGkKG8R/tT6PqkowXs/hp8JPHfiWQEsu9Yb/wASL4NsXO08NuKMQOSDuLef5a2uSVeu/wDqHwuIrL7KXvU6ctUnr7z0W9mL6hXbTkoU03tVq04O+llZyT9br9LfMZHHP5Hr36j3/qM9ajJ9FLHHYEDBPrg98Y69eK+m2X9kLR2bDftHeP5YwNpCfDv4a6fOQVzgvN43vYkcgqAYw4GCeRxWn+Jf7PGl7f8AhHf2XpNUdFAW5+I/xp8X62rvhcPNY+EdO8GQEE5LxLcBT8wBzgiv7Xqzt7DKsxqxbTTlGlRSV0rtVakJpWbTuu+7vZfUqaS9pi8NB6NpSnN6209yDXe2vbY+bAygZLJH03ZcAg5HBDAY4PUjvmp7S3udRlNvYQXWoTFgqQadaXN/KWIGQsdrBLI5JOMBS2B8oBGB9BxftHXulkP4N+Cn7Ofg5hwksPwvTxlexKcMGF58RdX8VFnB+65QFjuY8YAnuP2wv2mHjkt9M+LOs+EYG+VbT4faT4Y+HdsiAD5I/wDhDdG0WRAFG0FZM4BywySa+s51N/usBh6KfXEYpuf2U7qlTnHq01zbdV01VPAxdpYqUrXfuUtH8Nk3UlF+mn3q6XN+Fv2af2ifG6xSeFPgR8W9cgmyVvLfwHrtvYFOMudQ1CztbMIAclzOqouCSBzXon/DE/x2sITceMIvhZ8MYCwLt8UPjh8J/CFxEh6tJpc/iqfWMqcK6DTzICcbeorwTxJ8TfiZ4ykkl8Y/Er4g+KXkz5h8Q+NvE2sBs/e3R32pTxYPAIC4HIH3RXDLHBlpFiiD8ZdkDOx46kqxJx13HPJ6A1m6WfVGubHYHDxaWlPDVKslt9udeC9G4Jv+W7d59rl0LKNKvV5WrKVSEFpyvZRlpsrKTfW59YRfs7fDPSHP/Caftl/s46K0efNs/B1t8UvipqCspyUjbwr4FXRp36qpTWvJYkDzAu5qux+EP2LNEA/tf4+fHnx5Ou3fB8PfgH4d8MWUvYrDq/j74jQXUanja76FkZDNEGG0/IoY5x2JycAAZ5G7p3APscegxTiQA2CeDzgZPrwMdweuPc96z/sjHTletnWPa0vTpQwtKFny6cyw7qK7T1dT0d7EPGYeMU6eBopvld5OrOVm1Zv30lvr7um72R9ijx1+xF4fAbTv2fv2g/iFPGcef8Qfj54Z8IWFwQQQ02leA/h3PeRIxzmJNdcrnHmk/NVj/hpf4V6QAfBH7Ev7NOjvGQ0d946u/ix8WNQUL9x5Y/Efjy10SeRRy2/RfKZlJaFR8p+MmfcTwSQeu3PX8QxBHc54+9SqcHgHjtgAd/p1wfzIPfAuHcDfnrVsfXldXVbHYuUGvd0dNV/Zq97fBZrRrZFf2liI2UI0ILTWOHo36falBu1nbW3R37fay/t5ftDaZEYPA7/Bz4XW3KRp8L/2fvhB4ZngUj5BFqzeEr/WlaNdoWRtQaddoZnJ+Yed+J/2s/2ovGkTQeKv2ifjPqtrKuDp6/ELxDpGllD8uxdM0O+02yjQ5ACR2wjC4ACghT83lzjA6egAGTznt1PfOBnHIwMN3ljn7xGP9nP48kd+eoz3rppZDlNJrkwGET0bnKjCUnL3WmpNXV+jcn53FPMMXUtzYirZaW9o+VJ8ulk7WfnpptozZ1C/u9Wma51e7vNYuXyz3Gr6hfarcOTksTPqE88jNzySxIJOc9C+2l8lMRBY14G1VUbSo+XlVGMYAGCcbec9Bjb5M5LZGeORkYx3IPX2Ax2zyamDtggNkjnJK9OevOSB1z1G7v0HoUsPSo2VOnTTjazjCKcbcuifTZtddPLTmdZt3lOcm9LKWl3a/u3Wtr6OMb2Vmkz3GH41+Mbayt7WNNIZ4IkhjvJLGaS4kWNcBpVM4illA2s7lPnYFmB3En2nwP8AtpeLrbwmPhH8c/CuiftFfAWaWd0+GXjKe407WvBc9zK0lxrfwg+IlnHL4l+G+uKJDJHa2Mt54VuWDJqPhu+SWYv8TLOBhd3bkg4POeoBAGOB1OAQBxS7z8wwuCeQVGT0ycnOD0+Ycjpkjirzz23EGFo4PN8RVxdDDyjVwynUlGphqsYqMatCpBxqUqsY3SqQlGSS5eZXd1gakcsrTrYSnGlOppVtCPLWi+VyjNNSjOLaV4tcrafkfdTfsyad4t0rWfif+xX4y1/4qeG9Dt5dZ8U/C26SLQP2mPhNp0KiS5udc8LaG8MHxG8MaeN6yePvhs19bpBE13r3hzwuoK1zvgr9tT9rD4d2v2Lwj+0f8YNO0pN0LaFf+NtX8SeHyisytb3HhzxS+taM8eQ0b29xp+3AIkQ5wPlvwt4t1/wV4g0fxZ4Q8Qax4U8UeHbyPU9D8SeHNTu9F17SNQgdXhurDU9PeC7tplcffjkG5S0bExsy19vS/HH4JftPt9g/am0xPhZ8XbpVisv2rfhZ4Zt1s9fvWAEd1+0F8IdHjsNO8UmUZOo/EPwHHo/jJ3eS71jTfFEyc/B4rL6uAfJmWCpZ7lmn76WHpzx+Hp3il7WmoJYuMVvUpRjXUUr0qrbme7TrU8UlPC1pYDE/8+1OX1epJtL3ZSbdJ31UZPlvdqUfhMbWP26vGXikbfix8E/2WPjMz83F74q+BHhrwf4juByrtJ4q+EL/AA31hpXBOZ5Ll23ZfGeTxTfE/wDY58VMW8YfsoeO/h5d3DEy6l8CPj3qQsYmJGZIPCnxb8NeOQ0akki2XxNbjBEfmjG8cV8c/wBmX4pfAYaPrXiez0nxN8OPFg8/wJ8Z/h9qKeLPhR49s3A2voXiq0BhsdRCZN34b8QxaT4l08q8d/pMDRkt8/gDYHHHPy5CgsDg+2R1xgFSMkYwQPSwOS5Di6NPEZXVq0aelvqWLr4eMGpLmjKjCpGCkmmpRnHmT0eqsc9XE4/DydPFRhOTs37ejCbldJqSm4t2a1VpXaeu939Yn4d/sTeJlJ8OftJfGb4Y3bPmKx+MXwFtPEukw7j0uPE3wt8Z6vdbFAwZ08IqxAL/AGcc4gf9kmfXJMfCz9o/9lz4rCY/6LY2XxTT4aeIpiQdkX9hfGHSfAUgmbosEFxPh+NzA18ouH5VWY5GOCOR12hT2znOOufxNdrdHB82OORBkFXVW3bgc9FPzfL1JHRjjjNdUcqx9KTlhc8xDT+Gli6OHr0oNuNm+SlRqtLa0qz1t3ss/r2Fq6VMDSXeVKc4TesVe0nKC9FG7Vumi+lfEv7Hf7UvhOzbUtZ+AvxJn0hQSNe8NaJ/wm/h5488yxa74Nl1/SpISCMSpdFMcrgc14FfaZe6TcPZarYX2l3kOVey1WyudOuo2HG2SG8iidWBwpUruU8EHBFa/hPxp4y8DXKX3gvxh4r8I3kLB47vwt4n1vw/PGwOVKyaVe2pUg9MkDtjgA/TGnft3/tS28KWGv8AxQX4maWI/L/sv4y+E/BvxgsXiUBRG5+IPh7Xr1ECnBEV7EwBO11b7rcuJsP8MMux6vup1sJK1ovSDWJu97rmSV9OpDWXTfxYjD6Ky5Y1XtG2qdNpK+uj89GfHxB2kFgw4OFZWCgZJPGTjnOAecng9Kj3HncCMeowQAfQDHI7A9DnORX2RL+0z8OfEny/Ej9jr9nbxHNIxe41f4fjx58FtblJALPDH4O8Tv4XhduTvHhZogxYGFQAAyXWf2E/EqlbzwH+058HbuQhmm8M+M/h/wDGTQoCcEumm+IdE+HutNEhBIjbW55GGMszEsWs7xtL3cZkWPpxslKrh3h8RT05dUoVVWa2a/dJva10P6pRqK9LGYaV/szU6Uumrbgob9Ofproj48J78dskD+90z9c9ffr0pP8AOP8AJ78+lfXR+Bn7OXicu/w//bN8G6XO4T7NpPxz+F3xC+Gd3uYAmCbW/D1l8Q/DCOOAZpdUgt85YFFwTIf2Ff2gdWRrn4dW3wy+Nlju3Rz/AAY+MXw08c30o2jCx+HIPFNr4rEhVgRFJoKSg5RohIClXDiLKW17arWwbbWmNw9fCr7N1zYinTT3d2m0tF1M3lmJSuoxqrS7w9SFW2z1UG/xttfzPj9vp6Ec59zxnnsO2M9qQHPIyODngnnjgkd+eMHjI9cV6h41+CHxo+GrPF8RPhF8TPA/lsQ0vijwP4m0e1wPvEXl1p6Wjpg5LxzMHx8vy4I8yWSOU+XBJFI3RtrqGAwDllbY6nGTgjcMc4NetSxmDrqPsMTSqqS0dOpBp/Crppu7W6/N6o5qlGrT0lSqRaXWFk9Yq7TTfy+7ziICAZUZ9jnHXqoyRkYI6E8YBHRr4xgZGD7EZz9e3TPoc5OMU5kZCeTt4J5J+Y9uBjOclskbRjrURUkD58DHKkkMxJOcA5HHQAsSAe/OOlN7rVXv1lo7bW009W0trreE22rXveLur6X5XZx0Wl7Wu7Po9WGcDhjzjPOcKD9cHIOGOB3PXq8tkADIO4EEHgdM5A7Hr7c+2WFcjqe47dD+XoP19aaC+D0brngnHUck8bevPHI4IAIpRvZbPvfeya0TVvlfuk/OL6q13Z93onZaX3fZWtr5tEpLcAueBweg6kcE4PABxnoDk5oBIbPr1J5x9B9Pf8OTUZO0g9AQRgZxye2BnHJ7ge45pysDz9Onbvgc9QPX1B7ik01qu3lfpdtPW1+9lv0vdO6abWjaVutlbdNt2+etgbBJOAOM7T6Z4PoB3zjp09KRkDYJU8Z5HHLHGBjpu5HHOQcHmpVAwuAp6jp7/Q+34c4xyHnB6AAEdhzjr1PXOfr/AOyiumnfTV3v59fNrWz3XyLU7ei69XbSz00uruzWrve62hMbckEdMY5OOuQeec8Zxg989aTy2IztwPrz7Y64xjpjnAAyOalwckrkdODjjj3yOnbIx/NSG9Tgfmff6Dnj246jFx1S9VsmraR37+rvbdWC66WSdtU3bomttOqXo9tWJtOOf04z26j+ZHAJz6iWMqhEnRFDGRnJKjCEsWI5HTkDkj3xiJwcAAnk9uvJz9Mdsenr20tLsH1e9s9Fi3NNrF5aaTbrGitIbjU7mKxgVQ33nLzgAKCT1UHJJyxE1Tw9WpJ8vLCcns7Wj56PXbRbeppRi5Thdu7nG1ttWlr13u9NF0R9GftIMdLtv2fvBBLKfBP7OPw9kvICNph1Xx9PrHxM1HcmRtlf/hLrQu5Clwisx5GPmXcCOO+3P1Ax/L6+mR0H0x+13dW9z+0h8V7K2ZWsPCuuaf4A07YMRx2Hw70DRvBcUUY4URgaISFAwrZG0bcV80YUYKjg5yDkHIAweOwGOnp9a8rIocuUYSTs5VoKvJWs+eu/aTVv8U31v7z267ZlNSxdRJvlUowT6csYRiuuqXL0vq7LRaJ9OTnH0/xPtx9earl32krlCDz6nvyTgA56cAcc09nGCVwDkEevBBAP8XTGcd8e2YgWJxyCDy397ryM5PXHUk+/Ir2IpJNt2tZtPbS343+e6W1ziSd+nxdb6r3fiVuj3Wu/qJuk3feJAwAMgAjOD3JBBOffpjNIxk5bLbeSwAGQcDAJHPcntgdSOykY6jqBjBPO05GM5xgjHHJJ9ejWBHO4qDjJH5D1yecA8dOuTzV9V5qyvppaN1ponvra97ehW2itfRXVrO3LdW111eu9+m8SyjEqQRyACeT1IBHTJzyc989sml2BVkJTerKQUJYoSwABKg7c8cH09aBnvngYBHBJ4J684PA549CORTgSMgkngE5z7/8A6+mc9zUtpppq6dlJP3rrRNW0S37O7uuw4Ss1JXjJct1f+W3RJbvayvdbn2X4J+Pfg/4leDdC+Cn7Vsmq6p4Z0G1GkfCv46aRZjV/ij8EYnP+jaNfh2W6+JHwijlcm88E392NT8PxGe58E6hYS+Zpt54x8Z/gf41+CGt6bYeJjpmueHfE9l/bfw/+I3hS9/tfwB8R/DTuiw674O1wKiXMQ3LFqmk3kdlrug3pfTda0zT9QjaEeN46kHBIHzEbgPTtz05HU9M4xX0T8Hvj7N4E0LU/hX8RfDo+KvwD8VXq33iL4bahem01Lw9rJjMK+PPhV4gkguJvA/j+xhZimoWscmk69bq2k+KNN1TTpmjj+Zq4DEZXVni8pi6mHlJTxOW3UYNtxc6mFu+WnN6ucPgqO792Tcn6dPE0sZCNHGPlqwjaniV8TSslCrb4ktoy3t5WPnM8nODkYGB13cnBAB6dcnbggfxYFKuduW4I4+nA9OvP69K+i/i38CE8IaHZ/FP4b+JH+KHwH8SXjWeh+PbW0W01fwvqzhZ08DfFnQEklk8G+ObWM7FjkZtC8R26NqvhrUdQtjPHa/O2AykdgcEE5wcDuMg59Ru7969zBY6hj6PtaMtny1IP3alKS5XKE4tJwkr6ppW7PrwYihUoT5aiaTScZJ3jOFkrwd7SXbq7CK2d3bDFfy/z/X2AwJUgEjPXHXv09T+X1oK4yOnJbgd/cYGefrnHBPWkbvk8AH1x+JHGOM9c8/hXV1v1vqtHr7u22uuu2t/UxW2nqlvZq2+m76bW6b6MYclVBJ7cNg54H1IzjjjPAzyaRhxkj3C5GRhuMn65yDnqcHgZCV5OecZLA8noRk98Y4yOR06mntnaVLZI5weeNxxkcduO4H15rR9F5W3v/Lffz16PVpX6P+W+t2m9L2+Fd35aPR31VxQDwcc5OcdTnPT+Yz+fajYCfQc+/r9Mc4A7DjPXFJnAyWOCcYwcgg/TPTqMDjPHFKN2RnGOeR+OPr/LpxnpDu2+nRWtrZpu11a61301tbcV2l0T87Xfppa29t/ICOe/JPI7EYwDjt1HIOM/n9QfDcP4F/Zv+PfxGYtBqfxEvvCn7O/hWZTtke01e7g+IHxLmgYAtti8P+HNC0W6KsGEfiFoXAWQA/LrlUVizAABnOcdFBY8semBjsc4+YZ4+ovj7u8HfDz9nb4NRgxXGgfD64+L3jK2AKt/wm3xpuLbWbNbtCdwuNM8A6d4RtI1fLQpO6r8rlq8HOZOtUy7L43ticVCpVtZN0cLy13zLW8JTjThK62mk9mehgEqcMRib29lSdODtb36tqatbW6i5NNWtbZN6/LjsXycr3XCjGFXaFAAOB9SQenfNN5AHU+nv/Tr+FOP3Qcfjnk9c5GPb+XvTD057+h9u3/6ufSvfilGMYpcqSiulnays0+vTt8zzW29G+rb672Xp0EJI7E57eg98Z/z06chHTGAQO/ofTj2x/kU0ZOSDhfUj2xn+fsMc8AClHXIOCO/UEHjk98YPUD0z3qvy/q36lWWnpr+CtLot2nbXW7XdSM56jjr+fIxz+Gehxjmm7ckDaT/AJOAMADHHtyfrlxyedx6Hp79+Ovt6/mSYOfvHHf9emc5/HsRzxQCaSsu197dr2dr3dttVp11QAeuTzxnk4x9fXg9c/TBC4Bz7fXOR6d8+/Ujv0o257+vPp9c55AHUc8+ppcZ4P69P8P/AK9Lr9+n3a/L9RNpu+vnbpqvXv5a6+reuD055B7+n5Ht/UYpwI68dD+o/wAD9OlHA6+/T/J7n8efegcZzzzxyf8APUe3XA9QusbaK22t9uvRfP5b6T/X4/1v0+QdeaTnB4z349e3vx0z9D9AnOQB0HU9OBnPpxx/h6tPQDJORkcjnHPc5P16c5x0woq+63u0tLWun/l8kykveV31V3tZXWuttLbeXYdyexPT8fbHoB26cYpMEkYBI5PB5ycn/PPen8Rplyo4AyzBQBuxuwRkdQM88nIGBk+r+Efgn8S/GNj/AG3pvhx9K8MoCZ/GPi++sPB3g+BBjdIdf8Rz6faXOwkZi043lwwJ2QyHAPLVxmGw6br1Y01FtXk2rt2dkt5Nvok35M0p0qlSyhByad/d5tny2b1srd7NaNWseTmNjxtIPoepJBwPz5+oyfWnxRSTSxWkMck9zOwSG3gR57iZycLHDDCryySMT8saKXYdEJwK94Phz4F+Ci3/AAlHjnWvixrUQDN4f+F1udD8JxXAzm3vvH/iS2F5eQI4AkbQ/DMscig/Z9QBKvVKb46a9o8Ulp8MPDvhj4Rae8fkvceELSS98X3MBxkXnj3XW1HxJub+Mabc6ZAOfLgVTg8jzHEYjTA4SpUV7e1rp0aa21XPH2kl1XuNP+bU6Xh4Q1xFeEHdP2dNqpPpZys+W1mrqTvfZaBp/wAAPHKWMOs+OLjw/wDCfw9KolXVPiZq0egXt1AV8zzNL8KQpd+L9ULrkRLaaK0buApkQHNSSXH7P3g5VFpZeLPjbrSoCbjU5Jfhx8PUlDDcq6fp81540123zja0moeGmkRjuiUkgeJX+oX2q3s+o6pe3mpX907PcX+pXdxf30zuQS813dyTTSM7YyzPxk9ABmoCGzkAYUZ6E89MAYwB0B79D2NUsHi67f1vFys9XRw/7qF9NHJN1GtN+ZLys7EOtSppujRV4t/vKi55aaXUYpRV72Ss3d3uesaz8Z/HF/YzaJocmjeAPDc4KSeHPhvpaeFbK4hbgR6lqlvJJ4i1wDcVLazrV+z4BcM3XylSy7yHP7w7pBkEscgku7MWdjxlmYknn0AjMgxj0PAAJ74OSMNnoPlOec8ZzSKzKdoPyAgk4OB6ZGAcnGCehGORya7KODw9BWp0YLzcVzN9OZ68z89/UzdSrVd5zlLayd1Fr3dEkrK7a0SS7PVXubsDGMkEkZPGeeeehz1Pp39GE8nHIPy5JxxnIwGzgEgcjIGOc800EHIBzgjJ+vIGRjoO/p1ycmlI5GD0+uenr2I9fXv66tp2uo3irq6enw6bv1Xda+mK0bsrXvdeVla+97WXTpvbZ2PmxwR6g8dv5c59hn1wh+VskbiAQOV+UdCOMZHUnOfUdchuWxjr/tDBPHt+nX3NI2QMhiDg84JHI7gdvb6gdsOOjS91J2W2j+HV9dn1+629LorpJ21V99N7fjs1q+uvT6H4w1LRYJtPeO11nQbtt194d1dJLjSZyVK/aIArJPpl/Hn91qGny211HJgvIyZRr9z4Z0nX0kv/AAPcXLyqpefwbqkqP4gt843to9wqxweIrNMlgsSQ6tEigy2UgVp24E7jnBJzwc4yTnB9Men6471LE8kMkM6yMkkBV4pI3KSxOhDq8UiESI6Ngo6lSpGQQwwearhGpOrh5+yqu7aXwVNF8cXbrdc0bPs9LPVVU1GFVXV0lo3KPw3tZPS97Lyd9bsa0TI7pKCjq7I0boY5EcNgpIjDcGVhhkIBVvlPQipgPXgdsAg84PJIHsMdRjnlsV2ba3ZeIlSPxYpj1MlVj8W2sW+/6Af8T2yQxrrEYUKpukaLUo0xmW5CiM5Wq+Hr3R0t7icRXOm3RJs9XtJBLpt+FxhYZiu+KcDmS0u1guYjxLAnFOGId1CvF06miTVuWfwtOEn3fS6fSzE4X96DU4X2v7yV07NPZ+drXsttFifw9Rz0GB+ZOM9+OcY4HU0KcN3I2kEYJ7j1x2z0+Xv65Xb1PTaCSOe/yg9COrZAyegOT2AdxPOXIPXPOexPAxnPU4B+YAgZrpsl0vdXfZ2tron6366rW5ikmndPTZra94+TVlrrv1tsyUd+4xjHGARxwBgY9h09OoMiAcA8ZOR1GMMoPsOepHOO1RjnAzj6Y/H06H1x0weKmVyCDgMwPqW4YqcDPPODjjnHHc042a0SWt362Xy6abt33voF3bW7Wy7Jq1np1St59Hpe2bGu0YyQTgAk59wuMDgLnpkDotP5AJyM7SM5x2OP8M479s0iHIwcgAAAcHoeenbHH4fU04nAPQ/X05/+txj8fWZbpWWr16c23Xtd93qHVLRxul25trpv4kn87PYac7uRwCeCV6jBB9R1PJB5PqKUADOMZ54xz1OT24zx1/xpcgAnpnGAO+ee3fp6g8c0gxzjsW7epJ7j164yMjr1qW21dXSSSfm9Px2+4TadrLote76vfW+jbA9cdmH4Zx3/AAHYj6d6UDH+fpj36fh1NLR/nk/5/Lj29KTd7elvX/g7L5Cbv9yX3aCZ/wA/5+h/nSE4BPbr144/DvxnsOT9VOeMe2fp6D/P/wBYwevoOg//AFdu3Tv60a/ldPV6W7+u3qtkPzX3b7W++9+wZPoe/p/j3pfXH4Zoz/n/AD9KQjIxkj0x+np/n8KO3S1tVfTa7/rTtrqGjt02v19WMcgdVBA7HHPTgDOSenGD78dVZcgjPUHO0YIGexGAMcE9sZPXJA3yhSSeBn3PQYwOSSeQO/HYihtoBG8hjkYyRyc5GcY49BwCMADHNK/upabv7Vvs7+um2j8rDi5e7bu72um1Zb9Y2dtVrZW0u2KQC2T0wFHpnnPT6Z5HXOM9mFVfkYBGQp465Ofw+9jr3wOaexU/KzDjkk4yORnJ454OehxnIOAKT5SSFPQMAdgyQOfTPPAwANx+ozSbt5qzuk7Wsr7J2um0307WKi3porrq07WW17Ls/uv3BR1/vd/z6+/c5/AEClOPUD649D3IOOf0z15pfw/x/wA9f6A0Z4z09z/noOfr2ODmovrdrTy6aLb000d167kdm1pd6/cuz0XTT0Gh8nGCOeORzgj3xg/XJ9KkCZxuGcAEH6+xU4OR9cHK5zT1GUVsDgkkcHv34PBBGMdcDr1p24YyeAc4zkfnkDB9M/hS0W9lot9bWaV9d7+V733NIJOVkvJb/FdXd3Za6+W70vcjDMoJAGF4bgcAZBGR1OPbjrlucyDJwSPlOMA5znnByM8cZ7gdCCRV/S9H1TWbhLXRtO1HVrqUjba6RYXep3DswyAkNpBM5DE44GQSRjjNeuWX7PHxiubeO7v/AAXceFtPlXcNS8e6roXgWxCHaN7P4n1HS5WTLqTsidvmJVGUHGFXG4WlZ1K1KNmn8STesVaKb3tba/lpc1WHqSd1CpfXXl06O+i0e2rs25K3n4rt56enHIzyDgEDp34Pf3FBRhyEYDIGQG2nJBzyOTxyARjA7CvcV+FPgbRVB8Z/H34c6bKvzNpfge01v4j6sCNoMPnaTY2mg+Zgjn+2mjJyCQAc2ft/7NOilkS0+MXxEmVQwe7vvDnw+0d3XYCfItofEuqCJuuPtEEpXghSzY4p5zRVlh8Pi8S39qnRqKL2155qMHp0crdL7msMHO/vzpwS355pyTvG+kW3e3lfW1meCj92SJGCYXGXbaOykc5AzwQDjGBjIArb0fR9S1+dLLR9J1XXJ3YRrbaTpd3qU5ZsfcSztp3LZ6BcEY+XsK9mi+MPhXSAR4N+Bvwx0eaPG3UfE0Ws+P8AU1HXzHbxBqA0rcCRkHTFjJ6IFIFeo+FPFv7TfxN065v9E8Zv4E+H2njyNZ8WWp0X4XfDvRUKhnhl1bR7TTTf3iKo8vSdJF/q9w2FgtnJAPHic3xsaUpzwlDC0pJK+Lqpt8yXuqnTjPme9opptqy7HVSwlCUl++lUmru1GL00jdc03Hluk3ra13bqjtvBGm/tEaboGi+HviP4E0zXfhfJOiDTv2iJ9O0aw0u3MbyiPwx4h1q7sfGWhymMIIY9FkkjcrtFox3IcgxWcCvDYWtvZWEU062NhaTPc2tpa+YfLgtriYebNbIpCwzyZkmj2yMcuVHmWtePvhj4JeZPDral8c/HR84XPxF+IH9oweDdMvpCqG88JeFLu5fV9Wkh5MGq+KLqKJ2PmroyEAnmtN+M7PEra/p8lzfsxa4u7AQ28UpbYSVs+FhIywwCFXaAApyD9p4UZhhcqx2bYjNnHBU8XSpxw04YWpRpSampzlKkqtWUW1pzuFNySu47X+b4zwlXHUMDRwPNXnh6jlVTqRqTinGMYKMrRTs1dJc+9k3qexvK0W4KQrkMqFQCRIVOGAJBJBycE9sYBAFeo6R8PvgB45tW8Q+IfjZN8bviCtrY2uneBvEfxQ034MCy+zRyLcaKuqeMtF1USW1nLGbW1bS9V06CQIDEiZDV89+L9V1SP4VaD8T/AAybWfS9a8Vaz4K1F3Ja98M67YWNvqVpFeRruib+1bCR7qxl3kMkEilS6gD5TTDF2lPmu7NJKZcOWaQZkZs9SWJYkgZJzwWJro8SsRguLZ5fTybNq0JZfOvGtVpU0qT5vZWptuMa0bODbdKdJ2fxO9hcJ0quSU8RLH4RSeKVNxjJ3qRUb3lo+TXmWk1K2+lj738bRan8M7U3a/sFeDNI09cyQeLfE2r/ABH+LWkygYImXV9K8UQ+ErqKRCGJSIRMGz5e35R4ef2p/ivaDb4Wtvhh8P4oyI44PAvwk8A6VdQ45GzUdQ0bU9WDKNoBe884NtYtuAry7wn8RfHHgSf7R4L8YeJvC84YMx0TW9QsoHAAystpDMLSZD1aOWJkY8MCpAr1F/2hL3X2EfxP+Hfw1+KMbDEuo6n4eHhLxXJnIaQeLPA76DezT85E2pRagC5MjIx3bvzOGTYrC2eIwNLM0rJz+sVpVHaytGliqlVLs060dd0fVTx2Hrt+zrVMHe3u+zi103nSjDRK6XuProzF1b9o74/a9C1vrHxm+JdzbyKUezg8X6xptkiBQMCy0iaxtI0UBQY44xsG0YCivKNQ1nUdVZpNW1DU9WmblptS1LUNQkbuWZryeZmJGBk5GcjgdPbDF+zJ4sVvJv8A4o/BnUZOVF/Fp/xR8HpIxwFNzZx+H/E9rbqxwrPbanMsfDmRh8yD9m/xPrYeX4Z+M/hz8Xbf5mjt/CHiyy07xM64B2Hwh4tfQdeecdDBaWt4S25UkduK9CjicpoKMKuBWBm+Xm9thlGN1y/8vYp02utvaddGcsqWKqPmp4n6xHSyp1Xzvv7jcZJLvZLz1ueBCVUJEMaRAjBKoi9znp0OCO4wAMHriMs5yGbOcHAJIHHT9e2frkc9F4o8E+L/AATfPYeMfC/iPwrfRtsNt4j0a+0mRupzGby3iSVWB4eJ3jYYIJG01zZyAGwuGBbKsD9OBnPHQ5AOOMV7dKWHqxU6FShOLiuX2Tg7q6d7p+V9db6trY4KlOcLqpdO+qle/S2++v3u27slDI5LHJG0EgDkADPbOOMjjIPGM880b8qUx8vuD145HI7+uR7HHLDnOT0POMY64IB69QcdR6dehz6DjoAccc8dOP5Z9K6k9tUvdv8ALTX5dm0n30sODST95u2uz2VtddN0lZ32vbQDyf8AEk447c+vfqPXOaaQ27OSv3h0PIz1OScnPvzyDnkU4AnBI556e3554/ryKcAMHk8D2zn16cAfTBPftQndJa67vXpvr5+v46PNbpb6q99dbq7XrbfsIoAGCM4656nAII4HTHqfTstBJ4XGRj0GB0x0AORtGM8fpkIGCMkn1I/Mc9McY6AYOORSAAcZzj7p9uOvf6Y44/Giy376df7q1u7a/e7ffSjFL4XZJaq+ytrve13+DH5xgBse/P8AIf8A6/XHQNG7JJYsDwBk8cemTnqRnjOB6kUuRnAbOBn0IxnA7/pwf1pOfT6f5+vHf+eEkr/p2so79Hbf/N7ZiZbG1W2gc4xnk4Ocevy4yDz36Zp4cgAHkY9ieoz745PbH+7zluGwD0JJwDz9OnrkYxn8abnOePx7jGcdR6c+ozx61Vk7Xe1t1Z3SV9dd2rK3krlJ63l7yUk7Lytu9U72frt3bsMSMY9Rn/PQZ6ZP4ex8w49e+Dgd+R9OnPP61UYcjnjHbnJ44x69MD09gAHBMbjuJLDqSc859MYPQluh46HrNklq07Juz025VbZ2aVtHv1Hdb2V072V/K3a1te+vTqWs+3fH+B/p39++Fxj6f5HH5VV2rhRkkjBPqcepP97n6HPB7gBBPzkL1xySeMYHv1PfI44pXu7J32suj0Wye7Wrs+3qJ2aerXl03W34tq3T5FgKPQjjHU5x17Hjn0P40ZKg/McgehbgdOnJ4HYgfjyYlZkHzncOpY9TwB688g9uvBI4FBlUbSVBPUY5x6dQCM+v59DS1uldu/d3vtp9padXtuhK99Vf9evn8/ImDHcTjBDZye5zk9OmSfXJ7VIkjBySSWGduGI2A4JAGCQBxyCenY5zCrEqpAJyTwf0/HA685+vV24ZxnJ9OO3Xr+A/yaLLZx5otbPXtdt9vmk99t6hKUWumz0bVtne+7XXWy8kfQXwX/aW+KXwN/tbS/C2o6Z4g8A+JkEXjf4SePdMj8W/CrxxbMQJIvEHg7UP9BiuwvNtr+jtpniPT5EimsNWtZEBPtn/AAqP4DftNzm6/Zr1aH4LfF27Pmz/ALMnxT8TI/hnxVfyfNJbfAX4wavJaWd5NNIpFh4C+JL6VrnKW2l+J/EEmyM/CIZtp4AJ9xg54Ht3yAP8MDHI+dVZQVYKRj7pBBBB3A7hkFSCMdgCa8TE5LSdWeNy+o8vxrs5SopOlXasksRQTUKqf8zSqJX5akb6+lSx8nTVCvFV6KfwTb5oR0f7qerjbW32W7Np7nS+L/B/i74f+JdX8G+OvDGu+D/F+h3TWWs+F/Eul3Wja3plwMjy7ywvo4p0DZ3JMEaKaMq8byRsjtgKxX7wywGCACdp5ODjjnPPZecAivtTwb+1Zpvi/wAMaR8LP2ufC2ofHX4c6XarpnhPxtZ38Gn/ALQXwitFCpCPBXj69ilbxR4es02MfAHjp9S0SSJDHplzo0oWdcT4nfsnanpXhS++LfwJ8Z6f+0P8DLcCfU/GPhOxmtPGfw5WVsxaf8Y/hvK82u+CLuHBik1yOLUvCF08fmWWvv5ixjChncsNiI4TOKKwdWT5KWKjzPBYmTskoVW/3VR3dqVS0ntBz3U1cDGpB1sFUnWgrOdPVVqa92Tbin78Nb80b3V7qN7HyK7sAUKkA5AyMYJGctk4OMc5x0wRjIMYY5zk5HA9Prgjv9ePenNt4ZJFYMBsKEFSfVWAPXnqScYwORTSOvPfHp+Xf8+f6fQa+6007/C46p6JXW+99zzXpo3s9npZuyf46fIdvOe+emcnp1GPTnk+47DrHuB5weAAMntzjk4yM55I/DjhrHAxnHBznPPTpxk556Dnk0pIBx09wCRng4wPqeMe45Oar3vdWr62XRKyW2v3X77gr28nuuu66dPmr/cAco2dx2kdM8cnGO4PTH+OKVFjjnFxCiRTAllnhBhnVgQQwmiKurgksGUggk4GKZt+9823rkDPQn6nBPJ6YC5AwcVIx44wDztJ5GeevA569voTxknCnUVpxhO6s+aCldtKzV1Z23emit3L55QV4SlHXdOSe0dX6t2+7o9fd/A/7UX7R/w1jS18DfHP4qeHrBflOl2/jfXbvRGj/wCeE2h6nc32kTREHBims5I3GAysM16o37cnxT1wmL4n/D/9nX4zwyACaT4i/AbwDFq9wDhWZ/FPgjTPBvidZWGQbhNXWbeS28yAGvi0kt94Y645JPOfU49P1B3DqoPI6HgjGOeT2P68eoryq+QZNXlzVMBQjU/npx9nUvorqpT5Z37NSTW+jTt2RzHF0oqMa8+Vct4Sbmnte8Zcyato1LR9UrH2WfjF+yP4qjI8dfsb3fhO6kf59W+AXx08W+FxEzE7pIPDPxLs/iVpZwp3LAt1bRjGwNs4WjL4P/Yb8TPJ/YPxr/aD+Ety5Igs/iZ8JPDPxF0e3PZLjxF8OvF+i6oYl5BuI/CLvgbvs5Y7a+Q84AIJBwRjgggtnjrgjGenr65LTISB83PAGDntgjv9eRx2AJBHOuHqdJf7FmOaYXa1sXPExW1rQxft4xWuyilor266LMZzu62GwtZNvekqb89aKg279Xe1ne1j64/4ZU0jX2H/AAq/9qD9mX4iPK22207U/GWu/CfX5c4wrab8VvD/AIX09Z5MYWNNYlQMWHmMnLYfiH9jD9qbw5ZvqNx8EPGGvaQiiRtd+H8em/EvQWjxnzY9X8A3/iOzMJX5tzzKQMcBiBXy+8aSKQ4Vx1IcKcZzndlSQO+flOT1xW9oHiHxD4Vukv8Awz4l8QeGb2Bt8d34c13VNEuVcEEFJdNu7WRWGd25T1G4r1YNYPP6DXss0oYqCVrYvCpTlqtXOjOnGLW38N9bIFVwVR+/h5Unu3SquyacdFzRk3Z30Uu2qVyrqul6noV1LZ69pOq6HfRHY9prOmXelXEb5xtkhv4LeUNnIZWj3L6cVQARx8jKSORtKEkkDJUBTkc8DkdM8gV9W6N+23+1DpNoNNvvi7q3jrSSsaNo3xX0jw78V9MdFG0RvD4/0fX3VNuVPlyo23ADcDGt/wANT+EvEDf8XM/ZL/Zr8ayMw+0an4X0TxT8H9Zm3Eb5Fm+HPiPS9FSfb91johjyx/dHG0r67n1DStlVHExWqlg8VHnktPsV6dGMeqt7R7tbMaoYOpb2eMcH7v8AGotJfCmk4OTaatpyq6um7HyGAcHjb7MMH0HHfIHHOcCm56Ecj079ceh6e3r9M/W83if9iLxQn+nfCX9oT4R3crMxufAvxO8KfE7RIdxDFo9D8a+G/D+tPHHg4jPiVpGBGJOhpzfBr9l3xKjv4G/bBtfDlxJ5bQaV8dPg5438GMHfG6GTxB4Bm+JGjgK2V810ghOC5VOAU8/o0+VYzLszwkuvNhZ14L4VrUwvt4RV3u5Lv1u5/s2Ta9liMLW66VYxb+F6Rqcjb12s91ptf5HO49OD9B/kfgD0/NcEjI4PpkZP+I/L8MHH1sn7FPxg1qNpvhvrnwb+M9sCWj/4VR8ZvAOtapKuBtEXhfxBrHh3xg0zZA8g6GJuqLHvyg8e8b/A34zfDVyvxA+EvxJ8Fhc5uPEXgvxDplmQBncmoS6e2nyptORJFdPE3JUkYJ6aGd5ZiGoUcZhnP7VOdSMKiaavFwk1O93ezSafoY1MFiaUU50aiTaSkotxabWrtdNK3oeVEdskHr9OuMjvnvz+GRXvn7MHhuHxP+0b8DdGukV9Pk+JfhbUtUDD5Rpeg30fiHU3YKABHHY6VM8h4AUOTgA48DiMUrbYpkd842q6kjkDooUDHHAyRk9Sa+tv2URDo3jH4h+P5yHi+F3wC+MHi+GTI2x6zfeFZ/BHh35jkLI+teL7IwN182IbSDgVnnWJjHK8W6c4uU6TpQ5Gm+eslCDjy7uUmrabtJMrA0pPE0XKMlGMozbcWtI8re9lZW6vRa62Pnbxp4jm8V+L/FXiidvMuPEvinxN4ilmYljLLreuXt9udiSScT4J5+XDcjbjk9o+Y/TGCCMqAD0OBnIznvwMkVPLbG2EMLNu2RRYdWzuJwDyDj72dxIA9AApqD5gx3ZILMRuPQHOBxnOM5yMEYx7n08JSjRw9Kil8FOC5dklyx0S2Svtrp3005qs5VJzm3dc0ldJ6ptNN9Nkt9X33I3UELgkE56dAevqPQk+vSqy53EHkjIY+v1A6H9ABjPQC5+Xt/n/AAqGQYAIUAbhyMZ6jjAz1x3wcDp0NdWu1tH21a1V1ZWbVtlfv6GcGrpO266Xd7rp172+dnaww9hxz/8AX+oz0wMev4Jjuc4HGOB6cfzzyAeOMYpeSSSABzjHP5fh256j3payu1a1tL9nv1+6y+XqDd5X6aNp2fbbz289OnRDlifmycDgH+7nnt2OOQO3uC9d21tzEAMTjPpkg9c/3vpjmo027SR3PPPrzzxlhz+B9cinEL6k5IA68ZGM56gZHbPXB6007StbtulZbK+idne1vK+utx31tquVJdFfWKbdrK9krbomBzj1xz1xkcHGeep7/wCNLgg5UkHBBIJX8Bjp1PzAbsd+ai3neFPPGDjIwOAv0HIA79CMAhalA46k9s+vXsf8M+tTr97V99ul9uiW2qv1RKbT0uvvXZ7r5dU7Hq3wn+L/AIv+EGs3uoeHW07U9D16ybSPGvgbxJaf2t4I+IHh+RmNxoXi3RJHEV5AXYy2V/C1tq2j3qx6ho9/ZX0Qmr1nxt8GvCHj/wAJar8ZP2bU1S/8K6JAt/8AE74Nalctq/xC+Ce9wJNUgkVVufHPwmknLLp3jS3gbUfD8ZjsPGVtbXCx6rqPynnAwD3+nHP6d/qTx3PVeCPH3jL4Z+LdF8ceA/EWo+FvFWg3Hn6XrOmSLHLCrqY7i1uICr29/p17Az22o6Xfw3Fhf2kkltd288DtG3k43L6sarxuWSVHGqzqU9qOLUbe5Wim05ae7UXvQsr8yTi/Rw+JhOHsMVedO3uTTbnSemsW3t3j8L101TXH/KwDknGfkAOQwAxuG3KumCMHtx82BkjDKk5I4OBuJI4wQcj19OSRjjIFfZ+oeE/A37VtpdeI/hDoek/Dz9oa1tptR8YfA3TSlh4S+LCwRtPf+JfgTHcSLHpPidljkvNU+ErMyXOZZfBDzBBoY+L5Y57eWaC5hntZ7eWS1uba5heC6trmBzFNbXVvKEmt7qGVWimglRZIXBR1Ugg9eAzKOMTp1KcsPiqSUa1Cp8UZdHHT36b15ZptNaaWaWWIwsqHLOEvaUZ606i+HW1oy3adtLPyXUjB3MUOATuI4OOx6EjHGeBjHcZ5ErAHDZGASCMkE8HjqP5HrzkYpmMEkDDYOdpxjPPI5XPtkjGCe2XdO+ScnHfcQRg88Zzx+HAxXpN31u2vvd3Zu2mz/TU5FpZJu1ot8zvdpRXXva6eiT9WyNNwLE5BPABJBAyM9cAZHbOD0JzzUqbuh5BBGeuW4Hvj7vHHJPYZpQu/bhuwOAMjAGSD7ngY6dOnWnIiqDhs7mBzg8dsZ5OO49AMAZqXrs9b6dOz6vo7X66PQd48rSSvzaqz/u3V/W99d7q2x6F8IvAcnxN+KXw++H6MIovFvi7RtGvpycraaM93FPr+oPxkRWGjQ3t1MxBVI4WZ8qDt0Pjj48i+J/xh+I3jm0UR6Xrviq/GgW2PltPCujmLQ/C9jCAB5cVn4f03TbaFF+REQhQu7FegfAPPhDwx8dfjMWaGXwN8On8C+ErnIVh4++MMsnhK0e3J4F3pvhFvFmpq67ZoTBDLnAr5mQKiRooyY0VRk5JUKuDz3JB54B54xXgYZfW86xNd3cMFSjhab0ajUqKNatbs+T2Nu1mraM7aqVHB0aXMr15e2nvbljaMU9r2d/lrfTVWAXGDjnkex47dyf0PIHdG4GTzx69MZ9M8cdv6UpJZiTgkkdv8/h0pGbcTgc4Gc89fU/Qds9e/Ne8lqlq7Wa5bW1UX83q09XpokcTSet16Ll2urdXbd3fkujYmc9D9ePfH8wc/060mOpHIJBx+XQ++Px9utLz6e57j6cYPPTIB+lGM89wT/h/L+nWqfT019brbyXnqie/pr17frb/gh0H4e+fb1P14JoBLdRjnv7/gMUvHA7ngHjJx+HqfoegFHTHJ5zx6H2/Dr6geuTSTsrvrq9/JX28+mn42NO3z/rT8GA2jOepx+PIH/wCr3/Vdq8Hp9SM8/wAhyeuSeuKFBYgZJOBjuVAI54GR1zzjHXjjOtougaz4jv7fSfD+lanr+r3TBLbSNDsLrVtSnyRt8qzsYZ5mIztICDHAYjGTlVrU6MVKpOMElrKckuz112t389e9KMpWUVKTdrJJve2lkk1dNJ+lnozK+XAIBz3zyPpnjpnr7jpzUYJPUbR2ZsgAj1IAGcds89O+a+iP+FBTeF4kvvjL498JfCW3ZBKPD11cDxh8SrpSodY4PA/hua5m06ZxhV/4SPUNBCSMVlAKsBWfx38FvBhCfDz4YXPjzVolIXxh8ar1LqxjmONtxpvw08NXFvoiKpGUi8Rar4hj6iaJhuWvOebRqPkwVGti5JWvTVqaem9adqb/AO3XKVm9L6LojhJQSdeUaOq+OSdSzs3anF3TS7pK7d9dV5v4L+GnxA+I1xJD4H8Ia74lSBS91fafZsmj6ei43y6nrt0bfSNOgQAtJLfXsEaIGYsAtemj4VfDfwYyn4t/GDSDqUf3/A/wftrf4geIxIpINtf+KPtFl4H0mQ7drSQaprTxknfasVOeB8a/GX4n/EC2i0/xN4w1KfRLcBbXwrpQg8OeELCFSoSGy8LaBDp+iwpGMrGTaPIVGGZjyPNFVQoRUCgYCooGwdMjBKnoG74J65ODSVDNMVb2+Ihg6bSbp4b36ttNJVaitbo7U1r9rW70U8HStyQnXl/NVdoJaNtU4tu+9ru2i0s9PolvjL4N8I7YfhD8JPDvh67iwIPG3xGkT4l+NGJUJ9otbXUYIPBujzkkSKLLw9NJbyKhjuiQDXkXizxv4w8dX51Pxr4n1rxTfAHy5tZ1K4vI7ZQAyx2Nm7rZWMCggJDZ29vFGoCqigKF5fHHG0bSDgBsjgdOcgHngdT156KOckNnjoD3IHXOe2MdduMY656KOXYPDtVFTdWq1eVWs3UqPbVTmpNXetk0o30WtjKpiq1RcvNyQS0hTXJFL3bWSS12953b31erXGW3seeSowAFJABAAAXoBnqOndVpHA2sMdRjHXqeMDpgjjoc/pSkY6DHToOgxjOAPTv3OMnHFGOCOT25PUZzzjPB/wAM5xiu29rWVlfZJdo97d3t08jmTWl09Hu9W9m9279Vrvu11cJwAcZ6kDB7DGBjv3A/xxg4x7kDqceuePX268Zp0igEc4zzkEcHI6Hrk57Z49KZtGBgkkZz9ARyc885+gA6g5zSs7PTVffe2jfXy9dDRWsnzaaN9Ve6d/0+em+qMc46fTAGeenPJOBxn/69OI6jjnPJHIwQFOBz1B4PTnPBoHTcvYnpngjGDg8jk9T6gd6kAJPPAOcZzg5YEE+mQ3XBwRk9OG3a/wCfVeVvR39F8mW5VF6rW7e2l46JW3TWrS9eg0bxgbuOBg4OTkZHBBIHT8O3NSHODgZPboM/n+R/p1o6/Qj1zn+nTPIPp9KOceh9uc8eh/l7Vnf4b9Xdro9tX013029TNvyvu9r38m3u/wDPR9E3HJ24yep5OOmB6DPJ9Tj0AwnzHht20DkZHX198+vbrkEEmSk7EZ9fwySf6/zpJ6x9V+i/C2g4vVX7rXqtVqvS2l/yveEA5xtyeRgZ64/p1+nXil2dfoSA3A42/THcjP6dDJtA6AD0x6A+n19uOMdjS4HPJPUZPB5P0/L+tVzbNWTtbVea07W9XtfYG1dOK6a3ve+my6K6fXZikA4GBxgAZx045J7f3vUZ7mtfSvEN/oxmWEQXVhdYF3o9/F9p027XkgzWpICSqH3R3UDRXMJAeORWrIH+P6/5/Kk+U8dSPUd+M/06e3tUShGcXGa5o9W07rbrZ2au9O+t9Sqc+R3Sd/Jv8bPbttr1Ovl0zSddzL4aMtrfsWaXwzezB7gbFDudHv5HRL+MkPts5VS/UBUQ3mWauUIdJHjkR4nR2jdJEMckbKcMrxsqujA8AMMjBz3pg+U7hkMMbSDtKkHgqy4YY7Hsc8V051uDVI47fxAktxKihItchAOqxKBgC7ztTU4Y1CqizlbqNBtiuSo2nKMalGVoylUpSWjd+aCfKrJ6OSXZ662u7O9KUZxb91Sta17J3tZqz9NNdOm5z6nLEZJwMnqGGOp5z34GTnIpyjJXBOAc89cZGRkc9MBjt4JGfStC+0uWyjS5jeO8sJiRb6hb7jbSEHCpKsg821nA5MEwWTupdRuqmgJK8AcqTjqMMp7565yOTxjHrXTDlkrrVb62fbVden56aaZu8bJpd7aPWyd+/VNr5bGd+AHC9SGydvYDbnBBPTkdMkU8jg57A/UYHHGR049B6dKhjLZIIGRjkDggcDnoS3zc8HPT5cEyjj5sjB5/E56dz78e/HSiV3tfXWy1vrHrunqrb6WC1rfKy7u0b6rvuhSccYz6e556cZHHXpj3poKhSevOSB1yT05/nk56k5zSsSPm5wOSBnPYjAGO4yc9Dnpijbngbck5wR15JGentjP4A1KtazT1evnZrS2/X1/FAraX799Ol/w9PV7JeMn19M9vYf55zQDn0zxkeh//AF0YIOeCDgdefw+meen59VwB06nk/wCf8+w4pNdbdElfTVWT3t5/0nZevbT8N+u3/A0EOAOee3HX8P59e1AyefU8D0x6jrnP4elLj9e/UHtnjqPcZob5Rk8devHQZ7+3P056UO9rPfzaWmmlum3l8+h089fu/wA/+G1uH+f8/rTTkEEe+eDg/XHP0/Hn1ntoLi8cRWkE93KxAEVrDLcSEtjACRIzHIHQDseK7O2+HPja4iSd9BuNMtpORea7cWGh2oU7RueXVri1IQBgSyq2VJKrkVjKvRpu8pwt2bW90mrPXS9u97aPY0jRqytaDa36+XbbTutfkcRtP6HjP1PA6nPbt6cUwnGfofu5Y+2cKfp3xgjBxXoi+CdAsQr+IfiN4VsZAObDQIdR8VXwIwXQNYwQ6aWO7Of7Q25XaTTzL8JdOZgtl498WyADJmutH8JafIcLkmOCLW78ozZABliYqRyNtYLH020qVGvVd3rGm+XS32mox+fMut7o0WFfxVJ04bczbTaTte9tflZt/dbzcsOckAYzyVGPzHUngjJxVqxsb/UpVh02xvdSmcgLBp1lcXspPAACWsLksc4xhm5OMZOO8Tx9pmmlD4c+HXgjTJFDILzV7a+8XX33gwctrl5Lp4YYBO3TlXJOEC42wXXxT+Il3CbUeLdT061AKrZaD5Hhy0VG2naLfQ4bBSn3QA27O3ls4pqtjp2UMNCmrWTqyTaXuq9o3Wu9+ZXvrfW7UKEfjqynvpCGlvd6vu766al20+D3xFuIlu7rw2+gWThib3xXqGl+GLVUGNzudZubSYqMjO2JpATkoQBiyvw/8K6cwbxN8XfBVi6na1h4Xs9a8a32MjISXT7O00lmAJK51QKSuNwBGfLbqae+la4vLi4vZmO55r25mu5WJxuLSXDu/J5yWyQPyiRMbQchQOR2GOwGc446DtjHPIPq+NnrUxcaS0VqVKOiVtFKbl56tJv5jlWoRa5KPNZK3PJtOyir+7bbz6aa6nsKTfAvSAN1p8T/ABrKNwCtc+HvAmnvgoAQscfiXUvKYbiV8yKTBIG0qamX4paDpixr4U+D/wAOdIniZDHqPiKLW/H2o/LjDOPEWpNohcbmPGiBSwwF2gCvHMeoBIXAJUZwfUnJ6fz4zyKMkA4B3AcZJxyMD5hjtzwd3rzzWby2jK3tq9evt8daSTvy7wg4xskrNSjZ2V77gsXUi0oQpR81BN3tFWvJuUfJKystW9G/YdR+PXxdvYXs4fHuraJYS5jOn+EYbHwbp6xuQTGLTwzaaYuwY+VctzjJIAWvKL2e61Od7vU7y71O6kcs91qN7c38+7Azumu5pnYscZORyAOxzAA+cgDHbn69uw5PTNbXh7w5r/ivV7XQvDejalr+r3jH7PpmlW0t3dSYxukKQKRDBGpLzXEpWKFFaWWRVUkV9UwOFh7Vwp04wtdtRV7Wd3Kzu723+fYz9piK1SKdSc+ay5VJ9HHre/3ab31TMPZggAY2t0VdvTAx05BGOpYDAzwMV2ngv4d+MfiFfTWXg/Q7jUxaJ9o1bVJJYLDw/odoozLe67rt+9vpmk2kXLPJdXURKgiNJG2ivTk8H/Db4XkTfE/Uk8d+LYQxj+F/gfVojp2nXMXyiHx145tGms41jlH7/SPDTXl26KySahZsWxxfjf4seK/Gtjb6DKbDw14JsZfM0v4f+EoG0fwlYgMSslxZxyvPrd+ASJNS1241C+lOD5wyqjkWLxOLk6eAoclK1vrdaNqaWmtOCtKduj0hdJqTOlUKVBRliKrct1RhJOWnLbma+HrpdtO53gX4M/Csr9ouLX45+OrckG0sZL3S/g/ol2rlStxqKPaa349lt5AGMdmuk6HOVZTNeRMd3AeOvir42+I8tqfFOrGbTtOAi0Xw1plvDo/hPw9bggpb6H4asFh0yxiTJDSLA1zLndPcSt8580LE8Ert67cYC5IHAUrx6dMHHOKejKeR8vJ6nrnHUdF4HAzzknnHG9DKqVOca+JlPF4mL1nVtKMNnenDSMNdbKK2Tk3qRUxc2nCmlSpOyag3GUtI7yabk1a6d++iT0sO24+3rgde3TpkfTpzzTBtyM5xzgcjJHPpx07jPcd6ZvU5wwOOvPHf8/6+tDEAgg8j7uGz3HUDjp/un29fSUU2lJWTutNLaaKzv8l17nLF8sk3pbfZbW3v36vTyZ9KfAy5bxb4W+LXwSnYSP448ML4z8GQEKxT4i/DeO61mxitQcET674aOv6OVjw9xI9tGQ5WNK+ZxJlGP3dwVipIXk4G3jPIOFIPA2kEiuj8H+K9S8C+LfDfjPR3I1Twrrum69aAHIkbTriK4e3cc7ormJZbeVDw8cjKwKnFehftAeE9N8LfFLXn8OoG8H+LYLD4heDJEA8lvC3jW0j16xt42Hyt/ZUt3caRP5efKmsZY3JZDjyKEfqeb16V7U8dTjWgm9FXp8kaiSa1c4crXW6k/N985Ovg4zSTlQnySsknyStKOq1bUrx62bXkeQqVGQD04YAknkA4xnoSPwOepxkYkDGRjn0P8J7gjPbvx3yOKjUtjdsGCc43e2ew56g5HUHA5HAzcEHAYg/m3A7AY7fh3PT2HzNrtfo00m0r9bav5P5nmqNv+HXktbaLXReVtXq2bgcgnOCORxzweSSB3+nGc9KQeWrq4QF0YGJ1Uq6EFeUdQJEb720qykFmOckZZ2AA+v0/+tx7Y6DPVMjGD39cg+nXg+3fsepzROMZpRmk03qnHfa+jTvfta3TW2jTktU5K19pNdt0n6Wb+R7T4Z/aE+MvhGx/srTPH2sX2hbRGfDHitbTxv4XeIEfuX8P+LbXWNOSPGFIggibaBtYFRXSr8YvhZ4nc/8ACzf2ffC0l1Jy/iT4Qa/q3ww1o5K7pX0KT/hIfBc0g+VxFHoVhGxyuEXAX5yGAc9evfPt/wDXx2NGc9zjJxn+n889+vSvMq5Rl9S8o05UKkv+XmGnKjNyVrO9Nxd1qlzdvQ64YzEQXK6iqxS2qRjUVnZaRls/xWtnY+jT4H/Z18WAHwj8ate+HupSORFonxn8IPNpmSBiL/hNvA0mp24VT8rXF34etEwfNZVBIWrqX7LnxhhspNW8L6No3xT0JFMp1v4S+JdH8eW6wgZEtxpmlXB8Q2WQNxS80i3kjAIdA42j57bJBC8dOD09uxHHOOCRnGcHm3pt9qOjXUOoaNe32k30Db0vdJv7rTbtXXDLItzZzQSoysMgow/hBHBAx+p5jh3/ALJmM6sFZ+zxkI1dPd09pD2c9Fde85vW/paxGGqXVbDKDd/3lCfLe/Lq4SUkr67cqa7W1fe2V9pl4+n6rZ3ml6hC5Saw1K0n068icH7j2t3FDOhBByrICOeOMiswwD025BB5IPBOAQMAfUggZ9a+gLH9qD4vCzi0nxffeHvivo6KqrpHxY8M6T42VIgAhSDXL2CPxLaMAQols9YgljVcq/ANXf8AhOP2bvFjD/hLfg74t+GmoShVfXPg74xXV9FVyNxmfwR4+ivJBHgAtb2Him0GD5cYXIxX1/MqFvrWXOrDS9XCTVSPS7dOfJNWs9EptbK5EqOGqNOhiUr2tCtHlbem0kmnq7ptxX3HzgQRgZBzwADyvY5I5zjjHpwKYVJ4LAD2H0Pvz07diPp9JJ8Evh54qBk+GH7Q3gLUrmVh9l8M/FTT9T+EviVmOCtul/qLap4LnkXO1G/4SW1iZgWJXIrmfGX7O/xu8C2R1PxF8M/E66D99fFGhW0Xi/wrLGQGWaPxN4Um1jRjEy4Ys97GQucqOa2o5vgKk403UVCbteGIhKjNO66VIxbtdpNaN63d9G8FiYRcuSM4Kz5qTjUVvdu/dvbyW/2nroeKEfNwOeg4IyAuenv3OOv50wNuJBGcEYHp369PceueuOj4vLckQyLI6j5lQoSp4GGGA6kdwQCSDuGTwffJwWU9SSvY85IIBPHI989zXqwnCavBqcWrpprbe636fg7mKSfu2fupWumrO8dbW17N9uzdhMdOoGTjvjlQCQD3GQcE8A8jGCrMFJGADgZ5JyMf7QHPHAB9B/dpGyQAoyRweMZ2sTkAE9ec4Iz27bU2seSNoIJ+YYwQpGB3Hy4JzgnHO4qaSldX81tffyXXfrt0T0Zm4tK683onaO1tdddG9dF27sbG4k9zwDk8tjHA5wMY+9u5BIbkh4wBkccZP5A5x0Gf6d+DTSXC4yARwV4HIK9+Mg7s9Og4yM0oPXlVJBOAMgdDkcHOO3UHpjAIoltazS63u3un11Wl9NbaavRCavbTttfpaO+t+rdu9tdh9IM8fz/z6/5zQBzxjPfp0ye446//AF+eaMMRkHkY7cDn8fw+nuaztpq0tbar0620VnfclK/ls+yS0tt0/wA+wc59u3t06/r2P17UHt14/r+nvzn6Up9/898/1zSZ+nHXv+H1z/8AqpJtO636afL+ra/eNNpprcX5QOnPbgDHTv3J4Az6DB4pudvzDrgnHc49we36A9hTuPz7/wAvr2pOD06jjqfxI+mcH646E4qL16q+l3qr6Xsr6Lsujd7WHG11qlbvbXbTXTfbT/MMhssPwOeSA2NpOB+Ix1HsDUiP91W645bgjIx1weOvTOeDTAcZ4z7evbn6dfXjikI3ZGduehGTj+R/DkHvx1aad23Z9HZNpLZJffrbz6WKjJJO+mune1krfh21+WlwFlIHPAOOeB6dcEcnjqMYxj5a7j4e/Ev4gfCXxVZeNfht4v1vwR4osAY4NX0K6a2e5gdsy6fqlmyy2Os6TdBit5pOq217pt5GfLurSaNsHzzc+GU47YJ5Oe/07f4ercPjBbHHXnpx7gYOPT+dZV6VDFU5Ua9OFWnOPLKnOKnF3S3unu76WttdXWrWIq0pKUJcsrpJxdmtne7au1q7e87rtofch8Qfs+ftNuR4xg8N/sufHa9ICeO9BsJYP2eviNqbFiX8Y+E7OGW4+EmsX0pHna94XS48HGd3mu9A0uJmlT5u+LHwc+JXwR8QQ+HviV4XutAmvrdbzQtYimttV8MeLNLYKYdZ8IeKNPmudF8SaRcoVkivNNvLgKHWKdIZgYR5Uu47gw4PGCARwOTznqM8n/6x+iPhX+0p4x+Hugy/DfxNpWi/F74KalcmbVfhF8QhcX2gW9xJ8rap4K1iFxrfw98Rxq5a31rwxd2mXIN7a3qZirwVgsflMnLL5yxWDT5pYCvNylTjppha0nzKyu1SqNwukoyglY7lWoYyPJiIxp1/s4inHSV3HSpTirc195Rs92020z58LDJIySeMcnO7jDAdB3HXHvkAOIDKAwKlcZGDnr279PlzjserYr7Hu/2f/APxjtLrxL+yb4i1LV9Wt7eS/wBY/Zx+IN5YW/xc0VI08y4bwFrUf2XSPixo1ttcxRaYll4vSFUafQbhmeWvkS8s7zTbu80/UrS60/UdPuJbW+sNQtp7O/sruFzHNa31jcLHc2dzC4ZJYJo45EI2sitmvTwWa0MbJxg3RrQVqmHrJwrQleN4yi3qt7SV4SV7Nx1Oergq1BKUkpU5K8akHzRlona/2d7Wesdn50HjAGSenIJz+Prn2Bz35GKMfKCPmJGemOAfc8cgfl+cpB+64Kjcepx0PAb2455PUg+gbgqMHK8EAYBGOuM8nqeOSORj1HpNXtaz1W+1tHbe+lr7pWffU54rnjGSk7N82260su6d7uWu+zIyoJI2kHp15PGCeud3bnngYpjKBkAcg9cg5B4GMHBwcDOM9+eDTgWLtjnJOAMdQCec9M89O4HPGSnzZ5HQexGCAwPbd0x8vHIPekru2umnovha09b7K+q0tYcXK61asor4ntZW0vd30XqxEJDYYnLd+gUd9wPY7SNwxgcetSJtJJZhliAoOcjjgg+uc5HTtyRkQ4OehJByGIA5OcAqDxwCM8jJy3TBZhwd20e3oMkkZIOce3t24y+9nbRWWnfTZei31WnrWmrukrbX3vZJ6XsrW1/LrdJRSSzAEkZG4g5OOcD1zwAcDJzgikJHJ3gHB43En3H3ehHvjjngiq7FnwzdSFxjoepIIwSuOBnHJ6DJxSNwT16E85LBScDoDyBxg5zgjuDTSvfq7JPbXbbS+un/AAyFFXaV7Sej1vquRPs32evZaWLQUY6Z645JA9D949QRnGSfXil4BIZeADgjrg9Bkk9z2wQT2I4gjcqoG47dw5IDYUHkcAE54I+72xuAyZ1eMj744Ukk9c4POeTg4OMZz0X1MO+nuvo9L21aevRPXprey3TGlJpa2V31dk7x6376NaW7tsUBccLwOnQHjpnnPtyc560ZZSSvXGe5BI6/LnnAHTB6gA8GgFccEd/zzz1/GgNkdQM/Q9D0/T6cjqRUavd3S3i7WaTTS26a93b01zaaad7ro1o9LWfddk7PZLSyTemxZknVRHMuSsifunDA5BEkJjkVgehVhjAb+6R7f4H/AGkf2g/hwFi8DfG/4o+GbJBk6Zp/jfW5dHK5yI5NF1C7vNKmiwMNFLZyxMowytyD4cMEjGCee+T/AJ9B7/QUoJPBxyc5+nXnAJ6+5549KwrYLBYmNsRhMPUV9qlKErpcr1bWrfS5rTxVamvcnKMls+Zu+i9bLTy1W21/sZv21fiZqyNF8RvAn7P3xeilINxL8QPgb4Gi1u4Xgtv8U+CdO8IeJPNc4LT/ANp+dnLhsgvXQ6H+078AG0Txz4d1v9lJfCVn8SNE07wx4t1D4KfFzxB4dmk0HTvEWleKo7PTdI+IWl/EGxsvN1rRdLnuI4p0WeG1e2YxxvvHwvgHgHdjGT1HPPOSflOCDnJ5AOM00tggjaByMHGW4OMhWJHAHYfUGvJrcLZPVSUKNahaSlbDYmvQhzQlCcW6VKpCEnGcYyTcWlJbXVjrp5rjIpc841HytfvacJ2TSVlKUXJXjo1pv22+sZdB/Yy8UkyaN8Vvjz8L7yQAx2vxB+G3hX4iaPC5A+SXX/A3ibQ9UeLcdpuB4WlbHzm1ZmArNf8AZt0rXmz8Ov2jf2ePHhkYi306/wDFus/C3X5M7dkZsPifoPhvTvOdvkEcOsTAEn58AEfLW4ZBGdxbH93jABwSPoOOOPQGlcqxw4V1xjY6owbjAPKkDJHO3pnPPJOyynGUP91zfFRSelPEQo14LbqoU6r261H631J+tUZa1cNDe8vZSlSd09PdbkrOzimkl97R9E6z+yd+0Zods1/J8IfFOu6ai711jwONN8f6O0ZJPmJqXgu+162MeMkOXQYIIRcivD9T0fVtDma01zSdV0S8UlXttY0670q5jIwrB4b2GB1YAkMCAVOOozUeka5rfhydLvw/res6BdxMHS60PWNR0iZDnAIfT7i2ZTxuGMHOSfb3bR/2sv2h9LhSzm+K+veJtOSMJ/ZfxAg0r4i6WYxgBHsvGun65HsIO1kBAxuIK5AF/wDC/Sd39RxautL1MNJpct1r7aP3tXs7O4m8BUT/AI9HtpGsr330cWk7q71d+ttvnUDkgEEkEghlOc5Gc/MD2PB6YOcEGnYBwM4I4Pr0zwO/PoxznkdAPpF/2h9I19sePv2evgR4sZjvuNQ0Dw/rHww1ybOCzrc+A9X0rSlm7rJJosqhm/1bYAqymu/sheIEI1HwF8dPhffSnP2jwr4z8K/EbRYGIXDLpfiPSPDmrmJTuIU6zJKw4DEndUPNMbRX+1ZTi0kk3Uw7pYiFkk3pGXtHZ7WpNva19QjhaUv4WNoyvZ8k+anLo1rJOCV/71r37tv5jZOcqeTxjuMDB468Zzk+uOhqULkbsDGR1wMccADvyx592x04+mB8Jfgdr43eCv2oPDWnzyZaHTPi58PvF3ge4U4UmOXV9Bj8XaQTnjzGmhiI5OwUjfsm/GPUVNx4Kh8A/FG2OCs3wx+JXgnxNdSBsFdmh/21Z+IS5Vs+W2kpIpIQqXBUXTzzASajVqSwkmk0sVSqUHf3dvawgraLy87bE8BiFG8Iqs00/wBzKNRJWS+w3rpd+d1pY+bApPBPPOeOmMdee+eOv+BjAJ3dMfQ+o9D/AC9cV3Pir4Y/EfwHK8HjfwB408Iupw3/AAkXhbWdKjyFAys9zZpbuoLD95HK6t1Bx14FZIpP9XIjg5A2yKxOO4GQe/XFehTr0K6U6NejVi1pyVIzjoltZu7atv8Apc5ZUqtN2lTnF/3oN72srtWb9L6/hJx29O4H49/y+tRMc5HHYdDk89vcHpxkcketDhlJDEq2CQpzzjBBACHgDn3FNABOc9D2wRn+H+AdwM88HNbpO172VlLyduV67/grvVit1emito9Pht5+W9/xs61urqyure/s7m5sb3T7iG8sbyyuJbS+sby2kEtvd2V1AyT21zbyqJIpoZEkikVGRlZSa+xrTxD4M/aqSHTPiPqujfDr9owQQ2nh74s3f2fSvA/xomhVYrXRPi6IkjtfDfj24VUttN+Jsapp+tTbIPGkcc8keuRfGpTnHQ/5755B6ndgcHJqzGoJw22TK7WVlBBByMMDzggnjrjkHJrzsdl0cZy1aFSVDF09aWIp7rRcyle6nTlZc1OV7rs0pLqoYn2V4ySq0J8vPCXM09leLfwyVnZ30bttc6Txh4K8UeAPEmr+D/Gmgap4Z8U6Hc/ZdW0XVYDDe2cgw0bq2WiurS5hYXFnfWsk1ne2rxXNrcT28kcrcvsCncGyR0wVPHqOnqN3Oc9OBkfWPhT4r+F/iJ4Y0b4VftC3F9NpGjW/9m/Dj4wWVmdU8c/ChCx8nSNZAxd+OfhiWI+0+HbqZ9V8PoXufDFzF+80+68b+K3wm8WfCPXLXSPEcVjeadrNqmreE/F+g3a6p4O8b6FNtNrrvhXW418m/tpVZVuLWXydR02YtZanZ2t3HJAvNgszq+0WBzCEcPjFZQnZqjiYxt79Jytq7q8G24v+ZNMqthU4Ovh5KpRbV0n71JPldpLy0s03zbb7eanPGTg9+Bg8DpjjnnkcdCKAXI2jvg8kDCg5Yk8AADqeg45ABNQDzs5OFBxjODkZHoPunP3u3brzraNouo+I9Z0bw5pcLz6t4g1fTNB02GJTvkv9YvoNPtVVV+Yky3CEfeIUDggGvXqy9lTlVm1GMIOUmtLWV3e2r2bevd9k+SnRqTqQgr3lJJWS0UnHlbu7t67p23dtUfQ3joDwX+zV8F/A6nytV+KPiPxZ8dPEsX3ZDo9kZPAHw5gnHzHYbfTvE+q2yMSmL8zRfK5NfMYXAz1BJJ4PX9Bg8d+5x0r6G/af13TtX+MvifRdCmWTw18N7bQ/hL4V8ogw/wBjfDjSLbw280O07duoataanqbOn+se8aQ5DDPzy2FO3nIz79yO2ecDkZJ69hXm5FSlHAxr1E1VxtSpip3Wv76fPCL0/wCXdNxp+SVrnVmFpV+VaxpRhTSXaCjr/wCBK73V333aSfT+vp/9fntj8KX0PY9eOnQn6Y9TjPtyKBgjaACeenqSOoyR1OPx5qQKEBdyFQcbiVVeMBiWce/vznOelevzWS57Rslq2o6ea0tp/wAOtDiUZS2i36LfZfh+FyPGTgdj0zz9OMexPHT2yaGzkYBOAAQBnk9e4xg55PHPtXrngb4GfFL4i276j4b8I3o8PxYe88Y+ILi08KeDNPiXZukufE2vzafpTxqDlkt557hhkQwuwC13h8Cfs/eAd3/CwPilqfxR16EAv4Q+B1jFDokc6EBrXUfib4pt4rJkDFUlk0Pw9qasMmO5Jw1eVXzfCUpqjTcsTWiklSw8JVZXb0UnC8Ya9akkr7PS51wwdSdpS5aUOVPmqtQ3teybTk1d2snr00R81IhZkjQEyO4jjhUF5pHPIjjiCNI7tkBVVWcngDpj3rw/+zb8S9Q0y38S+KoNC+E/g+ZRKnij4taxB4PtLmEEAy6TolyJPFGuEhsRJpeiXSTMwVXzzWg37RF14WRrb4K/DrwX8H4hGYB4itLd/G3xIliIIZ38ceLBfz6bMwfLHw/Y6QqOMwqmFFeEa7ruv+KtSm1rxRrer+JNYuH3y6rr2p3er6g7MQSDc3007oAediFYwQCoUfLWKnm2Ltyxp4Ck3ZyrWq4i2iuoRapQlru51LdY9BcuDpPWc8S1raL5IJt6ayXM0tU1aOl9ep9B7/2X/h4CFk8ZftEeI4GyNon+FvwsinVyCRzc+PPEVqpVGTafDyTxlh+6DNjm9d/aK+I+oWEug+FpdE+FPhSUPE/hf4U6UPCFpc27HGzVtctpJPFevsVOxpdZ1y8aQbt6nJFeFbRnOOmevP6j1wOnoDwAaTIOT+PTHHqB6f4VdHKMOnCriZVcZVVnzYiV4fZvy0Vy0oO705YJtpa9x42o4uNGEKEJW0pRalZpaOb953d7JvZ/c9mLNI5yWlkaRmc7nZ3zuZpJCWkYkhizsWJGDlqgcck5AI6kHnofUnjHcEMeTkjgyHvjqOn19Dz0/wA8dk+VgMndzwCMDjPIGOc4JxweT1GBXqx5YK0VaKsrQSSVlFbaJLTTX06M5b3d3dtvV6t30au/npqm9bNkakEHgZyMYBBB4A4J6jPp0GSQCcjDIPUFQOMkErwDxwuOpwc5Oe2TUhUdjjHXAzu4HbluMDkc9BnOMG3vk8bun+0c/p/9eqc129U9O39WV73bfW5dJ3S3tfXe3Lq7JbpWe71aZEctuyMn044zjGcA57jvgjIOQcPIxnjHUggDOAFXjBGM4wcDHBzjFO5zz+hOD07fy/E4p20g8gAAk5B55IOO+AOR1yefTiHPur37WvpZu13ZrTbzDmk9WrJaabdOruui0ste9xp578AjAIHDAHJ44zls8dRweSSVHAJzxg9Bycc9c888n3OaDu4xj8f5dP1zRtIJ5zjIz9STjp2PHvnI5BJNXbWK6327dbWvttrvclrTe2vn5X8tvn36Cj+VIxOGPfB/M/5/DrxSc8ZHJOODxjnnn/8AX+PQY9COef8APOeBwc9R6jihu2l1o+j9LaLbbfRvXzBLa/e3T/NfovMGxx65/DqCd3PoO4PAB6UpweD2I7cfhn8j37UcY65+oHTA6/zIIoGOMdO3+fx6dBxgUX0Xq9X0emq07dtdn0RS29Lv53V9emm3W/qkAAByP/rfl78flS0UUvX0+7/gEiYAGMcf5/zn8aX/AD7+/wDSkwwJzjHb16dPz7/UfRMMT2x9SOw74HGfXselD+/T9Fp8tvl5AO/H/Pp/nPHv0KB9Pf8Aqf8APek9/fv9R9fwz9O9NJvt2vt27bvW2v8AkAv44/z0o4zz+foO/Y4+v9aaxBwMZ7D2PX1GCfrQDnHb1GR3OADkf1B9s1SjpF9bp6dmlv8A1113bTs3bzf/AAz9L6drjv8AP+f5fSjr369/8jv/AProGMk5P0zx+WOOmB759KMZxgHsfp3B6fzx71ert2d076a6fL8bahZ6dNbPy2vfpZN+jsXrG/ubAyGCVTG4KzW0yiW1uEOMpPCw2OBncrFQ6tllKkGtEQ2F8wksZVsLrIL2F3Ltgd8gEWd2zHajMM+TcsNoOBK5FYu1enqDnvwDgZGWJIHHVsHI54yuQpyVBAbjOPzP3TjPYEnv0yaycE23CXLLS9tU7tP0dtXfp5FJq60ul5a7Jd7N3V9L2VkVEUNkEnBwc4wOD0yw6njH4dKkG37uTgA9vr+Gc+h655oWEZUy3EMSqwyVzIyAEHIRAS3fkldueSDk1eH9kRKxAv7qTAJ5htImJ255/eyAnHDYU8gEHAJuT2sno4p9tWrWXdeSejBqy+KyaXTm1VlfS2/Vrl37GeWIzkgduvII65G0/n07dQaIw8jbIQ8jsMBYUMrHPUYVSTkE8ZOeRz30Bf20OxrbSbPOdrPdvNduDkEnDMkQbqcbCDkrjAKkOu6uQVjvmtIwpRY7GOKyTacAjMKo/wBPmJPXPpCdR2Sgo3stddfd+btbRaLS++qa5brm1Xu7JP8Al0trrZNa3W9lq7SwaBq8kYdtPkhiY8zXhhs4gAR8zPctGMAHkDBUtk5xVldIsoC39oeIdHtCp2+Vbefqdwd2DhBaQ+QCPvDM6bzwTjFYEsrzOzTSSTO+dzTSySkknOTvYknGM5Bz1OTimDrgcAY64AGeBjoeg7YBxk80nCrPVyUV1t52S6Ozfpe6ttZFqSW0Ozu9F0tbvdbaX1SZ1P8AxSVocv8A2/q4xjbF9k0eItlOhb7XMF4ynCsCQcKQamh8T2FiEGm+FNCjkjwVuNU+167OSNoBKXM62obg5UWxUhjwFArkwMgbmDHA65I/Ujk9cDt1AyKdgHgnIwOMYBHPboRn8fw4GcsNTaXtJ1J3V2uaST2326+W7B1ZL4VHe+kbNrS1m1e17pbdNDr5viJ4wlQxxa3Np0DAgQ6JBaaNAFIAIA06G3bAChRlixCgMeGrlrq5uL5/Ov57i+lcFvOvbue6k5wAS80jnOcMc8the3BhIAznOTxjjJ5HHzemT0xilwOfcgdT9RtGeOh6Y6ewqo0cPGzVGPTW2l/dTbb1aWnRa9U7k+0k4py5+/xd7J7NbW7Wvaz1GqD8xbOexG0Y4BwMHjGB6fw9gMSD1yARz7+2ePY46j6ZphBPfn8h7Z64xxz2/kpB9upz3/I/4dOx4505tElaKslZLRWt063/AKe5Dd9brXdO+lrdu9l0D/Off6fn+VHPqM/5we3cZ/MCggfn1P07ntx15Hp7UgOTgdBnPJ/LH8iDxj04KS0bvb8um+r+62v4JW0b7bdrq173v/wfwEOATj7x4+mf/wBRP55PNAY5wccY59cg4wPXj264AzT8DPocYJ5/lz0PHT9KTIx8wIGdoOSCWJwNoxlzkgYUdxwwIy7pJt2UUtXJ2WnLv09H16+dWb0Svqlo/ev20vp0Xne6VtWliQcDnqcnB9cj19+OemOantba6vLq3s7K2ub26u5FgtbW1hkubq4mf7kMEMMbSzSOcAIiMzHAABr0XS/h0ILSHXPH2sR+CNBljE1tb3EH2vxZrcRUtGui+HFaO48uZgEW/wBQazsomYEyTJ8taU/xTtvD9rLpHwp0I+CreaLyb3xPdzpqPxA1iP5fN362VWLQIJuc2Xh+O0KqSJLmYOWPBUx0pydLCUnWmvdlVlpRgvdveb+O138KfbS5v7BQSlWfs07NQVpTkmotaN6LzduvRFyL4Z6J4Qigv/i7rr6JP5Uc9t8PfDrWuo+PdRVxlI9RYu+meEYJcbZJdVkfUYQTjSnYDNDWvi5qx0258NeA9Ntfht4Ouf3d1pHhuac63rcQDYPirxZIw1jWmdTiWz8630pSSsWnqOT5PJJLNLLPNLJNPM7y3E0srySzSOwLyTzOzSSysQGZ3ZizZLc4akOTjpwMenQfmM++eemSBUxy/wBpKNXG1HXleMlTatRg9L8sNYtq2jk5O3bZDr8vu0YKnFrWVl7RrS7cm7q+vw6aNvo21WU8Iu0AZwGyMnjHXoSNwBzyeG4IDjz3HbGRnngfjjpxjHegqc89COmR+fByMjj3HXGKQr6cc546nHTJz69z19cjNek7JrlXKkraJcvKlFOyWmy1dt9zDS61euvve87tRv70u6+70bA565HQ8deeOO3Qjr1ycYpCMggEDJHXnnjge568565wadg8f54HoOnUD6c4NAzzn8Pp9P8AP5AVPzV1tp3cdvu3erXRai+66t89lbs7a33v6Bycduec+n+cfT8MUdDgA88k9s/59Pb8AnH4nFLSvrp+P9a6/wDBRIYOBjHJI+bLDb3DY68Ej0J49DX0Rq0n/Cdfs/eHNZLG4174JeIJfBGqlSTNJ4A8az3WseFLiUnkwaR4kh1jTVZgEhTUbaEAboyfngHPXP5dOOw47cew+le4/ALU7STxff8AgLWJ0g8P/Frw/f8Aw81CWZ1SC11TUjHdeENVlZvlQ6Z4rtNIlEhLMkT3G0gOwbzM1pv2VLGQUnPCVY1fdWrgrKqr32cHJ+ur2O3BTXtJ0ZO0a0HB3TtzOzi+mztZp2Tuu6PESwUhTgdGYDB4IA5BA7Y9chevTLGx047DOT04AHbPv6/Sreo6feaXqF9pmoQyW+oabeXOn6hby7lkgvbGZ7S6idSSymOeJ02t6d85NI/lweeP58H37Y9c16lNwlCNWk5ONWMZK735rNWa+a00v078koOlOUHvGTjpvKztf599bv8AA/H68j29O/T060noeO/PHGe/TqRyRjHqQBRjjp+uCMYIGee/fI/E80AY6cjI6cfXP5DPUnkcA8Fkr9X0V15a/jputL6rUElpfq+/TRP07q/Z3voL0x7+x/p+P8+xoIB4Iz/n6+/+eKM/jzj/AD+HP/66Wl8/6Vref4L/ACW3l+fe/l0/TyB+ntxR9P8APrRnn/63t/n8aQEEkDt1/X/Ci73u+19fuv8AoL+mKScd/fn9cf8A6zS5ODycfn70lN59DgjjnGP8n64wfpVJyfXRa+traateV9Vu7jWunf8AzW3n81/muQygOoZPmzGwyCeCMk5wOCCOODxtJrs/BnxJ+IXw6vFv/APjnxd4KukkDFvDXiHU9LikwGYCezt7hbO7TJUNFPBLGwGGQ5IPFHPsQDx1znt+PI47+oppbBC4ABI6A5yQc8ZBOCOMZ9sYqKmHoYiLjWo06iavacE09tG3e+m7ad+i0ZvTq1KKc4SlG2qs3o3y6Jt72t062Wp9KTftNeIfEmY/iz8OvhN8YI2+WXUvEPg218K+MZAWbe48afD5/C+szXByCZtQbUAXwzpI+5jVM37L3is/LD8XPgjqL8jy5dH+MXg1JDgnKSnwb4usrYENn99rlwEwMSEZPzmzEnjGO/U44A4ySODkfry1SIzZZgqnjbyOAOMDHGPu8fQc9a86eSYaN54WriMHLa2HrTjTXw70pN0mr94a3a7HSsdWdlWjRrRa19pGPM02vtpKTsuil5rSx9KW/wCzdqficF/hT8T/AISfFgvkw6TpHikeCfF7qMfIfCnxEg8MXk1yTkG306bUdzgJE8g2lvKfG3wu+JPw3uPsvxA8AeMPB8nJQ+INAv8AT7aRDjEsF7LALG4jYE4kguHhYcq/IxwDYJBOxipyrMAHU54KsmG3DkghsjkkEYI9j8F/tDfGz4dwGw8J/ErxRbaO6lZfDmqXw8SeFrhB/wAsbrw14ih1TRJ4SpIZHstpVccnhclSzvDuLp4nD42C15MRF0ZtaJJ1ad4N9r0l11SJVTB1Ze/TrUG7XdOXND7OvJJp6q+rnpfs0ePKVYbkPbblSjKc8gEpknsTtByMAYGDSFioJ5AAxjnPy9gCg+UfTsDnAr6e/wCF/eBPFrKvxa/Zz+GviOaRi0/ib4Zzal8GvFhLAbrg2+gPdeDLm5OQxM/hPZK+4MP4go8Jfss+Nt7+FfjB44+EGpyHMWi/GXwiPFHh1ZSNxiXx18PVlvIoVYYE174QiIB3SjBZaP7XrUrrHZdiqCWjqUo/WKT21XslOaV7q8qcLWd2mhfVITv7DE0aqdnyTbpT0a0fPaN30tJ63Su0fMWcZ3cdCMjHBHU8ADsce/oKT+IEkDBwMg9T79Pwwc89+n0pffso/GCe0bVfA9t4V+MejRhnOqfB7xhovjaXyRtKvN4bhuLfxjauFySl14fjdWyjr5isK+e9V0fVvD95Lput6ZqOialbu0U+nazp91pV9CyttZZLS9ht50dW4ZSgI5G3OQO/C4/A4rSjiKbmtHByUZp9nBtSg32aTV/moqYStT5XKnOMWtZWdnpvFpNWd+raa28qHrz39uPb+nr0780gGDwR6Edz1/X16Z5NAOMAjbkBgGBXIbkMNwGQecEZB6AmkHTIAzjp0Bz2xz9eoPT1wOpqyWukkrbW6a9e17q+tvV87Vlps0uiW9t9PLe+j+9qTgDAB6DGc8H/AD1+ppARn7wI5zyBzz14+g6jpQVYL8nygEn04Xb04554ByO+MgcKAe/y8Hkg5OcEnHB44G4dh0ppP/DpZdG9uib13sk9bX1TYuW9lfq+mt1bzfRvRa3avtoufx+n+fTr/wDXFL/n/P8An/66ZA5JHHXpnj25J78c/rQCCMiotrs+n4269L3+WhP4bb+fy6769BaQn6+mOh/D1P49uORRkeo/z/8ArpMcjk/iTj6Z/pznHNO2l392uu34O+9/ToFvX7v67r7xTz09M56D8+f0H4igEAZPAHbv2A9enX6ccGk6gdPz756d+DnB6+gzS4Pc8+3TqP8AD9TTV7Wvt9nvdrR9OvXVar0uLcHzbWV9dFo1+O9uxcs7660+6tb+zubqzvLCaO6sLyxuZbK9s7uBt9vc2d5bNHcW09vIC8csMiSI+CrZXNfX9h8fvA3xksbLw3+1XoeoarrFtbx2Gh/tB+BbOzh+K2hRqCsEfj3S2FvpnxW0S2QKHbUmtPFcEKMlprcrlUHxp6AY9uB1z+HqQfr+FPDFSCAAw7/eOT7jqRz/ALOD0HQedj8sw2OjzPmo14u8K9KThWg04vSW7Ts24ScoPZqyOyhjKlBWVqlNpe0pz1g9mvd6XXVap6pq2v0F8U/2d/GPw60eHx9o2q6P8U/g/qk/laP8WPATzX/hwMxCw6b4nsJR/a3gjxCBtS40XxFb2zpL5q2lzexx+YfnwnI8zgKcbcnLNkA8dcgjqQAen3T19K+GPxg+IXwd1ibWfAGvvprajC1r4g0W/t4dY8J+KdPYkSaX4n8MahHPpGtWE6sVkiu7d3TmSGSKQhx7h/YXwK/aGZW8GT6P+zt8Ybks03gnxDqMqfBXxzqDHmPwb4nvHkuPh5qt5IWFvoPiJ5/D3myLDaavZxlUTzoYzMMsTp5hCWJw0fdhjqEHzJe7Z4inBPl85wjypayUFvu6OHxbcsNNUKrfvYacrJO8b+ynou/uvXonI+QCdu4EEY5HGcgn5sHJwx+XocHPU9QgYkbuAMlmyD2A564Hy9ckHj/gNdf478A+M/hn4lufCXj7wzrHhPxDZEs+mazbmJ7i2Yjyb3TrkM9lq2nXSlXtdS02a5s7tD5lvO6jJ5HGCcjbxgjI4BGR0B4OcD2AbPUH3MPWpYijTrU6kKkZtOLjJSVmlpp/ds9deiR506U6U3CrBxlCWvMumnV6y1V/Ps9ReHHIPTBGeCMj0Pbn0PzDjsV78k5H05A/nx9MegzTQNvfADEkAkgDhRwB0yPof0pw/iA5IJznj6dAfcZ68d+DW8r3626NK2vu7vReur6bWs5avs9NktXr7qs+nazvbbUUZ4PTPUen+ev48+wSPbI4HsSP6/8A1vajb3479+euPUngZx+mBSYxnB6+/HB6cfl1zjpjFTpda6b210d1dd9uvW2grenR6b9PV2Svr31d9LtIUsTgHIAyPvHLcHJ7DPXoB+IoKLgkL1yccjJ7jGR1446fnTv9rnGOg65/nxgjqfvHPFHTgdTzz3559OfwPA6VV7d01Zb6acqs9Ler036pjvJWt21XRWS+7zelrrXezunTvnPfr36f19eRTWIA6HC545wM5GT2xwTz0AOMU7PTj9B+v5/Sl5Hrg574z/iOf6fSeazWt9et+q677JP/AINwU3p17b+X3/Pq/kMDFD8vAJwCSMAjqc+5+UFiMN6jgr55HykA46kFjjgY68d+3HXOOKTGAeScgjJ5xnGT07Y/nyB0RlyrAd+xJx/j1OTj+VXdK3W7Vm1v8Pl26vW6JVmtWld6trTV7vTtfm11eo7PJ+dccAjnGecep6gg5AycnoMAOzcW3AlRgDPXAxxkDgZ78dulRbWBOACckk5HPHQggkHAAHPKnklgBTdrkjpuHTCjOMdME9OPT05+7ik1vdNdbaJ7bvX+maqEdLzjoub7+XR9emujJmcAdVIAO3kde/oTkZIHGMcnFRlzuJXae5OCQc/l35xwAc5yc4RgQAMZJwCBzxwCfUZJIAOM9e2CuznjoCMnIHHG44ORwWwWznrxTTW6d13XdWuvVPoQ0rXVvta2t/Lok7230ta79CQyFhtbkHoMAFiCG4BJyOg7evQE0Y7gHjJ5JPrz1z36DPHYc4Mc5znnoemc/gR6DB/PinVEpNbJa7Pe/wCXfXv+JLfRbaafdvb0/wCGuNG3qBtIyTknGDj1IBHQgHPXPIPK9MkDseg645AwMd+AB2HrxQckAdgff1z/AE9v5UtQ5N6v0t00t8+m2ltNRP8Ar7l/XkrasVpJQqnfjaepAwQME8kljyMHOeMgAk5Do2hSZbiOMLOpVhPG3lShg24MJIQjKSehzxyQf7sZyQVzgHPvz0//AF89PzBgnqfrx1/X/P04pShTqpe1hGdrfEk3b3bbpqSdtnr27PWnVnCLjGTg5PWz2StZaaXf3LVc1rN+ueGf2gPjZ4Kt/svhb4s+PtIsVGz+yk8U6pqGjtGOBFJo2qXF9pksRXC+W9q6HABDKWC9mf2nvFusSFfH3gD4HfE1XXMs3ir4U+HtK1ZxxuY+IPA0XhLWBK2c+abxmDfMBuBNfNTISSRkEsccsO/YgMQcc8dRjPXhuCCc9yQD6cjGPXHuMAk55DA8c8pyyteTw1KM3qp006VTaO06bi7rTZtq17p6HVTxmJUeWNaUk7JRm+aNvdT0d11v+Kuz6U/4WB+zfrqlPE37O+ueFrh5NxvvhR8W9Xsoowcbnh0Px9pvi+3wuAVgOoQoAdpJXBNhfCX7LHiEMdG+NHxN+Hk7YMNl8SvhlZeItPjYMmFk17wJrs1z5YJI80eH0I5YwgnFfNSgAqSFzwCehI445BPbn8OOKe5J+fOOrAk8c/Ue4JHI4BBweOX+x4Ra+q47HUH0X1h14rWKXu4h1bL7n3H9deiq4ehVjoleCpt6x29m4a3/AJv+AfTifs1yauoPgH42/AL4geZu8u0g8ct4L1mT+6v9leP9P8N4nLDYIkupMOcbmOFHMeI/2dPjj4StnvdY+Ffi6TTh+8/tfRNOXxTojRkgB01jw1LqmntGck7xcBTt3HAOR4S0gOMhXAI+VljbA56c7iSSMHIIwc5JroNE8XeK/DNwtz4Y8U+I/Dc8Z3LN4f13VNIkjb5sYNjdQYweQCCBtABPNEcNnVDSljaGJi1p7ejyyduXRzhJJKy2UWvLcTngp2c6FSk9dac7xTtDaLje21veVn2vZZN48tjO1veQzWVwjFTDeQTWsyktja8NwqSArkrsK7uACWK4r2/4a/GFdG0G5+GfxD0Z/iD8GtXvHvbzwo10ltrvhLVZAEPi34aa5JHMfDfiSJSHntSsui65Gv2LWbOaN/Nhktv2nPjh5CWmv+MLXxzYggGy+I3hjwx49jeNsfI1x4i0q+vwMZVjHdqxXnduHGpbfGPwJrDuvjT9nz4a6jLOMyaj4HufE3w51EseC8cWlalfaCHwd6qdGEZKqChUDPJj1mNelyY3LFWUbShVwleHtISTVpwdX2Li430tN6XTTub4b6vCcnQxUot+7KFSErTT5fis5KS31td23Wxk+N/gfquj21j4n+HmoP8AEz4aa9eG28PeLtLs3t7uxuykUreHPHWiu81x4T8UWMbhbuGcy6ZfhDeaRqF5ZlpE7D4JeEdY+HXxH0nx94o0+GS28EaT4g8W6LBDNDeS3vjLTNDvD4Q0oQQBitwfEElpcmRwFh+z7mkXlD0vw91XwHcTeIJPAGn+MvDVtefYINT0HxB4mstfs0CzXBt5YLyzsdJkuXSTftF5ZtPHuciVCyg91cxN5TFtxwQqjMjDLZ4xx8+CemTuHfGT+l8LcH4fP+Gfa5hicVGviJVKNNKNOM4U4S5OWtH95Gc5a35XZq0klfT5rNs8q5bmnJhqdOUaSpzlz88oznKMZXhezSWjV09npZM+CLtb1bq4/tWO5i1OWaW6v/tkbRXX2q5kW4nlmR13B5ZJGfcwG7cXPBBre8JfD7xr4/1D+zfBPhTXvFV6MGWHRNOnvI7ZW6y3l6I0s7CFSGLz3c0ESABndVya+wD4TfXFTWNI+HPgv4k+MLGYWmnad428faV4Y020t3UzJcTeH7zXtAu/FLpdyJHFbrfizQLNHOkqMqjn/HXhX9tLX9IOma14D8b6d4QjX9x4V+Geh2OneB4IsYCrpXgKSaxvMYANxf8A2u6kUAyyyMc18PnVepk+Z18lw9TCQWGlGmsRiqqp+7KMJJqhFuU3FSV7ypxutHpr7+ApwxuFp46UardaLl7KknLVPlknN2STezSl0dkrHmc3wa8IeCPm+MPxY8PeH7+LmTwR8Olt/iL44Lgg/Zb260+5i8JaHMSMM93rF08LcPattNPj+L/w/wDBzKnwm+EWh2moQEGLxv8AFWeL4ieKg6BVFxZ6JPDbeC9IkyA8YTRr+WEqQLhyMnxjV/CHijQJHTWPCfifQ3XIZNU8O6vpxX2Y3Nmg69QzEtjGM4rlhLCGIMqK4ABRnEbE46lHIOecHIwOM/NiuOngqOKtPGZh9bva9OFSNKineN1yQd5R8pymn3avbWVSrRk40sOqKs0m4802nbXmasmlreKWu+1z0Xxt8TPHvxGuUuPHHi3XvE0kRK21tqV/K2l2aA5SOw0aDydJsIogB5cdtZQx7RtK7TgcGSSxOCCSWKnAVScdEHCjgcfMAeVxxSpklZFZSu0EbWBUgHjaATuxu47A54wOFcsR8yna3QkHuccZHfIBJJHXGR09WhRw1CCjQp06UY2S5IwS2itl5W20672PPnKtNt1JSl1d7trbXdWt2e+/mR5OOevf8PToOe3TGfbFJk5HOB0Hp7e+euRx35yMlSC3Q/kQCeeMf/W6Z745YQT8wfOPlYfLjH1wR3GOozXQpKTs59Nraxd1bo9E35rbRohJtaOybvtp9l21T9NezsxGLE/KM4AbaOo5XO4dcjIOD0HpnlxI6g/MAQecenXkHB6YG7vnoAYyXz0DZzyRw3ck4APBHBz1Y5HAFOHzAjjJ3DcMdS2SMY4xwcY7g88kVZNR1uo2X32016a6r8e9ctrN2VrJ791e6W+17rXdK6sxRuJPIxk5wAeCeM9e3GSeT6cCn8Dk/TrwPwPA6DpTDn5WHc5JwWOPTjnHb0PUcZwpIIwST1HQnCk5wPYn6jI5FQ09L7Xd1FLvG+z1eq31vbSwNLS11rZ2vpqk1+q2Xlcd0Hf8Tn8OT/Wl6EdR/EPw7479cdCeeKaWUDrnPpz6f/qPpkEnFG7GVOCBnkDPU7ug4zggE5wwxk+iSe+lu7tZXstdd9fkRZvX/h+i0XXdaCjj29qPX3x/kDt/9c0tJ3zn8P8APf8Az3pbb736632++/rr+aFpM88fj/h+HU5/AHsck8cD1GP/AK/HP6H1FHOOxP6HHfv9f85ot97tZetvls+99h228/69P8uomQw9M8DPXj/D2Jx+lJnCnI5AJ9iF5HP+fwGKCAOAAMbee/3hjPf3PP8AjSBSpyTnOQO3Uk/hzwMeufStOXS2zvdLzS77Xff523Ra06aaSV3Z+ul+mvy0W6TgQ3oevHtnAPrnH8/pSjAGMdPX+foc/wBegpFwTwOcZz/PkdxnnPPrnrTuv+f8n6Y79xUPRta2036ba9Nfudt7EPe2qWjt2uv68+4gwOAD279OPqeM8f8AAf4RzS0mTjgZPQcd/wBOP09OaTjhW5JBz9D1H07fhSSb++2mom7jv8/5/P8AlSZwe+ecds8Z45/zg0Z5xxn/AD19ByOf8KOSORj8Qe+P0HPT2oW6emjXX/Pv1fTyC36fj62/yAnAzzwM+n+fx/Lik+8CD364z7Yxnscden15NLzjrzgj8T05wP5U0Bh6dB3J7DrjAJ9Tz0HSqSSV9L62ettLbrfd39elila29nvfXystPX1VheQCAeQMdvQY7n/69O7DP59M/wCT/PFJjPPI/H0z/wDWODkdeOuUBHHbOSBjtn/PT17jBrSLbts3dXVvNPZbrtbR3WnZrvy3Ss3pZq9vlZ9G1ZeWjH56ZA7jnoQc9s9c4GR7+uKcAQOnGDzkHBHX0YDJGCc4IAwCMFBt6k8HkBc5yOcFTuOQB3yOue1PA4YggduTxjtkZ7HA4wAB05zQ7dd7N/irp+T67iUbet9m293H5a36N6aWWg8dTnp2Hv1z179D09R7qCCRkZzxwOQu5ecjJI54x0HbPFJ/nn/H/PvnrT1OCvHK84OcffUj8D3/AK4BpRfuprV6LzTv5aaefz1EnZ39Pwt/Xrv1M+NkO4pwvAPYZIGAO5zkZ5IyMDrmpOBnGPTpn6Dj8MD04A6VFBgpxjIxnHTP17+w7fXipfXj/P8An/PWiTSasl13Sjtaz8nbT7tWCurX3slZbWtt10/4N0B+mRz375B7ke/07UxsbskEjH944784zjJyeTjJz1OKk+n+f88UnPOD1/Tpj8OD+P05jmd1ra1uru9uq693o+moL/h9+67a72f9WGHOMMp5P94qcZJHzZ5B5H1BHODlxOVyMsBngEnHPIO0nv8AXHp1pSSO5zxjH9OOOeec/rSKuByOTkkcY5PI44xSbvr283dvS/3fza9Fuh6WW2j2vrrZ/La19bbb6ijPoMEdOAQfxPU8g9D+GTS0ev8APH+c/wD1+uc03p34IyBx2A4GP6cf1Vu+j89P6+Ykm3pvpa3/AANNOt7C5HfqccE/lx/hTAMngnjrgnnPv16Adz6ZGM04epHzcfUduTyPxAHGeOwOTyf64z2OM9PqMg9wBxS92+tnZa6eWye/rez3Kjpez7JardtXVvwuui6jcDjJPPIOeh69x3PqOeOOuFGcnrjr1PPQ4Ixxk8ngHnjilwRkHHOCOucjAzjuARnr9aQBtxwOnP3sDauNxJYDO3dkgNnAztwDm0m12tG75u113s723WibWq2u91bq1dX7aPR+fyWl7JCjqWPQ8AZ6kdcfiTwe5yQDQQuMkBAMbic4XngkkEHqfUnoRzXR6N4V1jWonvYo4bLSIDm613VZFs9ItwNpbbcSYa7lH3RbWaT3THhY2B42Y9W8MeFyD4ftI/E+tIQR4i12226TYzAqN+kaCzMlw0eCY7vVfNDHa62itzXHUxUYy5KKdWpZXUfhi/dSu72VmrXd2neyV3bWNFpJzkoQsndv3m7LZaLV6q607Ii0bwJqN/Zprer3ll4V8NEkjXNcYxG6A58vSNLRTqOryyAME+zQmEOQJJ41YsNVvGHhvwsoh8AaMz6khBk8a+KIILvVixCgtominzdP0VASGjuZBdaiuFK3MbZFcDq+tanrd49/q19cajeSsN091IZSmcEJBHxFbRpkhI4UjQKAm0AAVQwWT+HOBg9ck8EkZB4wOB9Tk8nKOEqV2pYqb5bK1KDcYLSL1Stz9dXfW91fYc402vZpK9lzyvz2slu07W12SstluXb++vtTvJtR1K7uNQv7p2kuLy9uJbm6nZjjdLNK7Slxhc4cgKQAMACqOCCpIxz0HGQV9zjAbj09MEinE/LkH6HPuPX+vNAHbODjnGDg4GOvPOPpjPfk90YQoxtTioxWllZWWl9F72z0st/lbFycryk7uT1b16rV9Vv06vo7XQgk5HUcd+B3PboM+vUHpxTWyM4yxyMAHlv4cYH5EnHTHen45z7DjGeCSTwMnoSCc8EEkYBpuMg8ngHrkc5DYwOfbOc/WmnaybvtbT00Xd8t72u9dLjTty3aa0TVtbPluvPT9QABJGPfPt7eo/2vz91wPxHOee3TPOcemT244pBycc5PJ6joePXAI5x64GfR+Pf8AcY/zj2Ht1ym29bvZdH5Xa26/LzvYTbaWu66J3s7K9r+bSvZdt0NwR6Y9P19Bzn14GemKfnNIBj/AD/M98dug9s80v8An/P+cflwnfteyTuk9mldv59fv6JS3f8Ar738+71f4BR/n/P+f60f/X9j1/z/AJxSEnIwMg9/bj357/pSVr76aX6X2uvl+gl8vm7fqg59O3fPr7ZHbtkj05qWCWWGWK4t5XtriJknhnRir288LiWGRG4KPHIiOrKSQQGB3YFQEnqN2fQ5AHc5z1Pbjt06CkB4AbOOCduc9VOefl5wR/vfMckACpQU6coNK042d9bp2utL3iv+H01NYXUoOL1jK63v0eyu+1v7zXk37d8dI4ta13Qvidax+XZfFXw5aeJrsxgLDF4ts2GkeNLcqnyJI2t2cuosm3cqagj42uCfEj1A5BHQ9T/Fwcjvjk49umK9u8NOfGXwc8Z+FJGEms/DnUIfiT4bj2lp30O8eHRPG9hbqpZjGgfR9aZEAUfZLqUgHcx8PGCQVxjGeoySVXHOW685xj5iepxXnZXOUaNXC1H7+EqShG+jdN2dJ/KDS7Npq1mdWLUZOFaLv7WHO1G1uflSd97q/Rrs33HbfqeQTz19uv48/n6Lhe3BOOMnPXI47Y69OPpmkAzgg5xxznPXn8xjgjsMHoaXAP4fhjk9Onpjj05r0G+m6Vr2ul03/LZfckjju3vfpe2jvdL5tedtdul3f55oz2/z/j+FICD0/wA55/XOaD2H4/lj/H8s1Nun56Ef8P8A18haaevPTuccc9ue3TpnJ647rzx29uvOPX0/Lkfmmc/lk56g5BAxnj29Pw5aWv8AwV+e3/BsNb7X+duq36eWvcQjJxjAA4POPwA7jp1/PFBHy47/ADZyMg9T0XbxzkDIBOcknNKeoAJ/U98k5Jx6A9fT2pp5yCxwPX1J4xgDjHBx156gnNq2nZWeqd9WrtLW9+2ivZ+ZpH7K6aX3vq18Oml38rrTa4xxhgBksxGeQOBt49z6E89etMK43jOB2wAARuAIIySACTz1II65qVuxPpk9G+6QRgAZJzyMfpxQQCSRk9cbvugk5G3A7+uOc474NqTfKtLpJXutny317a9Xr8xqSXL0sle911jdbKz7LTs73RFgcbgTwTk5A44IIBwCPT2PJwakBXksA2ABlSeeg7DnGSATxkA0gVgeDknoOqnlccZ4B7cjpjPYvwcOQAQM9eO6sD6kZbBbOT0HYqXSavt5eqXk73dl/mErcsb7aO2q6Qv07OytdW87jDx97I46HqBxjPODxzj6Dr0U9/4iAD1AOWKrk7eOueB17gnaQnJ+Y9AFzhTwQASeQAeD7DqPq4dgfQ9iM/Nn2UAgcA8jnng5LrS/z8tu9r2vq++19ybJWe2qT38m773S8u63FIYHIPsM8+nHJHXH14zkninjO1lJbDDBHGDtIIOT0BwMjndjjryh7Hr3H58Y69cAfm3QgU3aScc7uo44AXkdOAMdcfjxwUm5Rs0l1u1ro4u+9rO3XdX7tAtLNrbuney72autlfV/c2XbK+utMuY77S7q50y9t2V4LvS7u50y7idCWDpdWckUyupKnejryq89cfQOl/tWfGe1sotI8T63pHxT8PRR+V/wj/xg8NaL8RrNYANohg1DXrSXXrFSvG+w1i2dFGQy7Qa+cSCVIzwAVGPXOPXjgAEdzgjoBUZyvB+Y4wW5GBnp1IIGSDnn16ccmIy/BYyyr4ejOSa5ZuK9pG9vejKKUotbpx1XTc3pYitSS9nVlFXSaUpSi78qaad01ZbJWt3sfTEvxB/Zu8Zgt4y+Bmv/AA71SU7W134K+Nbg6UrMctMfAvjldZtFiXg/Y9P17TkByibeNtb/AIU/8KvFLMfhn+0L4SluJCDb+Gvi7pGp/DLXWYEgwLrAfXfBs8vG1JJNcsYXf5sIqkD5xxyNwwONuMZPBPPPUHHBUHHPpT8BkI+UqeGEgRgcnDDJJ2ggEFgMkk8jkngeUTou+CzDF4e3/LurU+s0tLPaspTUVbaM4pXt6arGKb5a+GozSV3OK9lJXatdwSjfzcZeatqeyeJ/2fPjP4QspNU1b4fa3d6Co3R+JPC/2Txl4akiHAmTXvC9xq9h5ZHzAzXETKMlwDmvGtwVyhLJLH8rxsoSRWAA2sjDerdCVO1s/wANdT4Y8aeLvBF4l74L8VeIvC14jBlm0DWr/TWJBPLx2s6QyryoKSxujBeVIJFexn9pLxNrgWL4oeB/hn8X4AhV73xZ4Vt9H8VMCvBXxn4Pfw9r5mXPyzXlzeBW3MUfGGFVzvDfxKGGx0Fb36M3Rq26v2c3OEnbvVje9xcuBqNNTq4eb3jUSqU+ib5klKye/uN+Z86ln64CjJ5IPJxzj5e2Rx2OSMjkoCWBC4GPrjjtyOOehGeQfTJ+hDcfsweLDiay+KnwV1GQ7Vls7vT/AIqeDYnLABRa3aeHfFNraqw6/btWlC/KN5JNTL+znqfiPMvwp+JPwv8AixE3zJpukeJoPCPi/GAfLbwp43/4R+7lnYceRp9xqBaQYjZ8bjUc4w0ZJYqlXwcmtXiabjDaNk6sealJ37VGk3fRvQeBqSt7GVOsr3TpyTk9I2fs5Wnum1dW330Z87Ebu2cDg5OCfT0+vJPTnPQPIwQfTtnqfX14JI/Piuu8X/D3xx8P7w2fjnwd4p8HzqThPEGh6hpscpB4aC5mgW0uY2BBWW3nlicElXK7WrklUsBKoYxsAVk+VlIC+oJ555CnBwOm75vTo16FaEZ0q1OpF6JxmnfRbNOy6XX9PB0p03acJQlpfmi09Era9k/ktttRCoOQOCOn6+vbj/OTSgDbjPGOufz56YH/AOsU4rlTg9ATwBz6884PPI6g9T1puCAAD7EkcjHAIHof5c+pq7Xs1Lm736Waelut1to1bTyzb3tJfPXs29+jvZJO2tgAAz1569fzGCTz7nPpS88859OOn+NJg57HHXrnHHTn+ec8nkqMHC5Oev8AkYHtkfgKnfd36Lre1u+1+/qTd30b7R+Vunml838xu4g4x36+vJ5wOp7fXP0oIjckOquhGGVsFW4IAbIJXBAORyCB3GC4DgA+5Pp344/l0/CgYBxxzk9MfT27fy4PNJxjKLjJXTTT0818nZa/0gi+SV1d8r3XZSvpZWslor36O9z6J8EftC6pZeHbf4cfFfw9a/Gj4UQh4bDwz4kvJ7TxP4OEg2m8+G/jlY59Y8MXUIAdNMd73w/cFVjutKkXLDW139nvT/Fmi3/jj9m/xHe/FTwtp0L3viHwNf2sNj8ZvANttLzNr3hi3kaLxTo1sUdf+Eo8I/bLUxRme/sNKBZF+YgOg69MHrnvg8DHOOc+/JxW1ofiHXPC+r6dr/hrWNT8P65pNwt3pmsaLeXGmanY3UZLJJb3lpJFNGVbkgPtcZRw6sQfIq5TOhUeIyyqsPNvmlQl/u1ba/PBW5ZNL+JBp91LZelSxcJxVHFr2kLWjVTXtoRVuut0k72ldaNWVjCeJv3jMrrsYxtldm10++rIclXHKlWUHcpJBJJLVABxggAZ6nA5KnAAAAGB0HYEEjGPrCT4mfDf42IYfjfpUXgr4gTJst/jp4G0iGODVrqTkS/FTwFYLb2estKcC68UeGY7HXnOZb201aQMT5J8Sfg54z+GaWGp6vDY634O1tWfw38Q/CtzHrfgjxLFwV+wa3Cuy0vY1H77RdVjsdatGyt1YQspB6MPmalNYbG03hq/KlHmsqVRrlTVOorKV76RVnf7O4quF9z2lGaq0UrtpfvIJqK9+F2769nd7Ns8uPPUY/LuCPcd/pz+FIBnueR1OOvUZP17g46nOeabu5AAbaQMFhtyMe4IP4HBBHNKM8g8BR6D88Dpt478n3zXo6u1mrvXV3stGnq3pez3u1b5cDu1zWVnpf0a6a6XvZbtNXWgAAE4PJ9T+P8A+vuOPWnD3xnvij379OPT8cex5Jx0HrS1L12vqkvWyX9fcRe77/m/w+5dApOmc/4fzP8AhS/55P8A+vP+eaTnP4frz+X/AOrHudP+G6W+a36f52Qfhz7fX3/Mjnp9MsfBByCQCANpx0PHPbrnse2OMlxzx6dx1z7ccfiePw4LQCT1JGMjP4YzxjOPr6+lXHTrbZ/LTra3Xbzs79Litd7bN38mv1230a7iBRnkEHOBzyvGSecdcdcZ7Ady/G4EEZxnA5zgZwfTgDjsMdfRuOMnI5JHPIGCevX+fTp1peo6nIxzjnHPcHkHr1Prn0batZPTvq3ol26dHe2rvvvV1bRvfvftfrqtVfXvbszb+Y5Bz7kkdu/fjr7UoHqecYOM+/Xnrk9T+hNGPc+mePz+vHXrz27AHIyOgwD+n+eo9Peb7639bdLd21ZvdLey6EPrrdevbrre6fZPW22iHe/9PSijt/nHt/WjPHt1/KoJA80zsOcYHQ8HpjkjHA+nX8MKSfQ9/T3+vpn6498Kf5c46+vbvnpj68+lJW106dV3Xq16qzXR92r/ANdNtfLpr9wzDcYI6gnAzx2HUY9j0xwcAZAVAJJJJCnPPOCOM8557MPTpS5bnnjsevHrjqTzz0AxnpxQBx1PXJ478fhkdiSR1PIzVb2210du2nVLR67XS2RotbNWW17L/Do30s+l9raMbtGWCqARwT7EE8bTnPO3254zlSwomAF5xkdT65x16c8AD3zUpwDk49BgEHj8enX8Mc0wgNg7sYJ7HnJzk4z8o5+nfg1UXd3vK3S+tr2066LXa3k7J3cXJ8qTstG3ra+2tvPq7a27ayYzheeoPTjjnHJ/IckfUcLkkg5+uep4GPcfz9sUc8Y5HU45PPXgDrnjPfqQafFE888NtDE89zcOsdvbQo09zcSOVUR28ESmWaRiwCRopkfoAWxnKTjTipzlGMErtyaVo6Xk+Z723ve33WzSlNqKTk+iirt3t2XffzIs556DJyuSTx365Xbk7TnnGMdKkBxySqjB5Y4A6Y54PQ9eM+nOK97sP2ePEmnWFt4g+K2veHfgp4duIvtFu/jeeSTxlqkBTej6H8O9KFz4pvHmxtge+tNMshIU8y7jUs9WR8Qfg18PiifDH4cTePvEMS5/4WD8aoYLuzguBwbnw78LtKuW0G2RS26B/FGoeIpMKjSWqElB5ks1p1JOGBo1MZUTa5qatRX+KrJqGj6RcpbWi7WO1YJxSliKkcPF2cYyf72zUXpBPmvvq0rdWklbj/AHwY+I/wAR7afVPDnh6SDw3aZbUfGviK7svDXgfSkAJd77xVrktnpeUCsTbWs095IFxBbSPhW7xNF/Z7+HYz4h17Vvj14rgHzaD4GmuvB3wvtLld37rUPGWoW6+JfE0QJHmr4d0zSYZo8rFq4OHryXxt8T/iD8SbqK58ceK9X8QRW52WWmT3AtdC0lB8yRaP4dsEttF0q3iJ2pDY2UCJ0yRzXEAttK5yMjacDGOMHGcc7c4AwdwyOcVP1PMMXZ43FPD0d/q2Ek4u2mk69lOT015FTvs7lKth6D/c0/aSSVqtVXS+G7UFpp1UuZW6n0RJ8fNWu7i2sY/CHgvwr4JtZJpIPB3gXQoNFhjllVUjvLjXrz+0PEWtajbqAgutY1S6aVQRtjGRWunxk0BUVpbHxFId24QSSWbLsLDcA+8bzsMiruVhuAIIYGvmJWKkDJPGTwD1zkYycZALEnBXbnjNTqWYctyAMLnp0wc87jndg8deeea+uyvOMbkuD+oYCr7Gg5OUVKKqNTk4tyvUu23LV33ldu99fJxuDw+Or/AFjEw5qmkXK8oNpWai0mtLbadLLoe3fGjw+1tqGg+LrO+g1/wf4y0aO98JeILWAwRlLEpb6voF/CWf7F4g8Paj5kGpWedzwz2t5EWhu4yPI7HxHr2juG0jXtd0pw25X03WtTsWUqM/KbS5iC4yOh4IHOBXqXw18UaVe6Xq3wm8bailj4N8Y31tfaTrM4JTwF48gja30jxUhUF49K1COT+xvFcKLtn0mcXpRrrTLMr5R4l8Pa14S17VvDXiCyfTtb0W+lsdStJMN5dxDtIlt3XclxaXEeye1uomaC5tpY54XkjkRz8xTr1MZisTRzaMMTinOVWNepGP7+nJpxnZK3NFPlklZO17JNX9Z01So0ng5OnQUIxVOMmuSS5U01q3vdeWjb1Z6fpf7Rvx50ZDbWHxe8fC32YFrfeIbzVrUrwNrW+qNexMCAMqykEAggDK1uf8NP/F24yutXfgfxQjAq6+KPhj4C1hpMfL880ugpcE84Y+aGz3yBXzwgAJAw3GQ2Spb7oyeoIwOe3BAOersZDHHJBwSWx688rwfyx1xRLKcslq8JRVrPmjBRd/laW2u7t01RksXib3Vedr663Wjtqr6LS/S23RHu0nxu0/UQD4g+BnwM1clyXktPCmseFbplJJZhJ4X8Q6XChO8ZYQNtIOEytQjx18EtQP8AxNfgPe6WzEMZPBnxV8QWCICFyYrXxLpniWL5c4VXlYA9SQTXh2GOTjnGc8sW/IkEdMnBAH6L0APXoMbeQx6dSAew/LB7Ff2RhIyXI69O1rKGJrR7X05+VaWsrPvqNYuurX9lJu3x0qbctFfVx69b7u7W9j2pn/Z2v1KC3+NXhd2ZioN14L8XW8S8HJUweG7h0U56MCDyRkkmq/hL4M3Yc6V8ZNU0/G1ki8W/DbU7QcbVJkuPD+q62gC5ySIj93JQDFeQZILD5sHjgZBBAPUk8dQQQB9Bil74GegByAc8Dn19j3b1ABprL5Qt7PMMXG1mk5wqJbfzRk9tGr+jVrjWKi7OVGjJ2vdLkd/d091q/wCmtrWZ6y/wp0+7ZV0L4u/CTWQ7HZFc63qvh242gZAMfiLRNPjjYnIAFwAS3LHaTSN8C/iQQzadpOkeIIzjbJ4Y8W+E9dzjaFCRWWsSTsW3cL5JbjGDwD5JJGpB3BWIAHKq3OeCR0Oe4I656nOWCFM7gqqR0KlkJx/EChXb1wcZxk+y1ao5hBJQxkJrr7WjG7tZtvlcL6/Jardu0yq4eT96jJLR3p1NLq11aSd29G/KyVrHcal8M/iHpAY6p4E8X2qLlmkk8P6i0QUHcW86G3ljxhvvB8HGScEVyU1pcWbBLq1urV/4kubaaBhnAJKzRx4PPI4/iIGcg3rDxB4i0hlOl+Itf05gQB9g1rUrULggg4huV6HoMFe5GM12Nv8AGH4pW48o+ONcvolQKsWsSW+uQkKBgFNXgvFcDcBgrsx1XHIG80j9jC1dpfHKlezS0Vp/P0JcsLLVutBSSdmoy1tHTTfZ67Kz0PNtyMSFkUg9CHHJyM4wD0ZunXJ9cinjgEKQQfQgnjuCFJ9uOnNemSfFTW7obdX8OfDzXjgFmv8AwNotvO3Qk/aNJj0+UMdwJcNuGcjBJpi+NPBVyw/tb4R+Hn8zl5fDviHxNocowACY45L3U7VCdpYKYNvzAEMop/WcZG3Ng5SWnMqVSErtJfzOD2va6vrbTQfs6Ml7uIsuqqQmu2nuqS16dL3S8/N9xJ+ZcYx/e+nHycegHBI46EilJOCOvtkjg/h64ye3PdefSje/Bu7GH0D4l+H5CcFrHxD4e8Q26KcfdivtK0e4IUBmAN1liFG7IJp66F8J7xmNl8R/E2klhlY/EPgGV0DEKTuudD1y+ZgAMEiAhipIUEVH1+MbOeFxMNLu9KTtrFbw59ntqroFhrtctWlJNrXmcf5e9npvd6K+zPLxkcEYP8PzHvwB90euTgfX0p23vj6EZJHHAxjt26HjnvXpp+H+izjGk/FP4eXzcFI9Qm1/w/OQT91v7W0ZIQ+MAhrnAJwXAAamN8JfGcyl9NTw5rkbEFW0Lxf4Zv2cFgCFg/tOOck7gCDED0BGcY0WZYVtOU5UrXv7RSgr6W+Ja33087FSw1VWslJt/YkpbpWinG6ttfv3ex5ptB4Bxnj8eCDnPTHOM8jnqKAvrkjt1Hbn0xk54zzx2HPZ33w48eaUQ1/4N8S26AFvMGkXE0Y27QNs0EcsTAbgxZXIwSQSAc8lcWd3asEurW6tSR0urSa22gZJyJIUIABwckMOxzjPRDEUJ6LEU3d7qcb68ui1tfXRXs1t5ZeymnZppKztyvRyte1t1fXWzej+LWMQPUnjrwePcnJ2g8fXgdc5FKT15wByTyDwexB/zyByDhFaN+EaOQgZAVsk/wCyBgkAkjbkcc8DuFfvALtVhzjgHPGAcc5DYPTd0yOc2nCST54u7teLV+VOOrtfWz0/HYxdm+VprprFrTRddO9t30fSykqSDz7Y5xggYOOMjcCxA6YLHFBOCTjO4EjAHGOSM9s9Rj3/ABQEKe+DksTxtJ5GTtx64wcDpxkUEglgOegHGc+p4/DkcE8AZHNKOqV9Gurvp7umn5rftZDUXa72VlJ3Vldr1tunb1B+OdpOeDg46kDnj/PNJtBUFfYYzjjJycHGRkdeAcDHShwcHkqQOnGcYBHGwZ5OBhjg5UnINNBbaQMkEnnByPfkA4yeOv5ZwKOl4tvVNa7x06XSf+S83YitL3s00/k7W/XqtL+jeAD6jtjPQenTjJ59T+dG3jqfU8nBPQjtgk8c80uCc54Pr25HYe3TPX37AOeMc59eB+P59BjPpxgzzPvbq/Oyj/l3XZ2HzLo+l3q97LTbXbvrqtLgB0J6/Unn6n+XueuaQDggnI4xnsOevPr9Ow+i4PbnsQemP6cex69MYwv9e/8An9PSiMnffr72ullbe97N9+rsSpWd+mzV77Wto7vTdfhYBwcdBxjpjPbkn8x7Z78uDNhuhx0z9OnHQ5OMnBwAM4zTeoyw+70/XueP5Z68HinDnrwcHAHGOC2DknPGMe2SD1rVW33vr6/0hrXVxuvNaXTWsejlovV38iY8c++Mcdc4/Dk8579xg07cThTj8D0AKZGcegwM/j1qNWO0lvUnnjOT157ZPHXjHU9XcNjHPTHfurfrjP0yOSQDKs9NWk7X0urfNfJrX03cq116v/gPo7X8yqgIUcYJAyc59egI459Sc+3Ip/8An/PrUSE56k4AX6d+f/19MYHNSf5/r/nP4deVPTtfVXv5rTfX8uovX+kL245/z60hz0xk8kDr0OB0z+Ht6CgnGPf29wPw6/57tYFhg5+8eTjON2eM9j16is0tVfRbu91ppt30vsr7b9BfEr6R6uzb3Xbpa9+q0HAZA49Dzzj8/wDOaPTnkf8A1x2I/PHHPFN6kDupBPp+Hfgnj+Rp+Me34e3H9Pwo8lfy9Xv9+oarf5ejXX+trdbiAk9sdf8A634fkenakO49CB07dPfPGeRjHoeaDk4x688/144+mD2pBw2MZZz3/QcHtnGegzznFVa3a99I79t29tF5X6PoUvKzbvZWWnrf52/O2gpJHbjGT6gj8cYPpnPvQCTwCvqeSe4A5+pGcnk/TIsWtleahMLextZbmY4OIVH7oEgiSd3wkMQzl3kZUX5txHIrejs9C0b59UlXXdTQgjS9Pn8vSo3BU7NQ1KIiW5wOHhsgEk+61ytZTrQg4qK5ptRSS9Vq9HZ6vV28u5rCnKzlK0YXs2100vZXd/O3xLa2hR0fQdU195F06JXghGbq/uJYrPTbNQBue8v7lo7eFlBJ8sOZn2kQxuxCnfSTwn4aw6xp4y1yJx80yyW/hS0kGzDxQB4rzWjGThWn+y2kvO6GQDJ53U9d1LWESCV0ttPiYtbaVYoLXTbTkHEVohCs5Gf383mTk48yRs1l7RgZOSDkHGPQdB8o6cY/PIyYdGpWj++m6cLa0oNK603lrq9bpdbbM19pTo/w4qctPflq0rJbW0WrT76adtfWPEWreIJhNql5JceQStraDbBptnGSWSGy06AR2ttGoOF8uMMQMMxGDWGyqQTklickDsTnHBGVHGMcHOeATUoA78+/fGSeD1Hp9PbikI5znp09umf0H09u9a04U6SShHlVt9G+i3W+l27q99bdDndSUpXk27767Wta1rab7WtpvsNACg4Vi3IA/EHPBBOSc5xyOpHBDmPXaeeQAcHJ4HP55/Ag9suOOvsB0OenXHseefxHWkwBztGeOB/j268nr7dq05r62bW3k9tHe6Vr3Xr5shecebTTZ31tyu/Ty030avcaRzjBboTwAAC3PTDdBnjjjnFJlhkLyQCSTgAeo4I6k464HQ+pfn8Ocfh69u35e9N5JwRxyOcdzkHnuMD6dTSUne7Sa+LXuuVarr6aWbXqXF6Lok7v1XLd9O2ya1aWm4g35BByeOSQBjjIBBGDxjoRnA5BOHHeRgsMZ44AzjBHTr075wPXsYJ4yf1wMdMZwT65z1A7cUo4GPT1/wDrUOXkvJW2WjWq/re4nL77p669FZ6q19/v9GAz7d+xH4+/6d+TxS0UHHHPX+fp/n3qCL/1+H6DepORxgYz+JPH5deeKdRRVe89LPppr0SV/wAgEI6cdx+n+T+fbqAk9sdfX68fXv8AgelGckjrxz6fSk9Rgdcjtk/1xwSR9OSKF0/J9du9/vslZXGm7q/SzSb9O+39dA+boCDjH16Ac8/U+vvUZZypxzxk9OB+XXv3/DBqQ84I9yceuCPY5/Lp1FG7jIHoOvUluT2/P68ZzTj0urpNa221S8r/AH+pcWk1ez6Wfk15a+Vtr630t3nws8VQ+DPHvh/Wb1S+jTTy6J4lticLdeGtft5NJ123dejq2n3c8igj5ZY0kA3KGrK8ceFrjwV4w8R+FbhvMOi6pc2lrMDuF1pruLjTbxTg7oruwltrhGUFGSYYJUqa5ZgBuBXO/KkgjIU87jkYwme+BglhxyfZfHu/xX4K8A/EInzdQt7N/h14pYHe66p4ahjbQLyckN8+oeHXtoRLIxaV7CTYMoceXUf1XMKVZNKnioexqK1rVFZwbd7aq66ttrbZdCvUoSim+anJVYtK7UPcTim0/ev3v30R478wJBBzwQOOOue4IB7Zz9RyKXjnOef/ANXTvn8KMAHjOOAPXHfPr39M9CcUV6Tae143W3bRfrfv6N78jtd2ulZfkvXr9+7DH9P06Uh9v8jv6f8A6yO1LSd856cY459v8OaPvfr8r/1p0fkL+rCZ5HTg4xn1/qO3qCR9TJyRkH06flwc8YPbnB5FIM9SOeOfr16ntjp69B3pQee2OBk9T+mOvGOCDn1p7dNLbLbeLet3vpr5pdCnptZ2Wt7PqtrdPxd3cQbj1wD9O3+fy7g5pfmPXH0x6n0yOP8A6/Bpcnt+p46nv+HTtxQMkDPXv/nJ/wA/oNvsvz7Xfz7u/kxuT30W3a/r31v16et2054yN36Y57YGcevJzzxSkgDnjv34ycE8emf84pSM/p/P9Pr268YowM85PP449vTj/wCvmhPrs+yW9mrLsvVfd3nmvunp+O2i1srJbpJa+Tsm0dMHg5/+tnr/AF457ZXgf/WH+FLSY+p+vb2Ht/8AW9BhXv1fz7/f+IX3/rXv6+fr6Afpn/8AWPX8/TikAI3cg5x+GO2PbsM/lS/56d/Xt+lAxz/LJP16/X8eD3pp2TXo7W81q76W7d+vQOj32X5p3/ruN5yDkZ9xnupAx9AfXByRwKRmkHv8rZI4OSBn0HOTz06A8EYcP7wzz2zx2xn6gdevJ/AUYYnPPPcggHsR+JP4D1NUmuttF0S8vlpte+qtbUpSSab1tql0ctOytayX3dSN2cceh6EerKMcHcNvUnuBnoOEYEhcnPXdkYOeAM9jyMDgHAAXHaXaAfqQPU5yO+encn6nOBQUPQfdG4Y5GCxUgYB44XHBGO3ejnWnlptbR2u7Jb3/AAv5DclZeUlr1tJK66vdd30XYZll4wegAzjjnOcgAde54zxxzl4KnnGTt6AAZ57n2PI6j9KMfMx6cDnHUAjsOvOB0J4BJGMlcAcc5yTjJ9cng/XHfgc8ECm5aK10/wDyV7f8G+ulvMjSy0vvffXRaPyu7aW+V7i9O+Px/GmMWycjOc9PTjH1PrkHP0zT+P8AD/8AV/n9eE9ev+ew6dfyqVJrq2uv/Ad7/kCdnft+O2nytpfTQbgkAMR7dARwf9o5xkjHU575yUch3VmERZQu1goVlwQBh1CsG4yGBzgADpT+/wDP8ent6jjn1z2azYPTPK9jjj1AAzzjqQDkH6y4wqO04qTWylZrTlv5apXWvy1ZdNtSdtG0tVddYpvTuv0t2frvhX48fGHwXZtpeifEDX/7EaPY/hvXJYvFfhiWMEL5Uvh3xNBqukNER8j/AOiJlQFznG3p/wDhb/w+8TPt+JXwI8HajPM6tN4j+F+oah8KtfGduWGm2B1XwXNIOHKv4agRzkNxgD5554z3HuQAfYHucDAGOnYGjDEkKc8ZyeAxxkdyCQoBIPXGM964auT4Co3ONNUJv3nUw83QldNat03Fy9G2u51QxmIjaPtI1IR2VSPtI7pO0ZRl30631T2PoR/Cv7PfikFvDHxa8U/DnUHPy6P8W/Cg1TSVznEf/CZeBjdMFUrsWa58MQLj5nVt22s+8/Z2+JzWr3/hSy0D4naSoMg1T4X+I9K8YlYhgmSfRbOZfElkGGSVvdGgZfusA6mvDQxIKkZGeQQmMNgHIyeTgj3zxUtpLPY3Ud7Y3Nzp95D80V1YXM1ldo4IKsk9rJFJGwIZgVZcMTwByc1gsdh3/s+P9rG2lLFQUn0dueHJK/dy5n3CVfDVNauHVN2T56M+R391q8Xdbqzslo3Zkt/p17pN3JY6rp9/pV/HIUms9RtJ7C8icHGHt7qOKVSCSpBUnJOVBHFbA4OTkAY6HOeTnBPJHPHrXsNl8evihFZx6brut2Xj7SY8KukfEfRtN8a26x8KUjvdXgl1e1baQiyWeowPGuCrcYrSTxh8EPEPyeLfhNrPhC+dAW1z4U+K5UsxL8uZ5PCPjGPVoHTqTb2Wt2K5+RCqgBaeKx9HXEYLnjH/AJeYefMvs6uMuWWltUuZ67mbo0KtvZ4jWSWlVWfS3vxbVlvfS2lkeFqcnqCueCMjA78YwcYxx0JwcdafjnsT09evpj8Pxr3ofCz4feJE3fDz40+GZrmTHleG/ibp918PNdd2XPkR6lLLqXhW5dThFc63aLI3UIOnM+Jfgh8WPCdudR1nwFrraMAGXxBpEEfiXw7Im3cJE13QJdS03yyvzZe5U7RltvIq6WZ4OrJRlP2E3vCtF022krJKpyv1tuu+4vqteNm4qUU179K01ZWTu7uz9btPW255cAQSMgeueRjuP55GR0PpTvX04J29c+o7D1Pf8MGiMK+QjRkjkoXAZACB8ysQ2Qc8EZIXnqdsRI69vXoPTrx3O3jvxknJruUoy+BxndJ6NOL+F6WTfrZefQwnaMtn0VpJrVcu+jSve1vn2Q5mccB+BnGecAgg9eOnfoeB2r034dfGPx58MmvbPQrrTtX8K6viPxF8P/FVhFr/AIF8SwsrKU1bQLwGBLkBh5Gq6ebPVrNws1tewuik+YDg59emcY9Oh49ev8qjcsDyMYJ55z78888fX261hiaFLE0XSrUlUTaavFNpq3K49U7qya1STtsa08ROlJTpuzWmmzSabTWzTs1Z30dj6VuPAfw0+MT/AGz4L3Z8CeO5Q8t18EfGGspJp2qTEb5E+Fvja+ktkv8AeQ5tfC3iVodYTPk2ep6nIFiPzxq+katoGp32ja9pd/outabO1tf6PqtnPYajZTxEh4bqzuVSeJwcnDJkDDJhWBOeNhxlSSpUoQdrI4bcrq4AaJk67lYEckHAGPoXRfjLZeI7DTvCvxz0G7+JXh/T4FstJ8V2l3FpnxW8IWiALCmkeKZYpE8RaVaKF2eHvFKX9msYaOxuNNZhIPLisZlr5oc+Lwy0VOb5q1OK5W1CTVppae7JqXTmdkjr56OKilJKhXercb8k3Ll3S0TaW6vrayTbZ8/qAcDAB9h3HY4JJ+v5jqaCRgkZ4zz06dcd/p0/Dt7r4o+ClwujXnjj4XeIIfin8P7UtLf3ml2T2njDwnCWG1PHHg9nm1DSQmCh1SzF/oU2DJHfruCDwlcuhbgrkDIIxyBxnn5skkAZOOuB19HC4yji03Tl7ySvTk3GrCStzRlF7S6bdDmq4apRaUkmtlJNWd7bNXT3v5Wb2Qv+en1/yP580Z5x6n2yB7+xweevI79DgHkDjnv27nI6joRkH0NIemMZH68eg7jOOOPTgc11LVq2ve9vu1ev4N69DBW7301WnrvfXpotXtoxAW4GcZ5IPJ9uMD0x+PbNGX6gj06D6dBnPAyQfUjBpw9cAE/n9P8APpQM+gH0P/1hTbXZWW22903676W6dNxt9o20W6v1X4arvpayQ0bjjoOefUj+nfPT8KXk8EcH6Y6c988np0Pv2p1GOnb6Y/L6Ur67Jem61vfpqvuE5eS8rdNtemum4mAeo6Z/Xr09f8c9aOOh9z/9fvxnp+mKMdOTx/n6/wCPfNLSTXa+v4abdm7asn+v69ba/wCQn+f89u/4/hQRn6fTJ98H6HHAzzS/56f5zSE/p1/Hv9Pf2NCT7Pp+O2vS/RjSu16rz6iHdjGcHtn6c4x0P58D8aQbvUenQ9QM+mTkZ/PI9Kd8xyMYOcDv+XTJz7AfXuAZB+Udeh29cHH0JH/16fMoq7ta6163Vvz/ADbvYrReasttG9nfa6T8uva4mW6ZGR2x+pweMjHQdTzSDeOuD09fbPHBOeeM/T0JgjLNtReeWIX6MMkE8ZHy5yTgchq9Z8IfBX4g+MtOPiCDTLLw54Qjy1x448c6ja+E/CMcYwXaDUtWaB9UdVBP2XRrfUbtyCsdszFQMq2KoYeKnWrQpxaTttJvRpKKd231svJq1i4UqlWXLTjKfS8VonKz1fwrW2+y7pWPJcMxIOcrywHIHXk5GQpzyc8AZxgEV1fg3wH4x+IGqLo3gjwxrXinUiA0sOj2Ut1HaRkfNNqF2VSy062jA3TXV7cW9tEmXkmCgket4+AHw+ADPrPx68TxKBtga98DfCuzuQBkNMxXxj4qgjdV/wBWnh61ulGNzIWB5Txf8bPiD4t00+HRqVt4U8FqNkPgXwJaJ4U8JxRggqLqx050uNZlQEr9r1y71O6fq056DgjjcXidMJhvZ05K6r4hOEbNxs4wvzS0d1zcq10bSZ0qlh6KTxFa7TvKlRd3ZWdnU1ile7vsmnZK+vat8K/hn8Pfn+MXxOtL7XIMk/Db4OS2Pi/xCk6nJtNe8avKPBnh9wyhJTZ3PiC4jXKi2DrWfc/HuTw7BJpvwY8E6B8ILMq0Umv2TS+KPiXfwsCpe78d60klzpkkikF08MWWhxo4xHkKpPz/AIVFKKAI8ZGwAKM49AoOMYz3GTj0Fwevyjnkc5x0LdST05I4xk9QSoZSqzU8fWqYuaaajJ8tC6ttRjaLWmjk5PrzPo/rkoQccNCFCCVnNXlVk/dXvVLtrS6tDlW90mXb/Ur/AFS+uNT1TULzUtSu5DNd6lqV3PqF/dTOSzS3N5eSTTTSE8szyEknBJYc0A2SSCSSxGePmAUNgYbcMZzz1B9sUpTd0AJJA5z0zgjAyM8H2OOOwpQuM4AAH3sjJ5HryDg4znt17mvXhSp0klTgopRSSVkrR5fsxXpZ22SWhxt8yk5NznJu8m7y15dW37z6ra78mxVLAcEYI5znBOeMnI6Z579hkjhcv6jn8Mjj0xn34/MmkIAzjgEA5Az0PbHp19TkkdKOcAAcY6k+3T8fr09OxfTdW036JW0srXfV2b2tZXsJeVrab79G+tn3avdbaXGh9pdTh8KCM8/eAJxkYzwCFIz0z6VJ5xAGRuyO+ARg9yOn4dcYzj7qFV5Gflz0+bgDB/Hk5yBnBHQgU0LyVzgAEgEnHXI67j1JOQcEjkDJBaku1lo720asu1r62WitbpYpy93Z2vfreySvq9Xq72Xe17WbeWz1AYkMpBwRhuzDoDjodvJzjqa9+hC/GfwWlg7Cf4rfDrRj/Z8hXdc/EH4e6dGTJYO4+e68T+CIEV7Iuxm1Dw1HJbDzZdLhV/AQo/E9fmblsY6k9/T/AHcEY41dD1jU/D2sabrmh3smmavpd7b3un6hCwWW0urd1aOQEqdyHBSWMjZLE7RurIzA8ONoOtGNWlLkxNB89KST1enNCT/lktGtdk97W2wtVU3yzu6c/dknbRytZ220a1eite27RkBiBnacFcAsCp5UYbHP05wSfQUuCMkn14wePbAPUE84z7n09j+IWi6d4j0iD4s+FrWK10rVr37F4z0C14Twf4zlUyOkMK48nw74iVHv9ElJ2xSPdWAO6BA/jnO0lgAQDxkAkEZx9OR93PYk9q1wleOLpuVuScWoTg170Jp6xd9N2rbJppdiK9B052WsZPmhNW96Latukvlvr03G4IHBGQR1OcZO3BI3deBj+9+QFyc8g/d568fp09xn36GnEnjHX07H8fb/APXjIpOmD3I56/z5PHtnPXtkdHNfSyvdtW73Td3v0Vrafpin/wADrazvZ2V/S2mv3Kd/GCBjjp15PPQ9RigFie2BwexJx16ep/L14oGcc4AOScYx2/QjOev1HSgcE9Tnvzxg9Onv69fSk3e7stv1ite67euj0ui++2mqS76X27K9uq76AQxIyRgHPGQc/r/PuaXp2/8Arf8A1vpS0VH/AA+n/A/pCbv2XTTTr/wROARwTk+px69Mj0Pf2+qkjnPAwRwMnngY6c5x9aKCeg57468f0/Pv61ak2tN9LRa7W9drfjdMX6eevyGtgckct8uDjhWKjrkcHPP6jO0UZ446AYzxjkdOowfyx144pSeDgdfrxjnjHPbA9j37tAPpwCSBk85IBJ9QM8ZHHGB0quZuy0TTvqk7LTZ7PS+6sle+2r01+X5q/wB/Te2re2qnJyMAg8Abcnvyc4GeTjOevHrSYAIyAdvIyDgdQMEDjA68n8OpCecevsTgc9R1579hwO+aGAwxOTkj8OTwOMDHtzng9ql+8km2lpdp209299L/AJ+lncrok0vLT/D6W+/W99E0wYvkFn3j7pGFIUHsC3IGOoyMtSbIxg+VF8vC4XDjBBJBVgwIGemCMnAPApScHb0AUdicAY4GePukDnse4GKaSDu5IwCPmPOGA/2e3THp1G3FHs4SSThF7JtpNdLe8++lt3bT3SlKXKkny2vaUb3vaOlk76NpWu31bNODXNYsSPsWs6tZ4OVFlqt9bsuM8ARTADAHy8AMQvAHzV0tv8TfiFDG0I8Za7NARtEF/djUYdvA2tFfR3AK9OPmBA4AArhmxnIbcME9Dxntg8j07HPToMpnn2/n9f5e3OOKzeEw8k70YN7t8qbsuui1vp6N+iEqtSN7Skum8nrdX18nZq60V7nct8QNanydS0/wpquTljf+FNFMrtuzzNaWlrKDtJBIlBA9yBUX/CUaLLtF54D8NsAMF9OuNb0l8fKPkWHU5IVOB8uIOpwBxg8STlumBjOe5Of8Oc4H3ueuAHnt+f5enPBP+eieCw/SLjt8MpR7W2a/4d6aFKvU01vor8yi9dN3bZW0187nYNf+CJy4k8Pa/YsTkyWHiKC4jXByCkWoaZI8gxkAGbJOCSCcVXa28HSAmDVfEFiGI+W+0iwvACSM75bO+t3AAxhhHk9wDgnmDt54A4z0ByR9cEDB98fyBkDBweR2zjHTrnGfvHPrnpS+quPwV60bJXXNzrSy05rxuul+66Ifte8YPTVKLi3srNrt56aLQ6STS9Jc4tfFWmSDPIu7LUrN8YAG7ENwo7ABZOm7IPaI+HrtgTaX+iXe3oLfU4EcnjAVLwQNyM8FQBn2rAzyeFII5yAc+mfUdfqaaBGW2mNAOrEDBzxgBhhvUYHG3k5waao4iKVsRfvz00+z6cu+t+r3fYTlB2bp2S3UXp9nffe9tXvvqzebw5riBSNNuJByS1ukVyDkZAU28kuMdSAMnOQR0rOmtLu1O24t7qA88S28kP4/vIhx8wOcn6knFVkLpgxySoQcDZM6kZJHChxgnrj2BPbGjHqerRMGTUr8HoUN1KVySD90syhQe3Y89BmqSrr43SltsmnfTW7vq/0tqnqOdNtWclK13dRbdrbtJN621/4BRLKQAQQWGOSBwT1GcYAyvP489nAKQOcgcE8nGPyHQgde+CQOK0m1XUnIEk0dwQcH7Ta2s2c5zlnhLZPTkkjnJ60034Zh52n6bKT97bBJbk4I/wCfeVFB6cBQF9Djik6it7t+m76pd0kvS/e+upmrea6pX06PVu3Xf09L0eMDg9OOo5wDzkZPJ5HHGAec0vCk/LnIyMHPrjsD94jIwc9DzgVZaaydeNPaFiwz5N5JtxxnCTK5HTOSxB3ZwCDUQNn0VblW7ljDIMqQCM/JuJ5OeBjaD04pcytzRttta7u46763+V+oLqr7PXVaK8dVq1d6a3to+q0ARg4GPbGPUDrjrj27elTgHABPBycc9Pl4zwM8cn3GKjCwsDtnIOSBuhcbgQDgFd2C3LcrwMd2AqbABGJImxnhXwDyOoZevbnPAAHAwWuy913Ttd7NJrTf12Vuyvda6W3u7W36O/p2+fkZqJtJ54IHGSOp+YDnsOnoM4yOKfn/ADg+/wDgfw56VGrM4J2hSQoPcEHgAZAwzAk9vY56LzjaTyQckYJ746jp6+px15pNXl+FlZPZavv2/pjSW+na2t1ZJt26rfr92gpPIH45+mM/oQOufm+uHUhGcZ5wc8gHHTp6dB/nGF4/P9RUraz8neylZaKz7L/hrakicAcf15/E9eMcjPGB14pu8YyeT6YOeDxwcHtx36eopOpCgM7vwqBSxDZAyBs53A4HPUkDAFX0tYoVWW/k8gEKVtoyr3su7bt/d42Qqy4+eQ/L90oM8N20bV3eN/L4U73dmnffbz1KSTSaTeui+HVWutfwdrq3bUqIGd0ijjaWSRtqRKCzsSMgBVBI9ATgDGBnpWnFZWNi6yaxM8jAgnSdOeNrtslGX7RenMFqrbgSEWeVcFWRSTilJfkK0VpELKFvvBCWuJAGU4luD+8C558uPYinseSaigNhvl+XAAIBzt9QOSSM5OOSD/tEKUZSVvgjpdp2urrq3vtdp99FqXF8mrV7NO7v3Wqae6euu++qVjdn165ljNlZpFpOlg4FjZllMoLKT9uuyftN7IBg4lcrkEKmWxWJtGflwF3Btq8DcOOADxxjjJ6DOecgGME45PHBOM47AZHGdx5xjOcZJd83pwMD8Dk8D/PHTtURjTp/DFX933r3f2e/49e6dyZTlPVu911vp8N7Xs7rS/6oXLc88HHYds8Hj/PTAA5CM85/lkdR3H45569e1Ie3PfJ+nP8AX+tLz/n/AD/+r3Gattu13d6aN6Wsrb6bf1qQtf8Ahrf1+ffUMds9evH+PH14x/MoeO2ePu+oOP5A/rS5pMgDPb1paeb/AKWn5q/oAjDOPlzlge+F/r0ycHIxnJ7UduDn347+v55zye+D3Uck4PtjgDse/wDXNIBjJHPU/wDfXJxgc/r6Zzmm2n1V1a613dnqul1q9rvXVDT2TeiabV7rWz1V/mGAc8eg/Dj6Y4/THXpS4ORzwO3c/j/n8ewMH/Pvzxx3zQc9sfjSu/01t+v5hrt8tfu67bB64/Pr7Uc9/bpx/X8/bt6mTnoOn6/p7dx/gc46AH06/h2o+7TX1vbT+ttRX6fP7/8Ahv66p06kduoxxkA9PTP6fm4D36+p/wA4/l60Y9fy7c/z/Gjt/n/69GnXvqv8rfPsG/8AX/Dfkg/H/H6+n+e/Y6ccc57/AJ9Pz/XpQTjrRn/ODS/4P9f1+ACZznHuPx/T9KQdBkHOPxPPr7+/48dVPtjPP4HH/wCrg/0FGOc57Y/lz+lU3olr539Ft5P9EO9vK/36fdo389PvCAQVxxj/AD+Pc/r1oPA4x+R79enNLRj+f1/Afj9fT6Tf7t7dBBnhiTzjqFyMDtjJwO2R0z2xXrHw4dtZ0rxt8P5nUr4l0f8At7QYsZK+LfCKTajbCIBlHm6ho7avp2E5lknhTkcV5QAScetauh6tdeH9X0vXbL/j80e/tdRg5yC9pMkrRsowXWWMPG4HDRsyt8p458ZS9thptW54WnBtq/NFxa7vdLe2mmqbRvQny1Ff7ScOlrPlW3pdN97dzKYDdwTsIVk3Z+6wJ55JxnIAyc4xyDynOTkg88Y9P8/57DuPiHo9tpPiq9bTAG0bW4bbxFoToMR/2VrUYvYLZOcFrOWWSzdVJEbwbXOeK4g8cd+fT/6/PX6VvRn7ajCokveirvS97K6S7rzd9bK2xnUg6c5RdnqrO1tLK3z7vXqhpOAcYyPWjI57d8j6de/6+lB6HPTnP07/AP1+/XpSZAwPXkfnnOefcj6dqpK/fz7W03eu3X5P1S22fy7ab79tmra3FGOuMA/T6569+/fpRwP5+/Pt1/8A1e1LR9f8OP1/P9KFd6d/P+umnX0J9Q6Y7D6dPT0/zik5GQSD16dv55z1HHrS0mTj34+mc49/w/XFC1+en9dg12XUO/XjHT3z3/THr+BpcEfTHA44HH4/n346ik5yMD/P/wBf/DrS9SDxwCPzx/h169PQYP8AgbW/q/nv3D7tv6a33DGM85/L9P8AJpDnt/n+mRwcHGefwU8DP9R/kUUbdPv8rP8AJ+juC0s99ROmByff/Ek/pzQMDsefXtn/APVkjk55Io9u/Xp65/yaQgnPJHYYJORjv+P+HoaF627/AKPz/p+jstVe3m10v0Xmtf8AgXDjq2eccE9Ont+ee/J4pCCCSOMhj0zlhyORn1x0Jx0B4p/Ix+v5Hn+mPegLjknGQcHHJyR7Hjjr2GBg1Sd+nS1raa2Wt310Tv09Qu/yWyei9ewE4APqcfqAeBz3+nr7oTgZPIGfbPOOfoR/M46UbQSMn8B25zzweuAD14J+tJjOcDOMkD0Oc/r1Y5HtgHhK2nrrrfTTr2306bCTV166+mjt91/6WiMDnHGCPoeSo7YPvyR24pR1PocnjPoowe3Oc/TnoDTSFySOccnv9wr0Htt4x3pyjBwevzHknPJDemOc4Az0xxyMVayS11VvTSK1fqld9U2N/CvVrbr7t+/z236IUZAGev8AL/PtR+H8qCcY9zgf59KMjPB5GR6fhn8+B6d+andN9vPpdaW6Lqrf8MebWn3evpvYjbPQjIGOuCACVxkEkgcNkEZJJ55FKzZHqT6nB6rggkjoeOQuGzgdSRueQcDgqQM5z83TAGMDkk9TnJOSXEAg/QgY9yGzjByckn8s56C1Z209bWVn7r8u1/wt0VOSSjot7Oyb6R3tpvq300vZaEWQvDHJxhRnoMDbk7QR0APHfg54pRjLbQBgnvzjjjORtODknGeeMU/g/MQOcZ5zgggqcDqRnK5GATnkigjrgHJ653YIyD/dY4yCOuc45J6zzX8r216XTj0209dt9w5tdW0+ru7X91vaySWqurX+8ASMK3B74IOTxyCOO46Lxn6mnYyMZ/Hj69Pp27j1pAPUA4HJXjk7exGR9dw5wTRjBwRnkk8kdTnt34wDnIxxwSQk73fLa2ulk1a3nbo7a9SXZdErfd8vL5tfIcBgduPp/L/AYpDgEE4bHIHJJ4GQMkdMYx0B56ZytFK99HqtrXtpppfotPkJPS6fnddu+ncUsdhQqrIRko4V16YOcjtnrx3xnmuo8LeO/G3gacXngrxd4j8LXIctu0PWL6whkBJJE1pFP9knTOMpNE4YAK2VyDy39PUfn/8Ar7j60Z5/P8OnHr3/AM5rOVChUjyVKNOouinBSu7JWtvr3vr2vtdOdSl8E5rXmb5mv5bLS2isrX77nvE/7QOta9+7+JPgL4a/EyMhVkvtW8NW/hnxM4LAM48T+DW0K/kmcNzJereKzYZ1bGDG3/DOfikMYx8SfhBfuMoJzY/E7wmkh45MS6D4mtLZWUYPlapKq8ESt18KYnbgHgnJ4JI/AnHP049OuWMG/wB7BGCDjC8dMkntyOcnHAOa43ldFS5sNVrYWVtqU24J+7b93LmgtfK1tDpjjJtctWFOtd/bik18O8lZpt6qV9Laq1j3J/gRrmrq9x8PfGvw7+J0G0ulr4c8Sw6R4hKDHyt4W8VJoerGfsYLWC8bPyxmTBNeW+IfCHi3whdfY/FvhrXfDd0BkQ65pN7p5I4w6PcQpHIh4Ikid0Y4KsQQK58xhiu7aHUhgyHawIwQysmHBJJO4HPPr09U8OfGr4qeFbX+ztM8Y6peaNja2geIPJ8U+H3ThQsmj+IotSshGAfupFHhR8pG0gz7LM8OvcrUcVy2tGpH2dR2aslKLad0rJckVrfQXNhKnxRnQfVwtKKv1s9bJd2zy9ULKrBgQTgbdpyOvA6557gcdemafhwwU8KuAeobIHb5Rxx0zwAQP4c+5p8Tvh94g2J49+C3hua4d3aTXvhtql94A1YnqZG0rOq+GZZAfnI/suBZCdqlV+WrK+C/gl4nDHwr8VdS8GXj7WTSPir4cmS0DEEmMeKvCo1G0IUgqslxpdqGCh32dFhZjOk3HF4SrRaXvSUXVhd215oXtZPd20tezdgeHUkvY1qNS715rwnb3bWcrPppZ9eh5V4W8W+JfBGtWniPwnrmpeG9csWZrbUtLuGtrjaSS0E6geVeWsoO2e0u0mtpkLLJE6NtPtz6z8KvjSQfFa6T8F/ifccp4w0izli+FfjG8JZ/M8V6BZRtN4I1W4cfvdX0CKbQppZDLc6RZ/NcVy2q/s+/FC2tH1HRdFsvHmkoC51f4da1pXjO1WIBW3zWulXM2q2oKsGIurCAooKuNwK14tdwz6fPNbX1tPZ3kDFHs72CW2uEboVlt7mON0IOUdWUdfYms50sBjrVcLiFh8T0qQlyzT91pSi7Rktm4teS6msJYrDpQrUXUpyaaTd/5V7rtpZP4k1fTodf46+HPjL4b30Fj4u0Waxivk8/SNZtpodR8Pa/aMQY73Qdds5J9O1O0kQhhJb3DSIcpPHFKGUcSDknjpkDPY5HUdD09T+pr1HwJ8YPEfg2xk8MX1pp/jjwDqLs+p/D7xYst9oLSOdpvNGmXF54b1dUbNvqujT286SZMyyR5WTup/hT4S+JMMur/AjVbyfVI4Tdal8H/FV1AvjawCqWuD4U1QLBY+NNNhw/lwwLBroUAPp87EtVwxtfCtUsxheHuqOLpJunf3Veqm26beibb5W7q/aqmGp1482Gm3Ld0pySqKzjfldlzLpZdHtpc+dOec8c8fzHp+XsexoweAOPf+gA/wDre3qLV1a3dhdXVneWlxZ3NnK8F1a3kL295bzQkrLDc2sqpNbyRMMSRSIrRkbCARxAR0I75/Q44/Tjk/WvVhKFSEZ0pxqRaTi42as7NWs2npv09TzpKUHaSaaezVtXbv8ALT/MbjP+T+oGM0AE9/r6f/W9uvXHpSkEbQcDPQZ+Y+nH1OMZB6cGkPqPyz/k/wCP500k1dSvbeyv29U7X69trEuSuk3q9r31uHPT/A4+h/z1NGMdSDz0wRj2P/6x9KcFJGcH29+f0x3zTtjYIwPmBwxxgduvBAHJIHJHPAHDslrN8vrZaL1fT00Vu6H5bvp+Hb+r/cRMcdB39vy+v0B/Cm5ycYwepxkkDp83YY5GM8Hsep7jwb8OPHHj+d4PCHhvUNXjgAa91MJFZ6DpsYAZ59S12+ktdKsIUG5nN1dwsFBKhuK7+TwX8IvATE/EHxrP4/8AEMOCfBPwomhOkQTqebbXPiHfRtYBMqFlXw9YaqxXcEvIn+ZeKrmGHpv2cb1qqv8AuqV5t7WvZ2j587Std+R1UsLVmnNpQglrKb5V0d0n8TWmmu+x4rpunX+s31vpmkafeavqd3II7XTtMtJtQv55GJPlxWloks8jeyr0DHOOR7lF8DJfDUUN/wDGLxp4f+FVrKkcq+HpT/wlHxGu42+YJb+DdFmZtMd1+4/iG+0hQzASAKDWVe/HXxNaWdxofw50nQ/hF4euoDa3Np4KSdfEeoQHI26142v5LjxHqBdWIdIby0tSchbZFOB4y7STyy3Eskk80ztLNNM8k080jYLSTTSM00ruRkszszFsk/NWPLmGKSvKOCotx0SVSu9ru7vTg2ndaT0Wlty+bDUUrc2ImtU2nGjd8rbtpKSfr28r+9SfEX4ZeCCq/Cn4dR6pq0Jyvj74tC18RaqsinCXWi+Crf8A4pbSGIZXhbUE125hddwlO0geU+LPG3i7x5qB1Txn4l1fxJfLn7PJq17JNDZx5BSHTtPUpYadBGCRHBY21vCq7VEeFxXNFONwJJzgk5J7nqTnJPB5AHIHXNAUjk89MnA5HGPX6Dt7cGt6WX4WhJVJKVaryxXtaz56jast5P3emkUk+11pnPFVZJxTUIXTUIJRVtOy3snHmvdpp+hhjgtgHBIwMD1HAIB4wMY65Ock00DPvz1Pcg+44HtxtOaefT6/5/z6570n1/ye3/1/8cV17K0bqN00tNLW0Wmya+45r2ula71lpr0101bfLa/e71tYRy2McHPT0wcdB04Ax7c54yKiPy4PJIzg4zxkDH4EEZIG7ABz0qb6j1/n7U0gY5Jx1/Uk9P65HGOtUpO9nqr273XR6/8AA673uNPZW0ej7u9v6Ssn89RhAJ4OCMDscYznqQduQCPx6c4XAAO4ZLEke5zjCn7wAxjsM+tOAGOMYOc8dTzk8epz6+1LtwTn5uuCcdGOe3HGAByenPIp83e9tLr5q6emu3XRp9GXzXfK7qN1pu09L62Tvff7vMacDoeRjPTttzk+pGOMjPHFKwOD7duck5HGO3Oe4wB17UpA6nqPTOefp/kUE8cjjjPf/OP/AK9Tdu3e9l26WXb1+VyL7Oz0aV9Em9Pd06r72pIQqSew7dN31HUfgc/THJKkkggEE4PyjtjHX2Jz27fMPU5/+v8Az/rgdPftS/5/x/L09xSvtfZPovv/AKfkhdrr8O9tHbV/lYAOOSP8+3ue349KUZweR0J647H056Z56evYUlH4/wCf8ihOzvvbv/X3feB3Hw/8ar4P1a6OqWrat4S1+0bRPF2g5AXUtGmbes9tlSkeq6TMFv8ASLoqXguoFAby3cGr468JnwhrQtLa8GraJqFrFq/hnXogFg1rw/eHdZ3gGcJdQg/ZNTgPNpqEFzbyDcik8gBnOD0xhT3PHPIPBHykcE8969W8FXdn4u0h/hjr9zDbyTXct/8ADzV7lvLh0bxJcD/SdAup2wItE8ThIofmKw2msC0vDlHug3BXjLC1ljKUW6bUY4qnFPVKy9pbT3o31t01t7qR6FGpCvT+r1Lcyt7Of/gL5JXtp9+vS1meThgy5B6gH1PPfr0HX0x+VOA6dj/9bHbgn8Pp14lvLO6069u7G+tpbO8tJ5LW5s7hTHNa3ELiOS2lRiWSWJ1KEbuMA8jBMXPfGCAMZ9eOfxx1+p4r0FKM4xnDWMlzXVtn8+lnfZX8zikmpNOy1Sei00V9N/68w/z/AJ/z+dHPr39M8enJP5/pSnoCOc++OnPX8un48Unr1Pp+Q/Dr64/IUvu37f8AA28vwIF5yeR+Ax/n8h9KT6Hv9enUUoz9Pof/AKwoo7/Lov8Ah/Vr57gHOf8AP+cf5zQf8/5/p3oopf1v/X9ddAGE4I4Y/gcckevf09OlO75GT3478fl0H9fU03qxGSPp7YGOR14yfbjml+bHHGMgdOfTucfic46jJ4p6Wvdab7dF06269yrbbapPXzt5dHfbpe4DGcgA545zxz24z1O7sOM/VGOAcHHGQTwF5HX09c9ePbhxGSOTwc/X/P8Aj60hBIAwDk5wTxy2TzjB7/ljkUJ7dk1ulpre19/62DqpbpNfK2y6Xdlf8xjnrgjOTyeQOnA6cDnk++GPdChAPzAEbjgDn7wHIOehzjGM45GWpzckFs4HGFz36g9ucnB44I44OWknO3GAFIyc9yWUcA4Izg5yTjp3Npu6s76u/XqtL2XfdLr2V04ttQUbtO7d12cdelm+yWj7NNiEHgZHAz0HPcdOc4AxnnPYUEEfMCDzkAcY/D0Hv7d+aaQRnBwOCTyMjI7YOB0PPHGSf7xjHTuckZ6d/fkZPAwOeckHF2/4Hp89SlG6W2y67rS9r6rXSy7a+Sngk4yeMg5GcdvbvnpnnnNDAYJPbHHfovPOMckjg9ePUBW5HBGRjHqOgx16c8nA6NjGKNoCgZAcKOPQ5DHnjkjGeeeO9C/K1+vb+rvutCbL3dW3dc2jukuX56J6W+Wyuq8YIPLHBH/A8d8dBkc5x0LAYNSdMHlgeo4yc5Pt9MDGOvakHUnGBjOc89Qeg9cEck8cAejwM5+v59h/L/DIGahyd9LX9VZ6xvbbVN26b+aE9Laet0tb2fa916313QgXuc5J4z0xkYAxjA4JOfxNGMgk46eg46/1PB4xx060vuOvOc/X6HrjJbrzxyTSEbgQe464z+nGenI4+tS3rZO23ZpL3bW6XW7XrbqSul3216+ugnORyB1zwexAGT6kdBj73cAcrg568en+cfTHPHP0MEHgDGCfxPrznnJzjpz7ALSbvu76dv69fw7ALgkgZHX8QOc9ug9OO56HkIwcen+f8/n05pM9uPX/ADnPTjr6+5pT/kfif5e/PPpWl7JbbL9L+n/DIBCOnv16jjnp7/TjHvSEZG3HB9APr79f1/Kl4Hr+P+P+Prij/Pf/AD/nFF+Z9baPZ9Nde7em17726jWj9N/vtpt38n5omAKjGM4JXrnpkcEDHYZPHUnOeC5OecEjnI7gfJjAyMdTkcnv2xTRyuVBz6EYxnnHHt789TUyEkpyBjJIzyeVJyee/bv+IoTbW2t0le+t7a7Le+mgeqX5efTbpZqy9embEpXII54zg9eAM+mOM+oHHtU3ccfQ4/z6VEG+bLccDjHQj6Z55PXn6c08kAAlsg465PHYg9CB35zjHPTMNO+my6q3lo9H0umra3ul0Y9f69Fp/ktvQbIf4VI3nGMjhfXqBnOMDnBbCg5IFSCP5V89hCuAS7fNksVYYjVQTk/dJxwTk+sIyAp+6A2AQNpGCBgseT06fdJ568U8IOh+bOMk5OcYx1JGQRkYxzzwSKtaJK66JX8rX6u91+fzKfKlupPTrZr4U9rq1r2891uWUuxEGjgVY2bhbghTcMCADtbOIzkA4CgnruDkEVQgyW3EuWy7E5Jzj7x3BiWxjIwemT2pQuCSABkenQ/n16DjjGQMHBowcnOM8Yx9RnscA7RgnPTnHSk3G2j3tbbTVdHon5XtfVdW0krr0Wi7KyVr6N26eW4ucZwM4x7BuAAeueCygnk8jOabnhmAIODz1weB0z2btgknvSnA3YPIwSM9B8o/AYxnHHPejAO7BOTwe4yCD+OPrgHj5eyv1a369Ps3TT6Wfe13ewJ2te+6u9rrS6te1rbaP07RsWyQyHnjAY89MZwRkevHueekhfI5BGQTxgY+bAyMcZ9Oo6+waXwdwYEgZOATgHnk+jEsen8IGRyGXJPGeoxnscEMpGOOR7j9eW+l1ZaddEvdbv22std/vKaTSvddtX5X0eyWy3d7JKzHZY4+U8nB6HHHXg+vpn8+CvOecYGfX298fj7U056qTz6DOfu5x+HueCSM8UHfwCAce/A+ZTkfL04OMdx1OM1NktdH3V2rfD3atvbq7772UW01a/Jq1m+tutrXu9dF0DkL13HI6duRx9fTg84yO1G4Dg9cE49h+f49e/NBzzjGOMkc4wRkY9Rz2Hr2pcZ9+vY55OQAPpwfX0xxRuleyV328tOiTfy7j06q6u3o+/LptbTbS2r6aDSMsMNzkHHpgg/+y/gcGn8L04AGePbqfX0+mKacA56ZAAIBJz8vXA4zgZz1x16AKpPUqBgnAyQcfK2ePfgnt+PI7uO+lttO66eXz27MG21vppp5pLbp16a2v0YNnjAJORwOnJH8uxx9e9Lyc8e49eOfpx9fejPBIyM8HjJH1GD+GR3Hej/P+f59v6Undr0bv0/lX/Asienzffy+X69+geuRx+f6f5+lGfY/p/j/AJ/EUuTk+mB9f88D/PQ/z9aVrWukvv8ALf8Ay3122D+v6/r1D8MexopOoyO3qcA+v9foRzR16H/P+cHgg03pq0l0+63e+vR/O+tx2/rbt39fz7ADnOcD26+nfPv6D+WVx/nJ/wA/59hTcZHB655I9fXtjtjHHHpSgY/zgewxnsOn4+vI+99Vp16Jd9Vba71fbdhp6Ptr/wAP+O+lrIUe3PT/AD6+38qQ8dQT9PQ49f8A6/r60AY6dP8AP+cUtSL8dv8AhhCT2Gfyo5JwAT+X5e/4cfrhaQH/AA/zj2/njrxQv6uAAn0PPUfTpnkdf0p25gpIJHfPB9Nw5ypyuR0PHtmkz/n+f/16QZGSDnr9R7AZ+oPfoOOKpK7SaT6216pJ3b2017dOthptbP8Ar+v07I9Fu5JPEXw3066b59R8Bai2jT/OS7eHNemlutMlfnJSx1Vbu3UhQq/bIgf4a85YE4QnDenOCODnkAd+gOAe/eu8+HU1udffQdQmEOm+M9PuvDFyzgFILm8VZdHvGB+Xda6rFZyK5JKAOAcMM8RdWk1hd3djdxGK6s7ia0uo2XDR3NrIYZUIOcbXUgbiQRgjiuXCPkqVsNdWjL2lNNWVpNXir30T1frdM6qseaEKyu21r6qz+5XaSvurXI8HGAcHgZ//AF/1NGVzjPP+e/8ASmhSOeM9cY4H6gdPp9cZy4ADoPf/AD/nj8a6lZO73V9rd0/Tp0ffbry6d79rfq2tuy/IWkP0J7/lz+mM/wAuaWjsRk857+pz6du3p71IhOvUe+PwPH+eKX8M96M+/wD+rt/L/OKB/wDr9/8APb0pr5fP1X9elwEzzjB9zxgfXn/P05o6/wCf8KOM47nrx/nP8u3pSHAz247fy9+/fI9s5p2vpZ9H5K9un666bq+o7a216dPv26deugDHIYg9fy/P+Zz9cUY7nnHc4/Pj9PT69D0JHT9P88Z7DqMUoHc857HoOox+RwfXrTul1fytvptbS9t1qumujHqr308rW10vZrRabvrfZ7h75znp+Ppjt/hkn0WmjA4A46+ue3B/D/63XDvf/P8An2qdX8vwJf8AWlg/z/n/APVRnPY++e/Pr0/LPrRS54755449T0Oe4/8Ar00+qtp9+lr/APDdrre4Dc8cg5z2/wA/qSB7dqTHTjpzjqccg+3cEnP1p1JyAe+eecfpnoP5UK11021+7Xt3ez8/IEbdwMAjjqcY5GRzx838wOnWg55wfp1P8Qzn8eOnHQ4BwQ+ucYAJ6D04PXrjBx2xy3ZAGGOmTnPsCSfxwSOmP1yLtK17326b7W/4d2at03H56drW32/O2rT33tcUngcA85547gd8dM8Hj368IcMCFIyQT2wcH8OpOevPbryhHucJngDLc4Iwev06/XjhcAjv1PQYIyVI7YwM49eCfcqyXXdK+mlnbyto+y3e+hWitZNa3b8rRa0d+trPu7Xa1EYZOzggAHGBnkgdccDABHBHJ6dKcSR0zgA5CjJIJAxkcjnjOD06YFKce+ewHQknP+OcZOM5oyeOOeh7YH9e349yRmld3Wm9ldrR3Ub/AJbu/l0JvtppqvJ6K/kvnre1tkDE9h1IHIyOoJx1wSTkdMHnnuc45H+T0/A++PypSSfXnrz06/19PXNJz6nH15J9/bn+mMVLbe+r/r+tv0Fa+yu9enp8xMEkZUkdQDjvjGOAScjkEnHPPOKT5uSowSM46HP48DI/M8dQaePr0/n+Hc0mM5yPQ/jnOTx6+596rm2vqk9NX05b6aXvo1a3nsNN6bW+/s3o3310sKMDOMf/AF/U8jn60ntnntnv+HFGMZzjr254zntznk57e3Wmgc9OAODgg9enXP54zz2zlLXqlbfz23btfW3476XLddNLej627XXb1F9MHrz156Z7j6cYFO/DjgdsD/OP8KT6D/P+Se3r+ICD0+lL1W2vy06h+XVrXf8Ara4v5/X+n4f4Un+e/wDk9f8AOKXP/wBb6/570Z/X8KLu9xCZx2J/LjP4/wD1h9KUcduBj6fT8fpSZwfT+vByPr+eR+OFz7/5zn+f60X62X3t9rK17/fp07AKpK8qcEjHY8ehJzj+f9V3ErtLEnpjrwfY5HOPfIznoKZz/wDW/wA5/wA/qYz1HUc/4Z68c9vyprezSd7dLt3S7vovuSfS7K2t5JbaWWlvVtb79S9YanqOkXEd5pWoXmlXcTK0V5pd5c6fcqwJOVntJYpA2fm3bu3THFeuWf7QHxEaKOy8UyeHviTpaoEFj8SPD2neJ3EY4EcWtSwweIbYqOEeDVY3QdCDXieAcDJGc575HB6jPTgc/h7hXkAE7QMY6dPbv26Z54rCrg8HWT9pRi3a90uWS21U0073XRp+VzaGIrQso1WlazT1VtN73v5J3XpfT2ybxP8AAzxOG/t34ceJ/h5qEjfNqnw78QjWtGQOSS58L+KWkuEjGMGG011AF+VQc4KWfwy0XVbi3uPhn8YvCGpX0Uyz2OneJJr34beK7eeJt0RtrjVv+JMbpXBMb2muFd5DIV214oAoIGCQOvocY44znqR0GB6kE0hCnJ2q23++oPX0zjo2cdT1yDXG8rlBNYbF16aa1pVr16Tva6aqXlZpbRmvJrddEcUpTUp0YPVe/H92/sptW0V9Vtdvq7XPsnVm8Q6hZ2+n/tLfDrxP5UMQttM+NXhjTre/1+yjClYn1u/03zdE8daXGqqS11exax5APk6gxAB8U8ZfCjW/DsVrqmh3dh458GarNHDovjnwv511otzLOw8qy1KAqb7QNWRRm50rU4IJk2u8TTQr51cn4Y8e+N/Bzu3hXxZr/h9ZBiWKw1O5jsJlJOI57B2exuYyTzHNbSIw+Ujk5+n/AIfeIfHfjPQNa1fVNDhtbNbi3F94h03w9b+HrLXgysyfbPsS2enard2zqWaaOxeXewYy5TDZZRlONeb4TDyxuEo0MRUjGpD2k4wkrq6p0pXdOc7Wio1JQu7cut0sZiaMsJVqOlUnUpQvBpJtP3bc0lbmjG93pdK720PObD4VaINOtf7Siu21FokkupILvy0WYgMUCiNV2pgoPlzjO3DHNcZ4x+H39k241LRfPltIQq3dpKRLdRlnCLPEY0ZnjzgSKAWDsG+ZcbfpKTGCvBP3S2TnoT0wMYBGO4IGBmsyXzEliNtL5MyspilBVfLmBGyQ+YCgEbFWyxAGFLEAmv3HGcO5e8HKFOhSp1I0vcrqyknGKcXJ9m9Xe902tD4fD5jiJVlKU3Jc6vBre7WkU7+aXp2R4x4f+B/i7UdJi8TeJbjQ/hp4OcGQeJviDqEeiRXcfJJ0TRdsuva7IcYiTTdNmjZjtMseQRd/4SX4E+BCi+HfD+qfGPXocg654zWbwz4FhmDACWx8J2FydZ1aJDwo1jUrOOYZ8yzIJSvOviZ4f+J0er3Ot+PNP8T3iXE8v2PX9Ve51PTpLUyEwra6lE1xYxx+XjZbxvEiBioiQrXmULBslCHCn5XDAhgctn34wMYyRyQDX4rLCTr1ZxxONjOEZyiqNCShF8rStKabnL3bdVq9tD7mMo0acXTo2lJKXtKivK9l8Kfupa9V12PYfGfxd8c+PbePTtb1xrfw/bHFl4T0GCDw74SsEGNiQaDpS29k5iyVSe7S6uSBh5jnJ81IGwR4zGoXlQoAPK4wOOpHygdhnFQocZYHOeoyf4Tgg7h1OcnucY9TVgkdAzKcHIIJw/UEfL064JBI28cjj0KWGo0IKNGlCCfZJSb91+87czbu7u7+RyzqTqy5pylNvpJvR6XslstXZq+ltLiN97sdmAMDAXIA4Y9QcjOMnkY4pNzAcKSM9RjHseoJHHboc470MxHLE7SfvYJA6HA3MOCcjtwPlAXimFlORk45wGBUkZG0kA5wfx45OMHNcrWiTS/l1fbp1+++mrVjNJtJ2bXR6tbq706a7X/EC7YHyng88HIDbeAQQD2zkD3PUl5Yg8A4xkrxnPGB16jJzxjqMimsSOF/4ERjPHPcjkk9vocZp+cd/X8ec46846e3H0ove115dbv4d7eT03366Evpol63d7289+3a6t5rj24P+T9eaQ5xwf8APPH50Ag9D9f84z/Kj+QHGP8AIA/z0qdn003v69f+APVP06P/AIIfiAQe/PbPf26+xpfxzz/L8Ox/Hjn3TA6H9OM+xHPAz9PwoIyMf5/z/nkcU3a+l7J32vppbf8AJ+XmHbvfp8rfP+u4fofX6/n6e/0NKM/U/wA6TH4Yx0P9PT/6/wCISByTikuit16b9P6XqIWijnjk8d+/4dhz7Umecev16jp7dM/070d/T+vX+n0Df8/6/wCCH4Ht3/8Ar9u/r70v+f8AP+f/AK5nH8/yo/8A10+2lra6u6eidv8AgeduwCZHqKAR6g/Tt7f575xxTTk9QM849uM44yf5Z56cZXaM5A54/oeP/rf40cul/Tz3tba/V6+VmrlJL1d1tqltvb1ez3WgoPUZ6EZ9x1//AF/0yMGAMHeUwch1+8mGBBRhgqwIUqVIIIBB4pMcY74z+Jz+PXP+c07A4B/HPf68cn3Oe3HFJ7ON1rorq+jSu3rbpe2tno1oCfK4yTaaaem6tbW/nqen61IPiBoUniVRu8YeHbO2h8WwRoRLr+kRBbey8WRqMebe2oEVnr3LSPut79xh7hl8uLBULDBD9MdlwuCCucjGM5OcdD0FbGiazqHh3U7PVtMlEd5as+VkUSQXVtKhhubG6gHyz2t5bu8E0TLtaN2A2nDVt+K9FsI0tfEfh9ZG8M62zm2hZg76FqalWvvD94xORJbMWewlbH2qwaKUFpElC8NGTwlX2E03Qm26U29E21eGrto0rfNHTK2IgqmiqRt7SFt07JPTR66Wu9O+hxmc546EjHUdBjnH1J9j2FKc44Ge2OnXt6UmMBiOnBxxxgZxgDrjJ5yeoyOKcCe3Q/zB/TH8+OO/fa1m72aTXS+zf+Wu3qteV2vptZffZX313v5dtAopu7tkY7deCcfhg5HcdcUdec8AnOeASD347HgY788kcm1uj02Telk1u9denfd2sFtvP+utthevfpjP5dPb+v1OaPfI9Px//X/QdeqHPt0GeSMDvjoOn0I/HFLgcY+ox9Mfypflt06Wv+n9XB6fqvufl+Xo2L9P/rUH6ZpFxgYGB/n60tFrff1/4f7+3cHo/R2+7vr/AF0Ck9Dg5/x+hx70tIT/APX/AJf1/LNIQ1ycDGc8ADnoTg5Hbrkd8noOaQA9MEZB4Gc9V6kfh07+pOKkzg5z2P8A9c+tNIx0OQM9TjJyDz2z6e/HIJFWmvK3XWzd7afLyaWmtlvUXsvv89tPm1366jJAcjgYyfUegwMMDkfiT7Dqxh8rYIK7s9c5wQADxkZOQAMH1z0MxHJPQkdQcnjHbH9Pr1puwlWUhSDn6YyCM5z2UgDP06kVaklb7Ktb121vtve/32XSoyXurs4r75Jt2+Vr3Tei22Rhjqckk8n3PA4I55zwO/Q5yAYwSO5O4EZGQQP4ipAGSOFHPJ93bQAWJPBBwCeMYPA4A6ZGAucg8nmlxzgd93Tvk/THUnHf070uaySV7XXkm3Z7bX08rBzR00vrdtrf4bq2y+Tvou9xTkAbeg6gdx6dO3/6ugoBP59sH279/wAePpg0ehHByenTk89jweD0HcdATSnP5+h64555HoePx6VLV9ErWv2XVWXn0um737vQzG5O48dQMc9ORngdcd8nj15pck84PHoOm3ucdhjHv70mTu9OOduQOoJz25LHIAzjGTjOF5/DHvnpx7/zNJprdPTV37abPv5u+mnQL7aW6af1/l94hJzgDp1zwD9Dz6/pTsYz78/oKP8AP+f8ik+v5dfT+Xr+dLbbTRfkn+eoB0POOeOnP5+nPp3oIz/9brS984z6+w/nycDr6UmB6fTpx9OeOOePT1qktl53fTTRJrz81rfR3uPtf9Htpt8uu+nqL36/if5nrQRn26dO+P8APt09eqHBBXHb8cZHP0B+h+uQCqn5TkHcuFGMD1JbpnPIx2wACQK016+m3prf1v0RUVqm0t1v0Wmq6bNavo7rynHAHP8A9f059SOtPDEEbTkgnoSd2CpyMc56AnkjBC85IYw6HPTk9sDuB1PfPHpnjrVgDBBHXOQefXd9fbk44Ax2Mpqyu1rslfdWeqXW7/TuK1kn3btZ9rf59beplIw7DP3QefUjnGc9CD+HTB5GIG7A5A+b5iTz0+XPGegPbkgEEksU5G7JycD5ccZIHJA+8QeufTj+ESMSuDkEOCMtkn3Ck46MTkYx0Iq7aprdN3WvTld/Sy19Neo0krO2rvrfouV3t1trp36aNDznPHrz6AZGcYz2KgZ6Zz/vL146dcHGMYPsPy68DniogCvDNnIJbrtwSpGWHGcc54BI5Ap5z8wJ24OP/rnnkE8dunbqM2rtq77N20V7Xe197uyT6NC5dl6Xsnpote73vZfcuig8nOeDjPA68jHfuAffp60FtpH/ANcdSBn046+ucAZzinZ/L+Xr/gf/ANdNJB4yOn169OOeDg/U8DmoW69en/A1/wA+jBPVadur8trbbdL9EloIQBnIAyRuPUcY7gA46nJAxznihhwQB1yePc/nx2Pt1px7c46c9f8AOe3vj6UDnqPTGfX8hgjvjjrzwaa79tbeSaWj/DTtYE2krPaV+X/wHps7+nRjCMEDrk9PTgHqOfqWGe3HcZSFOPvEg5Xkkgjpzx7jAAIPQdXAYJOMEj5sdSFx3I4GAe+0dR1zSYIzk5689MZIbOTnvjoR0OAeRVJ7Xvpq3rd7aJ6rte+mqb12cXquya0te7TTtbbtppd2b30Qt22t2HGOM+vPHH59KGyBtAJHT6Dj15Pru5x0zmlwcg7icYHH1I7HjGBk9yPWhTwfmOeM9eMfXjsee383ZLa+lm1rZ7PzastfuvfYqyW2tu993y2039bd7K4oGO2OmOp5wM5/Lrx39aMDPfkn3yDyfp+h4pOckZOPXk49Rn07eoP0JpQOeT1zxjrg9Tjtg9OmTnrUddeqV7Xvayd+23frr5ktvVp62Te+1lrZKy+/TpsmO/zzn27/AI8fkOlH9aPp/n+X40mecf5/PpS18939/X/gkC5zk9c/0/8A1UUceg9v/rf56ZznshPpz7enBPP5Y+tNJtq3Xq9vm3oC1/rb1A59uf8AA/X29e/FJk56HHrj8h9c54OOOc+qZOe5znHA4/8Arg8c9CORzmjnuTkewIHXnA6EduenAz0DitttfW+6Vuieq63Sv99KO3nrpfbr0+Vuj8g5IxjnHccfTv04I6g49RwYGACDxz6g5/Dt749xikwTn5sHPbt7fyx6HIpQDzkn2x+P1/DuPwFPZOz030TVrtetlvp813TstXey0enNo3bVLr19E79g6e/1PYdQeg6E4z6j8HfTGBnPoP8AJ/Dr3oPb/HGOM8+v+TS1La00e2uvXRdnpp+PQlvRfjrfTS3ez39PTQOPrR+PP+f6n/OaQgYx0B4GPXk/59aX/P5/40rbef8AwP8APboIOfX6f0puRnuee3IHbHt6nv8AoKXuT+H1xn0zjn8euR0pMY6ZHrjpxz1ODz09PXvTSve7tor27f5/LfTR2Kiru3ft9+v+XfsGM9iCefwxz7dz9eTSYznIK9AOOo7dunfjjH0zS4J6Ej14/Xt7DA6H3zSEEn7xzwf5+4z054/TNPbtt1v0a3ur2dktFbTS2pVrbtW0a32vG/3q2j8rWFHmK6yxsUlhZZonU4aOaEh4nUg5Vg3IIZSDjB6tXoPxF8vVr3SPGcMY8nxjpUeoXqKARH4h0/bp2vxHGFXzryAaiIyAWS9VmGCpbzwfNnDHkZ4zxyOc5/x44yR173SGbW/CGu6Ezf6RotwnirRUwWlZCFstetkUNnDW32a9ZAAMWjMxyCTx4m9KtRxEbppqlUaj9iSUdbXemju3Z29G96TvGVJtK6bSaad1y2Vm9Vpv369DhTkEdPxyD09uD69PpS/h6/5/HrSgd8cEBgDkcEDnnHJ+ncDBxSf5/wA/5/rXXJWaa6pO+3pp0+W++5yvVt7W3Wit2+flZaK/cKKOMc/r/wDX9MZpMn0/Uf59OmcZ745SV/8Ah7W8/wDhtRW/p6fmKT9f50hJGOM/Q/1/xwPX0LScdyM8j9OOeB7g9Mj6UENkfMRzxj2Ht36ngc/lhpbba36vy00tqvx+4tR22s9fldaLTfp+ApySBzxzn/PUc849frSEZ/PIzzxx7Z9Mjg9evdOpwCc8Z9PTtx6e3qc0vfIPGeeSfXrnoAD0xwTzjGRdvhto7XvbTs3tq9dO1ttR22e/w9PTq99F02621uhXngEj3xj1HOD6Y/LnmngDHpwODz6YHPp26Dr3pMHuffjg9c47/ofb6r369vT9e3rz/kGG21vt69Lavpv/AMPsKTTslfot/Te7t/wUncX/AD/n/wCtR/n9Pf8Azn3o6/j/AF+oP8jj0opb2S2VtNF2XTz8n89SAopM8dMHt6fh17e2e+BSE54BIxnoPb/OPX8QaaTfW3T8lrbv+L+bTSb9L2vv+XqKT7E/l/j/AJP4UEHqM+3oT6f49sHnpwnJ4zg56cZ/Dpjvyc8YPWk5xndn6DOe/Q5x29Bz0HdqLV/TbVu+js1a3/DvV2KUWrN2/G9tNHp52+dhCAuc9SD7cAYzgcdWx075x1JTaoHRiTycfxYKjpzgjp1HQ7gQKdg9SSTjnH4/TP6Hrz0pG3FRgknv+hGCOwHcenc8Gk7OOt/NvTRR6dW36Wbeg0+Wyumm03rZfZa1WvTRtebT3FG0HpyeMk5AI7LkAg8HgZzyeOaUDGfrkHg8ZGRjt0x+GeOKTac8k4GCAfX39On6nvmnY/nn9c1Ld/mkm7rfS9tvmttb30do7+fz7P7+4vH+H+f8/wBaM+34/wCfbjuOvekx2Ht3x3z+p69M880nfoR6c5GeecDpx16fn1VnrptfovLq/wDh7aq7dmW/rTrtvb/gLUdSDPOcdse3qP8APX27ICeckZ4/Mjj0HPoOPfmkyfUDp1xx+nU4zg4x6ejUXqtP89npbXZlKLd9vn12fTp59b+ejuTnr7ckceucfXP0yOxpu0EHtk+39PxxyeD9MHPrwAOOc855yBnj0B5xyaXaeMEnnJ56jrnP0AAx79jRstXy26Wfl/w9ul+nQtZXvba+77P/AINl+V7GCecc54z7gDsTge3cdeeaMHkZ5+mMnHUe2SM++fWgjHc/zHp7dOvr1I55pApBz94Hu3XB5446c9M9xyedq82+isrdraWf6b6vuhN6fLt6aa+WummvYd264PT1/n1/maBnnJz0x2x1z6+3el/+t/n/AD6cUfhn6/hx6/l6fSlf0+5f10/q7JCj/Pf/AD60hIHX/OMc+/qce9ITjgD8M/p1z6Z7AcnPQiV2vPT+tvULPTzdl6/0xxI6dTn1HTHHf+h4pOeuPw9+Oh//AFcY46009cA+uMY9erDBzls45HTGTyCnzYxuOV3DOCfQ4HBz6dvTnnNcqW77XXXdX+XmvTve1G3botdddL+TV9P13HjOT0x74z1+n17k/TkUmCCcdwcE9fxOM9frx9OUJ3FdxIJzjO7jAHJJGOCc9RgVr6LoGt+IroWWg6TqOtXRBIi022ludqnaC0ropSJVJGXlkjjUdWGKmc4U1zVZRgmlo5JK/urTVJ9trX76XqNOTdkm3a1uW6v7r9L629FfdtmOCc88kZyc4A/Lr+X4DFKDweg2nksdqgdcjIIOOMemeAcYr0w/Dyw0ZRL468aaD4c4Zjo2kunirxKzgIfJNlpkx0+zkYnAN9qUBRgQ8akHD18V+AdAdB4T8CDWrtV4134hXR1LEh2r5lp4a057bSolLZYR38uoY+7KGw27jePjNqOFw9Sq9ublcad7K75pWTTvum97dbPV4Zxs6koQiu7blsm1yra+vbXTc5jw74N8U+LJBF4b0LU9WwS0s9tbN9jtwPmZ7i+lRLW3jUAlnmmVVUckL17sfDrwpoG1/H/xC0vT51AL+G/BkKeMNfLZysE11bTQeH7GVl6G41F2QgiSI7Wrjtc+IfjLxJCLTVvEF6+nIoSPRrEppGjQRrjCxaVpi21kqJyEDQu395hxjlQAoB4CjGFAOO2Ohxxj2BGcDmk6OOxFlVrRw0P5aCvUto2ueWi7XUe+qdklz0IfDB1ZdHUbS0UWrRXfZX7Ws1c9vh+IHgPwwgXwH8NbCW8iYFPE3xHuv+Eq1RHUKPNttAh+zeHLRs5dUubXUxEyg+YxG6uO1/4n+NvEWoW2pa14l1XUJ7CdJ7CCWfydMsgj5EdnpFqLfTraBjuTybe2jQjcr4GK8+ckY6A/xHkggHjnPBHqc479agfOTydp49PX2/EEE5/Ct8PgMPhqsa0eedeDUo1akuapCcXFxlGTbcWmrq1vlqmSrVakXTk4qm1ZwjaKabV+ZRtfTZ7n0x4f+IT67ofijWbnTJbSLwnp1lqOpGGZJFuft+oJp1vDaB1XbNNNIGCSE/IshDsVOeA8RfE86zp81jo9nc2bXStHdXV55RlFuyqrx2wi3FHYlkeUsWABKgMcivoP+hfB34j3JO2TWvEvgTQkYnBeG3Osa1cR4wOvkwMQvOACwHFeUoSuGBIwCM8EtgYGQOc5wDtAAHXnBr3KfE2c4uOKw9XEJ0oS9lGSpxU5Q5IOSco231TekrJtvXXlllWDoulUhSSqSiqjXM7c11aKX5K1r2uranbeHfHHjLwmuNA8T63psb7lltEvpLnTp424Mc+nXouLCeNuNyywMrAZYEAiulb4i6LrTlfG/wANfB+vPJkvq3h6GbwJrmWY5l87QCmjTSjIYG40eRS24ODjNeWjnOX5BGcA9dvJ4I7+pyM4wBzQVwB90AjAyuTgk4yCc+hyQefrx4lXA4aq3Nw5Jyd+enJwl30aa2tf/gHWsROC0kmlGyhKN00+VrR76NpaXd9Nj01tL+D2sA/2Z4n8WeBbpmxHa+KtMt/E+kR9RhtY0H7LqEUYzxI+jzEKQWyWo/4VH4ou4zP4UvPDPj2125EnhHXLO9v9uRnzNBvmstcjfnJT7AzL0DFhgeWs6tkEbicHrtPTpgMOTnvyOR0GGSNVjdJEJhkjOVeF2ilVgSQVkiKspGcqVfORxgHNYvCYmlrQxcmla1OulUXTqrSV7W636WaD2tOWtSgnf7VOTUvst3jrGzb93S+vc09S0nUtGuGtNZ0zUtIulJDQ6nZT2MoYD7u26iiYAgkEjIY9QeCKAIxuUg8/eyuDk9iAevQA9c4Pau90z4oeOtMtV099el1jTU/5hPiSG28RacVIClTaaxFd+WoXI/cvGVUDBDdLp8WeB9WJHiT4cwWM7/N/aXgXVrnQnBYgF20fUo9W0twMMQsMVoucKrLgANVsZSdq2HVWN171CSlpeKk7Sa0d7tJtvprcFTpTV4zcbON1NNqz5VuundtdtbHm3zAE8Y653EAcHqQOmO2CTzwaAecEcc9Mtz064+vGOnfnA9FXw14H1YM2g+PRpU27EeneN9Km0447J/bGkPqNgTkMoaaG1Qn5m24IFS++GfjS0glu7bRzrmnKCz6n4YurXxFZBB8wd20qa5uIVwMk3MURHQgEYq4Y7DSaT5qUtrVYuF7ONn7yXe17u/nsJ4WdouNml1jaaesb7PtstE+u2nC9c4J/A8cf1I4xjg84PBowffpkZI9x6ce+OMjvzSsrRu0bsySpkNE6GKSMrtyrxSbXVh3BHHoO7SR/tdORz9P4v8noc9D1RcZ25ZKautU0/d92+uiX6387kcnR3W121qo3hvon6K3m+oYJI9O+ccnnPTHfvjnrzgUozzz16Yx0B/Xrg56HP1ozkDa3cEDtgjoOnoT3xjoQNtLjk88HJzwNpPoO3U8k9s9zU21s/d7JpvtqtLa6bb9FbQyemjVraWdn2vf19NVpsKP8f8f69fpk0gwuccZ+Y/h3/DPb+lBIAJ9P84+v/wCvpSZHbDdSM9weRjnn14IxjrSs+nZbfL8b2dvwFZ97d/TR/jshc9eOAB+Pr/k//XK0nrnjtj/P4/h1pgBGc5Uducj+vcfjnH1aSfdNNbfJet+ug0r9V0t5/fr9yfl0Hk49/X6fy/Mjofek6j1H1x1xk/qeOMdMdDTRznkn078HGM+5HY9OSetLjJ6n19iOO49uOTnvTtFdbNWd9ddntbt5p9PMrlS36a31t0081rumn5AAeCQM++e45OP0I4HHHXhcZz6dsEYxx7Z55HoOvOBQQSeD2/X+R6HIPTrR14PQZz79OgB59+OvQDsPv0026Ncrel1orK7v5NKyuN6rRX0tbWyumrLvvpvr2sLg9zk/0/Lvxnnr7DBUds/j60nQemOuOf6e+f1pRjr7cfjj6VLv1/Jdtk+1tbLTqT66J9l+mi7Bk/wsQcYBByR9PTv+o9a6jw7rkWnPd6bq4a58O60iQanbqAXtJEO621eyU8JqGnMd6suwzReZC+5JBt5fv0/z15x/PikB/X0Oemef89zis6lKFeDpz3t7stLxfRrrpa+nZ3ur2qE5QkpJ77pN6rdp/wBdL7Wb0dX0ufSL+ewlZZkASWC5jwYL20lAa2vLdiWDRToQchvkYsj4dHrMHAOAOOMDkcZ5A/TGeo254zXUWEq65YLoF3JjULIO3hudsDd5jGS40eaVmXMdznzrIuQEucxk7Z2xyjqys0TgxMjFHRwA6SK21o2A+ZZEcEMGGRjHBUkPD1G06NW/PCyu1pKOnLJO/XTt2TNqkElGcG+Wo07a+6/dbejSutL9ulrJp5PqBk5wCfvcg98c446c7eeQMrj1zk9RnAGTz39z69O3AqNiQSQTyenIxwM8YPTuewIx92n4PrzyD1xk8jjpjJ5OMngdem7VkteifVfy6bXST9GntZXMrOK3S1vre6ta6023s7Wfn0RjkjAIwOAffoOg6huSfT3p2QMcgUgHoTjkc9/ft+Y/A0DJPIyPTjH9Tz+GPepertfRJeT0WujWrsn+GvQl2dtbpWXZ9E7Jrf5vS17aDuPXr+v0/n24oopO+fboO/P17YP4596j+v67E/12/wCB/XQWikz07Z9f8/56daD/AJ6fTPP17c9qdv8AgdbvTTT1+/TvYW6sBJ6Y9CPQe5BxyMdPp07Jz6H1PPAyTge/A6dPzzTTu65JyTnAOefrn0/AnPNIPu5LNznI/wA/iT2/KtFB6O6d7bXvokls9Otnv8nY05PR7d93bs/n8+i2fgYOBzzjJ4Geo9vwIH86ADwSCMe5PA46DqeMccc9+lA6EBiT3zg8/wCe2euO2cgB5ycjOB0/n65OP6UrO/8Am3e3u81r6W/PXcXR6387tOz5dk7pL8xQOv1OPYeg6Y+n5ey8f57df19xSDjqfp3JPvn29Pc45pf5ev8A9fr+f9aVpO6t06W6WT8tF8k9rMhu+ohIGM44x15GMqB/Pv6e3IzDHJOcZbGScdAwyB756Yxk460hwcgA5APQMc4wRxjbn6ckEde0ZJYsOAQMEA9SfmA6Y3Ef3TzjPIAzbV9L6bPr/Lvro/la2rKSUrW9X6aLz6t6/eIX5foQMk+uMgjoBngdv5U8k7SQecZyFzjkDBPPXpzzyD3GWMcnCjOQckcjqPmAIwev3SR6tg4pwUrn5j90jo3XOQQFGPlwMDIJOSACeatZK9rbLTXW3ls7ryKiopR2VmrppeWy6K3pfZ6K4/JJ5XAHfrzjP9D0OT7UmG4PtggZJ+g4z3z1zknnGKUgk8Hp+h/EHsc8Z9OvRMHI5IHTAIGOvQDP/wBbuSM4yV9XpbTTW+rT0W/ZJ6/kxLddL7peST083unf0fdcc56jjtz/AEHXnpyfoKXjp/n/ACf159DRg+pHX/PTqenoO2KOfw/XGO/4/X+tWr300vpbbT3flp39L7aS/VO3b0S+emlt97inAHXBB/PnoMHHvnjnvjILl6HBGMYOQpOfr1HJ4PQDgjphpIycnOOuOx/hyT+GPQY5yQKkHzZB5weBggHHfPGee/zc9QD81V9/4f8AA29f0GtEnZ76t+sWrdl62XYec4zkDHU49x7/AOelTHeOQf8AZHHPbHTHc4XABGDzg1DnsTwPXvjvz6c859+4pwMgK4IZcZ6HPbHXqpzjC465OMDEpLlTaSatv02v8301vffcErpeTfzvy6af8OZ29WGxeuOScY5IwO5OSfTj0Y5AcyjAwPm+UAZI6kbuN2R26546cg4cqAfNjBYDPr2/EHIPBJweaOCMdWB56Y7Z/h5Py+56jBpvS2+nbZWa/r0vpdKzUldP7Ker0Sd2rXtpvZb69Bi5JUHBYEEnPbqDknOcZxuGcHGT1EpxhiAcYJ5JGSOCM8eg9BjpmhWAPB65BxnAyAMHjAzg4zgnjHWg84B59AOCM4BJOT9PQ+npDeq6PS9tL35W9dLP+rg3e2lurto2/db/AAtr21vtYBwFBwCT3xxkgkDBAyAScYPfBOBS8Dj09e3tz3x29PajHpxyD+WP8KOnf8/15x+P8sCk9dVq/Oy0Vnd9Lb/ld7EvXru32Xbftu9b/cBI+7+P68A8DI5OeecAdcUMB0ODg545JI+h5HT+vsmCMnjnJz+RxjnGeRwOw6kUZz09fUfXnGcD9ee3Wi/RPS6v0fTXV6O/a3mFuz2ej1Xb5L1+/oIQ3JyMdhx+gIPbJJ/TnhrE4+YkgjIIGQMEDtjJ+bHT1PY4Xc2cBRnPOeOOMkYJ5Jz7YOeafknt9R29wOMZP5YHbINCbVnZa3ejS2UdPK+/ntbVDTSa0uk027a20e91bte19V0as3PuPxGOozk9OepPr7ZpeeegJAPqR6/XGOO360oJOQR7ex/zx/nOEzgHd7Zxz1OM4649fx7UWbtyrdddekWv00a69Nk77d/K2109LK2/rbW9xffrx1H+c4/T1o5zz0H88ds59+mOvfmlHtx6YHPtx/n6GjA9T24/PP17df6ZoSbtyq71/Bp3X4LTzICkPrxnt9en6/rRj3P88Zx69eMkc45zzigdTz6ccce2McD/AD9Uot2unvs+3u3e/nr6D/p7+Wn9fJ7CHBBzx/Q884+ox7nI78qB3yD1PABySRnpznHTPb68mT3APoM5z068dPX+XqmSP4emOgzwBnpn9OQOnOadttNuj06K99bdfv3Wrs7N2T6dmvJaevrZvzuNyc9Rg8/XnHBx9Bx25AJpQGGecDJPp39weO/49TS5YDOAR14Pbn29Pz449AE44A56fyPHA/UHuPSi76JWdlrZrS1k+t11vd7tbaVeyWi3Wrs1sraq2q679baKwgJ56HHGOPU9+OenPTrxkUvvnv8AhnOD3xz+npnOTnOABj1/Lr07ensM96UZx6den169+vWpbv22Xn2/rv0bJb19Ur2fkrrr29e9w5549xjHU9e+Djr6H8KUds/4f49/rQRkdfwHX8fbv9fxpAMDqT65/wA/5/U007Lrvbbay26aff1tcn+vy/y/EP8AD8P8KP5/zwSP0Pp/XlaYTg9Bn1Hp1GfwH14yARjMpX/Pp39V/X3jSfbon6q6/q6/zAng444PpznsQe/B4x+I5pMsR6/98kd+vp+ORTs+3f8AIHv/AJ4OOCeMmTzwP8fb0zjHOeuPfFqy6Lda3Ta219H/AFbQqLXbbX8kt+n+d0tExCW7Dj1xnPvxnj6Dr+VJg555yO4z6E4Az+nBPA5wQ7LcAKB+Pb09un+elGCeoA57Hn35Hrzn6e+Qc2mtl6WbXVaO/Xp08rDule/KrdrX0t0d+ui+/SyuexBHYdOO/H6dM4IPOAMbXh7VG0bVrG/+9FFIYbuI/cmsLmN7a+hcZAKPbSSLhjjeQcCsbp1PHOT0+n+eP8FwD8rMVU/eI7j8B2/Cs6ijUpypv7SdulrW/V+vW3UUZ8rTvs429U0vL5J9WtGaWs2C6Zq17ZxNvghmZraXcHEtpKqy2sgIzgPC8ZHOCc59TmnOc8YP55/+v1/l3A39SYahpGk6kMtNaBtGvSST80BMthKwPILWzPEGbJYwqBgc1gH69Ov5dO/A7dD+FTR5nTcZN3h7uqeiVtH/AJ7272Cp8TdtJWkte6u/xfa78iJipO4YJDY+gDAEdeM5HAGAeuetLuPPf3UZxggY+mTgH1z1OKQnBGEyASeOCTlR2weo59s9KXByPlABDZAznkgjPH5DB55x6bqy5br4tNXF3sk7d7NL1Xm9RtrlSavq73tdL3dLddtV0Ts31FBPUnP06Dpxx1PPA5z2xS8nuPQ8dxk8Z9OMfmemKTJ6bR7jI7/pzn8+vupJ4O0Dp6+n0yD2+vAFTs9tbtpaXW1lv117vqkLXf5x2trbTl6XvffTTd6tuGyeRkdP88dM+nfpzy7DYAz9T+eD/Lj170fNxwO5HXrg49MenP6HFOobdle299LPTbZ7vrrr92ibenwvtZd+lmv6fmtGnPb9M59sfp7HnOBQAuQ306c46joD7EfhxSjqevb6fgO3vSMd2AvGMg+pJIyevOPfOCePWnHW++7121aS0fV6v/hxdl9nW71vd8tvK2j+5abinkjkjHpxn6+vv3oBBz7e/wDT8P5468h46HIyepOeo4ABPQ8dOenc0nIHC9c56DkkegIP144HPU0b7tvRKys+y6931W2j1TTBK9/80vz+Ybs56Y9OpxznIHH05x3J7UhJOMe+cjk4OOSMYzjpwOMH0pCSCCQD2wD6Hv1Jx7dPbmnEnsAcfmcHp2I6Z49OOmaLWSaXpqmr6Kze+6fknb5XonH1utb9k1632e1/wQE5I9+fpnpz6EkcAHH5E9eQQewB+hPBJ4HofyPU567Rz055H49MH29fWjk54GM8f44GSc9Poc4IJFDautL3snqm+nX/AIbutrhdWS++1tWrPS33KzXlfRCjOTnjjpxnqefw/LJ+ooAOckg88D0+n8un48nK/Xr+mfb8/wDPNGP/ANff/P6VLd3ZbtpeVrK+r16bWfrqyL/K9lp02v8Af9/nvc6fT/8AX/8AW7/ljlaKTHX3Of8AP5VP9eQgJx6njoPTvj35/HtSEjH3TznjGMnnrj+vse3ASQBgdOuf554Hb+XAoy3Hyg56jp3zg9Px465rRWW9nZvqu61/Drbt1Kt59e6T0876ddf8xpIYZAJPT6ZI4OD34/Ltg0uW5zjgE8d8dsn3x/jkEUm4r1XHIGB0yT/M8cc498cqSwxhRjBJJPTJBIOfcduMfXFFrWXTW12rq6Wq8077Fqy07L+ZX1s3ba1vVLr5iFuOdoxkAt39TjrgdwMY569lJbbyRx35459uvPbGPX3j3HJyeAOnGOcZPOT2bkjPfu1ObgjkDIYnPGeQTgnP+1jnGOOOVFctmlZWbu99rKy1s+vnZ67aDabtHSzeqd9IpJ320Xl/wwpOAMgkjGcADGSO3Hpjjpj0Jp+ef97kcY4AA7n29On0yYm25IGcknPPIIIOe+RgE9BnnjA5kHAAO7C8fdK8nJHYEjnk5wOeKVnbzs9d73S3d7WuvV/eyGlZWT69+qjbp3utlfT1HUnQ88+nXP4gcfjxjPvS45I9OffH6jjvzxxU0Fpc3siW9lDLd3EjKqW9rG9xO5JACiKNWJJJAI45yPUiHaKvNxjF7uTUbJW6u1r6r+kxRi5Oy6+V3v0676abvQrsMn1wemBjp0zjvwSeffFNfJ4yFYckk8c8hiSMjkHnpz65rtf+EKvbQJc+JNV0rwtAybxDqNwLrV3BC8RaPYie83EH7lwICpyHIXgn9o+B9IG7T9F1HxXeKP8Aj78QTHSdJDfL8yaPpkjXk6bSV23WoIJEb54s9ed4unzNUqcq0trxV1e63drfNavpe7No0ZWTm1BaX11T93pZX17rXrqjl9N0zUdYuYrLS7G81W8kIVLfT7WS6m7feWJCAMZO4tgjnJ+Y13afDl9MCXPjXxN4f8GR4B+wXM/9t+I5VYBsLoejm4khkKklRfy2YDEo7BsVi3nxA8U3NsbK3votE0sp5baZ4cgi0OyaL5SqTfYlS6ucc5NzcTSNyCxPB5BeSxIG5m3sxJYsfUuTuLNgkncT1JINTJY2r8U4YeF7tRSc2ny3Wqtp003t6Ft0adrKVR9W7cl1yrZa2T6fJLS56Ymu/DrQdg0HwzfeLruInGpeNLlrHSy25SJofDmkTJI8Y52x32oyAoxSSPGRWTrPxD8X63by2MurNpukbiI9D0CCLQNFSPI2p9h00W/2hQoCK929w7AZdyQDXFbTuDYwc9Mjgc46Lzke/GcnkZL+eoxuAz7dehJX+X17U4YKhGSdRyrz096q+d3ultql6eW99XMsRUfuxtCOitFJdlq1f7/MZsAVlQBFdskAAAsfmb6nnpzzt684aFOcHoD19CP90k44GehHQZzkz5I6H+ft/n8PpUe0leScjoQBkDB9B16kgHHpXZeMYpR5Yqy+FK121rFJaK3R6vo9TDmd25OOtk27t9Oz+9PfboxN+Tjnk88Z59Sc5Od3B5yDwAOr8+vYH9Cf6/jzg4poXbkjqcdeh49sY6YwTjkZzyKXnHQZ5xzxycnsM+n9ccUrp2st7Ru3ro101u+t1s+2gJK++itqtLapfhfyFJwD7euf6dv89qjbO04wSwyM9R3x78ZweOmPQUpY4Hy8E/XPT8Pp3P5U4MxKgKvYdO3HIycc57+uMZGaIq1k1vfW6vpa1uultV/ww0nzRel1vqrWTiltqne+zXVHo9/I9p8JNAtc7DrXxB1u/fGfni0TRLDT4dygqMLJfSrkggEt0PNeYZA4HbbnB65UDPUg9Oeg5AznBr0HxRMU8MfDzT1VVVNK1zV3Ax/rNV12eFX5ydzw6fEAc44GDjNcB1GehA2kYxxgZwc4wCMDHOCOeuOXL0/Z1ZvXnr1ZW025rJ6dHZdfLQ6sRK84K+kYRS1V9VF6qz6Ptu9x4LYJ4IySDwTxgZxnI7EcYx9KRsFOOMHnthQc44IOOwyO2QOhpNwDYBB4GeM5wAR8wIAA6d85xjJOXkA5UkFmzjJzgZJHABOBj6ccfezXWvO26fbRWvdpK9tGne3VdjmUmlFNdU1o1sldNdbK+rfLq/QZwMADHXjnPbHPGCM56nOc46YeqgdMggMAckdDgfyB9+3Wj5eTk8YwACSeFOTnGc5wMZOcknPAcOV54zkn6HnH6/nRKT0dtNb621Vnb+lrd902pNWVl013tzOz1vuna9r7drJiMuTkfe7EgnGMcfp7D2JpegyxBx3x9MYyTg5HPT8OaMng4GTjv+vQ+5HPT34pOc/dBPr09Prz+OPTOKV7vpba9lra19Xtvpb5DjKSSjzWje9tNdr9XbvbT07NLEMTnjgY4IbPcg8EZHODkcHGatWN9qOmzpc6bfXenXKOWE9hdT2cykMSWWS3dDkk56kHoar7iAMgdTz65xnA/PnpnkE5FHzFegBJ9SuOPoScdPy7UOMJK04xkra8yi+y6/d8nbzqMnG1m0273u27ppd1+O1rKzO7/wCFl+JrgCDXxo/i6BQo8rxNpNtqFyyDqiatHHb6qmeMsL3cgyd3emvqPgDUlc3nh7WvC9yW/wBd4f1JNX0xc4yzaZrAW7RRySkepnsFPQVwQyduVIyM7gCScAHHBwepBJABC89wJOcAA9RnOBnsc4YnkkY3YPUdOa5Xg6alzQbpc1v4Umlo1qk3Z366ea7DVaon7zhNf31d7LS60stbdfXr2beE9PvWY6B4u0HU2wdllqryeHdSbgAKEvwbCRz0UR374J+XOARi6p4Y8QaMiyapo9/aQv8Aduvs3nWUgwDlb22ElqykEkMspUgHjsuIVyMMAd2cltvI4O7aoAx0+7nAIYjBIXT03Xdb0Z1OmatqFhtxujtruUQP0Hz2xZ4XAJPyOjKcc8c1Sp4qnrCrGotLKpGzei+0lZW1smlfW6fQ56ct04O93KDv9qNrKV3ZWvb1MoFDnad3OAARj5cDnAPPIGMA898HDiMABSASScYznBzjAXjHU4HHU8ZFda/i37eQdd0DQNXZmDvdRWh0bUmzzvN5pDWscjYBO6eCUEkk85qJo/Bd4rtDc674fmzuSO7jt9csQRjpcW/2G8RBnjfBO/PO7OCfWZwaVWhOCf2o+9Hp22tfr/wRuCdmqibsnaXuyTtFK6lZPTrout2ctuOfmIwDngnj6YA7Dtnrz1FPLHjpxx0yRxk4AJJxnnqecdsnpf8AhGbuUZ0u+0jWkKljHp94sV7uGQN2n6h9lud2MApEkoJOAzEHGFd2V5YvsvbG5s5TwY7u3e3bGOcb0UEZzllJHoODWsK1KbTVlsrPRW0va/ld3Wj1b6oTg1ZtNXTenwq7j8LTTX2nvstOxWyTzkHDYPA9Qfxx1PQYA4IHKhySAcDHHHPfuRnGCeScAcA45NNDE7vlQjk4UnoR0wFOffGRgg5xxQM4J2hVGeVDMPU/KFyV45xyOmew0t0srX306tbW07663et9hWWz2Vldve/LfRLRtPV2363Q/B655x2/+vn3weOppefb26n8T0/L9aY2Q3AxkEnhskgDHGPTAPtznI4dgknJOcY/Pp7nHIzx06dahqyT/PfSya2tZW0T6EPo7Wvt12dvusttVurCgD098f8A6v6HjtR0z/Qe30/xppOBlmx9eOvTpg9vY9eB2d29ev8A+rv9O+aWvyb2Xy0W/kR6/wBdwyD39uOcdcfQ/UdeOaQDkg546Ejjvg5GMnp19x0JpAeDhf8AA9vx6YwKQE5+6CTzxx7+nP1yRwO9Wlv2030e8W+z0/4YtRs3fdb7bXi3bdff5eaHKzo2UJVwQySDKssilSrIybSpU7cEHOOecg1v34TWLFdajkQanD8msWaoAZosIsOrxICAFfIW+ypKTATN8ru45/JOcgDHp0J7AE54PQ/X3xVqzup7C6ju7cKWjV0kRuVuIJAqS20q5AMUsbOrA8EnIwwGcpwTamkvaRSad0rqNrJ33utk9nr5LSMtOV/C2ubW+/Lqlfe1ldd7JtPSqcMQ64x8pAGPu8EY2rg5zkgZ6nBXkBTkgkZ49QMHGeOuecfl255v6hbRxSLc2aM1hc5a3L/8sDu+e0lbLfvYijYIyGTayklTjPxnOSST05xjBYdQB9G5IyMEZznSMlOCm+1mrLR3V1ay1vrez/K0u0ZWsrRs0900+XXT823pdWdx2Pp069efpwOvJxjJ7Uck+gH68/yx19DxnrhByOnqRjHXt9N3OecjPXPR2Pf8P8/5OeelS/lp+lu+/wCW9tDN3693p1W39fID0OOvamYA5PJH069c9sn3/E+tKSR09Rn2/wDr8jj09OtKc8cZOR15Ax36du3p17U4p3Xr07ab+WqBJ6eena+353QmST6deo6+/wCePTjP4BJH4fU4AAPJzx3PfP1ppbAztHABPzZxyOykcYx6d8ZyKXcTyAMYPOe/HYccHPHU9vSqSsk1olvqpXtbr3f9WuVrH3tL+vkndPzvr66aBk8Doeg5yD264/PkH6nilz1H/wBfBxwSPTuOT7kUmSMfIMD6dfXjvzgdzgcdi7OcfKMEZ7nH04JJHbJ7nA60220rK63tvtb9N09brTZFN25ei0e/Zx++y/z6DTxyex7cevX8+3Uk8UuP159Rk4PPrjjHTI7dTSn3PHf8x/8AXBHfNLwQCP8AP4fn/XtUK7Wl99WuiVrN/wBdLva6z6X13tf0St+QDGDnnsPoc/ie3rnHPWk6joeR06UoHv8A5/z3P600HkAcjGc555z6/wD6/U00m0vLpdJ26N3+dr7aNdbiT1a6f1v37DCwC9ccHOD6sAACGXIx0PAyAf4TSSM4GOgKn8DuGe/cY7ZByeOcKflAwScliQOSp3hvfGenTHBx2JTLFSAvHzYPfk5zjAHOOOcZ9jzort9l3+759+nQuK1i3b4tm7dV/WvS2/U3ZJxheQSxwM4K5w3BHC8ccZJ4I204fKMA85wCeTjqcd+vGOcHjPcKDjJ2hVOVOASQxb+LPQ56nHXJJxjBnnIVcY47duee2DnOcD6dDMm9NNIv0v8ADa+97Py79RvommtNr2TtytvXe689UrPTRIc/d4zjkcY6jKj1AU9j1IJIFOI5x04OCCf8k9Cc/wD6zJz049yM/h+Hrzk46CgnHXp7c/8A6ug/PHXBqW3pa2yej9N1fdPa97k8zVkkvRX62ffV9LdNtQzyRg/Uf/qx+v4Z6GDnHOTkjk4AA6H1zgc9sk8cGlI7g8Yye+B+Q59+R+gpRkdDnPIzjofX8Cfp04rXXrv19Q0eyXm9tbR6vazv2jrZIXAwwOMDG4Z68528cjPBPXp78PU4zxgDOAcNgAHALAhjjhSegwQBk1ExAIGWxzwMZx2zwPY5XHf0FPAB5JO0EFc4ye+c9W6YOTk7SfciXq/68gWiV72fS19fd2j+bejWmjvaTGOB06kevGOuRj/Hvip3DEDawX6kjnIx0yO/fH8QGQc1EM9AM54/yeOhHtn36GVSq4D/AC87uDnI4PoM8cEZHHXDZWkrtJ6rbd+a1dtXs2tLfgTd7321X/B/rokZiM7csfmBUAk4wAd2OnGRxgDg55zxT2xgqQOh9M7uCeAcg/NknHfPTrCrY6juMYHcnrw2OAc8k57Ejmp3Hylgc5Pc47jHOB1LdSM+opatarrG/rdfpdfLey1r3bxald3Wq2i01pfqktLpvW6Vmm0nViDnIbjkg8EckYG0fjtxkYKnFP8Ar3/Dv2/lkd/TpTCp3Aj8f0HGemAD29adjn1/p0//AFnvx9MRLpa2trJatNJK19X572/AmSXu8r3Sv3Ttr+P6+QYwP/1fr9f17c0tJjkfr3/TpnPOfalqbq66LS66b/PTb5iGscEccHv75HbIPvnB/oVP6Z9+B36Y/n+fSkIHGeeuCccYA/PueR274NHUDOexOM9u35n6+/HDTtZq+6v52tt531+aQ7rTpbf+nfX8PIXA5/D9DnHPGP8AHHAAo+vqcfr/AEz/APq5pe/9f8/p/wDqyvO3px6+p9z+OPz70a6Xu1q/lpvr1srrVre1gu/680v0SX4CUUYbtjnp78//AKuf0pQDjcQCRjPJPr06HueuPyoindfK/po/8rW1XkIPXp0yfYf59PXHqKTPPJ6/nSYY9MDnnkcjngdyT7YPSl9sfT/D2/Kmr2VtL+bV7NL5Pu9eoCHAAz3HryeccdMf068CkAHb1OfUkdPpg/09aRhkj2PccdQP8j88cU/5R0PAHp7dvUe/6VSb91q+zv3tom/61d1vqh7JWb638tvx6+Wg3OMjrgf4+5PpnjPI65FHT35+nU5/r7ZHWl4I9unt0/z7Z96Mc5/z0Ix+pNRfvpa2lt7cv3Xt8rdQvr2tbTXpb/h+lvuD+ZHqR/ntzjPSlpP8/r/n6e9Lz2/z+PbnvS39e9/S33CEzyOOpP0/HGOtHfn0OM+mRkenf/6/Wl+uPw/z/h9KQZ5BHPQe/wDPHpj+dH9PW1/v9f61C/8AwPP+vLyF5HP9ef8A61FJ35Ax29e39ff0pTxnnj9eOpoSb0XruuqX620/UBpYAnORjv2P/wBf/ClGM5/PtnHHORmjIYDGTj1HcEkY7D8+p560nPYnp1I6EY7YHJznn8sVTSei0aSeyte8W7qzfnr2stbIe2mz0vf5duvXXb1EP3uQCDgjPPXA4/PP4ds0gcknPAGeox09cZx79+OnWgNwSQcgBiSM4APBPYZ9Aeo65wKdtbJOBt5zzyeRzt4Hcc8nHU5xVtKzsloktVurJvXz36brtcd9Gnpe3bbTo++976uw7r/n/P8Anmj1x/k+/wClJz7dvf6+n0H+RQM85x/j7+36/pzj/Xb87Ei/5/z6frx+gB0AA/zn/OPy5o/z/n/PNHT9Ov8A9frVLdeq8+35/wDAA2dIfz11DSJGAXUbcvaAkD/iY2OZ7QrlhgyoJICBliZR3BAxM/KM5zjGAcMxXAPU/KScjH3sgcer4pHt5Y7mNis0EqTxsMgho2UqPlOcgDkg84FaOsxwi/NzbAC1v4kv4VAIEZnGbiIYBDeROJIsA/KAgOOSc78lWT15ZpX6q+nwuyVrKz8/vW8EpqKd9JKKemt2redru1rba6pWMrIJG38Djjqv0/zjBycUA4wMcjqfqeOmOMHvwD+AoAznceemOPQc+/U8HIGT1BpeSTgD5T1OR29sdz1z0OOelbaWaSt7qbvZO+ltW1310XVmbUVeN723krb6LTvd6NbXencacZAwTz1yMjkAd88Ag++AT3p5Gf8AEdv59qaBg5x0zxzzkjJxk4zgnsTz3Jp3JOeRxyM5HO0nPABPXBzxz15xP9d09I+b23d9NFp0E29PJL8Uun9LyF/z/npRR+HXvRUkh6f59Tz/AJ9KQnAzQc8YHHc+np3HvS016X8l8vu3/QF59+/69P0EPT8R/MUmRjnsMkj6YPTnPXtnjFKcYxzjHfPp6eg5x09OKQYwOe5OfTIJ+nAyOmM579KWvfR6vfqre90S6tO+t7NDsrX10evpp19elm9etgyASMcdTkjHJ56noPpye+QcnAIzzgE8jr37dxj9c+tBGcHJ4z29wf6YH588UvsOO3oOcHjse/0x70N9E76a9NXZbvVrTy062WjvfW9rat66bR/4L79dhO/QEHAHvg89R7jAz9OtHTOTnJPfoOBznp1/L6Cl2njB6ZPJGc5DfXt+HpRzg5+bnPPc88Y6Y/Pn0zyk11bXpZfy29G7Xeu5LceuzVpbax0/N38tfUaxfOCAM/dJH3icc5I7ZznB5xgnGKUsQGyeoJzjpjAHoTj69D1A6qM9CAew5JPUEdh6HPQn0oKNkYUbcfXPzDtkZzjbweOtO6urtJ6p7K+y0bT1tf8AG26Ho7LbVczfbTbfXfa93bTZCn+XTt+fr+P9KZkbiMHk9Tz1ycemOT/XvT/wxScd/wAc9P8AD/P1qV10vp93mJdfQbnBx1JwR7jk8+nfH1HFBJweCeg4OepOcZ9O/wCWMClJAPXGfbpjjB9Oc+nQ9ORQcAEA+vOD1PPHHcnH14GT0pXunbt3tdpdu2jtstUt0VfVei7rz6K/kt/LS1lztPAH5dBz14wB169Se2CaPX1z9BnsPbtwPy5pf6f560qhnYxoN7kMNinMhwAflUAliM5wp5wPWko31ta28r6W2W/ReT3e6WgadE9Lap9dNdtOvztpuNxnPAJ69x055wQeOe+O+O1N2spLHpjqSW/mpX6jqME8k8b1v4e1KRUkuvs2lW7YfztTmW3BXIyYrfBuphg7cxRN8xYEAZxMB4YsCd5vvEFyvAWPbpemk5XAdmMl9KBzhlSHeCMFc8L20V7sVKb3su+i31S9L306lxjK13KEV2lJPttHW+y0a6LQ5yOF7mVIYIpLiWUkLFEjSSEg54RULFyc4U8ZHtXUw+ENSjjS51e50/w9ZuR+81m5SO5dDtyY9OhEt7K2GJGIF3YPPy1D/wAJVqttGYtLFroVuyNG8ekwiO4KnBIe+kMl6+5gw/1oIOcMOlc1LLJNI8s0ks8kuGeWV3lkYgA5Z5GLMeP4m6gjI6VFsRP+WkrbW5pact9dm9NP+HHekrP36mnX3Y3stXpe3zXS7eh2Pm+DNLK+VBqPii7jPD3TNouilgVyDbwtJqVygH3S0ltvU4ZQ2arXHi/W/Ke2sJYNDsmwGsNAt/7NQqFAHm3SM19OSVyftFy5J5YcHPKlsAZPGCTx8xJyowcjoBweADx16uU7uvQjAIU4w3zE8sQRyWxjvgZ5NP6vF2dSUp9Xzu+tl523Wmg/ayabioxjZW5Vpa6u7rV2Wv3arq5izSPIxLNIcu7uZJGy27czuxZnOAxJPOAehIMZO1iQo5bOcgk5zkkg8DuF9DznnLmwyEowzw2eoB69MElT1w2D3OSMk2ljjqCAoIPAOSc9ODg4OD0IAwDW0YQgrRSirp62WnuvpbytfrvpYi7au99b31bXurrpe2ye+r6xvH82MEAnPoRjdgbeueOhOcrweD1lIYLgdsgfMRjOAOTu5OP0xzSMHwBwuMHK5JOdvX6jIAxjBxwOKdsfOTx1A3Y9VIPHtkgHofToB6NNWVt/vXbs9bXv5aictnovJ36WtayS03tdv4rrXVSBzkAjtnHftz6/1xS/l7/Xik/x+mP8ef50HI6e557/AE/Hjrx71lr6eX3b/O3zIF/z+v8AhxRQORn/AD/+r0PekJAxk/r/AI+n5/1evn0/4H56eoATgAdOnAOCeeg5HYHH0PXhabkZ+7wAeevT0HOT6dxmnE8j8f5H+WDn07juGqQemRgkkDnOTn3/AE6c9BTW6urr53u15d7ad1v3TV7N2XrfVa6dbrbT/IDzg4JwT/8ArHPPI4Hf8QaUttOew5/Ln88c46n19VwDj2/H+efz6+9O2s3yDClsKrH+EkkKR2xkjjofWndLWzso2ctdPOy287Wbv10uJ6x8mrfedd4zcCbw3ZBv+PHwd4fhZeuyS5gl1CUMM/3rzcSME8dSWxxLdsHgA5H/ANfHPc8HHcYB2jqvGUjP4i1BTt/0WPT7BQDgBLDT7S2HTOSDGcYAIJIIyCTyjA4IwB0wfc5x39uvGO4OM1jg48uHhrbmu+27Wvqtk++5vU1rSbs0uWKV+yS/C/V3vawmDu6j5iOMdCQB9Dk8dPpyATIGADKMr1ywBJILAbSrEY5BBJX1OeMFoyOwY8khenUHOcdd3IA4Bx0AJqTPJ9MMCOnJYNnkccEYHGcehBrpvsmm9r2fVWet2t3+atvpm21yqz0torvSNt42Wt01qrP1eike2T057c7vboRxyOeDwTQTxwMjODjA+v8AP/Eig44Pv2zk98cc4746HGDQMLxnklmP4kn2Hb8/zrNO29/vfl+m1tb2vpYldNNu1/K78tu61fZWAnBPynOM8dz0/TP8zj1AQc8fUH17j/H8O+aOPwwD6AA9Ovr09h6Z5Rjg9OCOuSMHn0yTyenHGfTg0ttrZat9raWe/f56K1mNbbWlbRvytZLzt8+2+jWIAwPX5uhxntgcEYB7AdQfZScDPBBU4I7fMPmPOeDnOc8AnrzTm74Gcg5HcEFcA4BI7cYGeegyQDn7wz17nByc54wcnAORgZwDxnFt90lbR2sr6xu3t8XW/dXaQuZe7pezd3dX2g+99Ha3dWTYenHzHIJOB3AHTHbHQ9c57kKx4PGQB2JHpwG4xnJJ6dDnBGKUkj5unXJwT17nHTjOOnqOQaQ7ueBzyexOe4/Tn2IpX2aVumlrNWTtq9NvltuJa209H/NtZfL5afK5yDjGMEjOMcA8jIP/AOsdsU1wQp43Z5HbnIA59iec56E9Bw45yWIHbkZP59eT3x/QYbg4PIxyQevcEZPruyOo+vcKN/d3SulvfW0dG1e9ktV0v10QK912vrpq9no79OyV9hpAHp7ZYhi2QNoycc5yMYyfXnK4AIYKc4wMZUD8A2OCB1wOOSOlDj36dQAefu4wPTjI/wC+e5FKrBsfMW/vE9SOOORnBBHJ/D2pu8enndduV2vbRv8AHS2+mlrR5u7f3e7dXXW+33W3shAUh8crzuzsIABPBOCCM9euTjk5xt2viLXbSMxR6hLLbkbVtrxI7+1A67fJu1ljAOQCBjccnkFcYpJyV7YPJBbn5SATnOep4Ocdxg0KAOvHOMYwDnAG7Cnt6EfgNqiXGMopNQ1+K6Tdrrv1atvtdabIlStZpK6b77e7+C20ta6Ogk1jSr0htT8O2azFgTd6NcS6VPg9SbdhcWW7gE4t1AORkYBEbWOgXTA2mszWJYELb61aMB1G3/TrAyxkA7vmeGIKQN3XjHOcKQBjtz1AznJ/DryTnHPURkOwPAODnPAHQcAHoAB6AseexAz9ik04VJQtsrqUelnZvW/n6K2jdKpf4oxdne9rPptqr79PPs7a7+H9URTLHbpewkZE2nTQ3sWDjGVhd5kIBJO+JMcAjOAMgqYmKMGjdCdwkXy2UrngqwyCCccg8jr3ojaSJvMikaN4zw0bOjfUFSPu9fXAJIz11Y9e1IFlufs+pxOCTDqUCXQJK4GJWUXCkYAUpMCMZzlQKpKvC792evXS+y0tdXXW91rvtdx9nLq4973kumvy0+S10MoNk8YK44ycMfooU9QeMnsOD3cM8kkdOMHP06DoTznoBnHfOmLrR5/9dps1k5bcH065aSNe+fsl4ZCeFOVEwwWOOmaR7KzlybHU4HYEYivUaxmbOFIy5e3JJIA2yAeoAGaPaNfFTnHTlvvpoul1e7Wmm6FyLWzTVltu9rtXa/Du+i1zemQB06enP5d+3p+VIM98Ejp0yPboB2x/+qrU9hewjc9vM0ak7pY9s0XBx/rIt8bDkDB4xwOOTWBB798c9+2QOw6YHXkdTzVJxkvd5feel1Z+em616dn3aQpXi2n3Wrve68/8vO3ZIDkcDAOBz0x0+nToB3PTuRsbTnOPrt9CMk8YHf8ADuDk6D5R3Pr2OOOO+Pz6Zo+YHBwABk5BODuABHABHUAZOeDyRwLVp2snZJNq6s079d+mt7baCvrZaLTS++q9Xf01Vtty7Z3TRiS2uWL2U/yyKQXaF/nMd3CMqBJEzfMMhWQsjKwyTTlikt5DC4wwG7dgFXRwCsysd2UcfMDnaRg455cN33gA3DYBx83fA6nJA44yfTtVne13EbWQ5uoR/obEZLxAF3t2+bkgYKZ3cEqMAcRdqb920Za9LOyjdddnp3v0Wok3K3M0357dFbW7enTRLdW2VPBI6ZIJOQc45GSF64wDwRlQMkd6aznGepIJOAOMkepHPUjgr0yT0K4yAdu0qSCORl0JypCjPDDnO4rg5BXOTCBSvPO49TjO4n+7k7TwRnpnqK031a1TVtrWfLp1dtdNOuuoLZaXs77aO1ua+vmu3TuxmdvGMdiMk9G7MOOc8EEc7sjtS+YcMByeWHP8IIG31GOwwDwO/SMnqAM5BBGM47/0xjuDkGkOONpYdhjquWyM4I75B7csMeulltbTr26ev67baFJp8qtrzLray00vv3tq380ryMwJK88cccYw3qpByO3TjPJxSAgqRgYI5XrgZ24HOABjIOOe3AADCM4AOSMk9Rzw3OQQTk9sgdOpwXgEA+vT0Jyc8gjoTkjGep7YyrL8dtelrP8AL0+Y7pKOnRXvdtr3bvpZNq7a1vs3d2cXyTk4HI5429AcEEHn3IyDzx0N3BbpxzjPUAAnnj+LJwB0HJ+6rcODkDO7IIHuwJzzg9McbRk59adhhnjtjBx3OcjAxkjGME+mcAZLLt5bvbT/AC/Um6fKttr62XRa/d1eiSfYlwevb/PX364zjj1oH69j6f8A1/8AOPR21s8Ywd31AHHfg9/SkII6/Xr2/l/n6Vk4t9O2q2fZ7636pL5XZA0gd/647j+RNLxjjHPX3JPX9fx4oppHOc4GMYBwO/8AT8sZ7UK+qT6X11eyTS36aWVtug12vZf10/zG8Y9SQRgsc8H1PI64B45xxnNG7aCAMkKSCT3JxjBI6HAXgnB9RQflG3p1AIbkEkE7gcADkjJz3I24pCArEE/eByD1znK+mMZPXk5BOB10Sur3ut+r2ta+i1uumzezehXa70ck72vfZPTsley87e8h5Kng9hkjnjdjnPB7ckEH1GcUjHAwDzj0PrjqBxjnJwcYpoBywzngnjn8wQVUYDdSdoAyMdH7ec88Fl9l5HIABz1A5JwOwzSs3drXVaLrbls9lvr5J7IV1ouyWmjtonquz1e+ul9hefy9uo5/Ud+v68L/AJNIeMYyeo/wPPXp3I/HNGOuB15/nwe/GO/Y8cVnd6avve9/R6bNfeT/AEhccY7Ht/SgnA5//V/nPQfl0pMnPQEcYySM/X6dug6e9IVyc5OPTtx/T8K1V29+z83pF2t5XabVr9raFadeyt36fknpfTQdnjg9e/Jznr+Bz9OnYU8HOQRjK+o5Izzn09h6DOACKYe/b9aMkAkdQrcHrjOTnvknnHf+LvVJbdNl6f8ADBFWd9dWt721atr69NF2s7E+OSeen8v896m3JkBwGGMkEZHYgHk8Z/PBPpUWR3PTk/ToP5Hv+VPxuxgZw33ifv8AKg4G3ucNkfeOfShdO3l+Fv8AL8e69fL9LfgZqKBkAEjIGDyAGGTj3HPTgfN2xUh4Bxz3C4wQAR0weMEE9cZJPpTEJYkHK4xyDnJ5Xn13KT1POeV5pW+8xBPHyktx1C5J+XjIJHDHPB4BODrZbdfXRr7tbfeNbrys3vs2unXX7+nnIc9vxHr/AJ6fjQDn1/EfX+X9eM0A5/z/AJ9setHc/wCf6f1P8qw6bd7dOqv5v/gvsT+n9fP8/ktDnJ549PT8f159qP8APp3/AB7f55paT/636H+v0/HpR+G3/D6L+vMPu/r+umu/mA6c/wBf65NLR/n/AD/n+dFGr87L7v8AgK/QApPz7fz7/wD6+efajvj/AD/nkUZ/z/n/ADnjrQuul9Pu8wF7598+35dMe1ICcjtjPOBz6f488jjFGR9PrkenqB3NKOfoe/p/X3/yKavfTXprdrpZ6/J6+QB69f8AOOv+fSj8cf5/z/8AqzQMn/PT/PJzxS+/+f55/HpnitEnp0tftfVJdttNnr+QDfTBA+o6/TGKMHPXAHbH+cf/AFqX/P8An/IpO49DnJ//AF/54A6Vm7qzem+6V76Xd/VafaelvMF/z/n6UUUnAx7evqT6Yxyc/wD6jS/X9LP+vP5AAGBjJ/Pp/L/P0FLSfmex/wA++ee30xRn/wCtj07EevUZ9D7UWs9f18m+j2T17A7v+vT89f8AJgSeMdSec46Z9j2+h68kYyV/z36H/D6dzR0puc5x9D7ckH39+3GOhqlo/Jqz7Wsnvdd/l80Fr/1/XUd+f+fTPGeP8aT/AOt6duf8/pQBgdSfr+H+epoOSPw6evTjt9P5gihRbva+y69HbRXt06af5nX+v1t+NhPYkc+ufYdsk9ffnqRxQw4JwMgEe5GdpHToGIP4GnDsDj68/l+HAz1PemscggHn7uOcHqwOCAP4WGck5B6YwGr3SeqW1lvt17Lfzt1eia1fo1e2nVLS1vw1IuTknacY7jH3gpOTzyF7EDIJJ4qUDgkgkZLEc4xkZGc5yCQMYz2A6AtBAJDdjuxjOSMFf4TjOOuTgA7uvLiwyRkjA2kjOQckgHAAyMkZzuxkAcVcr6aa3T16ef8Aw3qtgd3Za76Wsn9myWn533XcUHk8H8/Xjj+o4/XNLwPYCg4Azn68f4f0GP6JkE479cY9xz/P/wCv1GVns1tr568vRP07depP6W8v6X/DeQtFJn8znH/68cdv/r0tLaz18un9Wfb8Bif4/l/n39fwrR8wXWl+VkGXTbgupOOLO6bLKpB3kxzncQoC/Ocjis454x3/ACAyMn09MZ9+du4VNaSCOdVcYjlD205yfmWUZUn5wDtYhuvT5R0yW4qajv7r07LVLpv0dn5vsWpct7PdNcsm76cr2t306Wsk7XRCAABtwQOnHY9/r6+pNHbjg/19/wCR/SnMCpKEY2sVx67SV3dT1xjj+XNITjmnJu/yVmu+mz7f8P3vGt+7+/8A4ciY4PJBweCcdmHI6EAnAx+HI6KOCxC4OCcYHByB/vdxnI5HOWpvIwuSW556L1ByQQPVsN0yp54JpwP3l3ENggfLjIyDkcAHHJ6kgdBirS2W72/xK0VdfqkraWHomktk7t69oq9tl2td33SWlncg855J98YPHpjj2+p7leOnrnA/n/8Aro3HtkAc5HOfy6456cjoDzijg8j0HP8AT1qNtd1o9LrVpO3ytrZW9NLIDn/P1H9M/p+JgZz1PTP+eKM469+n5dPTPXFAznnH+f5fmfw7rVXeyf3PbTT1/ND267/j3+X5/fZfw/z/AJGaTA59+v0PTp+X/wBfNAHHQDPXHYfh1OM+nNB//X9P6+lLr3/Xy031F100+f6/15C0Uhx3JGOvUfr3/DvQCMA89O/4df5/melLpf1/C3+Yf1/l+oD6Y/n+PWlpCwHX+RPr6DjpSg/p+GOAaP6/r+vQPT8b9LX172YhOCB6/wCf8/rS0E4B9SOBzzjB/l06/h1pinIOeCeMdwexGQwPUZHAHbIyadtL/wBdvXffo9UmtLlvTfy3/rqOI75xgHg8A/iBx9e350ZGQcjtkZ9ewPB59x74BFTW9pcznDJ5MbHIubkiGEKdpGGIUse42ggYIIBFWTBplupEt1Leyq2RFZRiKI4Ckhp5ckgnKnYvPJBB6tvltaPM1bbS93tbqrX1s1tdWHytdlfXVq1nrqtJK91qtPlvnFkzjdzjJwOevHBXPGMDgjrnJrRh0m7liW4kSK0tyf8AX3kiwRqpIxtQnzXC8cLExxk5IzkOpNEwawtrayKgAy7RcXJHAOZJQwXHPCKCDnDY5qhLJJM5mneScsMkyvuAI54UkhRuA7qO3uU1Uajy2g3be11tfRXTta+umnmkWnDd3k1ayVkrqy337r/hlfW2aFbsnmT3epzJndFZqbO0f7vyfaJczMhGPnSJTzgnjJedduIwyafa2mkKMbHtUL3bdAd97M0k+W2jcEMYPJAB4GDk+vbIGGAOTgYA4OSAc4wfvY4pQ4xnLHAXOM9CwI4JwuByDkDPfIzS9hezm3JafE2lstkrfjrt5E87WkVa6Xwp31a6t829r9NPPWeWSa4YyXEsk0ucl5pTJJg/7Uj7iDwfvdDzg4NRMWPLYU/NtyOh6YX5s4yBj3I9AQ/cSDjJLYPcnkhuV9yTnPJXtgEUwuc5HGOg+Ye4xnAyAPXpjPBGdkopWilFf8No9fPT16qxK8tXs5NJvS1rt6a33tprqtBjHJOeDyOS3AzjruJ4H1x05601sbeVHJ6DrtyMAEknPXIHUAHIoxkbgdpOWwf4ehXII45wT079W4LipAPI44HzFlGWB4PfhsZJ+bHHSnppv/VrXf8Anv5lq10m7Ju+2ieju3d6W0u9r67iE5zuw2STjAY5x04OR7HuMDBzShfl4A43gfxZGQMDqcEtjkHnpxRjBPUepA6kbTnjruOfvbecEEno8DAweWAB+YYzkggDtgcgcknjjqaG9u11rvu1trs7tPrqNWSTTuru+9na17aJJa8utmm/mnEgHnv0575AH06598e+aWmhs4x0ycH0OD0/IdPfoaXPOD1PP8+9Y67avTv5K23bT7kjP+v6/r/go+epByfz+8O5IPXqcHJGDQQBuYE5PJ7jOVHPzDHIK557+gFDNycEkqpI6nacA9M9MDsMZ6ckEIG+VscnJ7cZ3b+SV5IGDj65zmtYq17a+mvZaN2XR3Q12d7Jp63d17tvy676b6Id0OOvQ8kcdBweeOT355yKCcfkT7cAnH/6vx4pmeeCTkDAAPJ+XqO3Gfw4I4yXHPQjjByc454wPXGCeSO3ep2tfS9tbrolq732be3xa/MsrJtNJ+eu0b+mrureeo6kPTnoePoPfmgjP9PajnkEY/H/AOtxUaXWre19Evu1tp9y9AXTvf8Ay6vQQKB+eR7dPXPpTun/ANb/AD/nvR/nrn/P0pMg59utDbe+tv6/rz9RbgBgfTt16/h7n04q3ZQGe9soghIlu7eIknAy0yqV4w3QjpjGccg81a2NEBXVdOfdhY7uOfksciENKTwGI2lMgkYLA5HJxNSbjB6rZvW6bbat1S+6/TRXuOK5pwXd7vW2qvd9L300to77Mh12YT61rE+0bZdQuCATyQshXg446Kc5PUA4A5yGwMrwA2AOuOM56d2Py8jnoT0xLJKJZ5ZQTulmleTPXLSB8jHGCSAcHIzjp0icnAHJIOASCATng8AADr165wQOtXSjaEE9owgr7PaPbW177LRXs+1JylUk2nZyb3vpeNntf/hrt2dxdo5wOuSck44PXAPGB3AwFPJwMU856kZz12nuMLgDjjgjoMAdOTTTnrnjjsRwcHOcHjHP+107cKVJ7nt36cg8cfUA8cYHvTvtrbbS7tdcvnvbW3nZa2sk7au2+m/eOnxeWz+WtrB447joPQDg/ieAMg8557FBnGe5G7oMkDr2HHbvj1NKx5AwMkjBx09f/r9PX1wuOmOM89+DnOccdSTn6YIoT2ut5J32bWm67PffV97Dg1zWfWUfkk1dfqNJBI6HDDIyCQQF6Dg/xZ6A8g5xikPO4jqBwR7FQc4H4HIyOeecUjMoyRjJwM8jJypGCcAk5yPzByaUgYxz1xg8DCtuPtk84PGFH+zVWty9Hu907aPva3e/ra7FZLku0rvroneytr3u10uvIVm2kY5I5B6HqOhHPOM4A6gZ4p2SBkBunYc9RnuBnJH6/i1jjnnGRnA642nt3wMjPJ+lKCcYGRnPIJHXkEHH0BPU+hGalXduuut3b4kktdGl/lvYVo2Wml3dd72un5O73v3HNkBTjg9ORzyOmSOxJ9+Me5jGFz0A4PbI9KM49R056deg6D2zyeeuKKl3urNarXbW/L2tZJp+TevR3QhPGPVlzwTnBHX/AOv/AEpAAOmef8/Tt3oweR7YGf8APP1/mc4UZ74+uSfz49Pz9qd7JLz7eSfXTv8A8Mx9NHvv6aW+d7/8MIwHGcH5h1A7d+2O5z7noOiMuQevJAOOvp7k45zjHHuBT6T/AD7f1pXenk/l00/C79biv2b/AK/4b8BGwcg8g4GMgYyVHbnPP5H3FNYnBAU5weTyBjAOD153YByPX1pxYLycjjjH1BPsMYHX8OeQbgpAyQDn8MMCOwJ7dOOxqld20v1V9tLW0uv+Gd9R32urpPrdJ2s7f526vXYD1AG7ocn2yM8kg9QPXAI4NKxIHAJP+e2R7fnmgHPPUdvx4+o5H6deOFzzxn3/AM9+3+QanXt5a6vp3/K2z7CXn/XoNPIGfrjjIwQR/ED17ep6c4pjAjdkcEbsk8g5Hv7g9885yBkvIYYPXBxyP73TnPXj2zzSEg/KeCc5A9iD7jPI5JGeGOcg1SbbVu97eSUbXWvTvqn1uUvs7fFtp5Pr6fp1GFRknK8bgDgcgnbj7y+/UDuOvFOJXcpBDAA8Zz0HbPXP3TjHXO7nlGJGCo4+Y5GTu6ZwMEEjjoPQ5zjKHBzgAdeckDG9eeBwevfOPQZBvVpa+uzt1Te2y10X39S7VrppbXS2+G6e+n6ttr3rOeK5ubZ8280tuTwxSQqG6HaUBKn5jgjDZKgc4GLLX7S7Tc21tcADaGMXkSsd2dxkg2ZOSQCwbGMj5hkUHOWYgbiAfXHUcN12nr04xyOSaC/OcYIHpyvPHA9gOn4dMUcsbWt0WtrO9k2++j/y1Bt2uvm1q9lvq3+Cu1prdK2WsZEUFLi2P8TErcw5PcAbXAAHPBJyeTyCz7KZADC8U3GcK4V8DHJjcq3U5AGRzjJ5qAPyBzznlRgckcEN3545zwc4zQ5G3g8qThgQOuByRtYqAuM84yAPUJQa2bVrd7J6JaaK1rLsu+5Ks5R09Gk7x03s9bv4dtHIc0csT4kRkbsCuOcjgDbgdcDAI3eozUYYqwYEhlYEEA7lbjawIAI5wBhhjPfoZleUKfLlkb5dpUszLgHJG1sjPPTk9BgHFKzF9wdIzkgmVVEUmQFyflO08DA4APckjFDfSSTurbK6fu3t0vrfT7xpJtX3VrXV+yX4N9tNr3sOmYT4mKqr9ZRGqhWOSfMC57jlsgYJyT1quwJXPfHY55AJyew+90A7YHtJGVVjgNk/KAcFdp2g7mGD0OQwBPAz8xIprptbahDKQSrDBzuVeMjd82B2LcE9zTirb7918r+Xl0va/cfb8VZ9k9erv5KztpdtjB8pGQMgZ+Yg9D1GCv0+hOcZAppGSwIxkZA9FDAcnPqOhH4f3XgHJ6NkA9snBAwQR2JJyMcjoME0pG7PAyMjGT0LFhgEY6deRx1zine279dPTbyW1/k3vd2V19l9X2TUdLvWOu79ENfKsQ2MsTz2OWA4I2kc4bI6jHX71B6HIAxlu/AyB2JPXjBHbqcmnEAEnPOTjGcbjzgr05PykZ6AHuMBHyFMkEAnnjrlskZCkc4PbnnqaS8rq1lLzatsul1pdXS310tL2Su1qne7S0avtfa2/wArWG9QW2nAxwDxyfc+vYfn6g75Bxt59eo5HHpz/wDWNNz0GSOOcD68dMd+hPrS5znBIOCT1ztIzznjOeenI54+9TV3/W+i7aa+X5hpp6v7tLd7de/zJ/lyMc56ZI4yQcdQeRjP4cAAMUJ/i54zzyPu/kOKZuIJ5IPPKng9+h9hjtzwePmp+M4z6YI7c0m2tbrXpfV6p209dLaX7q9k9NFbp/wdr7dO/l0DjjJ68YOOenb8v6Y5o5zxwBx06/y6e2Rz7YoPuP8A63of8fT6c0Hpkc8E9cAcDA9vrjjsam2vndb/APbrutEnazvaztuP5f5dP6fTXpoM3EKVXqTgE4xndtXkDuOh7DgkAHCEEA4UrnJ+6CM7sH+LOOSQcfKATnHFPIzwo/vEjvnPB5Py56kg8ckHpR+OAB24ySc4wVIyRzn73bGMVWt9Hur3725d/XXbTXYemmjvdN8zWuiS6bNXs3pyv1GNkkjBTcCASMg8kDBHXHBweVPJJ4AXO4MFGMgnLZ9cAY68DjHXIPTFKAqk4yMZLbSSTkYHynI4HQDHXgDINLkDkZwRgEDnqMev5eo5ycYTd1a/Z7rXVWumrdXrsuu9gbVlppp+KWrVnbm7XaSvotkE8qB3PcYB5AJ6g5G30JGOh6U6mDByy54z8pJyScnGDwc5znjqpHbDsgDJ4/Pj+tR00v1Tfe1rJfdfp5dieit/Xpb5W+dgJPA7ZA+nPXPvnkd89sUvYk856EA+31z/APXzR+X4npx+X+fzTH6Hj6e3XjHB9eorTX0d110e1+m3S9tN9LsatorW138tLei8/Pys149R04/T27d+nNOPduuQQeh6AjjByOcjdgf3S3OaTaQM44xg8YHzdBjpg8EfgB60pG3dzleSACBkAksNqggdCD0GOOOtUnr5J9N+n9dOhSVuV6XurLdv4dElfv13XTtNjPBHX16fr71IgwFAIxhgfmyecd+xHQjjGe3So84HU/5HPA/yamXoOMEZ+pJPOc++Onfr05Su1p5dttNNPLayWhKb1X5/nr18+xmcFcZJBIHGOo25G38MEHJOfvEDFLkYYdAoPTuScDp64+bpk5znGKEAUFgCARnBAPU4PT0I68+gzniTHUDaCQcHJHTpzjJHU98Fjj0qZS1Xk76vq2t33XXe129HoNNxa5ukrpbLo7ddbaP12RGRyCQOcjBxz0OB0OR19cgduaeTtH4H9DtPOc8Hjoc8n0ywjBGOR0J3cAcHphuG75xwSScnNOIzn6MMe5IPoTx9fTqalrZPaO7+668vK+626A9eW+z3ffvp0tt6bbIUcfj/AExn2zknOB3GcUEgd8dT+XX+X8yKTv1x+PPVT0P5cevHXhevBxnH+Hr2z/Spd3a66L1em/nt6fixer3S27K2/wB23dX7XMkDPXr0/HH59D/hSqehA9+ff/P50Udf1/TP/wCr/OKcU21be/f038vXT7hAG56cj/8AX9M49OmeueaUsTnOD0yO5HOB2GM/Q+9IOfXPYY/z/n0oOM/T25Hb6/j3rWKsov71926tZ2+/vuw/qwu8nP4enb8/rj1OcdKTdu69eM/XGeePyPA/Emm5+vJI+nX1HXPY9+lLx0B6eo/p6fTjsDimNK9/S/69vl69RMckjjPBz/T+nbjpg5oJwQPX8vTHT2H+IFAz/wDW7kc468gk9s8Y60cHGMjjI7cD/PTkdDjHWXzbpLp6paX11u/JJ3HZq11dO3dKzta78vml012d9Of/ANfr/Lp6dBR2zkDHqf8A9X/1u9J3P+eP/wBeaUe/v/8AW/pmotJ27+r2tG/VfNrW9yf6/r0D/P8An/PvRn0/z/kUf5/D9fxHb+Rgg4xjOSeg7fz+v069EoyvpZWtddV53vb5LXtogDqPTP5jPt04/wA57Gf046D/AA5+v9aTPP8An2/Pr270HH4gZ79/cf54zjijll2evRJXtZdtbX3vs9eqH+Pp8l6/LTp3FLHknnjt19c9vTGMHt+CE88d89M46+3TPPPbBpv1OMHj39eo5wMjOfc0uenUjOD09Me3c88dc9MU9ndN3Xm76Wt0er6X6u3SzaVtPm0/w769vN2a7mMHgce+SR179O/rjrgZpcDOe/r3/M8+30/Cm5yeCeQOO34flzxx654pw9cnv6evt/Xn9aqV7XfTpa1/h1fTTXa679bp+u6W99dvwv8Al6C8Hr7j0pCeCvQEHLbQeeT16j07fTA5Pz4zxj6dPU/y/Gg4YgDGACpH1/Ie/cdvom3fa6fZprS2qvu+iSVr9NwTs12TTf8AX4CA9iRk5ILEcnPy9Blic8ew4JKkBzNkNkDBBznHI7gkfNg98cdPYUmQWxxlece5xknPByQeRjg9+tBx0657H8/6H8qevzVr267arTpd3Ssu91uuuu99Xt53X/AuKWz6AYPQcYHX9e3rRnp/Qc/p6f8A6qbuAxzn6HPp64HUYJ9sg8khM9QcgDpyST0ODjpjB75x9cibO6dnpZt3u3tol2Xe+vlaw7N97f1e3cdjOfQ+5GB/nsAPQ+tIfT6Y4GBz6kHn/wCsAM0ficHgeueeMkdew5Hp1HKAHOcjI4yRk9Bkdvfpz+ZoWm700a/8ls3o0ktE3vursrl7vS11fvputbLZMXjOeecY9s9u3v34znHXchUEYB2nJYHngjHOBnkN6deBgdaUgd8njt7HIyDkHkDk4IyT0zlc7g3QEAqp79gDtx0Hr16HuMEdX/VnZKyfTr2uvVq03XV2195dFFWs/wA9+xNI5crKMYZQHPBBlDENjIbkgM3JyM543AmLIP48nnP09+ee5z+VIrhd0R6Eh1XLdQSDnk8dD+HUdKWk3ol6fdaOz6X3/OwdPX9O3+fqhpOVB4yC2SV+7uI6AAc4+6Tg9+McoCB94g9Tnr1YAAdMAdvlP49Q7rjHT1B/H8c4x/k0Ejr6fpkg/j6+oGKpdE01o1dWXbrd9b3W710VwVtEr2Tt8mle34+va97mRx/vcHA9Rkep5B/XORilJ/HH6d+59/1ppHTqemOCQPwyOOehPTjoKTtgEk8cnjHPuPr2PfPQCp3S9bN9tIq7+4LXtr5PyWmr+9/c9WKQeue49s9sZz78YwMk+tAzznkE8Hjp2/P2z+FGSeuPUg44Axx7+vtxnigYzwe549T3PX/63B74pu9vPe6SfZ7q1raLr+RTWj6+dk9Fy9VtZfJp7vRjh/nP+RR/n+dFN3KDzg4yB1zkgYH15HGefcZxKV2l3/ry/ra5Gr6X9P62Hfh/L8uv/wBb3oBwO34jJ/Uf/q/OmjeUGCPXcQ3OcHoBjOOw78AE4AOgO9y3G5QigDAIPJxkHqR3HHJOBV8j8unr0T/Btr03vo2lf+v69fRPsDOBz1HHH5gkj1A565JGOOcuSOSRdyYRTlQ8hCLngjO7LE9z7Etj0aJsAbY0Q4wxILudvUknuPXjBwDkZJiYhyzSF3bA5JJChQMMqISFBYdOD1BwAM1GNku611XnF9Hrr3XRb9Xa2uras9LPt01fez2fS9ywsdunM8jSMScRwYVT0wS7BRyNxJBPHPUYp63hhiaO3ghiYkN574muMgjB3uSqnPzbQMqQCpB+WqQBbjghRk8HGA3oACAcYHOAcbuTkyKoAIHBHcAnr6c4zgY4wRuyeRg1yrd66qztq7W0bfpbS6WySW7vpvb3rvTXRq92norq2zabdrskleS4bM00kznGDK5xwOCEB2DAVRgYyoweoqMDquRgFuucA5IA4OQo46AkZyec5cBnBGepJPrjPBPI/i5I9Bt6GlK5DfxZ/hPTjGOBjpjr1J+9kYpXSbTa6Jb6bWtp+jf6F903e9r36Pzvb16LRJ3QgBGCvDHI6ZGBntuBPBJyeAMYyeKeSCDnkDOMbTg8jvyoPQkDA5BpOmMcngtgAe3cHjA6D3HQklCAAQMZIPJ7dDnj0OPcD3pNp9L69NbbW66L/g3J66vS6+7T9PTTYYzYYjDFmAGSAeMkAZBy2OuD6ZOcU0nO75eSSO/y9Ov3SMZwcZwSMjAyJXXuSOBg4JODkFcnHbrx79eKa+Np255zjP1B5OCD6ccnqDwTQtkkvKWuj2d9N73Wj6LzaKi1paLfM1q3ZaW16rTd6/PUXcw4bHGeMDPOPutgHnhgSOMYGeTUe4uGJBAPPQkHG0A9fQcEgnkcDgB2VGSOGK5457qenDHqwIwODjAOQAZIKlsH5h3B5AIz7564OcHjnimnqtFfvqnqo3e2ydrX13RUbJK0bWt3el43srNb2Su/TXcYjIB4+8SGPzE7hwCPb7oIIwPu/MBR0yVHJOfryuAB29eQeMAZNAXc3IwR8wA6kZBz055HzEH34yad83JwCfUnjA5HHI46YJwOTk5OU5JJd1vsk27arq9N+uys9LJcvVaJpu9rfZem91ZLZtq/V7NLevPQHJ6EhewIbsOx7noflaeM8j3x35AOCe5Axk84JyMYpx4JJAHPbJPBByx6A4GfToOaQgAAA9AV5zzyG4HPTGM+hI6Gmmvn1s9NEvPztfd7dGw0dl/eS16/Dd6Jr/gWvdoRnAABAbtyRwCRn5sjnPU546YKginFtuQMYPt0BONuDjJOTweB9CMHc9Bk8gEnHI5Oc5PA5zj6ZApAM5AxuxjoeATkMcdR7HkjBHJFFvLze+j0t5aWWu342nTZ66+9e+ztrt127/fopbHBKsAB35zxwDwc/NxnjOT3IpNxAYgDODgYHPI479vReo79QhOSxGOcHI5HQMQeMdjn3GBgAkoTjcTzn36DcDwoznvu5I6EcgAv5deu3T8t/wDLcF09dd3de7p1Xy379B544ba2ARjkH7wxn6rnIUAcDB5OV+YbsD1wRzjleo49MAc8jHTILQRl+uByWOenyEY6574zg9BggDEgORzkYJ4PbLZIGAO4xjr6g8VL69dt++lr629UlqreV3qrJ+Wj0T+FpWvq+mmrXmNAA45GSepP94dCD7jHHtu607O37x49fT1+o69Dn0GBikwc5xnn1z0b/dxn8ThcjjspBHIPIzx255B9+vOT7cfwza7S72bWmmkeu69W18+q0W1ndLTTTbrrbdrW3nfqu4cAY6+pI5OMdf659RxytRDsC20cZIB5IIOMEZz1J7Y4p+cKDtxuPOScksQxGNp+bBIGOv8AEQBQ4Xdtl008lfX+ru+xLsml1bsvP0e1t7eSHg9sZ59vTntxxg89MZrQ01yt2ZQx/c2l7ICAQd32ZlU5UE452g+pHTvmjjGeee/fqf5fSrVu4SO7kBIIs2iJGcqZZEXBIGRkBucgkLu+6KynDnS33S06q8V109d+1lc1oxvU2vypyVnbWLTT13V1t1Ki5CDPGMDOCoOSOOpJPOPfvkZNIx65IIHQDgnnuQSVIznIyRgdKd0+nGANx6EYyB1P9P8AgVRlTk5OcknAGACSrAYHGc8Z5HfPTG0YpvTRJpbaXulpr1st9n1uTG3Npd62X3rbTR23fp2Q8+mPx9OQM8c/xe3p3pPlJHBGOnGOhz+H0OOvTkUgyTkHjGRngc4wTx7EnHHuaUnHb0GDjAyOx7jsR/IClbaO/wA9F8N7przfVbu1nYLavTott07K+nzd7/eh2BnPf6mkzjJIzg9gSccDkZOfXp93GB1BUc4PHT9fb9aWov39PReRN++vT5XTt5bDWxwdqsx/vAcjK8E4zgbiOAc57gUpwT1OSD3OeCueck8dMHnpz1FDEDnqMc4HK+wJDE5xn2z6E4a/bgdecn3BHXuQO3A9D1q1eSXRK6v1vZael1dN+Vmnu0vh1ertfr9nb0voP9uOM9vU7vTsemMYzQWwBkZ5/n1zz6Dj/wDUQ3Izgntx0IPfPt9enoKU84yD27Y9fy6ZPQ/icUve0ur3eul7p8tt9v8APRPQS3V+/wCHr/Vu972GJO3HtnAxkDn6DPA6jsPWk6557ggjJ6H/AOtyATzSEknjp0PX16cc8cHHbPOKCCOhx15A/vHPP/1uT9cZbXNo7XXro/d1bS1f4LqNLba71Xldq1/8un4C4/8A185HHb06Y6/Uk8FCDg8k9Mjv79B0I7fjnqCvPHBwfwxjBOecZJ68A9etKRnuR/n/AD+f0pPRq7vZ6+Vravf0+QLRq9ktH3/z1dv6QDgD8/6nrz378+tKRx7d8ZB9h2P4DOfpmjoPYD+X+e34U0jdj0OD78EFT+HUZHHb1pJapd/lvbr6W0+S7tb6va+r1f8AT6gzAgjaODnkcdR1BOSoA9COSD3wM43dRznIHXPAJ444xyCM8HGTkEZsMcZwvcHrnHt7kDoD146gIxyO+epwBkj2H1657fSlottVazVvtcqtfdbXdrb77MaWya9PO/LpfW2y27621AscqBjHPXA/iAx69ST6ClY4GcZ9hjPXH5+3Wm7s9Bx7HnkjkYPQ4HOR1HbqYzk564I5I/u9QOPT3HY88Lls1d9d+6urLfSyev8AkFlpzLbf+8rqybvvq/NICxBAOST3HAGSFxz/AL2PXH50MRjJ5wcYzgnt3IwC3HU5IHbFLgnuc/TA/Ij0PrzjrxkIRngkj1JIHP3vX8MZI6cHINNJO60vpey3Ss73037ee240k2mrLX+93XWyXpta+uojHA5I5PGc5xuXjA5yOnHtnkikOMEkHAG7PXjOABg5GcjO4YwOA20gSYDADufp7Yx1HsfQcZIJpGXsTnt9SSD/AA+uOfQc+pp83w3VvNeVrbau+zvfS2uguaysr929NPh0SS8u0r66dCNmJOMDjI6DH3iM+xJ5Hfoe4pNxxwRzjjA7/Qc9Px4FObGT1xkHGc5wc5OegJP4nnGOCzAwB0Of4T0O4MMYH6c8cYGMVS6d/RLRct1bfXvt03Qe7aPqrpX2sr3X+W/m0O3cHJGDgEkDj0Oe/wCP4eoUudhA54IBPuykZxk5GGOM+/vTTznA4HOOTjHfOM/p0PT0UkBSOeAQcdByMcYyPXkexxkU10v5Np/Lq7W+7z0CNtNXun5LWOr/ABV/TQeWYYBB5J5Hf5gAOMcc9Seg5zmnHPb/ABPUf/X7/iOtJk47Z7cH9f6dO2euKTJAz1GeTk9O3Hrng447H2yfTRa9m3dKzsr2XZJd9kkm0JX28tN9bK++iv8Ai9Bcj8QQR1HpyOpIyeMdSAB0ppOMkjCgEe5zgZBzwOnqf+BcUuD3J6cY45PTI49PVRn1JIpeGzhugZSM4zzzjjqDkg5UZz97gVSvvfZdr6e6/vfnq+i7D0tvfb0tZq3nZ22WrvZtO8XTg+4GWJGCR948YIA4BGQfTHC5+UnAwQ2MA8nPXBwc5JPbjnPohX5mPJ4JJDZyc5G4YwBlskjIzkH0p3ZgCD1x7Btp6c/dOcnd0HAWq3119Nd3b8vw18xpr3HvZp9rK0evnpZ/qSZPBxkHjB+U4OR2AY5PBz0/MUxiQATjIGc8ZOSPYHPXsc8g8mlyMjJAyeVBzk8HAH3QfUgZyMZ4OGvyDg4OWHHbvkj0AAGcg8cnoalN3Xo9fkvlv21111uJbr5Nt6aOybd9Nuq303YFiMjIOe+PX0PoeD+Axx1aGxu452njGfl4GevA4PJxt6nikxtzggqAcnnpngHOQeV57nrx2XJ5GBnGBk/3gG4AHHYd+celUkuit+m3TdeiX4hHf5Ju+lrNX12bS3t0fYmHGfT09PXHt0x19BSEdeM57Z44P4cnr9e9J1wc47H2xnPuPwIOOT0pSCTjkHqDz+PQY6Z6kHOexyZd27Xe2ttP5b2emurfkvuC3d20/wDkfTXq7O/l3Uj8uSe3HOfT1/qT6oOp4xjoOg9+OnXuOxGaXBP4jkduOpGc9OfY8UDA/LBxx/QeuenP0NJ/Jp+r2dubTRvvZ3221QunV/kttf0+4OvfB45IycZP4+mAcdcArjIXccZyvTGT93vxwc44PfjI5yMhCfyx1HX9B+uaXrjp/wDq9c96Svvdt+u9rJLfonfVadb6h2+/8vX+rh3zxk/Q+3/6h2FBPOcenA6en/66THPpjPAIHOF6jHUYGM8D8eDPt9f1wffp9fx4pq+umzvtpdW27N6308rdld+f/Dbfpb5ChvbkdeuPcdgc9PTHbmk4P+cfT6Hp70Zx15/pnHb8DjPPbrwQn/POf8/zGeuKFFtp93d/cm2l010uv87tLVdL7Pz08v8AhroQZ6E89Tj2/oeOgx1HWlBDZyPTGR/Tt3/L60mM85/X6AjjGOByMcHoRihc85zx06gH14/yOmAKvVq7+dteu69Vfz177u2jfVW8rPS+2n6rqrjwOMNjP972GenJODx3PI607bkYYcYII6fKchslfmHzcE8jgDbmmJjZyx6ZxjHv2GMZ6jjn6YEw4BOVYc44wOfm3cdSB8wIxz82OxPLfo7Xvd2ta3r8gS9bXtezXWO3Z+vSw7P/ANb29/yH+TUisMx84yDjGO5UnjPzY3Y+bnHJ2gcRgdPfgnHQjtjrzzt7EenYkVlcEYwSMZ6jG044ABwoI655wcd0l6vRO9/Tz1W77au3YS/rZemr/H+mqiEEcDGMcZzj0xnkYx04x9ejscE9cZ6dck84HJyOf64HRiHr17f1/wAjvzT8gce/Qev+T1Pr71M900t3fXra3S91o7b333sLrp5bf1v+owFhnJBGM88E5K8fhn0PYdeKMk7+d2QRgcqCc5X5fm9edvAxgjpT8+uOgP8AM9OvGPr+VHAAH+f8mhN9ktuy35bW+5u333tYpNaK2v8Ait23+aevy+yrN7njBOBkgYIOPlz/AD65xx2AUckk5yMk8+pHPqRkDqOQcDg4oHBPdiOf/wBRO0Hn/DjApeSOuD7f59f04qb9n219FHpu1fpbpddRPfr0Tv6L1f4aK2nQMjOO4/w6k/TuaUDp9MdcfT/J/rSEAcnrxyBzntjr7cfgaX+lC0aa+evazd9NF83+gb6/K712t+GqE6dwOv5Y57/n7ce9HPfGeP8A6/6dP1ozgevoevX9T7evHuaRs9P85H+e3Ppk8hpO6v3u79LWu9fX5262BK9/T5aNXv5enkGSPTPbj26+oGeowSPXHQJbrkYJ68Yxn6Dk+ucdhjikU8c/Xjt35/DnuTg5PanZOOBkdR6Hn06g49s9ue9XlsrNre7to7Wfa/8AXdlWs1dLs77Naa69d7289BPmOPbPp0PqOvb64wCe4MZIz1B+nvkDnrjv6HpRzkgcdeSOCeP6f5OMkYkAHHTkj8D/ACPP4VN5Pr5q3bT8ndfi9NlqmrW7K299H/wNfNWWw7gcfl/n/P60f55/+v8A/qo7e/pR/wDX/maEpXSV72Wiur7Xv+ttW1sSGRgcEdPYEfzB7dPT8Q98d/fkD/PPTtSdDnn+n48/Xn0464yE8ZB/E8Dn8sjnA684q07/ADte1tdE7u/Rbdfys+q+Xfrb5/dv0EOT0I46j1/+t9O/GfRMnuRjjp7ngk5IGe/PAxjk0cj3xnnoMYPUAHpx6dcDvkzwDtB4zxyeT6fhn6/Qmj3n06/O2mv59ntojRJWW32dere/rrpZaPfyDJ56emBzx9c9T0AI644HNL8/PTr7jofTnt09j1o6ZJAHHrx7A+/vjpxS9/w9D3/TOefU/hkzeVtEumltlo9PK9r6320RLdraa3TT9EtN79f66J83HI9/54HGeg6dfrxhT36dh3J56jj7vY5P64pfT29fp+ffqD+PWjv/AJ/lU3k2lZtrb52t92+vfXZonfey+SXbolfz8+gMTkDnAxwxwD1yoIO4EH+Lb16D0ZlWBIGOQCcEHhsclcfNwcd+ScDmlYdDnqQeBnPTHABBICg7jn8MZASCGAyCB1zj5uD3AHQZ7nB54Nartsnd3T01a9X3eiS16j25bfk9ddvO2/zt0DAznnPH4f579fypGJGD1Pc/qQR3z1xnI6+tL79wOmc9gRkcAHB5Axjgc9k4ycDqcewI654HUc4yc5I4pJNu7s1butVp6X69O/RjjvvfRLsraaPTb82ra31TLbgcjHYbfQ4yQcnJyBgYGD9TS/Me45AOeOv4DHX9OlJlsHgg4Oe/v0bsfm5/hXI6chwPT6cYPbj1Izz0OO/ah2tordLe7fo366LRXfmmVZLot9LWdrJaX01v03a/BPmHcEYzyMfy/r/Sgg9Scj06Eg9B065xjjPJ6UAjoBkDIPpjHU9AM/kTn60vTHHGfyJPXkZ56dsZ7jpOqaSSWrte17adddenW97atCu+qt20V7KzsmuvbZXv1tZvBOGAVTjAOPmwQMDBJOCOwOCQO+2neoHvgkjj26Z68AYI45IpcDOck5yNo5IyeOOOTnluO/OPuh7/AMxyR04xyO3cZ5z34Tb6K1lppdvayT6tNa/K+1nF7u9t9bdL6LbfXX1e/Zh6qwxuHHIBypHI59QCQeACBnOaDjpxwCR1HTHcdOD0689hk0enJOBx6c454/mPekIxz3/+vngDPG7HqQO/SpTbfntFaWv0fTp+S6AtdPut306fnbX1EJPPOAMY46+vXr7Yx+VBLeo9/wAOPc4yeT7du5yew6n+uRj+fUZ557Lk5HB5OPx5/MfUDgZ9KteSVmm7XV9eVeuurv6X1Za2WkW7arTys+vz2+/dMuR1HPP+P48c8Hk+1Kd2OCAec59u46/r+lJn26AZxxx2+mOT1HOMdcUp56df5jPP1Hpg557Z5Gr/AGba9F6f5vddNk7oHa60S1XTrppv822tF5i84I4zzg9Mf5/l70f4de/t6e/b8u5zxx+XP4duvPXGPxpcY/8Ar9/ep1atZ97W8lZ2t22fnf1hu616f8D5aW/EQkcgcEjgk9+57Z6ehxkdaaAFJJ5yBk5GSVyO+P8APBboaXnqc5xzycDvgA9Prx3yOeEboc8ZBAOO55zjgYz+PGRkmhJu6vpbWyu2rLS+67W12tYFtZ2s99ttOr/LyegOu4dec+pHpnp36fn2zmmgYB2c4Bz1bOMDqScAYJOc88/NgU/ByWycDgDr14+77fT3z3KEgHgZ9Rxnnv07+h64GM85tN3Wt1ZPVtfy6Xt2stur72VJK6Vm27a7W2b+aXbuN5OcHqeRnkFjjrkccZ+ZScH2wUJO0nIwMgDjqCSoyccc5557Dtl5Jz0Bzx2x3OOec9ByPXpmg5GAcAZ5PPUYOc4/qe+TxVXeqdna3m1ordG/Tvp3KjdST6+6+9rWumu9nZdbdVe4jAkfpk8dx3HzD2znnqOuVU8YBOOg+8Oh745wBjBOSRznrS9SeOMehPTHBHrznGAenXsdMDBxntj8c+gPt+hwKhybVl5Ws2/5ettZX7fPWwnJJW7O6XSzs9L636X0et7KwvIxjAwc+vr/AFwev/11pAMd8/5/wx/notTrrZ+b01eu/wAnrq9Ne7Ie+9+t7W3/AK/q4xjtGO2B7jG5RjqD3+h7+hRiApAzyMnGM8FRz6dMDbgYPXA4k68cYwf8/wCfwx3Yc9hzg4OeByp4HGc98j1GeRlp3a9euvWNt/Nba6dOpUWlZPZS5papaNRtfsur7X7jWAX7p5J5Lc8FgMfLg5HBLe3bBIRicgjBBPz49jg9T16ZBG7oc4C4Q8MQMbupwSehLKWBxtz7HJG7ls4oYtg8DJB4Bz/ECfTPoT26ckVrZ6b3fV2baWi219Hr23RSsrXabb1bvqtL3t00drt3tdJXEOegKnBOASMAsVHJXDYGR1HfPSnBmIJJAJyOBwcEDOCd3QHsCDubnsEckg8kcdyeV4A6AKx4O4r3I6in85zgHjbx/wABPOcZ/PoAD/sxJpL8FeysrJ9VpZrd3+XSm0lF7ttWeqttJvro5K7vs72tcXn1Hcj6enTp0yRzz+agnnPb0+g9/wAs44xmk+nPODnjjA65HbrgcYJ7mnVn2v5dr7L52ttqvzMW7/d9z0/Cytr67jCOw74HPPcDvzznqD2HtSNnkE+uQM8YIGOoP8u/Y5D8e3rzx3PfHX6+3Wmsp4OQAQwJ7jkEAD1HP19zVwl00vr53+FJL1t0X3rQaey7Nv70tvPRW89O4nBYkjO7gjkDhtoIG7I55JwQR06AFnYp97I7ZC5DhTz1OOhGM5+pFPxh8AkgBScnJ+9njPODjvjAOFpcYBOOuc//AFwcfywPTHFWmnf5de9tX+O33sFureVtb66b9f8Ag6dBp3bSGIJ57clSwCgELnPTj0z1OAWYY5OBnqByT1Hy8nOT3yO546bZM8njBxzz6n2IJzxxxjjHUAqc8sAM4xzjJ9uOg+h65+XNV/S1tZ99fx2+RTsvdtfXTT03777LskR5OSvyk8nsSMkAjcGDcE7cHjBweRTucBiOMcrjkgEE+mBk4AIPGTgfdpRjJYDJI5IyTwQR8uTjpjgjI6A8kOOSGBHqPQkEA4zgjnPJHf1xxLdnqrWX5203/Ndnotx+7b3dG7t/+Atpe90eq7aWsgJIz3JIIHHTOPb156+/bKjA69NvPXI5PHBOMYxnnr220v8AnP8AX0ppUHO7ByD6HjpjHTHPPvyR0rNatXvfuraLS3pbXpo3e1yNNL+V/TTt833167kBAH3geOxI4PqccY7854OB1FOLnGQpPHAw2flYcgsckEckHkY5xkChgeCSfQA855J5ByCOcZ6E898BcdWAY4DDvgfMOAv3Qemc44IxkVr16NLdfc1/XoNJe62k7SaW/wDd3SV0mtrau22g8kYOMkZAHJ6k8c9cgkZ6D6YNOVlW0mU43zPEmCAMqvzk56+nUHgAYBBBQkjkAbePyyeg/L8+/WoztZVU84ctyTx8pHHAJAwcccYHGMgKyS6+T3u7re/4vdLY0ptRbdlfl06y1cUl2Su2ujd3cVmYjIwCS2Bwej46jBJA25Cj86RmIHr15zyfmIBJGSeTwOecdRnCFmCkjBA4zjgDgqNzdhyR09O2SKWDMARxuBGB1I3KR2J56Z+XJ4GKLdrJ/ne17+ennrbu7HupRtb4tN1p7rs2lK2jt15u+ujyW77WycHvjJAHfOc9sZ9CSKCTgkD5RuOD1PODxnIBz0YZz2wKFwck5IySRzyOCMZ6ZA6ds4zyKTbvyMjnJUg5JBIOe/AIyACPQ9RiLpPVJW+W9rtW6rfo7ee0vlXu3lo030Vvcu1rq/uXoyT+fv09Bxnv/nmlHv8Apx/jR/8AW/z+GP5Un8v6Y/xrMz/pf1/X4gwGAc4OQOeRkkAYHrjoTxnPvRngZxnJ/POOuPoM4IHPGCBQOB1z3z14/rj269R7pk85xx0I4z1z3HpzzxjPYVas9NrLXVJP4Ut1t1/4Og0rvpv+qXk+vl16iMTxyM9/TqB16jGTnHXocdgMQDyCcHpj1+8D7HjIwQcgZwSDJHQEjkdCcjjPbA5A4HT8cKi5PUDGDjtzjcOO4GAffpg5OLT81frtdrSz0vrvp5pJvcuKuldLe3nZ2d+r73tbRt9hCzAj5lBOAOxBBXgcAnqevJ4PGTSlivLEZAYgcAkAjjkdMnPHTPcnAAMnJwD3APXoRkdO3H0znnhRknO3pnknt6dOfr1OF5PWk5Nbd7vVa6LRbO3X57b3crLt/eV7O1krei6Wve6dnslGehAI9ug5wfyH8yMHsvHB45989ccD644/OkB/M+nPHb6jnkjjP6AHXIAGeMf57jH15zxU8reunTZLyatrr59LeTsZvf0tfrtZaJvW346vbZQBnpj17dfw/wAT7eoQDkY75/H/AB/L9aD0Jz69MZHGeMY7dCf1pOc8YI/ljtxzn35+lJJ+Sf5fDZ3136bdbdgW/b59rXd7fP8ApXX25A6Z9sevbv8AlnuMtbLd+Pbr6e5wOemOhH1XJPbr09egI5PHfkex64oz1z685OMDH9T0x+daJtX0vpZq8Wr2S06p+XR6K+w0nfS34Pt5tXfy7J9BrbuMY+vQdQBkHv6Dk54xxyb2H3ugHTHtn68cluOCR1HAMnI4A4JBHP3j7dcZHY5I/EKTg5x3xkcknOQOvGOCBxgk4BByE7e6mldrrbTZWTto7N7fd0d2dknZ7q9ummz72206eV2FnyO4PHQDHIySM7iO/Pc8kGm5ycYPzAgnkZA3dc855wOBtOewwVDgHHXsMD1AIHTIzg/pyetK2Oeu4A9+eAOw7ep4AJxijW+1layduulm1pt29VtcWzaXlsnfXl1av5LfW9tNRwAA/LntycYz7AZHHIAx1pGwV5GfXHH1OeDxwDjkemTyvP4f15yf/wBffPrSk+35ZP8AjRrdXXk+ui5Xq/v20b76kO7d+um1vl+m2t/mQnBLdOcE7umcgAjGGI4ycZPqCDwhIII46HnrgArwRkY6+mTk59aCcEkHBwSeOh4PzDnHJx168jpQVbBztAAbj16sMjGFJ7nJGO1Wtfw36f159R20S1V31/7d2/rbR9hDncAMMScDJAUdcLngkqCCc9unspLhSeCxz1Azy4GQ3Bz0+8OozwRmkYNklQNxyTjduzksCTkgZODgnqMDPNObqQN20cHlh1bI45BGc5PGB8p4NNq1tns/yevn6adn2tK0klZvrfXa3RbPf16sexcYGc8Z9fTgAfh+nTBNHz89Opx/T147+tKTjHTk845/wySOmev5UDvxnn6Ed+fYZyPrjA5rLe2iWis7W/lX4Xdmn/mK99Ukl0ulZ3snfta/Tf5Dcn5s4bI68AY6YBABxznk8k888Bc5HDcAEZOcAZUHJ+8c56AfebpgctHQEEAkdsA4zkEAjBOBzxyOBnqXDIB6DAfaMgnBOVyACMjJGeDgDjJGLWy67WV9NbW/Tomu3dXWmut91rpaO929d9kr7Ndgpk5wNxx1zjGc4GAD6YB9sZxQQoVunTGTjPJwMjglcn0K9upFP/A5wePxH4E9R19+ecNwcj/ZDHaB1zgjHHYHr9R1JFQpa6arazdm7tdXdX6tbK/qJO1k3onf9bfevRPUafvEAZJHIJC5U5xwOem4DPAINRg8Z5HBBHU8nGV3EEkYO7PJH94ink8uQ2AAflB6c4HBGDjH5j8mElScHOAwwT04JPQDI7buRntwKuKbsnpe3rdrre2/V307lxvomlry91a3LrqrXs1sttd7DcnjkAHvj8j0wPbJOc85NCl23YIz0HBOScdM85656jp3OaAc5yB0z3/Ukew9ehPTFGG6DaOvIIOOfT8x+vAGapPv/wAHpe3/AAdr9xpKLSaXdN9fh8m7+fVW0RZG7JJI56Dvn/OSRn8aQEg44Pr04GM9OvJ9fQeopOQMqMnLcZGTznHoOp5PToM5p/8Ann2rPa7vdX1tbR6W7a3/AOCjN6X81a3Zqy1V3sk7au9/UbxxnHBz17k49fU9/oOeKX/9Y/z70mRwR8w/LkHOMdsAcYPI4POKXBI5OD7cY6cd8/Xr6cVDTfrr1T2tfRbd9Ne67rXrpq9776X9d9X5W3Vhf/r/AK//AKhR7e3bP+fp+nekzjOeg798/Tp0x3HJx3pOvTOM++Tz+YHqOPrjktLVdNr232TTT11bttrqu4rd/wCuv5MCwH+fwwO2fXnPHT0Du45HA7jtyemM55//AF5wA8cnB9s8dzwD36D39qNxweOn4fzGfTtjHJI6U02+ifWzaW7i1bXq/wA1e9i0rdE9r+jS2vbv02630YfN2IBHQYPPGepx+n1PpRluOgzzg59s9uPTr6d6M8gcdh16demRzxjgevNHO3gcn9PbGePzGBk8Hil6qPRa2d3pq2unV+tuoettla+utl8raK77O17WYgJPBx1wff8ADjjB6/pzTue/59D7/T8KTP8AwH26n8OBySCe/wBDnhwz3/HA6D16/l9QK0TfktF89FfTRP1XXWwn6W6Pr226W7W6eTEU4xuUk55zgYAyxycqR6AfVfSpM4GPuqQe4A4BxgnBAySBk8dMkg00Efn7nHXuMDvyevp15Dl5Uj+LouOTgdd2Rg/e7d8buOaa0/4Ov53/AAGtFeyTva0r2Xw2tvZ21bb1tp5yZ6lSMjkd/T0Gc8d8dOnSpQAxGQTu5/kAOp7DB64J9TmowBnHQHPfgHt9Ov5fhUivtYAHIXIBHXIII7nrk8jIORzyQJVvs620XXe3T567PQWjbte3br0Xzd9lte3oZ8fVvw4475/yKk/DP9OD/n/61RRcLg4Jyfm7npgA9SP8ntUhJyOBg/XsO/1P+RUPWza7vdJPbvq3vpaz81urf5629eu/oGOP84+n0o9e3P59PX6Y9+oNAGB1J/U/5+lH8vr/AJ/nmp8ul/l0+dttPQW39b/f+op68dP6/n9expAuM+5znHbPv260uM8dP/rc9/y/zmm+xzyOo7Y69en5fj6VdPRb6N2V9LRXzV76LqgX57+m/wCgv147c98jp6H9RSZAByD7++fzHt+nHFO/z/n/ACKbnpxx3Pcc9Md/Tj8O1JXb0vum9bLp0W23TV2vbca+/wC5f538uv5AWx2Pt69sn24J/rijIGeDjrnvkEZz9PqRgdeMUp5P06cZwff9D29jyaOnU9/b8u3Tr6/Wru2ld9LO7s9Emmnq9Fby8rbCa00v69dVt/T3EGD0GOvp7eh7jofT2PK554yCecd8dCOmOT19ck5pccYz3P8AnP8Agc9885JgcHj2/Pp9e9R8TWrstel7aW+butm35dy/4bf128g/z/n9KPxz6n/H39aMd/X9enOP0z7detGOpwAM/wCB/XPHUkDNNt6+SV7ddtb/AJNaq2y1EB6c8D6/5xTScdFzzz+mO34ceg706j8f5fj/AIfnRG97W2s99GrR1201101fW97jTS3V/na+3lfp/XVhHPfjnj1yT3ByTx9ep7UuQcjB+mO5578dT/XpzRkE8fyz3/kD39eRwDSn64PH68dDn/P407N6O6so6aXW1317NLd69B66K+vS3S9u2uq1aXk9WxM46Dr74GcnOCcHOf8AEUufYjp1HX8vfPHpzSAD3JB6n9PyB/M54pfb8Oe9KU22r3dktbtPp380rabdL7DdtLaafPbWz720023WomQTgdcZx06Y6+n3h+Z46il5/Mjr6fh3/Pp19Aden8+ccc9P89PWlx/n/wDX9O386V23prdJ7ryemvkvlvreyvv8r/g3bTv222Exznn09uT/APW/TvS0D/P+f50YJ6DNO8n1u7PZr4Vy2281+C0EJn9Bn+fr+P8AWkJ4zjpnvySM8fpnnj1z2Xg9MZ59M56e/tmk7Enj69u3bBzye/BPHu0pNJWb1S30a0sra6+atp3Y1vt99+vpqJuAJ4OcZAOPXA755z0Iz8wAA5BazKAcqQQOnT0U9we4wcDHTOQMuO0g4J5Xn1IyR0IOT2Bz0IGOcBSBg55ypGO3HIO0Dtnrj0HWnfZvvte3bdJ+raeq29ajy8yv0tdtpWtbvbbVfmNyPmwD0yM9eSe/UnOMepxjnJoBBOD17Z6HoM+mCw7cA++MuBBBOMj5hjPv36YPpyMd+vDu3A/z/L6UufV7a/8AAs29b9dOmtxXbvfe++zT2+7TX8xPoB368d+emfqfw/A44zjJ5xkZ49uvbg47UvPX8v8A63+eKAuTnjOOvsP5fj69aWra3va+nyd+1r3drfF6iX3en/DhyOR/Ttj1/wAnpnqCnPPocfh6/wCPX6e60nt/nj/P4U/ea69+i7O6t1vfo/vuJaf1/X4ATz0OOw/H1wRkYyCcde1ISB1BP4deg9c98UA8AdDg4B9se/59Pw7KRxyfqfy7ep7enahLW7u9Vs+mi0tdtb3vfz10KtdpW00vbqrpfn1W/wCSZHXaeuDjrx6/h35x/NNw6hWGeP19sc89euc0vC9ScZ9zyc/5/U5NKOenpn8+h/8A1j09KL2eiettdfhVtP8APe22oXsutr+fTl69Pxa09W0EHGAemfwHHTPPf/A5NPooqW7paNeu/Sz79O1/xFfy06fhr53tqHPt/P8Az3457fSigf5Pf8f8n8KOxPb1weo57evpii7lZp3dlrs7Lltp+rd9PIQUhOOx9O/8h+PX9eKOoOOvoe3tx7fX60D8CcYx26E4/DP5dc0+jTWumiev2dbru/W7to9RrTV/8Hpr5b6PX0Ez04PrjIyOuOMjqO319KTcuTgHOegwT68c9P0PXnJpRg+meTgfXGffpwfQ4pce57/0+h4+vfGRxQr63Tdn+sbbu72VreWut007OzWz6PrdfJ7CEr0AJ9iOvTnnpz1P9eSuQccHnOT147Z9vTrnNA9/8/48cdvX2paXM7WV12d7327Wt+l2rK+g3rp993vZLy2tv1/AaO5Hc/zGc+uPbrn2PC7QP1/D8Og/AYPfJzRls8AY65P0/wAR6e2O5VuBg9+4IHX3zjtx61VnbRdF2301v9/po92hPvffzXTdabWey6W8hMnCnH3iepHqBxznv6BRxz2oznIzkjHHQ9umAPr/ADPNHOe3bHPPUdjx+PVeMckUYGc45x1/P/H8fzpXWybXnstlo930ave66PRMF3t5r8Hbfou2vmAPJGAM+h+hIx365/AH6ocYIII78Eg46ZOMZ9+enUc4CnrnsOnHPp69/Qfh2FISe3J9Mfh9c8Hj656ChXb87LyW8ba91dfNLdaAt1pvpvpf8+q/raOQoMLgnIBIPueg6nHGTjIOT7qXBgdw2joSRwc7j0zjdxzjIOPUYFBcKxPXAOfQe5HzDgZBJA7Dtin4AOQR3z7nPHQYOBnPP/fXBFtuy1Vt7t6N6drb69LaK5TtypPTRtN3e/K9EtFre7326WEKjn5TnK9eBwRx8uDx17dOScChhnr/AJ/kfrz06c4NOorPmbd+2u/S6v8Af20XZak3fTT0+X+WvcTHT19xnr1z6cDHXH6Cl5z2x345/D/P86adxOB6dc8EkjHAHbH8wRyDTSHxjjvznPfIPvjpjPryeMlk+tnpu9Nkt/vdtbW0s0Hz/wCG3/pd+hJ/n/61Jx1444ODnGfX05H6ZpetN4Az2/E5yMc/X37+9CT10vdJq3qvkv09Lgtd79Nvl+m3yAsBnjkDt6A/4ZIHYUbuPut9f6fX055PAGaAeODnHf8ADPP9c4HOOtIT8wHPrn0yMHrxgAZ78/jVLmurp6O92/JPy/4ZvRlJbq2u/wCWmtmvXXR9dwyAOnYZHHHYA56D8MdT60ZwMFTj3x07Z7fn07k0uM5+gye54PB9MZ9AffsF9B+n0/wo5n+V7vZabNO+t9d/nqHNr5PV99rbp2tbbrda2eogzjgcckAde/4Y78Yx2yKd9eP8aTaccDnqeck+nuRkjn8OlKM4Gf8AP+TmiSdo3+5O7s7Wfm/809mTvq+/9d/v69binnv9R9OPYfQDoKQ9vbp+P9ffr26cUfkOg6/4+9GD6f8A1xjP4frxULm6X6X7dLXa0vqvm+4iNhjBxk5Y8988AK2MgjOc8gYxtOBhhI+dQACeckHpu29BtIHHHXnHI4UvIDc9Bjn5jxjoTzgjg57d+/yuHGSeo7+ox7D26HPbk8VtzJK1nfr1b2em3fXZ9tLlrlW9+a60Wnm9Lataq2+/S1o2YE8oTjGPoSOSewOM8dNvfdgtYoRjacgE8E8c4ycYzwe/TkdBzM3QnJPByMjBOegyOMnqeuc+pFRYABKls7c5PIJzkZwMc9ByOOCuOqTT0vda7Sf93V+q62tfS97ptTjottV362V3btZ3dtdL7MG2hQAMgEnH93De5Bz8vQ54NLwSTjnaT97pk/3R7Dv7kZyRQASxOMA84A5HIyCACDjv24OM4qXGD1yQCOwB5yTx7nrz2o5rW6NK+vy01tf/AIGzBuyWt3a9n9m7jvsm3rfq09QxjpjJPTHbjJz+X49ewowB07/z/M8dPSl/D/Pv/k/Wjuf59/8AP41k763v2+7o33Wl/wAbMzu/y/DYKQn247+mP84/PPY0tJ37jg/j/UH06fzw1Fu1r779tn569r/8MB07fl6D6Dr04/LOKTIA+UE9vpjA+oP4Z/LNB5B5P6DjkdcHjHPc4x60AggDOOMY+nbnP49+meMU0uqu9k012s9bN6bNaPtqikur1V9eyWnz66W7dVsmRjbtOD6/XHf6/gcAHvSZJBwpHr049scZ49umAc0/2/z/APX/AA/Gjn6/p9T/AJ6DPXpVXutr7P1tZ6p73WnXpvoPm8lfTdvfTXtbRbvs+4gJIxyDjnOfpnn88dO3rSjOOevfFH0/zjr/AJ/nS+vv/wDW/wAP8is2/ls/Pot3ra2q/wCGJb/rr6X7dl+YgGMcg9eMemOvv7Z6EdBig9D+P+e38x9aBnGeP8gZ4PPrj/Gl/wA/5/z2pt+a0etra2t1erd739fUTu+uvp/W/UQn1HXI9hz1PT/Dr9abntgk59uOevt7A8gjBp3cdumc/wAv19evrmgkf59iM/h2Ofei92rK17d0r3/rbVaPrYP6/r/gDSR6MTkjOSBn2HPbPT8hSj1Kn1B5yOADx3z0yOOORxkLlcHB55JH0788Dn1+vrRxjOeOuT7/AP68Crs5R6+ettLx1slt09L76ou700fbbdO23Tp2tZrR6jQR2U4z3z19cdABjqORnGDSk46g/gAevT8c/r3xyVHr3xz17fX8aDn268dfqM8Hp/kjpUaN23WiX4X6X72Vuu3QTevW/S72enfzT6L9Ew4J6csPmB9MgY4OR1yM+5zkYoOMEKBtxzkddxGMgDIwOg4Kk45604ryDgknqB6kjoMewyAcdgScUpJ4XAHBBbAJOT34Ixx254HQmtVfR+T7dbWSt0WtuvnsLmimvVX10T93r8uVLV6patNJePunbzwM5A9D0OfpnocZ6ctI4weRjLc4zgjcBg5yOcDHp0FKOSeMbQT14OSOg9Txu47gZI5oGCOAPXkcfiAR1B9QefepWm1rab2e9l0e6d/Ltsg2trZqz3ta+zvfT10/AaxADcZwOfcZXAGOcDjIAPYnpy3cp4x8pB4HVudpbJOSOFBHA+YnnOakxzwT0OcE4ySB0z049tvzHsSGZPIwOh24bt06YG3BIXvjoO9O733031Se2y63bdmlray7jXbeyu7vfRXS81bRrouqGnbnIQsT0YjPAGMZGMDnB4/hG3qKUspG0qQQT+PPfJBXA4PGOmDnAIx+fOcgc/e556EqOO55+nJzQcEEgkjBBJJyM88DGB1PQ47dzhtpPZPRd99OttXZvS6d9lqNPRaaKW+unw3/AF08+ug48AHbjOACQOuduARkkLu5BHU800gY35XJBGe3LYz1GAOR9DlevMnAO7IzgZXk9jjI4xjjqenBApCpJbBDfLjBOACcYGCAvqcgk8dzT7vXW3zWj+7Vvq39wr3a12abf/gOnlbe+3lqMJJOd2MjHzjgDdjnBUgAAk5JyPTGC4nYOvH8WctnkDjncMdBkEnkZ60KvYAHAyQPuncfl455AAGev3RnBpdoO4gKTjpnHXkcdMZ9PYYPNJWfRNW0/TTy6/57Cs7WXX8bpapvRdm7p30trZTntxjHXnPt1H69MjGcUhbGRjIxg+35ZIwcEEdOT2NKP6/kO3c/049MYpOM9h64POegHHbr/gOayXnrbtv9nz6Lbpfa6BaXuunT1Wu/3W/IadpPK98ZyAeS3Q4LZJHTjJPHuxiGxkDdngtyMMceucjdySeRjqOKl4PPJxzxjJ47A8dCO3fjnIoKgnJz0I4OPTjnj8e3Xr0tS1Wjaava3ovK666d9kUnaUW7pK3TbbZ39L3vpo73GPggDb8xBUt1BAz05B3Dp059MdWZUgkoQMFW3EHblgPr1yTnBA46VNzlgMj5ex455xgjGSQeccjGe1NAODgZbByOepBIJBGD7nPciqTb2W9t3a+z6dP13Qk7W7X0tdNPRNt6pLd31V3ZLdDiMgY46gdPcD7vJ5AzgdG6buA4HjHGeh4HUdef5cA889gGjJJyPu56E9STgHH4g/NgjsVwAp4OemQAcEnJz6fgPf2xjEu92te+jV2vdX6PovVom7dtb9uu4p79j/Kjpj/Of0/T68UH+WP8Ocf19vrRj/P05qXdydvLqruyT0f5W1fYQ0gHHsf/ANefbsaRsH1OCOnXnj/OOc9cUuR7k+nPfn07Z/DjPakO3OOjHuBz/wDW9+enU01f5Kz/ACbsl0s9e9/NoqLs9b2/LVP5J9+t+oucHO1sccdz+voOuM+/TJuGOVIHb3HbjqPY+pHPSlxznJ6dO2cn8/x6H8KBnuMDsOOnv1/T/wDWm2lra7t31slqul9rtO/XzC+3WzTf4LTZt2WvS+vZoz04PbPY9f8APoPf1Pw6f54/z9aPX/P/AOof/X49Vqf6+el/y/zE7dL/ANWv+Xl5iEZx7dscf5A/KlAPqCc85x/L6emfXHqYJHH54zjv/KjGByOPfvjvz9OT2q43drvqrK2yvfm2131f330TE7W16+rVra6/07ai8gZ7dM+uf69jj6fVFAYFsZ4OMjtyCMHoc554x0NIeRg9McH3JOPTjPOOhJOO+XYXDDJO3gD7pzktuYdGx6keuQK0KSSs2+sdFqrJxerV7O71vbla+6cEDn8sc9evGDnP/wCumOzArtBJGD64b5R1AByAOxxgDGRTuv8AnB4/Wpl2hlBHzAt7Dgr904GeeeDyc5zk1MWrK33ad15La+/zJWmtr/8AAs/6/wAroz0Xbz7Dt06cfnx/+vAGwVbr6/iuCPw4HHXGR1zQGzg4I4HU9eOSc5+vrgE59XHJ4H179ARnp7Z/znENtTvfqno910/R9NddgWjV32va35X/AAYdeR09+oyRjjryDk5HHGcUgbJIx068/wBPr/nnFB9AfrnseMEf07Zz35pQMf56+596WnbWy8raL08/w3uw0S136Lttr9zdhRk+x9P/AK/+fz6mc/1/z/jRSDp9PU89O/1/+v1oV27X3tdK6slqmtddNt3p1bELj+ox2/Ht2+mDSYPGDx3HU8Z55/A9/r2oIzx/n3/TPXgdaUDj1/z+XfFVZtrzfTSy0fMul9NXd7peQf1/X9XE6enTv6D/ADyfpnpSckHjIHc5wffA655x74x7JyAM5yeMZBPbODgH1z0HfvkKQeuT0xge5Hcj269hjpzS10762tZ9lpbTybdtNPINtb/rbrt8/n3Hegx+OTyOn6fr+Bo9OMd/859x07UUnOevHcev+f8A9WMnK1t076abJO/rb73qAoJIzgjr+XT/AOtQSAOuM8cnI68enT/OBR/n86RhkY9f06/n/wDX/GqW6tpqr3vptdq60Tvrq29NAW6vt1F/z/n/AOvxRSZ+vXtnt649/X8RwaOenGOMcHtj06c/XjtwapJvtpt0Wurfnpon9+rYf1/XcTGR7c4HI6EjseOOOn4dqXHfAz+v58ml6YA/yKKl3/J2VtI6WaabW/XdW6K6D0vb+v6+QDOOf06Z70hzg4yMA5OOgxyff+Xr6UH27fr7f5780vTp+PbHOD+nP6VGr13d/wBdNOvnvfruHX9f67iZ5xgnvkDjr93OevbpjJ+ooBz2I+v+eR70pPuc46DGfQDnpxnPXjtlQKPyxzkc/n6fj7YORjFb9rq2176cqT7637PbRJ3AQ+xAxjOfQj/OM8c9+aTcMZLYGD1+oHqMegPXp3pT9Ae3+eOlGM8dBgjp0zj/AA7ce9JXvddOVW0t0X427O3luH9b2/r07DCADkEktx075HG4YOD39DnbjFGF5zkc8bs56ngN3H1yQCOR0DuckYxjoQR2GMYzjvnnHb0NKQMYBwB6ccgcE9/f69qpSene1398d7baeX43RSdrPu7X9HFruvK1vv2GHPIAII555BIx93+L6nGM565JpckA5OQd2M8kZbkd8nJI5PBweMEUhPBZQQewAP8AEQASCOQQCSODjnJ607sQeTgj3PTBPQAnB6ggcY68O7vpZJvW1u0Vfrfe6em+qsrN7JdEn2s18Orunpd6a6t7JWTd+ff0wOQB789vr9MgPsQc/mO/rg88c/hxR+vt64/Efz+tAJxgnp1HbPbHTj8PXrg5hJ300enbut+u77aba62gCSc9BwMeoI6Z65HTuemORjCDgAHr0+vv/U0AknPP19T7g+/1H4il6/59OO/4fhzyKLPra6srPe2nyt3aae9wEz0+vOMeuP1x79+M0dTnuOP5f4fnnNGM4xno2FHU9D0OBye+QRz60evbkc/l1479Pp+hdv8AWzWu1ml3dtbfDotdQE79QODt6cdMY9f/AK+OaU9PxH06jnAOf888UmMnnoMc+vQn8OB6c8UpHbp6Y7Y/THt/kF3pqui+XZta+vZ67jW69V202106+T/Nh2wfpzzn/Pej/P8An29f60ZGcd+p+lKORn06+x//AFg0rN9+/XrZ3dvlf8RP0t/XnqFIM859ePp/nr159sUvr/n/AD39f8DJOfr+fv8A5/lyT5fj6en9elwEPGCe5Iz2HpwMdc4HHGep7oxB3ZK8A5yOecegySRgZ69Rk5xR2OCTjnuTwclcd84xzz6d6VhggHH04Pp+R6Y+vuKpNvdvz6rS3e+rSfz8rjVk1vazvp0tfvffR+XWzbTWx0PBOQpJ6gk5AAOSAcDnge9IdoU4IIweepGWx1JBz1Geeee2C4k4OB82QSAe+FxzwCcevTPIIxhpCnIwckYIz8pPBPHHPfO4EK2PTFRfqlZLv/L3trquyvqr3KTd472TV0v5Vy6+V+90vRXIiAOclgfl+YhgPmPOTg9+pPBwcYpRjBOOg4H4nuSOox1yQcZIOKft6gcZIycZIOQwBIAHYHjk8DIxuKlQeCeo4x7fMQQB+fqCB1p82r1VrXfltbta+tl/wwXWl0tbNNX0T5Vbd3Tjd+ltlZCAqQQVC/e5PcElQBt68DtyOOdpBp4xyNpychufvEHBAwR39Rg5z06IGCktjGCcgejYywHQnuMHHJHHd5J49PzyeSM9j3//AFZpN22/Jq7VkkrPXfboraWs3D0+9au63ta3nr53vp3Ebp0GcED3z2z1+gGOnbJyZ+XkZyPTBGfXPOMdVwcH14pfz5z+tFQ2776W+9NJO+z1+/qtNQExwAOMfj69/rz0OOOKO3P0/p/Olx/npRgZ/r/n/PJ9aEmtdvwb22v+DV333Hvf+u39X1+/UQ9OvXnrjjv+mT39c8cHXofb1x/9elwPQUhOATn/AD+FLtbv5eXT/Pf7w7fh/X6bbiYx0HJ6kDpnvz2zjjP8jSgnjIyR16dfzH6fTNA/x/8A1enH60v+fp/n8TzT1bXfzbtrZdOm2u/nqIUemM56e3+f6Unvj/Ht0/8A19qM4598cj/H/PIozj+X8sfrSs+id9/lpZr/AIHr3AKKQHIBFH+f5f56fiO7V1qrr08n17a/igDv7fjn/D07evTu3B5ycg9O/X9fYY604ZPtyfr1/r3+uQaOB+J/M5z0H6nrxz6h623d1btZLRp6Xv6q7722Gna/6Wvo1s76fivzFx0H06f4c00dTjB7dMEex9uBjv8Ahg0ZOPc9P/r54HuM59DS/hjPJ+p69P6fhSV13VtdfVd+l+2t/K4v1X6/8AD1BAOPfr/LpkEc4/HijJ544/U8f5HX37Cl5/X1/X+X9M4pcHHXg+nX+h4/+vxwSJN2WrSS3dumnXtpe22trh/XoNycdDwDnHPfv2549BnA60vP5ev4Z/H6UHPTkf5x/T9KP8/59e1LXr5XWztokvyt99gGydBnIB5A+UAjJUjr+u3B5z0pCAMknnDYHQAY79PUjvgegJIcRnAPIxjk+pB6EEHOOnApu3n1ByD1z6jnH+GOg4wKtSXVtrfrfaOif32tp3KjbS+ybbXde7derSdtVr1FI4IGBnOT1xzyOee5+lLjnP8An+f5+vHoKOMZzwO+c5/PPekByOMent+X9M/Wpu2lfbb8I/fte3e7shWfTa+/rbdr5egHAI9eB68E8/zP69s0A9cqTngAKCRk4JA4yAOoOQOCpwFNKcDnHPc+xx19hjr6Unbvlgepwe3TgkdT3ODwO9Vd21u7a3TaXRWTV7vv6uwnfp+P4/qDZHQfNjOOvUqB0IwCPmOMc8DjOVGcDIOeM9seuf8ADrS5HGMg9T7Z6cDp/wDr9KTk9/rnnn8/z6+1S9Vt8/ktPNL5tbvrc/r8Lf1e78wHHHU//X4/P/HmgHOcjGPX2/8Ar/h7+i/r1/Dr/Sg+2Dnn/PH6cD8MUWfbTdN7a267dLa/dcPktfz/AA9ApCM8HnP/ANbk8jv1x6jpScZBC8nhj3zj9McDtn0ORhSM9/T9Dn/OP1o2a26O9r9t9dNumqd7aBtqv6f9feGRjjGOAMHPPT39vWgdOMfQY5/+v+P4nrQR16YI7dfQ59/w/MUo4wPQd/p/k+/82k7p7PS6SW1la9tF53vta3Y/z6rpp8+/X9RPTAOPXgD8jg8d6Un2z9Mf4gf/AKvzPx7nj/PHP9KO/wDXt/n/ACaV79NXa1rat739b/IP6/r1Dt93nrnPQfoOex9+g7BBOOOPcZz06flz6ducmjJ6Z4HQfh+Pfnt/PJ+R9ASf6dB/nnmnaT3Sir676Ky9Etk+6el7K4f1/Wnr/WwMnsf889vx/I0H68DP+f8AP5c8H+cd6Mc47+nXP+e2OOfpU2dtn92mtvz/AMgEHPfPXpx/XP4g0fiMHJ9+fTtjnPIP5HhAuOwwfqf5+x5+uO3Lqbvd2v389lv2fd9fnq31tt/X4ra/+Y31GQeOAf6//W6emMYX8+Ppz+X+eaXA645GSW9v5cevX+pTbdrO7Vl3te0bv0fr1T7MPTy8tfkIWxg4J5XPuCyg+/8AFjp1/AUE8EgDoemcZJx2ORk9vfHFGcDOT3z244+mRwT/ACzmkYbhgZ6EdvUZ9D/D69jzzRFp2vffV23tZa/PVvzfcE9vXXXS2mnfv0FY8cficZGcgDgEHj1H8RxnNMznIYdeeRnqcHIByTkAfgDTiecAnn+HsM5I+6PUkHkfKM9zgOQPXtj1BPftxjrnuTirbtp06N9drO+qu3d/K701BNaLre99VazW7tb72+ugpwT7jng4xyBzjsT0HQ4xSZHzZHGQvUDjj07cn6Z/Cnc8ZxnB5746Y6njj/IxhO5J6dQPTjn37dM+/Ws7t2vvbXXXdaLReq0fV3bDy+71uv6/pDNoBx7H1529uDz0BwBz2OMClKjHPPB69wCDyQQfbpzyQQRy7GD0/H8z/P6dfakIJ5GScEYz8pHYEZ4IGefTtjALUne6vp839lb/AI6Lfurjv+lt7ea1u12un+Gwy59OCvXnufXP/AfcUp4H6c9OeMnjP4j68dQv/wBb/P4UfQnH5Z9Mj157e9F27bu2213az/S/W1+rJvZp9VtbR9PLyWvR+rG5wxyPvDGcA8Ekbck5H/fJzyC3y5oYkjDAHsM88ZweAM4APHJwOKUfXOen0x7cc88++PSnBm9u+R16/lk/56Zou776aaW8t1pdK12+nk02GzT6r5dvu2XTzE4HOOfX/Pp1/p6oOSTg8cc/56f59aPfn7vA9O/TPXtj69+i/jx/L/Pf19eKV3ra62vZfruu9+ofoJtGc557+/TtzjGPb65pMDnPT06YH4e2Rnjjg5xS+vT/AAz1+nHoRn260uP5fiP8On8qE3rr0Wqsrapbryt0bvoO7XXp+H9f5CcHgYPGB3+owO3T6+1IAeecknjjpz0/HHI9fel6/gf8/wCf/rGl/wA/5/z6etP3lpone9lbpa2nn5b9hXsDA46dQQDnAJ/nkA/y54puOSR3yc9TkEgfdXdxz9M+mCHZIyRycHHTOce/H59Pp0MZyQedrccdTgAdP1xwTjBOAKV3bbe7v1+F3066/dZO9g3+fnb/AIb10/AX5hnIJ7kkAcBuFHQd8AYIxzzgmm9j25zhuvBwce3BB5wM+uMLuJ7ZHY5yTnkdsfjwTyOmDS4479eB69M/0+vFO9vNN+bVtPwettnfRIP6/X+vueonp9Pz9/8APf8AKk4z7/8A6/5/09qOueo4PbJzx749/vD/AAMcEHn1z6/T/OKmzfX81fZu2y0d+z0d/I/r+vT16gT+nbnnrwPf8/60ccepHGeff9PY/wAhhBgYzzzj3B7f/rx1IxgGnUmtmt7aadrbd977d76jemn4909hAD3Ofw/L/Pr3pen+fX/Of14ppOP8B3yeP8njPORjIXGRkcHH1x0z6DnP8s9jS/Ds4pb6bbeXn5bi/ry8/wBBaPbH4549uvHr/XHFHP8An0oByfbPXsfXpzwf/rU0mrNrS991suXa+ivbfq3r5gc5xjsOeec//rx+XBzkhO04wccAH346gjpk8Dqcego57fj/ADOc49O2ecUc4xxkdAOpHqeO3f0HStf66dLfn/mPttra3rpv+t9N7Cljgg9vunABIzjkjBbB52kkYzt+bo7B6qdrY3buD1699wHdepHIPXNNJAy3IwDhRyASxPIPJA788cdB0cPmIBOdwOUOznrgZK46ZJyTz1HQE22tf0v5fl/SKtppeL1vfr8K2fR9m7a30JOgJwBjJ/Xr+P0PU05Se6knBxyePmAPTnB65wRnHBPISpIyR1PXcB2xkqefUdeOT1PoKmLut+ttfLp0vpr1JT7LfR+a6r59X91jNjJcktyRt9cY56c4xx7/AK4EpPTsSOO/Qf57/So4znOeuASPzHbOfYVL/nnt/n3qHfZpaa+WyVv80u+gNt79ttun9MKQZ5ye/wCn+f8A9fouenv0/nSc5OcY7f5/z0/Eyuv9PfoHR7fruv8APp21A9P5/Tv+VAweR36/pjP0+tHfv9O3v2/n9AeTQMcgevI/z/8Aqpp26tbbapXte6f6ddA0t5/h/X9eYvGOvTg+3459O9AxweMcH6/njP079KTnI/X+n8yf84K0Xba11dvS+ivZPr1W628xB19M8Dkdfw7579s56dKCR9Pb+pP4fz6dzjHA7cdRjn0JPbseB9BRntj37Z/zn1/A9ad5Xtpra7vbtZp9Xona/wAg/r/IN3J7Hj0x06dSST3z7560ufYfy/Tp+n5Hmk4GeB39ufXj/wCvSZHcHr0Gfw/w5yPrihNu1umrW+mjvta++q97XqwFzjP09Ox9v8KP8/lR+mOo/wACcZ69h2+tNBznHBHXI+vof64ovKTd2tGm7O/bXqvN/j0ACSOgPfp/n19vU9qdRRj/AB/z/nge1G66XT2VtVZbNddOmv3JB0WnfXuJ/n8P0/8ArGlJA5PFFHXt/wDrB/z+QqADPI/L39vyHp/SjjI9R09eRj+Wf8ijPPT16dPb/Pr1J7hIHbPB9c9/f246c8c1Ubu1k9+tl/Ltra/nfXS/UA+mD/n/AA59+KKQ9COnGB/IUcAc/mSc8c/j/ntTSvbVW7Np6XXk0nf0v23ADnjGPfP+f8+tJ+BwRzzz3OPXPt0PTjGCpPT0zyfT6/546ngcg/MdR6/0BHcdvTjFFnZLrp5dn/4F0XWyemur1X6Pr0e+9/Xo/MWgHB5wev8A9brnnGDR/nP+cf59KOKi19O/n3876fptp0QD8OPX/wCv1+n6UoPvyMYHr/hwD+XHslH4f5/+t/n0qlfSy21367J27p/evIBQcHg4OP8APr6Y/wAmm/j0645/Dp7/AFpQQRwOvOc/px/jnij/AD/jS2tpqnfW1vs20vvf56XYDT1BGM8jJ5/AD17eowfalGOSvX1A7n346AnoeOg60m4cc4yDjt/PngHPTBBz0oAxkDgcnnHp24zxxzyOuRTV/NPS2mmjSV/TTZD6fl566+vay9emq9eRnpz6Afy68fjQMc8Yxx/X+vHoOmKQHPQ4/nkdQcjsMUoIOeuQcd8f56fr+L5W9euj7aWVrbLTr8g9Frpbe621+f8Ala2wYA/z/n1pQce3bPT8vr6j6d6TPJx6H2JOcAgEY7D1+u3mlPX/AOv/AJyPz/rU2d0r27eun3dL9vXQQmfQjPUf5/z+NKDyOmRz/n6de/XnqKNwHUA5wB3/AEHXI49e9GQB29s9vp2pro97/hZx221tpp06hby3/F/1YKaP4j7ZGB0xlj04PB7YHqeM0oIIB9f8/wCff60h6g8j/AevqeccfhQtdNvVdVa6utdfS/S+rH/Wq6rdf1r94v0P+Qeeefy4PHX0X2z19ffnHPp/SmjoSGPoRwScYGecnsMYIxjJGKQ5BznHsehGR9cdcdM+nFHvabKS2dmtdOVPTdaeWu4Wbsr21aV776eXn/mO5/yPrznnqPX8RziloopO+m9/S3RW87/0g/T08vv9P+CwpMjPOCMHI+o9uemTxS5/PrjjOe/f170m1eTwCAccdjk9PqB09aEv66X876fIX9f1/SDcRjBHqM+px0/D9cUuR3OCemf8f/18ntSKwIPA/A5Pbtx/T646hAIBxkdAQM//AFh/L1ql0upPrvt2t52a/BB67fd/n67bdBRj65I6d/0zzxzRk/56f55OOB7UfT/Dimj1JOR1HbOPTpz65Az6Gr1Vm32v6+7/AMHta+q3Glo/K3+X3f8AAFPc+3TPX/P655HSjn6evfB6+v8AnimnPODyeg/r7cdxjGeSTzSgngHOcZ5+uDz/AJ96z2S89vw3W1k9PNrqkDWm63+e35La/UdRkev+T0pAQQT2BHPGeOeMnHsSensaBjkenUf59f1pW8n29Nt9P6/Nd/6t6gWA7jjn9fp7dOe9Lx/n8P8AP4ikwOuBnjnuD/n3NL+v+f8APp9abT899eqvp263v+AO3S/ncT/P4/n7cj/69LnHP/1/0+vbnP6UD6ew7AdP8/jTD8oYnkH2GRz7nGB78de5FFtt9bL12fbRdt7jWr/r8P8Agik8kADcSAxJUZBx7gnGc46enem4HJyDjcD06A4zyc7u/Q9ewFRliSecYyRg85B+8Rg7gCMDnkEAAZOHf3gRnG4YycYJXsF+Xqcc/iU2kaWaVm3rq2tX9lbt7dXpps3sjRx0Wt9trbe6rp3326K13d95c/1/nj3/AP19cU0gfNgAg/eAznPbp06deTn26KSB7kZ4GMnB7fTHXOO9BwSxA4PBHB68cg8dBwMcZORWauu+q09br8dOmqdtntCXVKXT9N7dL7a9UKQvVsDORkjseoHfv0Hc56nNJlR0I4BOcYO0nkknn6gnPXjtSnBBzk47BQSM/XvxxnjHXjkmAcdMDjGPXn8PpxnOaPW/bstlbfv1+T8ifx2/4bR/15Bkc/rx+eT69ODyKUe3b+n+GP8ACkJAIyDg8Z9f1Jz6cYyOnBpeM8D68dfX+fr1yRjoBRaa++6T201217adb30Qffr/AE7Bn/D+v9fyPpR/Ie3r0z/h/wDXyZBPH4+nr1/Hjk+tJyfYfqeh79PT/DFNxb7Wtu3dWSXW34+vzPw9f6/IX0/X/Of8aQ+/T09fb/PfHPqgzk5zx7k549Tgdx+PPTFL0H09fbvU9Vv09dUrd9h2s9PJ/ergBgfnx+uP16nrRkAZPAPP0/D1/rSjPsOn49z+H6k9ulOGDgEA9M/T0x6559c8Djir5G7Xu9de3Tr52fn62bDd69d9v+G/yG7s9xx9OM/T1pcgc/nnp/P8+31FJx6D39/rSjHX68c/h7/559alXbWut++22va9vXzWghuRzz+f1xn+ncdefRwwPX+X+fr29D3Tg8kentnHHbPPfnp6ZxgJ5x/nt1IAH5/1rS2t3rZadr97dH9/y0D7/P8AD7v18hCM5/PA4z7dOB9KB0GP1z/Xn/CjORnn/Pt7035s9eD3xyOPT044HXnnnis0mt9OqTutra/dfbXQfle3k77/APDX89Ldh3cjPoccevPvj+XY+h/XP+fy/l24FNB4B656npjH5ZA78/zAp3r+nP8AnH60ndW6fcn0+fpfffqDVv6S7dN/vSbWvewOOPqcfXr+v607OOOPX37/AP1/yyOc0nTHoPcYwO3t/ntS8AjAyO45GPYf5/Onrpq007NXs7O23XV32T6fNBkFQc8gnHH65z0Ht7+uaAw7EEnHI9sZGPXOMnnP40cccZ7/AE65H4jvTcqegA/rjp+X0Hr0xVpS913srK6v001+5X3W+19wXOfT14A7/rj0oyTnOeOnB/QY6D2469qQE9xj9f1H+fbjNLn3/p6/oefrSSlzbtbXWmu2vby0bfdPUOvz6df6+YmeOmTzz9PYkcde/pj3QBvY9cfpgdzz+PTrS/5/A9Mg/wCc596OpzntyP8AOPUds01zaaJWv5aXW1vn+DfS77q34Xfz107aejQvseD1IzyMf5x79KTuPxH+fXoaMc57/wBPb/IpevUAEen49z9fTpxmpSaV9ba/dZO66LunfdLTcX9f1/w4EjPHGeg/p7/170ZHH8unT+fHX/JoAH90H09vpijpnjnPQ+v49Me3THAod2r66u7XZJLXXrb0bXSzDT+vXy6f8NYOOn+fX9Mj9PakH+fw/wA8e1OyMDgEj9ffqDnsO3X8E+n+H5Z//V7+i5XpZXuur6WW3z09PxP0Cm5OOQQRjPTntnjPTqaU9eeB098/4ds8Y/EGjHTvgY649vw9yOfrS06632f3ddtn52e40tr7f8N1ul1tvp16Bzk9fbPT/JyD159sUEA/5+n68fpQM4GeD3/zzS/jR+Fu3l6ffcHv29PL+txOMjpnt6/54oPXOfm7Hnt+Pb/D2o9/8/U/l+H40ue+PTjp0/Hqf60K67pvt17fjf8AQQf5P/1vWgEjHP8Agfw59M/h7UdSO/Tr6/8A6/8AIo6eg/z19Oaav0v6X06dv+BbTUAB6/l9P88j2oz/AJ6/56/1pCcf56Zz19vfn19aX/P+f/rUNNW083d+SXay1/8AtulwKT25xjH8hjj/ACPYGg/j3PGO3BHvnOMfyxmjB7nO3j/OOOP69+tKz32s/TXT7na29r+Y0ut7dt+nbzDHp9fbtx689+O5pfb/APV+ZwKbnBxzz06cnP8A9fnoOOKeOPf1B+v+f8MZprpe9t9PlfbXpv0s9L3sPpt/wbK/9dG2N49v8/5NLnHOR9cjHH6dqOvpj9Of5/jmjAx+H+e/4c9qEr/m7WSS69kn29LsQnHXjJHB/M/59aUHjrz3x06Z/HIJx/kUfh/+vqf8n+Zoz/np24/z3x1zmhfO+mzT002t12stUvlcP6/QFPTA98HPUnn0Pp/+qkJOcY49e4x2Pr2GOO+MUo4xknr+Xqe/p3z9elJzzk4649Me/wBP6fXNJt6a30eu3SzXXR769G2nqhr+r/09v0+QY5z/AJx6D09+x+vRfXHX1/Dt/nH600Y5wSevfkenXjGfqenOCaXBPc+3Az39vfH/AOulq3q+2nR6pva6d730u321sH+S3+Xr+PT7gOeDxjsT0PIAAOfTjIyMkdelIG5OOw6npyPX279CPel65AyeDkAHng84x2wTnv3zTWKjjGAARjoMdcds9eoGBnnFFm2nu7LXZv4U3ottfl08zXt+S387p9eum2r1sbgASpUFuDnO3hiVOdwHqTgEYzyoFL15U9iB068cYzjJ7dck9SMUwHOT/dydvtnA4weASTxjvjbmnHG1sYIBKlRgYyfTIAI9iQvpggGmnt6We+mmjVl2u/uBr4b238m09Ek7/Ky9U7D6P8+lIcdemRj+fHB69enNHA/Dj8enas7bee2n9df6Qrduv/A/r9BckEY+nb+vH58Yz3xSkAkc54zwSf5AYOBj/AE03nJ9McdM59v/AK/oKacgdeP4sdST/QZGOQcd+lblxjraWm1nbZ3TXo9dG9L/AHkm0jOcAt3JDfdyeepwTgEnkjj1FOweWBCtzuOA3TOMYIPy7gMkHA7Y3Um4lSPvA9F4wuCR8xXhgfrwBgY4qTGMgnjn0GecnJGPXqMD165Je10+js/LZ/Lpd6bdgbaSvZK6WqW65NNVvto/dfQeBnqcDPX/AB/L179OtBTJC5yDg8c8nByP58c9O/Rvfpxj9ef06dunrTg2x124yACSfbb8vJ+nAA9O4JhPS19dGuvZ6Jbenz7kf0ilHtOSBjOMnBx3x7+uM8+maecnjpnnOOMdPx57exz6FqDBJU7lGOCMYO0ZzjoMnpyRgcnoXnjOeOfXj/P4/nV2V76dt/S+nzV36W0KacWvPVdevpuITjA65IHb8T9B3/8A1Uv/AOvr/n/PFJxyOen489x9PyH8lxjAyTx3zkcA+mMdfcnJ6dQVtL6Ly69NXfRJ30fV36bHJzx07/y/z1/OggDsRz05z19h6jn/APXRx82OgLD6ex5x8ygk4JGARjAyDA5/iAJHfPynOcjgnHPAPv6BL8etu9kNJ81rN2ett91ZRt13s30W1xCR0Pcc+/XpjngemT+dL0I4JGP88n8vw/Gmkr359vfkj8/fgil5JGOmOp7A56cevX+XU0+z29fO2n5BrZLprvpHVLvZXSf5C5HJzx6/59/f6elIMDOO/wCv4/1Hv70EZHHJ545H1/MZ/Hn3oBODxzk46np+pH0/DHNAWenm9rq/ldad9G9+go4/HPP8+/fnjnjNJwMnP1P049Pb9eKM/wCeenft2/wzjNICecgcdcZ/w54/H26VN3bZXulv0f8AVvx2FZ6uztZX9Hbr80HPsR09fz45PBBx09DR0wOMe2R0yenJP9ec+lA/u47fXk+o4zn8CT2xzSknsM/p+tLVtaWd1+Nnd3Wmj1d7vS6sNee2jS+5enfV9H1HAZ657DPOBj256Dt/hRwDnI4wfbtwfp3/AMaQHOSOPX2we2ODyR04/KjIAznnsB34J/l+dWT+P9fMD/MjOMd8c4Hp37+1L2zz37d+31yPpj9KQ+2QM9Byfpn6/p19aKlR1u0vTfdq2m2jvdr1fUAJHAwff069fb356dsZpuVOQOOpJ7ZGOhPHHGBz06cinduhxj7o64B9AOmTkr3AJIFNJGSBjI4HJUY7duenoCODjoTXn/XT/M0V42snHZO7Vre676q19nZ6Wa/l1CPrx05/QnknPHvx60vfrz39/wDORz+FIc55UdSD/PpgD6HPBPQcijJPOAP8jOBzxxxz6dqP6/r8SG3ZLtfta2337/n5i88Ec9M89vUdvc8c0dDtPUdvX/P17ZpB8oBPQ+nQ9z0x6DA69D3p2B2OfXpwcY4/D/PNJ7euna1+uv8Aw9y1f00Sbu1raN0nLZva7VtFawhIBAOefw54/TP5ilPHXnBx0z6jsPr6e1JjODj8+o/DH+eoo6A4JPORnj1474//AF8inZfdt/w/9XItte+j1TlZ300S6ebd13Wlhc8+mMc5459O/wCBzz07UuRx+uff6EHse/btzTeDjnOOfpwce3fjPbnmkxzn0GPpz1/L8/XBpXW112t+SD100+//AIff8g/ix0HbjueTz798dueMGl9Tjrj/ADzg9O2OCe9IW9s8nIwcYHX/ADzx15NBY56DJzjGQPYdOo9+nqM0ynGXa2mzsu27drX318/NinPbr+nUdcfWmktlRwScc49PyGB35468cU7k9B9f07de/GdvOOxoOcehOOOPxx0z0Pf8uwJbLbe2ttLrR9dE7sTvxx79u/68+oPPtTu4H6nH05/p6fWk5479OuOMe+Pw4B7dOtHzZyfpjpj6nvjp+ePQrXyt87/8H8N9tNS2tnaPRO97qy1d9dVt9lra2qHHGfX+v88Hpkc855pB/nv25/HPTpj9aM4/z+H65/Gj8+R/nn/Pt0NJ77+Vl02vdrX9E7NkhgDAHQev49Ov8/X6UhJHPJ9h6+p/z+fZpZugGeP4hjocZz6c8gD0+lLu7E/NnnHcc88g8ds5zkHjHNUVyy3avrd/Oz17J336fcBOM57cg845yOnt3/PikDE8HpxgjPrxn6nqOO/SnE8HgYAIHqDlgvbByPTr0+iZ44HTsCOByRyB3+goGlbdLdLfVaxd12eu793X5MJYA8jj17/QcDv788Z9VBJA6dDk8dfw/wDr/UdKQHI6dRnH485PT6jr1yDQpHHY/l05IBPp2GaW267W9Hb/AIf0sHL05b679UrR6bK+urbWrtYefrn/AOt/nH4elIOBnqPTOT+nzf5644o+XJw2cEHnoB78cjHoffGSaCepGSOMDjp16Y5PPc+3pgvr/Wm2nz/PQm3dffp1X3b7vT52HHkknHQ5yQB747dfQevPU008AjHUYGCDkHIOPQjHfBHJpFwScgZGMdDkgnqMZHPPXp05OKc3Bx14IwOMgMfQ/mV/Uiml01fm/wDPt6/5Ds0+mjstWrfDd3vZXdtW1vsujRuAGTzxjJwOvsDjnjjOSM9SaMgj0BBOeD0I754z+akZBOaQnkYA6E87sKcE9cc4HP8AMDFITgZxjOMkYz0zwe47H169qP6QW1XRt9rW1W12r99NR2MADBHPrkdT09j6Djk9OSADt+vfnP0/x9fdpYj0OT68/Xtx29jjk8071/Hp/kfj70bf8ENbXt3s+1muvla3S1w59R3Gf8984z247dADPfr3Pqef8/zpCM9yOeME8+v+ef5ilAwOv0HHTj8ePwB571GrSVn6arROP3vz09Atf1vf0TtbVrRK9tXZaWF/+tQMZ7/h19v1o9//AK/8qOeoxjjnP+e3+cc0lzaK+umm2mj+/urtpdHe5IH/ADz1Pb6Z6UEr3HXIx0GT0x/h/TNIQeo6jt2J9/8AI+opo3ZyfxGR6Abj35x/P6HTTv8A59P8/wCtCrXvfRrfo+m19FvdX32HE9vXoeo7Yz+PQevoaPw59fp/LqcD9aXPGMDBOPfI9D1zkdM8deKaSRxjIzxjH4fr6cY57YoEl/wV5XW+q+7e9vOyZ5AGDxyc8Z6/icjOeT196fyT2/kM/wAsfj7U0cDp3/H9M+mAOmMDPalxznJHb2+uOhP6VN9tG+2rdtfe6aJPp8tAdunZejemvXz00tbvoHUgDtyevofzHr1+no7tjp7Dp2/LkD/IwUH+P+e3Xv8AU9aXjPt7f5/Cq1stt9f187dvP5i/r+v6+8QgH+fXHTvnqT9Py6YTPXI6HH/1+ccev0peB165/Ajr9f8A61JnOfbgc+/5gE/n6es63Xe2qa0to99r+a1d+i2e/ml/mv8AgLrp6AevX8Mc9xkf/qOfxoJ/DHXJ7dMjpjpj8OCcDKHPPtz14/z344zkEjuDJzwOMA4/UfgD9M5pr5J+6rduy0frrtbfQaXX07a7f531+YDjJznv6Aj/AAGevPB74wDJGehxyc9vxA7fnz24yZ68d8YI+nU5Ix1yfp+IDyQQODn2PQ/n75B9qnrtazV0+iVr6Ppv72/RabHdtLZeV/h/Ty0v6C/59/x/z/PhR+XU59/T15pOeR2xwfQ89P8AP86AMe/Oef6/5FN20tbpu30tr2bt11dt9GK39fd1+eva3mOGPQ49u3f+h+nvijj/AD0wP8fw/Xgxzjoc46/hz7UhyDg/56f5wefy4Sv2t72u22m+1356v7xB/n/P+fzNJkAf/rzjp+PXmgnH8gPU9h/9f86Dn0BP9cdeD+oPXv1NUltf5ea6699um7W9taSd/mt/VeTS366W87DSSCeQcj5ep/l65/lS54HYngZyeewPvj/JpM84wOM/gAeD9R6Yxz1GDhSeThcjOOTjtkfjyOQfxzijor+W2i20+T6d7opR0Tce+mmqVu+i+d7tu1mBYjt+BxxnPOenb6/oKOTg9ifXnGMD09c9cj68UvORwOfTqP8AHPHSgfTB5B9v5Hvn+dJ6231a/O+vb1X32Js+1rpfNO1vlf8APV7C/wCf8/5H9KTHX0Pb8/y69vSjvz07YznPv2P1/Q0DB78g4P8Ajx/h9M9s1dJJLttfbTtpps7a6Neok107X3XVfdutXp21sIeDx0yDz1OeDn35Ht74pWwOe+OMYOeMZx0JH5+tOfGcgdjgAglQTgYPK84zyQeCOuaQjggjcRxwSvcnGSvOecgHI6Z5FbepXLZJve+tnd2du+mzvd6O9tNG28AYx7kDr264Pv3/AKUZ6DHbtzjGcjI5JHTPv9BS474x7gZ5IPX8jjuc9eSKTnP3Rj+fPPp3+nQ85wRNm7NWs7N3bv02WqutOmvboJR26rq7pbpPS7W2+vTfa4o5HHpzwe/48fn0xjsab1IzjODx2x05+pIxx7HNLycHpjqPx59P/wBROMjqpOOcflyfT0+nf27U7dvw67adu3n2e4ttFa/Tq9bK17Jd9V8n3aQT3Ax1x6k/z5B6cnnjjDgDj/DtnP8An360DPGeT6//AFjjHXsM8c+lKP8AP1x/+r/OMxdyt2Xy1XLd+XqrNL0s0307XfRb2v267dbegc/w8HB+nHPb6fhxQMnrknp9e3+Rz9fUHrnI9M/jx9c+/Qe1J/n+f+frVJNaenztbWzfrd+nUQuMe2O3Sj9ODz2/yf8A9ZFIMDvu6DPT8Oh5AyefxxnFOJPTAxjjnp6Djr175PXoTTtt638nqn5323dru+2jKt7yTd1dXet9bX3Xnu9GNBJGewyT64Hc4HboemDnHumcHJ4469BjPQ89TnuPXHekJJOB1BJ25IbHHXIwR6/yUnFP+bkgA4OCvPTk5HGGwO6gY6dcYdv669Pnrp6hbZW1bs0+ivG3pvZvztYaTkZ/Htk+nPTnPUHP1JNKCT6H07Drzzz1x6cevQ0pOdxA4AJxz78YxjHXnjODQMgDgHBHyk87cE+hz9fTIHQUD5dEre8312s+Wy8tXvdaPW2wg6Yx6f56AfpS8HA7+3XPOPTGfr0z7imnAGM4ABPHX6/T/PTgqAMA9xxz/n65578d6Tvt001vrv576a+dmnuR6X3/AK+f5DsDOf1IPPtx/n36En1/yO38/X64xTcgfLkk++Px79fw5HNH+e+P88/5xSSulpZrpbo7X0f3N3e/fQP6+Qv04/XP+fw6fgQnHX8/8f8APrnpwnOe3t+Ge2OT6/8A1uUzz09s/wCc9D1yQOuM0Xeitbo1bSytdb7P79LWvqnbr0/rT1/rYCcnB7YOQCB26/qfbHOTkUEnsf6diQfXHY46/QEE5z90Z7n2+uO3f6cD0AT6D9QDz24/z9Dmnpv6W+en6j2Sat960el9++j8vRO5nOcEemOfXrkcjjqemf1XJyF65zjr/LJyfy/Gkwc9umD1/oeOfrjsT0p2MAfy/HHPQev+FK7va3be3ZX0d07Xt2203QNrRbt2SfbRWu9ErWtqra9HYTpyenvjA/H8v0pxwwPvz14JB/yfrkDqKT8j7H/P9e/FGB06D+We4/nT10/F306X+TV/n95P5ikgA4GeMDseMDjJPU4z1J5x3pp4x1yfU8DrnPXH+cAjmg/JnJPT39AOSQMZ75pT+nPB5IA5BPTp34HOemKOmm11a1ttL+mjZST0fLdX3s9Vp5XW9rrvZBkDsTkcex6ZOccfgffrmkz/AD+v5+h/lx64pOR/CNoyPw/XjA6ex+lNzkgL6n2B/EHn8v8ACn/X3A4tPTX1+VtNbbrWzjZt92n7jwMj1HQ5x04/EnqR3IyaQHO4Ef19M9OvoR7jvS56DHPceg457/l/9egnAzjOeo5yO3uP1x+Jpavyd15aK1/XtfZsdm3qrN7dFrZWsrWTT66dVruL0/P36E9+M5659yfaj/PT6f5z0Hek5wMcEkZxkZ5+mfQnNLnOeme4/H6t29T+Oai17NLZ36/Dpq0/lqnrfa6FZdnZvqkrarrrbfd6arQd7tgZxz26855yO/frkD2T5T17enPP6cg56fQetIQMew5+nGPQ9P8APpRxgYPqO4x2OQCOe/sTWlr797+gu3e/e3a1uz31f5piDIzk8ds/ifQdv84obHXqR09vfGfUdR29qU/mAQef169MZ689wMdaPpz/AE4Hv39e2R2pNPSy7OX4dU/626avXS6ej1Stpt2vZvut+ghwfU4PYHj/APVn6jJxilAAzjuc/wD1vp9aQ7gM4BPt6fhk9/TjnjIIpcEc45IGR/8ArOMc9B69aSTa1StdK342a0+/Z7pdCknZLXVrTotV/nrzaK2i1uwkA4PcZznjtwf8Mj3zmj5iTjHAxyOuSSD7EYXJ7Z4PYKeRyDg5wMjKgHv044z+ORnpR3IH8PHrnODnI64XPIzz1qkklZX+b8kv6/q562umk+Zu1tPV9k9Glo4sTONxHOQchjngZBx0OSc9cEjkg4qbIUYw2OoBbPTnGc5x0/DpzzTM/e4zwcru6HJ7YwQRn0z1IwOHjA75PPBwQMliOcYbjJzwD3+UgkfRdvxtv113313W+gK7et90rN6p2VtrLsuZ6Wad76jx/P8Az+H19M0vCyIw4+UcZPqDxz0xxjsOmKaMAsO/B59Onp29ye/U9HNgspxwF6HrxjpxnHJGeh65qFtHtdX0Svs013t9712tpHq7X8k3b3Xr5W2t57dK6KrAltvQfoCRg5OAx4znnsBwKewJ3qVCqMbSVGeckle/U7R6gEHnimQAjf6Z45GTgEdu3IBxkHHtxNnI9Bz39cDj69vwqnp6dPJe7fRPy69FtYabT1urNfLb4V0ejeyjay33j2gbiRzjg8HjcSRt5454Oc+p4ApCCAWIAzuBJwcgnHZjjOD14BwMYwamxx/n/DHH+c0h9Dz9cY6j047cevHSoUtVd31637rWzaVvXZvZaXE9dk72v9yWitZ7dXa9rIjwAQccEkHJyThQMBfvZ4wMDjGPQUwg4OFxnoSQeg7YI56ZDZ4xwCamOOBznnAHU8HI9+OOvfOeQaCCQxIHfpjuc55A6Hqfx64NWn/wdu2t+i0t/lZBFrTbfR6Ky5lr5tWaab0vdbDGTGcjLZJwecHccDJAIIxn2xyaGGenUZzt+bOCQQec9R2HUZ5w2XnJ9iTjIPoCQf556dfxIdpUgkkHvkjr2zjAB6EY46+opXvyvps7W303v03/AAGna1r6Pt3UdH0a0dra331I2Crk5wTkbjggckDI/h5wBgDk8DnJRhwGGAOcE9OOBkrjGfUjJOCQKkyMc5wcjA2g8ZJOVB4IGMgjOecNTTgA4OVAGAMg/wB45J446ZPPXceQaae+61W/fTTyvo7q/Xa9xwb0a16a2as+Xbz9fdV1tuRhTxngZP3iD/eByCMgE9CBgD0zmlI28dRgjPUc5A+UhSBkEADJJ5weTT8hgWB4AyACRzuPB52k+4IPHU5BpuCdygbmGAM5GS2TyD944ORgk5J+XLGldW136pvS3u/LS+t9XsNL3ruOul7+6k/du9bW3633TXkgznHfB/Hg9u3QjvyOvYIM8luR0AXk57EjqMZGRzkc8ipDtAJySAeQCc9TjgDHIA4LHjk8EU0jjkcY+Xgrng4yRnrz7cYY5AzSt6Xdte/lfT7nbzJS20e9tbp7xa5X0k7vTotb6oQgjuAM9evT24H059enWg+/HcdD+I6+uD6c08Y2tlmJAHByvU55yDnscZGAAOtMKn5sjOBgfw5xnPTPXkgZA4ORnNGnR9NL7taet9w5bWWzvaz6/C767aPRN8rV7dAYHOQDjPHOOOe3rkY9M8ZIBpoIIyeMdfqPTv3x+nPd4U7SASB0AOQR1IyNrE5ODj+6OuRS4AYjG7Ixn5gSRyM8cnGSMk9DnpRvoFk9LN+V2rK63f2b8zu9EntoNOMnGDknOWB4HGR0xkgjaM/NweeoRtySDyDnlSRknOAOgz3OcHHYczcAHPTJJA4AOQ2SCMAdccjjp96k2DBGScjIzgBmJPQdTgE85IIyTjgCea9uifXpp0durt37XvdopWTWlk3rfb7N15a6N6JXStppERgE8AEE5Jz0B/u854A4HY8ZIwuCARjpuAOB0ycHA9PX8DxT+CCAc9RjOOdxI4IJ/HOGX5sbeoRyeck7uOFJyeeTjpyQf4jyOcknN8tLvutvwaevl21BNWtbrfW1re7a61V2t201tvZJR7e5O0KDjJyGwSOAMkHP3eMk89ejuvQgfKxI4JI5AxnDAE8H5cjvxk07BGc4wvQKeRyQM9c4yCOQAPmxxwFT8w6nnGP9onknJDdSQd3zdwOaaWkb7pW/K/r0/AlNXV1vbVpcquo3b6dd9Uui0dmMc4YDBUHk456jryM4754IJzxikZQT16Z5HHQkdhxkjHrnuO0rgEFsEkcHt/ER065yRnPUfNnnIYRnOcnAwOCM5yc/dOepzkjO09+aLr+k93b/AD019fJxundKzv8AOy5dF1V7u6futSfm1GcZzjnpyfvHP06jHH55x0X3IOcYPTpnrnjIJx1xzwB6hI4yckAYGDgHLDrg/wAWfXIx0oIHI3HIyFPHXk9Rk4yfToOw5p/1/X+Wn5islZtLpvfW1rW84t6/g7bBOO3Ax/P6/oOePcUgwfmxz36/kfU/h6e1OypBJODjgAkdck8MPTA+YZwcHvheMDPIA6dMY5yeOxyc5znJajv5f8D+ugapR03emu6ajoul3e7vouyYdCABzkjsRj5snjrkgD8SfQUDJyQu0jPBHJwSMgdQBweo9uNwpcYBPzMCSxUAcBW+XopAB7Zz0PUhcI3BbOQMn5sjsMgnjrnKk9Dhs8gYNPS2mvXWL07/AKNX12GklZ6KWztdN2Ub6bN29W7K26EPAB4OT0HBHOP6+3ftyQcjrt7nIPt1HfoP/wBQFGRghjxggdRzznIwD7k4GO/YBByTnPBOF5BwMHJO3nHPPr6AqaV/k+z+V/Xffa5KSSXV63eytzKyV+qW/TV7LQO/r+vORjj8/wAvalOe/Tj0JyOnrgdj3HpwMoCeecYXaCMADkkk8YY5Oc9R3waUYHAw5wVJyRjk46jkckjBIC5JzzTXXReen4/p8yuVqVlF72u/hdrPW/49JXVkIcZPBww5yRwORwMgAnOOO44OQAXEiPcdp5DHd1xglR+A6A9zkH1J8pJXJwykY6+vJGCSACMEkc9ueHHaCQQcEYzkYPfaDggHPbGOo+91LPte/l0uk/XV/khq+nNzJatpX1TcVaz30Set9PXWM/KTxkkHG4Kc84IxjCgd8/hjugDD5s88DHfHOc5A9e/bjJ5p5PJ4BZf5fMehVic9e3GN3JxSZHOOevQ9h0PTp1zj05xij9fO/b5/hbcb0vez0Sb3Uo+5ZLorro21vZpWEJx6ZPXn/PpgevtQME5Ppjp0BGCMZxnqCev5UE7i3HA7emfu/hzggD9DTiRwvBwuF257EtycdMn0GBwc80EpWtdNXfa+6jdWfaL1Tutb3EHLHGS3OWA4OcjHA+g6/wD1jJPGCB6nkdfTgjHC9c4xjdyaCSOACcnnGMnJJ7474644x3wQuAAQxJ64ycHHXovzHrnB4Hf2NtH5eb1trp/XoPl62TS2+F7JWaumu+9lvbuIRtOD78kgk4ycAY4PbOOSduOoAQoxnAODg4B5+hHyg9uOOKOGJb0yAMjcOT1/vDvk4AGSAT0VtpJJJYA8jv1YgncOmeSeo79MUWtun/Xnr+oraWae+vTotr3adnb3m072VxOM+nU5J54yCWHbIHG48nvSDOSMYAGR0PGewGMAsQORxk5PQ0p2hchsjBBHJIOeBnuMZLLySN3TApeORgfLkbc44ycZHGc9cfifUgWWzV3az3srcuzs7Su7XfutNWkloJtGcnGW468cHOQBkjG0DI46+oo78ZwAc5IPUkdQc9x65zjoKccDhenJXPHA5PYjkheDkHnB3CgAHC+gAGOD3JPbIyCMZGOhAo7aPtv0svN9rdfLQe34aPdp8t3fbsnzXS6WEPHB4/ye/wDPt69OG45BzwByOv4+xH15zTyFIbgN6c/dOCcdM/8AAh2HvURyQRj8jzjng9eCPryMnigFG7SSe6Tbs2vhWn39dP5RwxyOoOemB1+ntj60p68dME5APYfn/Mnv3IMcAjp/dHHT5ueeVweQPmyBntlWOAeSOSAACSc8jtjpkjceaP8Ahvv/AKQoqy2bdrLm/wC3Vdppq9rN7qztbsjAEEYwSD95gegIOTjrkbfQAkDHFNyATwdwyvr2I9SQNowCc845OTUhb5STwBngZHrjI2n0yWBwefl4BKkKQQe5OGxjB5IPcnJG3sBjOMng/P8A4a1v6sVHSza0Ts16cl/X3dGne+8e4x9ozgcKeOTnrjp7A49Dzz3pAeMnj1z+HH58dOT7YpcA+oyAOmAeW6Z9Gx97PAPOeKXaVDBuQAVUdCcEnJADFh0HHA27TgjkJSSt2v3te/Lqktne71/OLsm3a2cYJ6AjryQcYHQ45z1/HFBBGeAO5B7cgdeoIxznJwTnjBAfu9Pu8D2GCeB0wDknnPHGOpVie2MY6nCDGCQTkjg/eBHXHIA+ai+v3/LbT8SrarRa+70V0lG+7a7W5mm20009EAYzkYByAc5BA6HpknPcfjkAimk5ycDr6478+/BH0x37UoUAZPPIGCcY5LKPcE98nv6g0HAOCD3UYJ7ZPJx6d+DwMnOMn9dv+CRbVbvVaK6enLdrs+7fdNAPyyec9vpjP4/48EwMgHrg/e55GemTn/A5PXqoIwSBkAEBc8jk54wO43AfjwTkq2Pm6HHQdAAWJGflIIwD3A6+1G2l/k/lvfz7jj3s9rNJd+VX1V1a6unfrsMJyQOnXBboRjkZx1GCoHzAnOMHbSlVQ5A4wQQeeR8u7gccng9m4FLlcFQfl6hQefvEA4wcgnP/AAHOe1K23qRllHGc8jJJPAGcc5zhuD8oNHXr2f5/8D16FbW91tPo09V7muul7adVF7aapnTnnBJx05xuXPQE8gE9PyzhPU4wOpGOc+vH69xgdM0/OV+bO0E4AJLAbmIyB/QnPr6q2VBGdxHHJ7nJycg5J5/rg80eu3/Daf15E2t5N6NJp6e615dbPm66rsR4GOB1BHGOh/IdhThjjGRx75Hp/nnH6UDvntkjGQeh45+929Tk45+WgDBJ5OAcAjAwSxyAxIPXgj8ccUabaaW/S3zJ5Xs9tG/mlv0Ts1vbfVigMA27ng7exyGwSQTkNzgA5GPXgl2AASfvZbPCkHJIHfI6cHHXjjHK5yCeu4H5SQO55wAwPADD8cg0h3AFs5UjHGAfvFuvGVIHBxg7STznA3ttdPvf+Xo9Nv00el3qldpLWzW70tey2101as3a1uqMFXPp0BPPOQOBgtjpg+vfg0zcMZAJxkdvfkeo9uCTmn5BBOflHOO+SSe+Cc/UDA3HAUks9cA5UMMAkZHLcg/ex165xnIBxk9fLo/lsn6/0hqOj0u9NW7K3utvyavaXRX06AMgsScLg4yep5GFOAMZ+XsM9D1wnTOc45I/DkAn37k9Tnr3fhWGWxgDIwT6n73BB7EjKg4LetGMcYGNvAyQe46chskZGWI7nA24PX5/cn27PcdvLW7XbRKK0k7a7b6XfupXs2+oYcYOTkYPXOM/mOV4HGDShQvQdckk/NkHIJ6ggbvu56HPUYFKSCSCPlYHkHGApOSQQO+QDg8DJ52mnYPzLgEDODkA8AtnAGDyCDtwf7wzile26t18+jfTre3ftuJq1nJdnq9HdRV43XKmr2s9r7JDMDoeM5HPHQewH0JGAD6YNIAOPbjr14xk84zj9Mfg4jgDOQMheMEfMeuMjBxkjgd/u803aMMOwOBycnk9cgk5IySCO+OKYJNW0W6untra/wA9tHdN2cSTI2lWH3s5YkEYGTyAFJyQCD/CfujrQxGPZuQW5JIPJxwRkjAbHA69TlN2FIPIyRgZyME9sEkjkljgn05GXMRtIJ6cKCAvJJIwcYYk8jHy8fMQcUuyet/P/D6LTdvTpZC10Wt7xWn/AG7tdaNaJ30/l6ER53ZHAAPrn1x/T+fSkVhwT0wM8+vtnrnP0GOo4EhAA5Oc9uVK7iduSVG75QG4wcdQOtNOCMHDAfKOoPfBPHfn8uvOKfpa2n6XtbS9lo3p+A2rJW6SV1d2vaN2k9E+uujvp2GgjJGDkfr/AE79e+aU9j174Az27Ht1/HoPcCqN3PGRtGfukbguMgcZz65znnoFyTuxg7RgYYA4+8SQRyBnIPPPBwCKASW+trpNN2a+Gz/RpqzV0tHomQABjBOMf4encf8A16Dk549PTn147f5xS9vU4JK7uh3EgZ5JHcHjgc4OCXZ65+YICv3gPU/RgM5BBzgc47H5frpb+vQSja109H1a8no9F1Wj3T3uN4HGehwfwP04GO57c5pSOmDxjP19OnTng+vrjqc4OScEHgc4AORkBduO+MnkN0xilwQGycABscgcLyBgDk5+i8n0WjfYLJ20Xna/93utGr2fM7Ppum0xg4ORnPJxjjqOBkYYbc+ueoBw3OM9Tg8d+OQePrnAxkHOccEOOF+UsQvUAHaxJLHGeTk4O0jGAOhZhhzbenO7uOB1OTxyPlKnJGVzuYgcEq+3n87ba+mu6fQtK1m43Ts1fZRXJq733Wj0t23bTMkEnkbgRliSMjI6AYGW4JIUD1wCaDnnB2naRwQcEkjBAPAxhV445B56vO0AncRjovTBJJzwDn1JJHBz6ZUkHcuQx4yMbRlskHPAbt049Rmhfhp11tp39dO913FfRLRq66N3slpqkuqvdWu7rcawyckYzuAyQwx909FBGcY5OepHU00jjd2HAI6dcYOSDgc4z9B1zTznDA4ZRxhTzyWAyMNuBU5JH8JJIwd1J2PAPBBX7vGSd3GMjuCCCecjkZL6201TT/B9fXz067iWltL2vffSOl7OWt3ez5tOzadhpADH1xgEZIIBI9Pmwf4sdye5puTzkEdgew9Tz19QcDuOSaeQcE4HIbgHJHXGDjJBxk49PbIXjO0kZ5AwQp43HPzA5yc9uT15Oaf6biS5XrG+3/tuy6vXrdO+nYjAYHkgg8+/Pf8APj8O3Ipc8kZ5H8u3X2x9O2OKCe2Oemew9Mn39P8A6xpCVBAAJbGM8enbOSOp5Of5gG99PX+u2thO7u7W0XlqrLq/Pp+SYuQT15PrnP8AjRwM8jPPAwecHJHYn/I70pC9+3Axk49AOMc89OvbBxSHaRwxG3hWxkD7xBzgfebqQRggnvwDSv0l81dJtq2lt9r3SvsrvQB7gjnkHvyemRxycevHPXFAweQBk45JHPTPX6Ywf580DPRvUj0yAD/s9c8fhgnPAUqQMcHH3ckeuRnBJ49+nCnoaPw7efTT56eo0rN3ave/NZ2ktNls77u+35J379/19+3TsRzigcZHpx17cHHvj29j2pTwM9h36c//AKyME+v4UcHp3HPH15HfJGOc5X0oIt0en3+X5J/jbdoPU9v178/T/OaMg9+3YAjA/EYJ9fr6YKZ3A857c5HrxnHT9eRSEjBxxt4HYjnPPByMZJxjgDiiz/DX8Nf67hyt2Vt3bXbolf79W9/vFJBLAnkDHJBBAPp2PGM4wfm5GRgIPqACMg8nGDjGOTzz1LYA5NPbGSQRzngEZ4LYyAM7R9BjOR6UnBycDAzg46gMxGMDHJ+hJx1NLt0Vtvut1/LT8C1FdrcqS8r6aJbJvpe6auxhOCAcAk4w3fJAzxnseMj3GSAKXGeenbPBzwORwPTnHGRznNKcdG47em4jJA568kfTH1pB1IPJzzyAMcnJyT+PzdB0ANMpKyTtZ9rJNp8i1vpbVp827d1u+VSCO2OM8lTznvxk9gD7EjGKB3KnBwc8Ek/QEjHQ8kZHc05mHJ5OVP3SScjOC3qRgZLD9KGAJycHj5TyuSCT/d5wQSCAVJHIFHTUS0eq3tdJK3TRXve2+rto9HYQjZuBPUNnODwCSThQQD0GB3+UZ7DDGMcHBAztOev3gOR3AIxgnkejsgYY8cEbQxyQckjAAJDcgY7A8+rjg556j5RwB/E2SxxnjOMk9OeckLRvbfXXpa1vJvz6d+021Ts+vkr3itE1a/8ANfZ7DG43YyGGeODxk9iMLnsOFz2AOabtAyQNoILdMDGT27An5eckdTk1ISpDHGepOBtPrwApyRg4GMZAODwS1gPm4ADD5Rz33YBORnJyBzj+Iknkilsuve/XTby1ve+w1bazTuvV6w0SvrfV62W9rIacfT3/AB/Tr0JPekAOB1JHoRyO/ftjvgnB7HlSPvZ6DgduCTkkEEEgn0AAyc7hSnad2CVYfKAQQduSecjHG47ueO564NHbvdaPdXaT9Gk+und92l8N1e9r6XVlyq91ronrdWvezvsYB6jbnJGcHGOxwBg5BU+2cDsHNgjJwMKQc4PAJxwuSOeFPr0Y0DaVLBs7SSVHOeTg85XbwSSSevPXhBtbcN25T82OmOp4JznnoBwOScMBl/167f8ADdenoKMdVfaPW17Xa0b01dt27PpqGMsw5yRwxYHoWzx1B4x904A2jB4pWzgjoOc/KrcnOOOqkcgZDY6HvuUY2k7iQATw2OuSc8Z+Y85B7c/wmkKnnJOMjjIGe/J29+mcEdickUk9ruz0umtnpr53vt069Ek9/La27+ytLt62smnotbdkEglxt5ZSM5zz0wCM4yQRg9CdvO6lCk/dG3GRg8g5zx1xxyM/e7YIzlN2NxIyB07MSGLDcGORnBxu9WznOQ75iMgg56enzYxj8AT05561MnayuterSae1m0/u1Xql0He0Vf8AHT7PS/Td3SutlceMfMOgI56465OePfqDn8KGIDx8EqVJyCQeSvUAnqOec44HIzgHIPbIHr6jt/Pg56YPFKw5GMgAYwffn+uOpxgjg01tHyX+Vuz667rdMWnKt1q7636JOy0/F21t2IkAO4dDjBPBXuvQYzjI5xznPB6vIxxjPqM8+vfrnvz3qMEogIAwQPmDBgVBByPlzkjAGOOpGeQJtr4GQeRk9P8APJ/r6UPVdU7dna7S12utXo9Gtd7MOid19/ZRs9Out/LW3VDQcjkY9v8AIFHv+H5n/wCsP/rUoDEdCM8Zwfz4AP6D27UuCowR+J6nHv8A4dfpipUX5723tZO2tl1762Vtb2sJ77dtF5/eJ7+n+f6f40fj/T6+vH40hyDnBOBwMNj68Dn27UuWKBgp4z2OD7dM5yOuMfXOapJLa+u+nXTWz23vt08hfj/V393UPTjj09fr6d+mfY9qQ/hgnGDz+vGcjtjqfSlAJ7E+uM9/wyOPy5z0phfBI2vkAZG1xzznHyD0/kRSa2s9UrPTo7b389dd9V3KSluk/uvbVa+WttfkKD1XGcD2wQOMdvXGMY45NNMYxxhT0yM9AeO45wBnt654pGY54RjkZ+6xO0dRgLn6joOT7l6knOQRyB3HXjv0/wB7p0z2pNPpzdHr0V1q/O/Ruyv0Fr00vbrdO3fp52e1x2R/ifp/h/POaTGB9BnPuBjP/wBamu5U4KsepPDE8Zz0B6dSee9NDnA+Rhx0w3/xPakk2tbpt9UraW3/ADtq299h20Ta1Vr3tb7Nkr7vVbp3T20ZJz6f0H9T+nbtQRn2wCOg7/4elIm4gkKcLk9Dx1POR7fzwD3fg8cHn2Ppx/8Aq9MnnGKVmndRemu3/DpW9W1u+lkk09rNWeu62er20TT26+aGdeccH9eO/b09cD604ADjp/n/AD7mo3LA7cH3wrZ69+AQO/bGM544edwQNsJ6ZPI4Oc9u+OvTIqktr9NdFaz93e6ttq/R38zlatd3vvrslZLXZXTW2iv6i9yPT/P+ffP1o/P9P88/060xgRkhCQeM4PGefXPTAAPTNKwYHhWJPJAU4POGJ+VsAY4weOcAc1Sjs1e1t9LX0V9dL9d9lfVXK5bq997J6baRd3r3vfta9rOyMg5JwQM/pn145z29cc0vUZ5H/wBcd/f/AApmW3bdhGOvBOScnHA9+e3Oc/KwLgWOSFYbM5AB69RkkenHbkZIPabJO6vpbo79NFdJXe99/Le6ezduyvfa3L1Wmv8AVrCnjA4x0OfToPX9aMdOmevPze2Dn6c9M9D8uBQpYjO1iM9h+PU8cgfp9KaGO0/KQQxDcNt3YJHb8OQPmJGeaVm3Zczu02rJX2vptdPTz07i1Wmu+q3XdX6JavV6Xdt3qoAGR2x36d+vOD7jjrQQSMYOOSG4wpOTnqDnPp24zilUMR0IIPzcHk8jngduRke2BikYkKTtY46gAlhnGOADjBOM8jpzzmhcze0r9NL3bsn27eltO4KTbSvdvVXs9Lp6X31tptt3AgnOAfX19ck+gA6k8Y4oI+8R1x1IBAwDwB1Ge+OuRnjNMV5CcbNu084DZC8nJDLz6HGcd2ODmQhsrlSMnjAJPIx3Xg9Rxn0x1wcslZ209L9nrZX3a03vfzY1fTbo9dbrSye99lZdr9CFgAQoGc8HuFGCB2yCcce54IFKU25AztGcHjkgZ9TwTwSenPQ8U/DEEgE4yeASQeeo2Z4GRzjp1zk0uGAxsJyDjOeOueNvXnHQjpxVpysvd6Ld+l7/AH9LvR6aMpPSPuqys2m7Ntcr72T10fXW97EJU52lck5wQAw43EZwMnP4kLkjnOAggYAPCnkZIwcnpywH8OeccDIqQbifud+RjGBk442k8DjqOnJFGXKnCE54wQRk4zk4T/a/n3JovJ20076dbX3a2V1q+t9Bro+RW0vZrRvlV1fZ7eWqbsIvccjO7OTlflLAAAEkEnAxjAORnAzSk4JXtg88EY7jnnk8D0IByCPmPnAPykEZPT646qvyjuW79xkmkYPtYhWAAbIwcA4YcfLx1POOQufvAmhXum1pdX0faPRW+V3tfsxJNNOVlZrd6O1rfPdbvskla7SGwynjGeevU5ORgE5PPcdzSAdfXBLLgHJxjGOo4Ax39eKAHxjac9fu4HJyeSM4Hfd7Z6in7GxgA/kc4J56JwRnHHy8dMZw9Ur21du66LvrbW+3TvcpKNk2k9Vp015fXX7raa9WgUkZXg9CMZPOAuMnjAHBHBIJAwAKdtBJ55ORjqcEY+uT14xgYGO9PwxzheR1Az6Dr8vGQQcn+QOGNldvyZPXhWGOM9QvPOB69yo4qFzdbpabJb6PW176rfXt6x710rNWs0nq/svXo+m9lbS9lYeAMEY4JJ6d+/vyenHXvjGEwcHjoMdjwfr1545PoW5NN3tnGxup/hbJ9eNpxjIz+uOtOUSfMMEnGccjjtnAOBnGeOOvtTs2rtt6R0VvK+mz+e33E69fx+X3vb5AVyQcjIOcgA5PqTn69Mf4oEUgDbhgcHgkYOV4zk9D1GScnIGcByBmyQhIBz904z3zx2PGfXkcgUmWYZ2kHccDaw53EdSB94eo6mkua9k2k+trdr3XTbTztZ7ju9La69Fo7Wstk+l7bfO5CQCTgttbOM8HK89O3Qfln2CgMQMA8huMckjOOM8cfUgnr6ygMRyOQckgEZ6nB+XGFHc5PTvggIIB+UYGeOCQSc8Dbxz+Wec1V39pPZN3W9/+A9r6vt1pPbRPZdG3e1mle60tsne2y1GhcFl68ccL8vzHv1+705yevoArKDk7eT3AHG4nuTjt8w5z1PSlG7JBUg59G6c8Y2+vfIxxnjgKcqPuk47YP4dATn06VNp3Td9OV/K69HfZq/4WsLW673W9lfayu/ldO9t+rEIOOxJ6nA4H4EEjtjP9RSAAk5XGOM8kH36fj3wOM4GSEtt3hTjJAznqMg5wPbp+PbFObIxkEbuRww4/EE4xxnrzx1yHZ2WjvtovRp9rKyXTr2B32a3slrom0tO2lkku2uujGFRuyO+dzdeNuNuAQfX6ZI5GAHYx0yc9MgHjJbPXPHPf14pGJB+6xGOmG5B/2cdfz/wAWYgbSAAf4SMDBJBJAGO/4e1LWW99FHpLdNb262+9dhNPlV720vZu+trXWmys10at31DzjjI5wcevIyMAjr1B54J4IpSMnnGe3AGe/A+hx+vNOIPPDZAP8J6/iOT7Z+tMHzDdyWXqMEDksD1wRwO+DzjnHJZ6b306PS1mlr5vuo6NNBZ72ta3b1T111vfs+24YG44HOMHOD2x1ySO/PcnIyoppXqASWO9uhPQ8djjj2wee1SYJzxjBGcfnhuOPoCc59+GuGUcA5AwflZuGHIPGSORjn8AM5ack47q1nZK97cqu0lpp+SVtEF3p52Vmk+i66t30uvRLYQKMgjIPzdenJGccHj046npgZoK53Z6jJHBOQcgEY5HfPUjqQFzSsXwp2nkjPyscKepxt4OM4zwPfoXDJwcEcEYx+POAOnIz0GTndReTd7Nq26T0Wivttfa+uvmgV7ppNtO2j7Wfo1ppbVNryuwAkbj1YHgD8Og788Y4OQARzgIUH88cZBI6cEj9AM5J4yaeQ24jZktjkZJxgYzwcdvqOOQDhgLNuBQjGcnBxgZPJI5wRnjI6cHmh8/fzvbpp+t7KyfV6bO70elrK+sU1orq13dp7LXq9NB2AW5IxgggdQOnPTPX7vToc5xQFIDActk4JGQAOvy+p+pHqG4pMvgMsZPJycNnj/gPGDxnqM9KUeZhvkPGCBtOMjqDlTgnjg9R3HALScVu/s9b9n3v/XWwkno9NEm9Y90tVr3V7r1XdNqkkkAkcn+LqCO/t2GO3tSkDdn1GOe2cgH3649+/A4YHJGQpIGTwrH2zjGRg5yOfwzUgJZQcE8cHaec8+mcDoDzgD1qbNb3dktlpuu91dP1T0Wi0EnJP58umm1tL6pu9vvWj6oQCSTySMZOT6gfl1/HnilIAJHRju7A4Jz656E/ljBOCBEXkVguwnpklWBAJI9B3HOSe/OMU8kgKxU9gTg9+/QYz03dBnuM0NS63fV2V10tbp8mu90r3KtJNW97bzWtkk/JpJWejQ7Hbv7fpx3PHfr0pCo6t+JJIwfTnp16Z9PwVQxGdp4HJCn0J/+v36465NRl3IIKksP9kgE++VIPPf8O1FpNp6u1r6b7X7de9rffZJNW1/HXpa7Sdk132tsO2A5x1OAT1JGMY/HjI6H0zTscHbgE55OT3bBOR12nrnGecMOiEMdwUNkZ6A9x6lSB94HgHsT8qmkDMMjY+Tnja44/Ec8g5Pc889k3J23d31Wj2trZJ769L9mP3mrt6Luu/KtW1e3w2/w21Ts0ZSd3B7YIK8ZHOOhx7dcsTjggOIc9CF7Mdo5yQffoBz2OAM8ZVN53AbWPY/K/XByc47deep+oqQKxOADnr0PI/z+Rx+L95cu+m+jaV7L8krrv17TrpfTZu2ujt33Wi7dtNkwqDuA79fQfXg//XJGcA0FeM/LnkAYBz3HXpx6fQ8DFOKsDjaSRy20ZABySc457HK5yc8+sRkYNtKNkEfwsfcDp1wOcZxweKLy06dHfXV6J2319F9zbCMnpa+uq0ure7q1Z76WvurNXSHkZOe/XPJz97H8zn8uc0pBxgnnBxxx7dTgYGAB/F7UqhmGdp4zng8Z5/DIwfQ9aRdzEqVdSOnysflwST823oR09+cHgzZ3Wj6b/Jde+n4DV7J7pO9t3pZvztb5CYOD0yevHA4xgY+nv+XFNOTkgHPIIOfmzjrkHIHOO4+mRSuSmOG5PTBwB17DA9hzgDkDFPKsOqn1HB5A6cYz+I7j3xTSktbN666Lyd+712evfa4O+mmj200eytpfstG7kbKoORhSccnoexGBjsfUEnvjgOAx/D64wc8L6g89D26ccgcUL84yFbIPAwccDIPA6deeRgds8uCsQCQwPGflIA/xyPb36im+Z2Wu2t03fRWWmujSu+99gd7K993e7snton16eS3Xm0qCMY9zkAnrnGTkdx19ePWjAOeecHaSRg7vT1AzjHvxmkYspGFJxyMZy2CM59Md/YdvmoDFjypByf4SMdz1HGCMY7YyTStJWbvo9vut+i/BXaaRZ8qfZt20trbpt5PfoulkhBydpAPfIBbJ4H97aCPTPvkDFBXdnHUZwSAck44HfjjgKcg9wKeVc5KjkYB6+v0/ySRkdSjblwSpAxk4BPU+gGSx7cgZPQgghrn7O/e217b6dVbV30a10YNvTS/TVK6tbdW95aJJO/4CAYKnIB5HO07ienLfNnHTBwOhOAtOZQehzjGB6jpjpwcZwSOpJz0pwRiqkBm7ng/L1wT9fT0NMUkllwdy9RgjA/Eex+nfFL3rrfRK+ltHb5dFq77a21Er/Em9NHa+qTVrp2ur2S2/Ua6ls7cg4zuxx6LnBOBkgHB578AZUjIIzy2OcKcnHX5s9QDx05PYcNDuG4DYJORtbj8cdAB7+tSZYno2Oo+U89s8DnHPXPUE9RTd7JdrW0ej912b666cu2t3ZaJ6915vRrS2mvdrTVpt6aXQmBnIA79RnOT37nqcHI2jpxQQfYD6Ak4BHb0HTHXnOacwbBARt2CcbWyoAznA9Pf04JNAyf4WxgEHB5znGB6HHX8elK0rat6+t1tbz87a2s+q0Pe5W1drZ+VrW1+Wl9krrTUj25AK/Kc89SeM4BzjIHBHfkAHAwHbQORwcYyR2HHryccZ4z7jgv2uVLBTgex6ZGPfnIwfcdaau5s/Kcjj7pB9BkEevqPw9Rc/nv29Fbz2v835iu9db21/Ldvdbd1dadWNIC5JGS/GRjaDkEYBx1Of/rDApQCMg4xzjg8ZxnjuD7fTmlwR29frn0GB7/Xnp6rgkZwcf559v5/jTXNpe9r/AOWtvlvYfM3vfpd9be7a22to6dxu3qeOc9u/t78jPr7UgUE7gMHpnHt6eoyRnr2PHFOYMvAVj6Eg9ME9gR7/AHu5xwQaapY9VIxnPysOgGO2eD146cUWe+vSzto9v7v2WtnZLVPWwtbX/XSy1trvqk0vwDAPJ4PocnoenB6DdkdOOenVcE+m7+9j+QJ9PcjPryKYrsSQFbd3ADZ468YIx0yefTIxUrK2CQGxjqAQe3qPcduO9K0na+zd9V6a67/F893q2Ptta91tbpqrvVdr6NfOzOCSOjdfUdx/XgfmAMZCv3jgAnGMA+/HpjGB6j128UqbmXO0n6Bv8Op7YHPHHNIDIzbVjYkAEja3f0OMdT6E9yKLSW19u2r22WvlZXdrMNbeS728uj1tsKQckjqQe2cgAjGO3Hfq2c4wKiwcNjOOSvVgPl+9nupLY9uec42yssnICHP3WB49sNlTjqMnnpjNNYsvVWA642tjBJ55X+8MdTggcc005Wu++vz5bbL5bddVuUr6aJ6rfvpZaLvsrOyutkxmCxKng85z6HgcjJLYHuBgZCg0uzBJU8gEHI65LcnBAB6fN82B7ZqbDYB2kA47MO+PTrnt6daNpPGDj1xwfUd/x70c0mnp6pq/WPl1va2jt3EptWSV1fVLXS6Suna6duXvtfa5EV78E8krgng/KAAeBxyMN1zjAp20AnGSp7HnBGc4AHBOcn34Gc8K6sMjHUgEgE/mdp28EEZHHf0pjMyAYRuQMcMRjoTwhOSce3zdDzhvnaWruu++0bNaWWu2t1u7a2PecYpa68qV0n9lr8Xp1sntaw8qCCME49f97OM4z16/Ud+S0LkHByenTHJ69vckk8np6ggZiRhGGc4yrcjnbjhe59+eOTTyGA6HOOhB/H+HsD3H1xyaHzO1rtvTa1r2v9/f5eaH7trNta3butfdbVt+mr0vtrYjZRk4JLcBlHzbTkgcsMjPB46YyARyTaRxkkD7uMdMsSCM5xz6AE+v3af97kKeeDwTkgdGO3pz17HIyeco7MoJ2NjBwcNjt/s8fjxzzxyHd6Kz032f8vb59tNfIFfZLd216vTTp812evcZtAJZRg8jnnJLEEnI7dfvc9ztHKlASxB2kk5z+IHB9eDwDz04Bp43MoOw8krgg55yB26kZPsOnJ4SQvGSQu49gQRjPA7HgnHX/vkipvO32r7eq08ulutvJuzDVaNNNaWemjtprfTezem1r7CADO8AKe4OMcA+2CfXk4/CjZwwyeRwcKemcdcDJzyeBjvkZoVmckbSO5Chgcc8ngZHHHA+79BSbyDgKeM8YYkcsOu0jPTPBzk/iPm3u7ryv2dtmtXo+mj9BJy1ST2/lu+XRrXX3fu+aaALkYIG4jjPIHUYx1yctwB25waUpndj5WPAO0EHJzkfnnPO49fZokdiVKHPoFJ6nIwSpB6dePXjnEpyBkqcewORke46546D1OOaHz/N7aXV9PO3S/bez10d3q9Lu348rXl066b2u9mFTk8ZOfmJHHRsAYyw5/kQCeRQ2QMD0OM4Poc5PAO7AORgjtuwaehLHhG64GQR3I9OnB545+XrzQQRklcck9Md/oOc4GPpzmi8k7tPVX89o379V2WjFd8219tG7rpdrfddNvTcQY+9tOSOcgZGW9+gOckkf7w5NHUkEevUcdAOv0OO2fmGeMBwyOf880jGRMEAjjrjjqe+O/IbrgcUJN/zJ9G27aNXa6362/4Alvpv0/r/AIf0uNAIAHA5PHGSBg/Qn3H48ilIBJO0A8gcDH1AHUdP/rU4hwAyoxzjnBwM5PbIHI4yRjPHuYOCwDEZHJBAHr1AxwD3xkGnZ62Wtt7JJv3de9lZWu31RS5patLV27LeNrv599N9NhBkfeCnORwMdevfuOvqCelJ6njJOPUEY4/Dnn8ecDFOYFf4ST9Ce/TOD69PwpuWB5jb8j0wee3cY/PsOVZuySl6bK+m23XponrZomz0v12vpfbb5bX07akR688Fv4sZ2gbgAw5645xwSOMrjMp+UfLkYJ54GRnPocc+o5IGTk5CHJJBUkj2YjkZ5+QYPQ9c4GSRg5N2cgLkjjG0+p/2OuTxnPPTHd3emjVmtFfbTbX8Grb7WZW9nbRWvtb7Nl6W6NpLfe9wljk7RkZ4OcDg89AOc8844xnNLnKnjg/7PbryP4ueR1xx7ks34yCGPHB28dhgjqSD/M5PSgSsQQVbOPcY7ZJ29jj/AGeASvUU/esmlta909m481tLX766ddynGyTWrdru7v8AZ6WezT6XWzWxIQMHjGc5x1/T9O9HH0xxz2HH59uaFJOSRjqCMEYJGcYIGMAjucfUUjbhztJwR/CeD+WCOe/Q+vaEmmr826s7NXSa1T6O3py2V9dDNXulvs99ell92m6s7JbkgUsQR8uT7DqTkr1B6d8Y56Y5kcY+ZgfyBPUf3jg/Tvn61HGzFiGQq2Bxg84wAOVA6HPbPbkHM4ildlSNJZJHdVVERncksAAqopZmJ4AAOSCMZIq9nfazVle2ml9reS33XyH9qK06adfs63VlZLRet77I/9k="
-
 # Configure Streamlit page
 st.set_page_config(
     page_title="HoRuS",
@@ -30,308 +37,135 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS for better UI
-# Custom CSS for a professional, minimalist look
-css = """
-<style>
-    /* 🎨 HoRuS Website Color System (Pharaonic + AI, Professional) */
-    :root {
-        --obsidian-black: #0B0E11;
-        --basalt-stone: #1A1F24;
-        --royal-gold: #C9A24D;
-        --lapis-blue: #1F3A5F;
-        --turquoise-glow: #2EC4B6;
-        --papyrus-white: #E6E2D8;
-        --muted-sand: #B8B2A8;
-        --disabled-stone: #6C6F73;
-    }
-
-    /* 🖋️ Typography Imports */
-    @import url('https://fonts.googleapis.com/css2?family=Cinzel:wght@400;600;700&family=Outfit:wght@300;400;600&display=swap');
-
-    html {
-        font-size: 19px !important;
-    }
-
-    /* Global Styles */
-    /* Global Styles */
-    [data-testid="stAppViewContainer"] {
-        background-color: var(--obsidian-black);
-        background-image: linear-gradient(rgba(11, 14, 17, 0.85), rgba(11, 14, 17, 0.95)), url("data:image/png;base64,BASE64_BG_IMG");
-        background-size: cover;
-        background-attachment: fixed;
-        background-position: center center;
-        background-repeat: no-repeat;
-        color: var(--papyrus-white);
-        font-family: 'Outfit', sans-serif; /* Modern, clean body font */
-    }
-
-    .stApp {
-        background-color: transparent !important;
-    }
-
-    /* Force transparency on all inner containers that might have the default background */
-    [data-testid="stMain"], [data-testid="stBlockContainer"], [data-testid="stVerticalBlock"] {
-        background-color: transparent !important;
-        background: transparent !important;
-    }
-    
-    /* Specifically target the element user mentioned if it has that class/color */
-    .st-emotion-cache-1p2n2i4, .st-emotion-cache-hzygls, .st-emotion-cache-6shykm {
-        background-color: transparent !important;
-    }
-    
-    /* Custom Scrollbar */
-    ::-webkit-scrollbar {
-        width: 8px;
-        height: 8px;
-    }
-    ::-webkit-scrollbar-track {
-        background: var(--obsidian-black);
-    }
-    ::-webkit-scrollbar-thumb {
-        background: var(--basalt-stone);
-        border-radius: 4px;
-        border: 1px solid var(--lapis-blue);
-    }
-    ::-webkit-scrollbar-thumb:hover {
-        background: var(--lapis-blue);
-    }
-
-    /* Typography */
-    h1, h2 {
-        color: var(--royal-gold) !important;
-        font-weight: 700;
-        font-family: 'Cinzel', serif; /* Pharaonic header font */
-        letter-spacing: 1px;
-        text-transform: uppercase;
-    }
-    
-    h3 {
-        color: var(--royal-gold) !important;
-        font-weight: 600;
-        font-family: 'Outfit', sans-serif;
-        font-size: 1.1rem !important;
-        margin-bottom: 0.5rem !important;
-        margin-top: -5px !important;
-        text-transform: uppercase;
-        letter-spacing: 0.5px;
-    }
-    
-    p, li, div {
-        color: var(--papyrus-white);
-        line-height: 1.6;
-    }
-    
-    .small-text {
-        font-size: 0.85rem;
-        color: var(--muted-sand) !important;
-    }
-    
-    /* ✨ Animations */
-    @keyframes fadeIn {
-        from { opacity: 0; transform: translateY(10px); }
-        to { opacity: 1; transform: translateY(0); }
-    }
-    
-    .stChatMessage {
-        background-color: var(--basalt-stone);
-        border: 1px solid var(--lapis-blue);
-        border-radius: 12px;
-        animation: fadeIn 0.4s ease-out forwards;
-        box-shadow: 0 4px 20px rgba(0,0,0,0.2);
-    }
-    
-    /* 💎 Cards */
-    .result-card {
-        background-color: #151A20; /* Slightly lighter than Basalt */
-        border: 1px solid var(--royal-gold);
-        border-left: 4px solid var(--royal-gold);
-        border-radius: 8px;
-        padding: 16px 20px;
-        margin-bottom: 15px;
-        box-shadow: 0 8px 30px rgba(0,0,0,0.3);
-        color: var(--papyrus-white);
-        line-height: 1.6;
-        animation: fadeIn 0.5s ease-out forwards;
-    }
-    
-    .metric-card {
-        text-align: center;
-        padding: 15px;
-        background: var(--basalt-stone);
-        border: 1px solid var(--lapis-blue);
-        border-radius: 8px;
-        color: var(--papyrus-white);
-        transition: transform 0.2s;
-    }
-    .metric-card:hover {
-        transform: translateY(-2px);
-        border-color: var(--turquoise-glow);
-    }
-    
-    /* ⌨️ Chat Input Styling */
-    .stChatInputContainer {
-        background-color: transparent !important;
-        padding-bottom: 20px;
-    }
-
-    [data-testid="stBottom"], .stBottom, [data-testid="stBottomBlockContainer"] {
-        background-color: transparent !important;
-        background: transparent !important;
-    }
-    
-    .stChatInput > div {
-        # background-color: var(--basalt-stone) !important;
-        border: 1px solid var(--royal-gold) !important;
-        border-radius: 25px !important;
-        color: var(--papyrus-white) !important;
-        box-shadow: 0 0 15px rgba(201, 162, 77, 0.1); /* Subtle gold glow */
-    }
-    
-    .stChatInput > div:focus-within {
-        box-shadow: 0 0 20px rgba(201, 162, 77, 0.3);
-        border-color: var(--turquoise-glow) !important;
-    }
-    
-    /* Code/Query blocks */
-    .code-block {
-        background-color: #0f1318;
-        color: var(--turquoise-glow);
-        padding: 15px;
-        border-radius: 6px;
-        font-family: 'Monaco', 'Consolas', monospace;
-        font-size: 0.85rem;
-        margin-top: 10px;
-        border: 1px solid rgba(46, 196, 182, 0.3);
-    }
-    
-    /* Primary Button */
-    div.stButton > button {
-        background-color: var(--royal-gold);
-        color: var(--obsidian-black);
-        border: none;
-        font-weight: 700;
-        text-transform: uppercase;
-        letter-spacing: 1px;
-        border-radius: 6px;
-        transition: all 0.3s ease;
-        padding: 0.5rem 1rem;
-    }
-    div.stButton > button:hover {
-        background-color: #D9B45A;
-        box-shadow: 0 0 15px rgba(201, 162, 77, 0.4);
-        transform: scale(1.02);
-    }
-    
-    /* Sidebar styling fix */
-    section[data-testid="stSidebar"] {
-        background-color: #0b0e11;
-        border-right: 1px solid var(--basalt-stone);
-    }
-    
-    /* Input fields */
-    .stTextInput > div > div > input {
-        background-color: var(--basalt-stone);
-        color: var(--papyrus-white);
-        border-color: var(--lapis-blue);
-        border-radius: 6px;
-    }
+@st.cache_data
+def load_css(path: str = "assets/style.css") -> str:
+    """
+    Reads the stylesheet once per server instead of on every rerun. The background image
+    it references is served from static/ (see .streamlit/config.toml) so browsers cache it.
+    """
+    with open(path, encoding="utf-8") as f:
+        return f"<style>\n{f.read()}</style>"
 
-    /* Typing Animation */
-    @keyframes blink {
-        0% { content: ''; }
-        25% { content: '.'; }
-        50% { content: '..'; }
-        75% { content: '...'; }
-        100% { content: ''; }
-    }
-    
-    .typing-dots::after {
-        content: '';
-        animation: blink 1.5s infinite step-end;
-    }
-    
-    .typing-indicator {
-        font-family: 'Outfit', sans-serif;
-        color: var(--royal-gold);
-        font-weight: 600;
-        text-transform: uppercase;
-        letter-spacing: 0.5px;
-        font-size: 1.1rem;
-        margin-bottom: 0.5rem;
-        margin-top: -5px;
-        padding: 0;
-    }
-    
-    /* Hide Default Streamlit Header Decoration */
-    [data-testid="stDecoration"] {
-        display: none;
-    }
-    
-    /* Hide the Deploy/Menu toolbar */
-    [data-testid="stToolbar"] {
-        display: none;
-    }
-    
-    /* Ensure header background matches */
-    header[data-testid="stHeader"] {
-        background-color: transparent !important;
-    }
-    /* Hide sidebar collapse button */
-    [data-testid="stSidebarHeader"] {
-        display: none !important;
-    }
-    /* Hide sidebar collapse button */
-    [data-testid="stSidebarCollapseButton"] {
-        display: none !important;
-    }
-    
-    /* Hide element toolbar button container */
-    [data-testid="stElementToolbarButtonContainer"] {
-        display: none !important;
-    }
+# Custom CSS for a professional, minimalist look
+st.markdown(load_css(), unsafe_allow_html=True)
 
-    /* Hide anchor links */
-    .st-emotion-cache-1v0mbdj a, .st-emotion-cache-1plm3a3 a, a.anchor-link {
-        display: none !important;
-    }
-    h1 > a, h2 > a, h3 > a, h4 > a, h5 > a, h6 > a {
-        display: none !important;
-    }
-    [data-testid="stHeaderActionElements"] {
-        display: none !important;
-    }
-    
-    /* Add padding right to chatbot messages */
-    .stChatMessage {
-        padding-right: 20px !important;
-    }
-    </style>
-"""
-st.markdown(css.replace("BASE64_BG_IMG", base64_str), unsafe_allow_html=True)
+# Query used to warm up both embedding models and the vector search path
+WARMUP_QUERY = "hotels in Cairo"
+# Answer when retrieval found nothing; never stored in the semantic cache
+NO_CONTEXT_ANSWER = "I'm sorry, but the knowledge base doesn't contain any information relevant to your query."
 
 class StreamlitTravelAssistant:
     def __init__(self):
         self.processor = None
         self.retriever = None
         self.embedder = None
+        self.response_cache = None
         self.initialized = False
+        # Warm start state shown in the sidebar: idle -> starting -> ready / failed
+        self.status = "idle"
+        self.error = None
+        self.stage_times = {}
+        self.stage_lock = threading.Lock()  # pool threads write stage_times while the sidebar reads it
+        self.ready = threading.Event()
+        self.start_lock = threading.Lock()
+        
+    def start(self, retry: bool = False):
+        """Start initialize_components in a background thread; later calls are no-ops (retry restarts a failed one)"""
+        with self.start_lock:
+            if self.status != "idle" and not (retry and self.status == "failed"):
+                return
+            self.status = "starting"
+            self.error = None
+            with self.stage_lock:
+                self.stage_times = {}
+            self.ready.clear()
+        threading.Thread(target=self.initialize_components, name="warm-start", daemon=True).start()
+    
+    def wait_until_ready(self, timeout: float = None) -> bool:
+        """Block until the warm start has finished; True if the components are usable"""
+        self.ready.wait(timeout)
+        return self.initialized
+    
+    def stages(self) -> Dict[str, float]:
+        """Snapshot of the finished warm start stages and their durations"""
+        with self.stage_lock:
+            return dict(self.stage_times)
+    
+    def _timed(self, stage: str, build):
+        start = time.time()
+        result = build()
+        with self.stage_lock:
+            self.stage_times[stage] = time.time() - start
+        return result
+    
+    def _discard_components(self, retriever_future):
+        """Close whatever a failed warm start already opened, so a retry does not leak drivers"""
+        retriever = self.retriever
+        if retriever is None and retriever_future is not None and retriever_future.done() and not retriever_future.exception():
+            retriever = retriever_future.result()[0]
+        for component in (retriever, self.embedder):
+            if component is not None:
+                try:
+                    component.close()
+                except Exception as e:
+                    Logger.log(f"Could not close {type(component).__name__}: {e}", Logger.ERROR)
+        self.processor = self.retriever = self.embedder = self.response_cache = None
+    
+    def _load_model(self, model_name: str):
+        model = SentenceTransformer(model_name)
+        # The first encode pays for lazy torch initialization
+        model.encode(WARMUP_QUERY)
+        return model
+    
+    def _connect_retriever(self):
+        retriever = GraphRetriever()
+        # Warm-up Cypher: opens the driver's connection pool; the names feed the cache guard
+        return retriever, retriever.get_known_entities()
         
     def initialize_components(self):
-        """Initialize all components if not already done"""
-        if not self.initialized:
-            try:
-                with st.spinner("Initializing system components..."):
-                    Logger.verbosity = 1
-                    self.processor = Preprocessor()
-                    self.retriever = GraphRetriever()
-                    self.embedder = EmbeddingManager()
-                    self.initialized = True
-            except Exception as e:
-                st.error(f"Initialization failed: {str(e)}")
-                return False
-        return True
+        """
+        Initialize all components in parallel (both embedding models with a warm-up encode,
+        the graph retriever with a warm-up Cypher query, the LLM preprocessor, the prompt
+        tokenizers), then run one warm-up vector search. Sets ready when finished, whether it succeeded or not.
+        """
+        if self.initialized:
+            return True
+        start = time.time()
+        retriever = None
+        try:
+            Logger.verbosity = 1
+            with ThreadPoolExecutor(max_workers=5, thread_name_prefix="warm-start") as pool:
+                model_1 = pool.submit(self._timed, "model_1", lambda: self._load_model(MODEL_1_NAME))
+                model_2 = pool.submit(self._timed, "model_2", lambda: self._load_model(MODEL_2_NAME))
+                retriever = pool.submit(self._timed, "retriever", self._connect_retriever)
+                processor = pool.submit(self._timed, "processor", Preprocessor)
+                # Context budgeting counts tokens with each model's tokenizer
+                tokenizers = pool.submit(self._timed, "tokenizers", lambda: [get_token_counter(name) for name in Inference.models])
+                models = (model_1.result(), model_2.result())
+                # Checks the vector indices while the retriever and preprocessor may still be starting
+                self.embedder = self._timed("embedder", lambda: EmbeddingManager(models=models))
+                self.retriever, known_entities = retriever.result()
+                self.processor = processor.result()
+                tokenizers.result()
+            if INTENT_CLASSIFIER == "local":
+                # The local classifier reuses the already-loaded MiniLM model
+                self.processor.intent_classifier = self._timed("intent_classifier", lambda: IntentClassifier.from_embedder(self.embedder))
+            if SEMANTIC_CACHE_ENABLED:
+                # Shares the MiniLM query embedding cache; known names guard against entity mismatches
+                guard = EntityGuard(known_entities + ["Solo", "Couple", "Family", "Business"])
+                self.response_cache = SemanticResponseCache(lambda q: self.embedder.encode_query(q, 1), guard)
+            self._timed("warmup_search", lambda: self.embedder.search_similar_hotels(WARMUP_QUERY))
+            self.initialized = True
+        except Exception as e:
+            Logger.log(f"Initialization failed: {e}", Logger.ERROR)
+            self.error = str(e)
+            self._discard_components(retriever)
+        finally:
+            with self.stage_lock:
+                self.stage_times["total"] = time.time() - start
+            self.status = "ready" if self.initialized else "failed"
+            self.ready.set()
+        return self.initialized
     
     def check_environment(self):
         """Check if required environment variables are set"""
@@ -343,8 +177,20 @@ class StreamlitTravelAssistant:
             return False
         return True
     
-    def process_query(self, query: str, model_name: str, retrieval_method: str, embedding_model_version: int = 1) -> Dict[str, Any]:
-        """Process a single query and return structured results"""
+    def process_query(self, query: str, model_name: str, retrieval_method: str, embedding_model_version: int = 1, stream: bool = False) -> Dict[str, Any]:
+        """Process a single query and return structured results (blocking wrapper around aprocess_query)"""
+        return async_runner.run(self.aprocess_query(query, model_name, retrieval_method, embedding_model_version, stream))
+    
+    async def aprocess_query(self, query: str, model_name: str, retrieval_method: str, embedding_model_version: int = 1, stream: bool = False) -> Dict[str, Any]:
+        """Process a single query and return structured results, overlapping independent I/O"""
+        # Every stage below records a nested span; the trace is shown in System Internals
+        with tracing.trace("query", model=model_name, retrieval_method=retrieval_method) as trace:
+            results = await self._aprocess_query(query, model_name, retrieval_method, embedding_model_version, stream)
+            trace.set(intent=results["intent"], semantic_cache_hit="cache" in results, error=results["error"])
+        results["trace"] = trace
+        return results
+    
+    async def _aprocess_query(self, query: str, model_name: str, retrieval_method: str, embedding_model_version: int, stream: bool) -> Dict[str, Any]:
         results = {
             "intent": None,
             "entities": {},
@@ -357,10 +203,27 @@ class StreamlitTravelAssistant:
         }
         
         start_time = time.time()
+        embedding_task = None
+        
+        # Near-duplicate of an earlier question: skip both LLM calls and both retrievals
+        if self.response_cache:
+            with tracing.span("semantic_cache") as span:
+                scope = await asyncio.to_thread(self.cache_scope, model_name, retrieval_method, embedding_model_version)
+                cached = await asyncio.to_thread(self.response_cache.lookup, query, scope) if scope else None
+                span.set(hit=cached is not None)
+            if cached:
+                cached["processing_time"] = time.time() - start_time
+                return cached
         
         try:
+            # Semantic search only needs the raw query, so start it while the request is analyzed
+            if retrieval_method in ["embeddings", "both"]:
+                embedding_task = asyncio.create_task(
+                    self.embedder.asearch_similar_hotels(query, model_version=embedding_model_version)
+                )
+            
             # Step 1: Analyze request
-            intent, entities = self.processor.process(query)
+            intent, entities = await self.processor.aprocess(query)
             results["intent"] = intent.category
             results["entities"] = entities.model_dump()
             
@@ -371,34 +234,39 @@ class StreamlitTravelAssistant:
             # Skip retrieval for greetings
             if intent.category != "greeting":
                 if retrieval_method in ["baseline", "both"]:
-                    baseline_results = self.retriever.retrieve_baseline(intent, entities)
-                    if hasattr(self.retriever, 'last_queries'):
-                        results["cypher_queries"] = self.retriever.last_queries
+                    results["cypher_queries"] = self.retriever.get_display_queries(intent, entities)
+                    baseline_results = await self.retriever.aretrieve_baseline(intent, entities)
                 
-                if retrieval_method in ["embeddings", "both"]:
-                    if intent.category in ["search", "recommendation"]:
-                        embedding_results = self.embedder.search_similar_hotels(query, model_version=embedding_model_version)
+                if embedding_task and intent.category in ["search", "recommendation"]:
+                    embedding_results = await embedding_task
             
             results["baseline_results"] = baseline_results
             results["embedding_results"] = embedding_results
             
             # Step 3: Generate LLM response
-            if retrieval_method == "both":
-                context = baseline_results + embedding_results
-            elif retrieval_method == "embeddings":
-                context = embedding_results
-            else:
-                context = baseline_results
+            # Each list is only filled for the selected retrieval method; merge, rank and fit them to the token budget
+            with tracing.span("context", rows=len(baseline_results) + len(embedding_results)) as span:
+                # Tokenizer loading/counting is blocking work; keep it off the event loop
+                context = await asyncio.to_thread(build_context, baseline_results, embedding_results, model_name)
+                span.set(chars=len(context))
             
             # If no context found AND it's not a greeting, show fallback.
             # If it IS a greeting, we let the LLM handle it even with empty context.
             if not context and intent.category != "greeting":
-                results["final_answer"] = "I'm sorry, but the knowledge base doesn't contain any information relevant to your query."
+                results["final_answer"] = NO_CONTEXT_ANSWER
             else:
                 formatted_query = Inference.format_prompt(query, context)
-                client = Inference.setup_inference()
-                response = Inference.call_model(client, model_name, formatted_query)
-                results["final_answer"] = response
+                if stream:
+                    # Lazy generator, consumed by display_results as tokens arrive
+                    client = Inference.setup_inference(model_name)
+                    results["answer_stream"] = Inference.stream_model(client, model_name, formatted_query)
+                else:
+                    client = Inference.setup_async_inference(model_name)
+                    response = await Inference.acall_model(client, model_name, formatted_query)
+                    results["final_answer"] = response
+            
+            if "answer_stream" not in results:
+                self.cache_response(query, model_name, retrieval_method, embedding_model_version, results)
 
         except Exception as e:
             # Log the actual error for debugging (visible in console)
@@ -409,18 +277,61 @@ class StreamlitTravelAssistant:
             results["error"] = "Processing Error"
             results["final_answer"] = "I apologize, but I encountered a temporary issue while processing your request. Please try asking your question again."
         
+        finally:
+            # The speculative search is not needed for greetings/questions (or after an error)
+            if embedding_task:
+                if not embedding_task.done():
+                    embedding_task.cancel()
+                elif not embedding_task.cancelled():
+                    embedding_task.exception()  # mark a failed, unused search as handled
+        
         results["processing_time"] = time.time() - start_time
         return results
     
+    def cache_scope(self, model_name: str, retrieval_method: str, embedding_model_version: int):
+        """Semantic cache scope; the graph version keeps answers from before a rebuild, sync or append from matching"""
+        try:
+            return (model_name, retrieval_method, embedding_model_version, self.embedder.graph_version())
+        except Exception as e:
+            Logger.log(f"Graph version unavailable, skipping the semantic cache: {e}")
+            return None
+    
+    def cache_response(self, query: str, model_name: str, retrieval_method: str, embedding_model_version: int, results: Dict[str, Any]):
+        """Remember a completed answer in the semantic response cache"""
+        if not self.response_cache or not results.get("final_answer") or results.get("error"):
+            return
+        # Answers without retrieved context (fallbacks, greetings) say nothing about the graph
+        if results["final_answer"] == NO_CONTEXT_ANSWER or not (results["baseline_results"] or results["embedding_results"]):
+            return
+        scope = self.cache_scope(model_name, retrieval_method, embedding_model_version)
+        if scope:
+            self.response_cache.store(query, scope, results)
+    
     def display_results(self, results: Dict[str, Any], widget_key: str = None):
         """Display the results in a clean, professional format"""
         
         # Main Answer
         st.markdown("### Response")
-        if results["error"]:
+        answer_stream = results.pop("answer_stream", None)
+        if answer_stream is not None:
+            # Render tokens as they arrive; the generator is not kept in the session history
+            stream_start = time.time()
+            try:
+                results["final_answer"] = st.write_stream(answer_stream)
+            except Exception as e:
+                print(f"Error streaming response: {str(e)}")
+                traceback.print_exc()
+                results["error"] = "Processing Error"
+                results["final_answer"] = "I apologize, but I encountered a temporary issue while processing your request. Please try asking your question again."
+                st.error(results["final_answer"])
+            results["processing_time"] += time.time() - stream_start
+        elif results["error"]:
             st.error(results["final_answer"])
         else:
             st.markdown(f'<div class="result-card">{results["final_answer"]}</div>', unsafe_allow_html=True)
+        if results.get("trace") is not None:
+            # Snapshot once the streamed answer (and its span) has finished
+            results["trace"] = tracing.as_dict(results["trace"])
         
         # Toggle for System Internals
         # Use a unique key if provided, otherwise fallback to a random one (though random is bad for persistence)
@@ -438,6 +349,13 @@ class StreamlitTravelAssistant:
                 ent_count = len([v for v in results["entities"].values() if v])
                 st.caption(f"Entities: {ent_count}")
 
+            if results.get("cache"):
+                st.caption(f"Served from semantic cache (matched \"{results['cache']['matched_query']}\", similarity {results['cache']['similarity']:.2f})")
+
+            if results.get("trace"):
+                st.markdown("#### Latency Breakdown")
+                st.code(tracing.format_trace(results["trace"]), language=None)
+
             # Details Expander
             with st.expander("View Retrieval Details & Debug Info", expanded=True):
                 st.markdown("#### Extracted Entities")
@@ -471,6 +389,30 @@ class StreamlitTravelAssistant:
 def get_assistant():
     return StreamlitTravelAssistant()
 
+def show_readiness(assistant):
+    """Sidebar status of the warm start; polls until the components are ready"""
+    was_ready = assistant.ready.is_set()
+    
+    @st.fragment(run_every=None if was_ready else 2)
+    def readiness():
+        stages = assistant.stages()
+        if assistant.status == "ready":
+            st.success(f"System ready (warm start {stages.get('total', 0):.1f}s)")
+            st.caption(" · ".join(f"{stage} {seconds:.1f}s" for stage, seconds in stages.items() if stage != "total"))
+            if not was_ready:
+                # Rerun the whole page so the polling stops
+                st.rerun()
+        elif assistant.status == "failed":
+            st.error(f"Initialization failed: {assistant.error}")
+            if st.button("Retry initialization"):
+                assistant.start(retry=True)
+                st.rerun()
+        else:
+            done = [stage for stage in stages if stage != "total"]
+            st.info("Warming up system components..." + (f" (done: {', '.join(done)})" if done else ""))
+    
+    readiness()
+
 def main():
     # Sidebar
     with st.sidebar:
@@ -486,6 +428,8 @@ def main():
         assistant = get_assistant()
         if not assistant.check_environment():
             st.stop()
+        # Starts the parallel warm start once per server; the page renders while it runs
+        assistant.start()
             
         # Settings
         selected_model = st.selectbox(
@@ -509,6 +453,7 @@ def main():
         )
         embedding_model_version = 1 if "Model 1" in embedding_model_name else 2
         
+        show_readiness(assistant)
 
         
     # Main Content - Custom Header
@@ -522,7 +467,8 @@ def main():
 """, unsafe_allow_html=True)
     
     # Initialize
-    if not assistant.initialize_components():
+    if assistant.status == "failed":
+        st.error(f"Initialization failed: {assistant.error}")
         st.stop()
     
     # Query Interface
@@ -557,19 +503,30 @@ def main():
         # Assistant Response
         avatar_url = "assets/pharaoh_avatar.png"
         with st.chat_message("assistant", avatar=avatar_url):
+            if not assistant.ready.is_set():
+                with st.spinner("Waiting for system components to finish warming up..."):
+                    assistant.wait_until_ready()
+            if not assistant.initialized:
+                st.error(f"Initialization failed: {assistant.error}")
+                st.stop()
+            
             # Custom Typing Indicator
             placeholder = st.empty()
             placeholder.markdown('<div class="typing-indicator">Typing<span class="typing-dots"></span></div>', unsafe_allow_html=True)
             
             try:
-                results = assistant.process_query(query, selected_model, retrieval_method, embedding_model_version)
+                results = assistant.process_query(query, selected_model, retrieval_method, embedding_model_version, stream=True)
             finally:
                 # Clear the typing indicator
                 placeholder.empty()
                 
             # Generate a unique ID for this message
             msg_id = str(uuid.uuid4())
+            streamed = "answer_stream" in results
             assistant.display_results(results, widget_key=msg_id)
+            # Streamed answers are only complete once displayed; the others were cached by process_query
+            if streamed:
+                assistant.cache_response(query, selected_model, retrieval_method, embedding_model_version, results)
                 
         st.session_state.messages.append({
             "role": "assistant", 
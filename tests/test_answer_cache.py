@@ -0,0 +1,90 @@
+import asyncio
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+import src.answer_cache as answer_cache
+from src.answer_cache import AnswerCache
+
+@pytest.fixture
+def cache(tmp_path):
+    return AnswerCache(path=str(tmp_path / "answers.sqlite3"), ttl=60, max_bytes=1000)
+
+def test_round_trip_is_keyed_by_model_and_prompt(cache):
+    cache.put("model-a", "prompt", "answer a")
+    assert cache.get("model-a", "prompt") == "answer a"
+    assert cache.get("model-b", "prompt") is None
+    assert cache.get("model-a", "other prompt") is None
+    stats = cache.stats()
+    assert (stats["entries"], stats["hits"], stats["misses"]) == (1, 1, 2)
+
+def test_empty_answers_are_not_stored(cache):
+    cache.put("model-a", "prompt", "")
+    assert cache.stats()["entries"] == 0
+
+def test_expired_answers_are_dropped(cache, monkeypatch):
+    cache.put("model-a", "prompt", "answer")
+    now = answer_cache.time.time()
+    monkeypatch.setattr(answer_cache.time, "time", lambda: now + 61)
+    assert cache.get("model-a", "prompt") is None
+    assert cache.stats()["entries"] == 0
+
+def test_least_recently_used_answers_are_evicted(cache, monkeypatch):
+    clock = [1000.0]
+    def tick():
+        clock[0] += 1
+        return clock[0]
+    monkeypatch.setattr(answer_cache.time, "time", tick)
+    cache.put("model", "a", "a" * 400)
+    cache.put("model", "b", "b" * 400)
+    assert cache.get("model", "a") == "a" * 400  # b is now the least recently used
+    cache.put("model", "c", "c" * 400)
+    assert cache.stats()["bytes"] == 800
+    assert cache.get("model", "b") is None
+    assert cache.get("model", "a") == "a" * 400
+    assert cache.get("model", "c") == "c" * 400
+
+def test_clear_drops_everything(cache):
+    cache.put("model-a", "prompt", "answer")
+    cache.clear()
+    assert cache.get("model-a", "prompt") is None
+
+class ThreadRecordingCache(AnswerCache):
+    def __init__(self, path):
+        super().__init__(path=path, ttl=60, max_bytes=1000)
+        self.threads = []
+
+    def get(self, model_name, prompt):
+        self.threads.append(threading.get_ident())
+        return super().get(model_name, prompt)
+
+    def put(self, model_name, prompt, answer):
+        self.threads.append(threading.get_ident())
+        super().put(model_name, prompt, answer)
+
+class FakeAsyncClient:
+    def __init__(self):
+        self.calls = 0
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    async def create(self, model, messages, max_tokens):
+        self.calls += 1
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content="answer"))])
+
+def test_async_calls_use_the_cache_off_the_event_loop(tmp_path, monkeypatch):
+    import src.inference as inference
+    cache = ThreadRecordingCache(str(tmp_path / "answers.sqlite3"))
+    monkeypatch.setattr(inference, "get_answer_cache", lambda: cache)
+    monkeypatch.setattr(inference, "FAILOVER_ENABLED", False)
+    monkeypatch.setattr(inference, "get_token_counter", lambda model_name: lambda text: len(text.split()))
+    client = FakeAsyncClient()
+
+    async def ask():
+        return await inference.acall_model(client, "model-a", "prompt"), threading.get_ident()
+
+    assert asyncio.run(ask())[0] == "answer"
+    answer, loop_thread = asyncio.run(ask())
+    assert answer == "answer"
+    assert client.calls == 1
+    assert len(cache.threads) == 3 and loop_thread not in cache.threads
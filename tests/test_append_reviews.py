@@ -0,0 +1,53 @@
+import re
+
+from Create_kg import _append_review_batch, parse_review
+
+class RecordingTx:
+    """
+    Records the Cypher the append sends; the create query returns the new review ids.
+    """
+    def __init__(self):
+        self.queries = []
+
+    def run(self, query, **params):
+        self.queries.append((" ".join(query.split()), params))
+        if "CREATE (r:Review" in query:
+            return [{'review_id': row['review_id']} for row in params['batch']]
+        return []
+
+def unscored_review():
+    return parse_review({'review_id': '7', 'user_id': '1', 'hotel_id': '2', 'review_text': 'No score given',
+                         'review_date': '2024-05-01', 'score_overall': ''})
+
+def totals_queries(tx):
+    return [query for query, _ in tx.queries if "score_sum" in query]
+
+def test_unscored_review_is_appended_without_score():
+    tx = RecordingTx()
+    assert _append_review_batch(tx, [unscored_review()]) == 1
+    assert tx.queries[0][1]['batch'][0]['score_overall'] is None
+    # Hotel totals, two segment dimensions; then the version bump
+    assert [params.get('review_ids') for _, params in tx.queries[1:4]] == [[7], [7], [7]]
+
+def test_appended_scores_are_counted_apart_from_reviews():
+    tx = RecordingTx()
+    _append_review_batch(tx, [unscored_review()])
+    hotel, *segments = totals_queries(tx)
+    assert len(segments) == 2
+
+    for query in [hotel] + segments:
+        # count(r.score_overall) skips the null score, count(r) does not
+        assert "count(r) as review_count, count(r.score_overall) as score_count" in query
+    assert "h.review_count = coalesce(h.review_count, 0) + review_count" in hotel
+    assert "h.score_count = coalesce(h.score_count, 0) + score_count" in hotel
+    assert "h.score_sum / h.score_count" in hotel
+    for query in segments:
+        assert "ON CREATE SET s.review_count = 0, s.score_count = 0, s.score_sum = 0.0" in query
+        assert "s.score_count = s.score_count + score_count" in query
+        assert "s.score_sum / s.score_count" in query
+
+def test_averages_never_divide_by_review_count():
+    tx = RecordingTx()
+    _append_review_batch(tx, [unscored_review()])
+    for query in totals_queries(tx):
+        assert not re.search(r"score_sum / \w\.review_count", query)
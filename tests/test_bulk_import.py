@@ -0,0 +1,69 @@
+import csv
+import json
+import os
+
+from Create_kg import (IMPORT_MANIFEST, IMPORT_NODE_HEADERS, IMPORT_RELATIONSHIP_HEADERS,
+                       _import_file_name, export_bulk_import)
+
+def write_csv(path, rows):
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+    return str(path)
+
+def hotel(hotel_id, city, country):
+    return {'hotel_id': hotel_id, 'hotel_name': f'Hotel {hotel_id}', 'city': city, 'country': country,
+            'star_rating': 4, 'cleanliness_base': 8.5, 'comfort_base': '', 'facilities_base': 8}
+
+def user(user_id, country):
+    return {'user_id': user_id, 'country': country, 'age_group': '25-34',
+            'traveller_type': 'Solo', 'user_gender': 'F'}
+
+def review(review_id, user_id, hotel_id):
+    return {'review_id': review_id, 'user_id': user_id, 'hotel_id': hotel_id,
+            'review_text': 'Nice, quiet', 'review_date': '2024-01-01', 'score_overall': 9}
+
+def read_rows(output_dir, name):
+    with open(os.path.join(output_dir, name), encoding='utf-8') as f:
+        return list(csv.reader(f))
+
+def export(tmp_path):
+    output_dir = str(tmp_path / 'import')
+    manifest = export_bulk_import(
+        output_dir,
+        hotels_file=write_csv(tmp_path / 'hotels.csv', [hotel(1, 'Paris', 'France'), hotel(2, 'Paris', 'France'),
+                                                       hotel(3, 'Lyon', 'France'), hotel(1, 'Paris', 'France')]),
+        users_file=write_csv(tmp_path / 'users.csv', [user(10, 'Egypt'), user(11, 'France')]),
+        reviews_file=write_csv(tmp_path / 'reviews.csv', [review(100, 10, 1), review(101, 10, 1), review(102, 11, 2),
+                                                          review(103, 99, 1), review(104, 10, 99), review(100, 10, 1)]),
+        visa_file=write_csv(tmp_path / 'visa.csv', [{'from': 'Egypt', 'to': 'France', 'visa_type': 'tourist'},
+                                                    {'from': 'Egypt', 'to': 'France', 'visa_type': 'evisa'},
+                                                    {'from': 'Egypt', 'to': 'Japan', 'visa_type': 'tourist'}]),
+    )
+    return output_dir, manifest
+
+def test_manifest_counts_match_the_loader_deduplication(tmp_path):
+    output_dir, manifest = export(tmp_path)
+    assert manifest['nodes'] == {'Country': 3, 'City': 2, 'Hotel': 3, 'Traveller': 2, 'Review': 3}
+    assert manifest['relationships'] == {'LOCATED_IN': 5, 'FROM_COUNTRY': 2, 'WROTE': 3,
+                                         'REVIEWED': 3, 'STAYED_AT': 2, 'NEEDS_VISA': 2}
+    assert manifest['skipped_reviews'] == 3
+    with open(os.path.join(output_dir, IMPORT_MANIFEST), encoding='utf-8') as f:
+        assert json.load(f) == manifest
+
+def test_every_file_starts_with_its_header(tmp_path):
+    output_dir, _ = export(tmp_path)
+    headers = list(IMPORT_NODE_HEADERS.items()) + list(IMPORT_RELATIONSHIP_HEADERS.items())
+    assert len(os.listdir(output_dir)) == len(headers) + 1
+    for key, header in headers:
+        assert read_rows(output_dir, _import_file_name(key))[0] == header
+
+def test_rows_keep_values_and_leave_missing_cells_empty(tmp_path):
+    output_dir, _ = export(tmp_path)
+    hotels = read_rows(output_dir, 'hotel.csv')[1:]
+    assert [row[:3] for row in hotels] == [['1', '1', 'Hotel 1'], ['2', '2', 'Hotel 2'], ['3', '3', 'Hotel 3']]
+    assert hotels[0][5] == ''
+    visas = read_rows(output_dir, 'country_needs_visa_country.csv')[1:]
+    assert [row[:3] for row in visas] == [['Egypt', 'France', 'evisa'], ['Egypt', 'Japan', 'tourist']]
+    assert read_rows(output_dir, 'review.csv')[1][2] == 'Nice, quiet'
@@ -0,0 +1,57 @@
+import json
+import os
+
+from Create_kg import Checkpoint, _Watermark
+
+def test_commit_only_moves_forward(tmp_path):
+    checkpoint = Checkpoint(str(tmp_path / 'checkpoint.json'))
+    checkpoint.commit('reviews.csv', 40)
+    checkpoint.commit('reviews.csv', 20)
+    checkpoint.commit('reviews.csv', 40)
+    assert checkpoint.offset('reviews.csv') == 40
+    assert checkpoint.offset('users.csv') == 0
+
+def test_resume_reads_the_saved_state(tmp_path):
+    path = str(tmp_path / 'checkpoint.json')
+    checkpoint = Checkpoint(path)
+    checkpoint.commit('hotels.csv', 10)
+    checkpoint.stage_done('hotels')
+    assert not os.path.exists(path + '.tmp')
+    with open(path, encoding='utf-8') as f:
+        assert json.load(f) == {'files': {'hotels.csv': 10}, 'stages': ['hotels']}
+
+    resumed = Checkpoint(path, resume=True)
+    assert resumed.offset('hotels.csv') == 10
+    assert resumed.is_done('hotels')
+    assert not resumed.is_done('users')
+    assert Checkpoint(path).offset('hotels.csv') == 0
+
+def test_remove_deletes_the_file(tmp_path):
+    path = str(tmp_path / 'checkpoint.json')
+    checkpoint = Checkpoint(path)
+    checkpoint.stage_done('hotels')
+    checkpoint.remove()
+    assert not os.path.exists(path)
+    checkpoint.remove()
+
+def test_checkpoint_without_path_stays_in_memory():
+    checkpoint = Checkpoint(None)
+    checkpoint.commit('hotels.csv', 5)
+    assert checkpoint.offset('hotels.csv') == 5
+    checkpoint.remove()
+
+def test_watermark_advances_over_contiguous_batches():
+    watermark = _Watermark(offset=100)
+    for batch_number in range(3):
+        watermark.add(batch_number, 10)
+    assert watermark.done({1: 10}) == 100
+    assert watermark.done({0: 4, 2: 10}) == 100
+    assert watermark.done({0: 6}) == 130
+
+def test_watermark_counts_skipped_rows_as_done():
+    watermark = _Watermark()
+    watermark.add(0, 10, pending=7)
+    watermark.add(1, 10, pending=0)
+    watermark.add(2, 10, pending=10)
+    assert watermark.done({0: 7}) == 20
+    assert watermark.done({2: 10}) == 30
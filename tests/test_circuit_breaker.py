@@ -0,0 +1,90 @@
+import pytest
+
+import src.inference as inference
+from src.inference import CircuitBreaker
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(inference.time, "time", lambda: now[0])
+    return now
+
+def make_breaker():
+    return CircuitBreaker("model", failure_threshold=2, slow_call_seconds=5, reset_timeout=30)
+
+def open_breaker(breaker):
+    for _ in range(breaker.failure_threshold):
+        assert breaker.allow()
+        breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+
+def test_opens_after_consecutive_failures(clock):
+    breaker = make_breaker()
+    breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+    breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.stats()["opened"] == 1
+
+def test_success_resets_the_failure_count(clock):
+    breaker = make_breaker()
+    breaker.record_failure()
+    breaker.record_success(0.1)
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.consecutive_failures == 1
+
+def test_slow_calls_count_as_failures(clock):
+    breaker = make_breaker()
+    breaker.record_success(6)
+    breaker.record_success(6)
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.stats()["slow_calls"] == 2
+    assert breaker.stats()["successes"] == 0
+
+def test_open_breaker_short_circuits_until_reset_timeout(clock):
+    breaker = make_breaker()
+    open_breaker(breaker)
+    clock[0] += 29
+    assert not breaker.allow()
+    assert breaker.stats()["short_circuited"] == 1
+    clock[0] += 1
+    assert breaker.allow()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+
+def test_half_open_lets_a_single_probe_through(clock):
+    breaker = make_breaker()
+    open_breaker(breaker)
+    clock[0] += 30
+    assert breaker.allow()
+    assert not breaker.allow()
+    breaker.record_success(0.1)
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.allow()
+
+def test_failed_probe_reopens(clock):
+    breaker = make_breaker()
+    open_breaker(breaker)
+    clock[0] += 30
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.stats()["opened"] == 2
+    assert not breaker.allow()
+
+def test_release_frees_an_unsettled_probe(clock):
+    breaker = make_breaker()
+    open_breaker(breaker)
+    clock[0] += 30
+    assert breaker.allow()
+    breaker.release()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.allow()
+
+def test_release_is_a_no_op_when_closed(clock):
+    breaker = make_breaker()
+    breaker.release()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.allow()
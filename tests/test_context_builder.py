@@ -0,0 +1,48 @@
+from src.context_builder import MAX_CELL_CHARS, build_context, merge_results, normalize_row, render_table
+
+def count_words(text):
+    return len(text.split())
+
+def test_normalize_row_strips_prefixes_and_aliases():
+    row = normalize_row({"h.name": "The Savoy", "h.star_rating": 5, "h.comfort_base": None})
+    assert row == {"name": "The Savoy", "stars": 5}
+
+def test_merge_ranks_shared_then_cypher_then_semantic():
+    baseline = [{"hotel": "A", "h.star_rating": 4}, {"hotel": "B"}, {"hotel": "C"}]
+    semantic = [{"hotel": "D", "score": 0.7}, {"hotel": "e", "score": 0.9}, {"hotel": "c ", "score": 0.5}]
+    rows = merge_results(baseline, semantic)
+    assert [row["hotel"] for row in rows] == ["C", "A", "B", "e", "D"]
+    assert rows[0]["match"] == 0.5
+    assert rows[1] == {"hotel": "A", "stars": 4}
+
+def test_only_semantic_scores_become_match():
+    rows = merge_results([{"r.score": 9.0, "review": "great"}], [{"hotel": "A", "score": 0.8}])
+    assert rows[0] == {"score": 9.0, "review": "great"}
+    assert rows[1] == {"hotel": "A", "match": 0.8}
+
+def test_rows_without_hotel_are_deduplicated():
+    rows = merge_results([{"from": "Egypt", "to": "France", "visa": "yes"}] * 2, [])
+    assert len(rows) == 1
+
+def test_columns_follow_field_order():
+    table = render_table([{"extra": 1, "rating": 8.5, "hotel": "A"}, {"hotel": "B"}], count_words, 100)
+    assert table.splitlines() == ["hotel | rating | extra", "A | 8.5 | 1", "B | - | -"]
+
+def test_budget_cuts_rows_in_rank_order():
+    rows = [{"hotel": f"Hotel {i}"} for i in range(5)]
+    # Header costs one word, each row two
+    table = render_table(rows, count_words, 5)
+    assert table.splitlines() == ["hotel", "Hotel 0", "Hotel 1"]
+    assert render_table(rows, count_words, 2) == ""
+    assert render_table([], count_words, 100) == ""
+
+def test_cells_are_truncated_and_escaped():
+    table = render_table([{"review": "x" * (MAX_CELL_CHARS + 50), "hotel": "A|B", "rating": 8.0}], count_words, 1000)
+    hotel, rating, review = table.splitlines()[1].split(" | ")
+    assert hotel == "A/B"
+    assert rating == "8"
+    assert len(review) == MAX_CELL_CHARS and review.endswith("...")
+
+def test_build_context_uses_estimate_without_model():
+    context = build_context([{"hotel": "A"}], [{"hotel": "B", "score": 0.9}], token_budget=100)
+    assert context.splitlines() == ["hotel | match", "A | -", "B | 0.9"]
@@ -0,0 +1,57 @@
+import numpy as np
+
+from src.intent_classifier import IntentClassifier
+
+VECTORS = {
+    "hello": [1.0, 0.0, 0.0],
+    "find hotels": [0.0, 1.0, 0.0],
+}
+
+class FakeModel:
+    def __init__(self, queries=None):
+        self.vectors = dict(VECTORS, **(queries or {}))
+
+    def encode(self, texts):
+        if isinstance(texts, str):
+            return np.asarray(self.vectors[texts], dtype=np.float32)
+        return np.asarray([self.vectors[t] for t in texts], dtype=np.float32)
+
+def make_classifier(queries, threshold=0.5, margin=0.08):
+    exemplars = {"greeting": ["hello"], "search": ["find hotels"]}
+    return IntentClassifier(FakeModel(queries), exemplars=exemplars, threshold=threshold, margin=margin)
+
+def test_confident_match_returns_intent():
+    classifier = make_classifier({"hi": [0.9, 0.1, 0.0]})
+    intent = classifier.classify("hi")
+    assert intent.category == "greeting"
+    assert "Local classifier" in intent.reasoning
+
+def test_below_threshold_falls_back():
+    # Mostly along the third axis: cosine to every centroid is below 0.5
+    classifier = make_classifier({"weather?": [0.3, 0.0, 1.0]})
+    assert classifier.classify("weather?") is None
+
+def test_small_margin_falls_back():
+    # cos ~0.74 vs ~0.67: above the threshold but only 0.07 ahead of the runner-up
+    classifier = make_classifier({"hi, find": [1.0, 0.9, 0.0]})
+    assert classifier.classify("hi, find") is None
+    assert make_classifier({"hi, find": [1.0, 0.9, 0.0]}, margin=0.05).classify("hi, find").category == "greeting"
+
+def test_empty_query_falls_back():
+    classifier = make_classifier({})
+    assert classifier.classify("") is None
+    assert classifier.classify("   ") is None
+
+def test_from_embedder_uses_cached_query_encoder():
+    calls = []
+
+    class Embedder:
+        model_1 = FakeModel()
+
+        def encode_query(self, query, model_version):
+            calls.append((query, model_version))
+            return VECTORS["find hotels"]
+
+    classifier = IntentClassifier.from_embedder(Embedder(), exemplars={"greeting": ["hello"], "search": ["find hotels"]})
+    assert classifier.classify("anything").category == "search"
+    assert calls == [("anything", 1)]
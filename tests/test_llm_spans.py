@@ -0,0 +1,59 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+import src.inference as inference
+from src import tracing
+
+ANSWER = "Try the Nile Grandeur in Cairo."
+
+def response():
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=ANSWER))])
+
+class FakeClient:
+    def __init__(self):
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=lambda **kwargs: response()))
+
+class FakeAsyncClient:
+    def __init__(self):
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    async def create(self, **kwargs):
+        return response()
+
+@pytest.fixture(autouse=True)
+def word_tokens(monkeypatch):
+    monkeypatch.setattr(inference, "get_answer_cache", lambda: None)
+    monkeypatch.setattr(inference, "FAILOVER_ENABLED", False)
+    monkeypatch.setattr(inference, "get_token_counter", lambda model_name: lambda text: len(text.split()))
+
+def llm_span(root):
+    [span] = [child for child in root.children if child.name == "llm"]
+    return span.attributes
+
+def test_call_model_records_token_counts():
+    with tracing.trace("query") as root:
+        assert inference.call_model(FakeClient(), "model-spans", "one two three") == ANSWER
+    attributes = llm_span(root)
+    assert attributes["prompt_tokens"] == 3
+    assert attributes["answer_tokens"] == 6
+
+def test_acall_model_records_token_counts():
+    async def ask():
+        with tracing.trace("query") as root:
+            await inference.acall_model(FakeAsyncClient(), "model-spans", "one two")
+        return root
+    attributes = llm_span(asyncio.run(ask()))
+    assert attributes["prompt_tokens"] == 2
+    assert attributes["answer_tokens"] == 6
+
+def test_stream_model_records_token_counts():
+    chunks = [SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=word + " "))])
+              for word in ANSWER.split()]
+    client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=lambda **kwargs: iter(chunks))))
+    with tracing.trace("query") as root:
+        assert "".join(inference.stream_model(client, "model-spans", "one")).strip() == ANSWER
+    attributes = llm_span(root)
+    assert attributes["prompt_tokens"] == 1
+    assert attributes["answer_tokens"] == 6
@@ -0,0 +1,79 @@
+import csv
+import threading
+
+import pytest
+
+from Create_kg import Checkpoint, load_reviews
+
+FIELDS = ['review_id', 'user_id', 'hotel_id', 'review_text', 'review_date']
+
+class FakeSession:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute_write(self, write_batch, batch):
+        with self.driver.lock:
+            if self.driver.fail_on in {row['hotel_id'] for row in batch}:
+                raise ValueError("write failed")
+            self.driver.writes.append((threading.current_thread().name, list(batch)))
+
+class FakeDriver:
+    def __init__(self, fail_on=None):
+        self.fail_on = fail_on
+        self.writes = []
+        self.lock = threading.Lock()
+
+    def session(self):
+        return FakeSession(self)
+
+def write_reviews(path, hotel_ids):
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDS)
+        writer.writeheader()
+        for review_id, hotel_id in enumerate(hotel_ids):
+            writer.writerow({'review_id': review_id, 'user_id': review_id % 3, 'hotel_id': hotel_id,
+                             'review_text': 'ok', 'review_date': '2024-01-01'})
+    return str(path)
+
+def test_each_hotel_is_written_by_a_single_worker(tmp_path):
+    path = write_reviews(tmp_path / 'reviews.csv', [i % 7 for i in range(40)])
+    driver = FakeDriver()
+    assert load_reviews(driver, path, batch_size=3, workers=3) == 40
+
+    writers = {}
+    for thread, batch in driver.writes:
+        for row in batch:
+            writers.setdefault(row['hotel_id'], set()).add(thread)
+    assert all(len(threads) == 1 for threads in writers.values())
+    assert sorted(row['review_id'] for _, batch in driver.writes for row in batch) == list(range(40))
+    assert all(len(batch) <= 3 for _, batch in driver.writes)
+
+def test_rows_without_hotel_are_skipped(tmp_path, capsys):
+    path = write_reviews(tmp_path / 'reviews.csv', [1, '', 2, '', 3])
+    checkpoint = Checkpoint(str(tmp_path / 'checkpoint.json'))
+    driver = FakeDriver()
+    assert load_reviews(driver, path, batch_size=2, workers=2, checkpoint=checkpoint) == 3
+    assert sorted(row['hotel_id'] for _, batch in driver.writes for row in batch) == [1, 2, 3]
+    assert "Skipped 2 reviews without a hotel_id" in capsys.readouterr().out
+    # Skipped rows still count towards the checkpoint, so a resume does not reread them
+    assert checkpoint.offset(path) == 5
+
+def test_writer_failure_is_raised(tmp_path):
+    path = write_reviews(tmp_path / 'reviews.csv', [i % 4 for i in range(20)])
+    with pytest.raises(RuntimeError, match="Loading reviews failed"):
+        load_reviews(FakeDriver(fail_on=2), path, batch_size=2, workers=2)
+
+def test_resume_skips_committed_rows(tmp_path):
+    path = write_reviews(tmp_path / 'reviews.csv', list(range(10)))
+    checkpoint = Checkpoint(str(tmp_path / 'checkpoint.json'))
+    checkpoint.commit(path, 6)
+    driver = FakeDriver()
+    assert load_reviews(driver, path, batch_size=2, workers=2, checkpoint=checkpoint) == 4
+    assert sorted(row['review_id'] for _, batch in driver.writes for row in batch) == [6, 7, 8, 9]
+    assert checkpoint.offset(path) == 10
@@ -0,0 +1,95 @@
+import asyncio
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+import streamlit_app
+import src.context_builder as context_builder
+from src.models import Entities
+from src.semantic_cache import EntityGuard, SemanticResponseCache
+
+QUERY = "hotels in Cairo"
+
+@pytest.fixture(autouse=True)
+def offline_tokenizer(monkeypatch):
+    # Fake model names have no tokenizer to download
+    monkeypatch.setattr(context_builder, "get_token_counter", lambda model_name=None: context_builder._approximate_tokens)
+
+class FakeEmbedder:
+    def __init__(self):
+        self.version = (3, "2026-01-01T00:00:00Z")
+
+    def graph_version(self):
+        if self.version is None:
+            raise ConnectionError("database unavailable")
+        return self.version
+
+class FakeProcessor:
+    async def aprocess(self, query):
+        return SimpleNamespace(category="search"), Entities(city="Cairo")
+
+class FakeRetriever:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def get_display_queries(self, intent, entities):
+        return []
+
+    async def aretrieve_baseline(self, intent, entities):
+        return self.rows
+
+def make_assistant(rows=()):
+    assistant = streamlit_app.StreamlitTravelAssistant()
+    assistant.embedder = FakeEmbedder()
+    assistant.processor = FakeProcessor()
+    assistant.retriever = FakeRetriever(list(rows))
+    encoder = lambda query: np.ones(3, dtype=np.float32)
+    assistant.response_cache = SemanticResponseCache(encoder, EntityGuard(["Cairo"]))
+    return assistant
+
+def answered(**fields):
+    results = {"intent": "search", "entities": {}, "baseline_results": [{"hotel": "Nile Grandeur"}],
+               "embedding_results": [], "final_answer": "Try Nile Grandeur.", "error": None}
+    results.update(fields)
+    return results
+
+def lookup(assistant):
+    return assistant.response_cache.lookup(QUERY, assistant.cache_scope("model", "baseline", 1))
+
+def test_answers_are_scoped_to_the_graph_version():
+    assistant = make_assistant()
+    assistant.cache_response(QUERY, "model", "baseline", 1, answered())
+    assert lookup(assistant)["final_answer"] == "Try Nile Grandeur."
+    assistant.embedder.version = (4, "2026-01-02T00:00:00Z")
+    assert lookup(assistant) is None
+
+def test_answers_without_context_are_not_cached():
+    assistant = make_assistant()
+    assistant.cache_response(QUERY, "model", "baseline", 1, answered(final_answer=streamlit_app.NO_CONTEXT_ANSWER))
+    assistant.cache_response(QUERY, "model", "baseline", 1, answered(baseline_results=[], final_answer="Hello!"))
+    assert assistant.response_cache.stats()["entries"] == 0
+
+def test_cache_is_skipped_when_the_graph_version_is_unavailable():
+    assistant = make_assistant()
+    assistant.embedder.version = None
+    assert assistant.cache_scope("model", "baseline", 1) is None
+    assistant.cache_response(QUERY, "model", "baseline", 1, answered())
+    assert assistant.response_cache.stats()["entries"] == 0
+
+def test_pipeline_does_not_cache_the_fallback_answer():
+    assistant = make_assistant(rows=[])
+    results = asyncio.run(assistant._aprocess_query(QUERY, "model", "baseline", 1, stream=False))
+    assert results["final_answer"] == streamlit_app.NO_CONTEXT_ANSWER
+    assert assistant.response_cache.stats()["entries"] == 0
+
+def test_pipeline_caches_answers_with_context(monkeypatch):
+    async def acall_model(client, model_name, prompt):
+        return "Try Nile Grandeur."
+    monkeypatch.setattr(streamlit_app.Inference, "setup_async_inference", lambda model_name: None)
+    monkeypatch.setattr(streamlit_app.Inference, "acall_model", acall_model)
+    assistant = make_assistant(rows=[{"hotel": "Nile Grandeur"}])
+    asyncio.run(assistant._aprocess_query(QUERY, "model", "baseline", 1, stream=False))
+    assert assistant.response_cache.stats()["entries"] == 1
+    results = asyncio.run(assistant._aprocess_query(QUERY, "model", "baseline", 1, stream=False))
+    assert results["cache"]["matched_query"] == QUERY
@@ -0,0 +1,97 @@
+import numpy as np
+
+import src.semantic_cache as semantic_cache
+from src.semantic_cache import EntityGuard, SemanticResponseCache
+
+VECTORS = {
+    "best hotels in london": [1.0, 0.0, 0.0],
+    "top hotels in london": [0.95, 0.05, 0.0],
+    "best hotels in paris": [0.97, 0.03, 0.0],
+    "hotels rated above 8": [0.0, 1.0, 0.0],
+    "hotels rated above 9": [0.0, 0.99, 0.01],
+    "cheap places to eat": [0.0, 0.0, 1.0],
+}
+
+SCOPE = ("model-a", "hybrid", 5)
+
+def encode(query):
+    return np.asarray(VECTORS[query.lower()], dtype=np.float32)
+
+def make_cache(**kwargs):
+    guard = EntityGuard(["London", "Paris", "family"])
+    return SemanticResponseCache(encode, guard=guard, **kwargs)
+
+def test_entity_guard_finds_names_and_numbers():
+    guard = EntityGuard(["London", "New York", "New"])
+    assert guard.terms("Hotels in NEW YORK above 8.5") == frozenset({"new york", "8.5"})
+    assert guard.terms("anything") == frozenset()
+    assert EntityGuard().terms("rated 9") == frozenset({"9"})
+
+def test_entity_guard_matches_case_plural_and_accent_variants():
+    guard = EntityGuard(["Paris", "Family", "L'Étoile Palace", "Gaudi's Retreat"])
+    assert guard.terms("hotels in paris for families") == frozenset({"paris", "family"})
+    assert guard.terms("PARIS FAMILY TRIP") == guard.terms("Paris family trip")
+    assert guard.terms("reviews of l'etoile palace") == guard.terms("Reviews of LEtoile Palace")
+    assert guard.terms("Gaudis retreat") == guard.terms("Gaudi\u2019s Retreat") == frozenset({"gaudis retreat"})
+    assert guard.terms("Parisian families") == frozenset({"family"})
+
+def test_entity_variants_still_block_other_entities():
+    cache = make_cache(threshold=0.9)
+    cache.store("best hotels in London", SCOPE, {"answer": "The Savoy"})
+    assert cache.lookup("Top hotels in LONDON", SCOPE)["answer"] == "The Savoy"
+    assert cache.lookup("best hotels in paris", SCOPE) is None
+
+def test_near_duplicate_query_hits():
+    cache = make_cache(threshold=0.9)
+    cache.store("best hotels in London", SCOPE, {"answer": "The Savoy", "error": None})
+    results = cache.lookup("Top hotels in London", SCOPE)
+    assert results["answer"] == "The Savoy"
+    assert results["cache"]["matched_query"] == "best hotels in London"
+    assert results["cache"]["similarity"] >= 0.9
+    assert cache.stats()["hits"] == 1
+
+def test_different_entities_never_share_a_response():
+    cache = make_cache(threshold=0.9)
+    cache.store("best hotels in London", SCOPE, {"answer": "The Savoy"})
+    cache.store("hotels rated above 8", SCOPE, {"answer": "eight"})
+    assert cache.lookup("best hotels in Paris", SCOPE) is None
+    assert cache.lookup("hotels rated above 9", SCOPE) is None
+
+def test_dissimilar_query_and_other_scope_miss():
+    cache = make_cache(threshold=0.9)
+    cache.store("best hotels in London", SCOPE, {"answer": "The Savoy"})
+    assert cache.lookup("cheap places to eat", SCOPE) is None
+    assert cache.lookup("best hotels in London", ("model-b", "hybrid", 5)) is None
+    assert cache.stats()["misses"] == 2
+
+def test_lookup_returns_a_copy_without_request_state():
+    cache = make_cache()
+    results = {"answer": "The Savoy", "rows": [1], "answer_stream": object(), "trace": {}, "cache": {}}
+    cache.store("best hotels in London", SCOPE, results)
+    first = cache.lookup("best hotels in London", SCOPE)
+    assert "answer_stream" not in first and "trace" not in first
+    first["rows"].append(2)
+    assert cache.lookup("best hotels in London", SCOPE)["rows"] == [1]
+
+def test_errors_are_not_stored():
+    cache = make_cache()
+    cache.store("best hotels in London", SCOPE, {"answer": "", "error": "boom"})
+    assert cache.stats()["entries"] == 0
+
+def test_expired_entries_are_dropped(monkeypatch):
+    cache = make_cache(ttl=10)
+    cache.store("best hotels in London", SCOPE, {"answer": "The Savoy"})
+    now = semantic_cache.time.time()
+    monkeypatch.setattr(semantic_cache.time, "time", lambda: now + 11)
+    assert cache.lookup("best hotels in London", SCOPE) is None
+    assert cache.stats()["entries"] == 0
+
+def test_least_recently_used_entry_is_evicted():
+    cache = make_cache(capacity=2)
+    cache.store("best hotels in London", SCOPE, {"answer": "london"})
+    cache.store("hotels rated above 8", SCOPE, {"answer": "eight"})
+    assert cache.lookup("best hotels in London", SCOPE) is not None
+    cache.store("cheap places to eat", SCOPE, {"answer": "food"})
+    assert cache.lookup("hotels rated above 8", SCOPE) is None
+    assert cache.lookup("best hotels in London", SCOPE)["answer"] == "london"
+    assert cache.stats()["entries"] == 2
@@ -0,0 +1,36 @@
+import pytest
+
+from src.inference import ThinkingFilter, strip_thinking
+
+SAMPLES = [
+    "Plain answer without reasoning.",
+    "<think>hidden plan</think>\n\nThe Royal Compass is the best choice.",
+    "Intro <think>a</think> middle <think>b</think> end",
+    "<think>unterminated reasoning that never closes",
+    "Tag-like text: <thin and </thi stay visible",
+]
+
+def stream(text, chunk_size):
+    thinking_filter = ThinkingFilter()
+    output = [thinking_filter.feed(text[i:i + chunk_size]) for i in range(0, len(text), chunk_size)]
+    output.append(thinking_filter.flush())
+    return "".join(output)
+
+@pytest.mark.parametrize("text", SAMPLES)
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 5, 7, 1000])
+def test_streamed_output_matches_strip_thinking(text, chunk_size):
+    expected = strip_thinking(text) if "</think>" in text or "<think>" not in text else ""
+    assert stream(text, chunk_size).rstrip() == expected
+
+def test_tags_split_across_chunks():
+    thinking_filter = ThinkingFilter()
+    assert thinking_filter.feed("Hello <th") == "Hello "
+    assert thinking_filter.feed("ink>secret</th") == ""
+    assert thinking_filter.feed("ink> world") == " world"
+    assert thinking_filter.flush() == ""
+
+def test_leading_whitespace_is_dropped_once():
+    thinking_filter = ThinkingFilter()
+    assert thinking_filter.feed("<think>x</think>\n\n") == ""
+    assert thinking_filter.feed("  Answer") == "Answer"
+    assert thinking_filter.feed("  continues") == "  continues"